@@ -0,0 +1,309 @@
+"""
+Headless batch inspection over stored images.
+
+    python batch_inspect.py MODEL_A "D:/archive/2025-02/*.png" -o results.csv
+    python batch_inspect.py MODEL_B D:/archive/tray_ng -o results.jsonl -w 8
+    python batch_inspect.py MODEL_A recordings/20250301_080000 -o results.csv
+
+Recording folders (FrameRecorder) are expanded to one "<folder>::<i>" entry
+per frame, frames are read from the memory-mapped segments without decoding.
+Frames recorded with a sensor ROI are inspected with the model config moved
+to the window coordinates (shift_config), like in auto mode.
+Images are decoded and inspected with ImageProcessor.find_result across a
+process pool, one result row per image is written to CSV / JSONL / Parquet.
+"""
+
+import sys
+
+sys.path.append("libs/")
+
+import argparse
+import csv
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2 as cv
+
+from libs.settings import Settings
+from libs.image_processor import ImageProcessor, RESULT
+from libs.fiducial_matcher import FIDUCIALS_FILE, FiducialMatcher
+from libs.frame_recorder import FrameReader
+from libs.sensor_roi import shift_config
+
+
+IMAGE_EXTENSIONS = [".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff"]
+FORMATS = ["csv", "jsonl", "parquet"]
+# "<recording folder>::<frame>"
+RECORDING_SEPARATOR = "::"
+
+# Trạng thái riêng của mỗi process worker
+_worker = {}
+
+
+def list_images(inputs: list) -> list:
+    """Expand directories, recordings and globs into a sorted list of image paths"""
+    paths = []
+    for item in inputs:
+        if FrameReader.is_recording(item):
+            n_frames = len(FrameReader(item))
+            paths += [f"{item}{RECORDING_SEPARATOR}{i:06d}" for i in range(n_frames)]
+        elif os.path.isdir(item):
+            with os.scandir(item) as it:
+                for entry in it:
+                    if (
+                        entry.is_file()
+                        and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                    ):
+                        paths.append(entry.path)
+        elif any(c in item for c in "*?["):
+            paths += [
+                p
+                for p in glob.glob(item, recursive=True)
+                if os.path.splitext(p)[1].lower() in IMAGE_EXTENSIONS
+            ]
+        elif os.path.isfile(item):
+            paths.append(item)
+        else:
+            print(f"Skip {item}: not found")
+    return sorted(set(paths))
+
+
+def init_worker(config: dict, yolo_path: str = None, fiducials_path: str = None):
+    _worker["config"] = config
+    _worker["model"] = None
+    _worker["readers"] = {}
+    # Config đã dịch theo từng cửa sổ sensor ROI: (x, y, w, h) -> config
+    _worker["roi_configs"] = {}
+    _worker["fiducials"] = (
+        FiducialMatcher.load(fiducials_path) if fiducials_path else None
+    )
+    if yolo_path:
+        from ultralytics import YOLO
+
+        _worker["model"] = YOLO(yolo_path)
+
+
+def roi_config(roi: tuple) -> dict:
+    """Model config in the coordinates of frames read out with sensor window roi"""
+    config = _worker["roi_configs"].get(roi)
+    if config is None:
+        config = _worker["roi_configs"][roi] = shift_config(_worker["config"], roi)
+    return config
+
+
+def load_frame(path: str):
+    """
+    Decode an image file or take a frame view of a recording.\n
+    Returns (mat, config), config in the coordinates of the frame.
+    """
+    if RECORDING_SEPARATOR not in path:
+        return cv.imread(path), _worker["config"]
+    folder, i = path.rsplit(RECORDING_SEPARATOR, 1)
+    # Mỗi worker map recording 1 lần, các process dùng chung page cache
+    reader = _worker["readers"].get(folder)
+    if reader is None:
+        reader = _worker["readers"][folder] = FrameReader(folder)
+    i = int(i)
+    if i >= len(reader):
+        return None, _worker["config"]
+
+    mat = reader[i]
+    row = reader.index[i]
+    x, y = int(row["roi_x"]), int(row["roi_y"])
+    if x or y:
+        # Frame ghi với sensor ROI: dịch shape / blob origin theo góc cửa sổ
+        return mat, roi_config((x, y, mat.shape[1], mat.shape[0]))
+    return mat, _worker["config"]
+
+
+def inspect_image(path: str) -> dict:
+    """Decode and inspect one image, returns a flat result row"""
+    t0 = time.perf_counter()
+    row = {"path": path, "ok": False, "error": "", "msg": ""}
+
+    mat, config = load_frame(path)
+    if mat is None:
+        row["error"] = "Failed to load image"
+        return row
+
+    try:
+        result: RESULT = ImageProcessor.find_result(
+            mat,
+            config,
+            model=_worker["model"],
+            fiducials=_worker["fiducials"],
+        )
+    except Exception as e:
+        row["error"] = str(e)
+        return row
+
+    n_ok, n_ng, n_none = result.count_decisions()
+    row.update(
+        ok=True,
+        msg=result.msg,
+        n_ok=n_ok,
+        n_ng=n_ng,
+        n_none=n_none,
+        b_pass=n_ng == 0,
+        rois=result.to_dict()["rois"],
+        time=time.perf_counter() - t0,
+    )
+    return row
+
+
+def flatten_row(row: dict, n_rois: int) -> dict:
+    """One column per ROI value for table formats (CSV / Parquet)"""
+    flat = {k: v for k, v in row.items() if k != "rois"}
+    rois = row.get("rois") or []
+    for i in range(n_rois):
+        roi = rois[i] if i < len(rois) else {}
+        flat[f"roi{i}_decision"] = roi.get("decision")
+        flat[f"roi{i}_dx"] = roi.get("dx")
+        flat[f"roi{i}_dy"] = roi.get("dy")
+        flat[f"roi{i}_da"] = roi.get("da")
+    return flat
+
+
+class ResultWriter:
+    """Stream result rows to CSV / JSONL, Parquet is written once at close"""
+
+    COLUMNS = ["path", "ok", "error", "msg", "n_ok", "n_ng", "n_none", "b_pass", "time"]
+
+    def __init__(self, path: str, fmt: str, n_rois: int):
+        self.path = path
+        self.fmt = fmt
+        self.n_rois = n_rois
+        self.rows = []
+        self._file = None
+        self._csv = None
+
+        if fmt == "parquet":
+            try:
+                import pandas  # noqa: F401
+            except ImportError:
+                raise RuntimeError("Parquet output requires pandas and pyarrow")
+        else:
+            self._file = open(path, "w", newline="", encoding="utf-8")
+
+        if fmt == "csv":
+            columns = list(self.COLUMNS)
+            for i in range(n_rois):
+                columns += [f"roi{i}_{k}" for k in ("decision", "dx", "dy", "da")]
+            self._csv = csv.DictWriter(self._file, fieldnames=columns)
+            self._csv.writeheader()
+
+    def write(self, row: dict):
+        if self.fmt == "csv":
+            self._csv.writerow(flatten_row(row, self.n_rois))
+        elif self.fmt == "jsonl":
+            self._file.write(json.dumps(row) + "\n")
+        else:
+            self.rows.append(flatten_row(row, self.n_rois))
+
+    def close(self):
+        if self.fmt == "parquet":
+            import pandas as pd
+
+            pd.DataFrame(self.rows).to_parquet(self.path, index=False)
+        elif self._file is not None:
+            self._file.close()
+
+
+def run(
+    model_name: str,
+    inputs: list,
+    output: str,
+    fmt: str = None,
+    workers: int = None,
+    yolo_path: str = None,
+    models_dir: str = None,
+) -> int:
+    settings = Settings()
+    if models_dir:
+        settings.models_dir = models_dir
+
+    config = settings.load_model(model_name)
+    if not config:
+        print(f"Invalid or missing configuration for model: {model_name}")
+        return 1
+    if not config.get("blobs"):
+        print(f"Model {model_name} has no origin, set origin in teaching mode first")
+        return 1
+    fiducials_path = os.path.join(settings.models_dir, model_name, FIDUCIALS_FILE)
+
+    paths = list_images(inputs)
+    if not paths:
+        print("No images found")
+        return 1
+
+    if fmt is None:
+        fmt = os.path.splitext(output)[1].lstrip(".").lower()
+        fmt = fmt if fmt in FORMATS else "csv"
+
+    workers = workers or os.cpu_count()
+    n_rois = len(config["shapes"])
+    writer = ResultWriter(output, fmt, n_rois)
+
+    print(f"Inspect {len(paths)} images of {model_name} with {workers} workers")
+    t0 = time.perf_counter()
+    n_done = n_pass = n_error = 0
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(config, yolo_path, fiducials_path),
+        ) as executor:
+            chunksize = max(1, min(16, len(paths) // (workers * 4)))
+            for row in executor.map(inspect_image, paths, chunksize=chunksize):
+                writer.write(row)
+                n_done += 1
+                if not row["ok"]:
+                    n_error += 1
+                elif row["b_pass"]:
+                    n_pass += 1
+
+                if n_done % 100 == 0:
+                    dt = time.perf_counter() - t0
+                    print(f"{n_done}/{len(paths)} images, {n_done / dt:.1f} img/s")
+    finally:
+        writer.close()
+
+    dt = time.perf_counter() - t0
+    print(
+        f"Done {n_done} images in {dt:.1f}s ({n_done / dt:.1f} img/s), "
+        f"pass: {n_pass}, fail: {n_done - n_pass - n_error}, error: {n_error}"
+    )
+    print(f"Results: {output}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless batch inspection")
+    parser.add_argument("model", help="model name in models/ (Settings)")
+    parser.add_argument("inputs", nargs="+", help="image files, folders or globs")
+    parser.add_argument("-o", "--output", default="results.csv")
+    parser.add_argument("-f", "--format", choices=FORMATS, default=None)
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--yolo", default=None, help="YOLO weights for blob detection")
+    parser.add_argument("--models-dir", default=None)
+    args = parser.parse_args()
+
+    sys.exit(
+        run(
+            args.model,
+            args.inputs,
+            args.output,
+            fmt=args.format,
+            workers=args.workers,
+            yolo_path=args.yolo,
+            models_dir=args.models_dir,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
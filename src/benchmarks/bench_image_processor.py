@@ -0,0 +1,263 @@
+"""
+Benchmark of the ImageProcessor pipeline stages on synthetic trays.
+
+Run from src/:
+
+    python -m benchmarks.bench_image_processor --save benchmarks/baseline.json
+    python -m benchmarks.bench_image_processor --compare benchmarks/baseline.json
+
+Every MODEL_A/B/C config is fitted to synthetic trays of each resolution
+and layout (4x5, 8x10). For each stage the latency percentiles, throughput
+and peak memory (tracemalloc: Python + numpy/OpenCV output buffers) are
+reported. --save writes the numbers as JSON, commit it as the baseline of a
+line PC and later runs with --compare print the change per stage.
+benchmarks/baseline.json is the reference run of the series (every model,
+layout and resolution, --repeat 10, machine and library versions in
+"meta"). Absolute times only compare on the same machine: on another PC
+save a baseline first, then compare against it.
+apply_threshold / apply_threshold_downsampled compare the two threshold
+methods, the IoU of the downsampled mask against the adaptive one is
+printed with them.
+"""
+
+import argparse
+import copy
+import json
+import platform
+import time
+import tracemalloc
+
+import cv2 as cv
+import numpy as np
+
+from libs.image_processor import ImageProcessor, RESULT, THRESHOLD_DOWNSAMPLED
+from benchmarks.synthetic_tray import (
+    LAYOUTS,
+    RESOLUTIONS,
+    load_model_config,
+    make_config,
+    make_tray,
+)
+
+
+MODELS = ["MODEL_A", "MODEL_B", "MODEL_C"]
+# Ngưỡng báo regression khi so sánh với baseline (p50)
+REGRESSION_THRESHOLD = 0.10
+
+
+def stage_find_blobs(image, config, state):
+    ImageProcessor.find_blobs(image, config)
+
+
+def stage_find_blobs_with_yolo(image, config, state):
+    ImageProcessor.find_blobs_with_yolo(image, state["yolo"], config)
+
+
+def stage_apply_threshold(image, config, state):
+    ImageProcessor.apply_threshold_adaptive(state["blur"], config)
+
+
+def stage_apply_threshold_downsampled(image, config, state):
+    ImageProcessor.apply_threshold_downsampled(state["blur"], config)
+
+
+def stage_find_circles(image, config, state):
+    box = state["boxes"][state["i"] % len(state["boxes"])]
+    state["i"] += 1
+    ImageProcessor.find_circles(image, box, config)
+
+
+def stage_filter_circle(image, config, state):
+    size, circles = state["candidates"][state["i"] % len(state["candidates"])]
+    state["i"] += 1
+    ImageProcessor.filter_circle(size, circles)
+
+
+def stage_draw_output(image, config, state):
+    ImageProcessor.draw_output(state["canvas"], state["result"].blobs, config)
+
+
+def stage_find_result(image, config, state):
+    ImageProcessor.find_result(image, config, model=state.get("yolo"))
+
+
+# name -> function(image, config, state), one call per sample
+STAGES = {
+    "find_blobs": stage_find_blobs,
+    "find_blobs_with_yolo": stage_find_blobs_with_yolo,
+    "apply_threshold": stage_apply_threshold,
+    "apply_threshold_downsampled": stage_apply_threshold_downsampled,
+    "find_circles": stage_find_circles,
+    "filter_circle": stage_filter_circle,
+    "draw_output": stage_draw_output,
+    "find_result": stage_find_result,
+}
+
+
+def prepare_state(image, config, yolo=None) -> dict:
+    result: RESULT = ImageProcessor.find_result(image, config)
+    boxes = [box for box in result.blobs.boxes if box is not None]
+    candidates = []
+    for x, y, w, h in boxes:
+        cropped = image[y : y + h, x : x + w]
+        circles = ImageProcessor.hough_circles(cropped, config).tolist()
+        candidates.append(((w, h), circles))
+
+    gray = cv.cvtColor(image, cv.COLOR_BGR2GRAY)
+
+    return {
+        "i": 0,
+        "yolo": yolo,
+        "blur": ImageProcessor.apply_blur(gray, config),
+        "result": result,
+        "boxes": boxes or [config["shapes"]["0"]["box"]],
+        "candidates": candidates or [((1, 1), [])],
+        "canvas": image.copy(),
+        "n_found": len(boxes),
+    }
+
+
+def threshold_iou(config, state) -> float:
+    """IoU of the THRESHOLD_DOWNSAMPLED mask against apply_threshold (adaptive)"""
+    reference = ImageProcessor.apply_threshold_adaptive(state["blur"], config)
+    config = copy.deepcopy(config)
+    config["threshold"]["method"] = THRESHOLD_DOWNSAMPLED
+    mask = ImageProcessor.apply_threshold(state["blur"], config)
+
+    union = np.count_nonzero(cv.bitwise_or(reference, mask))
+    intersection = np.count_nonzero(cv.bitwise_and(reference, mask))
+    return intersection / union if union else 1.0
+
+
+def measure(fn, image, config, state, repeat: int) -> dict:
+    fn(image, config, state)  # warm up
+
+    samples = np.empty(repeat, dtype=np.float64)
+    for k in range(repeat):
+        t0 = time.perf_counter()
+        fn(image, config, state)
+        samples[k] = time.perf_counter() - t0
+
+    tracemalloc.start()
+    fn(image, config, state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    mean = float(samples.mean())
+    return {
+        "p50_ms": p50 * 1000,
+        "p95_ms": p95 * 1000,
+        "p99_ms": p99 * 1000,
+        "mean_ms": mean * 1000,
+        "throughput": 1.0 / mean if mean > 0 else 0.0,
+        "peak_mb": peak / 2**20,
+    }
+
+
+def run(models, layouts, resolutions, stages, repeat=10, yolo=None) -> dict:
+    cases = {}
+    for model_name in models:
+        model_config = load_model_config(model_name)
+        for resolution_name in resolutions:
+            for layout_name in layouts:
+                layout = LAYOUTS[layout_name]
+                image, geometry = make_tray(RESOLUTIONS[resolution_name], layout)
+                config = make_config(model_config, geometry, layout)
+                state = prepare_state(image, config, yolo)
+
+                case = f"{model_name}/{resolution_name}/{layout_name}"
+                print(f"{case}: {state['n_found']}/{len(geometry['boxes'])} blobs")
+                cases[case] = {}
+                for stage in stages:
+                    if stage == "find_blobs_with_yolo" and yolo is None:
+                        continue
+                    state["i"] = 0
+                    stats = measure(STAGES[stage], image, config, state, repeat)
+                    cases[case][stage] = stats
+                    print(
+                        f"  {stage:<28} p50 {stats['p50_ms']:9.2f} ms"
+                        f"  p95 {stats['p95_ms']:9.2f} ms"
+                        f"  p99 {stats['p99_ms']:9.2f} ms"
+                        f"  {stats['throughput']:9.1f}/s"
+                        f"  peak {stats['peak_mb']:8.1f} MB"
+                    )
+
+                if "apply_threshold_downsampled" in stages:
+                    iou = threshold_iou(config, state)
+                    cases[case]["apply_threshold_downsampled"]["iou"] = iou
+                    print(f"  threshold mask IoU (downsampled / adaptive): {iou:.4f}")
+
+    return {
+        "meta": {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "machine": platform.node(),
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "opencv": cv.__version__,
+            "numpy": np.__version__,
+            "repeat": repeat,
+        },
+        "cases": cases,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold=REGRESSION_THRESHOLD) -> int:
+    """Print the p50 change per stage, returns the number of regressions"""
+    n_regression = 0
+    print(f"\nCompare with baseline of {baseline['meta'].get('time', '?')}")
+    for case, stages in report["cases"].items():
+        for stage, stats in stages.items():
+            base = baseline["cases"].get(case, {}).get(stage)
+            if base is None:
+                print(f"  {case} {stage}: new")
+                continue
+            change = stats["p50_ms"] / max(base["p50_ms"], 1e-9) - 1.0
+            flag = ""
+            if change > threshold:
+                flag = "  <-- REGRESSION"
+                n_regression += 1
+            print(
+                f"  {case:<28} {stage:<28} {base['p50_ms']:9.2f} -> "
+                f"{stats['p50_ms']:9.2f} ms ({change * 100:+.1f}%){flag}"
+            )
+    return n_regression
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ImageProcessor benchmark")
+    parser.add_argument("--models", nargs="+", default=MODELS)
+    parser.add_argument("--layouts", nargs="+", default=list(LAYOUTS))
+    parser.add_argument("--resolutions", nargs="+", default=list(RESOLUTIONS))
+    parser.add_argument("--stages", nargs="+", default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--yolo", default=None, help="YOLO weights for YOLO stages")
+    parser.add_argument("--save", default=None, help="write the report as JSON")
+    parser.add_argument("--compare", default=None, help="baseline JSON to diff")
+    args = parser.parse_args()
+
+    yolo = None
+    if args.yolo:
+        from ultralytics import YOLO
+
+        yolo = YOLO(args.yolo)
+
+    report = run(
+        args.models, args.layouts, args.resolutions, args.stages, args.repeat, yolo
+    )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Saved {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        n_regression = compare(report, baseline)
+        if n_regression:
+            raise SystemExit(f"{n_regression} stage(s) slower than baseline")
+
+
+if __name__ == "__main__":
+    main()
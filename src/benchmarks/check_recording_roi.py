@@ -0,0 +1,132 @@
+"""
+Check that recordings made with a sensor ROI inspect like full frames.
+
+Run from src/:
+
+    python -m benchmarks.check_recording_roi
+    python -m benchmarks.check_recording_roi --models MODEL_A --trays 5
+
+The sensor sees an 8x10 synthetic tray, the model inspects the 4x5 block of
+positions at BLOCK. Every tray is recorded twice with FrameRecorder: the
+full frame, and the window around the shapes (config_roi + margin) the
+camera reads out in auto mode, with the window origin in the index. Both
+recordings are inspected through batch_inspect (load_frame, inspect_image),
+the decision and the reply (dx, dy, da) of every ROI must be the same.
+Exit code 1 on any difference.
+"""
+
+import argparse
+import os
+import tempfile
+
+from batch_inspect import RECORDING_SEPARATOR, init_worker, inspect_image
+from libs.frame_recorder import FrameRecorder
+from libs.sensor_roi import config_roi
+from benchmarks.synthetic_tray import (
+    LAYOUTS,
+    RESOLUTIONS,
+    load_model_config,
+    make_config,
+    make_tray,
+)
+
+MODELS = ["MODEL_A", "MODEL_B", "MODEL_C"]
+# Lề quanh vùng bao các shape như MainWindow.SENSOR_ROI_MARGIN
+MARGIN = 128
+# Khay trên cảm biến, model chỉ kiểm tra khối vị trí (hàng, cột đầu) cỡ LAYOUT
+SENSOR_LAYOUT = LAYOUTS["8x10"]
+LAYOUT = LAYOUTS["4x5"]
+BLOCK = (2, 3)
+
+
+def block_geometry(geometry: dict) -> dict:
+    """Geometry of the LAYOUT block at BLOCK of a SENSOR_LAYOUT tray"""
+    indexes = [
+        (BLOCK[0] + r) * SENSOR_LAYOUT[1] + BLOCK[1] + c
+        for r in range(LAYOUT[0])
+        for c in range(LAYOUT[1])
+    ]
+    block = dict(geometry)
+    for name in ("boxes", "centers", "vectors"):
+        block[name] = [geometry[name][i] for i in indexes]
+    return block
+
+
+def decisions(row: dict) -> list:
+    return [roi.get("decision") for roi in row.get("rois") or []]
+
+
+def check_model(model_name, resolution, n_trays, root) -> int:
+    """Record n_trays full and windowed, returns the number of mismatching trays"""
+    image, geometry = make_tray(resolution, SENSOR_LAYOUT)
+    config = make_config(
+        load_model_config(model_name), block_geometry(geometry), LAYOUT
+    )
+    height, width = image.shape[:2]
+    x, y, w, h = config_roi(config, MARGIN)
+    x, y = max(x, 0), max(y, 0)
+    w, h = min(w, width - x), min(h, height - y)
+
+    recorder = FrameRecorder(root=root, segment_bytes=1024**3, max_frames=n_trays)
+    names = {}
+    for windowed in (False, True):
+        name = names[windowed] = f"{model_name}_{'roi' if windowed else 'full'}"
+        recorder.start(name)
+        for seed in range(n_trays):
+            # Khay lệch / xoay nhẹ như trên line
+            tray, _ = make_tray(
+                resolution,
+                SENSOR_LAYOUT,
+                seed=seed + 1,
+                shift=(seed % 5, 2),
+                max_angle=3.0,
+            )
+            if windowed:
+                recorder.record(tray[y : y + h, x : x + w], seed, roi=(x, y, w, h))
+            else:
+                recorder.record(tray, seed)
+        recorder.stop()
+
+    init_worker(config)
+    n_mismatch = n_ok = 0
+    for i in range(n_trays):
+        rows = [
+            inspect_image(f"{recorder.root}/{names[b]}{RECORDING_SEPARATOR}{i:06d}")
+            for b in (False, True)
+        ]
+        full, roi = decisions(rows[0]), decisions(rows[1])
+        if not rows[0]["ok"] or full != roi or rows[0]["msg"] != rows[1]["msg"]:
+            n_mismatch += 1
+            print(f"  tray {i}: full {full} / roi {roi} {rows[1]['error']}")
+        n_ok += full.count(True)
+    print(
+        f"{model_name}: window {(x, y, w, h)} of {width}x{height}, "
+        f"{n_trays - n_mismatch}/{n_trays} trays with the same decisions "
+        f"({n_ok} OK ROIs)"
+    )
+    return n_mismatch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sensor ROI recording check")
+    parser.add_argument("--models", nargs="+", default=MODELS)
+    parser.add_argument("--resolution", default="5472x3648", choices=RESOLUTIONS)
+    parser.add_argument("--trays", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        n_mismatch = sum(
+            check_model(
+                model_name,
+                RESOLUTIONS[args.resolution],
+                args.trays,
+                os.path.join(root, model_name),
+            )
+            for model_name in args.models
+        )
+    if n_mismatch:
+        raise SystemExit(f"{n_mismatch} tray(s) differ between full frame and ROI")
+
+
+if __name__ == "__main__":
+    main()
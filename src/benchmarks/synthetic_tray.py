@@ -0,0 +1,119 @@
+import copy
+import json
+import os
+
+import cv2 as cv
+import numpy as np
+
+
+LAYOUTS = {"4x5": (4, 5), "8x10": (8, 10)}
+RESOLUTIONS = {"5472x3648": (5472, 3648), "2736x1824": (2736, 1824)}
+
+
+def load_model_config(model_name: str, models_dir="models") -> dict:
+    with open(os.path.join(models_dir, model_name, "config.json"), "r") as f:
+        return json.load(f)
+
+
+def make_tray(
+    resolution=(5472, 3648),
+    layout=(4, 5),
+    seed=0,
+    shift=(0, 0),
+    max_angle=0.0,
+):
+    """
+    Draw a synthetic tray: bright square blobs on a dark noisy background,
+    each blob carries two dark fiducial circles (centre + orientation).\n
+    Returns (image, geometry), geometry holds the blob side, circle radius,
+    ROI boxes and the expected centre / vector of every blob.
+    """
+    rng = np.random.default_rng(seed)
+    width, height = resolution
+    rows, columns = layout
+
+    pitch_x = width / columns
+    pitch_y = height / rows
+    side = int(min(pitch_x, pitch_y) * 0.6)
+    radius = max(int(side * 0.04), 8)
+    offset = int(side * 0.22)
+
+    image = rng.normal(40, 6, (height, width)).clip(0, 255).astype(np.uint8)
+    image = cv.cvtColor(image, cv.COLOR_GRAY2BGR)
+
+    boxes = []
+    centers = []
+    vectors = []
+    for r in range(rows):
+        for c in range(columns):
+            cx = pitch_x * (c + 0.5) + shift[0] + rng.uniform(-3, 3)
+            cy = pitch_y * (r + 0.5) + shift[1] + rng.uniform(-3, 3)
+            angle = rng.uniform(-max_angle, max_angle)
+
+            rect = ((cx, cy), (side, side), angle)
+            pts = cv.boxPoints(rect).astype(np.int32)
+            cv.fillConvexPoly(image, pts, (200, 200, 200), cv.LINE_AA)
+
+            a = np.radians(angle)
+            x0, y0 = int(round(cx)), int(round(cy))
+            x1 = int(round(cx + offset * np.cos(a)))
+            y1 = int(round(cy + offset * np.sin(a)))
+            cv.circle(image, (x0, y0), radius, (30, 30, 30), -1, cv.LINE_AA)
+            cv.circle(image, (x1, y1), radius, (30, 30, 30), -1, cv.LINE_AA)
+
+            margin = int(side * 0.25)
+            x, y = int(cx - side / 2 - margin), int(cy - side / 2 - margin)
+            boxes.append([max(x, 0), max(y, 0), side + 2 * margin, side + 2 * margin])
+            centers.append((x0, y0))
+            vectors.append((x1 - x0, y1 - y0))
+
+    geometry = {
+        "side": side,
+        "radius": radius,
+        "boxes": boxes,
+        "centers": centers,
+        "vectors": vectors,
+    }
+    return image, geometry
+
+
+def make_config(model_config: dict, geometry: dict, layout=(4, 5)) -> dict:
+    """
+    Fit the processing parameters of a model to a synthetic tray.\n
+    Algorithm choices (blur / threshold / morphology / Hough method and
+    params) are kept, sizes are scaled to the synthetic blob and circle.
+    """
+    config = copy.deepcopy(model_config)
+    side = geometry["side"]
+    radius = geometry["radius"]
+    rows, columns = layout
+
+    config["rows"] = rows
+    config["columns"] = columns
+
+    block_size = int(side * 1.2) | 1
+    config["threshold"]["block_size"] = block_size
+    config["morphological"]["kernel_size"] = min(
+        config["morphological"]["kernel_size"], 5
+    )
+
+    area = side * side
+    config["detection"]["area_min"] = str(int(area * 0.7))
+    config["detection"]["area_max"] = str(int(area * 1.5))
+    config["detection"]["distance"] = max(int(side * 0.1), 15)
+
+    config["hough_circle"]["min_radius"] = max(radius - 4, 1)
+    config["hough_circle"]["max_radius"] = radius + 4
+    config["hough_circle"]["min_dist"] = radius * 2
+
+    config["shapes"] = {
+        str(i): {"label": f"Roi{i + 1}", "box": box}
+        for i, box in enumerate(geometry["boxes"])
+    }
+    config["blobs"] = {
+        str(i): {"center": list(center), "vector": list(vector)}
+        for i, (center, vector) in enumerate(
+            zip(geometry["centers"], geometry["vectors"])
+        )
+    }
+    return config
@@ -6,6 +6,7 @@ from cameras.MVSImport.LoadAndSave import save_feature
 from cameras.hik import HIK
 from cameras.soda import SODA
 from cameras.webcam import Webcam
+from cameras.replay import Replay
 
 
 def get_camera_devices():
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+import threading
 import numpy as np
 
+from libs.metrics import METRICS, now
+
 
 NO_ERROR = ""
 ERR_NOT_FOUND_DEVICE = "ERR_NOT_FOUND_DEVICE"
@@ -9,6 +12,37 @@ ERR_MODEL_NAME = "ERR_MODEL_NAME"
 ERR_LOAD_FEATURE_FAIL = "ERR_LOAD_FEATURE_FAIL"
 ERR_CONFIG_IS_NONE = "ERR_CONFIG_IS_NONE"
 ERR_GRAB_FAIL = "ERR_GRAB_FAIL"
+ERR_SET_ROI_FAIL = "ERR_SET_ROI_FAIL"
+ERR_SET_PREVIEW_FAIL = "ERR_SET_PREVIEW_FAIL"
+
+# Chế độ preview khi live view: binning NxN và giới hạn frame rate (None = giữ nguyên)
+PREVIEW_DEFAULT = {"binning": 2, "frame_rate": 10.0}
+# Vào preview lỗi (node tạm thời không ghi được...): thử lại sau bấy nhiêu giây
+PREVIEW_RETRY_INTERVAL = 5.0
+
+
+def align_roi(roi, width_max, height_max,
+              inc_x=1, inc_y=1, inc_w=1, inc_h=1, width_min=1, height_min=1) -> tuple:
+    """
+    Smallest (x, y, w, h) window covering roi that the sensor accepts:
+    offsets rounded down and sizes rounded up to their increments, clamped
+    to the sensor size.
+    """
+    x, y, w, h = [int(v) for v in roi]
+    x0 = max(min(x, width_max - 1), 0) // inc_x * inc_x
+    y0 = max(min(y, height_max - 1), 0) // inc_y * inc_y
+    x1 = min(x + w, width_max)
+    y1 = min(y + h, height_max)
+    w = max(-(-(x1 - x0) // inc_w) * inc_w, width_min)
+    h = max(-(-(y1 - y0) // inc_h) * inc_h, height_min)
+    w = min(w, width_max // inc_w * inc_w)
+    h = min(h, height_max // inc_h * inc_h)
+    # Làm tròn lên vượt ra ngoài cảm biến: lùi offset lại
+    if x0 + w > width_max:
+        x0 = (width_max - w) // inc_x * inc_x
+    if y0 + h > height_max:
+        y0 = (height_max - h) // inc_y * inc_y
+    return x0, y0, w, h
 
 
 class BaseCamera(ABC):
@@ -19,6 +53,20 @@ class BaseCamera(ABC):
         self._cap = None
         self._config = {}
         self._model_name = ""
+        # Cửa sổ đọc cảm biến (x, y, w, h) so với ảnh full, None = full frame
+        self._roi = None
+        # Preview (binning / frame rate thấp) cho live view, full khi trigger
+        self._preview = False
+        self._b_preview_supported = True
+        self._t_preview_retry = 0.0
+        self._binning = 1
+        # (binning, roi) của frame grab_preview() trả về lần cuối
+        self._live_mode = (1, None)
+        # Đổi ROI / preview và grab không chạy xen nhau giữa các thread
+        self._mode_lock = threading.RLock()
+        # Thống kê theo chế độ: False = full, True = preview
+        self._n_frames = {False: 0, True: 0}
+        self._n_bytes = {False: 0, True: 0}
         if config is not None:
             self.set_config(config)
 
@@ -59,3 +107,127 @@ class BaseCamera(ABC):
     @abstractmethod
     def grab(self) -> tuple: ...
 
+    def set_roi(self, roi=None) -> bool:
+        """
+        Read out only roi (x, y, w, h) of the full frame, None restores the
+        full frame. The applied window can be larger (increments), see
+        get_roi(). False when the camera has no sensor ROI.\n
+        Runs under the mode lock: no grab is in flight while the camera is
+        reconfigured.
+        """
+        with self._mode_lock:
+            # ROI tính theo pixel full frame: thoát preview (binning) trước
+            if self._preview:
+                self.set_preview(False)
+            return self._set_roi(roi)
+
+    def _set_roi(self, roi) -> bool:
+        """Camera specific part of set_roi(), called with the mode lock held"""
+        return False
+
+    def get_roi(self):
+        """Window (x, y, w, h) of the frames grab() returns, None = full frame"""
+        return self._roi
+
+
+    def get_preview_config(self) -> dict:
+        """PREVIEW_DEFAULT overridden by the "preview" key of the camera config"""
+        return {**PREVIEW_DEFAULT, **((self._config or {}).get("preview") or {})}
+
+    def _apply_preview(self, b_preview: bool) -> bool:
+        """
+        Camera specific switch between preview (binning / reduced frame
+        rate, see get_preview_config()) and full resolution. Called with
+        the mode lock held, _preview already set to the target mode. False
+        when the camera has no preview mode.
+        """
+        return False
+
+    def _has_preview(self) -> bool:
+        """
+        True when the camera has binning or frame rate nodes, or cannot tell
+        yet (not open). A failed switch only disables the preview mode for
+        good when this is False.
+        """
+        return False
+
+    def set_preview(self, b_preview: bool) -> bool:
+        """
+        Switch to the preview mode or back to full resolution, the switch
+        time is recorded as camera.preview_on / camera.preview_off.
+        """
+        with self._mode_lock:
+            if b_preview == self._preview:
+                return True
+            if b_preview and not self._b_preview_supported:
+                return False
+            t = now()
+            if b_preview and t < self._t_preview_retry:
+                return False
+            self._preview = b_preview
+            if not self._apply_preview(b_preview):
+                self._preview = False
+                if b_preview and not self._has_preview():
+                    # Không có node: live view đọc full frame, không thử lại nữa
+                    self._b_preview_supported = False
+                    return False
+                # Lỗi tạm thời: live view đọc full frame, thử lại sau
+                self._t_preview_retry = now() + PREVIEW_RETRY_INTERVAL
+                self._error = ERR_SET_PREVIEW_FAIL
+                print(f"Set preview {b_preview} fail, retry later")
+                return False
+            name = "camera.preview_on" if b_preview else "camera.preview_off"
+            METRICS.record(name, t)
+            return True
+
+    def is_preview(self) -> bool:
+        return self._preview
+
+    def get_binning(self) -> int:
+        """Binning factor of the frames grab() returns, 1 = full resolution"""
+        return self._binning
+
+    def grab_preview(self) -> tuple:
+        """Live view frame, in preview mode when the camera supports it"""
+        with self._mode_lock:
+            if not self._preview:
+                self.set_preview(True)
+            result = self._count(self.grab())
+            self._live_mode = (self._binning, self._roi)
+            return result
+
+    def get_live_mode(self) -> tuple:
+        """
+        (binning, roi) of the last grab_preview() frame, read under the mode
+        lock so a concurrent switch cannot mismatch them with the frame.
+        """
+        return self._live_mode
+
+    def grab_full(self) -> tuple:
+        """
+        Full resolution frame for a trigger. Leaving the preview mode and
+        grabbing happen under the mode lock, so a live view grab cannot run
+        in between; the next grab_preview() switches back.
+        """
+        with self._mode_lock:
+            if self._preview:
+                self.set_preview(False)
+            return self._count(self.grab())
+
+    def _count(self, result: tuple) -> tuple:
+        mat = result[1]
+        if mat is not None:
+            self._n_frames[self._preview] += 1
+            self._n_bytes[self._preview] += mat.nbytes
+        return result
+
+    def format_stats(self) -> str:
+        def mb(b_preview):
+            n = self._n_frames[b_preview]
+            return self._n_bytes[b_preview] / max(n, 1) / 1024**2
+
+        return (
+            f"camera: preview frames={self._n_frames[True]} "
+            f"({mb(True):.2f} MB/frame), full frames={self._n_frames[False]} "
+            f"({mb(False):.2f} MB/frame)"
+        )
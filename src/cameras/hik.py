@@ -6,6 +6,8 @@ from cameras.MVSImport.CamOperation_class import *
 class HIK(BaseCamera):
     def __init__(self, config=None) -> None:
         self._stFrameInfo = MV_FRAME_OUT_INFO_EX()
+        # Frame rate của feature trước khi vào preview: (enable, fps)
+        self._frame_rate_saved = None
         super().__init__(config=config)
 
     def set_config(self, config):
@@ -147,6 +149,145 @@ class HIK(BaseCamera):
         except:
             return False
         
+    def _get_int(self, key):
+        stParam = MVCC_INTVALUE()
+        memset(byref(stParam), 0, sizeof(MVCC_INTVALUE))
+        ret = self._cap.obj_cam.MV_CC_GetIntValue(key, stParam)
+        if ret != 0:
+            raise RuntimeError("get %s fail! ret[0x%x]" % (key, ret))
+        return stParam
+
+    def _set_int(self, key, value):
+        ret = self._cap.obj_cam.MV_CC_SetIntValue(key, int(value))
+        if ret != 0:
+            raise RuntimeError("set %s fail! ret[0x%x]" % (key, ret))
+
+    def _update_payload(self):
+        # Payload đổi theo ROI / binning, buffer chỉ cấp phát lại khi cần lớn hơn
+        payload = self._get_int("PayloadSize").nCurValue
+        if self._cap.buf_cache is None or len(self._cap.buf_cache) < payload:
+            self._cap.buf_cache = (c_ubyte * payload)()
+        self._cap.n_payload_size = payload
+
+    def _set_roi(self, roi) -> bool:
+        if self._cap is None or not self._cap.b_open_device:
+            return False
+
+        # Width / Height bị khóa khi đang grab
+        b_grabbing = self._cap.b_start_grabbing
+        if b_grabbing:
+            self.stop_grabbing()
+        try:
+            # Offset về 0 trước để Width / Height lấy được giá trị max của cảm biến
+            self._set_int("OffsetX", 0)
+            self._set_int("OffsetY", 0)
+            width = self._get_int("Width")
+            height = self._get_int("Height")
+            offset_x = self._get_int("OffsetX")
+            offset_y = self._get_int("OffsetY")
+            if roi is None:
+                x, y, w, h = 0, 0, width.nMax, height.nMax
+            else:
+                x, y, w, h = align_roi(roi, width.nMax, height.nMax,
+                                       max(offset_x.nInc, 1), max(offset_y.nInc, 1),
+                                       max(width.nInc, 1), max(height.nInc, 1),
+                                       width.nMin, height.nMin)
+            self._set_int("Width", w)
+            self._set_int("Height", h)
+            self._set_int("OffsetX", x)
+            self._set_int("OffsetY", y)
+
+            self._update_payload()
+
+            full = (w, h) == (width.nMax, height.nMax)
+            self._roi = None if full else (x, y, w, h)
+            self._error = NO_ERROR
+            return True
+        except Exception as ex:
+            self._error = ERR_SET_ROI_FAIL
+            print(f"Set ROI error: {str(ex)}")
+            return False
+        finally:
+            if b_grabbing:
+                self.start_grabbing()
+
+    def _set_binning(self, binning) -> bool:
+        # Kích thước ảnh đổi theo binning, chỉ đặt được khi không grab
+        b_grabbing = self._cap.b_start_grabbing
+        if b_grabbing:
+            self.stop_grabbing()
+        try:
+            cam = self._cap.obj_cam
+            ret = cam.MV_CC_SetEnumValue("BinningHorizontal", binning)
+            ret |= cam.MV_CC_SetEnumValue("BinningVertical", binning)
+            if ret != 0:
+                print("set Binning fail! ret[0x%x]" % ret)
+                return False
+            self._binning = binning
+            if binning == 1:
+                # Binning về 1 không chắc trả lại Width / Height cũ: đặt lại ROI
+                self.set_roi(self._roi)
+            else:
+                self._update_payload()
+            return True
+        except Exception as ex:
+            print(f"Set binning error: {str(ex)}")
+            return False
+        finally:
+            if b_grabbing:
+                self.start_grabbing()
+
+    def _set_frame_rate(self, frame_rate) -> bool:
+        # Frame rate đổi được cả khi đang grab, không cần dừng
+        cam = self._cap.obj_cam
+        if self._frame_rate_saved is None:
+            b_enable = c_bool(False)
+            fps = MVCC_FLOATVALUE()
+            memset(byref(fps), 0, sizeof(MVCC_FLOATVALUE))
+            ret = cam.MV_CC_GetBoolValue("AcquisitionFrameRateEnable", byref(b_enable))
+            ret |= cam.MV_CC_GetFloatValue("AcquisitionFrameRate", fps)
+            if ret != 0:
+                print("get AcquisitionFrameRate fail! ret[0x%x]" % ret)
+                return False
+            self._frame_rate_saved = (b_enable.value, fps.fCurValue)
+
+        b_enable, fps = (True, frame_rate) if frame_rate else self._frame_rate_saved
+        ret = cam.MV_CC_SetBoolValue("AcquisitionFrameRateEnable", b_enable)
+        if b_enable:
+            ret |= cam.MV_CC_SetFloatValue("AcquisitionFrameRate", float(fps))
+        if ret != 0:
+            print("set AcquisitionFrameRate fail! ret[0x%x]" % ret)
+            return False
+        return True
+
+    def _has_preview(self) -> bool:
+        if self._cap is None or not self._cap.b_open_device:
+            return True
+        cam = self._cap.obj_cam
+        st_enum = MVCC_ENUMVALUE()
+        memset(byref(st_enum), 0, sizeof(MVCC_ENUMVALUE))
+        st_float = MVCC_FLOATVALUE()
+        memset(byref(st_float), 0, sizeof(MVCC_FLOATVALUE))
+        # Đọc được node là camera có node, kể cả khi đang bị khóa ghi
+        return (
+            cam.MV_CC_GetEnumValue("BinningHorizontal", st_enum) == 0
+            or cam.MV_CC_GetFloatValue("AcquisitionFrameRate", st_float) == 0
+        )
+
+    def _apply_preview(self, b_preview: bool) -> bool:
+        if self._cap is None or not self._cap.b_open_device:
+            return False
+        preview = self.get_preview_config()
+        binning = int(preview.get("binning") or 1)
+        frame_rate = preview.get("frame_rate")
+
+        b_done = False
+        if binning > 1:
+            b_done |= self._set_binning(binning if b_preview else 1)
+        if frame_rate:
+            b_done |= self._set_frame_rate(frame_rate if b_preview else None)
+        return b_done
+
     def grab(self):
         _mat = None
 
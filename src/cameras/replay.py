@@ -0,0 +1,131 @@
+from cameras.base_camera import *
+
+import os
+import time
+
+import numpy as np
+
+from libs.frame_recorder import FrameReader
+
+
+class Replay(BaseCamera):
+    """
+    Camera serving the frames of a FrameRecorder recording.\n
+    config: {"id": recording folder, "loop": restart at the end,
+    "realtime": wait the recorded interval between frames,
+    "failed_only": serve only the frames whose processing failed}
+    """
+
+    ROOT = "recordings"
+
+    def __init__(self, config=None) -> None:
+        self._reader = None
+        # Chỉ số các frame được phát trong recording
+        self._frames = None
+        self._position = 0
+        self._t_last = None
+        super().__init__(config=config)
+
+    def set_config(self, config):
+        print("Set camera config")
+        self._config = config
+        self.create_device()
+
+    def get_config(self):
+        return self._config
+
+    def get_error(self) -> str:
+        return self._error
+
+    def get_devices() -> dict:
+        devices = {}
+        if os.path.isdir(Replay.ROOT):
+            for name in sorted(os.listdir(Replay.ROOT)):
+                path = os.path.join(Replay.ROOT, name)
+                if FrameReader.is_recording(path):
+                    devices[path] = name
+        return devices
+
+    def create_device(self):
+        if self._config is None:
+            self._error = ERR_CONFIG_IS_NONE
+            self._cap = None
+            self._model_name = ""
+            return
+
+        path = self._config.get("id", "")
+        if not FrameReader.is_recording(path):
+            self._error = ERR_NOT_FOUND_DEVICE
+            self._cap = None
+            self._model_name = ""
+            return
+
+        self._cap = path
+        self._model_name = f"Replay_{os.path.basename(os.path.normpath(path))}"
+        self._error = NO_ERROR
+
+    def open(self) -> bool:
+        if self._cap is None:
+            return False
+        self._error = NO_ERROR
+        try:
+            self._reader = FrameReader(self._cap)
+        except Exception as ex:
+            self._error = str(ex)
+            return False
+        if self._config.get("failed_only", False):
+            self._frames = np.flatnonzero(self._reader.index["failed"])
+        else:
+            self._frames = np.arange(len(self._reader))
+        return len(self._frames) > 0
+
+    def close(self) -> bool:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        return True
+
+    def start_grabbing(self) -> bool:
+        self._position = 0
+        self._t_last = None
+        return self._reader is not None
+
+    def stop_grabbing(self) -> bool:
+        return True
+
+    def grab(self):
+        _mat = None
+        if self._reader is None:
+            self._error = ERR_GRAB_FAIL
+            return self._error, _mat
+
+        if self._position >= len(self._frames):
+            if not self._config.get("loop", True):
+                self._error = ERR_GRAB_FAIL
+                return self._error, _mat
+            self._position = 0
+            self._t_last = None
+
+        i = self._frames[self._position]
+        if self._config.get("realtime", False):
+            # Giữ khoảng cách thời gian giữa các frame như lúc ghi
+            t_mono = self._reader.index["t_mono"][i]
+            if self._t_last is not None:
+                t_frame, t_wall = self._t_last
+                delay = (t_mono - t_frame) - (time.perf_counter() - t_wall)
+                if delay > 0:
+                    time.sleep(delay)
+            self._t_last = (t_mono, time.perf_counter())
+
+        # View trực tiếp trên file map, không copy
+        _mat = self._reader[i]
+        # Frame ghi với sensor ROI: báo lại cửa sổ để dịch toạ độ config
+        row = self._reader.index[i]
+        if row["roi_x"] or row["roi_y"]:
+            x, y = int(row["roi_x"]), int(row["roi_y"])
+            self._roi = (x, y, _mat.shape[1], _mat.shape[0])
+        else:
+            self._roi = None
+        self._position += 1
+        self._error = NO_ERROR
+        return self._error, _mat
@@ -6,6 +6,8 @@ class SODA(BaseCamera):
     def __init__(self, config=None) -> None:
         self._converter = None
         self._grab_result = None
+        # Frame rate của feature trước khi vào preview: (enable, fps)
+        self._frame_rate_saved = None
         super().__init__(config=config)
 
     def set_config(self, config):
@@ -115,6 +117,122 @@ class SODA(BaseCamera):
         except:
             return False
         
+    def _set_roi(self, roi) -> bool:
+        if self._cap is None or not self._cap.IsOpen():
+            return False
+
+        # Width / Height bị khóa khi đang grab
+        b_grabbing = self._cap.IsGrabbing()
+        if b_grabbing:
+            self.stop_grabbing()
+        try:
+            nodemap = self._cap.GetNodeMap()
+            offset_x = nodemap.GetNode("OffsetX")
+            offset_y = nodemap.GetNode("OffsetY")
+            width = nodemap.GetNode("Width")
+            height = nodemap.GetNode("Height")
+
+            # Offset về 0 trước để Width / Height lấy được giá trị max của cảm biến
+            offset_x.SetValue(0)
+            offset_y.SetValue(0)
+            width_max, height_max = width.GetMax(), height.GetMax()
+            if roi is None:
+                x, y, w, h = 0, 0, width_max, height_max
+            else:
+                x, y, w, h = align_roi(roi, width_max, height_max,
+                                       offset_x.GetInc(), offset_y.GetInc(),
+                                       width.GetInc(), height.GetInc(),
+                                       width.GetMin(), height.GetMin())
+            width.SetValue(w)
+            height.SetValue(h)
+            offset_x.SetValue(x)
+            offset_y.SetValue(y)
+
+            full = (w, h) == (width_max, height_max)
+            self._roi = None if full else (x, y, w, h)
+            self._error = NO_ERROR
+            return True
+        except Exception as ex:
+            self._error = ERR_SET_ROI_FAIL
+            print(f"Set ROI error: {str(ex)}")
+            return False
+        finally:
+            if b_grabbing:
+                self.start_grabbing()
+
+    def _set_binning(self, binning) -> bool:
+        # Kích thước ảnh đổi theo binning, chỉ đặt được khi không grab
+        b_grabbing = self._cap.IsGrabbing()
+        if b_grabbing:
+            self.stop_grabbing()
+        try:
+            nodemap = self._cap.GetNodeMap()
+            for name in ("BinningHorizontal", "BinningVertical"):
+                node = nodemap.GetNode(name)
+                if not genicam.IsWritable(node):
+                    print(f"Set binning error: {name} is not writable")
+                    return False
+                node.SetValue(binning)
+            self._binning = binning
+            if binning == 1:
+                # Binning về 1 không chắc trả lại Width / Height cũ: đặt lại ROI
+                self.set_roi(self._roi)
+            return True
+        except Exception as ex:
+            print(f"Set binning error: {str(ex)}")
+            return False
+        finally:
+            if b_grabbing:
+                self.start_grabbing()
+
+    def _set_frame_rate(self, frame_rate) -> bool:
+        # Frame rate đổi được cả khi đang grab, không cần dừng
+        try:
+            nodemap = self._cap.GetNodeMap()
+            enable = nodemap.GetNode("AcquisitionFrameRateEnable")
+            # ace 2 / USB: AcquisitionFrameRate, ace GigE cũ: AcquisitionFrameRateAbs
+            fps = nodemap.GetNode("AcquisitionFrameRate")
+            if not genicam.IsAvailable(fps):
+                fps = nodemap.GetNode("AcquisitionFrameRateAbs")
+            if self._frame_rate_saved is None:
+                self._frame_rate_saved = (enable.GetValue(), fps.GetValue())
+
+            b_enable, value = (True, frame_rate) if frame_rate else self._frame_rate_saved
+            enable.SetValue(b_enable)
+            if b_enable:
+                fps.SetValue(min(float(value), fps.GetMax()))
+            return True
+        except Exception as ex:
+            print(f"Set frame rate error: {str(ex)}")
+            return False
+
+    def _has_preview(self) -> bool:
+        if self._cap is None or not self._cap.IsOpen():
+            return True
+        nodemap = self._cap.GetNodeMap()
+        for name in ("BinningHorizontal", "AcquisitionFrameRate", "AcquisitionFrameRateAbs"):
+            try:
+                node = nodemap.GetNode(name)
+                if node is not None and genicam.IsAvailable(node):
+                    return True
+            except Exception:
+                pass
+        return False
+
+    def _apply_preview(self, b_preview: bool) -> bool:
+        if self._cap is None or not self._cap.IsOpen():
+            return False
+        preview = self.get_preview_config()
+        binning = int(preview.get("binning") or 1)
+        frame_rate = preview.get("frame_rate")
+
+        b_done = False
+        if binning > 1:
+            b_done |= self._set_binning(binning if b_preview else 1)
+        if frame_rate:
+            b_done |= self._set_frame_rate(frame_rate if b_preview else None)
+        return b_done
+
     def grab(self):
         _mat = None
         self._grab_result = self._cap.RetrieveResult(5000, pylon.TimeoutHandling_ThrowException)
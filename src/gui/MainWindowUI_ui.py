@@ -78,9 +78,21 @@ class Ui_MainWindow(object):
         self.ControlAuto.addLayout(self.Checked)
         self.ViewLog = QtWidgets.QVBoxLayout()
         self.ViewLog.setObjectName("ViewLog")
-        self.list_view_log = QtWidgets.QListWidget(parent=self.TabAuto)
+        self.combo_box_log_level = QtWidgets.QComboBox(parent=self.TabAuto)
+        self.combo_box_log_level.setObjectName("combo_box_log_level")
+        self.ViewLog.addWidget(self.combo_box_log_level)
+        self.list_view_log = QtWidgets.QListView(parent=self.TabAuto)
+        self.list_view_log.setUniformItemSizes(True)
         self.list_view_log.setObjectName("list_view_log")
         self.ViewLog.addWidget(self.list_view_log)
+        self.text_stats = QtWidgets.QPlainTextEdit(parent=self.TabAuto)
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.text_stats.setFont(font)
+        self.text_stats.setLineWrapMode(QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text_stats.setReadOnly(True)
+        self.text_stats.setObjectName("text_stats")
+        self.ViewLog.addWidget(self.text_stats)
         self.ControlAuto.addLayout(self.ViewLog)
         self.ButtonControl = QtWidgets.QVBoxLayout()
         self.ButtonControl.setObjectName("ButtonControl")
@@ -93,6 +105,9 @@ class Ui_MainWindow(object):
         self.button_reset = QtWidgets.QPushButton(parent=self.TabAuto)
         self.button_reset.setObjectName("button_reset")
         self.ButtonControl.addWidget(self.button_reset)
+        self.check_box_record = QtWidgets.QCheckBox(parent=self.TabAuto)
+        self.check_box_record.setObjectName("check_box_record")
+        self.ButtonControl.addWidget(self.check_box_record)
         self.ControlAuto.addLayout(self.ButtonControl)
         self.ControlAuto.setStretch(0, 2)
         self.ControlAuto.setStretch(1, 1)
@@ -199,6 +214,9 @@ class Ui_MainWindow(object):
         self.combo_box_type_adaptive_thresh = QtWidgets.QComboBox(parent=self.DetectionRoi)
         self.combo_box_type_adaptive_thresh.setObjectName("combo_box_type_adaptive_thresh")
         self.Thresh.addWidget(self.combo_box_type_adaptive_thresh, 0, 0, 1, 3)
+        self.combo_box_threshold_method = QtWidgets.QComboBox(parent=self.DetectionRoi)
+        self.combo_box_threshold_method.setObjectName("combo_box_threshold_method")
+        self.Thresh.addWidget(self.combo_box_threshold_method, 2, 0, 1, 3)
         self.ParameteDetection.addLayout(self.Thresh)
         self.TextMorph = QtWidgets.QHBoxLayout()
         self.TextMorph.setObjectName("TextMorph")
@@ -255,9 +273,13 @@ class Ui_MainWindow(object):
         self.label_distance = QtWidgets.QLabel(parent=self.DetectionRoi)
         self.label_distance.setObjectName("label_distance")
         self.TextDetection.addWidget(self.label_distance)
+        self.label_pyramid_level = QtWidgets.QLabel(parent=self.DetectionRoi)
+        self.label_pyramid_level.setObjectName("label_pyramid_level")
+        self.TextDetection.addWidget(self.label_pyramid_level)
         self.TextDetection.setStretch(0, 2)
         self.TextDetection.setStretch(1, 2)
         self.TextDetection.setStretch(2, 1)
+        self.TextDetection.setStretch(3, 2)
         self.ParameteDetection.addLayout(self.TextDetection)
         self.Rectangle = QtWidgets.QHBoxLayout()
         self.Rectangle.setObjectName("Rectangle")
@@ -270,9 +292,17 @@ class Ui_MainWindow(object):
         self.distance = QtWidgets.QSpinBox(parent=self.DetectionRoi)
         self.distance.setObjectName("distance")
         self.Rectangle.addWidget(self.distance)
+        self.spin_box_pyramid_level = QtWidgets.QSpinBox(parent=self.DetectionRoi)
+        self.spin_box_pyramid_level.setObjectName("spin_box_pyramid_level")
+        self.Rectangle.addWidget(self.spin_box_pyramid_level)
+        self.check_box_refine_blobs = QtWidgets.QCheckBox(parent=self.DetectionRoi)
+        self.check_box_refine_blobs.setObjectName("check_box_refine_blobs")
+        self.Rectangle.addWidget(self.check_box_refine_blobs)
         self.Rectangle.setStretch(0, 2)
         self.Rectangle.setStretch(1, 2)
         self.Rectangle.setStretch(2, 1)
+        self.Rectangle.setStretch(3, 1)
+        self.Rectangle.setStretch(4, 1)
         self.ParameteDetection.addLayout(self.Rectangle)
         self.ParameteDetection.setStretch(0, 1)
         self.ParameteDetection.setStretch(1, 1)
@@ -350,6 +380,18 @@ class Ui_MainWindow(object):
         self.spin_box_max_radius = QtWidgets.QSpinBox(parent=self.HoughCircle)
         self.spin_box_max_radius.setObjectName("spin_box_max_radius")
         self.ParameterHough.addWidget(self.spin_box_max_radius, 2, 3, 1, 1)
+        self.label_alignment_method = QtWidgets.QLabel(parent=self.HoughCircle)
+        self.label_alignment_method.setObjectName("label_alignment_method")
+        self.ParameterHough.addWidget(self.label_alignment_method, 3, 0, 1, 1)
+        self.combo_box_alignment_method = QtWidgets.QComboBox(parent=self.HoughCircle)
+        self.combo_box_alignment_method.setObjectName("combo_box_alignment_method")
+        self.ParameterHough.addWidget(self.combo_box_alignment_method, 3, 1, 1, 1)
+        self.label_alignment_search = QtWidgets.QLabel(parent=self.HoughCircle)
+        self.label_alignment_search.setObjectName("label_alignment_search")
+        self.ParameterHough.addWidget(self.label_alignment_search, 3, 2, 1, 1)
+        self.spin_box_alignment_search = QtWidgets.QSpinBox(parent=self.HoughCircle)
+        self.spin_box_alignment_search.setObjectName("spin_box_alignment_search")
+        self.ParameterHough.addWidget(self.spin_box_alignment_search, 3, 3, 1, 1)
         self.verticalLayout_4.addLayout(self.ParameterHough)
         self.verticalLayout_4.setStretch(0, 1)
         self.verticalLayout_4.setStretch(1, 1)
@@ -480,6 +522,7 @@ class Ui_MainWindow(object):
         self.button_start.setText(_translate("MainWindow", "Start"))
         self.button_stop.setText(_translate("MainWindow", "Stop"))
         self.button_reset.setText(_translate("MainWindow", "Reset"))
+        self.check_box_record.setText(_translate("MainWindow", "Record frames"))
         self.TabMachine.setTabText(self.TabMachine.indexOf(self.TabAuto), _translate("MainWindow", "Auto"))
         self.label_model.setText(_translate("MainWindow", "Model:"))
         self.label.setText(_translate("MainWindow", "Process Name"))
@@ -502,6 +545,8 @@ class Ui_MainWindow(object):
         self.label_area_min.setText(_translate("MainWindow", "Area Min"))
         self.label_area_max.setText(_translate("MainWindow", "Area Max"))
         self.label_distance.setText(_translate("MainWindow", "Distance"))
+        self.label_pyramid_level.setText(_translate("MainWindow", "Pyramid"))
+        self.check_box_refine_blobs.setText(_translate("MainWindow", "Refine"))
         self.TabParameter.setTabText(self.TabParameter.indexOf(self.DetectionRoi), _translate("MainWindow", "Detection Roi"))
         self.label_ksize_hough.setText(_translate("MainWindow", "K-size"))
         self.label_type_blur_hough.setText(_translate("MainWindow", "Type Blur"))
@@ -512,6 +557,8 @@ class Ui_MainWindow(object):
         self.label_param2.setText(_translate("MainWindow", "Param 2:"))
         self.label_min_radius.setText(_translate("MainWindow", "Min Radius"))
         self.label_max_radius.setText(_translate("MainWindow", "Max Radius:"))
+        self.label_alignment_method.setText(_translate("MainWindow", "Alignment:"))
+        self.label_alignment_search.setText(_translate("MainWindow", "Search:"))
         self.TabParameter.setTabText(self.TabParameter.indexOf(self.HoughCircle), _translate("MainWindow", "Hough Circle"))
         self.label_rows.setText(_translate("MainWindow", "Rows:"))
         self.label_columns.setText(_translate("MainWindow", "Columns:"))
@@ -5,20 +5,24 @@ import time
 from cameras.hik import HIK
 from cameras.webcam import Webcam
 from cameras.base_camera import NO_ERROR
+from libs.metrics import METRICS, now
 
 
 class CameraThread(QThread):
-    frameCaptured = pyqtSignal(object, object)
+    # frame, time, binning của frame (preview > 1), sensor ROI (None = full frame)
+    frameCaptured = pyqtSignal(object, object, int, object)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, camera=None):
         super().__init__(parent)
-        self.camera = HIK(
-            config={
-                "id": "0",
-                "feature": "",
-                # "color": True
-            }
-        )
+        if camera is None:
+            camera = HIK(
+                config={
+                    "id": "0",
+                    "feature": "",
+                    # "color": True
+                }
+            )
+        self.camera = camera
         self.b_open = None
         self.frame = None
         self.running = False
@@ -29,7 +33,10 @@ class CameraThread(QThread):
 
     def grab_camera(self):
         if self.b_open:
-            err, self.frame = self.camera.grab()
+            t = now()
+            # Frame chụp luôn ở độ phân giải đầy đủ, kể cả khi đang live view
+            err, self.frame = self.camera.grab_full()
+            METRICS.record("camera.grab", t)
             return self.frame
         else:
             return None
@@ -38,13 +45,16 @@ class CameraThread(QThread):
         if self.b_open:
             self.running = True
             while self.running:
-                err, self.frame = self.camera.grab()
+                t = now()
+                err, frame = self.camera.grab_preview()
+                METRICS.record("camera.grab_live", t)
 
                 if err != NO_ERROR:
                     print("Camera error: ", err)
                     break
                 else:
-                    self.frameCaptured.emit(self.frame, time.time())
+                    binning, roi = self.camera.get_live_mode()
+                    self.frameCaptured.emit(frame, time.time(), binning, roi)
 
                 time.sleep(0.04)
 
@@ -54,5 +64,11 @@ class CameraThread(QThread):
 
     def close_camera(self):
         self.stop_camera()
+        # Binning / frame rate của preview cũng giữ lại trong camera
+        if self.camera.is_preview():
+            self.camera.set_preview(False)
+        # Trả cảm biến về full frame, thiết lập ROI còn giữ sau khi đóng
+        if self.camera.get_roi() is not None:
+            self.camera.set_roi(None)
         self.camera.stop_grabbing()
         self.camera.close()
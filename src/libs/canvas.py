@@ -2,7 +2,6 @@ import sys
 from shape import *
 from edit_label_dlg import BoxEditLabel
 from utils import *
-import resources
 
 from functools import partial
 
@@ -65,6 +64,9 @@ class Canvas(QLabel):
 
         self.text_pixel_color = "BGR:"
         self.shapes = []
+        # Overlay kết quả (OVERLAY items), vẽ dạng vector lên picture
+        self.overlay = []
+        self.overlay_scale = 1.0
         # self.dict_shapes = {}
         self.idVisible = None
         self.idSelected = None
@@ -469,6 +471,8 @@ class Canvas(QLabel):
             self.selectedShapeSignal.emit(self.idSelected)
         else:
             self.idSelected = None
+            # -1: bỏ chọn
+            self.selectedShapeSignal.emit(-1)
 
     def highlightCorner(self, pos, epsilon=10):
         if self.idSelected is None:
@@ -517,6 +521,9 @@ class Canvas(QLabel):
         for shape in self.shapes:
             shape.paint(p, self.scale)
 
+        if self.overlay:
+            self.paint_overlay(p)
+
         if self.edit:
             # draw center
             pos = self.current_pos
@@ -534,6 +541,48 @@ class Canvas(QLabel):
 
         return super().paintEvent(event)
 
+    def paint_overlay(self, p: QPainter):
+        """Paint OVERLAY items as vectors, coordinates scaled by overlay_scale"""
+        s = self.overlay_scale
+        for item in self.overlay:
+            b, g, r = item.color
+            lw = max(item.thickness * s, 1)
+            p.setPen(QPen(QColor(r, g, b), lw))
+            if item.kind == "rect":
+                x, y, w, h = item.points
+                p.drawRect(QRectF(x * s, y * s, w * s, h * s))
+            elif item.kind == "circle":
+                x, y, radius = item.points
+                p.drawEllipse(QPointF(x * s, y * s), radius * s, radius * s)
+            elif item.kind == "arrow":
+                x0, y0, x1, y1 = item.points
+                p0, p1 = QPointF(x0 * s, y0 * s), QPointF(x1 * s, y1 * s)
+                p.drawLine(p0, p1)
+                # Đầu mũi tên 10% chiều dài, giống cv.arrowedLine
+                v = p1 - p0
+                length = np.hypot(v.x(), v.y())
+                if length > 0:
+                    angle = np.arctan2(v.y(), v.x())
+                    tip = 0.1 * length
+                    for a in (angle + np.pi / 6, angle - np.pi / 6):
+                        p.drawLine(p1, p1 - QPointF(tip * np.cos(a), tip * np.sin(a)))
+            elif item.kind == "text":
+                x, y = item.points
+                font = QFont("Arial")
+                # cv.FONT_HERSHEY_SIMPLEX cao ~22px với font scale 1
+                font.setPixelSize(max(int(22 * item.font_scale * s), 1))
+                p.setFont(font)
+                p.drawText(QPointF(x * s, y * s), item.text)
+
+    def set_overlay(self, overlay: list, scale=1.0):
+        self.overlay = overlay if overlay is not None else []
+        self.overlay_scale = scale
+        self.update()
+
+    def clear_overlay(self):
+        self.overlay = []
+        self.update()
+
     def wheelEvent(self, ev):
         if self.picture is None:
             return super(Canvas, self).wheelEvent(ev)
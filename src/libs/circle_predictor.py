@@ -0,0 +1,142 @@
+import threading
+
+import numpy as np
+
+from libs.fiducial_matcher import ANGLE_TOLERANCE, DEFAULT_SEARCH
+
+# Khoảng bán kính khi dự đoán: r +- max(RADIUS_MARGIN, r * RADIUS_TOLERANCE)
+RADIUS_TOLERANCE = 0.15
+RADIUS_MARGIN = 2
+
+
+class CirclePredictor:
+    """
+    HoughCircles only in small windows around the expected circles.\n
+    config["blobs"] holds the origin box, c0 and c1 of every ROI. c0 is
+    expected at its origin position shifted by the displacement of the blob
+    box centre, c1 at c0 + origin vector (rotation widens its window by
+    |vector| * ANGLE_TOLERANCE). Each window is searched with the radius
+    range tightened around the origin radius. ROIs where a circle is not
+    found (or the origin has no circles, older models) are returned by
+    match() for the full box search. Thread safe counters of hit / miss.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def origin_circles(origins: dict, n: int):
+        """(boxes, c0, c1, valid) arrays of the first n origins"""
+        boxes = np.zeros((n, 4), dtype=np.float64)
+        c0 = np.zeros((n, 3), dtype=np.float64)
+        c1 = np.zeros((n, 3), dtype=np.float64)
+        valid = np.zeros(n, dtype=bool)
+        for i in range(n):
+            origin = origins.get(str(i)) or {}
+            if origin.get("box") and origin.get("c0") and origin.get("c1"):
+                boxes[i] = origin["box"]
+                c0[i] = origin["c0"]
+                c1[i] = origin["c1"]
+                valid[i] = c0[i, 2] > 0 and c1[i, 2] > 0
+        return boxes, c0, c1, valid
+
+    @staticmethod
+    def search(src, config: dict, center, radius: float, r: float, hough_fn):
+        """
+        Circle nearest to center within radius, only radii around r.\n
+        Returns (x, y, r) in image coordinates or None.
+        """
+        tolerance = max(RADIUS_MARGIN, r * RADIUS_TOLERANCE)
+        half = int(radius + r + tolerance) + 1
+        h, w = src.shape[:2]
+        cx, cy = int(round(center[0])), int(round(center[1]))
+        x0, y0 = max(cx - half, 0), max(cy - half, 0)
+        x1, y1 = min(cx + half + 1, w), min(cy + half + 1, h)
+        if x1 - x0 < 2 * r or y1 - y0 < 2 * r:
+            return None
+
+        # Chỉ hough_circle được hough_fn đọc, thay khoảng bán kính
+        window_config = {
+            "hough_circle": {
+                **config["hough_circle"],
+                "min_radius": max(int(r - tolerance), 1),
+                "max_radius": int(np.ceil(r + tolerance)),
+            }
+        }
+        circles = hough_fn(src[y0:y1, x0:x1], window_config)
+        if not len(circles):
+            return None
+
+        d = np.hypot(circles[:, 0] + x0 - center[0], circles[:, 1] + y0 - center[1])
+        i = int(np.argmin(d))
+        if d[i] > radius:
+            return None
+        x, y, r = circles[i].tolist()
+        return x + x0, y + y0, r
+
+    def match(self, src, table: np.ndarray, config: dict, hough_fn) -> np.ndarray:
+        """
+        Fill c0, c1, center, vector and paired of the predicted ROIs.\n
+        hough_fn(cropped_image, config) returns the (N, 3) circles of a
+        window. Returns the indexes of the found ROIs that were not predicted.
+        """
+        radius = float(config.get("alignment", {}).get("search", DEFAULT_SEARCH))
+        origins = config.get("blobs") or {}
+        boxes, c0, c1, valid = self.origin_circles(origins, len(table))
+
+        indexes = np.flatnonzero(table["found"])
+        misses = []
+        for i in indexes:
+            if not valid[i]:
+                misses.append(i)
+                continue
+
+            # Dịch theo độ lệch tâm box so với origin
+            x, y, w, h = table["box"][i].tolist()
+            ox, oy, ow, oh = boxes[i]
+            dx = x + w / 2 - (ox + ow / 2)
+            dy = y + h / 2 - (oy + oh / 2)
+
+            p0 = self.search(
+                src, config, (c0[i, 0] + dx, c0[i, 1] + dy), radius, c0[i, 2], hough_fn
+            )
+            if p0 is None:
+                misses.append(i)
+                continue
+
+            vector = c1[i, :2] - c0[i, :2]
+            radius1 = np.hypot(*vector) * ANGLE_TOLERANCE + RADIUS_MARGIN
+            expected = (p0[0] + vector[0], p0[1] + vector[1])
+            p1 = self.search(src, config, expected, radius1, c1[i, 2], hough_fn)
+            if p1 is None or np.hypot(p1[0] - p0[0], p1[1] - p0[1]) <= p0[2]:
+                misses.append(i)
+                continue
+
+            table["c0"][i] = p0
+            table["c1"][i] = p1
+            table["center"][i] = p0[:2]
+            table["vector"][i] = (p1[0] - p0[0], p1[1] - p0[1])
+            table["paired"][i] = True
+
+        with self._lock:
+            self.hits += len(indexes) - len(misses)
+            self.misses += len(misses)
+        return np.asarray(misses, dtype=np.int64)
+
+    def format_stats(self) -> str:
+        return (
+            f"circle prediction: {self.hit_rate * 100:.0f}% hit "
+            f"({self.hits}/{self.hits + self.misses})"
+        )
+
+    def clear(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
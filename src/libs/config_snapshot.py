@@ -0,0 +1,39 @@
+from collections import namedtuple
+
+from libs.metrics import now
+
+
+CONFIG_SNAPSHOT = namedtuple(
+    "config_snapshot", ["version", "config", "t_publish"], defaults=[0, {}, 0.0]
+)
+
+
+class ConfigPublisher:
+    """
+    Latest config published by the GUI thread for the worker threads.\n
+    publish() is only called from the GUI thread, when a parameter widget or
+    a shape changed, and bumps the version only when the config differs from
+    the current one. Workers read self.snapshot: one attribute load, atomic
+    under the GIL, so a reader always gets a complete (version, config)
+    pair without a lock. A published config dict is never modified again,
+    readers must treat it as read-only.
+    """
+
+    def __init__(self):
+        self.snapshot = CONFIG_SNAPSHOT()
+
+    @property
+    def version(self) -> int:
+        return self.snapshot.version
+
+    @property
+    def config(self) -> dict:
+        return self.snapshot.config
+
+    def publish(self, config: dict) -> bool:
+        """Publish config (a new dict owned by the snapshot), True if it changed"""
+        current = self.snapshot
+        if not config or config == current.config:
+            return False
+        self.snapshot = CONFIG_SNAPSHOT(current.version + 1, config, now())
+        return True
@@ -0,0 +1,180 @@
+import os
+
+import cv2 as cv
+import numpy as np
+
+
+# Tên file template trong thư mục model
+FIDUCIALS_FILE = "fiducials.npz"
+
+# config["alignment"]["method"]
+ALIGNMENT_HOUGH = "Hough"
+ALIGNMENT_TEMPLATE = "Template"
+ALIGNMENT_PREDICTIVE = "Predictive"
+ALIGNMENT_METHODS = [ALIGNMENT_HOUGH, ALIGNMENT_TEMPLATE, ALIGNMENT_PREDICTIVE]
+
+# Mặc định của config["alignment"]
+DEFAULT_SEARCH = 48  # bán kính cửa sổ tìm c0 (pixel)
+DEFAULT_MIN_SCORE = 0.5  # điểm NCC tối thiểu
+# Cửa sổ tìm c1 nới thêm |vector| * ANGLE_TOLERANCE (~ sin 15 độ)
+ANGLE_TOLERANCE = 0.26
+
+
+class FiducialMatcher:
+    """
+    Template matching of the two fiducial circles of every ROI.\n
+    Templates are cut from the origin image around c0 / c1 of the origin
+    result. At runtime c0 is searched with normalized cross correlation in a
+    small window around its origin position relative to the blob box centre,
+    c1 around c0 + origin vector. Circles are rotation invariant, the angle
+    follows from the two positions like with HoughCircles.
+    """
+
+    def __init__(self, boxes, c0, c1, templates0, templates1, valid):
+        self.boxes = boxes
+        self.c0 = c0
+        self.c1 = c1
+        self.templates0 = templates0
+        self.templates1 = templates1
+        self.valid = valid
+
+    def __len__(self):
+        return len(self.boxes)
+
+    @staticmethod
+    def _patch(gray, center, half: int):
+        x, y = int(center[0]), int(center[1])
+        h, w = gray.shape[:2]
+        if x - half < 0 or y - half < 0 or x + half >= w or y + half >= h:
+            return None
+        return gray[y - half : y + half + 1, x - half : x + half + 1]
+
+    @classmethod
+    def learn(cls, src, table: np.ndarray, margin=4):
+        """Cut the fiducial templates of every paired ROI of an origin table"""
+        gray = cv.cvtColor(src, cv.COLOR_BGR2GRAY) if src.ndim == 3 else src
+        radius = max(
+            int(table["c0"][:, 2].max(initial=0)),
+            int(table["c1"][:, 2].max(initial=0)),
+            1,
+        )
+        half = radius + margin
+        size = 2 * half + 1
+
+        templates0 = np.zeros((len(table), size, size), dtype=np.uint8)
+        templates1 = np.zeros((len(table), size, size), dtype=np.uint8)
+        valid = table["paired"].copy()
+        for i in np.flatnonzero(valid):
+            p0 = cls._patch(gray, table["c0"][i, :2], half)
+            p1 = cls._patch(gray, table["c1"][i, :2], half)
+            if p0 is None or p1 is None:
+                valid[i] = False
+                continue
+            templates0[i] = p0
+            templates1[i] = p1
+
+        return cls(
+            table["box"].copy(),
+            table["c0"].copy(),
+            table["c1"].copy(),
+            templates0,
+            templates1,
+            valid,
+        )
+
+    def save(self, path: str):
+        np.savez_compressed(
+            path,
+            boxes=self.boxes,
+            c0=self.c0,
+            c1=self.c1,
+            templates0=self.templates0,
+            templates1=self.templates1,
+            valid=self.valid,
+        )
+
+    @classmethod
+    def load(cls, path: str):
+        """FiducialMatcher saved at path, None when the model has no templates"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                return cls(
+                    data["boxes"],
+                    data["c0"],
+                    data["c1"],
+                    data["templates0"],
+                    data["templates1"],
+                    data["valid"],
+                )
+        except Exception as e:
+            print(f"Error loading fiducials {path}: {str(e)}")
+            return None
+
+    @staticmethod
+    def search(src, template, center, radius: int, exclude=None):
+        """
+        Best NCC position of template within radius of center, positions
+        inside the circle exclude (x, y, r) are skipped.\n
+        Returns ((x, y), score) or (None, 0.0) when the window leaves the image.
+        """
+        half = template.shape[0] // 2
+        h, w = src.shape[:2]
+        cx, cy = int(center[0]), int(center[1])
+        x0, y0 = max(cx - radius - half, 0), max(cy - radius - half, 0)
+        x1, y1 = min(cx + radius + half + 1, w), min(cy + radius + half + 1, h)
+        if x1 - x0 < template.shape[1] or y1 - y0 < template.shape[0]:
+            return None, 0.0
+
+        window = src[y0:y1, x0:x1]
+        if window.ndim == 3:
+            window = cv.cvtColor(window, cv.COLOR_BGR2GRAY)
+
+        res = cv.matchTemplate(window, template, cv.TM_CCOEFF_NORMED)
+        if exclude is not None:
+            # Điểm thấp nhất cho cả đĩa: vector ngắn thì cửa sổ c1 chứa luôn c0
+            ex, ey, er = exclude
+            cv.circle(
+                res,
+                (int(ex) - x0 - half, int(ey) - y0 - half),
+                max(int(er), 1),
+                -1.0,
+                -1,
+            )
+        _, score, _, loc = cv.minMaxLoc(res)
+        return (x0 + loc[0] + half, y0 + loc[1] + half), score
+
+    def match(self, src, table: np.ndarray, config: dict):
+        """Fill c0, c1, center, vector and paired of the found ROIs of table"""
+        alignment = config.get("alignment", {})
+        radius = int(alignment.get("search", DEFAULT_SEARCH))
+        min_score = float(alignment.get("min_score", DEFAULT_MIN_SCORE))
+
+        n = min(len(table), len(self))
+        for i in np.flatnonzero(table["found"][:n] & self.valid[:n]):
+            # Vị trí c0 so với tâm box giống như ảnh origin
+            x, y, w, h = table["box"][i]
+            ox, oy, ow, oh = self.boxes[i]
+            expected = (
+                self.c0[i, 0] - (ox + ow / 2) + (x + w / 2),
+                self.c0[i, 1] - (oy + oh / 2) + (y + h / 2),
+            )
+            p0, score = self.search(src, self.templates0[i], expected, radius)
+            if p0 is None or score < min_score:
+                continue
+
+            vector = self.c1[i, :2] - self.c0[i, :2]
+            radius1 = radius + int(np.hypot(*vector) * ANGLE_TOLERANCE)
+            expected = (p0[0] + vector[0], p0[1] + vector[1])
+            p1, score = self.search(
+                src, self.templates1[i], expected, radius1, (*p0, self.c0[i, 2])
+            )
+            if p1 is None or score < min_score:
+                continue
+
+            table["c0"][i] = (p0[0], p0[1], self.c0[i, 2])
+            table["c1"][i] = (p1[0], p1[1], self.c1[i, 2])
+            table["center"][i] = p0
+            table["vector"][i] = (p1[0] - p0[0], p1[1] - p0[1])
+            table["paired"][i] = True
@@ -0,0 +1,303 @@
+import glob
+import mmap
+import os
+import threading
+import time
+
+import numpy as np
+
+from libs.metrics import now
+
+
+# Mỗi segment gồm file dữ liệu .frames và file index .index.npy cùng tên
+FRAMES_EXTENSION = ".frames"
+INDEX_EXTENSION = ".index.npy"
+# Offset mỗi frame căn theo trang bộ nhớ: view NumPy luôn aligned
+FRAME_ALIGN = 4096
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("frame", np.int64),
+        ("t", np.float64),
+        ("t_mono", np.float64),
+        ("trigger", np.int64),
+        ("offset", np.int64),
+        ("nbytes", np.int64),
+        ("height", np.int32),
+        ("width", np.int32),
+        ("channels", np.int32),
+        ("roi_x", np.int32),
+        ("roi_y", np.int32),
+        ("dtype", "S8"),
+        ("pixel_format", "S16"),
+        ("model", "S32"),
+        ("failed", np.bool_),
+        ("valid", np.bool_),
+    ]
+)
+
+
+def pixel_format(mat: np.ndarray) -> str:
+    """Name of the pixel layout of a grabbed frame"""
+    bits = mat.dtype.itemsize * 8
+    if mat.ndim == 2:
+        return f"Mono{bits}"
+    if mat.shape[2] == 3:
+        return f"BGR{bits}"
+    return f"C{mat.shape[2]}x{bits}"
+
+
+class FrameRecorder:
+    """
+    Raw frame recorder on preallocated memory-mapped segment files.\n
+    Each segment is a data file of segment_bytes, allocated once when the
+    segment is opened, plus an index of max_frames rows (INDEX_DTYPE,
+    np.lib.format.open_memmap). record() copies the frame as grabbed
+    (Bayer / Mono / BGR, no encoding) to the next page aligned offset and
+    then fills its index row, `valid` last, so a reader never sees a
+    partly written frame. A full segment is closed (data file truncated to
+    the used size) and the next one is opened.
+    """
+
+    def __init__(self, root="recordings", segment_bytes=4 * 1024**3, max_frames=10000):
+        self.root = root
+        self.segment_bytes = int(segment_bytes)
+        self.max_frames = max(int(max_frames), 1)
+        self.folder = None
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._data = None
+        self._index = None
+        self._segment = 0
+        self._n_segment_frames = 0
+        self._offset = 0
+
+        self.n_frames = 0
+        self.n_dropped = 0
+        self.n_bytes = 0
+
+    @property
+    def running(self):
+        return self._data is not None
+
+    def start(self, name: str = None) -> bool:
+        """Open a new recording folder root/<name> (timestamp by default)"""
+        with self._lock:
+            if self._data is not None:
+                return True
+            name = name or time.strftime("%Y%m%d_%H%M%S")
+            self.folder = os.path.join(self.root, name)
+            self._segment = 0
+            self.n_frames = 0
+            self.n_dropped = 0
+            self.n_bytes = 0
+            try:
+                os.makedirs(self.folder, exist_ok=True)
+                self._open_segment()
+            except OSError as e:
+                print(f"Error opening recording {self.folder}: {str(e)}")
+                self._close_segment()
+                return False
+        return True
+
+    def stop(self):
+        with self._lock:
+            self._close_segment()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.folder, f"seg_{segment:04d}")
+
+    def _open_segment(self):
+        path = self._segment_path(self._segment)
+        self._file = open(path + FRAMES_EXTENSION, "w+b")
+        # Cấp phát trước cả segment, không cấp phát lại khi đang ghi
+        self._file.truncate(self.segment_bytes)
+        self._data = mmap.mmap(self._file.fileno(), self.segment_bytes)
+        self._index = np.lib.format.open_memmap(
+            path + INDEX_EXTENSION,
+            mode="w+",
+            dtype=INDEX_DTYPE,
+            shape=(self.max_frames,),
+        )
+        self._n_segment_frames = 0
+        self._offset = 0
+
+    def _close_segment(self):
+        if self._index is not None:
+            self._index.flush()
+            del self._index
+            self._index = None
+        if self._data is not None:
+            self._data.flush()
+            self._data.close()
+            self._data = None
+        if self._file is not None:
+            # Bỏ phần cấp phát trước chưa dùng
+            self._file.truncate(self._offset)
+            self._file.close()
+            self._file = None
+
+    def record(
+        self,
+        mat: np.ndarray,
+        trigger: int = -1,
+        model: str = "",
+        t_mono: float = None,
+        roi=None,
+        failed: bool = False,
+    ) -> bool:
+        """
+        Append one frame, False when not recording or the frame is dropped.\n
+        t_mono: perf_counter time of the frame (trigger), now() by default.
+        roi: sensor window (x, y, w, h) the frame was read out with.
+        failed: processing the frame gave no result.
+        """
+        if mat is None or self._data is None:
+            return False
+        t, t_mono = time.time(), now() if t_mono is None else t_mono
+        mat = np.ascontiguousarray(mat)
+        nbytes = mat.nbytes
+
+        with self._lock:
+            if self._data is None:
+                return False
+            if (
+                self._n_segment_frames >= self.max_frames
+                or self._offset + nbytes > self.segment_bytes
+            ):
+                if self._n_segment_frames == 0:
+                    # Frame lớn hơn cả segment
+                    self.n_dropped += 1
+                    return False
+                try:
+                    self._close_segment()
+                    self._segment += 1
+                    self._open_segment()
+                except OSError as e:
+                    print(f"Error opening recording segment: {str(e)}")
+                    self._close_segment()
+                    self.n_dropped += 1
+                    return False
+
+            offset = self._offset
+            view = np.ndarray(
+                mat.shape, dtype=mat.dtype, buffer=self._data, offset=offset
+            )
+            view[...] = mat
+            del view
+
+            row = self._index[self._n_segment_frames]
+            row["frame"] = self.n_frames
+            row["t"] = t
+            row["t_mono"] = t_mono
+            row["trigger"] = trigger
+            row["offset"] = offset
+            row["nbytes"] = nbytes
+            row["height"] = mat.shape[0]
+            row["width"] = mat.shape[1]
+            row["channels"] = mat.shape[2] if mat.ndim == 3 else 1
+            row["roi_x"], row["roi_y"] = roi[:2] if roi else (0, 0)
+            row["dtype"] = mat.dtype.str.encode()
+            row["pixel_format"] = pixel_format(mat).encode()
+            row["model"] = model.encode("utf-8")[:32]
+            row["failed"] = failed
+            # Đánh dấu valid sau cùng, khi dữ liệu và metadata đã ghi xong
+            row["valid"] = True
+
+            self._n_segment_frames += 1
+            self._offset += -(-nbytes // FRAME_ALIGN) * FRAME_ALIGN
+            self.n_frames += 1
+            self.n_bytes += nbytes
+        return True
+
+    def format_stats(self) -> str:
+        return (
+            f"recorder: frames={self.n_frames} dropped={self.n_dropped} "
+            f"segment={self._segment} {self.n_bytes / 1024**2:.0f} MB"
+        )
+
+
+class FrameReader:
+    """
+    Random access to a recording made by FrameRecorder.\n
+    The data files are memory-mapped read-only: reader[i] is a NumPy view
+    of frame i straight on the mapping (no copy, no decode), pages are read
+    by the OS on first access and shared by every process reading the same
+    recording. Only the valid index rows are used, so a recording still
+    being written can be read.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.isdir(path):
+            index_paths = sorted(glob.glob(os.path.join(path, "*" + INDEX_EXTENSION)))
+        else:
+            index_paths = [path[: -len(FRAMES_EXTENSION)] + INDEX_EXTENSION]
+
+        indexes, self._data, segments = [], [], []
+        for index_path in index_paths:
+            data_path = index_path[: -len(INDEX_EXTENSION)] + FRAMES_EXTENSION
+            if not os.path.isfile(data_path) or not os.path.getsize(data_path):
+                continue
+            index = np.load(index_path, mmap_mode="r")
+            index = index[index["valid"]]
+            if index.dtype != INDEX_DTYPE:
+                # Recording cũ thiếu vài trường: các trường mới để 0
+                converted = np.zeros(len(index), dtype=INDEX_DTYPE)
+                for name in index.dtype.names:
+                    converted[name] = index[name]
+                index = converted
+            index = np.array(index)
+            indexes.append(index)
+            segments.append(np.full(len(index), len(self._data), dtype=np.int32))
+            self._data.append(np.memmap(data_path, dtype=np.uint8, mode="r"))
+
+        self.index = (
+            np.concatenate(indexes) if indexes else np.zeros(0, dtype=INDEX_DTYPE)
+        )
+        self._segments = (
+            np.concatenate(segments) if segments else np.zeros(0, dtype=np.int32)
+        )
+
+    @staticmethod
+    def is_recording(path: str) -> bool:
+        return os.path.isdir(path) and bool(
+            glob.glob(os.path.join(path, "*" + INDEX_EXTENSION))
+        )
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        row = self.index[i]
+        shape = (int(row["height"]), int(row["width"]))
+        if row["channels"] > 1:
+            shape += (int(row["channels"]),)
+        return np.ndarray(
+            shape,
+            dtype=np.dtype(row["dtype"].decode()),
+            buffer=self._data[self._segments[i]],
+            offset=int(row["offset"]),
+        )
+
+    def meta(self, i: int) -> dict:
+        """Metadata of frame i as plain Python values"""
+        row = self.index[i]
+        return {
+            "frame": int(row["frame"]),
+            "t": float(row["t"]),
+            "t_mono": float(row["t_mono"]),
+            "trigger": int(row["trigger"]),
+            "height": int(row["height"]),
+            "width": int(row["width"]),
+            "channels": int(row["channels"]),
+            "roi_x": int(row["roi_x"]),
+            "roi_y": int(row["roi_y"]),
+            "pixel_format": row["pixel_format"].decode(),
+            "model": row["model"].decode("utf-8", "ignore"),
+            "failed": bool(row["failed"]),
+        }
+
+    def close(self):
+        self._data = []
@@ -0,0 +1,217 @@
+import os
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+
+import cv2 as cv
+
+from libs.image_processor import ImageProcessor, RESULT
+
+ARCHIVE_JOB = namedtuple(
+    "archive_job",
+    ["index", "b_pass", "mat", "result", "config", "t"],
+    defaults=[0, True, None, None, None, 0.0],
+)
+
+# Thư mục con theo kết quả
+ARCHIVE_OK = "OK"
+ARCHIVE_NG = "NG"
+
+RAW_EXTENSION = ".png"
+DST_EXTENSION = ".jpg"
+JPEG_QUALITY = 90
+PNG_COMPRESSION = 1  # nén nhẹ: nhanh hơn nhiều so với mặc định 3, file lớn hơn ~10%
+
+
+class ImageArchiver:
+    """
+    Background archive of inspected frames.\n
+    submit() only puts the job on a bounded queue and never blocks: when the
+    encoders fall behind the frame is dropped (counted in n_dropped), the
+    inspection is never stalled. Encoder threads write the raw frame as PNG
+    and the annotated result as JPEG under root/OK|NG/YYYYMMDD/.\n
+    Only the last keep_ok OK frames are kept. When the archive exceeds
+    max_bytes the oldest OK frames are evicted first, then the oldest NG.
+    """
+
+    def __init__(
+        self,
+        root="archive",
+        max_bytes=20 * 1024**3,
+        keep_ok=500,
+        n_workers=2,
+        queue_size=8,
+        b_archive_ok=True,
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.keep_ok = keep_ok
+        self.n_workers = max(int(n_workers), 1)
+        self.b_archive_ok = b_archive_ok
+
+        self.queue = queue.Queue(maxsize=max(int(queue_size), 1))
+        # Mỗi frame: (t, [paths], bytes), cũ nhất ở đầu
+        self._frames = {ARCHIVE_OK: deque(), ARCHIVE_NG: deque()}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.n_saved = 0
+        self.n_dropped = 0
+        self.n_evicted = 0
+        self.n_errors = 0
+
+        self._threads = []
+        self._running = False
+
+    @property
+    def running(self):
+        return self._running
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def start(self):
+        if self._running:
+            return
+        self.scan()
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._loop_encode, daemon=True)
+            for _ in range(self.n_workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def stop(self, timeout=5.0):
+        """Stop after the queued frames are written (up to timeout)"""
+        if not self._running:
+            return
+        t_end = time.perf_counter() + timeout
+        while not self.queue.empty() and time.perf_counter() < t_end:
+            time.sleep(0.05)
+        self._running = False
+        for t in self._threads:
+            t.join(max(t_end - time.perf_counter(), 0.1))
+        self._threads = []
+
+    def submit(self, index: int, result: RESULT, config: dict, b_pass: bool) -> bool:
+        """Queue a frame for archiving, False when it is skipped or dropped"""
+        if not self._running or result is None or result.src is None:
+            return False
+        if b_pass and not (self.b_archive_ok and self.keep_ok > 0):
+            return False
+        try:
+            self.queue.put_nowait(
+                ARCHIVE_JOB(index, b_pass, result.src, result, config, time.time())
+            )
+        except queue.Full:
+            self.n_dropped += 1
+            return False
+        return True
+
+    def scan(self):
+        """Rebuild the frame index from the files already in root"""
+        frames = {ARCHIVE_OK: {}, ARCHIVE_NG: {}}
+        for kind in frames:
+            for dirpath, _, filenames in os.walk(os.path.join(self.root, kind)):
+                for filename in filenames:
+                    # <stem>_raw.png / <stem>_dst.jpg cùng thuộc 1 frame
+                    stem = filename.rsplit("_", 1)[0]
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    t, paths, size = frames[kind].get(stem, (stat.st_mtime, [], 0))
+                    paths.append(path)
+                    frames[kind][stem] = (
+                        min(t, stat.st_mtime),
+                        paths,
+                        size + stat.st_size,
+                    )
+
+        with self._lock:
+            self._total_bytes = 0
+            for kind, items in frames.items():
+                self._frames[kind] = deque(sorted(items.values(), key=lambda f: f[0]))
+                self._total_bytes += sum(f[2] for f in items.values())
+
+    def _loop_encode(self):
+        while self._running:
+            try:
+                job: ARCHIVE_JOB = self.queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                self._write(job)
+            except Exception as e:
+                self.n_errors += 1
+                print(f"[{time.strftime('%H:%M:%S')}][archive][ERROR]: {str(e)}")
+
+    def _write(self, job: ARCHIVE_JOB):
+        kind = ARCHIVE_OK if job.b_pass else ARCHIVE_NG
+        folder = os.path.join(
+            self.root, kind, time.strftime("%Y%m%d", time.localtime(job.t))
+        )
+        os.makedirs(folder, exist_ok=True)
+        ms = int(job.t * 1000) % 1000
+        stem = (
+            time.strftime("%H%M%S", time.localtime(job.t)) + f"{ms:03d}_{job.index:06d}"
+        )
+
+        raw_path = os.path.join(folder, f"{stem}_raw{RAW_EXTENSION}")
+        dst_path = os.path.join(folder, f"{stem}_dst{DST_EXTENSION}")
+
+        # Ảnh kết quả chỉ được vẽ ở đây, không tốn thời gian của pipeline
+        dst = ImageProcessor.render_output(job.result, job.config)
+
+        size = 0
+        for path, mat, params in (
+            (raw_path, job.mat, [cv.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION]),
+            (dst_path, dst, [cv.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]),
+        ):
+            ret, buf = cv.imencode(os.path.splitext(path)[1], mat, params)
+            if not ret:
+                raise RuntimeError(f"Failed to encode {path}")
+            # tofile thay cho imwrite: hỗ trợ đường dẫn unicode trên Windows
+            buf.tofile(path)
+            size += buf.size
+
+        with self._lock:
+            self._frames[kind].append((job.t, [raw_path, dst_path], size))
+            self._total_bytes += size
+            self.n_saved += 1
+            evict = self._select_evictions()
+
+        for paths in evict:
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _select_evictions(self) -> list:
+        """Pop the frames over keep_ok / max_bytes from the index (under lock)"""
+        evict = []
+        ok, ng = self._frames[ARCHIVE_OK], self._frames[ARCHIVE_NG]
+        while len(ok) > self.keep_ok:
+            evict.append(self._pop(ok))
+        while self._total_bytes > self.max_bytes and (ok or ng):
+            evict.append(self._pop(ok if ok else ng))
+        return evict
+
+    def _pop(self, frames: deque) -> list:
+        _, paths, size = frames.popleft()
+        self._total_bytes -= size
+        self.n_evicted += 1
+        return paths
+
+    def format_stats(self) -> str:
+        return (
+            f"archive: saved={self.n_saved} dropped={self.n_dropped} "
+            f"evicted={self.n_evicted} q={self.queue.qsize()} "
+            f"ok={len(self._frames[ARCHIVE_OK])} ng={len(self._frames[ARCHIVE_NG])} "
+            f"{self._total_bytes / 1024**2:.0f}/{self.max_bytes / 1024**2:.0f} MB"
+        )
@@ -0,0 +1,211 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2 as cv
+import numpy as np
+
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+# Chỉ JPEG giải mã nhỏ nhanh hơn hẳn (IDCT thu nhỏ), PNG / BMP vẫn đọc hết file
+PREVIEW_EXTENSIONS = (".jpg", ".jpeg")
+PREVIEW_FLAGS = {
+    2: cv.IMREAD_REDUCED_COLOR_2,
+    4: cv.IMREAD_REDUCED_COLOR_4,
+    8: cv.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def scan_folder(folder: str, extensions=IMAGE_EXTENSIONS) -> list:
+    """Sorted image paths of a folder (one os.scandir pass, no stat per file)"""
+    paths = []
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.name.lower().endswith(extensions) and entry.is_file():
+                paths.append(entry.path)
+    return sorted(paths)
+
+
+class ImageCache:
+    """
+    LRU of decoded images bounded by their total size in bytes.\n
+    Keys are (path, reduce), reduce = 1 for the full frame.
+    """
+
+    def __init__(self, max_bytes=1024**3):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.n_hits = 0
+        self.n_misses = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key) -> np.ndarray:
+        with self._lock:
+            mat = self._items.get(key)
+            if mat is None:
+                self.n_misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.n_hits += 1
+            return mat
+
+    def put(self, key, mat: np.ndarray):
+        if mat is None or mat.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._items[key] = mat
+            self._bytes += mat.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+
+class ImageLoader:
+    """
+    Folder listing and image decoding off the GUI thread.\n
+    list_folder() scans on a worker and calls on_listed(folder, paths).
+    request(paths, index) makes paths[index] the current image: a cached
+    frame is delivered at once, otherwise a reduced JPEG preview and the
+    full frame are decoded on the pool and delivered through
+    on_loaded(path, mat, reduce) (reduce = 1 for the full frame, mat None
+    when decoding failed). The `prefetch` images before and after are
+    decoded into the cache too. Decodes queued for images that are no
+    longer near the current one are cancelled.\n
+    Callbacks run on the worker threads, the caller must hand them over to
+    its own thread (a Qt signal).
+    """
+
+    def __init__(
+        self,
+        on_loaded=None,
+        on_listed=None,
+        n_workers=2,
+        max_bytes=1024**3,
+        prefetch=2,
+        preview_reduce=4,
+    ):
+        self.on_loaded = on_loaded
+        self.on_listed = on_listed
+        self.prefetch = prefetch
+        self.preview_reduce = preview_reduce
+        self.cache = ImageCache(max_bytes)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(int(n_workers), 1), thread_name_prefix="image_loader"
+        )
+        self._lock = threading.Lock()
+        # path -> future của lần giải mã full đang chờ / đang chạy
+        self._pending = {}
+        self._current = None
+        self._wanted = set()
+
+    def list_folder(self, folder: str):
+        def scan():
+            try:
+                paths = scan_folder(folder)
+            except OSError as e:
+                print(f"Error listing {folder}: {str(e)}")
+                paths = []
+            if self.on_listed:
+                self.on_listed(folder, paths)
+
+        self._executor.submit(scan)
+
+    def request(self, paths: list, index: int):
+        path = paths[index]
+        lo, hi = max(index - self.prefetch, 0), index + self.prefetch + 1
+        # Ảnh kế tiếp trước, rồi ảnh trước đó, gần trước xa sau
+        neighbours = []
+        for i in range(1, self.prefetch + 1):
+            if index + i < len(paths):
+                neighbours.append(paths[index + i])
+            if index - i >= 0:
+                neighbours.append(paths[index - i])
+        with self._lock:
+            self._current = path
+            self._wanted = set(paths[lo:hi])
+            for p, future in list(self._pending.items()):
+                if p not in self._wanted and future.cancel():
+                    del self._pending[p]
+
+        mat = self.cache.get((path, 1))
+        if mat is not None:
+            self._deliver(path, mat, 1)
+        else:
+            b_preview = self.preview_reduce in PREVIEW_FLAGS
+            if b_preview and path.lower().endswith(PREVIEW_EXTENSIONS):
+                self._executor.submit(self._load_preview, path)
+            self._submit_full(path)
+
+        for p in neighbours:
+            if self.cache.get((p, 1)) is None:
+                self._submit_full(p)
+
+    def _submit_full(self, path: str):
+        with self._lock:
+            if path in self._pending:
+                return
+            self._pending[path] = self._executor.submit(self._load_full, path)
+
+    def _load_preview(self, path: str):
+        if path != self._current:
+            return
+        key = (path, self.preview_reduce)
+        mat = self.cache.get(key)
+        if mat is None:
+            mat = cv.imread(path, PREVIEW_FLAGS[self.preview_reduce])
+            self.cache.put(key, mat)
+        # Ảnh full đã xong trước thì không gửi preview nữa
+        if mat is not None and self.cache.get((path, 1)) is None:
+            self._deliver(path, mat, self.preview_reduce)
+
+    def _load_full(self, path: str):
+        try:
+            if path not in self._wanted:
+                return
+            mat = self.cache.get((path, 1))
+            if mat is None:
+                mat = cv.imread(path)
+                self.cache.put((path, 1), mat)
+        finally:
+            with self._lock:
+                self._pending.pop(path, None)
+        self._deliver(path, mat, 1)
+
+    def _deliver(self, path: str, mat: np.ndarray, reduce: int):
+        if path == self._current and self.on_loaded:
+            self.on_loaded(path, mat, reduce)
+
+    def clear(self):
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._current = None
+            self._wanted = set()
+        self.cache.clear()
+
+    def shutdown(self):
+        self.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def format_stats(self) -> str:
+        cache = self.cache
+        return (
+            f"image cache: hits={cache.n_hits} misses={cache.n_misses} "
+            f"{cache.total_bytes / 1024**2:.0f}/{cache.max_bytes / 1024**2:.0f} MB"
+        )
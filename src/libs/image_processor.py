@@ -1,33 +1,280 @@
 import cv2 as cv
 import numpy as np
 import os
-from ultralytics import YOLO
 from collections import namedtuple
+from typing import TYPE_CHECKING
+
+from libs.metrics import METRICS, now
+from libs.stage_cache import NO_CACHE, StageCache, stage_key
+from libs.fiducial_matcher import (
+    ALIGNMENT_HOUGH,
+    ALIGNMENT_PREDICTIVE,
+    ALIGNMENT_TEMPLATE,
+    FiducialMatcher,
+)
+from libs.circle_predictor import CirclePredictor
+
+# ultralytics (kéo theo torch) chỉ import khi thật sự load model YOLO
+if TYPE_CHECKING:
+    from ultralytics import YOLO
+
+# Decision của một ROI trong ROI_DTYPE
+DECISION_NONE = -1
+DECISION_NG = 0
+DECISION_OK = 1
 
-BLOBS = namedtuple(
-    "blobs",
+# Một dòng cho mỗi ROI
+ROI_DTYPE = np.dtype(
     [
-        "src",
-        "dst",
-        "mbin",
-        "roi",
-        "contours",
-        "boxes",
-        "circles",
-        "vectors",
-        "centers",
-        "aligments",
-    ],
-    defaults=[None, None, None, None, [], [], [], [], [], []],
+        ("box", np.int32, 4),  # x, y, w, h của blob
+        ("found", bool),  # tìm thấy blob
+        ("paired", bool),  # có center và vector
+        ("c0", np.int32, 3),  # circle gần tâm: x, y, r (r = 0 nếu không có)
+        ("c1", np.int32, 3),  # circle còn lại
+        ("center", np.int32, 2),
+        ("vector", np.int32, 2),
+        ("aligned", bool),  # dx, dy, da hợp lệ
+        ("dx", np.int32),
+        ("dy", np.int32),
+        ("da", np.float64),
+        ("decision", np.int8),
+    ]
 )
 
-RESULT = namedtuple(
-    "result",
-    ["src", "dst", "mbin", "ret", "msg", "decision", "blobs"],
-    defaults=[None, None, None, True, "", [], BLOBS()],
+
+class BLOBS:
+    """
+    Blobs of an image, one ROI_DTYPE row per ROI.\n
+    Images and contours are held by reference. boxes, circles, vectors,
+    centers and aligments are built from the table on access, for the
+    debug / teaching code that still wants Python lists.
+    """
+
+    __slots__ = ("src", "dst", "mbin", "roi", "contours", "table", "b_aligment")
+
+    def __init__(
+        self,
+        src=None,
+        dst=None,
+        mbin=None,
+        roi=None,
+        contours=None,
+        boxes=None,
+        circles=None,
+        vectors=None,
+        centers=None,
+        aligments=None,
+        table: np.ndarray = None,
+    ):
+        self.src = src
+        self.dst = dst
+        self.mbin = mbin
+        self.roi = roi
+        self.contours = contours if contours is not None else []
+        if table is None:
+            table = BLOBS.make_table(boxes, circles, vectors, centers, aligments)
+        self.table = table
+        self.b_aligment = aligments is not None
+
+    @staticmethod
+    def make_table(
+        boxes=None, circles=None, vectors=None, centers=None, aligments=None
+    ):
+        boxes = boxes or []
+        circles = circles or []
+        vectors = vectors or []
+        centers = centers or []
+
+        n = max(len(boxes), len(circles), len(vectors), len(centers))
+        table = np.zeros(n, dtype=ROI_DTYPE)
+        table["decision"] = DECISION_NONE
+
+        for i, box in enumerate(boxes):
+            if box is not None:
+                table["box"][i] = box
+                table["found"][i] = True
+        for i, pair in enumerate(circles):
+            if pair:
+                table["c0"][i] = pair[0]
+                table["c1"][i] = pair[1]
+        for i in range(min(len(centers), len(vectors))):
+            if centers[i] is not None and vectors[i] is not None:
+                table["center"][i] = centers[i]
+                table["vector"][i] = vectors[i]
+                table["paired"][i] = True
+
+        if aligments is not None:
+            ImageProcessor.set_aligments(table, aligments)
+        return table
+
+    def __len__(self):
+        return len(self.table)
+
+    @property
+    def boxes(self) -> list:
+        return [
+            box if found else None
+            for found, box in zip(
+                self.table["found"].tolist(), self.table["box"].tolist()
+            )
+        ]
+
+    @property
+    def circles(self) -> list:
+        has_circles = self.table["c0"][:, 2] > 0
+        return [
+            [tuple(c0), tuple(c1)] if b else None
+            for b, c0, c1 in zip(
+                has_circles.tolist(),
+                self.table["c0"].tolist(),
+                self.table["c1"].tolist(),
+            )
+        ]
+
+    @property
+    def centers(self) -> list:
+        return [
+            tuple(c) if b else None
+            for b, c in zip(
+                self.table["paired"].tolist(), self.table["center"].tolist()
+            )
+        ]
+
+    @property
+    def vectors(self) -> list:
+        return [
+            tuple(v) if b else None
+            for b, v in zip(
+                self.table["paired"].tolist(), self.table["vector"].tolist()
+            )
+        ]
+
+    @property
+    def aligments(self) -> np.ndarray:
+        if not self.b_aligment:
+            return None
+        aligments = np.zeros(len(self.table), dtype=ALIGMENT_DTYPE)
+        aligments["valid"] = self.table["aligned"]
+        for name in ("dx", "dy", "da"):
+            aligments[name] = self.table[name]
+        return aligments
+
+    @property
+    def decision(self) -> list:
+        if not self.b_aligment:
+            return []
+        return [
+            None if d == DECISION_NONE else d == DECISION_OK
+            for d in self.table["decision"].tolist()
+        ]
+
+    def message(self) -> str:
+        """Reply message: "dx,dy,da" or "None" per ROI, joined by "_" """
+        if not self.b_aligment:
+            return ""
+        table = self.table
+        return "_".join(
+            f"{dx},{dy},{da:.2f}" if v else "None"
+            for v, dx, dy, da in zip(
+                table["aligned"].tolist(),
+                table["dx"].tolist(),
+                table["dy"].tolist(),
+                table["da"].tolist(),
+            )
+        )
+
+    def count_decisions(self) -> tuple[int, int, int]:
+        """Number of OK, NG and not found ROIs"""
+        if not self.b_aligment:
+            return 0, 0, 0
+        d = self.table["decision"]
+        n_ok = int(np.count_nonzero(d == DECISION_OK))
+        n_ng = int(np.count_nonzero(d == DECISION_NG))
+        return n_ok, n_ng, len(d) - n_ok - n_ng
+
+
+class RESULT:
+    """
+    Result of find_result. msg and decision are derived from blobs.table,
+    the message string is only formatted on first access.
+    """
+
+    __slots__ = ("src", "dst", "mbin", "ret", "blobs", "_msg")
+
+    def __init__(self, src=None, dst=None, mbin=None, ret=True, msg=None, blobs=None):
+        self.src = src
+        self.dst = dst
+        self.mbin = mbin
+        self.ret = ret
+        self.blobs: BLOBS = blobs if blobs is not None else BLOBS()
+        self._msg = msg
+
+    @property
+    def msg(self) -> str:
+        if self._msg is None:
+            self._msg = self.blobs.message()
+        return self._msg
+
+    @property
+    def decision(self) -> list:
+        return self.blobs.decision
+
+    @property
+    def table(self) -> np.ndarray:
+        return self.blobs.table
+
+    def count_decisions(self) -> tuple[int, int, int]:
+        return self.blobs.count_decisions()
+
+    def to_dict(self) -> dict:
+        """JSON friendly summary, one entry per ROI"""
+        table = self.blobs.table
+        decision = self.decision
+        rois = []
+        for i in range(len(table)):
+            row = table[i]
+            rois.append(
+                {
+                    "found": bool(row["found"]),
+                    "box": row["box"].tolist() if row["found"] else None,
+                    "center": row["center"].tolist() if row["paired"] else None,
+                    "vector": row["vector"].tolist() if row["paired"] else None,
+                    "dx": int(row["dx"]) if row["aligned"] else None,
+                    "dy": int(row["dy"]) if row["aligned"] else None,
+                    "da": float(row["da"]) if row["aligned"] else None,
+                    "decision": decision[i] if decision else None,
+                }
+            )
+        return {"msg": self.msg, "rois": rois}
+
+
+# Cặp circle của một ROI: circle_0 gần tâm ROI nhất, circle_1 gần circle_0 nhất
+PAIR_DTYPE = np.dtype([("found", bool), ("c0", np.int64, 3), ("c1", np.int64, 3)])
+
+# Sai lệch so với origin của một ROI
+ALIGMENT_DTYPE = np.dtype(
+    [("valid", bool), ("dx", np.int64), ("dy", np.int64), ("da", np.float64)]
+)
+
+# Overlay item: vẽ bằng OpenCV (draw_overlay) hoặc vẽ vector trên Canvas
+# kind: "rect" (x, y, w, h) | "circle" (x, y, r) | "arrow" (x0, y0, x1, y1) | "text" (x, y)
+OVERLAY = namedtuple(
+    "overlay",
+    ["kind", "points", "color", "text", "font_scale", "thickness"],
+    defaults=["", (), (0, 255, 0), "", 1, 1],
 )
 
 
+# Phương pháp threshold trong config["threshold"]["method"]
+THRESHOLD_ADAPTIVE = "Adaptive"
+THRESHOLD_DOWNSAMPLED = "Downsampled"
+THRESHOLD_METHODS = [THRESHOLD_ADAPTIVE, THRESHOLD_DOWNSAMPLED]
+# Kích thước block (pixel) trên ảnh thu nhỏ của THRESHOLD_DOWNSAMPLED
+DOWNSAMPLED_BLOCK = 16
+# config["detection"]["pyramid_level"]: 0 = full resolution, 3 = 1/8
+MAX_PYRAMID_LEVEL = 3
+
+
 class ImageProcessor:
     def apply_blur(image, config: dict):
         """Apply blur based on selected parameters"""
@@ -45,6 +292,13 @@ class ImageProcessor:
 
     def apply_threshold(image, config: dict):
         """Apply threshold based on selected parameters"""
+        method = config["threshold"].get("method", THRESHOLD_ADAPTIVE)
+        if method == THRESHOLD_DOWNSAMPLED:
+            return ImageProcessor.apply_threshold_downsampled(image, config)
+        return ImageProcessor.apply_threshold_adaptive(image, config)
+
+    def apply_threshold_adaptive(image, config: dict):
+        """cv.adaptiveThreshold on the full image"""
         block_size = config["threshold"]["block_size"]
         if block_size % 2 == 0:
             block_size += 1
@@ -69,6 +323,61 @@ class ImageProcessor:
             image, 255, adaptive_type, thresh_type, block_size, c
         )
 
+    def apply_threshold_downsampled(image, config: dict):
+        """
+        Adaptive threshold with the local background estimated on a
+        downsampled image.\n
+        The image is reduced with pyrDown (power of 2) until the block is
+        about DOWNSAMPLED_BLOCK pixels, the mean / Gaussian of the block is
+        computed there and the threshold (background - C) is upsampled back
+        with linear interpolation. Same result as cv.adaptiveThreshold up to
+        the interpolation of a smooth background, at a fraction of the cost
+        for large block sizes (Gaussian cost grows with the block size).
+        """
+        block_size = config["threshold"]["block_size"]
+        if block_size % 2 == 0:
+            block_size += 1
+
+        c = config["threshold"]["c_index"]
+        thresh_type = config["threshold"]["thresh_type"]
+        n_levels = int(np.log2(max(block_size / DOWNSAMPLED_BLOCK, 1)))
+        if n_levels < 1 or thresh_type not in ("Binary", "Binary Inverted"):
+            # Block nhỏ hoặc kiểu threshold không hỗ trợ: dùng adaptiveThreshold
+            return ImageProcessor.apply_threshold_adaptive(image, config)
+
+        h, w = image.shape[:2]
+        small = image
+        for _ in range(n_levels):
+            small = cv.pyrDown(small)
+        factor = 2**n_levels
+
+        ksize = max(round(block_size / factor), 1) | 1
+        if config["threshold"]["adaptive_type"] == "Gaussian":
+            # sigma của adaptiveThreshold Gaussian, tính theo block_size gốc
+            sigma = 0.3 * ((block_size - 1) * 0.5 - 1) + 0.8
+            background = cv.GaussianBlur(
+                small.astype(np.float32),
+                (ksize, ksize),
+                sigma / factor,
+                borderType=cv.BORDER_REPLICATE,
+            )
+        else:
+            background = cv.boxFilter(
+                small.astype(np.float32),
+                -1,
+                (ksize, ksize),
+                borderType=cv.BORDER_REPLICATE,
+            )
+
+        # dst = src > round(background) - C  <=>  src >= round(background) - C + 1
+        level = np.clip(np.round(background) - c + 1, 0, 255).astype(np.uint8)
+        level = cv.resize(level, (w, h), interpolation=cv.INTER_LINEAR)
+
+        mbin = cv.compare(image, level, cv.CMP_GE)
+        if thresh_type == "Binary Inverted":
+            mbin = cv.bitwise_not(mbin)
+        return mbin
+
     def apply_morphological(image, config: dict):
         """Apply morphological operation based on selected parameters"""
         k_size = config["morphological"]["kernel_size"]
@@ -85,7 +394,17 @@ class ImageProcessor:
             return cv.morphologyEx(image, cv.MORPH_CLOSE, kernel)
 
     @staticmethod
-    def find_blobs(src, config: dict, b_debug=False):
+    def find_blobs(src, config: dict, b_debug=False, cache: StageCache = None):
+        """
+        gray -> blur -> threshold -> morphological -> contours, then sort the
+        blobs into the ROIs of config["shapes"].\n
+        With a StageCache only the stages whose parameters changed since the
+        previous call on the same image are recomputed.\n
+        config["detection"]["pyramid_level"] > 0 runs the stages on the gray
+        image reduced by 2**level (sizes and area limits scaled with it),
+        found boxes are scaled back and, with "refine", their edges are
+        re-measured at full resolution inside each box.
+        """
         retrieval_mode_map = {
             "EXTERNAL": cv.RETR_EXTERNAL,
             "LIST": cv.RETR_LIST,
@@ -105,23 +424,62 @@ class ImageProcessor:
             config["contour"]["approximation_mode"]
         ]
 
+        if cache is None:
+            cache = NO_CACHE
+        cache.set_image(src)
+
         # Convert image
-        gray = cv.cvtColor(src, cv.COLOR_BGR2GRAY)
+        t = now()
+        gray = cache.get("gray", (), cv.cvtColor, src, cv.COLOR_BGR2GRAY)
+        t = METRICS.record("find_blobs.gray", t)
+
+        # Pyramid: xử lý trên ảnh thu nhỏ, config được scale theo
+        level = min(int(config["detection"].get("pyramid_level", 0)), MAX_PYRAMID_LEVEL)
+        factor = 2**level
+        config_level = config
+        if level > 0:
+            config_level = ImageProcessor.scale_config(config, factor)
+            gray_level = cache.get(
+                "pyramid", level, ImageProcessor.pyramid_down, gray, level
+            )
+            t = METRICS.record("find_blobs.pyramid", t)
+        else:
+            gray_level = gray
 
         # Apply blur
-        blur = ImageProcessor.apply_blur(gray, config)
+        key = (level,) + stage_key(config_level, "blur")
+        blur = cache.get(
+            "blur", key, ImageProcessor.apply_blur, gray_level, config_level
+        )
+        t = METRICS.record("find_blobs.blur", t)
 
         # Apply threshold
-        mbin = ImageProcessor.apply_threshold(blur, config)
+        key += stage_key(config_level, "threshold")
+        mbin = cache.get(
+            "threshold", key, ImageProcessor.apply_threshold, blur, config_level
+        )
+        t = METRICS.record("find_blobs.threshold", t)
 
         # Apply morphological operations
-        mbin = ImageProcessor.apply_morphological(mbin, config)
+        key += stage_key(config_level, "morphological")
+        mbin = cache.get(
+            "morphological",
+            key,
+            ImageProcessor.apply_morphological,
+            mbin,
+            config_level,
+        )
+        t = METRICS.record("find_blobs.morphological", t)
 
-        cnts, _ = cv.findContours(mbin, retrieval_mode, approximation_mode)
+        key += stage_key(config_level, "contour")
+        cnts, _ = cache.get(
+            "contours", key, cv.findContours, mbin, retrieval_mode, approximation_mode
+        )
+        t = METRICS.record("find_blobs.contours", t)
 
-        min_area = float(config["detection"]["area_min"])
-        max_area = float(config["detection"]["area_max"])
-        max_distance = config["detection"]["distance"]
+        min_area = float(config_level["detection"]["area_min"])
+        max_area = float(config_level["detection"]["area_max"])
+        max_distance = config_level["detection"]["distance"]
 
         rows = config.get("rows", 4)
         columns = config.get("columns", 5)
@@ -144,6 +502,10 @@ class ImageProcessor:
             x, y, w, h = cv.boundingRect(cnt)
             area = w * h
             if min_area <= area <= max_area and abs(w - h) < max_distance:
+                if level > 0:
+                    x, y, w, h = x * factor, y * factor, w * factor, h * factor
+                    cnt = cnt * factor
+
                 # Tính tâm của box
                 center_x = x + w // 2
                 center_y = y + h // 2
@@ -155,6 +517,16 @@ class ImageProcessor:
                         sorted_boxes[roi_index] = [x, y, w, h]
                         sorted_contours[roi_index] = cnt
                         break
+        t = METRICS.record("find_blobs.sort", t)
+
+        if level > 0 and config["detection"].get("refine", True):
+            for i, box in enumerate(sorted_boxes):
+                if box is None:
+                    continue
+                refined = ImageProcessor.refine_blob(gray, box, factor, config)
+                if refined is not None:
+                    sorted_boxes[i], sorted_contours[i] = refined
+            METRICS.record("find_blobs.refine", t)
 
         if b_debug:
             dst = src.copy()
@@ -176,8 +548,77 @@ class ImageProcessor:
 
         return BLOBS(dst=dst, mbin=mbin, boxes=sorted_boxes, contours=sorted_contours)
 
+    def pyramid_down(gray, level: int):
+        for _ in range(level):
+            gray = cv.pyrDown(gray)
+        return gray
+
+    def scale_config(config: dict, factor: int) -> dict:
+        """Sizes and area limits of config for an image reduced by factor"""
+
+        def odd(value, minimum):
+            return max(int(round(value / factor)) | 1, minimum)
+
+        return {
+            **config,
+            "blur": {**config["blur"], "ksize": odd(config["blur"]["ksize"], 1)},
+            "threshold": {
+                **config["threshold"],
+                "block_size": odd(config["threshold"]["block_size"], 3),
+            },
+            "morphological": {
+                **config["morphological"],
+                "kernel_size": max(
+                    int(round(config["morphological"]["kernel_size"] / factor)), 1
+                ),
+            },
+            "detection": {
+                **config["detection"],
+                "area_min": float(config["detection"]["area_min"]) / factor**2,
+                "area_max": float(config["detection"]["area_max"]) / factor**2,
+                "distance": config["detection"]["distance"] / factor,
+            },
+        }
+
+    def refine_blob(gray, box, factor: int, config: dict):
+        """
+        Re-measure a blob box found on a pyramid level at full resolution.\n
+        Otsu threshold of the box grown by 2 pyramid pixels, the largest
+        external contour gives the box. Returns (box, contour) or None when
+        nothing fits the area limits (the scaled box is kept).
+        """
+        x, y, w, h = box
+        margin = 2 * factor
+        H, W = gray.shape[:2]
+        x0, y0 = max(x - margin, 0), max(y - margin, 0)
+        x1, y1 = min(x + w + margin, W), min(y + h + margin, H)
+        if x1 <= x0 or y1 <= y0:
+            return None
+
+        thresh_type = (
+            cv.THRESH_BINARY_INV
+            if config["threshold"]["thresh_type"] == "Binary Inverted"
+            else cv.THRESH_BINARY
+        )
+        _, mbin = cv.threshold(gray[y0:y1, x0:x1], 0, 255, thresh_type | cv.THRESH_OTSU)
+        cnts, _ = cv.findContours(mbin, cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
+        if not cnts:
+            return None
+
+        cnt = max(cnts, key=cv.contourArea)
+        rx, ry, rw, rh = cv.boundingRect(cnt)
+        area = rw * rh
+        min_area = float(config["detection"]["area_min"])
+        max_area = float(config["detection"]["area_max"])
+        if not min_area <= area <= max_area:
+            return None
+
+        return [rx + x0, ry + y0, rw, rh], cnt + (x0, y0)
+
     @staticmethod
-    def find_blobs_with_yolo(src, model: YOLO, config: dict = None, b_debug=False):
+    def find_blobs_with_yolo(
+        src, model: "YOLO", config: dict = None, b_debug=False, cache: StageCache = None
+    ):
         # Get configuration parameters
         conf_threshold = config.get("detection", {}).get("confidence", 0.25)
         rows = config.get("rows", 4)
@@ -194,8 +635,18 @@ class ImageProcessor:
         sorted_boxes = [None] * total_boxes
         sorted_contours = [None] * total_boxes
 
+        if cache is None:
+            cache = NO_CACHE
+        cache.set_image(src)
+
         # Run YOLO detection
-        results = model(src, conf=conf_threshold)[0]
+        t = now()
+        results = cache.get(
+            "yolo",
+            (id(model), conf_threshold),
+            lambda: model(src, conf=conf_threshold)[0],
+        )
+        METRICS.record("find_blobs.yolo", t)
 
         # Process each detection
         for detection in results.boxes.data:
@@ -245,9 +696,8 @@ class ImageProcessor:
         return BLOBS(dst=dst, mbin=None, boxes=sorted_boxes, contours=sorted_contours)
 
     @staticmethod
-    def find_circles(src, roi, config: dict, b_debug=False):
-        """Detect circles using Hough Circle Transform"""
-        cropped_image = src[roi[1] : roi[1] + roi[3], roi[0] : roi[0] + roi[2]]
+    def hough_circles(cropped_image, config: dict) -> np.ndarray:
+        """HoughCircles on a cropped ROI, returns an (N, 3) int array of x, y, r"""
         gray = cv.cvtColor(cropped_image, cv.COLOR_BGR2GRAY)
 
         # Áp dụng blur trước khi detect
@@ -284,8 +734,6 @@ class ImageProcessor:
         min_radius = config["hough_circle"]["min_radius"]
         max_radius = config["hough_circle"]["max_radius"]
 
-        # rows = gray.shape[0]
-
         circles = cv.HoughCircles(
             blurred,
             method,
@@ -297,10 +745,21 @@ class ImageProcessor:
             maxRadius=max_radius,
         )
 
+        if circles is None:
+            return np.empty((0, 3), dtype=np.int32)
+        return circles[0].astype(np.int32)
+
+    @staticmethod
+    def find_circles(src, roi, config: dict, b_debug=False):
+        """Detect circles using Hough Circle Transform"""
+        cropped_image = src[roi[1] : roi[1] + roi[3], roi[0] : roi[0] + roi[2]]
+
+        circles = ImageProcessor.hough_circles(cropped_image, config)
+
         dst = None
 
-        if circles is not None:
-            circles = [list(map(int, circle)) for circle in circles[0]]
+        if len(circles):
+            circles = circles.tolist()
 
             vector = None
             center = None
@@ -331,7 +790,7 @@ class ImageProcessor:
                 src=cropped_image,
                 dst=dst,
                 roi=roi,
-                circles=ret,
+                circles=[ret],
                 vectors=[vector],
                 centers=[center],
             )
@@ -376,87 +835,184 @@ class ImageProcessor:
 
         return dx, dy, da
 
+    def cal_aligments(origins: dict, centers: list, vectors: list) -> np.ndarray:
+        """
+        Vectorized cal_aligment over all ROIs.\n
+        Row i of the returned ALIGMENT_DTYPE array compares origins[str(i)]
+        with centers[i] / vectors[i], valid is False where either side is missing.
+        """
+        table = BLOBS.make_table(centers=centers, vectors=vectors)
+        return ImageProcessor.cal_aligments_table(origins, table)
+
+    def cal_aligments_table(origins: dict, table: np.ndarray) -> np.ndarray:
+        """cal_aligments on the center / vector columns of a ROI_DTYPE table"""
+        n = len(origins)
+        origin = BLOBS.make_table(
+            centers=[origins[str(i)]["center"] for i in range(n)],
+            vectors=[origins[str(i)]["vector"] for i in range(n)],
+        )
+
+        current = np.zeros(n, dtype=ROI_DTYPE)
+        m = min(n, len(table))
+        current[:m] = table[:m]
+
+        valid = origin["paired"] & current["paired"]
+        origin_vectors = origin["vector"].astype(np.float64)
+        current_vectors = current["vector"].astype(np.float64)
+
+        angle0 = np.degrees(np.arctan2(origin_vectors[:, 1], origin_vectors[:, 0]))
+        angle = np.degrees(np.arctan2(current_vectors[:, 1], current_vectors[:, 0]))
+
+        da = angle - angle0
+        da = np.where(da > 180, da - 360, da)
+        da = np.where(da < -180, da + 360, da)
+
+        d = current["center"].astype(np.int64) - origin["center"]
+
+        aligments = np.zeros(n, dtype=ALIGMENT_DTYPE)
+        aligments["valid"] = valid
+        aligments["dx"] = np.where(valid, d[:, 0], 0)
+        aligments["dy"] = np.where(valid, d[:, 1], 0)
+        aligments["da"] = np.where(valid, da, 0.0)
+        return aligments
+
     @staticmethod
-    def find_result(src, config: dict, model: YOLO = None, b_origin=False):
+    def find_result(
+        src,
+        config: dict,
+        model: "YOLO" = None,
+        b_origin=False,
+        b_debug=False,
+        cache: StageCache = None,
+        fiducials: FiducialMatcher = None,
+        predictor: CirclePredictor = None,
+    ):
         """
-        Find Blobs, Find Circles, Calculate aligment
+        Find Blobs, Find Circles, Calculate aligment\n
+        dst is only drawn when b_debug is set, otherwise use render_output
+        or output_overlay when the annotated image is actually needed.
+        cache (teaching mode) keeps the blob stages and the circles of each
+        ROI, keyed by the parameters they depend on.
+        With config["alignment"]["method"] == ALIGNMENT_TEMPLATE the circles
+        are located by fiducials (learned from the origin) instead of Hough.
+        With ALIGNMENT_PREDICTIVE Hough only runs in windows around the origin
+        circles, ROIs the predictor misses fall back to the full box search.
         """
+        if cache is None:
+            cache = NO_CACHE
+
         # find_blobs
+        t_start = now()
         if model is None:
-            blobs = ImageProcessor.find_blobs(src, config)
+            blobs = ImageProcessor.find_blobs(src, config, cache=cache)
         else:
-            blobs: BLOBS = ImageProcessor.find_blobs_with_yolo(src, model, config)
-
-        circles = [None] * len(blobs.boxes)
-        vectors = [None] * len(blobs.boxes)
-        centers = [None] * len(blobs.boxes)
-
-        for i, box in enumerate(blobs.boxes):
-            if box is None:
-                continue
-            blob_circles: BLOBS = ImageProcessor.find_circles(src, box, config)
-            circles[i] = blob_circles.circles
-
-            if blob_circles.circles:
-                vectors[i] = blob_circles.vectors[0]
-                centers[i] = blob_circles.centers[0]
-
-        if b_origin:
-            aligments = None
-            msg = ""
-            decision = []
+            blobs: BLOBS = ImageProcessor.find_blobs_with_yolo(
+                src, model, config, cache=cache
+            )
+        t = METRICS.record("find_result.blobs", t_start)
+
+        table = BLOBS.make_table(boxes=blobs.boxes)
+
+        method = config.get("alignment", {}).get("method", ALIGNMENT_HOUGH)
+        if method == ALIGNMENT_TEMPLATE and fiducials is not None and not b_origin:
+            fiducials.match(src, table, config)
+            t = METRICS.record("find_result.template", t)
+        elif method == ALIGNMENT_PREDICTIVE and not b_origin:
+            if predictor is None:
+                predictor = CirclePredictor()
+            misses = predictor.match(src, table, config, ImageProcessor.hough_circles)
+            METRICS.record("find_result.predict", t)
+            ImageProcessor.match_hough(src, table, config, cache, indexes=misses)
+            t = now()
         else:
-            origins = ImageProcessor.get_origin_from_config(config)
-            currents = {
-                str(i): {
-                    "center": centers[i],
-                    "vector": vectors[i],
-                }
-                for i in range(len(centers))
-            }
+            ImageProcessor.match_hough(src, table, config, cache)
+            t = now()
 
-            aligments = {
-                key: ImageProcessor.cal_aligment(origins[key], currents[key])
-                for key in origins
-            }
-
-            msg, decision = ImageProcessor.decision(aligments)
+        aligments = None
+        if not b_origin:
+            origins = ImageProcessor.get_origin_from_config(config)
+            aligments = ImageProcessor.cal_aligments_table(origins, table)
+            ImageProcessor.set_aligments(table, aligments)
+        t = METRICS.record("find_result.aligment", t)
 
         blobs = BLOBS(
-            mbin=blobs.mbin,
-            contours=blobs.contours,
-            boxes=blobs.boxes,
-            circles=circles,
-            vectors=vectors,
-            centers=centers,
-            aligments=aligments,
+            mbin=blobs.mbin, contours=blobs.contours, table=table, aligments=aligments
         )
 
-        dst = src.copy()
-        dst = ImageProcessor.draw_output(dst, blobs, config)
+        dst = None
+        if b_debug:
+            dst = src.copy()
+            dst = ImageProcessor.draw_output(dst, blobs, config)
+            METRICS.record("find_result.draw", t)
 
-        return RESULT(
-            src=src, dst=dst, mbin=blobs.mbin, msg=msg, decision=decision, blobs=blobs
-        )
+        METRICS.record("find_result", t_start)
+        return RESULT(src=src, dst=dst, mbin=blobs.mbin, blobs=blobs)
 
-    def draw_output(mat, blobs: BLOBS, config: dict, lw=5):
-        boxes = blobs.boxes
-        circles = blobs.circles
-        vectors = blobs.vectors
-        centers = blobs.centers
-        aligments = blobs.aligments
-        origins: dict = config
-
-        color_box, color_circles, color_aligments = (
-            (0, 0, 0),
-            (0, 0, 255),
-            (255, 0, 0),
-        )
+    @staticmethod
+    def match_hough(
+        src,
+        table: np.ndarray,
+        config: dict,
+        cache: StageCache = NO_CACHE,
+        indexes: np.ndarray = None,
+    ):
+        """
+        Fill c0, c1, center, vector and paired of the found ROIs with Hough\n
+        indexes limits the search to these rows (default: every found ROI).
+        """
+        t = now()
+
+        # HoughCircles từng ROI, chọn cặp circle cho tất cả ROI cùng lúc
+        boxes = table["box"].tolist()
+        if indexes is None:
+            indexes = np.flatnonzero(table["found"])
+        candidates = []
+        sizes = []
+        key = stage_key(config, "hough_circle")
+        for i in indexes:
+            x, y, w, h = boxes[i]
+            cropped_image = src[y : y + h, x : x + w]
+            candidates.append(
+                cache.get(
+                    f"hough_{i}",
+                    key + (x, y, w, h),
+                    ImageProcessor.hough_circles,
+                    cropped_image,
+                    config,
+                )
+            )
+            sizes.append(cropped_image.shape[:2][::-1])
+        t = METRICS.record("find_result.hough", t)
+
+        pairs = ImageProcessor.pair_circles(sizes, candidates)
+
+        # map to global image
+        rows = indexes[pairs["found"]]
+        pairs = pairs[pairs["found"]]
+        offset = table["box"][rows, :2]
+        table["c0"][rows, :2] = pairs["c0"][:, :2] + offset
+        table["c0"][rows, 2] = pairs["c0"][:, 2]
+        table["c1"][rows, :2] = pairs["c1"][:, :2] + offset
+        table["c1"][rows, 2] = pairs["c1"][:, 2]
+        table["center"][rows] = table["c0"][rows, :2]
+        table["vector"][rows] = pairs["c1"][:, :2] - pairs["c0"][:, :2]
+        table["paired"][rows] = True
+        METRICS.record("find_result.pair", t)
+
+    def output_overlay(blobs: BLOBS, config: dict, lw=5) -> list:
+        """Build the annotation of a result as a list of OVERLAY items"""
+        table = blobs.table
+        shapes: dict = config["shapes"]
 
-        for i, box in enumerate(boxes):
-            if box is None:
-                box_origins = origins["shapes"][i]["box"]
-                x, y, w, h = box_origins
+        color_circles, color_aligments = (0, 0, 255), (255, 0, 0)
+        overlay = []
+
+        for i, (found, box) in enumerate(
+            zip(table["found"].tolist(), table["box"].tolist())
+        ):
+            if not found:
+                shape = shapes.get(i, shapes.get(str(i)))
+                x, y, w, h = shape["box"]
                 text_box = f"Boxes{i}: NG"
                 color_box = (0, 0, 255)
 
@@ -465,103 +1021,167 @@ class ImageProcessor:
                 text_box = f"Boxes{i}: OK"
                 color_box = (0, 255, 0)
 
-            cv.rectangle(mat, (x, y), (x + w, y + h), color_box, lw)
-            cv.putText(
-                mat,
-                text_box,
-                (x, y),
-                cv.FONT_HERSHEY_SIMPLEX,
-                3,
-                color_box,
-                lw,
+            overlay.append(OVERLAY("rect", (x, y, w, h), color_box, thickness=lw))
+            overlay.append(OVERLAY("text", (x, y), color_box, text_box, 3, lw))
+
+        texts = blobs.message().split("_") if blobs.b_aligment else None
+        for i in np.flatnonzero(table["c0"][:, 2] > 0).tolist():
+            c0 = tuple(table["c0"][i].tolist())
+            c1 = tuple(table["c1"][i].tolist())
+            overlay.append(OVERLAY("circle", c0, color_circles, thickness=lw))
+            overlay.append(OVERLAY("circle", c1, color_circles, thickness=lw))
+            overlay.append(
+                OVERLAY(
+                    "arrow",
+                    (c0[0], c0[1], c1[0], c1[1]),
+                    color_circles,
+                    thickness=lw,
+                )
             )
 
-        for i, pair_circles in enumerate(circles):
-            if pair_circles:
-                c0, c1 = pair_circles
-                cv.circle(mat, (c0[0], c0[1]), c0[2], color_circles, lw)
-                cv.circle(mat, (c1[0], c1[1]), c1[2], color_circles, lw)
-                cv.arrowedLine(mat, (c0[0], c0[1]), (c1[0], c1[1]), color_circles, lw)
-
-                if aligments is not None:
-                    align = aligments[str(i)]
-                    if align is not None:
-                        dx, dy, da = align
-                        text = f"{dx},{dy},{da:.2f}"
-                    else:
-                        text = "None"
-
-                    cv.putText(
-                        mat,
-                        text,
-                        (c0[0], c0[1]),
-                        cv.FONT_HERSHEY_SIMPLEX,
-                        2,
-                        color_aligments,
-                        3,
-                        cv.LINE_AA,
-                    )
+            if texts is not None:
+                overlay.append(
+                    OVERLAY("text", (c0[0], c0[1]), color_aligments, texts[i], 2, 3)
+                )
+
+        return overlay
+
+    def draw_overlay(mat, overlay: list, scale=1.0):
+        """Rasterize OVERLAY items onto mat, coordinates are multiplied by scale"""
+
+        def p(*values):
+            return tuple(int(round(v * scale)) for v in values)
+
+        for item in overlay:
+            lw = max(int(round(item.thickness * scale)), 1)
+            if item.kind == "rect":
+                x, y, w, h = p(*item.points)
+                cv.rectangle(mat, (x, y), (x + w, y + h), item.color, lw)
+            elif item.kind == "circle":
+                x, y, r = p(*item.points)
+                cv.circle(mat, (x, y), r, item.color, lw)
+            elif item.kind == "arrow":
+                x0, y0, x1, y1 = p(*item.points)
+                cv.arrowedLine(mat, (x0, y0), (x1, y1), item.color, lw)
+            elif item.kind == "text":
+                cv.putText(
+                    mat,
+                    item.text,
+                    p(*item.points),
+                    cv.FONT_HERSHEY_SIMPLEX,
+                    item.font_scale * scale,
+                    item.color,
+                    lw,
+                    cv.LINE_AA,
+                )
 
         return mat
 
-    def cal_distance(pos_0, pos_1):
-        x1, y1 = pos_0
-        x2, y2 = pos_1
-        return np.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+    def draw_output(mat, blobs: BLOBS, config: dict, lw=5):
+        overlay = ImageProcessor.output_overlay(blobs, config, lw)
+        return ImageProcessor.draw_overlay(mat, overlay)
 
-    def filter_circle(img_size, circles):
-        w, h = img_size
-        center = w / 2, h / 2
-        min_distance = 0.0
+    def render_output(result: RESULT, config: dict, max_width: int = None):
+        """
+        Lazily render the annotated output of a result.\n
+        With max_width the source is downscaled first, so only a small copy
+        is allocated and drawn.
+        """
+        if result.dst is not None:
+            return result.dst
+        if result.src is None:
+            return None
+
+        src = result.src
+        scale = 1.0
+        if max_width is not None and src.shape[1] > max_width:
+            scale = max_width / src.shape[1]
+            mat = cv.resize(src, None, fx=scale, fy=scale, interpolation=cv.INTER_AREA)
+        else:
+            mat = src.copy()
 
-        if len(circles) < 2:
+        overlay = ImageProcessor.output_overlay(result.blobs, config)
+        return ImageProcessor.draw_overlay(mat, overlay, scale)
+
+    def filter_circle(img_size, circles):
+        """
+        Pick the circle nearest to the image centre and its nearest neighbour.\n
+        Returns ((x0, y0, r0), (x1, y1, r1)) or None when less than 2 circles.
+        """
+        pairs = ImageProcessor.pair_circles([img_size], [circles])
+        if not pairs["found"][0]:
             return None
+        return tuple(pairs["c0"][0].tolist()), tuple(pairs["c1"][0].tolist())
 
-        circle_0 = circles[0]
-        c = (circles[0][0], circles[0][1])
-        min_distance = ImageProcessor.cal_distance(c, center)
-
-        for circle in circles[1:]:
-            center_circle = (circle[0], circle[1])
-            distance = ImageProcessor.cal_distance(center_circle, center)
-            if distance < min_distance:
-                min_distance = distance
-                circle_0 = circle
-
-        circles.remove(circle_0)
-
-        center_circle_0 = (circle_0[0], circle_0[1])
-
-        circle_1 = circles[0]
-        c = (circles[0][0], circles[0][1])
-        min_distance = ImageProcessor.cal_distance(c, center_circle_0)
-
-        for circle in circles[1:]:
-            center_circle = (circle[0], circle[1])
-            distance = ImageProcessor.cal_distance(center_circle, center_circle_0)
-            if distance < min_distance:
-                min_distance = distance
-                circle_1 = circle
-
-        return tuple(map(int, circle_0)), tuple(map(int, circle_1))
-
-    def decision(aligments: dict) -> tuple:
-        # if aligments is None:
-        #     return ""
-        msg = []
-        decision = []
-        for aligment in aligments.values():
-            if aligment is None:
-                msg.append(f"None")
-                decision.append(None)
-            else:
-                dx, dy, da = aligment
-                msg.append(f"{dx},{dy},{da:.2f}")
-                if -10 < abs(dx) < 10 and -10 < abs(dy) < 10 and -5 < abs(da) < 5:
-                    decision.append(True)
-                else:
-                    decision.append(False)
-        return "_".join(msg), decision
+    def pair_circles(img_sizes: list, candidates: list) -> np.ndarray:
+        """
+        Vectorized filter_circle over all ROIs.\n
+        candidates[i] holds the (N_i, 3) circles of an ROI of size img_sizes[i].
+        They are padded into one (R, K, 3) array, returns a PAIR_DTYPE array.
+        """
+        n_rois = len(candidates)
+        pairs = np.zeros(n_rois, dtype=PAIR_DTYPE)
+        if n_rois == 0:
+            return pairs
+
+        counts = np.array([len(c) for c in candidates])
+        k = max(int(counts.max()), 2)
+
+        padded = np.zeros((n_rois, k, 3), dtype=np.int64)
+        for i, c in enumerate(candidates):
+            if counts[i]:
+                padded[i, : counts[i]] = np.asarray(c).reshape(-1, 3)[:, :3]
+        mask = np.arange(k)[None, :] < counts[:, None]
+
+        sizes = np.asarray(img_sizes, dtype=np.float64).reshape(-1, 2)
+        xy = padded[:, :, :2].astype(np.float64)
+        rows = np.arange(n_rois)
+
+        # circle_0: gần tâm ảnh nhất
+        d0 = np.hypot(
+            xy[:, :, 0] - sizes[:, None, 0] / 2, xy[:, :, 1] - sizes[:, None, 1] / 2
+        )
+        d0[~mask] = np.inf
+        i0 = np.argmin(d0, axis=1)
+
+        # circle_1: gần circle_0 nhất (trừ chính nó)
+        c0_xy = xy[rows, i0]
+        d1 = np.hypot(xy[:, :, 0] - c0_xy[:, None, 0], xy[:, :, 1] - c0_xy[:, None, 1])
+        d1[~mask] = np.inf
+        d1[rows, i0] = np.inf
+        i1 = np.argmin(d1, axis=1)
+
+        pairs["found"] = counts >= 2
+        pairs["c0"] = padded[rows, i0]
+        pairs["c1"] = padded[rows, i1]
+        return pairs
+
+    def decision_codes(aligments: np.ndarray) -> np.ndarray:
+        """DECISION_OK / DECISION_NG / DECISION_NONE of every ROI"""
+        ok = (
+            (np.abs(aligments["dx"]) < 10)
+            & (np.abs(aligments["dy"]) < 10)
+            & (np.abs(aligments["da"]) < 5)
+        )
+        codes = np.where(ok, DECISION_OK, DECISION_NG).astype(np.int8)
+        codes[~aligments["valid"]] = DECISION_NONE
+        return codes
+
+    def set_aligments(table: np.ndarray, aligments: np.ndarray):
+        """Write an ALIGMENT_DTYPE array and its decision into a ROI_DTYPE table"""
+        n = min(len(table), len(aligments))
+        table["aligned"][:n] = aligments["valid"][:n]
+        table["dx"][:n] = aligments["dx"][:n]
+        table["dy"][:n] = aligments["dy"][:n]
+        table["da"][:n] = aligments["da"][:n]
+        table["decision"][:n] = ImageProcessor.decision_codes(aligments[:n])
+
+    def decision(aligments: np.ndarray) -> tuple:
+        """Message and OK/NG decision (None when not found) of every ROI"""
+        table = np.zeros(len(aligments), dtype=ROI_DTYPE)
+        ImageProcessor.set_aligments(table, aligments)
+        blobs = BLOBS(table=table, aligments=aligments)
+        return blobs.message(), blobs.decision
 
 
 if __name__ == "__main__":
@@ -0,0 +1,161 @@
+import logging
+import logging.handlers
+import os
+import queue
+import time
+from collections import deque
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+
+# Tên level hiển thị trên combobox lọc log
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+LOG_COLORS = {
+    logging.WARNING: QColor(200, 120, 0),
+    logging.ERROR: QColor(220, 0, 0),
+}
+
+
+def guess_level(message: str, debug_prefixes=()) -> int:
+    """Level of a plain logInfoSignal message from its wording"""
+    lower = message.lower()
+    if "error" in lower or "failed" in lower or "lost" in lower:
+        return logging.ERROR
+    if "warning" in lower or "rejected" in lower:
+        return logging.WARNING
+    if message.startswith(tuple(debug_prefixes)):
+        return logging.DEBUG
+    return logging.INFO
+
+
+class LogRingModel(QAbstractListModel):
+    """
+    Last `capacity` log records for a QListView.\n
+    Records are (time, level, message) tuples in a deque(maxlen=capacity),
+    the rows shown are the records at or above min_level, also capped at
+    capacity. append_records() inserts a whole batch with one
+    beginRemoveRows / beginInsertRows pair, so the cost per message does
+    not grow with the age of the log.
+    """
+
+    def __init__(self, capacity=5000, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self.min_level = logging.DEBUG
+        self._records = deque(maxlen=capacity)
+        self._rows = deque(maxlen=capacity)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        t, level, message = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{time.strftime('%H:%M:%S', time.localtime(t))} {message}"
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return LOG_COLORS.get(level)
+        return None
+
+    def append_records(self, records: list):
+        self._records.extend(records)
+        rows = [r for r in records if r[1] >= self.min_level][-self.capacity :]
+        if not rows:
+            return
+
+        # Bỏ các dòng cũ nhất trước để không vượt capacity
+        n_remove = len(self._rows) + len(rows) - self.capacity
+        if n_remove > 0:
+            self.beginRemoveRows(QModelIndex(), 0, n_remove - 1)
+            for _ in range(n_remove):
+                self._rows.popleft()
+            self.endRemoveRows()
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def set_min_level(self, level: int):
+        if level == self.min_level:
+            return
+        self.beginResetModel()
+        self.min_level = level
+        self._rows = deque(
+            (r for r in self._records if r[1] >= level), maxlen=self.capacity
+        )
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._records.clear()
+        self._rows.clear()
+        self.endResetModel()
+
+
+class LogFileSink:
+    """
+    Rotating log file written by a background thread.\n
+    log() only puts the record on a queue (QueueHandler), the
+    QueueListener thread formats it and writes to a RotatingFileHandler,
+    so disk I/O never runs in the GUI or pipeline threads.
+    """
+
+    def __init__(
+        self, path="logs/vision.log", max_bytes=10 * 1024 * 1024, backup_count=10
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.logger = logging.getLogger("vision")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.listener = None
+        self._handler = None
+
+    def start(self) -> bool:
+        if self.listener is not None:
+            return True
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                self.path,
+                maxBytes=self.max_bytes,
+                backupCount=self.backup_count,
+                encoding="utf-8",
+            )
+        except OSError as e:
+            print(f"Error opening log file {self.path}: {str(e)}")
+            return False
+
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)-7s %(message)s")
+        )
+        log_queue = queue.SimpleQueue()
+        self._handler = logging.handlers.QueueHandler(log_queue)
+        self.logger.addHandler(self._handler)
+        self.listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self.listener.start()
+        return True
+
+    def log(self, level: int, message: str):
+        if self.listener is not None:
+            self.logger.log(level, message)
+
+    def stop(self):
+        if self.listener is None:
+            return
+        self.logger.removeHandler(self._handler)
+        # stop() xử lý hết các record còn trong queue rồi mới dừng thread
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        self.listener = None
+        self._handler = None
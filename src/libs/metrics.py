@@ -0,0 +1,177 @@
+import itertools
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+
+# Đồng hồ monotonic dùng cho mọi span
+now = time.perf_counter
+
+
+class SpanRing:
+    """
+    Fixed size ring buffer of span durations (seconds).\n
+    add() is lock-free: the slot index comes from itertools.count, whose
+    next() is atomic under the GIL, and a list item store is atomic too.
+    """
+
+    def __init__(self, size=4096):
+        # Kích thước là lũy thừa của 2 để dùng mask thay cho phép chia
+        size = 1 << max(int(size) - 1, 1).bit_length()
+        self._mask = size - 1
+        self._values = [0.0] * size
+        self._counter = itertools.count()
+        self._count = 0
+        self.total = 0.0
+
+    def add(self, dt: float):
+        i = next(self._counter)
+        self._values[i & self._mask] = dt
+        self._count = i + 1
+        # Tổng gần đúng khi nhiều thread ghi cùng lúc, chỉ dùng cho _sum
+        self.total += dt
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> np.ndarray:
+        n = min(self._count, len(self._values))
+        return np.array(self._values[:n], dtype=np.float64)
+
+
+class Metrics:
+    """Registry of named spans with rolling p50 / p95 / p99"""
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, size=4096):
+        self.size = size
+        self.spans = {}
+
+    def ring(self, name: str) -> SpanRing:
+        ring = self.spans.get(name)
+        if ring is None:
+            ring = self.spans.setdefault(name, SpanRing(self.size))
+        return ring
+
+    def record(self, name: str, t_start: float) -> float:
+        """
+        Close a span opened with t_start = now(), returns the current time
+        so consecutive spans can be chained:
+
+            t = now()
+            ...
+            t = METRICS.record("blur", t)
+        """
+        t = now()
+        ring = self.spans.get(name)
+        if ring is None:
+            ring = self.ring(name)
+        ring.add(t - t_start)
+        return t
+
+    def add(self, name: str, dt: float):
+        self.ring(name).add(dt)
+
+    def summary(self) -> dict:
+        """name -> {count, sum, p50, p95, p99, max} over the ring window"""
+        stats = {}
+        for name, ring in list(self.spans.items()):
+            values = ring.snapshot()
+            if not len(values):
+                continue
+            p50, p95, p99 = np.quantile(values, self.QUANTILES)
+            stats[name] = {
+                "count": ring.count,
+                "sum": ring.total,
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "max": float(values.max()),
+            }
+        return stats
+
+    def prometheus_text(self, prefix="vision") -> str:
+        """Prometheus text exposition format (summary per span)"""
+        metric = f"{prefix}_span_seconds"
+        lines = [
+            f"# HELP {metric} Duration of instrumented processing spans.",
+            f"# TYPE {metric} summary",
+        ]
+        for name, s in sorted(self.summary().items()):
+            for q, key in zip(self.QUANTILES, ("p50", "p95", "p99")):
+                lines.append(f'{metric}{{span="{name}",quantile="{q}"}} {s[key]:.6f}')
+            lines.append(f'{metric}_sum{{span="{name}"}} {s["sum"]:.6f}')
+            lines.append(f'{metric}_count{{span="{name}"}} {s["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def format_table(self) -> str:
+        """Short text table in milliseconds for the GUI stats panel"""
+        lines = [f"{'span':<24}{'p50':>9}{'p95':>9}{'p99':>9}{'n':>8}"]
+        for name, s in sorted(self.summary().items()):
+            lines.append(
+                f"{name:<24}{s['p50'] * 1000:9.2f}{s['p95'] * 1000:9.2f}"
+                f"{s['p99'] * 1000:9.2f}{s['count']:8d}"
+            )
+        return "\n".join(lines)
+
+    def clear(self):
+        self.spans = {}
+
+
+# Registry dùng chung cho toàn bộ ứng dụng
+METRICS = Metrics()
+
+
+class MetricsServer:
+    """Serve METRICS as Prometheus text on http://HOST:PORT/metrics"""
+
+    HOST = "127.0.0.1"
+    PORT = 9108
+
+    def __init__(self, metrics: Metrics = METRICS, host=None, port=None):
+        self.metrics = metrics
+        self.host = host or self.HOST
+        self.port = port or self.PORT
+        self.httpd = None
+
+    def start(self) -> bool:
+        if self.httpd is not None:
+            return True
+
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            self.httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            print(f"Error starting metrics server on {self.host}:{self.port}: {e}")
+            self.httpd = None
+            return False
+
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return True
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
@@ -0,0 +1,285 @@
+import threading
+import queue
+import time
+from collections import namedtuple
+
+
+JOB = namedtuple(
+    "job",
+    ["index", "socket", "config", "mat", "result", "t_trigger"],
+    defaults=[0, None, None, None, None, 0.0],
+)
+
+STAGE_ACQUISITION = "acquisition"
+STAGE_PROCESS = "process"
+STAGE_OUTPUT = "output"
+
+
+class StageCounter:
+    """Busy / done counters of one stage"""
+
+    def __init__(self, n_workers=1):
+        self.n_workers = n_workers
+        self.busy = 0
+        self.done = 0
+        self.busy_time = 0.0
+        self._lock = threading.Lock()
+
+    def enter(self):
+        with self._lock:
+            self.busy += 1
+        return time.perf_counter()
+
+    def leave(self, t_start):
+        with self._lock:
+            self.busy -= 1
+            self.done += 1
+            self.busy_time += time.perf_counter() - t_start
+
+
+class InspectionPipeline:
+    """
+    Staged pipeline for back-to-back triggers.\n
+    acquisition (1 thread) -> process (N workers) -> output (1 thread)\n
+    Stages are connected by bounded queues, so frame k+1 can be grabbed while
+    frame k is processed and the result of frame k-1 is sent. The output stage
+    re-orders results and always delivers them in trigger order.
+    """
+
+    def __init__(
+        self,
+        grab_fn,
+        process_fn,
+        output_fn,
+        n_workers=2,
+        queue_size=4,
+        on_drop=None,
+    ):
+        """
+        grab_fn(job) -> job: grab frame and config of the trigger
+        process_fn(job) -> job: run the inspection
+        output_fn(job): send the reply and update the UI
+        on_drop(job): reply to a job discarded when the pipeline stops
+        """
+        self.grab_fn = grab_fn
+        self.process_fn = process_fn
+        self.output_fn = output_fn
+        self.on_drop = on_drop
+        self.n_workers = max(int(n_workers), 1)
+        self.queue_size = max(int(queue_size), 1)
+
+        self.trigger_queue = queue.Queue(maxsize=self.queue_size)
+        self.process_queue = queue.Queue(maxsize=self.queue_size)
+
+        # Kết quả chờ gửi theo đúng thứ tự trigger
+        self._pending = {}
+        self._pending_cond = threading.Condition()
+        self._next_output = 0
+        self._next_index = 0
+        self._index_lock = threading.Lock()
+
+        self.counters = {
+            STAGE_ACQUISITION: StageCounter(1),
+            STAGE_PROCESS: StageCounter(self.n_workers),
+            STAGE_OUTPUT: StageCounter(1),
+        }
+        self.n_dropped = 0
+
+        self._threads = []
+        self._running = False
+        self._t_start = 0.0
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._t_start = time.perf_counter()
+        self._next_output = 0
+        self._next_index = 0
+        self._pending.clear()
+        self.n_dropped = 0
+        for name in self.counters:
+            self.counters[name] = StageCounter(self.counters[name].n_workers)
+
+        self._threads = [
+            threading.Thread(target=self._loop_acquisition, daemon=True),
+            threading.Thread(target=self._loop_output, daemon=True),
+        ]
+        self._threads += [
+            threading.Thread(target=self._loop_process, daemon=True)
+            for _ in range(self.n_workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def stop(self, timeout=2.0):
+        if not self._running:
+            return
+        self._running = False
+        with self._pending_cond:
+            self._pending_cond.notify_all()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+        # Bỏ các job còn tồn trong queue và chờ sắp xếp, vẫn trả lời từng job
+        dropped = []
+        for q in (self.trigger_queue, self.process_queue):
+            while True:
+                try:
+                    dropped.append(q.get_nowait())
+                except queue.Empty:
+                    break
+        with self._pending_cond:
+            dropped += [self._pending[i] for i in sorted(self._pending)]
+            self._pending.clear()
+        for job in sorted(dropped, key=lambda job: job.index):
+            self._drop(job)
+
+    def _drop(self, job: JOB):
+        # Client không phải chờ tới timeout
+        if self.on_drop is None:
+            return
+        try:
+            self.on_drop(job)
+        except Exception as e:
+            print(f"[{time.strftime('%H:%M:%S')}][drop][ERROR]: {str(e)}")
+
+    def submit(self, socket=None) -> bool:
+        """
+        Queue a new trigger. Returns False when the pipeline is stopped or
+        the acquisition queue is full (trigger is rejected).
+        """
+        if not self._running:
+            return False
+
+        with self._index_lock:
+            job = JOB(
+                index=self._next_index, socket=socket, t_trigger=time.perf_counter()
+            )
+            try:
+                self.trigger_queue.put_nowait(job)
+            except queue.Full:
+                self.n_dropped += 1
+                return False
+            self._next_index += 1
+        return True
+
+    def _get(self, q: queue.Queue):
+        while self._running:
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def _put(self, q: queue.Queue, job: JOB):
+        # Bounded queue: chờ stage sau rảnh (back-pressure)
+        while self._running:
+            try:
+                q.put(job, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _loop_acquisition(self):
+        counter = self.counters[STAGE_ACQUISITION]
+        while self._running:
+            job = self._get(self.trigger_queue)
+            if job is None:
+                break
+
+            t0 = counter.enter()
+            try:
+                job = self.grab_fn(job)
+            except Exception as e:
+                print(f"[{time.strftime('%H:%M:%S')}][acquisition][ERROR]: {str(e)}")
+            finally:
+                counter.leave(t0)
+
+            if not self._put(self.process_queue, job):
+                self._drop(job)
+
+    def _loop_process(self):
+        counter = self.counters[STAGE_PROCESS]
+        while self._running:
+            job = self._get(self.process_queue)
+            if job is None:
+                break
+
+            t0 = counter.enter()
+            try:
+                job = self.process_fn(job)
+            except Exception as e:
+                print(f"[{time.strftime('%H:%M:%S')}][process][ERROR]: {str(e)}")
+            finally:
+                counter.leave(t0)
+
+            with self._pending_cond:
+                self._pending[job.index] = job
+                self._pending_cond.notify_all()
+
+    def _loop_output(self):
+        counter = self.counters[STAGE_OUTPUT]
+        while self._running:
+            with self._pending_cond:
+                while self._running and self._next_output not in self._pending:
+                    self._pending_cond.wait(0.1)
+                if not self._running:
+                    break
+                job = self._pending.pop(self._next_output)
+                self._next_output += 1
+
+            t0 = counter.enter()
+            try:
+                self.output_fn(job)
+            except Exception as e:
+                print(f"[{time.strftime('%H:%M:%S')}][output][ERROR]: {str(e)}")
+            finally:
+                counter.leave(t0)
+
+    def occupancy(self) -> dict:
+        """
+        Per-stage occupancy.\n
+        queued: jobs waiting in front of the stage
+        busy: jobs currently handled by the stage workers
+        utilization: busy time / (elapsed time * workers) since start
+        """
+        elapsed = max(time.perf_counter() - self._t_start, 1e-6)
+        with self._pending_cond:
+            n_reorder = len(self._pending)
+
+        queued = {
+            STAGE_ACQUISITION: self.trigger_queue.qsize(),
+            STAGE_PROCESS: self.process_queue.qsize(),
+            STAGE_OUTPUT: n_reorder,
+        }
+
+        stats = {}
+        for name, counter in self.counters.items():
+            stats[name] = {
+                "queued": queued[name],
+                "busy": counter.busy,
+                "workers": counter.n_workers,
+                "done": counter.done,
+                "utilization": counter.busy_time / (elapsed * counter.n_workers),
+            }
+        stats["dropped"] = self.n_dropped
+        return stats
+
+    def format_occupancy(self) -> str:
+        stats = self.occupancy()
+        items = []
+        for name in (STAGE_ACQUISITION, STAGE_PROCESS, STAGE_OUTPUT):
+            s = stats[name]
+            items.append(
+                f"{name}: q={s['queued']} busy={s['busy']}/{s['workers']} "
+                f"util={s['utilization'] * 100:.0f}%"
+            )
+        items.append(f"dropped={stats['dropped']}")
+        return " | ".join(items)
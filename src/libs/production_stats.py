@@ -0,0 +1,267 @@
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from libs.image_processor import DECISION_NG, DECISION_OK
+
+
+# Các đại lượng theo dõi của mỗi ROI
+METRIC_NAMES = ("dx", "dy", "da")
+# Giờ bắt đầu các ca trong ngày
+SHIFT_HOURS = (6, 14, 22)
+
+
+class Welford:
+    """
+    Running mean / variance of (R, M) values, one accumulator per item.\n
+    add() and remove() are O(R * M) per sample whatever the sample count,
+    remove() undoes an earlier add() so a sliding window costs the same.
+    Items are masked per sample (ROIs without alignment are skipped).
+    """
+
+    def __init__(self, n_items: int, n_metrics: int):
+        self.count = np.zeros(n_items, dtype=np.int64)
+        self.mean = np.zeros((n_items, n_metrics), dtype=np.float64)
+        self.m2 = np.zeros((n_items, n_metrics), dtype=np.float64)
+
+    def resize(self, n_items: int):
+        n = len(self.count)
+        if n_items <= n:
+            return
+        self.count = np.pad(self.count, (0, n_items - n))
+        self.mean = np.pad(self.mean, ((0, n_items - n), (0, 0)))
+        self.m2 = np.pad(self.m2, ((0, n_items - n), (0, 0)))
+
+    def add(self, values: np.ndarray, mask: np.ndarray):
+        self.count[mask] += 1
+        n = self.count[mask][:, None]
+        delta = values[mask] - self.mean[mask]
+        self.mean[mask] += delta / n
+        self.m2[mask] += delta * (values[mask] - self.mean[mask])
+
+    def remove(self, values: np.ndarray, mask: np.ndarray):
+        n = self.count[mask][:, None]
+        single = n[:, 0] <= 1
+        mean_old = np.where(
+            n > 1, (n * self.mean[mask] - values[mask]) / np.maximum(n - 1, 1), 0.0
+        )
+        m2 = self.m2[mask] - (values[mask] - mean_old) * (
+            values[mask] - self.mean[mask]
+        )
+        m2[single] = 0.0
+        self.mean[mask] = mean_old
+        # Sai số làm tròn có thể làm m2 âm một chút
+        self.m2[mask] = np.maximum(m2, 0.0)
+        self.count[mask] -= 1
+
+    @property
+    def std(self) -> np.ndarray:
+        n = self.count[:, None]
+        return np.sqrt(np.where(n > 1, self.m2 / np.maximum(n - 1, 1), 0.0))
+
+
+def shift_bounds(t: float, hours=SHIFT_HOURS) -> tuple[float, float]:
+    """(start, end) epoch of the shift containing t"""
+    lt = time.localtime(t)
+    midnight = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday, 0, 0, 0, 0, 0, -1))
+    hours = sorted(hours)
+    # Ca cuối của hôm trước kéo dài qua nửa đêm
+    starts = [midnight + (h - 24) * 3600 for h in hours[-1:]]
+    starts += [midnight + h * 3600 for h in hours]
+    starts += [midnight + (24 + hours[0]) * 3600]
+    i = max(k for k in range(len(starts) - 1) if starts[k] <= t)
+    return starts[i], starts[i + 1]
+
+
+class ProductionStats:
+    """
+    Incremental production statistics of the auto mode.\n
+    update() costs O(ROIs) per cycle: running totals, per-ROI OK / NG /
+    none counters, Welford mean / std of dx, dy, da per ROI over the last
+    `window` cycles (sliding, old cycles are removed again) and over the
+    current shift. Nothing is recounted from history.\n
+    SPC: an EWMA of every ROI metric is compared with the baseline taken
+    once the ROI has `window` aligned cycles in the shift. Drift is flagged
+    when the EWMA leaves baseline mean +- L * sigma * sqrt(lambda / (2 - lambda)).
+    """
+
+    def __init__(
+        self, window=500, ewma_lambda=0.2, ewma_l=3.0, shift_hours=SHIFT_HOURS
+    ):
+        self.window = max(int(window), 2)
+        self.ewma_lambda = ewma_lambda
+        self.ewma_l = ewma_l
+        self.shift_hours = shift_hours
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self, t: float = None):
+        with self._lock:
+            self._reset(0, time.time() if t is None else t)
+
+    def _reset(self, n_rois: int, t: float):
+        m = len(METRIC_NAMES)
+        self.n_rois = n_rois
+        self.n_cycles = 0
+        self.n_pass = 0
+        self.roi_ok = np.zeros(n_rois, dtype=np.int64)
+        self.roi_ng = np.zeros(n_rois, dtype=np.int64)
+        self.roi_none = np.zeros(n_rois, dtype=np.int64)
+        self.rolling = Welford(n_rois, m)
+        self._history = deque()
+        self._shift_start(t)
+
+    def _shift_start(self, t: float):
+        m = len(METRIC_NAMES)
+        self.shift_t, self.shift_end = shift_bounds(t, self.shift_hours)
+        self.shift_cycles = 0
+        self.shift_pass = 0
+        self.shift = Welford(self.n_rois, m)
+        self.ewma = np.zeros((self.n_rois, m), dtype=np.float64)
+        self.ewma_ready = np.zeros(self.n_rois, dtype=bool)
+        self.baseline_mean = np.zeros((self.n_rois, m), dtype=np.float64)
+        self.baseline_std = np.zeros((self.n_rois, m), dtype=np.float64)
+        self.baseline_ready = np.zeros(self.n_rois, dtype=bool)
+
+    def _resize(self, n_rois: int):
+        if n_rois <= self.n_rois:
+            return
+        pad = n_rois - self.n_rois
+        self.roi_ok = np.pad(self.roi_ok, (0, pad))
+        self.roi_ng = np.pad(self.roi_ng, (0, pad))
+        self.roi_none = np.pad(self.roi_none, (0, pad))
+        self.rolling.resize(n_rois)
+        self.shift.resize(n_rois)
+        self.ewma = np.pad(self.ewma, ((0, pad), (0, 0)))
+        self.ewma_ready = np.pad(self.ewma_ready, (0, pad))
+        self.baseline_mean = np.pad(self.baseline_mean, ((0, pad), (0, 0)))
+        self.baseline_std = np.pad(self.baseline_std, ((0, pad), (0, 0)))
+        self.baseline_ready = np.pad(self.baseline_ready, (0, pad))
+        # Số ROI hiếm khi đổi, pad luôn các chu kỳ trong cửa sổ
+        self._history = deque(
+            (np.pad(v, ((0, pad), (0, 0))), np.pad(m, (0, pad)))
+            for v, m in self._history
+        )
+        self.n_rois = n_rois
+
+    def update(self, table: np.ndarray, b_pass: bool, t: float = None):
+        """Add one cycle (ROI_DTYPE table of the result)"""
+        t = time.time() if t is None else t
+        n = len(table)
+        values = np.stack([table[name] for name in METRIC_NAMES], axis=1).astype(
+            np.float64
+        )
+        mask = table["aligned"].copy()
+        decision = table["decision"]
+
+        with self._lock:
+            if not self.shift_t <= t < self.shift_end:
+                self._shift_start(t)
+            self._resize(n)
+
+            self.n_cycles += 1
+            self.n_pass += bool(b_pass)
+            self.shift_cycles += 1
+            self.shift_pass += bool(b_pass)
+            ok = decision == DECISION_OK
+            ng = decision == DECISION_NG
+            self.roi_ok[:n] += ok
+            self.roi_ng[:n] += ng
+            self.roi_none[:n] += ~(ok | ng)
+
+            full = np.zeros((self.n_rois, len(METRIC_NAMES)), dtype=np.float64)
+            full[:n] = values
+            full_mask = np.zeros(self.n_rois, dtype=bool)
+            full_mask[:n] = mask
+
+            # Cửa sổ trượt: bỏ chu kỳ cũ nhất khi đủ window
+            self.rolling.add(full, full_mask)
+            self._history.append((full, full_mask))
+            if len(self._history) > self.window:
+                old, old_mask = self._history.popleft()
+                self.rolling.remove(old, old_mask)
+            self.shift.add(full, full_mask)
+
+            lam = self.ewma_lambda
+            start = full_mask & ~self.ewma_ready
+            self.ewma[start] = full[start]
+            step = full_mask & self.ewma_ready
+            self.ewma[step] = lam * full[step] + (1 - lam) * self.ewma[step]
+            self.ewma_ready |= full_mask
+
+            # Baseline riêng từng ROI khi ROI đó đủ window chu kỳ trong ca
+            ready = ~self.baseline_ready & (self.shift.count >= self.window)
+            self.baseline_mean[ready] = self.shift.mean[ready]
+            self.baseline_std[ready] = self.shift.std[ready]
+            self.baseline_ready |= ready
+
+    def drift(self) -> np.ndarray:
+        """(R, M) bool, EWMA outside the control limits of the shift baseline"""
+        lam = self.ewma_lambda
+        limit = self.ewma_l * self.baseline_std * np.sqrt(lam / (2 - lam))
+        return (self.ewma_ready & self.baseline_ready)[:, None] & (
+            np.abs(self.ewma - self.baseline_mean) > np.maximum(limit, 1e-9)
+        )
+
+    def snapshot(self) -> dict:
+        """JSON friendly copy of every statistic"""
+        with self._lock:
+            n_decided = self.roi_ok + self.roi_ng
+            drift = self.drift()
+            rois = []
+            for i in range(self.n_rois):
+                roi = {
+                    "ok": int(self.roi_ok[i]),
+                    "ng": int(self.roi_ng[i]),
+                    "none": int(self.roi_none[i]),
+                    "pass_rate": (
+                        float(self.roi_ok[i] / n_decided[i] * 100)
+                        if n_decided[i]
+                        else None
+                    ),
+                    "drift": [m for m, d in zip(METRIC_NAMES, drift[i]) if d],
+                }
+                for j, name in enumerate(METRIC_NAMES):
+                    roi[f"{name}_mean"] = float(self.rolling.mean[i, j])
+                    roi[f"{name}_std"] = float(self.rolling.std[i, j])
+                    roi[f"shift_{name}_mean"] = float(self.shift.mean[i, j])
+                    roi[f"shift_{name}_std"] = float(self.shift.std[i, j])
+                rois.append(roi)
+
+            return {
+                "cycles": self.n_cycles,
+                "pass": self.n_pass,
+                "yield": self.n_pass / self.n_cycles * 100 if self.n_cycles else 0.0,
+                "window": min(len(self._history), self.window),
+                "shift_start": time.strftime(
+                    "%Y-%m-%d %H:%M", time.localtime(self.shift_t)
+                ),
+                "shift_cycles": self.shift_cycles,
+                "shift_yield": (
+                    self.shift_pass / self.shift_cycles * 100
+                    if self.shift_cycles
+                    else 0.0
+                ),
+                "baseline": bool(self.baseline_ready.any()),
+                "rois": rois,
+            }
+
+    def format_text(self) -> str:
+        """Short text for the auto tab stats panel"""
+        s = self.snapshot()
+        lines = [
+            f"Cycles {s['cycles']}, yield {s['yield']:.1f}% | shift since "
+            f"{s['shift_start']}: {s['shift_cycles']} cycles, yield {s['shift_yield']:.1f}%"
+        ]
+        drifting = [
+            f"Roi{i + 1}:{'/'.join(roi['drift'])}"
+            for i, roi in enumerate(s["rois"])
+            if roi["drift"]
+        ]
+        if drifting:
+            lines.append("SPC drift: " + ", ".join(drifting))
+        elif not s["baseline"]:
+            lines.append("SPC: collecting baseline")
+        return "\n".join(lines)
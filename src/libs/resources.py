@@ -1,7930 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x04\x8a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x04\x00\x00\x00\xd9\x73\xb2\x7f\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x02\
-\x62\x4b\x47\x44\x00\xff\x87\x8f\xcc\xbf\x00\x00\x00\x09\x70\x48\
-\x59\x73\x00\x00\xec\x38\x00\x00\xec\x38\x01\x71\x2b\xca\x38\x00\
-\x00\x00\x07\x74\x49\x4d\x45\x07\xe6\x02\x15\x0f\x34\x22\x74\xd8\
-\x53\xdc\x00\x00\x02\x2f\x49\x44\x41\x54\x48\xc7\xc5\xd5\xbb\x4f\
-\x54\x51\x10\xc7\xf1\x0f\xbb\x04\x1a\x15\xa3\x88\x2c\xc8\xdd\x0e\
-\x34\x0a\xc1\x44\x0b\x13\x4b\x8d\x60\x6b\x41\x62\x47\x43\x65\xa5\
-\x7f\x80\x89\xc6\x7f\x43\x5b\x5f\x11\x63\xed\x2b\xbb\x20\x34\xba\
-\x58\x58\x60\x4c\x94\xbd\x01\x2c\xd0\xb8\xcb\xc6\x4a\xf6\x58\x78\
-\xb3\xe1\xb1\x0f\x94\xc2\xe9\xce\x4c\xe6\x3b\x73\xe7\xfc\xce\x5c\
-\xf6\x68\x6d\x75\xbd\xed\x0e\xd8\x87\x8a\xb2\x5f\x7f\x07\x48\x19\
-\x74\xc1\x79\x43\xba\xf1\xcd\xa2\xbc\xe7\x3e\xaa\xee\xae\x9f\x5e\
-\x37\x15\x05\x55\x65\xb1\x58\x59\x55\x50\x74\x5b\xdf\x6e\xd2\x47\
-\xbd\x14\xfc\x30\x6d\xca\x59\x59\x59\x67\x4c\x79\xec\x87\xe0\xb5\
-\xd3\xad\xd3\xdf\x09\x66\x8d\xeb\xdc\xe2\xef\x30\x2e\x27\x28\x34\
-\x47\x64\xbc\x10\x3c\x13\xd5\x8d\x1e\xf3\x54\xf0\x52\xa6\x31\xe0\
-\xa6\x60\x46\x84\x36\xdd\xb2\xfa\xa5\xa5\xf5\xcb\xea\xd6\x86\x48\
-\x5e\x70\xa7\x51\xfa\x09\x4b\xca\x2e\x83\x2b\x0a\x96\xcd\xcb\xc8\
-\x98\xb7\x6c\xc1\x04\x18\x57\xb6\xe4\x44\x7d\xc0\x35\xc1\x13\x9d\
-\xe8\xf6\x56\xd5\xd7\x1a\xe0\xab\xe0\xad\xc3\xe8\xf4\x50\x70\xa3\
-\x5e\x7a\xda\x7d\xc1\x14\x88\x14\xad\x38\x27\x23\x2d\x2d\xe3\x9c\
-\x15\xc5\x64\x32\x93\x82\x07\xd2\x5b\x93\xdb\xd1\x65\xc8\xba\x02\
-\xd8\xb0\x82\xa2\x55\xb0\x2a\xa5\x88\x0d\xf0\x41\xc5\xa0\x2e\xdf\
-\xb7\x77\x10\x89\xc5\xb2\x49\x37\x19\x99\x4d\x55\x36\x9f\xb3\x62\
-\xf1\xf6\x7b\x4a\xb5\x92\x47\x2b\x4b\xa1\xe2\x9b\x2e\x3d\xa0\xd7\
-\xb4\x69\xbd\xb5\xf8\xe6\xf3\x51\x07\xad\xa9\xec\x04\x94\x2c\xda\
-\x9f\xe8\x2c\xad\x4f\x24\xaa\x0d\x31\x12\xe9\x4b\x3e\xe1\xa4\x7d\
-\x3e\x29\xed\x04\x6c\xc8\xe3\xa2\x0e\xfc\xb4\x96\x54\xed\xd1\x93\
-\x54\x5f\xf3\x13\x1d\x2e\x61\x2e\x19\x68\x13\x21\x4d\x6c\x13\xd2\
-\x7b\x57\x6b\x42\xfa\x6c\xa8\xd1\x2c\x6e\x0b\x72\x06\x34\x92\xf2\
-\x80\x9c\xe0\x56\xe3\x61\xf6\x79\x25\x78\x6a\xa0\x6e\xf4\xcf\x63\
-\xca\x25\x83\x6e\x60\xa7\x15\x04\x33\xc6\x76\x3c\xe7\x31\x39\x41\
-\x50\x30\xd2\xfc\x4a\x47\xbd\x12\x94\x3c\x32\x99\x2c\x94\xb3\x26\
-\xdd\x57\x52\x95\xf3\x4e\x30\xdf\x0a\xd1\xeb\x4e\xb2\xd2\xd6\xc5\
-\x62\xeb\xaa\x82\x2f\x6e\x39\x62\xd8\xbc\x60\xce\x70\x73\x44\xca\
-\x71\x37\x3c\x54\x10\x8b\x2d\x78\xe4\xba\xc1\x44\xaf\x23\xe6\x76\
-\x83\x80\xb4\x43\x22\x91\x43\xda\xb7\xf8\x87\xbd\x11\xbc\x71\xaa\
-\x35\xa2\x91\x9d\x32\x2b\x98\xdd\x1b\x62\x46\x30\xb3\x17\xc4\x49\
-\x79\xc1\xdd\xed\xab\xe5\xef\xba\xb8\xe7\xc2\xbf\xa7\x43\x7b\x83\
-\xbf\xea\x7f\xb0\xdf\x1e\xfa\xbc\xba\x07\xb3\xd8\x51\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\
-\x00\x32\x30\x32\x32\x2d\x30\x32\x2d\x32\x31\x54\x31\x35\x3a\x35\
-\x32\x3a\x33\x33\x2b\x30\x30\x3a\x30\x30\x66\xc9\x9b\xb1\x00\x00\
-\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\
-\x79\x00\x32\x30\x32\x32\x2d\x30\x32\x2d\x32\x31\x54\x31\x35\x3a\
-\x35\x32\x3a\x33\x33\x2b\x30\x30\x3a\x30\x30\x17\x94\x23\x0d\x00\
-\x00\x00\x20\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\
-\x68\x74\x74\x70\x73\x3a\x2f\x2f\x69\x6d\x61\x67\x65\x6d\x61\x67\
-\x69\x63\x6b\x2e\x6f\x72\x67\xbc\xcf\x1d\x9d\x00\x00\x00\x18\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\
-\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\
-\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\
-\x61\x67\x65\x3a\x3a\x48\x65\x69\x67\x68\x74\x00\x35\x31\x32\x8f\
-\x8d\x53\x81\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\
-\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\
-\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\
-\x31\x36\x34\x35\x34\x35\x38\x37\x35\x33\xa3\x89\x08\xcd\x00\x00\
-\x00\x13\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\
-\x65\x00\x31\x32\x32\x30\x34\x42\x42\x25\x18\x3e\x5c\x00\x00\x00\
-\x44\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\
-\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\
-\x2f\x35\x36\x2f\x59\x45\x7a\x31\x58\x34\x79\x2f\x33\x34\x31\x30\
-\x2f\x66\x69\x74\x5f\x7a\x6f\x6f\x6d\x5f\x69\x63\x6f\x6e\x5f\x32\
-\x31\x37\x32\x39\x37\x2e\x70\x6e\x67\x00\xa4\xf8\x07\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\xda\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x02\xa3\
-\x50\x4c\x54\x45\xf0\xf0\xf0\x00\x00\x00\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xe3\xe3\xe3\x12\x12\x12\x03\x03\x03\x02\x02\x02\x05\
-\x05\x05\x08\x08\x08\x01\x01\x01\x00\x00\x00\x01\x01\x01\x09\x09\
-\x09\x32\x32\x32\x05\x05\x05\x00\x00\x00\x01\x01\x01\x16\x16\x16\
-\x10\x10\x10\x02\x02\x02\x00\x00\x00\x00\x00\x00\x02\x02\x02\x08\
-\x08\x08\x01\x01\x01\x00\x00\x00\x00\x00\x00\x03\x03\x03\x3b\x3b\
-\x3b\x05\x05\x05\x00\x00\x00\x01\x01\x01\x08\x08\x08\x0f\x0f\x0f\
-\x02\x02\x02\x00\x00\x00\x01\x01\x01\x19\x19\x19\x09\x09\x09\x02\
-\x02\x02\xe0\xe0\xe0\x48\x48\x48\x05\x05\x05\x01\x01\x01\x00\x00\
-\x00\x03\x03\x03\x10\x10\x10\x02\x02\x02\x00\x00\x00\x07\x07\x07\
-\x0a\x0a\x0a\x01\x01\x01\x17\x17\x17\x5f\x5f\x5f\x05\x05\x05\x01\
-\x01\x01\x02\x02\x02\xaf\xaf\xaf\x11\x11\x11\x03\x03\x03\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x07\x07\x07\x0b\x0b\x0b\x01\x01\x01\
-\x00\x00\x00\x06\x06\x06\x00\x00\x00\x00\x00\x00\x05\x05\x05\x07\
-\x07\x07\x01\x01\x01\x09\x09\x09\x03\x03\x03\x00\x00\x00\x32\x32\
-\x32\x01\x01\x01\x00\x00\x00\x03\x03\x03\x15\x15\x15\x34\x34\x34\
-\x02\x02\x02\x00\x00\x00\x05\x05\x05\x6e\x6e\x6e\x03\x03\x03\x00\
-\x00\x00\x03\x03\x03\x10\x10\x10\x01\x01\x01\x09\x09\x09\x14\x14\
-\x14\x01\x01\x01\x01\x01\x01\x0a\x0a\x0a\x08\x08\x08\x01\x01\x01\
-\x02\x02\x02\x15\x15\x15\x05\x05\x05\x00\x00\x00\x01\x01\x01\x20\
-\x20\x20\x05\x05\x05\x05\x05\x05\x4d\x4d\x4d\x03\x03\x03\x00\x00\
-\x00\x02\x02\x02\x03\x03\x03\x01\x01\x01\x08\x08\x08\x5b\x5b\x5b\
-\x02\x02\x02\x00\x00\x00\x05\x05\x05\x40\x40\x40\x02\x02\x02\x13\
-\x13\x13\x0f\x0f\x0f\x01\x01\x01\x01\x01\x01\x0e\x0e\x0e\x34\x34\
-\x34\x2e\x2e\x2e\x3b\x3b\x3b\x09\x09\x09\x00\x00\x00\x00\x00\x00\
-\x04\x04\x04\x2f\x2f\x2f\x33\x33\x33\x2f\x2f\x2f\x4b\x4b\x4b\x06\
-\x06\x06\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x01\x01\x01\x25\x25\x25\x03\x03\x03\x00\x00\x00\x06\x06\x06\
-\x5c\x5c\x5c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x0c\x0c\x1a\
-\x1a\x1a\x07\x07\x07\x06\x06\x06\x0b\x0b\x0b\x00\x00\x00\x04\x0b\
-\x15\x03\x09\x11\x0b\x21\x3e\x24\x67\xc1\x1a\x4b\x8d\x01\x03\x05\
-\x02\x05\x09\x13\x36\x65\x2a\x7a\xe4\x30\x8a\xff\x2d\x83\xf4\x12\
-\x34\x62\x05\x0e\x1a\x1c\x50\x97\x2e\x84\xf6\x2f\x89\xff\x2f\x88\
-\xff\x29\x77\xdd\x0a\x1c\x34\x0b\x1f\x3a\x23\x66\xbf\x23\x64\xbb\
-\x04\x0d\x18\x01\x04\x08\x12\x35\x63\x2a\x79\xe2\x1b\x4d\x90\x01\
-\x03\x06\x05\x0d\x19\x1c\x50\x95\x2d\x83\xf5\x08\x16\x2a\x23\x65\
-\xbd\x29\x78\xdf\x0a\x1d\x36\x09\x19\x2e\x28\x75\xda\x23\x65\xbc\
-\x0f\x2b\x51\x2c\x7f\xed\x18\x47\x84\x00\x01\x02\x15\x3d\x73\x2e\
-\x86\xf9\x2f\x89\xfe\x23\x65\xbe\x02\x05\x0a\x1c\x51\x97\x2e\x84\
-\xf5\x1b\x4f\x94\x22\x61\xb6\x13\x37\x66\x01\x04\x07\x08\x18\x2c\
-\x27\x70\xd1\x23\x66\xc0\x0b\x20\x3c\x0d\x25\x46\x2b\x7c\xe7\x1c\
-\x51\x98\x13\x38\x69\x2e\x85\xf7\x2a\x7b\xe5\x13\x37\x67\x14\x39\
-\x6a\x00\x00\x01\xff\xff\xff\x6b\xa5\x00\x44\x00\x00\x00\x9d\x74\
-\x52\x4e\x53\x00\x00\x00\x02\x01\x01\x0f\x6e\x94\x37\x29\xa6\xfb\
-\xc5\x1f\x03\x48\xd0\x9f\x0b\x0d\x78\xeb\xf9\x6d\x26\xa2\xfa\xe7\
-\x46\x03\x46\xce\xc8\x21\x0d\x76\xea\xa1\x0c\x23\x70\x01\x02\x45\
-\xcc\xe8\x49\x0c\x73\xe9\x23\x21\x9d\x0c\x02\x44\xca\x72\x02\x0c\
-\x70\xe6\xdd\xe4\x3a\x1e\x9b\xcd\x44\xe3\xee\x47\x36\xc6\x22\x5f\
-\xf2\x08\x98\xef\x71\x0c\x05\x81\xfc\x49\x02\x72\xfd\x38\x0f\xa5\
-\x25\x12\xb0\xbd\x1a\x1f\xc2\x77\x0d\x2c\xd2\x94\x07\x38\x4a\x02\
-\x4f\xf6\x67\x58\xa8\x27\x03\x7d\xe1\x3a\x03\x7c\x0e\x11\xad\xbe\
-\x21\x09\x0b\x08\x2e\xdb\xd5\x53\x0b\x0a\x0a\x03\x2b\xd1\xd3\xbf\
-\xc0\xfe\xc1\x0d\x4b\xec\x40\x03\xf1\xf7\xf8\x24\x0a\x37\x41\x20\
-\xfa\x69\x49\xac\x00\x00\x00\x01\x62\x4b\x47\x44\x02\x66\x0b\x7c\
-\x64\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x9d\x7b\x00\x00\x9d\
-\x7b\x01\x3c\x9f\x77\xc4\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe4\
-\x0a\x10\x08\x0b\x12\x45\xf6\x45\x31\x00\x00\x02\x24\x49\x44\x41\
-\x54\x38\xcb\x9d\x93\xf7\x77\x0c\x61\x14\x86\xe7\xce\x5c\xa2\x05\
-\x09\xb1\xec\xea\x92\xa8\x59\x44\x8b\x16\x5d\x74\xab\x04\xab\xf7\
-\xa8\xd1\x09\xc2\x92\xe8\x32\x7a\xe7\x25\x48\x32\xc4\xce\x10\x44\
-\x59\xbd\xf7\xde\xfb\xbf\x62\x66\x4d\x76\x13\xbb\xe1\x9c\x3c\xbf\
-\xcd\xb9\xcf\xf9\xce\x37\xef\x7b\x3f\x41\xfa\x0f\x42\x49\x04\x16\
-\x4a\xf1\xbf\x04\x2a\x1d\x52\xa6\x2c\x15\x2f\x50\xb9\xf2\x15\x10\
-\x5a\x51\x2c\x46\xe0\x4a\x95\xc3\xa0\x13\x5e\x85\x83\x0a\x54\x35\
-\xa2\x1a\x70\xf4\x18\x2c\xd5\x83\x0a\x54\xc3\x6a\x03\x32\x8f\x9f\
-\x38\x89\x9a\xb5\x28\x40\xe0\xda\x75\xea\x02\x59\xd9\x39\xca\xa9\
-\xd3\x40\xbd\xfa\xf4\x97\x20\x36\x88\x8c\x02\x72\xcf\xb8\x55\x4d\
-\x3d\x7b\x0e\x88\x6e\xc8\x45\x04\x6a\x14\xae\x1f\x9f\x77\x5e\xd5\
-\x74\x94\x0b\x17\x61\x69\xdc\xa4\x90\xc0\x4d\x9b\xc5\x00\xf9\x97\
-\x2e\x2b\x9a\x17\xf5\xca\x55\xd8\x9b\x93\x4f\x10\x5b\xb4\x8c\x05\
-\x3c\xd7\xdc\xaa\x66\x0a\xd7\xb3\x81\x98\x56\x64\x0a\xd4\xba\x8d\
-\x05\xb8\x71\xb3\x60\x6c\x18\xb7\x6e\x03\xd6\xb6\x6c\x08\xdc\x2e\
-\xae\xbd\x11\xce\x9d\xbb\x8a\x5f\xd0\x94\x7b\x1e\xd8\x3a\x74\xd4\
-\x05\xb1\x53\x67\x3b\x10\xdf\x05\xb8\xff\x40\x2d\x6c\x3c\x04\xba\
-\x76\x13\x24\xb1\x7b\x0f\xfd\xf8\x9e\x71\xbd\x7a\xe3\xd1\xe3\x27\
-\xfe\xf9\xd3\x67\x79\x40\x42\x1f\x81\xfa\xf6\x03\x2c\xd6\xfe\x44\
-\x03\x06\xe2\xf9\x0b\xdf\x25\x5f\xbe\xf2\x00\xf6\x90\x41\x82\x34\
-\x18\x70\x0c\x19\x2a\x4a\x3c\x6c\x78\x22\x3c\xaf\xff\x5c\x43\xc9\
-\x79\xf3\x16\x08\x1b\x31\x92\x05\x1a\xe5\x44\xfc\x68\x23\x55\x1e\
-\x13\x0d\xbc\x7b\x6f\x18\xea\x87\x8f\x80\x6d\xec\x38\x23\x07\x1e\
-\x3f\x01\x98\x38\xc9\xa8\x9f\x26\x4f\x01\x3e\x7d\x56\x55\xf7\x97\
-\x5c\x20\x76\xea\x34\xd1\x9b\x24\x4d\x4f\x02\x66\xcc\x34\x72\xa7\
-\x59\xfa\xaf\x7c\xfd\xf6\xfd\x47\x3e\x90\x34\x7b\x0e\x9b\x65\xd1\
-\xdc\x04\x24\xcf\xf3\x6e\x10\xcd\x77\x20\xeb\x67\xe6\x2f\xd8\x16\
-\x2c\x24\xff\x3e\x2c\x5a\x9c\x88\x25\x4b\x49\x62\xe6\x65\x91\x16\
-\x23\xb2\xa8\x94\xe5\xa4\x7f\x15\xb4\xc9\x2b\x56\x02\xa9\xab\x56\
-\xbb\x5c\xae\x35\x6b\xd3\xf4\x79\xfa\xba\xf5\x1b\x5c\x06\x1b\x37\
-\x79\xa3\x96\x68\xf3\x16\x38\xb7\x66\xc8\xb2\x9c\x91\xee\x04\xb6\
-\xa5\xa5\xca\x5e\xb6\xcb\x29\x3b\xcc\xb2\x76\xee\x42\x50\x1c\xbb\
-\xcd\xba\xf7\x44\xec\xdd\x97\x1c\xc8\xfe\xd0\x03\xa6\xc0\x07\x0f\
-\x1d\x0e\xc6\x11\xf6\x6d\x94\x28\x52\x20\x22\x97\xec\xf1\x16\xe1\
-\x37\xfc\x3e\x19\x97\x80\xa3\xae\x29\x00\x00\x00\x25\x74\x45\x58\
-\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\
-\x30\x2d\x31\x30\x2d\x31\x36\x54\x30\x38\x3a\x31\x31\x3a\x31\x38\
-\x2b\x30\x30\x3a\x30\x30\x36\xc6\xd6\x79\x00\x00\x00\x25\x74\x45\
-\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\
-\x32\x30\x2d\x31\x30\x2d\x31\x36\x54\x30\x38\x3a\x31\x31\x3a\x31\
-\x38\x2b\x30\x30\x3a\x30\x30\x47\x9b\x6e\xc5\x00\x00\x00\x20\x74\
-\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x68\x74\x74\x70\
-\x73\x3a\x2f\x2f\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\
-\x6f\x72\x67\xbc\xcf\x1d\x9d\x00\x00\x00\x18\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\
-\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\
-\x3a\x48\x65\x69\x67\x68\x74\x00\x35\x31\x32\x8f\x8d\x53\x81\x00\
-\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\
-\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\
-\x03\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\
-\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x36\x30\x32\
-\x38\x33\x35\x38\x37\x38\x46\x34\x29\x88\x00\x00\x00\x13\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x32\x32\
-\x35\x31\x33\x42\x42\x1b\x23\x89\x31\x00\x00\x00\x48\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\
-\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\
-\x6d\x38\x51\x33\x37\x52\x57\x2f\x32\x35\x39\x36\x2f\x63\x6c\x65\
-\x61\x72\x5f\x66\x6f\x72\x6d\x61\x74\x5f\x69\x63\x6f\x6e\x5f\x31\
-\x35\x35\x36\x34\x37\x2e\x70\x6e\x67\x00\x6e\xc2\x07\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x7c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x02\xc1\x50\x4c\x54\
-\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x04\x07\x00\x10\x1f\x00\x12\x23\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x1c\x36\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x2e\x58\x00\x2e\x57\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x18\x2e\x00\x0b\x15\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x16\x00\x17\x2c\x00\x00\
-\x00\x00\x16\x2b\x00\x19\x2f\x00\x10\x1e\x00\x34\x64\x00\x35\x66\
-\x00\x0f\x1e\x00\x18\x2f\x00\x15\x29\x00\x17\x2d\x00\x16\x2a\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x12\x00\x0a\
-\x12\x00\x19\x30\x00\x00\x00\x00\x00\x00\x00\x11\x20\x00\x10\x1f\
-\x00\x00\x00\x00\x00\x00\x00\x31\x5f\x00\x00\x00\x00\x00\x00\x00\
-\x1c\x36\x00\x2d\x57\x00\x1c\x36\x00\x10\x20\x00\x12\x22\x00\x10\
-\x1f\x00\x03\x07\x00\x1b\x35\x00\x2d\x56\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x1d\x00\x0f\x1e\x00\
-\x19\x30\x00\x00\x00\x00\x0a\x14\x00\x0a\x14\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x15\x29\x00\x14\x26\x00\x14\x27\x00\x18\x2e\
-\x00\x10\x20\x00\x26\x4d\x00\x0f\x1d\x00\x13\x25\x00\x00\x00\x00\
-\x00\x00\x00\x0b\x15\x00\x14\x27\x00\x00\x00\x00\x00\x00\x1f\x15\
-\x00\x1c\x13\x00\x05\x03\x00\x1e\x15\x00\x23\x18\x00\x00\x6e\xd4\
-\x00\x74\xe0\x00\x83\xfc\x00\x85\xff\x00\x34\x65\x00\x3f\x78\x00\
-\x84\xff\x00\x38\x6c\x00\x36\x69\x00\x63\xbf\x00\x84\xfc\x00\x59\
-\xad\x00\x6d\xd2\x00\x69\xcb\x00\x5b\xaf\x00\x62\xbc\x00\x63\xc0\
-\x00\x86\xff\x00\x72\xdd\x00\x6e\xd5\x00\x83\xfb\x00\x84\xfb\x00\
-\x31\x5e\x00\x58\xaa\x00\x58\xa9\x00\x77\xe5\x00\x5d\xb3\x00\x7f\
-\xf5\x00\x78\xe6\x00\x72\xdc\x00\x6f\xd6\x00\x6c\xd0\x00\x1e\x3d\
-\x00\x11\x21\x00\x75\xe1\x00\x20\x40\x00\x83\xfd\x03\x22\x40\x4b\
-\x30\x00\x15\x1e\x1e\x00\x73\xe1\x14\x1e\x1e\x49\x2e\x00\x03\x23\
-\x43\x00\x78\xe7\x00\x3e\x78\x00\x45\x89\x47\x30\x00\xcb\x8b\x00\
-\x20\x26\x1e\xca\x8a\x00\x44\x2f\x01\x00\x49\x90\x00\x6b\xce\x00\
-\x7f\xf6\x05\x27\x45\xad\x76\x00\xe4\x9c\x00\x1e\x25\x1e\x00\x74\
-\xe1\xaa\x74\x00\x00\x74\xdf\x00\x74\xe3\x1a\x23\x22\xdc\x97\x00\
-\xe3\x9b\x00\x1f\x20\x16\x00\x65\xc7\x1b\x24\x21\xdd\x97\x00\xf8\
-\xaa\x00\x7a\x54\x00\x11\x20\x27\x00\x49\x91\x7b\x54\x00\x07\x28\
-\x44\xb2\x79\x00\xff\xb3\x00\xfb\xad\x00\xbd\x80\x00\x4b\x34\x03\
-\xbc\x80\x00\xb0\x78\x00\x07\x28\x45\x00\x38\x6b\x00\x69\xca\x00\
-\x47\x8d\x5b\x3f\x00\xf6\xaa\x00\xff\xb0\x00\xff\xb1\x00\xf3\xa7\
-\x00\x58\x3c\x01\x00\x48\x8f\x00\x67\xc6\x00\x37\x6b\x00\x78\xe8\
-\x08\x27\x42\x8b\x5d\x00\xf7\xaa\x00\xff\xb2\x00\x88\x5b\x00\x08\
-\x28\x44\x00\x6c\xd2\x09\x27\x41\x57\x3c\x00\xae\x77\x00\xda\x96\
-\x00\x09\x28\x43\x00\x6d\xd3\x00\x6c\xd1\x0b\x14\x18\x3f\x2b\x00\
-\x3d\x2a\x00\xd7\x92\x00\xe3\x9c\x00\x00\x5a\xae\x1e\x24\x1e\xe1\
-\x9a\x00\x00\x32\x5f\x00\x60\xba\x00\x6f\xd7\x00\x71\xdd\x1e\x25\
-\x1f\xe1\x99\x00\x00\x5f\xb7\x1e\x1c\x0d\x00\x5a\xad\x00\x5f\xb6\
-\x00\x30\x5c\x1e\x15\x00\x00\x30\x5d\xe1\x9b\x00\xc4\x86\x00\xff\
-\xff\xff\xc4\xa4\x88\xef\x00\x00\x00\x64\x74\x52\x4e\x53\x00\x02\
-\x18\x1e\x1b\xc4\xe3\xe1\x01\x03\x39\xf2\x04\x61\x9c\x2b\x59\xfd\
-\xfd\x9f\x5d\x62\xeb\xd4\x4e\x22\x9e\x23\x52\xd4\xea\x5e\xeb\xee\
-\xe1\xfd\xfd\xe2\xef\xea\xeb\xea\x5c\x99\x97\x2a\xd3\xd2\xef\x4d\
-\x25\xe1\xe0\x3a\x58\xfd\x57\x3b\xf4\xfc\xf5\xe1\xe1\xe1\xc3\xf4\
-\xfc\x1a\x38\x56\x55\x24\xe0\xe0\xf0\x51\xd3\xd2\x9d\x9b\x5b\xe9\
-\xe8\xe9\xee\xe0\xfd\xdf\xe8\x4c\x21\xd2\xe8\x5a\x98\xfc\xf2\xc3\
-\xe3\xe1\xd7\x75\x86\x01\x00\x00\x00\x01\x62\x4b\x47\x44\xea\xc8\
-\xda\x16\x2e\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x02\x76\x00\
-\x00\x02\x76\x01\xda\x60\xe3\x4f\x00\x00\x02\x88\x49\x44\x41\x54\
-\x38\xcb\x63\x60\x20\x05\x30\x32\x31\x03\x01\x13\x23\x4e\x05\x2c\
-\xac\x6c\xec\xec\x6c\xac\x2c\xd8\xe4\x38\x38\x81\x04\x17\x77\x4a\
-\x6a\x6a\x0a\x37\x17\x90\xc9\xc3\x81\x26\xcf\xcb\xc7\xcf\xc0\x20\
-\x20\x98\x96\x9e\x9e\x26\x24\xc0\xc0\xc0\x2f\x2c\x82\xa2\x82\x43\
-\x54\x2c\x43\x5c\x42\x52\x2a\x33\x3d\x2b\x2b\x3d\x9b\x4f\x5a\x46\
-\x36\x47\x4e\x9e\x03\x59\x5e\x21\x37\x2f\x5f\x51\x49\xb9\x00\xa4\
-\xa0\x50\x45\x55\xad\x28\xaf\x58\x1d\x49\x05\xaf\x46\x49\x69\x56\
-\x69\x59\x79\x05\x50\x1e\xa8\x22\x2d\xa5\x2c\x3d\xab\xb4\x58\x53\
-\x0b\xee\x3b\xed\x8c\x3c\x90\x04\x58\x3a\x0b\xc6\xaa\xac\xd2\x81\
-\x1b\xa1\xab\x57\x5d\x0a\x96\x00\x93\xa5\x60\x85\xa5\x35\xfa\xba\
-\x08\x47\x48\x18\x94\x81\x6c\xaf\xad\xab\xcf\xca\xaa\xaf\x6b\x00\
-\xb1\x1b\x0d\x0c\x91\x7c\x61\x64\xdc\x94\x9e\x95\xde\xdc\xd2\xda\
-\x96\x9e\xde\xd6\xda\x0e\x74\x6b\x7a\xb9\x89\x11\xcc\x05\x2c\xa6\
-\x66\xc2\x2a\x1d\x59\xe9\x0d\x9d\x5d\xdd\x3d\xe9\xe9\x3d\xbd\x7d\
-\xfd\x13\xd2\xb3\xd2\xcc\xa5\x2c\x2c\x59\x40\xa1\xce\xc4\x6a\x65\
-\x3d\x11\xa4\x67\xd2\xe4\x29\x53\x41\x0a\xa6\x4e\x9b\x3e\xa3\x34\
-\x2b\x7d\xe6\x44\x6b\x1b\x56\x26\xa0\x02\x66\xdb\xf2\x0e\x90\xbb\
-\x66\xcd\x9e\x33\x77\xde\xfc\xf4\xf4\xf9\xf3\xe6\x2e\x98\x3d\x0b\
-\xe4\xe2\x8e\x72\x5b\x66\x90\x02\xbb\x85\x20\x67\xa7\x2f\x5a\xbc\
-\x64\xe9\xb2\xe5\xa5\xa5\xcb\x97\x2d\x5d\xb2\x78\x11\x58\x68\xa1\
-\x1d\x8a\x82\x15\x2b\x57\xad\x5e\xb3\x76\xed\x9a\x75\xab\x56\xae\
-\x40\x51\x60\x9f\xd2\x01\x0a\x99\xfa\xf5\x1b\x36\x6e\xda\xbc\x65\
-\xcb\xd6\x4d\x1b\xb7\x6d\x07\x59\x91\xde\x91\x62\x0f\x52\xc0\xe4\
-\xe0\x68\xbd\x63\x27\x30\x6c\x77\xed\xde\xb3\x77\xdf\xfe\xfd\xfb\
-\xf6\xee\x39\x70\x10\xe8\xc8\x43\x87\x9d\x1c\x1d\x40\x8e\x64\x74\
-\x76\x71\xe5\x53\x4e\xcb\x4a\x3f\x72\xf4\xd8\xf1\x13\xfb\xf6\x9d\
-\x38\x7e\xf2\xd4\x11\x90\x37\xf9\xdc\xb8\x9c\x61\x89\xcb\xdd\xe3\
-\x34\xd0\x9f\xa7\xcf\x9c\x3d\x77\xfe\xfc\xb9\xb3\x17\x2e\x02\x39\
-\x17\x3d\x8d\x90\x42\x52\xc6\xab\x11\xe8\x8a\xd2\x4b\x97\xaf\x5c\
-\xbd\x7a\xe5\xf2\x69\x60\x94\xa4\x97\x79\x79\x23\xe4\xf9\x7d\x8a\
-\x40\xd1\x94\xde\x33\xef\xda\xf5\xeb\xd7\xe6\xf5\x80\xbd\x70\xc3\
-\x97\x1f\x26\xcf\xe9\x97\x03\x8e\xee\xd2\x9e\x9b\xb7\x4e\x9c\xb8\
-\x75\xb3\x07\x1c\x9f\x95\xb7\xfd\x39\x61\x2a\x02\x02\xef\x00\x13\
-\x4c\xe3\xdd\x7b\xf7\x1f\xec\xdd\xfb\xe0\xfe\xbd\x8b\x40\x0b\x4b\
-\x1f\x06\xb9\x21\x92\x5c\x40\xf0\x9d\xb4\xea\x90\xd0\xb0\x47\xb7\
-\xf6\xee\xbd\xf5\x28\x2c\x3c\xe4\x71\xda\x93\x08\x57\xe4\x44\x19\
-\x10\xf8\xd4\x37\x32\x8a\xef\x19\x48\xc1\x33\xff\x28\x89\xe8\xe7\
-\x31\xae\xa8\xc9\x3a\x36\x0e\x98\x7e\xcc\xe2\x5f\x9c\x38\xf1\x22\
-\xde\x0c\x98\xc6\xf8\xdc\xd0\x33\x06\x38\xe3\x24\xbc\xbc\x75\xeb\
-\x65\x02\xb6\x8c\x03\x01\xce\x89\x49\xc9\xc9\x49\x89\xce\xe4\x67\
-\x5e\x6c\x00\x00\xb1\x4a\x10\xa0\xaf\xa8\xb6\x5c\x00\x00\x00\x25\
-\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\
-\x32\x30\x31\x37\x2d\x30\x34\x2d\x31\x39\x54\x31\x30\x3a\x34\x32\
-\x3a\x34\x30\x2b\x30\x32\x3a\x30\x30\xab\x75\x2d\x48\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\
-\x00\x32\x30\x31\x37\x2d\x30\x34\x2d\x31\x39\x54\x31\x30\x3a\x34\
-\x32\x3a\x34\x30\x2b\x30\x32\x3a\x30\x30\xda\x28\x95\xf4\x00\x00\
-\x00\x46\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x49\
-\x6d\x61\x67\x65\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x37\x2e\x38\
-\x2d\x39\x20\x32\x30\x31\x36\x2d\x30\x36\x2d\x31\x36\x20\x51\x31\
-\x36\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\
-\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\xe6\xbf\x34\xb6\
-\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\
-\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\
-\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\
-\x00\x35\x31\x32\xc0\xd0\x50\x51\x00\x00\x00\x17\x74\x45\x58\x74\
-\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\
-\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\
-\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\
-\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\
-\x54\x69\x6d\x65\x00\x31\x34\x39\x32\x35\x39\x31\x33\x36\x30\x15\
-\x54\xd0\x9f\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x53\x69\x7a\x65\x00\x32\x32\x2e\x33\x4b\x42\x42\xfc\xf8\
-\xde\xc1\x00\x00\x00\x81\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\
-\x6c\x6f\x61\x64\x73\x2f\x63\x61\x72\x6c\x6f\x73\x70\x72\x65\x76\
-\x69\x2f\x35\x49\x7a\x38\x43\x50\x69\x2f\x31\x32\x32\x31\x2f\x31\
-\x34\x39\x32\x36\x30\x38\x30\x33\x37\x2d\x31\x33\x2d\x73\x65\x74\
-\x74\x69\x6e\x67\x2d\x63\x6f\x6e\x66\x69\x67\x75\x72\x65\x2d\x72\
-\x65\x70\x61\x69\x72\x2d\x73\x75\x70\x70\x6f\x72\x74\x2d\x6f\x70\
-\x74\x69\x6d\x69\x7a\x61\x74\x69\x6f\x6e\x2d\x67\x6f\x6f\x67\x6c\
-\x65\x5f\x38\x33\x33\x38\x31\x2e\x70\x6e\x67\x78\x37\xf8\x1f\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x59\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\xba\x50\x4c\x54\
-\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xab\x9a\x4c\xe1\x00\
-\x00\x00\x3c\x74\x52\x4e\x53\x00\x2b\x6a\x69\x6b\x3e\x96\xf2\x97\
-\x68\xfe\xbd\x6d\x7b\x3b\x80\x04\x81\x1b\x64\xa8\xea\x0c\x1e\xeb\
-\x70\x6e\xe2\x58\x65\xed\xe0\xe4\xfb\x95\x5c\xc6\xe6\x91\x1d\x08\
-\x19\x39\xe1\xa7\xf1\x83\x0e\xa4\x66\x38\xf4\xa9\x86\x9e\xc0\x72\
-\x12\x84\x9a\x54\x7c\x28\x91\x00\x00\x00\x01\x62\x4b\x47\x44\x3d\
-\xd0\x6d\x51\x59\x00\x00\x00\x09\x70\x48\x59\x73\x00\x01\x3a\xf6\
-\x00\x01\x3a\xf6\x01\x3a\xb1\x57\x3a\x00\x00\x00\xd6\x49\x44\x41\
-\x54\x38\xcb\xdd\x92\xd7\x0e\x82\x30\x18\x85\x0b\x45\x68\x55\x10\
-\x41\xad\x5a\x07\xee\xad\xb8\x70\xf5\xfd\x9f\xcb\x16\x54\xc0\xc4\
-\x9a\x18\xaf\x38\x37\x4d\xdb\x2f\x27\xff\x38\x00\x64\x44\x8a\x0a\
-\x93\xd2\x72\xef\x00\x64\x69\xe9\x3f\x00\x06\xc2\x10\x62\x64\xb0\
-\x7c\xa1\x88\xb1\xa9\x23\xcb\x42\x3a\x17\xca\x3d\x80\x92\x2d\x4e\
-\xbb\xcc\x0a\x4e\xe4\xe8\xba\x91\x59\xc5\x12\x1f\x6a\x55\x01\x35\
-\x42\x6a\x40\xa9\x37\x80\xed\x38\x4d\x4a\x5b\x6d\xc6\x3a\x5d\xaf\
-\xc7\xfa\x02\xd0\x28\x01\x03\x4a\x07\x80\x50\x0d\x38\xc3\xd1\x78\
-\x42\xa6\x98\x31\x73\x36\xf7\x62\x80\xdb\xc2\x10\x20\x8b\xb0\xc8\
-\xe8\xbe\x90\x02\xcb\xb6\xd9\x91\x02\x42\xab\xf5\x17\xc0\xdc\x48\
-\x00\xdf\x17\x6f\x12\x60\xbb\xf3\xf7\x07\x4b\xd2\x66\xdc\xc5\x87\
-\x41\xc5\xc0\x6b\xd4\xc7\xd4\xa8\x93\x80\x11\xf0\x48\xa8\x01\x5f\
-\xd6\xe9\xfc\x5c\x16\x5f\xd4\xe5\x7a\x6b\xfd\x27\x0f\x5f\x23\x97\
-\x01\xdd\x01\x10\x34\x34\xd5\x36\x02\x54\xfe\x00\x00\x00\x25\x74\
-\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\
-\x30\x32\x30\x2d\x30\x33\x2d\x31\x37\x54\x30\x38\x3a\x31\x33\x3a\
-\x30\x34\x2b\x30\x30\x3a\x30\x30\x51\x60\x40\xd0\x00\x00\x00\x25\
-\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\
-\x32\x30\x32\x30\x2d\x30\x33\x2d\x31\x37\x54\x30\x38\x3a\x31\x33\
-\x3a\x30\x34\x2b\x30\x30\x3a\x30\x30\x20\x3d\xf8\x6c\x00\x00\x00\
-\x46\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\
-\x61\x67\x65\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x37\x2e\x38\x2d\
-\x39\x20\x32\x30\x31\x39\x2d\x30\x32\x2d\x30\x31\x20\x51\x31\x36\
-\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\x67\
-\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\x41\x7b\xe2\xc8\x00\
-\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\
-\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\
-\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\x00\
-\x35\x31\x32\xc0\xd0\x50\x51\x00\x00\x00\x17\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\
-\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\
-\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\
-\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\
-\x69\x6d\x65\x00\x31\x35\x38\x34\x34\x33\x32\x37\x38\x34\xa0\xeb\
-\xd4\xd9\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x53\x69\x7a\x65\x00\x34\x2e\x33\x34\x4b\x42\x42\xee\x9b\x42\
-\x91\x00\x00\x00\x3f\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\
-\x6f\x61\x64\x73\x2f\x35\x36\x2f\x63\x52\x6d\x69\x77\x4f\x4e\x2f\
-\x32\x32\x34\x38\x2f\x6f\x63\x72\x5f\x69\x63\x6f\x6e\x5f\x31\x33\
-\x36\x33\x33\x39\x2e\x70\x6e\x67\x2f\x57\xad\xcf\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x7b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x03\x00\x00\x00\x60\xdc\x09\xb5\
-\x00\x00\x01\xad\x50\x4c\x54\x45\x47\x70\x4c\x70\x88\xb6\x7f\x7f\
-\xbf\x70\x88\xb6\x71\x88\xb7\x74\x8a\xb4\x6f\x87\xb7\x6f\x89\xb7\
-\x71\x89\xb7\x72\x87\xb6\x70\x87\xb5\x4a\x6a\x9f\x6f\x86\xb4\x49\
-\x6e\x9f\x62\x7e\xae\x56\x74\xa5\x46\x6a\xa0\x5c\x78\xa9\x6b\x86\
-\xb4\x00\x4a\x8a\x6d\x84\xb3\x47\x6b\x9f\x68\x81\xb2\x39\x67\x9f\
-\x06\x47\x87\x45\x6b\x9f\x64\x82\xb2\x28\x5f\x97\x4e\x71\xa2\x49\
-\x72\xa4\x0e\x4c\x88\x45\x69\x9f\x47\x6b\x9d\x01\x45\x83\x01\x45\
-\x85\x47\x69\x9e\x01\x47\x85\x46\x6a\x9f\x3f\x5f\x9f\x5a\x7b\xad\
-\x01\x47\x83\x00\x45\x85\x01\x47\x85\x00\x3f\x7f\x00\x46\x85\x48\
-\x6d\xa1\x01\x47\x85\x45\x6a\x9d\x47\x6b\x9e\x00\x48\x87\x1b\x56\
-\x8e\x71\x8d\xb8\x70\x89\xb6\x6f\x87\xb5\x70\x88\xb7\x71\x8d\xb3\
-\x6f\x89\xb5\x6f\x89\xb6\x6f\x87\xb7\x71\x89\xb7\x71\x87\xb5\x73\
-\x8b\xb6\x70\x89\xb6\x3d\x68\x9f\x5c\x7b\xab\x1a\x53\x8e\x0d\x4c\
-\x88\x50\x73\xa6\x48\x72\xa3\x35\x61\x98\x1f\x58\x92\x5a\x7b\xac\
-\x01\x46\x85\x44\x69\x9e\x10\x4f\x8b\x70\x86\xb4\x00\x47\x85\x03\
-\x46\x83\x6e\x85\xb4\x00\x44\x89\x01\x47\x85\x00\x54\x8d\x5c\x7c\
-\xae\x01\x45\x83\x71\x89\xb7\x01\x47\x85\x47\x6b\x9f\x02\x47\x89\
-\x50\x71\xa4\x1b\x56\x90\x53\x74\xa6\x23\x5b\x97\x67\x81\xb1\x56\
-\x79\xac\x46\x6a\x9e\x4f\x71\xa4\x70\x88\xb6\x68\x83\xb2\x5b\x79\
-\xaa\x2f\x5f\x96\x5a\x7b\xad\x3a\x68\x9e\x06\x49\x87\x0a\x4b\x88\
-\x68\x82\xb2\x56\x76\xa8\x18\x53\x90\x65\x82\xb1\x48\x6c\x9f\x1a\
-\x56\x90\x2a\x5f\x97\x56\x75\xa7\x6d\x86\xb5\x1b\x55\x93\x59\x7b\
-\xac\x4a\x6d\xa0\x6d\x86\xb4\x6c\x85\xb4\x3e\x66\x9b\x2f\x5e\x96\
-\x6b\x84\xb3\x36\x62\x99\x55\x75\xa7\x18\x53\x8d\x54\x74\xa6\x60\
-\x7d\xad\x4d\x70\xa3\x38\x63\x99\x4b\x6e\xa1\x0f\x4e\x8d\x4b\x72\
-\xa6\x1a\x55\x93\x61\x7e\xae\x11\x4f\x8b\x0e\x4f\x8b\x46\x6b\x9f\
-\x24\x5b\x94\x67\x82\xb1\x29\x5e\x97\x67\x83\xb2\x60\x7f\xaf\x08\
-\x4b\x88\x44\x6e\xa3\xde\xbb\xe5\xc8\x00\x00\x00\x54\x74\x52\x4e\
-\x53\x00\x54\x08\x78\x9d\x18\xf2\xfd\xc1\x31\xde\x18\xfe\xfc\xfc\
-\xfb\xfd\xfb\xfd\x18\xfe\x9d\xfc\xfb\xfd\xf2\xfd\xfb\xfc\xfc\xfc\
-\xfd\xfe\xf2\xfd\xde\x9d\x78\x08\xfc\xfe\x54\xde\x08\x78\x31\xc1\
-\x54\xc1\x31\xfc\x12\x93\xed\x7d\x1b\xfb\xa5\x20\xf5\xfe\x2a\xba\
-\x6b\x6b\xfc\xfc\xfb\xfc\x9d\xfb\xfc\x9f\xf2\x9d\xfe\x7a\xf2\xfe\
-\x1a\xf3\x09\xfd\xdf\x01\x7d\x41\xdf\x00\x00\x02\x29\x49\x44\x41\
-\x54\x48\xc7\xcd\x95\xf7\x5f\xd3\x40\x18\xc6\x5b\x4a\x07\x54\x41\
-\x28\x54\xd4\xca\x50\xb6\x20\x2a\xdd\x50\xb6\x03\x94\xe9\xbd\x57\
-\x64\xb4\x6e\xc0\x0d\x6e\x65\xa8\x0c\x05\xc7\xdf\xec\x8d\x26\x69\
-\x92\xbb\x24\x3f\xf2\xfe\x92\xeb\xe5\xbe\x9f\x26\xcf\xf3\x3e\x6f\
-\x5c\x2e\x61\x95\x05\x02\x65\x2e\xe7\xe5\x2d\xf5\x23\xe4\x2f\xf5\
-\x3a\x3c\x5e\xe2\xf1\x21\x56\x3e\x4f\x89\x93\xf3\xee\x72\xa4\x56\
-\xb9\xdb\x01\x10\x09\x6b\x40\xdb\x35\x07\x00\x6e\xac\xac\xe6\xc7\
-\xcf\x9e\x6b\x07\x27\x00\xc6\xa7\xaa\x4e\x20\x54\x73\xba\x0e\xc0\
-\x21\x80\xf1\xc9\x8a\xf3\xf5\x00\x96\x80\xaa\x3c\xe6\x05\xa0\x01\
-\x02\x57\x8a\x94\x37\x01\x02\x57\x74\xca\x1b\x00\x91\x2b\x7a\xe5\
-\xf5\x80\xd0\x15\xbd\xf2\x3d\x17\x19\x90\xcd\x66\x01\x3a\x3b\x84\
-\xae\x18\x94\x6f\x6d\x39\xc3\x81\xa6\xae\x4b\x62\x57\x4c\xca\x07\
-\x39\x10\x92\xb9\xa2\x29\xff\xf7\xdf\x9f\x5f\x85\x1d\x02\xd0\xd5\
-\xe6\xa7\xad\xb7\x26\x57\xd4\xd7\x3c\xfa\x4d\xfe\x7a\x20\xa3\x01\
-\x99\x01\xb2\xf1\xe6\xb5\xde\x95\x22\x20\x7f\x48\x1f\x36\x19\xed\
-\xe5\x40\x6f\x34\x49\x7f\x6f\xbc\x94\x02\xf8\xe7\x97\xf7\xf4\x48\
-\x8c\x03\x31\xba\x7e\xfe\x8a\xec\x4b\x01\x8c\x5f\x3c\x24\x6f\x88\
-\x38\x40\x16\x35\x4f\x9e\x82\x19\x28\x28\x0f\xf0\xf5\x03\x7b\x7b\
-\x15\xb8\x3f\x36\x42\x4e\xad\x3c\x2a\x00\x9d\x1d\x8a\xd5\x5c\x79\
-\xb2\x35\x79\x9d\x2e\x22\x61\x0e\xdc\x1c\x26\x5b\x4d\x13\xe3\xfc\
-\x1e\x75\x45\xab\x60\x6d\x03\x86\x0b\xcd\x21\xb6\x58\x7b\xb7\x40\
-\x81\xc5\xb9\x1b\xea\x16\x5b\xe8\xab\xfb\xca\xe5\xab\x6c\x31\xb4\
-\x4a\x9e\x7d\x69\x7b\x77\x99\x5c\x46\x07\xf5\xf7\x04\x79\x48\xa4\
-\xfa\xa9\x36\x3f\x0e\xbe\xed\xd1\x6b\x7f\x2a\x61\x99\x87\x74\xbc\
-\x8f\x75\xd9\x3d\xaa\x4c\x9e\xf5\x5d\x5f\x3c\x6d\x91\x07\xbf\xd2\
-\x65\x00\x39\xac\xf4\x9d\xdf\x32\x0f\x68\x8a\x75\xd9\xfe\xce\xf7\
-\xcf\xac\xef\x6e\x23\x9b\x3c\x3c\x26\x4f\x03\x77\x3f\xe6\x88\x4a\
-\xcf\xa8\x3d\xf3\x0f\x6c\xf2\x40\x8e\xcf\xdc\x99\xe5\x3e\x70\x7b\
-\x6c\xf3\x70\x6b\x5a\xeb\xd6\x60\xad\x4d\x1e\x94\x7e\xd1\xf2\x20\
-\x9c\x52\xe6\x49\x64\x00\xa4\xdd\xaa\x4e\x22\x0e\x78\x1d\x02\xc4\
-\x15\x0e\x08\xa6\x94\x08\xa0\xae\x28\x79\x30\x4e\x29\x63\x1e\x40\
-\x99\x44\xbc\x5b\x8b\xa6\x94\x2c\x0f\xea\x24\x5a\x9a\x5f\x5f\x2e\
-\x9e\x52\xf2\x3c\x88\xa6\x94\x4d\x1e\x04\xca\x0b\xf3\xa0\xff\xa0\
-\x18\x5f\xd3\xf6\x0b\x74\xbc\x00\xb1\xf2\x56\x25\x51\xde\xaa\x24\
-\xca\x5b\x95\x5c\xf9\xff\x06\xe9\x70\xc5\x86\x5b\x1f\xc9\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\x46\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x05\xe8\x49\x44\x41\x54\x58\x85\xcd\
-\x96\x4b\x6c\x1b\xc7\x1d\x87\x7f\x33\xb3\x12\xb9\xa6\x28\x32\x92\
-\x76\xf9\x50\xa8\x87\x5d\x59\x8a\x64\x04\x31\x02\xd9\x62\x53\x07\
-\x41\x0b\x54\x71\x50\x96\x29\x10\xc8\x41\x80\x1c\x82\x9c\x72\xee\
-\x21\x40\xd1\x4b\x0f\xcd\x2d\x01\x72\x53\xde\xa7\x0a\x68\x52\x54\
-\x85\x69\x27\xb6\xdb\x40\x49\x5c\xc0\x36\x92\x34\x06\x8a\x75\x24\
-\x18\x05\x92\xa0\x4b\x39\x7a\x50\x54\xb4\x7c\x2c\xb9\x3b\xd3\x03\
-\x77\x57\x4b\x8a\x14\x95\xe4\xd2\x01\xfe\xd8\x27\xe7\xfb\xe6\xb7\
-\xb3\x3b\x04\xfe\x1f\xdb\x3b\x8a\x12\xbf\x9e\xcd\xfe\xe1\x65\x45\
-\xf9\xc9\x8f\xed\x2b\x77\xe6\xcc\xb9\x2b\x8f\x3d\xf6\xe2\x1c\x20\
-\xb7\xbb\xce\xda\xc1\x1f\x5e\x58\xf8\x50\x12\xe2\x29\xa5\xbf\x3f\
-\x3b\xbc\xb3\x73\xf5\x93\x4a\x65\xeb\x87\xc0\x3f\x48\xa7\xe7\x87\
-\x1f\x7c\xf0\x12\xdb\xdd\x3d\x7f\x76\x70\x70\xe6\xdf\xf9\xfc\xa5\
-\x6f\x81\x7a\x47\x01\x17\x6e\x15\x8b\xd3\xe6\xc6\x06\x28\xe7\xd1\
-\xd1\x64\x32\x73\x7f\xb1\xf8\xbd\x25\x3e\x48\xa7\xe7\x13\xa7\x4e\
-\x2d\x97\x56\x57\x65\x6e\x18\x08\x4a\xd2\xd4\xb9\x78\x7c\xba\x55\
-\xc2\x13\xf0\xe0\x3b\x3b\xd3\xe6\xe6\x26\x04\xe7\x00\xe7\x60\x42\
-\x44\x46\xe3\xf1\xcc\xfd\xdf\x7d\x77\x64\x89\x5c\x3a\x3d\x3f\x7c\
-\xea\xd4\x72\xe9\xcb\x2f\x65\x51\xa9\x34\x4e\x72\xde\x90\x48\x24\
-\x9a\x24\xd8\x81\x91\x6f\x6e\x42\xd8\x36\x20\x04\x20\x04\x04\xe7\
-\x60\x9c\x47\x46\xe3\xf1\x4c\x6a\x6f\xaf\xab\x44\x2e\x9d\x9e\x4f\
-\xcd\xcc\x34\xc3\x9d\xbe\x60\xdb\x9e\xc4\x6a\x3e\x9f\x5b\x07\xea\
-\x0c\x00\x7e\x97\xcd\xbe\x4a\x4c\xf3\x97\xe6\xc6\x46\x63\xe4\x3e\
-\xb8\x27\x61\xdb\x5d\x25\x5c\x78\xf9\xce\x9d\x66\xb8\xbf\xd9\x36\
-\x64\xc6\xa6\xc6\xa3\xd1\xf5\x8b\x9b\x9b\x9f\x51\x00\xb8\x7b\xfb\
-\xf6\x5f\xaa\xdb\xdb\x55\x37\xf6\x56\xb8\x2b\xd4\x53\xab\x8d\xfc\
-\x62\x66\xe6\xca\xef\x07\x06\x1e\xe8\x08\xd7\x34\x99\x97\xcb\x20\
-\x9c\x37\x4a\x88\x03\x55\xa1\x54\xbf\xaa\xeb\x37\x00\x08\x06\x00\
-\x7f\xdd\xda\xfa\xcf\x4f\x25\x49\x1b\x8a\x46\xb3\xc4\xb6\xa5\x76\
-\x70\x57\x8c\x59\x56\x64\x34\x91\xc8\xa4\x0c\xc3\x4b\x22\x97\x4e\
-\xcf\xa7\xa6\xa7\x97\xcb\x9a\x26\x8b\x4a\x05\xc4\x6f\x26\x04\x08\
-\xe0\x55\x55\x96\xf5\xd7\x34\xed\xc2\xbb\x7b\x7b\xff\x02\xc0\xfd\
-\xf7\x92\xb7\xa6\xa6\x9e\x9c\x1c\x1e\x5e\x22\xb5\x5a\xb0\x1d\xdc\
-\x5f\xf5\x40\xe0\x9b\x0f\x57\x57\x1f\x7f\x64\x72\x72\x24\x31\x3d\
-\xbd\x5c\xd1\x34\x99\x3b\xb1\x13\x37\x76\x67\x4b\x00\x80\x10\x54\
-\x64\x59\x5f\xd4\xb4\x0b\xef\x1a\xc6\x2d\x00\x96\x77\xad\x55\xe2\
-\x64\x3c\xbe\x44\x6a\xb5\xa0\x07\xe7\x7c\xbf\x43\x67\x9f\x08\x01\
-\x2b\x14\xd2\xa3\x93\x93\x03\x5e\xec\xbe\x11\xb7\xb6\x8a\x2c\xeb\
-\x8b\x77\xee\x34\xc1\xdb\x09\x00\x00\x79\x7d\x6a\xea\xc9\x07\x54\
-\x75\x89\x98\x66\xb0\x69\xe4\x6e\x12\x2e\xc8\xd9\xe7\xa5\x12\x44\
-\xbd\x0e\x61\x59\x80\x6d\x7b\xf7\x11\xd2\xe8\xde\x54\x55\xfd\x8d\
-\xaf\xbe\x3a\x00\xef\x24\xd0\x90\x98\x98\x68\x48\xf8\x93\x00\x00\
-\xce\x61\x1b\x06\x6c\xc3\x00\xaf\x54\x20\xea\x75\x10\x42\xf6\x0b\
-\x68\x3a\xae\x0e\x0d\xe9\x6f\xde\xbb\xd7\x16\x7e\x98\xc0\xbe\x84\
-\xa2\x2c\x11\xd3\x0c\xf2\x6a\x15\xf5\x42\x01\xd6\xee\x2e\xc0\xb9\
-\x07\xa0\x7e\x78\x4b\x55\x15\x45\x7f\x23\x9f\xef\x08\xef\x26\xe0\
-\x49\x1c\x07\x96\xea\x5f\x7f\x1d\xf4\x77\xee\x81\x29\x3d\x28\x41\
-\x29\xcc\xa1\x21\xfd\x35\x5d\x3f\x14\x0e\xb4\x59\x8c\x5a\x5b\xae\
-\x50\x58\xfb\x59\x38\xac\xdd\xd7\xd3\x93\x25\xa6\x29\x75\x82\x53\
-\x4a\x1b\xc5\x18\x4c\x45\xc9\x2f\xea\xfa\xd3\xef\x75\x81\x03\x00\
-\xed\x26\x00\x40\xc4\x54\xb5\x72\xdf\xdc\x1c\x08\xa5\x4d\xa3\xa4\
-\xee\xd6\x39\x4f\x29\x05\x6b\x9c\x17\x23\x3d\x3d\xc5\x6e\xf0\xa3\
-\x25\x30\x3b\x3b\x9f\x1c\x1b\x5b\xde\xbd\x7e\x5d\x86\x33\xe1\xa8\
-\x03\x73\x25\x3c\xb0\x73\x1c\x34\xcd\xfe\x89\x58\xec\x57\x49\xcb\
-\xea\xba\x76\x1c\x2a\x90\x9b\x9d\x9d\x4f\x8c\x8d\x2d\x17\x3f\xfa\
-\x48\xe6\x86\xb1\x3f\x52\x7f\xe4\x3e\x09\x7f\x05\x6a\xb5\xc8\x78\
-\x2c\x96\x49\x10\x72\xf5\x13\xc3\xe8\x28\xd1\x51\xc0\x85\xef\xac\
-\xac\x78\x70\x7f\xe4\xed\xa0\x8c\x52\x30\xc6\x1a\x5b\x4a\x11\xa8\
-\xd7\x23\xe3\x8a\x92\x89\x03\x1d\x25\xda\x0a\xe4\x66\x67\xe7\xe3\
-\x23\x23\xcb\xc5\x95\x15\x99\x97\x4a\xfb\x93\xcc\x11\x60\x4e\x12\
-\xcc\x2f\xe0\x80\xdd\x7d\xf7\x58\xae\xd7\x23\xc7\x55\x35\xa3\x72\
-\xde\x56\xe2\x80\x80\x0b\xdf\x71\x62\x6f\x85\xbb\x8f\x81\x35\x66\
-\xfb\xb7\x52\x6f\xaf\x24\x59\x96\x44\x9d\xd1\x7b\x49\xb8\x69\x30\
-\x86\x63\x96\x15\x39\xae\xaa\x19\xc5\xb6\x0f\x48\xb0\x76\xf0\x82\
-\x13\xbb\x0b\xf7\xcf\x7a\x4a\x88\xfb\xaa\xe9\x8b\xba\xbe\xd0\x2b\
-\xcb\x7f\x4f\x1e\x3b\xf6\x6b\xc9\xb2\x24\xe6\x97\x60\x0c\x92\x23\
-\xc0\x18\x43\xc8\xb2\x22\x27\x54\x35\x33\x68\x59\x4d\x12\xac\x09\
-\x9e\x4a\x2d\x6f\xb7\x81\xb7\x3e\x73\x53\x51\xf4\xd7\xf3\xf9\x0b\
-\xef\x19\xc6\xad\xf7\x8b\x45\x6d\x76\x60\x40\x8b\xcb\x72\xb6\xc7\
-\xb6\x25\x6f\x0e\xf8\xe0\x6e\xf5\x71\x1e\x39\x11\x8b\x65\x06\x6a\
-\x35\x4f\x82\x01\xc0\xe5\x33\x67\x7e\xae\xa6\x52\x17\xb7\x57\x56\
-\x64\xbe\xb7\xd7\xfe\xd3\xea\xbc\x76\xa6\xa2\xe8\x6f\xae\xaf\x37\
-\x7d\xe1\x72\x85\xc2\xda\xd9\x68\x54\x8b\x85\x42\xd9\x1e\xcb\x92\
-\xfc\x50\x7f\x0a\x8c\x52\xf4\xd9\x76\xe4\x44\x2c\x96\x09\x97\xcb\
-\x97\xfe\x59\x2e\x17\x28\x00\x04\x43\xa1\x67\xb7\x3f\xfe\x58\xb6\
-\xf7\xf6\x1a\x71\x38\xd0\xc6\x2e\xf1\xfe\x4c\x98\x9d\x17\x16\xf1\
-\xfc\xdd\xbb\x7f\xfb\xbc\x52\x79\xa6\xde\xd7\x57\xf5\xde\x0a\x57\
-\x42\x92\xd0\xe3\xab\x98\x10\x23\x13\xb1\xd8\x13\x00\x08\x03\x80\
-\x54\xb1\x78\x3b\x19\x0e\x3f\x41\x0c\x63\xb0\xd3\xe8\x6b\xaa\xaa\
-\xbf\xbd\xb1\x71\xe8\xb7\xfd\x62\xa1\xb0\xf6\x70\x34\xaa\x25\x43\
-\xa1\x6c\x40\x08\x6f\x4e\x48\x8c\x81\x49\x12\x24\x49\x02\xe9\xed\
-\xc5\xa7\xd5\xea\xb5\x17\xbe\xf8\xe2\x8f\x65\xc0\x60\x00\x70\xbd\
-\x5a\xdd\x4d\x02\x97\xc7\x87\x86\xce\x93\x52\x69\xb0\x75\x49\xb5\
-\x54\x55\x7f\x7b\x73\xb3\xeb\xc2\x02\x00\x17\xb7\xb6\xd6\x4e\xf7\
-\xf7\x6b\xc3\xe1\x70\x36\xc8\xb9\xe4\x0a\x48\x8c\x81\x05\x02\xb8\
-\x55\x2a\x5d\x5b\xb8\x79\xf3\xb9\x2d\xe0\x5e\xd3\x24\xbc\x61\x9a\
-\xc5\x04\x70\x79\x4c\x51\xce\x53\x57\x82\x52\x58\xf1\xb8\xfe\xce\
-\x11\xe1\x7e\x89\x87\xfa\xfa\xb4\x54\x7f\x7f\x36\xc8\xb9\x44\x19\
-\x03\x0d\x04\x70\xd3\x30\xae\x3d\x75\xe3\xc6\x73\xdb\xc0\x3a\x00\
-\xd1\xf6\xc7\xbf\x8d\x44\xc6\xdf\x1f\x1d\x5d\xbb\x12\x0c\x8a\xcb\
-\x63\x63\xff\x5d\xe8\xeb\x7b\x04\x80\x74\x14\x70\x4b\x23\x6f\x4d\
-\x4d\xfd\xe6\x9b\x73\xe7\x2a\xc5\x47\x1f\x15\xff\x98\x9b\xbb\x3a\
-\x08\x24\xd1\xfd\x2f\x00\xf0\x62\x24\x32\xf6\xa7\x89\x89\x57\x9e\
-\x0e\x87\xcf\xfe\x40\xb8\x27\xb1\x78\xf2\xe4\xe3\x7f\x3e\x7d\xfa\
-\xa5\x21\x20\x71\x24\xb8\xaf\xd1\xef\xfb\x83\x43\x5a\xc7\x35\xe7\
-\x7f\x57\x68\x41\xbf\xe5\x9d\x84\xad\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x01\xd2\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x01\x74\x49\x44\x41\x54\x68\x81\xed\
-\xd8\x31\x4b\x1c\x41\x18\xc6\xf1\x9f\x9e\x29\x04\x41\x24\x07\x81\
-\x14\x16\x49\x15\x45\xb0\x0d\x49\x93\xd2\x26\x18\xb4\xb0\xcc\x17\
-\x08\x58\x06\x52\xdb\x5f\x21\xe9\x2c\x05\x2b\x09\x08\x7e\x81\x54\
-\x49\x48\x65\x97\x10\x09\xa6\xf0\x0b\x04\x0b\x0b\x2f\xc5\xad\x97\
-\xe5\x6e\x6f\xef\x6e\xee\xc6\x65\x71\xfe\xb0\xcc\xee\xce\x3e\xfb\
-\xbe\x0f\x3b\xf3\xee\xce\x92\x48\x24\x12\x89\x44\x8d\x99\xe9\x39\
-\x6e\x57\x92\xc5\xf8\x74\xf3\x9e\xad\x32\x8b\x69\x50\x7b\x03\x73\
-\x25\x7d\xbd\xc3\xab\x6a\x0a\x87\x77\xed\x9f\x40\x32\x50\x35\xf7\
-\xde\x40\x03\xef\xd0\xc2\x5a\x80\xfe\x75\xa6\x7d\x33\x61\x1e\x5d\
-\xda\xb9\xad\x8c\x06\xb6\xf0\x2d\x77\xfd\xe6\x18\x71\x9e\xe3\x38\
-\xa7\x6d\x85\xe6\x56\x56\x46\x07\xd1\xc4\x77\x2c\x07\x68\xe1\x14\
-\x1b\x81\xda\x3e\x42\x86\xd0\x82\x4e\xf2\x6d\xfc\x0c\xd0\xaf\x64\
-\xed\x8f\x00\x6d\x1f\x21\x06\xfe\xe2\x3d\x9e\xe1\x63\xc9\x75\xab\
-\x38\xc0\x07\xcc\xe7\xce\xef\xe3\x05\x76\x02\x62\x0f\x65\xd4\x39\
-\x70\xcb\xae\xc1\x73\xe0\x24\xd7\xb7\x5d\xa0\x5d\x37\x85\x39\x10\
-\xb3\x8c\x1e\xe1\x1a\xbf\xf1\x35\x56\x90\x98\x06\x0e\xb1\x84\x27\
-\xb8\x88\x15\x24\xa4\x0a\x8d\xc3\x55\xe4\xfb\xa7\x37\x71\x19\x0d\
-\xbc\xc4\xa3\x88\x31\xa2\x1a\xd8\xc3\x67\xfc\xd1\xa9\x38\x51\x88\
-\x69\xe0\x61\xd6\x3e\xc0\xe3\x58\x41\xca\x16\xf5\xa3\xac\xc8\x9e\
-\xfa\xff\x11\xf7\x05\x97\xb9\xbe\x26\xde\xe2\x1c\x9f\x70\xd3\xa3\
-\x5d\xc4\xab\x6c\xff\x17\xce\x86\xc4\x2a\xcc\x6d\x52\x03\x77\x49\
-\x61\x6e\xa9\x0a\x55\x4d\x32\x50\x35\x65\x9f\x12\xb5\xf8\xcd\x58\
-\xfb\x27\x50\x7b\x03\x89\x44\x22\x91\x48\xd4\x9a\x7f\x1d\xd4\x3e\
-\x75\x59\x6e\xec\x6d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x01\xd5\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x01\x77\x49\x44\x41\x54\x58\x85\xe5\
-\x96\xbd\x4a\x03\x41\x14\x85\xbf\x33\xb3\x16\x0a\x36\x8a\x88\x8a\
-\x60\x7a\xc5\x4a\x48\x67\x21\x16\x56\x82\x95\x48\xde\xc2\x17\xb0\
-\x16\x0b\x1f\xc0\xc6\xc2\xc2\xc6\xd2\x37\x10\xc1\x4e\x04\xed\x8c\
-\x8d\x12\x51\x44\xb0\x0c\x9b\x6b\x93\xc4\x08\x46\x33\xb3\x63\xf0\
-\xe7\x83\x65\x07\x96\x7b\xce\xd9\x3b\x3f\x0c\xfc\x77\xd4\x7c\x8f\
-\x02\x59\x02\xbd\x27\xa0\x1e\x96\xc0\x73\xe0\x32\x2c\xc5\x23\xcf\
-\x2d\x30\x15\xe2\xef\x80\xf5\xa0\xc4\x9f\xfd\x8c\x98\xc4\xb1\x18\
-\x52\x93\x49\x38\x00\x33\xea\xc0\x55\xa4\xf7\x84\xc4\x58\x73\xec\
-\x82\x2a\x3b\xda\x57\x8b\x34\x47\x9e\xed\x96\x0e\x8e\x4a\x90\x7f\
-\xac\x69\x2a\xbe\x3b\x80\x80\x32\xb4\xa7\xa7\xbf\x01\xe4\xd9\x72\
-\x19\xa7\xf2\x5c\x00\xc3\x7d\x0f\x80\x51\x06\x90\x18\x07\x66\xfa\
-\x1f\xe0\xed\xa0\xeb\xca\x9f\x5f\x84\x5f\xd2\x79\xfe\x0f\xe1\xd8\
-\x8c\x52\x11\x0b\x81\x15\x13\x38\xd6\x68\x70\xdc\x0e\x20\x31\x2c\
-\xb1\x13\x15\x20\x10\x79\x8e\x24\xca\x26\xae\x9d\x19\xd5\x64\xca\
-\x86\xd1\xe8\x49\xaf\x04\x20\x51\xca\x2c\x67\xc9\x1c\xab\x80\x2f\
-\x1c\x40\x5c\x02\x27\x21\x25\x19\x50\xa5\xc1\x6e\x61\xf3\x48\x7e\
-\xd4\x2e\x78\x8f\xa3\x22\xb1\x4c\x0f\x87\xc9\x27\xcc\xc6\x06\x98\
-\x96\xd8\x6f\xdd\x15\xbe\x93\x6e\x06\xcf\xc0\x43\x2a\x13\x33\xee\
-\x81\x9b\x8f\xbe\x75\xeb\xc0\x8b\xe5\xcc\x99\x67\x9e\x62\x53\x00\
-\x60\xe4\x9c\x03\x2f\x05\x75\xd2\x21\x4f\xad\x79\x83\x6a\xfc\xe0\
-\x5d\xf0\x31\x83\xf2\xec\xd1\xc3\xea\xfe\x82\x91\xb8\x00\x9e\x15\
-\x89\x8d\x82\xe6\x6d\xcc\x42\xa7\x20\xe7\xcc\x8c\xbb\x54\x01\x80\
-\xc3\x98\x15\x3e\x40\x47\x0b\x0b\x90\x03\x8f\x09\x74\x7e\x39\xaf\
-\x34\x13\x57\xd5\xda\xf0\x32\xa3\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x09\x92\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\x62\x4b\x47\
-\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\x70\
-\x48\x59\x73\x00\x01\x3a\xf6\x00\x01\x3a\xf6\x01\x3a\xb1\x57\x3a\
-\x00\x00\x06\xfc\x49\x44\x41\x54\x58\xc3\xc5\x97\x7b\x70\x55\x57\
-\x15\xc6\x7f\x7b\x9f\x93\x84\x7b\xf2\xe2\x11\xa4\x15\x85\x56\x51\
-\x11\x2a\x12\x03\x09\x20\x45\x5a\x10\x48\x79\x34\x20\x16\x98\xa1\
-\xbc\x5a\x41\xac\xfd\xc3\xf1\xdf\xce\xd4\x71\xa6\x33\x75\x1c\xa7\
-\x6a\xb5\x53\xb5\x53\x2d\x8f\x50\x1a\x1e\xa5\xa4\x24\xbc\x6c\xc2\
-\x3b\x91\xf0\x88\x90\x40\x80\x80\x90\x10\xca\x3b\x37\xf7\x91\x9b\
-\x73\xce\x5e\xfe\x71\x6f\xaf\x86\x06\x72\xa7\x9d\xd1\x35\x73\x66\
-\xee\xd9\xe7\xce\xfe\xbe\xf3\xad\x6f\xad\xbd\x0e\xfc\x9f\x43\x2d\
-\x5c\xbe\x12\x94\xb2\x11\x99\xe3\x79\xde\x93\xbe\x11\x85\x08\x96\
-\xa5\xf1\x7c\x1f\xcf\xf3\x10\x01\x11\x83\xd2\x1a\x11\xc1\x73\x5d\
-\xcc\x27\x6b\x4a\xa1\x95\xa6\xcb\x75\x31\xc6\x00\x22\xda\xb2\x76\
-\x29\xd4\x87\x9e\xef\xf9\x18\xb2\x7c\x64\xa1\x8f\x14\x60\xa4\x4d\
-\x8b\xac\x03\x9a\x95\x08\x87\xf6\x56\xa0\x16\xad\x58\x85\x88\x3c\
-\x65\xdb\xf6\xda\xc7\x46\x0c\xef\x9f\x37\xa0\x3f\xe1\x48\x94\xda\
-\xba\xe3\x3c\x32\xe4\x4b\x7c\x79\xf0\x60\x44\x04\x11\xe1\x9f\x0d\
-\x8d\x20\x30\xf2\x9b\xdf\x40\x44\x40\x29\x2e\x5e\xfa\x17\xe7\x2f\
-\x5e\x62\xfc\xd8\x31\x04\x02\x7d\x68\xbb\xf6\x31\x75\x27\xea\x6f\
-\x75\xb9\xee\x22\xf1\xcd\x01\xa3\x78\x35\xcb\xf8\xab\x87\x79\x6e\
-\x5a\xab\xd2\x5c\x55\xea\xb0\x32\xf2\x63\x94\xaa\xc7\xf8\xd8\x88\
-\xe0\xfb\xfe\xf4\x51\x23\x47\xf4\x7f\x71\xd5\xf3\x38\x81\x00\x37\
-\x6e\xdd\xe2\x74\xe3\x19\x26\x8e\x2b\x62\xc6\xd4\x27\x93\x72\xbd\
-\xfe\xa7\xb7\x00\x78\xe1\x47\x2b\x92\x6b\xdb\x2b\x76\x72\xed\xfa\
-\x75\x96\x2f\x5e\xc8\xa0\x81\x03\x09\x87\x23\xfc\xe2\xd5\x5f\x0f\
-\x38\x5c\x7b\x74\x3e\xda\x2a\x76\x8c\xff\x93\x45\x9d\x61\x7b\x4c\
-\x57\x27\x57\x94\xe6\xaf\x19\xce\xf8\x66\x6d\xbf\xa9\x8d\xff\x2c\
-\x70\x41\x1b\x11\x8c\x88\x3d\x70\x60\x1e\x4e\x20\x00\xc0\xa9\x86\
-\x46\xee\xde\x6d\xe7\xdc\x85\x66\x5c\xd7\x03\xa0\xb5\xad\x8d\xc6\
-\xa6\x73\x34\x9c\x6d\xa2\xf5\x6a\x1b\x00\xae\xeb\xd2\xd8\x74\x8e\
-\xdb\x77\xda\x39\xd5\x70\x06\x80\xcc\x4c\x87\x2f\x3e\xfc\x10\x22\
-\x2c\xc8\xcc\x30\x2f\x58\x69\x62\x07\x51\x88\x08\x5f\xe8\x8a\x31\
-\x37\xd4\xce\x20\xcf\x1d\xef\xc1\x22\x01\xb4\x28\x05\x22\xdd\x8c\
-\xd1\x7c\xe9\x32\xa1\x70\x84\xb3\xe7\x2f\x10\x8e\x84\x01\xb8\x74\
-\xf9\x0a\x57\x5a\x5a\xb9\xdc\xd2\xca\xc5\xcb\x57\x00\x08\x85\xc3\
-\x9c\x69\x3a\x4f\x28\x14\xa2\xe9\x42\x33\x00\x91\x68\x94\x8f\xaf\
-\xdf\x24\x37\x53\x72\x7f\x36\x27\x98\xbe\x74\x7a\x88\x72\x27\x40\
-\xa5\x95\x41\x87\x31\x3c\xec\xb9\x0c\xf2\x5d\x8c\xf0\x90\x42\xc5\
-\x53\x20\x10\xcf\x69\x22\xa6\x4c\x9a\x88\x56\x8a\xaf\x0f\xfb\x2a\
-\xb9\x39\x39\x00\x8c\x1a\x39\x82\xc5\x0b\xe6\x03\x8a\x6f\x3f\x36\
-\x02\x80\xbe\xb9\xb9\x2c\x59\xf4\x0c\x8d\x67\xcf\x31\x63\xca\x13\
-\x74\xc6\x62\xbc\xb5\xa6\x94\x86\xd3\x47\xf9\xe9\xcc\x10\x53\x47\
-\x47\xd9\xb8\x2f\x80\x67\x09\x15\x59\x01\x62\xc6\x27\xc3\xf8\x9c\
-\xb7\xd3\x5d\x0d\x47\x8d\x08\xb6\x24\x08\xfc\x77\x3c\x32\x74\x08\
-\xcb\x87\x0e\xe9\xb6\x96\x9d\x95\xc5\x82\x79\x25\xdd\x4b\x48\x29\
-\x26\x4f\x9c\xc0\xe4\x89\x13\x88\x76\x76\xf2\x97\x77\xd6\xb3\x6b\
-\x77\x39\x2b\xa7\xdd\xe5\xfb\xf9\x51\xca\xf6\x3b\x94\x56\x07\x58\
-\xf8\xdd\x20\x46\x84\xf7\xaa\xb2\xe8\x72\xc5\x8b\xa2\xde\xd0\x22\
-\x65\xf1\x14\x24\x1c\xfe\x79\xa2\xb3\x33\xc6\xdb\xeb\xde\xa5\x72\
-\x57\x39\xcf\x4f\x6d\xa7\xb8\x20\xca\xa6\x83\x0e\xeb\xaa\x1c\xe6\
-\x16\x05\x99\x55\xd0\x41\x20\xcd\xe0\x6a\xbc\x28\xea\x8f\x0a\x5e\
-\x42\xa9\x70\x5d\xf5\x6e\xb4\x8a\x17\xf9\xa7\x7c\x90\x6a\xc4\x62\
-\x31\xfe\x56\xba\x91\x8a\xca\xed\x3c\x37\xb5\x9d\x99\x63\x23\x49\
-\xf0\x79\x45\x41\x9e\xfa\x4e\x07\xbb\x4f\x3a\xbc\x53\x95\xe3\x45\
-\x62\xea\x0f\x5a\xf1\x92\x52\x84\x8e\x56\xed\x02\xc0\x06\x40\xe0\
-\xb3\xc0\x77\x75\x75\xb1\xe6\xdd\x4d\x7c\x58\xb9\x9d\xe5\x53\xda\
-\x99\x5d\x18\x61\xf3\x01\x87\xf5\x55\x0e\xf3\x8a\xda\x29\xce\xef\
-\x60\xd7\x89\x4c\xd6\x54\xe5\x78\xc1\xa8\xfa\xbd\xad\xcc\xcb\x82\
-\x0a\xd5\x7e\xb4\x33\xb9\x87\x36\x4a\x21\x9f\x01\xde\x75\x5d\xd6\
-\x97\x6d\xa5\x7c\xc7\x36\x96\x3d\x71\x87\xd9\x45\x11\x36\x1f\x74\
-\x58\x5f\x9d\xc9\xdc\xa2\x20\xc5\xf9\x21\x76\x9e\xc8\x64\x4d\x75\
-\xae\xd7\xd1\xa9\x7f\x67\x69\x79\x59\x94\xee\x06\x0e\xc4\x4d\x18\
-\x57\x21\x75\x12\x9e\xe7\xb1\x61\xf3\x36\x3e\x28\xdf\xc2\xd2\xc9\
-\x77\x98\x55\x14\x65\xcb\x41\x87\xf5\xd5\x01\xe6\x16\x06\x99\x91\
-\x1f\xa2\xf2\x78\x26\x6b\xab\xb3\xdd\x70\x4c\xfd\xd6\xd2\xf2\x4b\
-\x50\xa1\x9a\xbd\x95\x9f\xda\x2b\x5e\x86\x92\xba\x06\x9e\xef\xb3\
-\x71\xeb\x76\xde\xff\x60\x33\xcf\x4e\xba\xcd\xac\xa2\x28\x5b\x0f\
-\x05\x28\xad\x76\xe2\xe0\xa3\xe3\xe0\xeb\xf6\x65\xbb\x91\x18\xbf\
-\xb1\x94\xbc\x22\xa8\x50\xcd\xde\x8a\x1e\xf7\x8b\x97\x61\x8a\xe8\
-\xbe\xef\xb3\x69\x5b\x39\x5b\xb7\x95\xb1\x78\xd2\x2d\x66\x17\x46\
-\xd9\x72\x28\x40\x69\x75\x80\xb9\x45\x41\xa6\x8f\xee\xa0\xf2\x98\
-\xc3\xda\xea\x6c\xa2\x5d\x6a\x87\xd6\xf2\x0a\xa8\x50\xcd\x9e\x8a\
-\xfb\xee\x19\x2f\x43\x7a\x2f\x45\xdf\xf7\xd9\xb2\x7d\x07\xa5\xef\
-\x95\x31\xab\xe0\x76\x02\xdc\xa1\x74\x9f\x43\x49\x61\x07\xd3\x47\
-\x87\xa8\x38\xe6\x50\x76\x24\x8f\x8c\x3e\x39\x80\xb9\xaa\x95\x0a\
-\x1d\x79\x00\x78\x5c\x81\x1e\x5a\x71\x4f\x71\xe0\x48\x2d\x6b\x36\
-\x6c\x24\x12\x8d\x72\xbc\x39\x9d\x68\xa7\x62\xf7\xc9\x74\x4a\xc6\
-\x06\x93\xe0\x9b\x6a\x06\x50\x32\x67\x1e\x2d\xad\xad\x54\xec\xf9\
-\x3b\x3a\x5d\xf5\xba\xaf\x86\xde\x4b\xd0\xf5\x3c\xf6\x56\xef\x67\
-\xd8\x57\x1e\x65\xd5\x8a\xa5\xdc\x88\x0e\x66\xc3\xbe\x0c\x1e\x1f\
-\x1e\x89\xe7\xfc\x98\xc3\xe6\xda\x3c\xe6\x3d\x3d\x9f\x1f\x3e\x3d\
-\x93\x8c\x8c\x74\x8c\x11\x44\x7a\x27\x60\x2b\x63\x7a\x65\x70\xa1\
-\xf9\x22\x67\x9a\xce\xb1\x72\xf9\x12\xa6\x7e\xef\x71\x32\xd2\xd3\
-\x29\x2d\xdb\xc2\xe9\x96\x16\xd6\xef\xcb\xa6\xaa\xb1\x1f\xf3\x4b\
-\xe6\x53\x32\x73\x3a\x69\x69\x69\x09\x41\x53\x33\xb6\x9d\x8a\x07\
-\x0e\x1c\xa9\xa5\x6f\x6e\x0e\xa3\x46\x8e\x20\x18\x0c\x32\xae\x20\
-\x9f\xdc\x9c\x6c\x5e\x7b\xe3\xcf\x5c\xaa\x8f\xb0\xf8\x99\x1f\x30\
-\xa7\x78\x1a\xb6\x6d\xa3\x54\xfc\xad\x45\x04\x31\xbd\x53\xb0\x4d\
-\x2f\x6d\xf8\xf6\x9d\x3b\xd4\xd4\x1d\x63\xe2\xb8\x42\x02\x7d\x32\
-\xb8\xd2\xd2\xc2\xc9\x53\x0d\xd4\xd6\x1d\x47\x8c\x61\xc9\x82\xf9\
-\xcc\x2a\x9e\x86\x6d\x59\x28\xa5\x92\x04\x40\x50\x29\x78\xcb\x4e\
-\xb2\xbd\xcf\x9f\xeb\x4e\xd4\x73\xe3\xc6\x4d\x2c\xcb\xe2\xed\xb5\
-\xa5\x1c\x3d\x7e\x92\x8e\x50\x88\xe1\x5f\x1b\xc6\xea\xe7\x96\x51\
-\x54\x90\xdf\x0d\x3c\x7e\x25\xde\x49\x99\x14\x52\xa0\xd4\x7d\x73\
-\xe5\xba\x2e\xfb\x0f\xd7\xd0\x1e\xec\x60\xe3\xe6\xf7\xc9\x1b\xd0\
-\x9f\xf1\x85\x63\x18\x33\x7a\x14\x8f\x0e\x1d\x4a\x46\x46\x3a\xc0\
-\x3d\xe0\x89\x14\xc4\x35\x48\xd5\x03\x3d\xfb\xb0\x33\x16\xc3\xf8\
-\x3e\x13\x0a\xc7\x50\x58\x90\xcf\xb7\x46\x0c\xa7\x5f\xdf\xbe\x68\
-\xad\x12\x07\xa8\xa0\xb5\xee\x06\xae\xb5\x86\xc4\x08\x96\x4a\x83\
-\xb3\x1f\x74\x14\x67\x67\x65\xf1\xf3\x17\x57\xe3\xba\x2e\x69\xb6\
-\x9d\x5c\x8f\x0f\xc4\xaa\x47\xf0\xa4\x07\x52\x9c\x33\xec\xde\xe6\
-\x81\x7e\x7d\xfb\xe2\xba\x2e\x91\x48\x04\xdf\xf7\x93\x20\xf7\x03\
-\x8f\x2b\x40\xca\x0a\x68\x93\xc2\x41\x94\x96\x96\x46\x66\x66\x66\
-\xb2\xcc\xee\x25\x71\x2f\x99\xff\x88\xd0\xbb\x09\xb5\xc8\x27\x72\
-\xf5\x22\x95\x6d\xe3\x38\x4e\x37\x12\x40\x37\x70\xad\x75\x7c\x3d\
-\x31\x63\x28\x95\x52\x19\x2a\x40\x79\x6d\xd7\xae\x11\x8e\x44\xc8\
-\x74\x9c\x07\x92\xd0\x5a\xe3\x76\x75\x21\xd0\xa3\xfc\xa1\x50\x98\
-\x96\xd6\xab\x28\x54\x34\xa5\x56\x8c\x12\x2c\xcb\xaa\xa8\x6f\x68\
-\x5c\xfc\xab\xd7\x5e\xef\x3f\x30\x6f\x40\xbc\x8f\x23\x49\x65\x92\
-\x9d\x32\xf1\xdb\xf7\x7d\x8c\x6f\xee\x49\x9d\xa0\x94\xa2\xb5\xed\
-\x1a\x75\x27\xea\x6f\x5a\x96\x55\x91\x92\x09\x13\xa5\xb4\xc7\x75\
-\xdd\x65\x87\x6a\xfe\x31\xd5\x37\xc6\x96\xf8\xd7\x12\x88\x49\x1c\
-\x2a\xf1\xcb\x88\x20\xc6\xc4\x09\x99\xc4\xbd\x08\x22\x26\xf1\x4c\
-\x00\x5c\xcb\xb2\x2a\xb5\xd6\x1f\x7d\xde\x69\xfb\x7f\x12\xff\x06\
-\x15\x36\xca\x31\xc9\x7e\x86\x67\x00\x00\x00\x25\x74\x45\x58\x74\
-\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x38\
-\x2d\x31\x30\x2d\x31\x31\x54\x31\x37\x3a\x34\x34\x3a\x33\x37\x2b\
-\x30\x32\x3a\x30\x30\x37\xfc\xdd\x6b\x00\x00\x00\x25\x74\x45\x58\
-\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\
-\x38\x2d\x31\x30\x2d\x31\x31\x54\x31\x37\x3a\x34\x34\x3a\x33\x37\
-\x2b\x30\x32\x3a\x30\x30\x46\xa1\x65\xd7\x00\x00\x00\x46\x74\x45\
-\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\x61\x67\x65\
-\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x37\x2e\x38\x2d\x39\x20\x32\
-\x30\x31\x36\x2d\x30\x36\x2d\x31\x36\x20\x51\x31\x36\x20\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\x67\x65\x6d\x61\
-\x67\x69\x63\x6b\x2e\x6f\x72\x67\xe6\xbf\x34\xb6\x00\x00\x00\x18\
-\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\
-\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\
-\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\
-\x6d\x61\x67\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\x00\x35\x31\x32\
-\xc0\xd0\x50\x51\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\
-\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\
-\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\
-\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\
-\x00\x31\x35\x33\x39\x32\x37\x32\x36\x37\x37\xa0\xdc\xcb\xd0\x00\
-\x00\x00\x13\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\
-\x7a\x65\x00\x33\x34\x2e\x33\x4b\x42\x42\x8c\xd6\x36\x68\x00\x00\
-\x00\x5b\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\
-\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\
-\x73\x2f\x35\x36\x2f\x49\x55\x78\x46\x79\x50\x73\x2f\x31\x36\x30\
-\x33\x2f\x6e\x6f\x74\x65\x2d\x74\x61\x73\x6b\x2d\x63\x6f\x6d\x6d\
-\x65\x6e\x74\x2d\x6d\x65\x73\x73\x61\x67\x65\x2d\x65\x64\x69\x74\
-\x2d\x77\x72\x69\x74\x65\x5f\x31\x30\x38\x36\x31\x33\x2e\x70\x6e\
-\x67\x9a\x67\xcf\x85\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x08\xca\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
-\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
-\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\
-\x2b\x0e\x1b\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe5\x09\x03\x06\
-\x21\x37\xa5\x57\x21\x50\x00\x00\x06\x53\x49\x44\x41\x54\x58\xc3\
-\xad\x96\x5f\x50\x53\x57\x1e\xc7\xbf\xf7\x5f\xfe\x0b\x49\x88\x24\
-\x81\x20\x44\x0c\x95\x3f\x5a\xa4\x88\x2c\xc5\x71\x94\x3a\x38\x2d\
-\x1d\xc7\xa9\xba\xb3\x7d\xb2\x75\x76\x1f\xf6\x65\x67\x76\x76\xd6\
-\xed\xeb\x3e\xec\xf4\xb1\xef\xfb\xd2\x99\x76\xda\xed\x4c\x8b\xe3\
-\xcc\x4e\x45\xa7\x45\x67\x51\x46\x5a\x0c\x18\x0c\x42\xd0\x40\x40\
-\x82\xb9\x24\x21\xe4\x86\xe4\x26\x37\xf7\x9c\x7d\xb0\xc4\xb2\x10\
-\x8c\x59\xbf\x8f\xc9\xf9\xfd\xce\xe7\x7c\xcf\x3d\xe7\x7c\x99\xbe\
-\xbe\xbe\xf7\x1a\x1b\x1b\x8f\x08\x82\xc0\xa2\x7c\x31\xa1\x50\x28\
-\xfe\xc8\xe7\xff\x97\xc1\x64\x5c\x9d\x9a\x7e\x58\x72\x21\x7f\xfc\
-\xf8\xf1\x7f\x5e\xba\x74\xc9\xa9\xd1\x68\x76\x1d\x48\x29\xdd\xf5\
-\xff\xaf\x06\xbf\x51\x59\x9b\xae\x75\x7a\x68\xfc\x93\x8e\xc3\xed\
-\x6b\x5e\xdf\x64\x69\x00\x56\xab\xd5\x59\x5f\x5f\x0f\x55\x55\x91\
-\xcb\xe5\x8a\x0e\x14\x04\x01\x3c\xcf\x17\xa3\x43\xcd\xfe\x3a\xae\
-\xf3\x8d\x53\xbf\x57\xf5\x0c\x1b\xf8\xf6\xa7\x2b\x47\x0e\xb5\xaf\
-\x4d\x4c\xbd\x1c\xa2\xd0\x31\x12\x89\xc0\xef\xf7\x17\x5d\x69\x73\
-\x73\x33\xea\xea\xea\x76\x75\xc8\x72\xc0\xc1\x36\x5e\x38\x7a\x99\
-\x50\x8a\x27\x83\xe3\x57\x4a\x71\xa2\x00\xe0\x74\x3a\xe1\x74\x3a\
-\x4b\xb2\xad\x28\x04\xa1\xa8\xdc\x5f\xcd\x1e\xb8\x70\xf4\x32\x00\
-\x3c\x19\x1c\xff\x5b\xc7\xe1\xf6\xf8\x6e\x10\x05\x00\x42\x08\xb2\
-\xd9\xec\x4b\xf7\x7a\x53\x0c\xc3\x40\xa7\xd3\x81\x65\x37\xbf\x5d\
-\x0a\x86\x65\x00\x00\x95\x1e\x3b\xeb\xf9\x6d\xd7\x65\x86\x63\x99\
-\xc5\xeb\xbe\x2b\x9d\x47\x3b\xe3\xb2\x9c\x07\x21\xd4\x5e\x6d\xd5\
-\xbe\x93\x53\x68\x38\xb0\x94\x1e\x31\xe9\xb9\x7c\x01\x40\x14\x45\
-\x78\xbd\xde\x92\x00\x28\xa5\x10\x04\x01\xc7\x8e\x1d\x83\xc5\x62\
-\x01\x18\x06\x1a\xc2\x23\xec\x9b\x47\xda\x4c\x41\x28\x01\xc3\xb2\
-\xec\xde\xb7\xea\x3f\x96\x42\x51\x1a\x9f\x0e\xff\xc5\x1f\x5c\x91\
-\xff\xf4\x87\x13\xff\x38\x77\xb2\xe6\xe3\xa5\xa7\x91\xb5\x2f\x87\
-\x56\x3e\xaa\xaa\x14\xae\x15\x00\x1c\x0e\x07\xce\x9c\x39\xf3\x4a\
-\x96\xbf\x58\x3d\xd0\xd7\x73\x02\x7b\x26\x4c\xc8\x65\x15\x80\x01\
-\x40\x81\x5c\xf5\x7e\x36\xd0\x6b\xf9\x70\x28\x71\xfd\xf3\x3d\x89\
-\xec\x7c\xe3\x3e\xf3\xc9\x13\x3d\xfb\xf1\x74\x5e\xb5\xdc\xb8\x17\
-\xed\xfb\xe2\xef\xad\xd7\xb6\x6d\x41\xb9\xd2\x1b\x0c\xe8\x3b\x71\
-\x12\x82\x20\x14\x5c\x92\x65\x19\x16\x5d\x05\x7b\xeb\x87\x61\x4e\
-\xaf\xe3\x99\x48\x74\x83\x9b\x98\x12\xb1\x1a\x91\x90\xdc\xc8\xbb\
-\x0e\xff\x6e\xec\x58\x01\x60\x79\x79\x19\xb7\x6f\xdf\x06\x21\xa4\
-\x2c\x00\x4a\x29\xaa\xaa\xaa\xd0\xdf\xdf\x0f\xad\x56\x5b\x58\xd4\
-\x66\x3f\x0d\x2b\x23\x91\xdb\x8b\x39\xa9\x1d\x61\xc9\x81\x74\x7e\
-\xd5\xc4\x73\xf2\xf9\x02\x80\xcb\xe5\xc2\xc5\x8b\x17\xcb\x76\x80\
-\x52\x0a\x96\x65\x0b\x93\xff\xaf\x52\x29\x09\x0d\xee\x46\x9c\xee\
-\x7f\x0f\xfe\xd9\x59\xdc\xbd\x3b\x36\xb3\x2a\xae\xde\x2b\x00\xb0\
-\x2c\x0b\x9d\x4e\x57\xb4\xb9\xa2\x28\x20\x84\x80\xe7\xf9\xe2\x17\
-\xd2\x2e\x62\x18\x06\x94\x52\xa8\x44\x05\x51\x55\xd0\xe7\x3f\xa2\
-\xa4\x4e\xb3\xb3\xb3\xb8\x71\xf3\x26\x38\x8e\x83\xc9\x68\xc2\x85\
-\x0b\xe7\x61\x34\x1a\xcb\x76\xeb\xd7\x2a\x0a\x10\x0c\x06\x11\x0c\
-\x06\xe1\x76\xbb\x31\x36\x36\x86\xa6\xe6\x16\xd8\x1d\x0e\x3c\x98\
-\x98\xc0\xe8\xe8\x28\x5c\x2e\x17\x9e\x2e\x2f\xe3\x37\xdd\xdd\x30\
-\x99\x4c\xaf\x17\x20\x10\x08\xe0\xfb\xa1\x21\xec\xad\xb6\x63\x26\
-\x30\x07\x47\x4d\x0d\xaa\xed\x76\x10\x42\xf0\xc6\xc1\x83\xb8\x37\
-\x36\x86\x7b\xe3\x5e\xb0\x3c\x87\x70\x38\x8c\xf3\x1f\x7c\x50\xb6\
-\x23\xdb\x00\x54\x55\xc5\xf0\xad\x5b\x68\x69\x3b\x84\xfa\x86\x06\
-\xc4\xa2\x51\xcc\x05\x02\xf0\x3f\x98\x84\x4e\xa7\x43\x52\x4a\x41\
-\xd0\x68\xd0\x78\xb0\x0e\x1a\x8d\x06\x8f\x1e\x3e\xc4\xe8\xe8\x28\
-\x4e\x9f\x3e\xfd\x6a\x33\x53\xca\x66\x65\xf9\xfe\x36\x00\x8e\xe3\
-\x50\xbf\x6f\x1f\x32\x99\x0c\xa2\xab\xab\x78\x30\xe1\x45\x77\x57\
-\x17\x5a\x5a\x5a\xa0\xd1\x68\x90\x4c\x26\x71\xe7\xce\x1d\xf8\x1e\
-\xcd\xa0\xe1\x80\x07\x1a\x81\x87\xdb\xed\x2e\x67\xf1\xcc\xdd\x9f\
-\xef\x2f\x6c\x01\xa0\x94\x42\x14\x45\x44\x22\x22\xf6\x3a\x1d\x98\
-\x99\x9e\xc6\x3b\xa7\x4e\xa1\xa9\xa9\xa9\x30\xc6\x6c\x36\x63\x60\
-\x60\x00\x79\x55\xc5\x5c\x68\x11\x84\x50\x3c\x7e\xfc\x18\x4e\xa7\
-\xb3\xac\x6d\xd8\x92\x82\xe2\xf1\x38\xbe\xfa\xfa\x6b\x98\x6d\x36\
-\xe8\x0d\x46\x18\xf4\x3a\x78\x3c\x9e\x1d\x0b\x8f\x76\x76\x22\x97\
-\x49\x43\x57\x51\x81\xc1\xa1\x9b\xf8\xf6\xbb\xc1\x72\x5c\xd8\x0a\
-\x20\xcb\x32\x2c\xd6\x2a\xb4\xb4\xb6\x22\xb9\x9e\xc0\x1e\x93\x09\
-\x0c\xc3\xec\x58\x68\xd0\xeb\xa1\x15\x34\x90\x73\x0a\xac\xd5\x76\
-\xa4\x32\x99\x92\x5f\xd2\xa2\x00\x1c\xc7\x21\x16\x8b\x41\x14\x23\
-\x30\x1a\x4d\xc8\xc8\xf2\x8e\x45\xf9\x7c\x1e\x99\x4c\x06\xa9\x74\
-\x1a\xe9\x4c\x06\xd2\x7a\x02\x0c\xa5\x45\x61\x4b\x06\xb0\xd9\x6c\
-\x38\xfe\x76\x0f\x26\x7e\x1e\x47\x22\x99\x44\xf8\xd9\x33\x44\xa3\
-\xd1\x2d\x05\xaa\xaa\x22\x9b\xcd\xc2\x3f\x3d\x8d\xe8\x7a\x12\xeb\
-\xf1\x18\x5a\x1b\xea\xf1\xee\x99\xfe\xff\x7f\x0b\x78\x9e\x47\x57\
-\x57\x17\x9a\x3c\x07\xb0\x10\x0a\x81\xd3\xea\xf1\xdd\xd5\xab\x58\
-\x59\x59\x81\xa2\x28\xc8\x66\xb3\x90\x24\x09\x53\x53\x53\xb8\xfe\
-\xc3\x8f\x30\x54\x9a\x21\x30\x0c\xce\xbe\x3f\x80\x86\x86\x86\xb2\
-\x00\xb6\x1d\x43\x42\x08\xe6\x17\x42\xa8\xa8\x34\xc3\x5a\x65\x43\
-\xe4\x59\x18\x9f\x7f\xf1\x25\xea\x6a\x6b\xa0\xd7\xeb\x11\x11\x45\
-\xcc\x04\xe7\xa1\xab\xa8\x84\xde\x60\x80\xb8\x16\xc7\xa3\x99\x19\
-\xd4\xba\x5c\xaf\x07\x80\x65\x59\x1c\x3a\xd4\x86\xe1\xff\x8c\x80\
-\xa8\x2a\x52\x92\x04\x93\xd9\x02\x51\xda\x80\x14\x7e\x06\x59\x51\
-\x40\x59\x1e\x1b\x92\x84\xac\x2c\xc3\x61\xb5\xa0\xb9\xb9\xb9\xac\
-\xc9\x77\x04\x00\x80\xb7\x7b\x7a\x00\x4a\xf1\xc0\xe7\xc3\x5b\x6d\
-\xad\xf8\xc9\xeb\x85\x94\xa7\xd0\xea\xf5\x48\xc5\x62\x78\xd3\xd3\
-\x08\xbb\xdd\x8e\xd0\xd2\x12\xce\x0e\x0c\xa0\xb6\xb6\xf6\xa5\x13\
-\xd1\x5f\x3e\x52\x8e\x65\x7f\x49\x52\x0c\x58\x8e\x2d\xfe\x18\xf5\
-\xf4\xf4\xa0\xbb\xbb\x1b\x1c\xc7\xc1\x68\x34\xe2\x9b\xab\xd7\xa0\
-\xca\x19\x58\x0c\x7a\x9c\x3b\x7b\x16\x55\x36\x1b\x08\x21\x5b\x62\
-\xd9\x6e\xd2\xeb\x74\xcf\x73\xe7\xe4\x24\x42\x8b\x4b\x90\xe5\x0c\
-\x26\xbd\xde\x17\x00\x94\xd2\x6d\xe7\x78\xf3\x0d\xef\xec\xec\x84\
-\xdb\xed\x06\x21\x04\x5a\xad\x16\x16\xab\xb5\x90\x74\x76\x4a\x50\
-\x3b\x40\x31\x2b\xc0\x7a\xcc\xef\x5f\x4c\xc4\xe3\xfb\xd6\x44\x11\
-\xeb\xa2\xf8\xf8\xd3\x2b\x7f\xc5\x96\x54\xec\xf3\xf9\x76\xbc\x4c\
-\x18\x86\xd9\x72\xc6\x77\x8b\x6d\x1c\xc7\xa1\xa3\xa3\xe3\x79\x5a\
-\xfe\x55\x8b\x3f\xf7\xf6\x6e\xac\xa5\x52\xdf\xb7\x0b\x42\x2f\x38\
-\x6e\x79\x4d\x51\x6e\x28\x84\xbc\x00\xb0\xd9\x6c\xe8\xed\xed\x2d\
-\xc9\xce\x97\x69\x33\x96\x6d\x82\x53\x4a\x71\x3f\x12\x41\x2a\x9d\
-\x1e\xfe\x91\xe7\xd7\x17\x65\xf9\xae\xff\xc9\x93\xc0\x11\x8f\x07\
-\x7c\x2c\x16\x5b\x59\x58\x58\x70\x6e\xa6\xd9\xd7\x25\x4a\x29\xd2\
-\xe9\x34\x82\xc1\xa0\x24\x49\x52\x92\xe3\x38\x44\x15\xc5\xf7\xef\
-\x58\x6c\x38\x43\xc8\x8d\x73\x6d\x6d\xf9\xab\xa3\xa3\xe0\x47\x46\
-\x46\xfe\x38\x37\x37\x77\x8e\x65\x59\x03\x80\x57\xbf\xcc\x8b\x8b\
-\x51\x55\x95\x24\x12\x89\xa1\x70\x38\xfc\xd0\x66\xb3\x61\x0f\xc7\
-\x65\x16\xb3\xd9\xcf\x00\x04\x57\x15\x05\x00\xf0\x5f\xe9\x07\xd7\
-\x21\xa0\x6e\xaa\xb8\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x31\x2d\x30\x39\
-\x2d\x30\x33\x54\x30\x36\x3a\x33\x33\x3a\x35\x35\x2b\x30\x30\x3a\
-\x30\x30\x24\xd7\x08\x01\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
-\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x31\x2d\x30\
-\x39\x2d\x30\x33\x54\x30\x36\x3a\x33\x33\x3a\x35\x35\x2b\x30\x30\
-\x3a\x30\x30\x55\x8a\xb0\xbd\x00\x00\x00\x20\x74\x45\x58\x74\x73\
-\x6f\x66\x74\x77\x61\x72\x65\x00\x68\x74\x74\x70\x73\x3a\x2f\x2f\
-\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\xbc\
-\xcf\x1d\x9d\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\
-\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x48\x65\x69\
-\x67\x68\x74\x00\x35\x31\x32\x8f\x8d\x53\x81\x00\x00\x00\x17\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\
-\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\
-\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\
-\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\
-\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x36\x33\x30\x36\x35\x30\x38\
-\x33\x35\xc7\x6d\xe2\x19\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x32\x38\x30\x37\x33\x42\
-\x42\x57\x33\x7a\xfb\x00\x00\x00\x5c\x74\x45\x58\x74\x54\x68\x75\
-\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\
-\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x58\x5a\x72\x51\
-\x47\x74\x6b\x2f\x33\x31\x33\x37\x2f\x63\x6f\x6e\x74\x65\x6e\x74\
-\x5f\x6d\x61\x72\x6b\x65\x74\x69\x6e\x67\x5f\x6d\x61\x6e\x61\x67\
-\x65\x6d\x65\x6e\x74\x5f\x73\x65\x6f\x5f\x69\x63\x6f\x6e\x5f\x31\
-\x39\x32\x34\x34\x37\x2e\x70\x6e\x67\x22\x28\x28\x1c\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x32\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x04\x03\x00\x00\x00\xa5\x2c\xe4\xb4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x27\x50\x4c\x54\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdd\x12\xf9\xb5\
-\x00\x00\x00\x0c\x74\x52\x4e\x53\x00\x7f\xfe\x60\x01\xbf\x65\x02\
-\x62\x5e\x5f\x63\xe6\x56\x3c\x08\x00\x00\x00\x91\x49\x44\x41\x54\
-\x38\xcb\x63\x60\x18\x4e\xc0\x59\x10\x09\x98\x20\x49\xd8\x9c\x41\
-\x02\x87\x91\x24\x64\x94\x74\x94\x0e\x41\xd0\x21\x1d\x45\x64\x09\
-\x55\x84\x49\x31\x28\x12\x07\xb1\xb3\x19\x64\x14\xb1\xb3\xf1\x48\
-\xe0\x31\xca\x6b\x3b\x08\x61\xd1\x31\xe7\x18\x08\x61\xd1\xd1\x74\
-\x0c\x84\xb0\x58\x5e\x96\x0e\x42\xa4\x58\x4e\x35\x7f\xe0\x0c\x44\
-\x5c\xc1\x8e\x33\xa2\x20\x51\x1b\x74\x14\x23\x6a\x21\x40\xe8\x20\
-\x8e\x24\x21\x83\x4b\x42\x88\x64\x09\x2a\x1a\x85\x2e\x01\x4f\xb8\
-\x31\x47\x51\x93\xaf\xd1\x21\x1d\x1d\xe4\xb0\x02\x52\xca\x98\x01\
-\x85\x1c\x5c\x28\x79\x40\x10\x47\x70\x0d\x59\x00\x00\x62\x2d\x5a\
-\x7f\x29\xcf\x27\x13\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x05\xf9\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x05\x9b\x49\x44\x41\x54\x58\x85\xbd\
-\x97\x7d\x6c\x55\xf5\x19\xc7\x3f\xbf\xd7\x73\x2f\xa5\xed\x2c\x01\
-\x4c\x5b\x25\x1b\x65\x48\x23\xd3\xad\x93\x09\x6b\x5c\x66\x94\x89\
-\x48\xc6\x1f\x14\xe3\xcb\x54\x16\x62\xb6\x65\x7f\x2c\x05\xb2\x64\
-\x26\x23\xd9\x70\x9a\x4d\x85\xc9\xc2\x96\x90\x85\x38\xb7\x05\x21\
-\x24\x2a\x9b\x73\xcc\x97\xd0\x50\x51\xc6\xa8\x80\x56\x90\xd2\x97\
-\x5b\x28\xd7\xf6\xb6\xb7\xf7\xb6\xf7\xde\x73\x6f\xef\x39\x77\x7f\
-\xdc\xdb\xdb\x82\xb4\xbc\xa4\xf5\x9b\x9c\x9c\x93\x9c\x3c\xe7\xfb\
-\x39\xdf\xe7\xf7\xfc\x4e\x8e\xe0\x8b\xd0\xb3\x94\x7f\xb7\x66\xf9\
-\x83\x33\x4d\x69\x65\x28\xda\x71\xfc\xf8\x96\x63\x6f\xd0\x46\x1a\
-\x40\x4c\xb7\x77\xcd\x9f\x6b\x6a\xef\xac\xbe\xeb\xdf\xd1\x74\xb2\
-\x3a\x9a\x1e\x24\xa8\x03\xf8\x7e\xe6\xe4\xe9\x96\x0f\x1b\x7a\xb6\
-\xf4\x9c\x96\xd3\xea\xde\x80\xbd\xa3\xaa\xfe\x95\xae\xa1\x70\x75\
-\x6f\xaa\x8f\x11\x7f\x84\x78\x66\x88\xe1\x6c\x7a\xf1\x4d\x8b\x16\
-\xec\x04\x1c\x3d\x9d\xfe\xf7\x3e\xb4\x62\x83\xeb\x79\xb7\xa6\xfd\
-\x0c\x42\x08\x84\x80\xd1\xd0\x55\xc0\x2c\x03\x4a\xa7\x0d\x60\xce\
-\x8e\x39\x5f\xa9\x2c\x9f\xf7\xd4\xa7\xd1\x76\x94\x92\x05\xdb\x51\
-\x08\x90\xe4\x52\x80\x98\x36\x80\xbb\xe7\xdf\xb7\x3d\x9c\xec\x2d\
-\x29\x9a\x0b\x51\x84\x00\xc8\x0d\xb9\x87\x80\xe4\xb4\x00\x2c\xdd\
-\x53\xbf\xc6\xea\xe0\xfd\x6e\x2a\x82\x96\x0a\x21\x40\x88\x62\x06\
-\x68\xa1\xd2\x9f\x34\x7d\xf4\x3c\x90\x9a\x7a\x80\xcd\x94\xd5\xce\
-\x5e\xbc\x2d\x94\xe8\x41\x6b\x95\xef\x7d\x21\x7a\x21\x04\x5a\x28\
-\xfa\xcf\x5e\xf8\x43\x68\x67\xe8\x3d\xc0\x9f\x72\x80\x35\xdf\x7a\
-\xf0\xd7\x09\xdf\xad\x12\x52\x60\x84\x2e\x2e\xbe\x51\x10\x2f\xe1\
-\x9e\x78\x7f\xd3\x7b\xcf\x01\x49\x80\x29\x1d\xc3\xc5\x7f\x5b\x5c\
-\x37\xbb\x6c\xee\x4f\x62\x23\x31\x8c\x56\x18\xad\x31\x5a\x63\xb5\
-\xc1\x6a\x4d\x40\x19\xf7\xe3\xd7\x4f\x6c\x20\x49\xef\x68\xcd\xd4\
-\x25\xd0\x80\x5a\x52\xbd\xec\x8f\xbd\xe9\x7e\x6d\xb5\x46\x0a\x81\
-\x94\x12\x21\x04\x52\x08\xb4\xd4\x9c\xff\xb8\xf3\xc5\xd0\xae\x50\
-\x33\xe0\x4f\x39\xc0\xca\x27\x56\xfd\xd8\x9a\xc0\x1d\x39\x2f\x86\
-\x51\x79\x00\x25\x25\x42\x48\xa4\x14\xb8\xb1\x44\xcb\xc1\x0d\x07\
-\x5f\x00\x52\xe3\xeb\xa6\xa4\x05\xb3\xb6\xcf\xaa\xac\xa9\x58\xb0\
-\x25\x9c\x0e\x93\x93\x3e\x39\xe1\xe1\x4b\x0f\x4f\x7a\xe4\xa4\x87\
-\xcc\xe5\x52\xff\xdd\x7d\xa4\x91\x04\x7d\x97\xd6\x4e\x49\x02\xcb\
-\x17\xad\xd8\xda\x96\xec\x28\x4f\xfa\x09\xb4\xd2\x18\xa5\x50\x28\
-\x34\x0a\x21\x0d\x9d\x27\x3a\xb7\x75\xbd\xd4\xf5\x01\xe3\xa2\xbf\
-\x18\xe0\x37\xcc\x5a\x7d\xcb\xda\x4d\x5a\x99\xaf\x65\xb2\x6e\xf7\
-\xa9\x0b\xad\x7b\x3e\xfd\xe9\x27\xef\x5e\xae\xe0\x52\xd5\xef\xab\
-\xbf\x2f\x10\x0c\x36\xf4\xb9\x11\x02\xc6\x62\x94\x46\x2b\x8d\x56\
-\x0a\x2d\x15\x99\x01\xf7\x68\xd3\x93\x87\xb6\x71\x49\xf4\xa3\x52\
-\x6c\x66\xe6\x23\x5f\xff\xe1\xe1\x78\xce\x5d\x7d\x21\x15\x59\x30\
-\xec\xbb\x75\x73\x6f\xa8\x7c\xac\x62\xe5\xac\xaa\x9e\x63\xdd\xff\
-\x21\x46\x76\x42\xf7\xcd\xcc\x58\x7e\xdb\x8a\xfd\xe1\x4c\xb8\x42\
-\x6b\x85\xa3\x0d\x8e\x36\x58\x6d\x70\xb4\xc5\x0a\x9d\x6c\xde\x79\
-\xf8\xb1\xc1\xe3\x83\xa7\x80\xdc\xe5\x1e\x21\xef\x59\xf8\xbd\x47\
-\xe3\x9e\xbb\xa8\xdf\x8d\x42\x61\x5e\x87\x46\x12\x04\x67\x96\xaf\
-\xbf\x6d\xcb\x92\xbd\xdc\x43\xf9\x44\xfe\x0d\xf5\x6b\x7f\x91\x96\
-\x99\xf9\x4a\x0b\x02\xda\xe2\x18\x87\x80\x71\x08\x5a\x87\x12\x1b\
-\xe4\x5c\xcb\xb9\xe7\x3b\xff\xd2\x79\x64\xb2\x24\x65\x89\x53\x76\
-\xe3\x40\x3a\x0a\x50\xd8\xb1\x04\x1e\x1e\x5d\x43\x21\xfa\xfc\xf8\
-\x03\xb5\x4f\x7c\xe3\x5f\x3c\xce\x8d\x97\x16\xd6\xbe\x5c\x5b\x3b\
-\xbb\x7c\xce\xc6\x58\x36\x8a\xa3\x2d\x8e\xb1\x04\x8c\x25\x60\x2d\
-\x41\xe3\x90\x8c\x24\x8e\x1c\x58\xff\xd6\x76\xc0\x9d\x30\x41\x40\
-\xb6\x47\xda\x8e\x05\x4c\xa0\xf0\xf6\x90\xcc\x26\xe9\x88\x77\x91\
-\xf4\x52\x20\x72\xa4\xe4\xc8\xd2\xdb\x57\xde\xf9\x4e\xe9\xa6\xd2\
-\x05\xe3\xea\xc4\xb2\x2f\xd7\xef\x88\x64\x23\x8e\xd5\x06\xc7\x98\
-\x31\x00\xe3\xa0\x73\x2a\xd1\xb4\xab\xa9\x11\xe8\x9f\xcc\x1c\x40\
-\x9e\xfc\x7d\xcb\x9b\x43\xc9\xfe\xb7\x95\x50\x0c\x66\x62\x74\x0d\
-\x77\x93\xc3\x47\x49\x89\x92\x0a\x29\x25\x19\x99\x5d\x74\xeb\xb7\
-\xeb\xde\xb9\xf9\x99\x9b\xeb\x00\xb1\xea\x1f\xab\x1e\x37\x01\xf3\
-\x1d\x4f\x78\x85\xbe\x8f\x9a\x5b\x66\x98\x00\x6d\x1f\x9c\xfd\x5d\
-\xfb\x4b\xa1\xff\x4d\x16\xfd\xa8\x14\x7d\x78\xe7\xe3\x5d\xaf\xcd\
-\x58\x38\xe3\xf6\xcf\xd2\x03\x35\x42\x0a\x8c\x52\xc5\x71\xb2\x4a\
-\x63\x94\x41\x68\x51\x56\x59\x55\xd9\x10\x58\x6a\x3b\xeb\xbe\xfa\
-\xcd\xad\xe1\x91\x70\x89\x35\xfa\xa2\xf8\x1d\x63\x89\x85\xe3\x87\
-\xff\xfe\xfd\xbd\x8d\x40\xfc\x4a\xe6\x79\x00\x80\x76\xd2\x03\x6d\
-\xbd\xaf\xdd\xb0\xa4\xa2\x56\x19\x73\x8b\x94\x02\xa3\x74\xf1\xb0\
-\xda\x60\x95\x46\x69\x19\x9c\x57\x35\x6f\x8d\xa7\xbc\x92\x9c\xf4\
-\xc6\xcc\x6d\x1e\x40\x64\xe5\xf0\xfe\x17\xfe\xf9\x83\xe8\x89\x58\
-\x1b\x13\xac\xfa\xcf\xb5\xa0\x78\xd5\xca\x70\xf8\xe9\x8e\x87\x4d\
-\xd6\xdf\xed\x28\x8b\x12\xb2\xd8\x06\x25\x65\x7e\xae\x95\x22\x8d\
-\x4b\xca\x4f\xe6\xe1\xb4\xc6\x6a\x8d\x55\x86\x80\x0a\xd0\xda\x7c\
-\xea\xd9\xb3\x2f\x77\xb5\x5c\x4d\xf4\x9f\x07\x00\x38\x47\xea\xfc\
-\x93\x67\xd7\x91\xce\xec\x72\xf4\x18\x84\x96\xaa\x00\xa2\x50\xb2\
-\xb0\xc9\x14\x13\xca\xcf\x7d\xe4\x7c\xe4\xd0\xeb\xeb\xde\xf8\x13\
-\x57\x58\xf5\x93\x03\xe4\xe5\x86\xd6\x9f\xf9\x91\x9f\x74\x77\x38\
-\xda\xa2\xa4\x44\xca\x31\x10\xad\xf2\x67\xa3\x0a\x87\x56\xe4\x46\
-\x88\x1f\x78\xf1\xad\x8d\x40\xf4\x5a\xcc\x27\x02\x00\xc8\x9c\x59\
-\xd7\xfa\x33\x2f\x9e\x7c\xee\xe2\x76\xc8\x71\x49\xe4\xb7\x5a\x2b\
-\x2d\x1f\x35\xb5\x3e\x73\x66\x77\xe7\x87\x5c\x43\xf4\xa3\x52\x93\
-\xdc\xf3\x7b\x5f\xfd\xec\xdd\xb9\xf7\xcf\x11\x25\xa5\x33\xef\x52\
-\x4a\x89\xfc\x62\x1c\xdb\x6a\x1d\x63\x89\xf5\x0c\x1e\xfc\xeb\xea\
-\x3d\x3f\x07\x86\xae\xd5\x1c\xae\xfc\x39\xce\x1e\x7d\xf4\xc8\xaf\
-\xdc\xbe\xa1\xa7\x1c\x69\x7c\x29\xc6\xda\x21\xa5\xc4\x4f\xfb\xb1\
-\x37\xb7\x1e\xd8\x08\x0c\x5c\x8f\xf9\xd5\x00\x00\x64\x9b\x1f\x6e\
-\xfe\xed\x70\xcf\x60\xa3\x95\xc6\x93\x42\x20\x85\xc4\x08\xcd\xa9\
-\x43\xa7\x9f\x6e\xdf\xd7\x7d\x92\xab\x1c\xb9\xcb\x69\xb2\x16\x8c\
-\x57\xae\x63\x5f\xe7\xd1\x9b\xee\xad\xec\x29\x2b\x2f\xbb\x3b\xe8\
-\x04\xed\x40\xf7\xc0\xfe\xbd\x6b\x5f\xfd\x25\x30\x7c\xbd\xe6\xd7\
-\x23\x59\xbd\xb2\xa2\x6a\x61\xe3\xfc\x65\xc0\x97\xf8\x02\x7e\x6e\
-\xa7\x5d\xff\x07\x5b\x91\xee\xa4\x7d\xc3\x13\xbf\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0b\xaa\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x0b\x4c\x49\x44\x41\x54\x68\x81\xd5\
-\x9a\x6b\x6c\x1d\xc5\x15\xc7\x7f\x33\xbb\x7b\x1f\xb1\xaf\xed\x38\
-\x76\x88\x71\x1c\x4c\x12\xb7\x79\x38\x86\xf0\x48\x00\x95\x12\xa0\
-\x44\x20\xde\xa4\xd0\xaa\xa8\xa5\x2a\x12\xa5\xd0\x22\x68\x4b\x0b\
-\x82\xaa\xfd\x50\x28\x14\x55\x8a\x84\x2a\x28\x7c\xa2\x1f\x68\x4b\
-\x00\x01\xe1\xfd\x2a\xa5\x94\x42\xa0\x10\x02\x21\x0d\x89\x03\x21\
-\x0f\x12\xc7\xf6\xb5\x7d\xaf\x7d\x1f\x7b\x77\xa6\x1f\x66\xf7\xde\
-\xdd\xf5\x75\x08\x06\x3e\xf4\x48\x47\x67\x9e\x67\xce\x7f\xce\x99\
-\x9d\xd9\xd9\x15\x7c\x71\xd4\x08\xf4\x02\x4b\x81\x23\x81\x76\x20\
-\xe1\xd7\x95\x81\x03\xc0\x87\xc0\x66\xe0\x3d\x20\xff\x05\x8e\x3d\
-\x6d\xea\x04\xae\x05\x5e\xc4\x18\xa4\x0f\x91\xf3\x7e\x9f\x6b\x7d\
-\x1d\xd3\x26\x31\xcd\x7e\xc7\x03\xd7\x03\xe7\x02\x29\x00\x52\x4d\
-\x30\x7b\x31\xb4\x1e\x09\x4d\x1d\x90\x6a\x01\xcb\x31\xad\x3d\x17\
-\x8a\x23\x30\xf6\x09\x0c\x7f\x08\x03\x5b\xa0\x38\x16\xe8\x2a\x02\
-\xeb\x81\x3b\x80\x37\xbe\x6c\x00\xf3\x81\xdb\x81\x8b\x00\x49\x7a\
-\x26\x2c\x58\x05\xf3\x4f\x86\xf6\x1e\x10\x46\x9d\x10\x02\xc7\x12\
-\x48\x69\xf2\x4a\x69\x5c\x4f\xa3\xb5\x36\x5a\xb4\x86\x03\xdb\x60\
-\xc7\x3f\xa1\xff\x25\x28\x64\x01\x14\xf0\x30\xf0\x4b\x60\xc7\x17\
-\x0d\x40\x02\x57\x01\xb7\x02\x19\x1a\x67\xc3\xd1\x97\x40\xcf\x69\
-\xe0\x24\x49\xd8\x92\xde\xce\x0c\x7d\x73\x33\x7c\x65\x76\x03\x9d\
-\x2d\x29\x32\x29\x1b\xc7\x32\xea\x5d\x4f\x93\x2b\x56\xd8\x33\x52\
-\xe4\x83\x81\x71\x36\xed\xce\xf1\xde\xde\x1c\x65\x57\x81\x5b\x82\
-\x6d\x2f\xc2\xc6\x07\x20\x3f\x00\x90\x03\x6e\x02\xfe\xe8\x83\xfa\
-\xdc\x00\x32\xc0\x7d\xc0\x05\x48\x5b\xb0\xfc\x12\x38\xfa\x9b\xe0\
-\xa4\xe8\x6a\x4d\x73\xe6\x92\x36\x4e\x5a\x30\x93\x4c\xca\x3a\xc4\
-\xb9\x30\x94\x2b\x7a\xbc\xda\x9f\xe5\xe9\xf7\x07\xd9\x35\x5c\x00\
-\xb7\x08\x1b\x1f\x84\xb7\x1f\x00\x55\xd1\xc0\x23\xc0\x65\x3e\xa0\
-\x69\x03\x38\x1c\x78\x1c\x38\x9a\x96\xb9\x82\x33\x6e\x80\xf6\x05\
-\xb4\x35\x26\x58\xb3\x7c\x0e\x2b\xbb\x9b\x83\xa8\x89\x69\x9c\x4a\
-\xad\x36\x4b\x38\x5c\xa2\xe1\xf5\x8f\x46\x79\xe8\xed\x7d\x0c\xe6\
-\xcb\x70\xa0\x1f\x9e\xbb\x0d\x46\x76\x03\xbc\x8d\x59\x67\x7b\xa6\
-\x03\xe0\x70\xe0\x39\x60\x09\xf3\x8e\x85\xd5\x37\x40\x2a\xc3\xd7\
-\x16\xcc\xe4\xfc\xbe\xd9\xa4\x1c\x59\xeb\x3e\xdd\x47\x81\xae\x25\
-\x8a\xae\xe2\xd1\x4d\x03\xbc\xd2\x9f\x85\x62\x0e\x9e\xbd\x0d\x3e\
-\xfe\x0f\xc0\xfb\xc0\xea\xa9\x40\x4c\x35\x74\x06\xf8\x07\xb0\x9c\
-\x85\x27\xc3\xea\x5f\x60\x27\x93\x5c\xd0\x37\x9b\x63\xba\x9a\x10\
-\x88\x68\x4f\x11\x4b\x1c\xc4\x01\x91\x84\x8e\xd6\x69\x34\x6f\xed\
-\xca\xf1\xc8\xa6\xfd\x54\x4a\x25\x78\xf6\x0e\xd8\xfe\x32\x18\x4f\
-\x9c\x42\x9d\x70\xaa\x17\xb8\x12\xf8\x0b\xb0\x8a\x23\x8e\x13\x9c\
-\x7d\x33\x4e\x2a\xc5\xc5\xcb\xe7\xd0\xd3\xde\x80\xab\x34\x65\xad\
-\x29\x2b\x4d\x59\x63\x64\xb8\x2c\xc2\x41\xbd\x9a\x5c\xe7\x85\xd3\
-\xa6\xde\xf5\x34\x6d\x0d\x09\x0e\x6f\x49\xb2\x75\xa8\x8c\x3a\x72\
-\x25\xec\xff\x00\x46\xf7\x76\x00\x8b\x80\x75\x31\xd8\x75\x01\x5c\
-\x0d\x5c\xc7\xcc\x2e\xc1\x85\xb7\x22\xd2\x33\x38\x6b\x49\x3b\xf3\
-\x5a\x53\xb8\x0a\x5c\xad\x71\x95\xc6\xd5\xe1\xb4\x36\x75\x01\x6b\
-\x6a\xf5\x5a\xd7\xf2\x91\x36\x7e\x5f\xe5\xf7\xf5\x6a\xf9\xc6\x94\
-\x45\x6b\x43\x82\x6d\xd9\x12\x74\xaf\x84\x1d\xaf\x42\x61\x6c\x11\
-\x30\x04\x6c\x08\x1b\x1b\x77\xf6\x7c\x60\x23\x96\x9d\xe1\x3b\x77\
-\xc2\x61\x3d\x1c\x33\x37\xc3\x71\x5d\x4d\xe6\x19\x1f\xb4\x0e\xa5\
-\xf7\x8d\x94\xb0\x6c\x49\x7b\x53\x22\xaa\x29\xae\x59\x4f\x91\xd7\
-\xe1\x70\xd2\xa1\xfd\x5a\xf3\xe6\xae\x1c\x6f\xed\x1e\x83\xfd\xdb\
-\xe1\xfe\x1f\x83\x57\xc9\x01\x47\x13\xda\x27\xe2\x1e\xb8\x07\x58\
-\xce\x89\x97\xc2\xd2\xd3\x99\xd5\x98\xe0\x84\xee\x16\x5c\xa8\xcd\
-\x64\x38\xad\xe1\x8a\x15\x1d\x74\xcd\x70\x78\xfe\x83\x61\xb4\x2d\
-\xd1\x96\x08\x79\xa0\x0e\x2b\xa2\xde\x0b\xf2\x81\x57\x15\xd5\xf2\
-\xb6\x06\x87\xbd\xf9\x32\x85\x64\x0b\x28\x05\xbb\xde\x49\x62\x8e\
-\x1e\xeb\xea\x01\x38\x1e\xf8\x03\xcd\x73\x04\xe7\xdd\x04\x8e\xc3\
-\x8a\x79\xcd\x24\x1c\x49\x45\xe3\xb3\x36\x12\x9f\x35\x1c\xd3\xd1\
-\xc8\x45\x4b\xdb\xb9\x70\x69\x3b\x3b\xf6\x8d\xb3\x61\xd7\x18\x89\
-\xb4\x8d\x07\xa1\x7e\xf5\x58\x4f\xce\x2b\xa8\x28\x5f\x6a\x93\xce\
-\x24\x6d\x76\x8e\x96\xa0\x63\x11\xbc\xff\x02\x94\xf2\x8b\x80\xa7\
-\x80\xbd\x71\x00\x6b\x81\x5e\x4e\xbd\x02\xba\x7a\x69\x6b\x4a\xd2\
-\xdd\x9a\xf2\x8d\xd5\xbe\x14\x35\xe3\x7d\x3e\x7e\x4e\x23\x3d\xad\
-\x69\x52\xb6\x64\xd5\xc2\x99\x9c\xda\xdd\xcc\x6b\xdb\xb2\xf4\x8f\
-\x94\x48\xa4\x6c\x2a\x5a\x44\x8d\x84\x29\xf2\x3a\x06\xc6\xe4\x1d\
-\x5b\x30\x52\xf2\x98\x50\x12\xec\x24\x6c\xff\xb7\x00\x5a\x02\x2f\
-\x48\xdf\xf8\x4e\xe0\x5c\x1a\x5a\xe1\xa8\xd5\x60\x09\x3a\x9a\x93\
-\x14\x94\x36\xac\xa1\xa0\x75\x88\xfd\xbc\x32\x06\x84\x69\x41\xdb\
-\x0c\xee\xfb\xd6\x62\x6e\x3f\x65\x1e\xa5\x6c\x91\xc1\xf1\x72\xac\
-\x1f\xd1\xbc\x8a\xe9\x8c\xd7\x29\x4d\x47\x73\x12\x6c\x61\x6c\x6b\
-\x68\x05\xb3\xb9\x75\x86\x01\x5c\x0c\xa4\x58\xf6\x0d\x48\xa6\xb1\
-\x1c\x8b\x86\x94\x4d\x49\x43\x49\x6b\x4a\x4a\xd7\xd2\x11\x09\x1e\
-\x93\x49\x08\xc1\x69\x3d\xad\x3c\xfd\xfd\x3e\x2e\x5f\xd8\x4a\x76\
-\x60\x82\xbc\xeb\xd5\xfa\x42\xb5\x7f\x8d\x63\xba\x95\xae\xa6\x1b\
-\x52\x36\x96\x6d\x41\x2a\x0d\xcb\xce\x00\x73\x02\xbe\x38\x0c\xe0\
-\x3c\x00\x7a\x4f\x03\x4b\x90\x49\x1b\xe3\x8b\x5a\x53\xd4\xf8\xac\
-\x27\x4b\xea\x03\x08\xc8\xb1\x24\x3f\x3c\xb1\x93\x17\xbe\xb7\x8c\
-\x55\x8d\x49\xf6\x0f\x8c\x53\xa8\xea\x83\x22\x46\x47\x74\x9c\x9a\
-\xee\x20\x5d\xd2\x90\x49\xdb\x60\x09\x58\x76\x5a\xa0\xfe\xbc\x00\
-\x40\x23\xb0\x82\x19\x2d\xd0\xb5\x18\x6c\x49\x22\x61\x45\x66\xb9\
-\x84\x9f\x66\x32\x1f\x0c\x40\x40\xb3\x1a\x1c\x7e\x7f\xf6\x02\x1e\
-\x5f\xb3\x88\xee\x92\x47\x76\xb4\x54\x57\x57\x89\xb0\x77\x74\xc4\
-\x3b\x89\x84\x05\x96\x84\xb9\x8b\x60\x46\x0b\xc0\x0a\xa0\x51\x62\
-\x5e\x03\x1b\x38\xa2\x17\x6c\x0b\xa4\x40\xda\x82\x32\x4c\xc1\xd1\
-\xba\x43\x01\x00\x26\xac\x16\x1f\xd6\xc0\xc3\x97\x2e\xe5\xce\x93\
-\xe6\x92\xce\x16\x19\x2f\x56\x0e\xa2\x3b\x3a\x8e\xb4\x25\x48\x61\
-\x6c\x3c\xa2\x17\xa0\x01\xe8\x95\x98\x77\x58\xe8\xe8\x31\x2e\xb2\
-\x24\x4a\x84\x3a\x0b\x5f\x99\x20\x5a\x26\x4c\xd9\xa7\x1e\xd8\xeb\
-\x00\x39\x67\x49\x1b\xaf\xfc\xa0\x8f\x6b\xba\x5b\x28\x1f\x28\x50\
-\x54\x4c\xd6\x4f\xb4\x4c\x49\x8c\x07\x2c\x61\x6c\x35\xb4\x54\x62\
-\x5e\xc0\xa1\x6d\x6e\xb5\x41\x45\xc4\x3c\x10\x06\x11\x32\xbe\x2c\
-\xc4\x67\x06\x10\x50\xca\xb1\xf8\xe9\xd7\xe7\xf1\xc6\x65\xcb\x38\
-\x3b\x6d\x33\x31\x5c\x9c\x7a\xc2\x30\x8f\xf0\x60\x82\x69\x9f\x1b\
-\xa8\x39\x52\x62\x6e\x0f\xa0\x79\x96\xdf\x40\x50\x11\xf8\xec\xa7\
-\x09\xe7\x45\xa4\x4e\x4d\xf7\x28\xed\xd3\xec\x4c\x82\xbb\x2f\xfc\
-\x2a\x4f\x9f\xdb\xc3\x32\x57\x51\xc8\xbb\xb8\xd5\xf1\x43\x36\x08\
-\xaa\xf6\xd1\x34\xab\xda\x5d\x12\x5c\x7d\x38\x09\x13\x63\x96\xc4\
-\x15\xe0\x0a\x51\x93\xd2\x67\x21\x70\x65\xb4\x4c\x4d\x7a\xa3\x99\
-\x1e\x1d\xdb\xd5\xc4\x53\xdf\xed\xe5\x4f\x2b\x0e\x67\x36\xc1\xf8\
-\x21\x1b\x84\x3f\xfb\x52\x42\x22\x19\x74\x73\xec\xaa\x06\x19\x34\
-\x30\x8d\xa5\xc0\x1c\xc8\xc2\x2c\xfd\x76\x42\xf8\x72\xf2\x19\xed\
-\xf3\x90\x10\x60\xcf\x4a\x23\x9a\x92\x54\x72\xa5\xc8\xd8\x6e\xe0\
-\x01\xa8\x3d\xfc\x01\x1b\x13\x62\xa0\x2a\xa6\x81\x34\x61\x62\x07\
-\x46\xc6\x39\x5c\xfe\x05\x84\x50\x40\x6f\x8d\x14\xb9\x71\xd3\x00\
-\x2f\x0f\x8c\x83\xd2\x46\x7f\x40\xda\x84\x52\xb5\x4c\x55\xf7\x7f\
-\xd7\xc6\xdc\x98\x41\x7e\xd8\xf7\x82\xf0\xbd\x00\x52\xc4\x0c\x8e\
-\x83\x10\x02\xfd\x39\x43\x68\xa0\x54\xe1\xd7\x5b\x87\xf8\xf3\xce\
-\x31\x5c\x4f\x45\x0d\xf7\x8d\x57\x22\x00\xe4\xd7\xe5\x87\xab\xdd\
-\x6d\xcc\x75\x1f\x0c\xed\xf6\x0d\x34\x4f\x22\x4f\x4c\x31\xeb\xb1\
-\xb2\xe9\x02\x28\x7a\x8a\xbb\x76\x8d\x71\xcb\xf6\x2c\x23\x65\xcf\
-\x0f\xd1\xc9\xc6\x23\xc1\x53\xc2\x3f\x76\x4a\x40\xc1\xe0\xee\xa0\
-\xc5\x87\x36\xe6\xae\x12\xf6\x6c\xab\x3d\x67\x7d\x4f\x78\x42\x20\
-\x2c\x81\x90\x22\xe2\x9d\x28\x88\xcf\x66\xb8\xd6\x9a\x27\x87\x0b\
-\x5c\xbf\x6d\x98\xad\x79\xd7\x84\x8b\x25\xa2\x6b\x2d\x64\xbf\x86\
-\x5a\xec\xe3\x83\xd8\xb3\x2d\xc8\x6c\xb6\x31\x17\xad\xe3\xf4\xbf\
-\xd3\x80\xd0\x55\x0f\x04\x52\x0b\x81\xae\x1a\x2d\x6b\x0b\x79\x1a\
-\x21\xb4\x65\xc2\xe5\x67\x3b\xb2\x3c\x33\x54\x40\x69\xaa\xeb\xc8\
-\x6c\x26\xa2\x66\xb2\x0e\xed\x2e\x1a\xd0\x92\xea\x96\xa9\x14\xf4\
-\xbf\x03\x30\x0e\xbc\x27\x31\x17\xad\x1b\xc8\x65\x61\xe7\xfb\x35\
-\xe3\xac\x38\xcb\x90\xf4\xd9\x96\x87\x74\xa5\x32\xe4\x2a\xae\xfb\
-\x68\x84\xa3\xde\x19\xe0\xa9\xd1\x32\xaa\x9e\xae\x7a\x63\x85\xed\
-\x08\xec\xfa\x78\x0b\xe4\xb2\x60\xde\x8d\xf3\x41\x00\x3c\x06\xc0\
-\x1b\xcf\x4e\x8e\xf5\x90\x37\xea\x02\x3b\x88\x07\x5c\xad\xb9\xfb\
-\xc0\x38\x4b\x36\x1f\x60\xed\x81\x09\x5c\x4b\x98\x73\xbd\x1d\x4c\
-\x40\x1d\x7d\xf5\xc6\xac\x7a\x5f\xc0\x86\x67\x08\xdb\x1c\x00\x58\
-\x07\x14\x79\xf5\x09\xa8\x94\x62\x20\x64\x1d\xc5\x21\x9e\x62\x0d\
-\xbc\x98\x2b\xb3\x62\xeb\x30\x3f\xda\x9d\x63\x40\xeb\x98\x07\xc3\
-\x33\x1d\xd6\x15\xf3\x46\x60\x74\x30\x76\xa5\x04\xaf\x3e\x01\xe6\
-\xf0\x1a\x79\x23\xdb\x03\xac\x67\x64\x10\x5e\x59\x5f\x07\x7d\x6c\
-\x56\x0e\xe2\x81\xfe\x92\xc7\x9a\x9d\xa3\x9c\xfe\xd1\x08\x1b\x5d\
-\x2f\x34\xdb\x01\x8b\x5a\x7e\x52\x98\xc6\x0c\x8f\x87\xd3\x2b\xeb\
-\x61\x64\x30\x98\xfd\x3d\x61\x00\x60\xee\xe7\x15\x8f\xdc\x0b\x6e\
-\xa1\xce\x53\x27\x3c\x33\x01\x28\x59\x05\x30\xe6\x29\x6e\xde\x9f\
-\xa7\xaf\x3f\xcb\xc3\xf9\x72\x74\x86\x6d\x51\x27\x1f\x9f\xfd\xb8\
-\xee\x20\x8d\x91\xe5\x02\x3c\x72\x2f\x98\xd5\x7c\x47\x60\x74\xf8\
-\xa5\x7e\x2f\xb0\x8c\xf1\xdc\x12\x6c\x07\x8e\x3a\xa1\x36\x1b\xb6\
-\x40\x5a\x12\x69\x05\x52\x22\x6d\x93\x3f\xab\x39\xc9\xd6\xb2\xc7\
-\xc5\xbb\xc7\x78\x72\xa2\x82\x27\xa9\xb5\x95\x71\xc6\x48\x21\x22\
-\xd1\x61\x6c\x14\x48\x04\xc1\x8d\xeb\xa4\x23\xca\xba\xbb\xe1\xf5\
-\xe7\xc1\x7c\x43\x58\x1b\x14\xc7\x57\xa0\xb9\xd8\xb2\x9d\x0c\x6b\
-\x1f\x82\x9e\xa5\x55\x57\x3b\xb6\xc4\x8a\xc7\xb1\x14\x34\x3b\x16\
-\xa3\x5a\x47\xf7\x06\x41\xf4\x22\xcc\xbf\xa8\xaa\x4a\x55\x87\x3d\
-\x0d\x9e\x02\xa5\xf1\x2a\x0a\xb7\xa2\x6a\x65\x1f\x6c\x86\x6b\xd7\
-\x40\xc5\xfd\xd4\x8b\xad\x2c\x90\x47\xa9\x33\x79\x77\x83\xe0\xf4\
-\xf3\x21\x9d\x06\x4b\x60\x59\x92\x94\x63\x61\xd9\x12\xcb\x12\x86\
-\x6d\x49\x45\x9a\xba\x08\xdb\x7e\x99\x14\x86\x2d\x51\x4b\x8b\x3a\
-\x8c\xc0\x82\x6a\xba\xa2\xb5\xd9\x27\x00\x72\xa3\x70\xf3\xe5\x30\
-\x32\xa8\x31\x9f\xb5\x9e\x09\x1b\x5c\xef\x6e\xf4\x4d\xa0\x8f\xb1\
-\xec\x62\x76\x6c\x81\x53\xcf\x06\xc7\x41\x59\x92\x06\x5b\x92\xb4\
-\x25\x4e\xc0\x56\x48\x56\x59\xd4\xa4\x94\x38\x52\xe0\x48\x8c\x14\
-\x81\x0c\x31\x7e\xb9\x9f\x06\x18\xf7\x7c\x6f\x95\x4b\xf0\x9b\xab\
-\x60\xcb\x46\x80\x47\x81\x9f\xc7\xa3\xab\x1e\x00\x0d\x3c\x09\x9c\
-\xc9\xde\x9d\x1d\xec\xde\x01\x27\xaf\x06\xc7\xc6\x95\x82\x99\x09\
-\xcb\x80\xb0\x24\x8e\x6d\xbe\x85\x4d\x09\x42\x0a\x9f\xfd\xb4\x90\
-\x51\x00\x60\x8c\xc7\xe4\x25\x30\xe8\x2a\x94\xd6\xc6\xf8\xdf\x5e\
-\x07\xff\x7a\x0e\x60\x23\xe6\x16\xa2\x14\x37\xf6\x60\xfb\x68\x27\
-\xf0\x2c\xb0\x84\x95\xa7\xc0\x2d\x77\xc1\xcc\x99\x24\x6c\xc9\x11\
-\x69\x9b\xb4\x5d\xe7\xc9\x11\x3f\x27\x45\xa6\xc5\x8f\x75\x1d\x8a\
-\xf9\x90\x2c\x54\x14\x3b\x8b\x15\xf3\xdd\x2c\x9b\x85\x9b\xaf\x82\
-\xd7\x5e\x82\x69\x7e\xe0\x08\x83\x58\x0f\x2c\xa7\x7b\x21\xfc\xee\
-\x2e\x58\xda\x87\xb4\x24\x9d\x29\x8b\xae\xa4\x85\x94\x75\x80\x04\
-\x87\xbc\x00\x84\x26\x6a\x7c\x68\xe1\x2a\xa5\xd9\x55\xaa\xb0\xa7\
-\xe8\xa1\x3c\x05\x9b\xdf\x85\x1b\xaf\x84\x8f\xb6\x07\x33\x7f\xce\
-\x54\xc6\x43\xfd\x10\x0a\x53\x0e\xb8\x1f\x58\xc4\xc8\xf0\x22\x1e\
-\xfb\x9b\x40\x79\xe8\xbe\x63\x18\x73\x12\xec\xd7\xe6\xb1\xd8\x62\
-\x4b\x9a\x6d\x41\xda\x92\xa4\x2d\x61\x58\x4a\x9f\x05\x69\x01\x69\
-\x89\x91\x42\x90\x12\xe6\x46\x7a\xaf\xa7\xf8\x6f\xd9\x23\xeb\x69\
-\xf4\xc4\x38\xdc\xb3\x16\x7e\x75\x0d\x0c\x1f\xd0\x98\x98\x3f\x0f\
-\x18\x3c\x98\x81\x87\x70\x14\x03\xcc\x7c\x5e\x0d\xdc\x02\x64\xe8\
-\xec\x82\x2b\xaf\x83\x35\xdf\x86\xc6\x06\xb0\x04\x19\xc7\xa2\xcd\
-\x96\xb4\xda\x92\x8c\x25\x48\x4b\xff\xad\x0e\x73\x59\x5b\x50\x9a\
-\x9c\xa7\x19\xae\x28\x06\x2b\x8a\x9c\xeb\x99\xf0\xc9\x8f\xc3\x43\
-\x7f\x85\xbb\xd7\xc2\x9e\x8f\x83\x49\x3b\xe4\xcf\xac\x9f\x95\xe6\
-\x63\xce\x20\x1e\xa0\x69\x3f\x4c\x73\xc5\x4f\x34\x4f\xfc\x5d\xb3\
-\x2f\xa7\x19\x9a\xd0\x8c\x16\x35\xf9\x92\xa6\xe0\x6a\x4a\x15\xc3\
-\x05\x57\x93\x2f\x9b\xba\xa1\x09\xd3\xf6\xc9\x97\x4c\xdf\xf6\xc3\
-\x82\x63\xbf\x07\x3c\xe8\x8f\x71\xc8\x74\xa8\x1e\x88\xd3\xe4\x5f\
-\x0d\x66\xb5\xc1\xca\x13\x60\x59\x1f\x2c\x5c\x08\x1d\x73\x20\x9d\
-\x32\x3b\xf9\xf8\x04\x7c\xb2\x0f\xb6\x6f\x87\x77\x37\xc1\xeb\xaf\
-\xc1\x50\x35\x32\x4a\x98\xb3\xcd\xb4\x7e\x35\xf8\xbc\xf4\x7f\xfb\
-\xb3\x47\x3d\x0a\x7e\xb7\xe9\x05\xba\x89\xfe\x6e\xe3\x02\x03\x7c\
-\x09\xbf\xdb\xfc\x0f\x61\xdf\xdc\x21\x52\x36\x70\x11\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\x68\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x02\x0a\x49\x44\x41\x54\x58\x85\xed\
-\xd7\x4f\x4b\x54\x61\x14\xc7\xf1\xcf\xe8\x64\x66\x83\x51\x10\x89\
-\xd0\x26\xdf\x42\x84\xe1\xb6\x6d\xd0\x42\x5a\x24\x14\x05\x19\x44\
-\x84\xb5\x70\x15\xe5\xa6\x36\x6e\x2c\x6a\x51\xa0\x41\x50\x90\x8b\
-\x20\x77\x45\x41\xcb\x88\xde\x40\x6d\x83\x40\xfa\x43\x9a\x3a\x35\
-\x21\xb6\x38\xd7\xb8\x73\x1b\xc7\xeb\xe8\xb8\x9a\x1f\x3c\x9b\xe7\
-\x9e\xfb\x9c\xef\x7d\xce\x73\xcf\x73\x0e\x74\x61\x18\x93\xe8\xf5\
-\xbf\x76\x24\x63\xa3\x6a\x4f\x46\x56\x7b\x70\x1d\x97\xb1\x0b\x46\
-\xf0\x05\x65\x3c\xc5\xce\xcc\x0b\x43\x18\x68\x00\xe0\x08\x8e\xd7\
-\x98\x1f\xc7\x5c\xe2\xf3\x3c\x8c\x61\x1e\x2b\xc9\x78\x8e\x43\xe8\
-\xc6\x55\x2c\x63\xb0\x01\x80\x41\xfc\xc6\x59\xb1\xcb\xfb\x71\x37\
-\xe5\xe7\x17\x1e\x12\x5b\x32\x9e\x7a\x50\xc1\x0b\x4c\xe0\x47\x32\
-\xd7\x28\xc0\x0a\xbe\xe2\x5a\xe2\x6c\x29\xe5\x67\x5a\x26\xe4\xf7\
-\x32\x06\xe9\xb1\x19\x80\xec\xa8\x60\x06\x9d\xd0\x96\x7a\x61\x2c\
-\xa1\x6a\xb6\xde\xe0\x8a\x08\x41\x15\xc0\x22\x3e\x6e\x03\xc0\x07\
-\x11\x16\x59\x80\x21\x71\xe8\x9a\xad\xd3\xb8\x90\x9e\x68\xc7\x09\
-\x11\x9b\x5a\x31\xdb\xea\x33\xb0\x22\xfe\xac\x53\x28\x16\x12\x80\
-\xc3\x38\x58\x67\xb1\x59\xf1\x3b\x95\x72\x3a\x5f\xc4\x14\x0e\xd4\
-\xb1\xf9\x8c\x77\x85\x9c\x0b\x4e\xe1\x18\xde\xe6\xb4\xef\xc7\x2b\
-\x9c\x5b\xcf\xb0\x98\x73\xc1\x52\xe2\xfc\x64\x4e\xfb\x69\x39\x77\
-\xab\x6d\x7d\x93\xe6\xaa\x05\xd0\x02\x68\x01\xb4\x00\xf2\x66\xc2\
-\x05\x91\x8a\xf3\xd6\x0b\xfd\x78\x9d\xc7\xb0\x80\x0e\x51\x40\xf6\
-\xd4\xb1\x9b\x15\x79\x7d\x77\x4e\x80\x05\x51\x82\xd5\xbb\x8c\x3e\
-\xe1\xbd\x04\xe0\x8c\xb8\x22\xb7\xeb\x3a\xae\x88\x12\xa0\xaa\x6c\
-\x1f\x15\xe5\x72\xb3\x01\xbe\x89\x3e\x04\xd5\x87\xf0\x3e\x1e\x35\
-\xe0\x68\xa3\x9a\xc0\xe3\x5a\x00\xfb\xd0\xb7\x0d\x00\x7d\xa2\x4f\
-\xa8\x52\x07\x9e\x59\xbb\x2c\xdb\xca\x10\x2c\x89\x16\xe0\x9f\x7a\
-\xc4\x96\xac\x1a\x94\xf1\x04\x37\xf1\x7d\x0b\x00\xe6\x70\x1b\x2f\
-\x55\x7f\xe0\xb8\x68\x8a\x3c\x48\x9c\xae\x3e\x98\x4c\xa0\x4a\xb8\
-\x88\x3f\x9b\x00\x58\x16\x95\x76\xb7\xd8\xfa\x99\x94\x9f\x79\xdc\
-\x80\x4b\xe2\x64\xfe\xc4\x1d\x91\x1b\xb2\x0b\x1d\x6d\x00\x60\x40\
-\x94\xfa\x69\x75\x8a\x64\x56\x16\xcd\xe9\x08\x91\x5c\x46\x71\x0b\
-\x7b\x6b\x2c\x54\x94\x3f\x63\xa6\xb5\x56\x5b\xdf\x2b\x8a\xdc\x61\
-\x74\xfd\x05\x2a\xe1\xab\xdd\x63\x4f\xc0\x8d\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\x6b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x02\x0d\x49\x44\x41\x54\x58\x85\xed\
-\xd7\x3b\x68\x14\x41\x1c\x06\xf0\x5f\x34\xd1\x3b\x09\x72\xc6\xa0\
-\x82\x0f\x7c\x54\x82\x08\xa2\x82\x36\x56\xd6\x36\x82\x8d\x60\x65\
-\x65\x63\xaf\x60\xa1\x20\xa4\x51\xb1\x11\x44\xd1\x4a\xe5\x50\xd0\
-\xc2\x46\xb0\xf2\x15\x05\x95\x54\x6a\x21\x18\x51\x2c\x15\x72\x6a\
-\x30\xc9\xc5\x62\x36\xde\xe6\x72\xb3\x6e\x6e\xb7\xbc\x0f\x96\x65\
-\x67\x66\xff\xdf\x37\xf3\x9f\xc7\x37\x30\x1b\x79\x1a\x18\x51\x0c\
-\x35\x3c\xc7\x4c\x06\x4f\xb4\xe2\x0a\x86\x0a\x0a\x80\x3d\x78\xb3\
-\x18\x01\xd3\xb8\x83\x25\x25\x90\xcf\x61\x2b\xc6\x3b\x09\x88\x91\
-\x4c\xa0\x59\xa2\x80\xc9\xac\x78\x73\x6a\x66\xcc\xcf\xd5\x25\xe5\
-\xa4\x60\x17\x5e\xa5\xe2\x4e\x09\xa3\xbc\x20\x05\x77\x71\x33\xf5\
-\xdd\x48\x44\x14\xc1\x30\x5e\x68\x75\x6c\x1a\xa7\xf1\x30\x2d\xa0\
-\x81\xab\xe8\x47\x5f\x42\x3a\x91\x6a\x70\x1e\x95\x2e\xc8\x37\xe0\
-\x71\x2a\xce\x57\x1c\x4b\xea\x96\x09\x9d\x6d\x10\x96\x5a\x7a\xa8\
-\x57\x25\x65\xb3\x42\xde\x4e\x62\x79\x17\x02\xd6\xa2\x9e\xc4\xf9\
-\x8d\x23\x6d\x71\x56\x0b\x9d\x8b\xe2\x14\x4e\x74\x41\x9c\x46\x45\
-\x18\xdd\x43\xb1\x06\x7d\x19\x3f\x0f\x24\xef\x29\x6c\xc6\x19\x0c\
-\xe6\x24\x6e\xe0\x2c\x3e\xa1\xaa\x35\xf1\x16\x60\x69\x46\x90\xa6\
-\xd6\xd2\xb9\x80\x83\xf8\x92\x53\xc0\x01\x6c\xc4\x83\x84\x38\xba\
-\x04\xfb\x73\x06\x1c\xc4\xa8\x90\xc7\x3c\xa8\xcb\x39\x5a\x65\xee\
-\x76\x5d\xa1\x27\xa0\x27\xa0\x27\xa0\x27\x20\xef\x4e\xd8\x10\xb6\
-\xe2\x7a\xce\xf6\xfb\x84\xa3\xf8\xbf\xc8\x3a\x0b\x56\x62\x3d\xbe\
-\x63\x0c\x9b\x84\x73\x3c\x0f\xde\x0b\x87\xd1\x0f\xe1\x58\xae\x09\
-\x1e\x23\x4a\xd4\x09\x23\x82\x95\xda\x96\x93\xb4\x13\xaa\xb8\x87\
-\x47\x82\xcf\x68\x47\x0d\x9e\x62\x6f\xaa\x70\x18\x97\xb5\x9c\xcc\
-\x4b\x6c\xe9\x82\x7c\x05\x6e\xa4\xe2\x3c\xc1\xce\x54\xfd\x6e\x3c\
-\x23\xf8\xb5\x31\x6c\x17\x52\x72\x0d\x3f\x53\x3f\x5e\x17\xdc\xcb\
-\x62\x31\x80\xc3\xf8\xa3\xe5\x07\x47\xb1\x4e\xb0\xe9\x6f\x13\xee\
-\x7f\x44\xe3\xc2\x68\xcc\x7d\x4f\xe2\x96\xfc\x13\x35\x86\xa3\xf8\
-\x96\x8a\xfb\x11\x9f\x75\x70\xc5\xed\xcf\x7d\xc1\x54\x14\x45\x05\
-\xc7\xc5\xaf\x67\x1d\x0b\xdf\x09\x13\xa8\x4c\x9c\x33\xff\x3e\x90\
-\x79\x33\x1a\xc2\x8e\x12\xc9\xab\xd8\x2f\xe2\x41\x63\x29\xf8\x20\
-\x78\xbb\xa2\x58\x83\xdb\x19\x3c\xd1\x8a\x26\x5e\x0b\xcb\xb2\x08\
-\x2e\xe2\x57\x8c\xe7\x2f\x78\xa2\xd0\x24\x0c\x0e\xa7\x23\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x21\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x04\x00\x00\x00\xd9\x73\xb2\x7f\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x02\
-\x62\x4b\x47\x44\x00\xff\x87\x8f\xcc\xbf\x00\x00\x00\x09\x70\x48\
-\x59\x73\x00\x00\xec\x38\x00\x00\xec\x38\x01\x71\x2b\xca\x38\x00\
-\x00\x00\x07\x74\x49\x4d\x45\x07\xe6\x02\x15\x0f\x24\x37\x53\xc7\
-\xa5\x66\x00\x00\x01\xca\x49\x44\x41\x54\x48\xc7\xb5\xd5\xbf\x6e\
-\x13\x41\x10\x06\xf0\x1f\x89\x9b\xb8\xa1\x4a\x1c\xc9\xc6\x0e\xc2\
-\x51\xc0\x90\xc0\x3b\xa4\x01\xa1\x34\x69\xf8\x13\x04\xaf\x80\x84\
-\x68\x79\x0e\x1e\x80\x02\x68\xa8\x28\x20\x38\x06\x3b\x09\xae\x78\
-\x02\x90\x0b\x07\x39\x11\x41\xa2\xa0\x42\xb1\x97\xc2\x56\xe4\x3b\
-\x9f\x0f\x83\xc5\x57\xdd\xdc\xce\x7e\xb3\x33\x3b\xf3\x2d\x53\xe2\
-\x4c\xea\x6a\x46\x0e\x47\x4e\xfe\x95\x3e\xaf\xa9\x29\x9f\x1e\x23\
-\x0d\xb3\xf2\x98\x4d\x73\x99\x99\xb6\x06\x33\x91\xef\x75\x97\xff\
-\xb8\xe3\x92\x1b\xe3\xc2\xae\xfb\x66\x37\x42\x31\x5a\x83\x15\x35\
-\xc7\x36\x92\x09\x2a\x1a\x82\xc6\x10\x45\x46\x5e\x7e\xa8\x4e\x2b\
-\x76\x04\x4d\x57\xc7\x1d\xaf\xa2\x2e\xa8\x2b\x26\xae\x9e\x53\x15\
-\x7c\xb4\x9a\x96\x61\x45\xdd\x2b\xb9\x81\x95\x55\x50\x90\x1d\x58\
-\x0b\x5e\xd8\x8f\x6f\x1f\x6d\xa4\xa2\x5f\x0e\x91\x73\xc7\x4d\xcb\
-\xf8\xec\xb5\xe7\x3a\xc8\xc9\x6a\x4d\x76\x3b\xab\xaa\x7a\x4e\x74\
-\x74\x9c\xe8\xa9\x59\x9b\x6c\x63\x1f\x39\xef\x04\x4d\xf7\x95\x95\
-\x6d\xd9\x13\x54\x4f\x13\x9b\x00\x0f\x05\x4d\x17\x4e\xed\x25\xbb\
-\x82\x47\xe3\xdc\x33\xf2\x4a\x8a\x4a\x83\x2b\x9b\xf3\x56\xf0\x20\
-\xe2\xb3\x25\xd8\x96\x4d\xf0\xd6\x6f\x97\x03\x6d\x07\x83\xa6\x29\
-\x68\xe9\x58\x8e\x10\x2c\xeb\x68\x29\x8c\x7a\x4f\x3d\x0b\xe3\x52\
-\xe8\xb9\x17\xf1\xb9\xad\x67\xdb\x5c\x72\x0a\xc9\x45\xdc\x73\xfe\
-\xd4\x2e\xa9\x0b\x1e\x4f\x7e\xa6\x45\x55\xc1\x9e\xbb\xca\xca\x6e\
-\xa9\x0b\x6a\x16\xff\x26\xad\xb5\x58\x23\xbd\x1f\x37\x40\xa3\x6a\
-\x53\x32\xe7\xa7\x23\x6f\x1c\xca\x38\xab\xeb\x93\xa7\x9e\xf8\x82\
-\x9c\x05\x3f\xd2\x23\xaf\xd8\xf1\xd2\xfc\xc0\x8a\x0e\xd3\xbc\x67\
-\xea\xe9\x92\xd3\x9f\xf7\xfd\xa1\xf2\x0d\x63\xc9\x87\x98\x5e\xc4\
-\x70\x51\x2d\x36\xef\x71\x41\xe9\xeb\xc5\xae\x2b\xc9\x04\xd7\x1d\
-\x6b\x46\xe6\x7d\x54\xd2\x2a\x1a\xbe\xdb\x4c\x26\x98\xb1\xe1\x5a\
-\xe4\x4f\x51\x5b\x3b\xa6\x4f\xab\x36\x27\xef\xdf\x24\x82\x91\xa8\
-\x53\x22\xfd\x65\xea\xfa\x8a\x6e\x9a\xcb\x7f\x7e\x5c\x27\xc0\x6f\
-\xe3\x73\x85\x8e\xc9\xd9\x8c\x5c\x00\x00\x00\x25\x74\x45\x58\x74\
-\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x32\
-\x2d\x30\x32\x2d\x32\x31\x54\x31\x35\x3a\x33\x36\x3a\x35\x34\x2b\
-\x30\x30\x3a\x30\x30\x84\x5f\xc6\x81\x00\x00\x00\x25\x74\x45\x58\
-\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\
-\x32\x2d\x30\x32\x2d\x32\x31\x54\x31\x35\x3a\x33\x36\x3a\x35\x34\
-\x2b\x30\x30\x3a\x30\x30\xf5\x02\x7e\x3d\x00\x00\x00\x20\x74\x45\
-\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x68\x74\x74\x70\x73\
-\x3a\x2f\x2f\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\
-\x72\x67\xbc\xcf\x1d\x9d\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\
-\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\
-\x48\x65\x69\x67\x68\x74\x00\x35\x31\x32\x8f\x8d\x53\x81\x00\x00\
-\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\
-\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\
-\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\
-\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x36\x34\x35\x34\
-\x35\x37\x38\x31\x34\x0a\xbe\x0f\x01\x00\x00\x00\x12\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x38\x30\x32\
-\x34\x42\x42\x5b\x25\xf8\xd2\x00\x00\x00\x41\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\
-\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x77\x66\
-\x30\x32\x30\x39\x64\x2f\x33\x34\x30\x36\x2f\x6c\x69\x67\x68\x74\
-\x5f\x69\x63\x6f\x6e\x5f\x32\x31\x36\x33\x32\x35\x2e\x70\x6e\x67\
-\x1f\x85\x38\xa9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x04\xef\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x04\x91\x49\x44\x41\x54\x58\x85\xbd\
-\x97\x3d\x6f\x5c\x45\x14\x86\xdf\xf9\xd8\xbd\xf6\xda\x59\x27\x62\
-\x0d\x76\x0c\xf9\x07\x14\x08\x24\x0a\x6a\x04\x0d\xbf\x83\x8a\x82\
-\x86\x90\x86\x26\x22\x28\xd0\x03\x7f\x82\x86\x0a\x51\x80\x04\x48\
-\x14\x80\x04\x14\xc4\x14\xa1\x88\x64\x2d\x6b\x27\x66\x17\xdb\x7b\
-\x77\xee\xcc\x39\x87\xe2\xce\xfd\xbe\x1b\x10\x24\x8c\xb4\xbe\xe3\
-\x99\x59\x9f\xf7\xbc\xcf\xb9\x33\x63\x85\x9e\xf6\xf6\x5b\xd7\x17\
-\x69\x9a\x8e\x95\x52\x50\x4a\xe1\xd9\xe7\x5e\xc0\xf3\x2f\xbe\x84\
-\xa1\x35\x80\x48\xb5\x30\xce\xe7\x5d\x15\x3f\x80\x2a\x7f\x47\xfc\
-\xe4\x7d\xe7\x03\xbe\xfd\xfa\x2b\xfc\xf8\xc3\x77\x00\x80\x4b\xe3\
-\x4b\x73\xdb\x27\x60\x3e\x9f\x8f\xef\x1c\xde\xc1\x95\xcb\x57\xb0\
-\xb7\xb7\x07\x3b\x18\xe0\x89\xc9\x04\x9b\xc9\x10\xa8\xc5\x47\x0c\
-\x16\xb5\x54\x42\xd0\x0c\xac\x63\x7f\xe9\x32\x0c\x86\x43\xa4\x69\
-\x0a\x00\x10\x91\xcb\xbd\x02\x98\x19\xfb\xfb\x57\x31\xb0\x16\xcc\
-\x0c\x00\x30\x5a\x21\x10\x75\xd6\xaa\x7a\x3f\x06\x47\xe9\x42\x53\
-\x90\x56\x0a\x22\x52\xfe\x4d\x22\xc2\x5a\x01\x85\xd5\x45\xdf\x68\
-\x85\xed\xcd\x41\xdf\x72\x00\xaa\x72\xa0\x70\xa3\xe1\x04\xa0\xa0\
-\x70\x96\x3a\x00\x95\x00\x11\x81\xfd\xa7\xbc\x1f\xdc\x7f\x80\xd3\
-\xff\xc0\x7b\xf7\xc9\x5d\xbc\xfe\xc6\x9b\x60\xae\x39\xc0\x04\xfb\
-\x7f\xf1\x3e\x9e\x1d\x23\x10\x83\x45\x20\x31\x31\x61\x81\xed\xf2\
-\x96\x47\xc6\x1b\x2d\xde\x81\x18\x52\x73\x80\x99\x73\x01\x4d\xde\
-\x78\x64\xbc\xa5\xc5\x3b\x10\x83\x98\xbb\x02\x46\xa3\x51\x25\x00\
-\x02\x63\x14\x7c\xe8\x3a\xd0\x11\xa0\xba\xb3\x22\x02\x01\x40\x2c\
-\x1d\xde\x81\xf2\xe0\x0d\x01\x52\xdf\x58\x4a\x7b\x81\xad\xcd\x41\
-\xc3\xf2\xce\x2a\xc9\xc7\x44\x04\x22\x80\x20\x3e\x45\xc0\x22\x58\
-\x65\x1c\xe7\x2a\xde\x85\x03\x52\x73\xdc\x16\x6a\x8a\xc6\xcc\x20\
-\x62\x9c\x2d\xb3\x6e\x76\x79\x8a\x8d\xbe\xc4\x21\x69\xf5\x59\x9a\
-\x0e\x30\x33\x7c\x20\x30\xf5\x20\x68\x08\x10\x81\x27\xc6\xd0\x76\
-\xb7\x08\x81\xe4\xf6\xc4\xec\xa1\x62\xc0\xe2\x59\x38\xa1\x14\xb2\
-\x8c\x3a\xbc\xd7\xd6\x40\xbd\x11\x31\x42\x60\xfc\x49\xae\xc1\xb8\
-\x4d\x4a\x6a\x4e\xe4\xdd\x26\x8a\x22\x40\xc3\x81\x98\xbd\x3c\xac\
-\x06\x8a\x85\xc9\xc0\x34\xc6\x0b\x31\xc5\x72\x15\xb7\xd5\x68\x44\
-\xa7\x46\xfa\x78\x7f\xfe\xe9\x27\xb8\x77\xf7\xd7\xbf\x41\xc0\x8c\
-\x40\x04\x1f\x18\xfd\x4d\x22\xff\xba\x20\xe9\x38\xa1\x14\x3a\xbc\
-\xbf\xff\xe6\x8b\x4e\xac\x2e\x02\x66\xf8\xc0\x30\x5a\xaf\x09\x1f\
-\x7f\x4a\x95\x75\x89\xa3\xfe\x36\xb0\x80\xa4\x29\x40\x7a\x92\xb5\
-\x7d\x83\x81\x18\x81\x64\x4d\x0d\xd4\xdf\x82\xca\x13\x29\x1d\x89\
-\xfd\xe8\x40\x9d\x77\x3b\x59\xe9\x73\xe0\x97\x9f\x7f\xc2\x32\x75\
-\xdd\xf7\xbe\x19\xbf\xdd\x8d\x8e\x34\xbf\xd5\xe6\xfd\xfb\x6c\x06\
-\x62\xc2\xfe\x53\x7b\x95\x03\xdc\x2a\xc2\xd9\xf4\x08\xb3\xe9\xd1\
-\xba\xf0\xff\xba\x31\x33\x76\xc6\x63\x2c\xd3\xb4\x79\x1f\x68\x23\
-\x78\x5c\xad\x08\xaa\x95\x02\xc5\x83\x4e\x29\xd5\x45\xf0\xb8\x9a\
-\xc4\x1a\x10\x11\x84\x10\xca\xbb\xe4\x5a\x01\x2f\xbf\xfa\x0a\x26\
-\x93\x49\x0e\xba\xdc\x03\xea\x05\x90\x4f\x28\x5d\x4c\x02\xab\xd5\
-\x0a\x1f\x7f\xf4\x21\xb4\x36\x10\x91\x0e\x6f\x22\x02\x94\xc2\xb0\
-\xb8\x27\x88\xac\x17\x70\x70\x70\x80\xf1\x78\x8c\xdb\xb7\xde\x2b\
-\x95\xa7\x69\x8a\x9b\xb7\xde\xad\xdd\x88\x54\x79\xe0\x28\xa5\x60\
-\x8c\xc1\xd6\x68\x0b\xc3\xe1\x10\x22\xd2\xe1\xed\x43\xc8\x1d\xf0\
-\xbe\xc4\x60\xa9\xe7\xe2\x01\x00\xce\x39\x64\x59\x06\xef\x7d\x99\
-\xc1\xc5\x72\x89\x34\x4d\x1b\x02\xea\xcd\x18\xd3\xb8\xb5\xb4\x79\
-\x93\xf7\x50\x5a\x23\x4d\x53\x68\xad\x41\x21\xac\x17\xb0\x5a\xad\
-\x90\x24\x09\xa8\x78\x8d\x88\xe0\xbd\x47\x88\x59\x54\x24\xa4\x0c\
-\x60\xad\x85\x48\x7e\xa0\x49\x0f\xef\xcc\x67\x60\x16\x5c\xda\xde\
-\x86\x73\x0e\xda\x18\xd8\x10\x42\xaf\x80\x2c\xcb\xb0\x5a\xad\x40\
-\x71\x9e\x99\xe1\xbd\x87\x73\xae\x0c\x58\x7f\x8a\x08\x88\x08\x44\
-\x01\x46\x2b\x30\x4b\x87\xb7\xf7\x01\xc2\x8c\x65\xbc\x27\x6a\x91\
-\xf5\x0e\x14\xf6\x13\xe7\xf3\x39\xc3\xca\x81\xa2\x2e\x0a\x01\xcc\
-\x0c\x63\x4c\x99\x31\xb3\x74\x78\x33\x51\x2e\x34\x26\x25\x5a\xb3\
-\xa5\x87\x38\xe0\x9c\x43\xc8\x7c\x7e\xc5\x8a\x08\x2e\x2e\x2e\xca\
-\xcc\xdb\x27\xa9\x31\x06\x3e\xf3\xe5\x19\xdd\xe6\x3d\x9d\x1d\x7f\
-\x50\x90\xd3\x46\x11\x13\x4d\x2d\x11\x4d\x01\xec\xaf\x73\xe0\x8f\
-\xc5\x1c\xce\x65\x20\x26\x30\x33\x9c\x73\x60\xe6\x46\x01\x16\x7d\
-\xad\x75\x5e\xb4\x22\xf1\x42\xda\xe4\x7d\x3a\x3f\x7d\x1f\xb5\x33\
-\x0c\x80\xb7\x8b\xf9\xf9\x6b\x9b\x5b\xc9\x67\x5a\xeb\x49\x9f\x80\
-\xeb\x37\x6e\x94\x63\xc5\xab\x58\xff\xf7\x4a\xc7\x53\x53\x44\x4a\
-\x01\xd5\x3d\xb0\xe2\x6d\xf2\xb1\x14\xc0\xb2\x26\x02\xf6\xf0\xee\
-\xe1\xbd\x9d\x9d\x9d\xdb\xcf\x5c\x3d\xb8\x69\x8d\xd9\x28\x26\x88\
-\x08\x21\x04\x9c\x9d\x9d\x95\x01\x72\xb6\xd5\x35\xbb\xfe\xd4\x5a\
-\x97\x9b\x8d\xae\x17\x66\x8d\x77\x74\xfa\xb7\x86\x00\x00\xe7\x8b\
-\xc5\xe2\x4b\xe7\xdc\x3b\xa3\x8d\xd1\x2e\x00\xb9\x76\xed\xe9\xc1\
-\xc9\xc9\xc9\x6e\xba\x5c\x26\xc3\x24\x19\x5a\x6b\x93\x81\xb5\x43\
-\x6b\xcc\x40\x19\x63\x01\x28\x66\x0e\x44\xe4\x89\x28\x0b\x21\x64\
-\x59\x96\xb9\xf3\xf3\xf3\x2c\xd9\x48\xee\x1f\x1d\x4d\x57\xa8\x76\
-\x84\x92\x37\x80\x73\xb4\x0e\xd1\xbf\x00\x32\xe8\x7c\x30\xa4\x00\
-\xf0\x11\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\x56\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x01\x23\x50\x4c\x54\
-\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xff\xff\xe8\x1d\x22\xbd\x00\x00\x00\x5f\x74\x52\x4e\x53\
-\x00\x11\x17\x4b\x60\x50\x64\x08\x0c\x58\x6b\x5e\x94\x92\x91\xb4\
-\xbd\x93\x96\x10\x0e\x18\x14\x61\x72\x23\x77\x80\x06\x34\x4d\x19\
-\x1d\x4a\x04\x6f\x51\x0f\xac\xab\x1b\xb2\xf4\x70\x75\x39\xf2\x38\
-\xb1\xf1\xce\x4e\x24\xdc\xfa\x01\x3d\x2e\x53\x4f\xe5\xcf\x32\x0a\
-\xe4\x1c\x49\x88\xe0\xcd\x62\xc7\xf8\xcb\x5f\xf9\x2f\xea\x05\x8c\
-\xfc\xd8\x6d\xb5\xc1\xc0\xc2\xa5\xaa\xbf\xdb\x59\x09\x07\x69\x92\
-\x99\x57\x06\x00\x00\x00\x01\x62\x4b\x47\x44\x60\xc5\xb7\x7c\x10\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x55\xe6\x00\x00\x55\xe6\
-\x01\x39\xc6\x90\x1a\x00\x00\x01\x2b\x49\x44\x41\x54\x38\xcb\xa5\
-\xd2\xd9\x52\xc2\x30\x14\x06\xe0\x20\x62\xb1\xda\x52\x90\x52\xc5\
-\x2a\xa2\x20\x2a\x88\xda\xb2\xa8\x68\x8b\xca\xa2\xb8\x2b\xb8\x51\
-\x3d\xef\xff\x16\x86\x42\xb1\xa4\x99\x86\x19\xff\x8b\x4c\x26\xff\
-\x97\x4c\x2e\x0e\x42\xd3\x24\x30\xc3\x00\xc1\x59\x06\x08\xcd\xfd\
-\x07\x70\xe1\x30\x37\xcf\xe3\x95\x08\xe7\x80\x85\x45\x41\x8c\x48\
-\xa2\x40\x24\x1a\xe3\x97\x86\x20\x2e\xcb\x09\x65\x39\x21\x93\x59\
-\x49\xae\xaa\xfe\x7f\xe0\x62\x6b\x8c\x4f\x26\xd7\x29\x20\xa5\x28\
-\xb2\xbd\xd9\x48\x6f\x6e\x65\xbc\x20\xbb\x0d\x90\xcb\xe2\xcd\xce\
-\xee\x5e\xbe\x10\xf2\x82\xfd\x22\x40\xf1\x00\xf7\x87\x00\x47\x9a\
-\xee\x05\xa5\x32\x40\xb9\x64\xf7\x00\x15\x02\x54\x8f\x4f\x50\xf5\
-\x54\x92\x6a\xa3\xde\x03\xf4\xb3\x73\x03\x21\xd3\x74\x7a\x12\xe8\
-\x75\x00\xcd\x40\x68\xdc\x13\x60\xd0\xdb\xe2\xc2\xe9\x27\xc1\x65\
-\x7d\x78\xa8\x19\x57\x40\x01\x7a\xae\xe1\x9c\x36\x5b\x6d\x1a\xb8\
-\x1e\x5f\x83\x9b\x4e\xdb\x0b\x6a\x15\xa0\x08\x17\x48\xdf\x02\x45\
-\xb8\xc0\xdd\x3d\x50\x84\x0b\x3c\x3c\x3e\x4d\x88\x26\xff\x3c\x00\
-\x1d\x3c\x46\xf1\xd1\x58\xbd\xbc\x76\x7b\x7f\x79\x7b\xff\xe8\xf6\
-\x3e\xbf\x22\xa2\x10\xed\x3b\x8f\xa8\x96\x3b\xa6\x69\x59\x6a\xa1\
-\x8f\x47\xf9\xdb\x67\xde\xf3\x19\xe4\x1f\x26\xf8\x09\x32\x80\x1c\
-\x40\xd3\xe4\x17\x77\x9a\x6a\xc3\xa4\xdc\xa9\x65\x00\x00\x00\x25\
-\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\
-\x32\x30\x32\x30\x2d\x30\x35\x2d\x30\x34\x54\x31\x33\x3a\x34\x32\
-\x3a\x33\x30\x2b\x30\x31\x3a\x30\x30\x44\xfd\xe9\x4e\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\
-\x00\x32\x30\x32\x30\x2d\x30\x35\x2d\x30\x34\x54\x31\x33\x3a\x34\
-\x32\x3a\x33\x30\x2b\x30\x31\x3a\x30\x30\x35\xa0\x51\xf2\x00\x00\
-\x00\x46\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x49\
-\x6d\x61\x67\x65\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x37\x2e\x38\
-\x2d\x39\x20\x32\x30\x31\x39\x2d\x30\x32\x2d\x30\x31\x20\x51\x31\
-\x36\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\
-\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\x41\x7b\xe2\xc8\
-\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\
-\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\
-\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\
-\x00\x35\x31\x32\xc0\xd0\x50\x51\x00\x00\x00\x17\x74\x45\x58\x74\
-\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\
-\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\
-\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\
-\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\
-\x54\x69\x6d\x65\x00\x31\x35\x38\x38\x35\x39\x36\x31\x35\x30\xdf\
-\x8b\x24\x18\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x53\x69\x7a\x65\x00\x36\x2e\x36\x38\x4b\x42\x42\xfb\x32\
-\x63\x70\x00\x00\x00\x5b\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\
-\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x66\x71\x7a\x5a\x51\x4a\x44\
-\x2f\x32\x33\x33\x34\x2f\x63\x72\x6f\x70\x5f\x69\x6d\x61\x67\x65\
-\x5f\x70\x68\x6f\x74\x6f\x5f\x75\x73\x65\x72\x5f\x69\x6e\x74\x65\
-\x72\x66\x61\x63\x65\x5f\x69\x63\x6f\x6e\x5f\x31\x34\x32\x33\x34\
-\x34\x2e\x70\x6e\x67\xbe\x14\x1e\x89\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x09\x10\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x03\x00\x00\x00\x9d\xb7\x81\xec\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x03\x00\
-\x50\x4c\x54\x45\x3d\x9a\xe2\x00\x00\x00\x3e\x99\xe2\x35\x91\xdb\
-\x3d\x9a\xe1\x3d\x9a\xe3\x3d\x9a\xe2\x3d\x9a\xe2\x3c\x9a\xe2\x3b\
-\x99\xe2\x3b\x99\xe2\x3c\x9a\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3d\x9a\
-\xe2\x3d\x9a\xe2\x3c\x99\xe2\x3c\x99\xe2\x3d\x9a\xe2\x3d\x9a\xe2\
-\x3d\x9a\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3c\x99\xe2\x3d\x9a\xe2\x3d\
-\x9a\xe2\x3d\x9a\xe2\x3b\x99\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3b\x99\
-\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3b\x99\xe2\x3d\x9a\xe2\x3d\x9a\xe2\
-\x3c\x99\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3c\x99\xe2\x3d\x9a\xe2\x3d\
-\x9a\xe3\x3c\x99\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3c\x99\xe2\x3d\x9a\
-\xe2\x3c\x9a\xe2\x3d\x9a\xe2\x3c\x9a\xe2\x3d\x9a\xe2\x3d\x9a\xe2\
-\x3c\x9a\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3d\
-\x9a\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3d\x9a\xe2\x3c\x9a\xe2\x3d\x9a\
-\xe2\x3d\x9a\xe2\x3b\x99\xe2\x3c\x99\xe2\x3d\x9a\xe2\x3a\x98\xe2\
-\x44\x9e\xe4\x57\xa7\xe8\x5d\xaa\xe9\x5c\xaa\xe9\x50\xa3\xe6\x3c\
-\x9a\xe2\x55\xa6\xe6\x6d\xb3\xe9\x59\xa9\xe6\x4d\xa2\xe6\x58\xa8\
-\xe8\x45\x9e\xe4\x3e\x9a\xe2\x65\xae\xeb\x9e\xcb\xf8\xb5\xd7\xfd\
-\xb9\xd9\xfe\xbb\xda\xfe\x86\xbf\xf2\x3a\x98\xe1\x9b\xcb\xf0\xfb\
-\xfd\xfe\xf8\xfc\xfe\xf8\xfb\xfe\xf9\xfc\xfe\xfa\xfc\xfe\xfc\xfd\
-\xfe\xab\xd3\xf2\x3a\x99\xe1\x7b\xb9\xf0\xba\xda\xfe\xb6\xd7\xfd\
-\xa0\xcc\xf8\x6a\xb1\xec\x3e\x9b\xe2\xbf\xdc\xff\xbe\xdb\xff\xbd\
-\xdb\xff\xc0\xdc\xff\x89\xc0\xf3\x9e\xcc\xf0\xff\xff\xff\xef\xf7\
-\xfd\xd1\xe7\xf8\xcf\xe6\xf8\xe5\xf2\xfb\xaf\xd5\xf3\x7d\xba\xf0\
-\xb7\xd8\xfd\x72\xb5\xee\x88\xc0\xf3\xec\xf5\xfc\x77\xb8\xeb\x42\
-\x9d\xe3\x41\x9c\xe2\x5e\xab\xe7\x6d\xb2\xed\xb8\xda\xf4\x54\xa6\
-\xe7\x71\xb5\xee\x62\xad\xea\x89\xc2\xed\xaf\xd6\xf3\xbe\xdc\xff\
-\xb3\xd6\xfd\x66\xaf\xeb\x9d\xcb\xf8\x3e\x9b\xe3\x7c\xbb\xeb\xae\
-\xd4\xfc\x5f\xab\xea\x7d\xbb\xeb\xa9\xd1\xfa\xa4\xce\xf9\x54\xa5\
-\xe7\x9f\xcc\xf8\x4e\xa3\xe6\x98\xc8\xf7\x49\xa0\xe5\x90\xc4\xf5\
-\x46\x9f\xe4\x7e\xbb\xf0\xc1\xdd\xff\x8b\xc1\xf4\x43\x9d\xe3\xb0\
-\xd6\xf3\x6b\xb1\xec\x84\xbe\xf2\x80\xbd\xec\xbc\xdb\xff\x85\xbe\
-\xf2\x41\x9c\xe3\xd5\xe9\xf9\x50\xa4\xe5\x3a\x99\xe2\x3e\x9a\xe3\
-\xae\xd5\xf3\x3f\x9b\xe2\x9d\xcc\xf0\xfe\xfe\xff\xc8\xe2\xf7\x8e\
-\xc4\xee\x8c\xc3\xee\xb2\xd7\xf4\xb7\xd8\xfe\x6c\xb2\xed\x8d\xc3\
-\xf4\x86\xc0\xed\xfc\xfe\xff\xfd\xfe\xff\x95\xc8\xef\xa1\xcd\xf8\
-\xa8\xd0\xfa\x4c\xa2\xe5\x46\x9f\xe3\x90\xc5\xee\x47\x9f\xe3\x4b\
-\xa1\xe5\x92\xc5\xf5\x8e\xc3\xf4\xab\xd2\xfb\x91\xc5\xf5\xaa\xd1\
-\xfb\xb6\xd8\xfd\x8f\xc3\xf5\x9a\xc9\xf7\x60\xac\xea\x39\x98\xe1\
-\x5f\xac\xea\x99\xc9\xf7\x40\x9b\xe2\x6e\xb3\xe9\x8d\xc4\xee\x40\
-\x9c\xe2\x46\x9e\xe4\x8f\xc3\xf4\xa6\xd0\xfa\x4c\xa1\xe5\xa8\xd2\
-\xf2\xf5\xfa\xfe\xf6\xfa\xfe\xad\xd4\xf3\xa5\xcf\xfa\x96\xc8\xef\
-\x9c\xcb\xf0\x3b\x99\xe1\x74\xb6\xef\xb8\xd9\xfe\x49\xa0\xe4\xd8\
-\xeb\xf9\xc4\xe0\xf6\xc3\xe0\xf6\xb4\xd6\xfd\x5c\xaa\xe7\xee\xf6\
-\xfc\xd9\xeb\xf9\x4a\xa1\xe4\x37\x97\xe1\x38\x98\xe1\x5c\xaa\xe6\
-\xb4\xd7\xfd\x52\xa5\xe7\x5f\xac\xe7\xf0\xf7\xfd\xf4\xf9\xfd\xa7\
-\xd1\xf2\xf1\xf8\xfd\xa4\xd0\xf1\x8b\xc3\xee\xa2\xcf\xf1\xda\xec\
-\xfa\x51\xa4\xe5\xce\xe6\xf8\xe7\xf3\xfb\x6a\xb2\xe9\x6c\xb2\xe9\
-\xe1\xef\xfa\x68\xb0\xe8\x66\xb0\xe8\xe8\xf3\xfc\x68\xb0\xec\xaf\
-\xd4\xfc\x52\xa4\xe7\xea\xf4\xfc\x56\xa7\xe8\x5a\xa9\xe9\x45\x9e\
-\xe3\x69\xb1\xe9\x14\x2d\x12\x89\x00\x00\x00\x40\x74\x52\x4e\x53\
-\x00\x00\x00\x00\x00\x00\x1d\x80\xd5\xf6\xf7\xd8\x85\x22\x2c\xbe\
-\xfd\xfe\xc7\x36\xbd\xd0\x32\xfc\xc8\x28\xbc\xf5\xac\x16\xfe\x9f\
-\x10\xfd\x95\x0c\xfa\x84\x06\xf5\x71\x03\xf0\x64\x02\xeb\x58\xe5\
-\x4a\xda\x3c\x21\xfe\x91\x8d\x1f\xc0\xc6\x30\xc3\x8a\xd7\x8e\x20\
-\x4b\x1e\xef\xaf\x00\x00\x00\x01\x62\x4b\x47\x44\x6d\xbb\x06\x00\
-\xad\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\
-\xc4\x01\x95\x2b\x0e\x1b\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe4\
-\x0c\x11\x09\x38\x10\x69\xad\xb9\xdf\x00\x00\x03\x40\x49\x44\x41\
-\x54\x58\xc3\x63\x60\x60\x60\x63\xe7\xe0\x74\x40\x02\x8e\x4e\x0e\
-\xce\x58\x81\x83\x93\xa3\x03\x17\x37\x0f\x2f\x03\x03\x23\x02\x30\
-\x30\xf0\xf1\x0b\xb8\xb8\xba\xb9\xc3\x81\x9b\x87\xa7\x97\x37\x56\
-\xe0\xe3\xe9\xeb\xe6\xe7\x2f\x28\x24\xcc\xc0\x84\x64\x00\x9b\x48\
-\x40\x60\x50\x70\x08\x02\x84\x86\x85\x47\x44\x46\x21\x40\x74\x4c\
-\x24\x08\xc4\x46\xc5\xc5\x27\x24\x26\x25\xa7\xa4\xa6\x89\x8a\x21\
-\xb9\x81\x81\x5d\x3c\x30\x38\x3d\x23\x13\x01\xb2\xb2\xc3\x73\x72\
-\x91\x41\x5e\x7e\x01\x10\x14\xe6\xe6\x16\x25\x14\xa7\x67\xa6\x97\
-\x94\x3a\x49\x48\x22\x4c\x60\xe0\x70\x09\x4a\xcf\x44\x06\xe9\x65\
-\xa8\x06\x94\x57\x54\x56\x01\x41\x75\x3e\xc4\x80\xcc\x8c\xe0\x1a\
-\x27\x29\x36\x84\x01\xd2\xae\xc1\x19\x78\x0d\xa8\x75\xac\x2b\xad\
-\x2f\x6d\x70\x6e\xcc\x6d\x02\x1b\x90\xd9\xdc\xd2\xea\x28\x23\x0b\
-\x33\x81\xc1\xc1\x2d\x24\x13\xaf\x01\x45\xe1\xc5\xe9\x19\x59\x6d\
-\xed\x1d\x30\x03\x32\x9b\x3b\xbb\xe4\xe4\x15\x18\x60\x06\xb8\x13\
-\x32\x00\xec\xf3\xb6\xf6\x6e\xb8\x01\x99\xe9\x3d\x7e\x8a\x4a\xca\
-\x0c\xe4\x1b\x90\x99\xde\xdb\xa7\xa2\xaa\xc6\x40\xbe\x01\x99\xe9\
-\xfd\x13\xd4\x35\x34\x19\xc8\x37\x20\xb3\x79\xe2\x24\x2d\x6d\x1d\
-\x06\xf2\x0d\xc8\xcc\x98\x3c\x45\x57\x8f\x99\x81\x28\x03\xa6\x4e\
-\x4b\x9f\xd6\x8f\x14\x0b\x50\x30\x7d\x86\xbe\x01\x0b\x2b\x61\x03\
-\x66\x86\xcf\x0a\x6a\xeb\x9f\xed\x39\x07\xdd\x80\xb9\xf3\xe6\x1b\
-\x1a\x31\x10\x36\x60\xc1\xc2\x45\x01\x01\x8b\x1d\xe7\x2f\x81\xa6\
-\x44\x04\x08\x4d\x5c\x2a\x64\x8c\xd5\x80\x65\xc8\x06\x2c\x5f\xb1\
-\x72\x15\x10\xac\x8e\x06\x27\x29\x64\x95\x19\x6b\xd6\x9a\x98\x62\
-\x31\x60\x9d\xf3\xfa\x0d\xb9\x58\xc0\xc6\x4d\x0e\xd9\x68\xd9\x66\
-\xb3\x3f\x37\xa6\x01\xcd\x5b\xb6\x6e\x5b\x39\xb3\x08\x03\xcc\xdc\
-\xbe\x63\xe7\x96\x66\x54\xb5\xc1\xae\x9c\x98\x06\x64\x66\xee\x9a\
-\xe0\xe8\x80\x05\x38\xfa\xee\x46\x57\x19\xe2\xe6\x80\xcd\x80\xcc\
-\x3d\x7b\xcb\xb0\x80\xbd\xfb\x30\x14\x86\xb8\x63\x37\xa0\x39\x1d\
-\x2b\x68\x26\xda\x00\xa2\xc1\xa8\x01\xa3\x06\x0c\x5f\x03\xd2\x09\
-\x02\xbc\x06\xa4\xef\xef\x3f\x50\x86\x17\xec\xee\xdf\x9f\x8e\xc7\
-\x80\x83\x87\xe6\x3b\x1f\xc6\x0b\x9c\xe7\x1f\x39\x8a\xd3\x80\x8c\
-\xbd\x53\x8e\x1d\x5f\x75\x02\x2f\x58\x75\xfc\xe4\xa9\xd3\x38\x0c\
-\x68\x3e\x73\x76\xc7\xb9\xf3\xb9\x04\xc0\x85\x8b\x3b\x76\x5e\x6a\
-\xc6\x6a\x40\x46\xa2\xc3\xe5\x8d\x84\xf4\x03\x8b\xf9\x2b\x57\xaf\
-\x61\x77\xc1\x75\xf7\x1b\x37\xc1\x4a\x62\x6e\x15\x61\x03\x4b\x6e\
-\xc7\x80\xa5\x6f\xde\x70\xbf\x8e\xcd\x80\x8c\x3b\x75\x77\xef\x81\
-\x55\xdc\x7f\xf0\xf0\x11\x16\xf0\xf0\xc1\x7d\xb0\xf4\xbd\xc7\x75\
-\x4f\x32\xb0\x19\xd0\xf2\xf4\xd9\x73\xb0\x8a\x17\xe7\xb0\x86\xe4\
-\xaa\x97\x2f\xc0\xd2\xcf\x9f\x3d\x6d\xc1\x6f\x00\x01\x30\x6a\x00\
-\x5d\x0c\x78\xf5\x7a\x15\x36\xf0\xe6\xed\x2b\x22\x0d\x78\xf7\x7e\
-\xe9\x49\x2c\x60\xe9\xfb\x77\x44\x1a\x10\x79\xf3\x43\x01\x16\xf0\
-\xe1\x66\xe4\x90\x09\xc4\xe1\x60\x40\x6c\x74\x14\x16\x10\x1d\x8b\
-\xdd\x00\x37\x0c\x03\x3e\x76\x7c\xfa\x8c\x05\x7c\xea\xf8\x88\x61\
-\x00\xb0\x99\x07\xef\x74\x21\x0c\xf8\xf2\x75\xe1\x7b\x2c\x60\xe1\
-\xb7\x2f\x68\x06\x64\x04\xbb\x4a\x23\xba\x7d\x48\x5e\x78\xf5\x1d\
-\x2b\x78\x8e\xee\x85\xf4\x7e\x17\x0e\x60\xc7\xf3\x07\xa4\xe3\x49\
-\x72\x20\x66\xa4\x27\xa7\x0a\x98\x31\x98\x5b\xa4\xfd\xe8\x07\x77\
-\x7d\x7f\xfe\xaa\xfe\x1d\x13\x45\x10\xc4\xfc\xae\xfe\xf5\x13\xa4\
-\x3e\xb8\x3f\x35\xcd\xd2\x9c\x81\xc1\xca\x5a\xc0\xe5\x0f\xb0\xf3\
-\xed\xf6\xb7\xf2\xdf\x7f\x6f\x22\xc0\xff\x7f\x95\x7f\x41\xea\x5d\
-\x5d\x04\x80\xfd\x70\x20\x60\xb3\xb1\x95\x06\xb7\xa6\x9d\x3c\x9d\
-\x89\x02\x9e\x4e\x60\xe5\x9c\xb6\x76\xf6\x0c\x0c\x00\x65\x10\xea\
-\x3b\xdc\xce\x7e\xf7\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x30\x2d\x31\x32\
-\x2d\x31\x37\x54\x30\x39\x3a\x35\x36\x3a\x31\x35\x2b\x30\x30\x3a\
-\x30\x30\x02\x5e\x91\xa7\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
-\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x30\x2d\x31\
-\x32\x2d\x31\x37\x54\x30\x39\x3a\x35\x36\x3a\x31\x35\x2b\x30\x30\
-\x3a\x30\x30\x73\x03\x29\x1b\x00\x00\x00\x20\x74\x45\x58\x74\x73\
-\x6f\x66\x74\x77\x61\x72\x65\x00\x68\x74\x74\x70\x73\x3a\x2f\x2f\
-\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\xbc\
-\xcf\x1d\x9d\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\
-\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x48\x65\x69\
-\x67\x68\x74\x00\x35\x31\x32\x8f\x8d\x53\x81\x00\x00\x00\x17\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\
-\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\
-\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\
-\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\
-\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x36\x30\x38\x31\x39\x38\x39\
-\x37\x35\x02\xe2\xf1\xf8\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x31\x32\x33\x35\x34\x42\
-\x42\x2f\xa6\xe7\xde\x00\x00\x00\x62\x74\x45\x58\x74\x54\x68\x75\
-\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\
-\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x59\x72\x52\x47\
-\x41\x53\x76\x2f\x32\x37\x34\x34\x2f\x66\x6c\x6f\x70\x70\x79\x5f\
-\x64\x69\x73\x63\x5f\x73\x61\x76\x65\x5f\x73\x74\x6f\x72\x61\x67\
-\x65\x5f\x64\x69\x73\x6b\x5f\x63\x6f\x6d\x70\x75\x74\x65\x72\x5f\
-\x69\x63\x6f\x6e\x5f\x31\x37\x35\x39\x32\x32\x2e\x70\x6e\x67\x80\
-\x00\x9b\xf1\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x14\x64\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x14\x06\x49\x44\x41\x54\x78\x9c\xe5\
-\x9b\x7f\x8c\x5c\xd7\x75\xdf\x3f\xe7\xde\xf7\xe6\xcd\xcc\xce\xce\
-\x72\x67\x77\xf9\x9b\x12\x69\xcb\xb4\x4a\xfd\x8a\x7f\x34\x28\xea\
-\xd8\x96\xe0\x1f\xad\xed\xa0\x48\x02\xc8\x01\xdc\xda\xad\xeb\x16\
-\xf9\xd1\x00\x49\xd1\x22\x68\x0b\x04\x92\xd0\xe6\x8f\xa4\x01\x5a\
-\x14\x45\xeb\x3a\x48\x5d\xb7\x4d\x81\x48\x81\x1b\x28\x71\x5b\xc7\
-\x91\x25\xd7\x8e\xed\x38\xb6\x15\x5b\x22\x25\x4b\xa6\x25\x5a\x22\
-\x29\x72\xc9\xfd\x35\xb3\x33\xef\xc7\xbd\xe7\xf4\x8f\x37\xbb\x5c\
-\x72\x97\xcb\x25\x45\xc9\x01\x7a\x80\x8b\xf7\xde\xdc\x1f\xef\x9e\
-\xef\x3d\xe7\xdc\x73\xce\x7d\x03\xff\x9f\x93\xbc\x5e\x2f\xfa\xea\
-\x92\xf5\x06\x2b\xdc\x35\x8c\xd5\x5f\x89\x66\x6f\x72\x4e\xf6\x99\
-\xd1\xf1\x42\xa6\xe2\x2a\xd0\xa1\xa9\x9c\x77\xce\x4e\xb6\x9c\x3c\
-\xdb\x94\xea\xe9\x77\x1d\x68\xbd\x2c\x22\xf6\x5a\xce\xeb\x35\x03\
-\xc0\xcc\xe4\xdb\x17\xaa\xb7\x9e\xea\xcb\xcf\x88\xf0\xfe\x88\xdd\
-\xa5\x2a\x19\x18\x89\x03\xef\x04\x0f\x38\x01\xb5\xba\x44\x20\x68\
-\xcd\xaf\x17\x62\xe2\xe4\xa4\x19\x5f\xec\x35\xf9\xec\xf4\x9e\xe4\
-\x4b\x77\x8a\x94\x37\x7b\x9e\x37\x1d\x80\xa7\x9f\x3e\xd7\x79\xae\
-\xd5\xfd\x68\x65\xfc\x9c\x9a\xbb\x07\x20\x18\x34\xbd\xb0\x2b\x13\
-\x3a\x29\x34\x9c\xe0\xb6\x78\xb3\x19\x54\x66\xac\x56\xb0\x5c\x1a\
-\xab\xc1\xf0\x52\xb7\x75\xd8\xcb\x89\xf0\x99\x7d\x69\xff\x93\x7f\
-\xed\xd0\xec\xcb\x37\x6b\xbe\x37\x0d\x80\xc7\x1f\x7f\xa1\xb9\x70\
-\xcb\xee\x5f\x28\xd5\xff\xaa\x19\x7b\x4b\x85\x3c\x1a\xbb\x9b\x8e\
-\xbd\x6d\x47\xc3\x0b\xd7\x23\xcb\x02\x04\x33\x2e\xe6\xc6\xd9\xa1\
-\xe2\x04\xda\x89\xe0\x84\x61\x42\xfc\x9d\xc3\xad\xf0\x2f\xdf\xba\
-\xbf\x3b\xff\x6a\xe7\x7d\x53\x00\xf8\xa3\xe7\xfb\xf7\x2d\xc7\xe4\
-\xdf\x9b\xc8\xb1\x3c\x1a\x83\xd2\x98\xce\x84\x37\x4c\x79\x1a\xee\
-\xfa\x18\xdf\x8a\xcc\xe0\xa5\xd5\xc8\x99\xa1\xd2\xf6\x42\x27\x15\
-\x9c\x63\xbe\xe3\xec\xd7\x3e\x74\xa4\xf9\xdb\x22\xa2\x37\x3a\xf6\
-\xab\x02\xe0\x2f\xce\x9e\x9d\x78\x76\xb1\xf3\xaf\x4b\x49\x7f\xbe\
-\x8a\x2a\x2b\x95\x51\xa9\x71\xdb\xae\x84\xbd\x6d\x87\xde\x44\xf3\
-\x25\x40\xbf\x32\x9e\x59\x0c\x18\x30\x99\x0a\xed\x54\x68\x3a\x7b\
-\x62\xb6\xc9\xc7\xde\x7d\xb0\xfd\xd2\x8d\x8e\x7b\x43\xf4\xf8\x0b\
-\x8b\x87\x5f\x1e\x35\xfe\x20\x28\xf7\xac\x54\xc6\x28\x28\x06\xdc\
-\x39\x9b\x32\xd5\x70\xaf\x7a\xd5\xaf\x46\x65\x34\x9e\xba\x18\x28\
-\xa2\xd1\xf4\x42\x2f\x73\x34\x13\x39\x37\xdd\x08\x7f\xfb\xfd\x87\
-\x27\x1f\xbb\xde\xf1\x6e\x08\x80\x47\x9f\x1f\xbc\x75\x21\xb7\xcf\
-\x95\xca\xde\xc5\x42\x29\xc7\x02\x78\xe7\x6c\xca\xae\xec\xb5\x63\
-\x7e\x8d\xaa\x68\x3c\x39\x5f\x51\x29\xa4\x1e\xa6\x1b\x8e\x4e\xc3\
-\x15\xbb\x12\xfd\x85\x0f\xdd\xd6\xf9\xf4\xf5\x8c\x75\xdd\x00\x3c\
-\xfa\xec\xd2\x5f\x9d\x2f\xfd\xe7\x47\x95\x4e\x2f\x95\x4a\xa5\x60\
-\xc0\x1b\xa6\x52\x0e\x4c\xfa\xeb\x1d\xee\x86\xa9\x5f\x2a\xdf\xbd\
-\x50\x01\x90\x08\x74\x1b\x8e\x5e\xd3\xe9\x74\xa2\xff\xe8\x43\x47\
-\xbb\x9f\xdc\xe9\x38\xd7\x05\xc0\x67\x4f\x2c\x1f\xbd\x58\xf0\xe5\
-\x61\xa5\xbb\x17\x72\x25\x5a\x3d\xc2\x64\xe6\xb9\x7b\xae\x71\x7d\
-\x1c\xdc\x04\x7a\x71\xa5\xe2\x74\x3f\x22\x52\xfb\x13\xbb\x32\xc7\
-\x4c\xcb\x85\x5e\x43\x3e\xf2\x93\x6f\x9a\x7c\x64\x27\x63\xec\x18\
-\x80\x3f\xf9\xee\xc9\x3d\x2f\x84\x99\xaf\x0f\xca\x78\xf8\xe2\x48\
-\x09\x66\x20\x02\x02\x77\xcf\x65\x74\x1a\xee\xc6\x39\xb9\x41\x52\
-\x33\xbe\xf9\x4a\x41\x1c\xab\xa0\x77\xd0\x6b\x7a\x66\xdb\x7e\x34\
-\x93\x8c\xde\xf7\xa1\xdb\xf7\xfc\xe9\xb5\xc6\xd8\x11\x00\x0f\x3f\
-\xfc\xb0\x5f\xbe\xed\xbd\x9f\x1f\xe4\xfa\x9e\xf9\x61\xa8\x75\xde\
-\x81\x88\xd0\x69\x38\xee\xde\x9d\x61\xaf\xb5\xe2\x5f\x85\x4e\xad\
-\x54\x9c\x1e\xc4\x75\x46\x52\x81\xd9\xb6\x67\xae\xed\xcf\xec\xb3\
-\xfc\xad\xef\xbd\x7b\xef\xb9\xed\xfa\x27\x3b\x79\xc9\xf0\x8d\xef\
-\xf9\xa7\xfd\x51\x78\xcf\xfc\x20\x90\x6b\xbd\xf2\x62\x82\x89\xd1\
-\xcb\x12\xca\xf0\x23\xe2\x1e\x98\xce\x1c\x3f\x5c\x2a\xd7\x01\x88\
-\xc0\xf9\x81\x92\x60\xfb\x93\x4e\xf3\xb7\x81\xbf\xb5\x5d\xff\x6b\
-\x4a\xc0\x67\xff\xec\xe5\xa3\x2f\x85\xec\xc9\xf9\x41\xd1\x5e\x2e\
-\xb4\x16\xfb\xf1\xea\x23\xc2\x3d\x7b\x9b\x34\xfd\xeb\x2f\xfe\x6b\
-\x64\xc0\x93\xaf\x8c\xd6\x63\x88\x35\x9a\x48\x85\x43\xdd\x8c\x7d\
-\x2d\xfd\x3b\x3f\x75\xe7\xdc\xef\x5e\xad\xff\x35\x25\xe0\x6c\x4c\
-\xfe\xcd\xf2\x6a\xde\x5e\x1a\x06\x82\x81\x78\x01\x13\x44\xc0\x3b\
-\x87\xa8\x51\x5a\x7c\xf5\x9c\xdc\x20\x09\x90\x8a\x31\x0a\x97\xcf\
-\xa1\x1f\x60\xde\x41\xcb\x67\xbf\xf9\x07\x5f\xf9\xca\xa3\x3f\xf5\
-\x13\x3f\xd1\xdf\xaa\xff\xb6\x00\x7c\xe6\xff\xfe\xe0\xdd\x67\xf3\
-\xf8\xc1\x0b\xfd\x92\x3c\x28\x38\x41\xcc\x21\xe3\x48\xc6\x25\x46\
-\x50\x7d\xcd\xf7\xfd\xed\x48\x00\x31\x25\x5c\x01\x40\x00\x2e\x0c\
-\x94\x4e\x22\xfb\x9b\x9d\xdb\x7e\x19\xf8\x57\x5b\xf5\xdf\x16\x80\
-\x65\x4b\x7f\x6d\xa9\x9f\x33\xc8\x4b\xa2\x08\xce\x1c\x98\x21\x26\
-\x80\xe0\x45\x08\x51\x6f\xaa\xcb\x7b\xbd\x24\x40\x8c\x4a\x08\x9b\
-\xc3\x81\xd5\x00\xe7\x07\x25\xdd\x46\xf3\x97\x1f\x7e\xfc\xe9\x7f\
-\xfb\xe1\xfb\xee\x1c\x5c\xd9\xe6\xaa\x00\xfc\xc9\xb3\x0b\x77\x7f\
-\xf5\x07\x8b\xf7\x2d\xf4\x73\x8a\x4a\x11\xef\x50\x67\xb5\x14\x8c\
-\xf5\x5f\x0c\x8a\xf2\x47\x27\xfe\x6b\x54\x94\x61\x93\x04\x00\x60\
-\xc6\xc2\x20\x72\x21\x93\xd9\x6e\x6f\xee\xa3\xc0\x7f\xbc\xb2\xc9\
-\x55\x01\xf8\xde\xb9\xc1\x27\x56\x56\x4b\xd7\x1f\x95\x44\x04\x31\
-\x43\xbc\x21\x2a\xeb\xfb\x7f\x0c\x30\xaa\x2a\x9c\xbc\x6e\x89\xa5\
-\x4d\x24\xc0\x20\x0f\x54\x5b\x02\x00\x31\x1a\x17\xfb\x8e\xb9\x4c\
-\x3e\xc1\x16\x00\x6c\x39\x73\x33\x4b\x7f\xe3\xff\x9c\x7c\xe1\xf9\
-\xb3\xfd\x03\x8b\xa3\x0a\x9c\x47\xfc\x58\xf7\xbd\x43\xc6\xdd\x0c\
-\x78\xd3\x5c\x8b\x56\xfa\x23\xdc\x05\xcc\x78\xe6\xdc\x70\xdd\x19\
-\xda\xa2\x05\xdd\x86\xe7\xae\x03\x93\x3a\x33\x7c\xf1\xae\x8f\x7e\
-\xf0\x5d\x27\x36\xd6\x6e\x29\x01\x5f\x78\xe6\xe2\xdb\x16\xfa\xf9\
-\x81\xfe\x6a\x41\x15\xeb\x95\x77\xe6\xc0\x39\x50\xad\x55\x80\x1a\
-\x80\x8b\xfd\x82\xdd\x9d\xf4\x66\xf2\x74\x5d\x34\x2c\x95\xbc\x08\
-\x5c\x55\x08\x0d\x06\x1a\xb9\xb0\x92\xbb\xde\xcc\x2d\x1f\x04\xae\
-\x0d\xc0\xb3\xa7\x97\xde\xd7\x5f\xcd\x19\xe6\x6b\xe2\xef\x6b\x15\
-\x70\x56\x4b\xc1\x86\xb7\xcd\xaf\xe4\x4c\x65\xb2\x0e\xca\xeb\x4d\
-\xe7\x56\x72\x62\xdc\xc6\x0e\x99\x11\x03\x2c\xad\x16\x0c\x3b\xf2\
-\x7e\xe0\xb7\x36\x56\x6f\x09\x40\x51\x86\x77\xf4\x07\x39\x45\x51\
-\x82\xf7\x08\x86\xa8\xab\xd5\x40\x2e\x07\xa0\x32\xe3\x42\x5f\xe8\
-\x36\x5f\x7f\x29\xa8\xa2\xb2\xb0\x92\x73\xf5\xe5\x07\xcc\x30\x8c\
-\x95\x55\x28\xb4\xfd\x16\x33\x6b\xc8\x86\xe4\xea\x26\x00\xcc\xcc\
-\x3d\xf0\xfb\xdf\x3d\x36\x18\x96\x94\x55\x40\x94\x7a\xf5\x13\x8f\
-\xe8\x9a\x04\x5c\xde\xe7\xcc\xe2\x88\xc6\x8c\x6c\x3b\x8f\xd7\x82\
-\xce\x2c\x15\xb5\xf1\xdb\xee\xbd\x56\xdb\x89\xfe\x08\x96\x57\x8b\
-\xd9\xef\x9c\x5e\x39\x0c\x3c\xb7\x56\xbd\x09\x80\xef\x9d\xe9\xf7\
-\x06\xa3\x6a\xdf\x70\x54\x10\xaa\x88\x18\x38\xa9\xe3\x7c\x71\x8a\
-\xa8\xdb\x84\x78\x30\xe3\xf4\xc2\x90\x3d\xdd\xe6\xeb\xe4\x14\x19\
-\x2b\xa3\xc0\xf2\x6a\x79\x6d\xd0\xcd\x30\x33\x46\x28\x83\xbc\xe4\
-\x95\xc5\xe1\x51\xb6\x03\x60\xb1\x3f\xdc\x3f\x1c\x15\x49\x51\x54\
-\x54\x41\xf1\x08\x0a\xa0\x86\x38\x87\x38\xdd\x52\xe4\x16\x07\x11\
-\xcc\x98\x6a\xbd\xf6\xaa\x90\x57\x91\x73\xcb\x05\xec\xe4\xcc\xc4\
-\xc0\x4c\x29\x54\x18\xe6\x15\x2b\xab\xe5\xfe\x8d\xd5\x9b\x00\x28\
-\x2a\x9b\x19\x0c\x4b\xca\xb2\x22\xa8\xa1\x22\x38\x0c\xcc\x5f\xee\
-\x07\x6c\x41\xf3\xcb\x23\xaa\x2a\xd0\x7d\x0d\x41\xc8\xab\xc8\x7c\
-\xbf\x84\x9d\xca\xda\x18\x00\x04\xf2\x22\x50\x54\x71\xcf\xc6\xea\
-\x4d\x00\x54\x31\x4e\x9c\x5f\x1c\x30\xca\x0b\x54\x1c\x6e\xcd\x09\
-\x52\x43\xd4\x6f\xda\x05\xae\xa4\x0b\xfd\xc8\xb0\xa8\xd8\xd5\x6e\
-\xdc\xe4\x9d\xc1\x18\xe4\x81\xe5\x51\x75\x7d\x69\x2c\x33\x4c\x0d\
-\xc4\x58\x58\x19\x11\xd5\x3a\x1b\xab\x37\x1b\x41\xc1\x85\x10\x78\
-\x65\x7e\x85\xe9\x5d\x13\x78\xc6\x46\xd0\x40\xd4\x6a\x47\xe8\x1a\
-\x8c\xad\x54\x81\xd5\x51\x49\xb7\x95\x92\x25\xaf\x2e\x4f\x28\x22\
-\x54\x51\x59\x19\x55\x94\x21\x5e\x3f\xa8\x66\x98\x2a\x83\xbc\x62\
-\xb2\xe1\x88\x31\x5e\xe6\xb5\x6d\x02\xc0\x3b\xc9\x1d\x50\x55\x81\
-\x73\x17\xfb\xcc\xcd\x76\x71\x8c\xa3\x2e\xe7\x40\x5d\x7d\xbd\x06\
-\xc5\x08\x17\xca\x40\xe2\x1d\xed\x46\x42\x96\x5e\x1b\xb8\x2b\xe6\
-\x4d\x88\xca\xb0\x0c\x14\x55\xac\x67\x70\x23\x02\xa5\xca\x30\xaf\
-\x18\x0c\x0b\x6e\xed\xb5\x00\xf2\x8d\xd5\x9b\x00\x48\x9d\x5b\x4e\
-\x3d\x08\x4a\x51\x04\xce\x2f\xf4\xe9\x4d\x77\xf0\xc6\xd8\x1d\xf6\
-\xd4\x7b\xe3\xce\x66\x13\xa2\x92\x97\x15\x22\x42\xea\x1c\x69\xe2\
-\x48\xbc\xd4\xaa\x55\x07\x95\xeb\x0c\x9b\x19\x41\x8d\x10\x95\x32\
-\x18\xfa\xaa\xf3\x6c\xc6\x28\xaf\x58\x59\x2d\x68\x38\x48\x1c\x34\
-\x3c\x17\xb7\x05\xa0\xdd\xd4\xb3\xed\x46\x82\x37\xc5\x62\x20\x54\
-\x8e\x85\xa5\x55\xba\xdd\x36\x69\x9a\x82\x37\x44\xdc\x0d\xad\x46\
-\x00\x46\x45\x6d\xbe\xea\xee\x63\x10\x0c\x6a\x77\xe5\xe6\x9e\xd6\
-\x0e\xf3\xc0\xa8\xa8\x40\x23\x5e\x84\x66\x22\x24\x5e\xce\x6e\x6c\
-\xb3\x09\x80\xb7\xbd\x61\xff\xf9\xa9\x89\xa7\x16\xbd\x30\x4d\x0c\
-\x58\xe5\x08\x22\x2c\xad\x0c\x69\xb7\x9b\x64\x59\x7a\xc9\x1b\xfc\
-\x11\x46\x81\xdb\x91\x9a\x31\x2c\xc6\x21\xb2\x2a\x16\x15\xef\x3d\
-\xed\xcc\x73\x78\xae\xf3\xe2\xc6\xb6\x9b\x00\x10\x91\xfc\x9f\x7c\
-\xea\x89\x93\x59\x22\x6f\x27\x06\x4c\x04\x71\x82\x09\x0c\x57\x8d\
-\x2a\x44\x9a\x59\x8a\x73\x9b\x1d\xa2\xbf\x0c\x54\xc5\x48\x51\x29\
-\xa8\xd6\x7a\xa5\x06\x31\xd0\x70\x8e\xd9\x4e\x56\xec\xdd\xbd\xf7\
-\x7b\x1b\xdb\x6f\x19\x0b\x4c\xb6\xd2\x6f\xb6\x5b\xe9\xdb\xc5\x14\
-\x8d\x01\x0b\x6b\xcc\x0a\x55\x59\x11\x62\xa4\x91\x78\x92\xc4\xff\
-\xa5\xc1\x40\x0d\xca\xa0\x97\xec\xc6\xd8\xfa\x9b\x2a\xa2\x91\xe9\
-\x89\x06\xd3\x2d\xff\xdc\x91\x69\x59\xda\xd8\x6f\x4b\x00\xf6\xcf\
-\x74\x1e\xeb\x4d\xb6\x7e\xfe\x34\x46\x11\x2a\x6c\x9c\x00\x11\xac\
-\x56\x52\x13\x86\xe5\x08\x8d\x15\x89\xb3\x3a\x39\x7a\xc3\x40\xac\
-\x75\xbc\x7e\x83\x67\x80\x69\x6d\x38\x0d\x4f\xda\x68\x22\xae\x66\
-\xc9\xcc\x6a\x29\x88\x91\xcc\x0b\xb7\xce\x76\x68\x36\xe4\x89\x2b\
-\xc7\xd8\x12\x80\x77\xdd\x73\xe4\x89\x2f\x7e\xf3\x64\xfe\xbd\xef\
-\xfb\x66\xb1\x9a\xd7\x00\x20\xe8\xd8\x68\xa9\x46\xfe\xf1\xcf\xbc\
-\x85\xfb\xdf\xf9\x66\xcc\x6c\x9c\x20\xba\x02\x81\x2b\x01\xd9\x8a\
-\x3f\x33\x42\xa8\x70\xce\xe1\xbc\xdf\xa2\xd3\x56\x2c\xaf\x0d\x5e\
-\xdf\xeb\xd8\x72\x5e\x58\xc9\xf9\xe9\x87\x7e\x1f\xd7\x98\x04\x49\
-\xc0\x6a\xdd\x17\x8d\x1c\x9c\xeb\x32\xdb\x6d\xb2\xaf\x37\xf5\xbf\
-\x76\x04\xc0\xed\x07\xba\x17\xfe\xd9\xa7\xbe\xf8\x78\xb7\x93\x7d\
-\x60\x30\x18\x62\xa1\x62\x6d\x1f\x16\x31\x34\xe4\xcc\xb6\x1d\x59\
-\x18\xa0\x7a\x79\x2a\x66\x6d\xaf\xdf\xe9\x9e\x9f\xad\x7d\x2b\x33\
-\x0e\xe9\x6d\xc3\xd6\xb7\xf1\xfe\xca\xf1\x44\x64\xbd\xde\xcc\x38\
-\xd0\x6d\x62\xf9\x12\xb8\x0c\xbc\x40\x54\xc4\x22\xfb\x77\xb5\x98\
-\x9e\x68\xb0\x7b\xba\x7d\x3e\x26\x13\x4f\xec\x08\x00\x80\x5b\xf6\
-\x4f\x7f\x7a\xdf\xdc\xd4\x07\xe6\xcf\x2f\x52\x84\x6a\xfc\x56\x43\
-\x31\x2c\x94\x68\xac\x28\xf2\x7c\xcb\xbd\x7a\xeb\x89\x1b\x6b\xc7\
-\x89\xd7\xda\xde\xeb\x2e\x97\xc2\xeb\x4b\xed\x6d\xfd\xf9\x52\x9b\
-\x5a\x1a\x12\x97\xa2\xd5\x10\x89\x15\x62\x1e\x87\xb2\x77\xaa\x45\
-\xbb\xe1\xe8\x4d\x36\x99\x9e\x68\x3e\xfc\xf1\xfb\x8e\xe4\x57\xbe\
-\xeb\xaa\x00\xbc\xf7\xe8\x8f\x3d\xfa\xed\x23\xa7\x7e\xf8\x83\x17\
-\xcf\xde\x52\x2c\xac\x5c\x36\x69\x8b\x15\x5e\x84\x03\x07\x0f\x60\
-\x6a\x97\x49\xf7\x25\xe1\xdc\xb8\x49\x5c\xb1\x7a\x1b\xda\xd4\x2a\
-\x74\x79\x2e\x41\x36\x78\x7d\xeb\xaa\x25\xe3\x3b\xd9\xa4\x6c\x00\
-\xac\xe4\x25\x28\x58\x88\xa4\x0d\x65\xdf\x74\x8b\x04\xe8\x34\x3c\
-\xfb\x7a\x13\x71\x6f\x6f\x62\xcb\x23\xf3\xab\x02\x70\xf4\xa8\x14\
-\xbf\xfe\x99\x2f\xff\xbb\xfd\x7b\xa6\x7f\x6b\x65\xb9\x4f\x59\x55\
-\xe3\x69\x1b\x82\xf1\xd8\x9f\x3f\x47\xbf\xbf\x8c\x59\xa8\x8d\xe3\
-\x46\x57\x75\xc3\xaa\x6f\xa2\x0d\x3f\x45\x55\xca\xa2\xc4\x27\x9e\
-\x46\x9a\xde\xd8\xb6\x6a\xb5\x94\xad\xe4\x0a\x2e\x63\x22\x4b\xd9\
-\x3d\xdd\xc6\x99\x92\x0a\xcc\x74\x5b\xec\x9b\xed\xfe\xe1\x47\xde\
-\x73\xc7\xf1\xeb\x02\x00\xe0\xd0\xde\xc9\x4f\xde\xfd\xe6\x83\xbf\
-\x72\xe6\xec\xfc\xc1\x8b\x17\x97\xb1\x4a\x6b\x00\xbc\xe3\x8f\xbf\
-\x7e\x92\xcf\x7f\xed\x04\x48\x1c\x9f\x17\xae\xf9\xfa\xaf\xb3\x83\
-\x34\xd6\x07\x71\x0d\x76\xcf\xcc\xb1\x6b\x72\x02\xd1\x88\x58\x64\
-\x72\x22\xe3\xe0\x9e\x6e\xd8\xdf\x9b\x7c\xf0\x6a\xdd\xb7\x05\xe0\
-\x63\x7f\xe3\xc7\x56\x7f\xf3\x7f\x7c\xe5\x9f\x3f\x7f\xeb\xde\xff\
-\xb6\xda\x5f\x65\x34\x2a\x6b\x87\xd5\x52\xc4\x27\x48\x92\xd5\xf1\
-\x81\x4f\xea\x00\x69\xec\x1c\xad\x07\x4b\xeb\x4a\x7c\xd3\xd8\xdd\
-\xb0\x6b\x8e\xed\x81\x2a\x59\xe2\xd9\x3d\x3d\x41\x96\x24\xf5\xc9\
-\x95\x2a\x59\x22\xec\xe9\x4d\x72\x70\x6e\xea\x3f\x7f\xec\x6f\xde\
-\xf5\x9d\xab\x0d\x77\xcd\xb0\xee\x57\x3f\xf2\x8e\xdf\x7d\xdb\x9d\
-\xb7\x7e\x61\xf7\xdc\x2e\xbc\x18\x84\x0a\xab\x2a\x2c\x44\x88\x8a\
-\x29\x98\x0a\x66\x0e\x33\x07\x78\xcc\x3c\x35\xb6\xe3\x22\x29\xb8\
-\x9b\x50\x24\x5d\x1f\xd3\x48\x10\x12\x66\xa7\xba\x1c\x9c\xdb\x45\
-\xe6\x93\x3a\x65\x1f\x03\x09\x91\x99\xc9\x26\x87\x0f\xcc\x9c\xdd\
-\x33\xd7\xfb\x17\xdb\xf1\xb7\x83\xef\x03\xc4\xee\xba\xe5\x1b\x9f\
-\x38\x77\xcf\x6d\x4f\x0e\xfa\xab\x33\x0b\x0b\xcb\x58\x28\xeb\x2c\
-\x8b\x29\xa2\x8a\x25\x06\xea\x11\xef\x31\xe7\x10\xa9\xaf\x6b\xf1\
-\xc2\x9a\xf1\x7a\xd5\x34\xce\xef\x09\x30\xd5\x6e\xd0\x9b\xcc\xf0\
-\x02\x68\x44\xac\x76\x7f\x3d\xca\x64\x3b\xe3\xe0\xfe\x19\xbd\xed\
-\x50\xef\x1f\xfe\xdd\xf7\x1d\xbb\xb8\xdd\x90\x3b\x3a\xd2\xf9\xfb\
-\x3f\xfd\xe3\x2f\xbd\xe5\xf6\x43\x1f\xbf\xfb\xce\x23\xb1\x33\xd1\
-\x04\x8d\x58\x55\xa2\xe3\x62\x55\x51\xdf\x97\x25\x56\x55\x68\x28\
-\xb1\x50\x8d\x4b\x40\x63\xc4\xd6\x8b\xae\xbb\xa8\xa6\xb6\x4d\x19\
-\xb7\x89\x8a\xc5\x88\x86\x00\xaa\x74\x5b\x29\xb7\xcc\x75\x98\x9b\
-\xcc\xf0\x56\x7b\x7a\x12\x2b\x08\x01\x17\x2b\xda\x0d\xcf\xa1\xbd\
-\x3d\xde\x74\x70\xee\x37\xfe\xc1\x4f\xbe\xfd\x73\xd7\xe2\x6d\xc7\
-\xe9\x9a\x2f\x7c\xf6\xd3\xcf\x7d\xec\xe7\x7e\x65\x75\x35\xaf\xde\
-\xbf\xb8\xb8\x42\x55\x96\xa0\x91\x5a\x07\xac\x5e\x81\x35\xf7\xb3\
-\x0e\xee\x2f\xff\x9d\xb5\xeb\xf8\x77\xec\xb2\x76\x9b\xcb\x25\xa0\
-\xd2\x44\xe8\x75\x32\x76\x4f\xb5\xe8\x34\x3d\x8e\x7a\x5c\xb1\x58\
-\x1b\x3c\x8d\x38\x8b\xb4\xb2\x84\x43\xfb\x66\xb8\xfd\xc8\x81\xdf\
-\xfb\xd6\x1f\x9d\xfb\xa5\x13\x27\x1e\xb9\xa6\xf5\xb9\xae\x7c\xd5\
-\xe3\x8f\xfe\xd7\xaf\xfd\xec\xc7\x7f\x29\xcb\xab\xf8\xce\xa5\xa5\
-\x3e\xa1\x28\x31\x8d\xeb\xa2\x89\xea\xba\x6a\xd8\x1a\x13\x6b\x75\
-\xb6\x16\xa1\x8d\xeb\xd5\xb0\xf5\x7a\xbd\x54\x34\x62\xaa\x78\x81\
-\xc9\x66\xca\x5c\xb7\x49\xaf\x93\xd1\x4c\xa4\x76\xc6\x2d\x22\x7a\
-\x25\xf3\x4a\x3b\x4b\x38\xb8\xaf\xc7\xd1\x23\xfb\x1e\xfb\xdf\x27\
-\x16\x7e\xf6\x8f\x0f\x1e\x0f\x7c\xe9\x4b\xd7\xe4\x69\xa7\x00\x08\
-\x0f\x3c\xe0\xe0\x5e\xff\xa7\xcf\x9c\x79\xfc\xc3\xf7\xdd\xd3\x52\
-\xec\x1d\x4b\xcb\x7d\xaa\x72\x0d\x84\x35\xe6\xc7\x52\xa0\x6b\x57\
-\x5d\x5f\x51\xae\x04\x42\xb5\x96\x22\x8d\x78\x31\x32\x2f\x4c\xb6\
-\xd2\xda\x73\xeb\x34\x98\xc8\x12\xbc\x5b\x5b\x6d\x5b\x67\x1e\xbd\
-\xc4\xbc\x47\x69\x37\x1b\x1c\xda\x3f\xcb\x1b\x6f\xdd\xf3\xc4\x17\
-\xbe\xf9\xf2\xfd\x5f\xff\xf6\x93\x81\x27\x33\xe1\xd8\xbd\xc2\xdf\
-\xbb\x97\xed\x80\xd8\x01\x00\x26\xdc\x7f\xc2\xf1\xc4\x5c\x42\xd2\
-\x4d\x7a\x55\xd1\x7c\xec\xd4\xc9\x2f\x7f\xe0\xed\x77\x8c\xa6\xba\
-\xed\x77\x2e\xaf\xac\xba\xb2\x28\xd1\x58\xeb\xa8\x69\x5c\x67\x7c\
-\x4d\x84\x6b\x26\x6b\xe6\x9d\x19\x89\x18\x0d\xef\x68\x35\x3c\x93\
-\xcd\x84\x5d\x13\x19\x53\x13\x19\x93\xad\x84\x66\xea\xf0\x02\x0e\
-\x1d\xb7\x1f\xaf\xf6\xd8\xe0\x5e\x5a\x79\x25\x75\xd0\xed\xb4\x39\
-\x7c\xcb\x1e\xe6\x66\xa7\xff\xe7\x7f\xf9\xdc\x53\xbf\xf8\xd2\x2b\
-\x7d\xb2\x34\xf5\x13\xbb\x72\x97\xaf\x24\xc2\x77\x80\x7b\x77\xc3\
-\x89\xe3\xc0\x43\x5b\xac\xec\x35\x99\xff\xb0\xa3\xbf\x37\xe1\xcc\
-\x2d\x49\xb7\x3d\xc8\xaa\x76\xd5\x52\x6b\x35\x2d\x16\x8d\x0f\xfe\
-\xf5\xdb\xdf\xdd\x4d\xf4\xd7\x9f\x3e\xfe\x42\xef\xdc\xb9\x79\x8a\
-\xbc\x20\x9a\x21\xce\xe3\xc6\x47\xea\xce\x25\xb8\xc4\xe3\xbc\xc7\
-\x7b\x3f\x8e\xfc\x1c\xce\x5d\x3a\x67\x74\x22\x63\x77\x58\xc6\x1b\
-\x87\x20\x18\x4e\xd6\xce\x3e\x6a\x9b\xb1\x66\x37\xbc\x40\x96\xa5\
-\xf4\xa6\xbb\x1c\x3a\x38\x57\xae\x56\xee\x77\x7e\xef\x89\xe3\xff\
-\x5d\x84\xe0\x9c\x1f\x55\x25\xb9\x97\x38\x4a\x92\x6c\xd4\x0f\x45\
-\x41\x6b\xa1\x62\xf2\x95\xc0\x23\x8f\xd4\x9e\xdc\x8e\x25\xe0\x01\
-\x1c\x7f\x16\x3c\xcb\x6f\x48\x27\xb3\x8b\xcd\xaa\x9b\x74\xbc\x36\
-\xa6\xf0\x71\x3a\x71\x8d\xd9\xef\xbf\xbc\x98\x2f\x0c\xaa\xaf\xfe\
-\xf8\x3d\x87\xf7\xee\x9a\x9c\xd8\x5f\x56\x41\x2c\xd6\xab\xe5\xa4\
-\xfe\xb3\x83\x17\xc3\x01\x4e\x0c\x87\xe1\xa8\xc5\x19\xd3\x9a\x29\
-\xd3\xf5\xe2\xd6\xef\x37\xae\x78\xfd\x8c\x45\x1c\xb5\xd3\x33\xd5\
-\x9d\xe0\xd0\x81\xdd\xcc\xce\xcd\xfe\xf0\xcf\x4f\xce\xff\x87\xc7\
-\xbf\x7d\xea\x29\x9f\xf8\xae\x99\x6b\xe2\x62\x13\x27\x89\xd7\xd4\
-\x55\x5a\x4a\x0b\xb4\x0c\x2d\xe3\xc5\x39\xe3\x17\xef\xb5\x2b\xd5\
-\x61\x3b\x00\x84\x7b\xef\x15\x16\x6f\x4d\xa6\x5b\x65\xa3\x6c\x24\
-\xed\xc4\xb4\x1b\x4d\xa6\x9d\xb8\x19\x31\x66\x9d\x97\xd9\x41\x51\
-\x74\x9f\x3e\x75\xe1\xf9\xc9\xa9\xee\xb9\x7b\x8e\x1e\xd8\x3f\xd1\
-\x6a\xb6\xe3\x58\xbf\x45\x75\x9c\x45\xa8\x99\xbf\x74\xd5\x4b\x57\
-\x33\x9c\x29\x6e\x13\xd3\x97\x8a\x77\x46\x96\x26\x4c\x4d\x4e\xb0\
-\x6f\xdf\x2c\x07\x0f\xee\x1d\x9d\xee\x17\x5f\xfe\xc3\x6f\xbc\xf0\
-\xf9\xf3\x8b\xab\x96\x78\x99\x34\x93\x96\x43\x5a\x20\x0d\x44\xbc\
-\x13\xc5\x59\xaa\x51\x25\x4e\xe8\x28\x16\x9d\x24\x32\xbc\x43\xb9\
-\x62\x67\xd8\x4e\x05\x84\xfb\x1f\x76\xbc\xf4\xb5\xc6\xe4\x44\xd6\
-\x2e\xc9\xa6\x5c\xa0\x27\x09\xb3\x82\xcc\x80\xef\x09\xb6\xcb\xb0\
-\x09\x11\x69\xa9\x91\x79\xef\x92\xb7\xdd\xb6\xe7\xe8\x2d\xbd\xec\
-\xce\xd5\x95\xfe\xf4\xd9\x57\x2e\xd2\xef\xaf\x52\x16\x25\x31\x86\
-\xf5\x30\x56\xc4\x5d\x12\x79\x77\xb9\x0a\xb8\xf1\x37\x48\xde\x3b\
-\xd2\x24\x21\x6b\x66\x74\x3a\x6d\x66\x7a\x5d\x26\x3a\x13\xa3\xd3\
-\x4b\xc5\xf7\xbf\xfe\xec\xd9\x67\x06\x45\x99\x3b\x93\x88\x50\x09\
-\x14\x86\xe5\x02\x03\x43\x96\xcd\x58\x44\xb9\x60\xe2\x2e\x68\xac\
-\x16\x52\x58\x1a\x0c\x18\xc2\xd9\x8a\x6f\xfd\xa7\xb0\xf1\x50\x71\
-\x47\x5f\x8a\x5a\xc8\x24\x03\x57\x35\x9c\x47\x35\x31\xf1\x0d\xd0\
-\x0c\xa4\x21\x26\x99\x41\x26\x62\x99\xa9\xa6\xdf\x78\xf6\xcc\x99\
-\x6f\x38\x77\xee\x8d\xfb\xa6\x66\xdf\x7c\xf8\xd6\x23\xad\x84\x3d\
-\xc5\x70\xd8\x5c\x5a\x1e\x30\x1c\x8d\xa8\xca\x8a\x18\x62\x9d\x48\
-\x19\x4f\x43\x9c\xe0\xc6\x0c\xa7\x69\x42\x96\x35\x68\xb7\x9a\x74\
-\xbb\x13\x34\xdb\xcd\xb0\x5a\x71\xe1\xf9\x57\xfa\x2f\x9d\xf8\x8b\
-\xef\xbf\x52\x06\x0b\xde\x49\xe2\x45\x5a\x20\x95\x61\xae\x8e\xa8\
-\xc5\x0c\x0b\x06\x05\x42\xc3\x9c\x4b\x4d\xab\xa4\x91\xe0\xd4\xe1\
-\xe8\x75\x84\x05\xe0\x81\x07\x85\x87\xb8\x3e\x00\x24\x29\xac\x70\
-\x13\xd1\x07\x0b\x78\x57\x09\x56\x60\xae\x10\xb1\xdc\x84\xc4\x0c\
-\xc4\x89\x99\x11\xc5\x91\x8a\x90\x9c\x3c\xbb\x74\xee\xb9\xd3\x8b\
-\xe7\xb3\xc4\x27\x07\x67\x27\xa7\x0e\xce\xf4\xe6\x0e\xec\x49\x77\
-\x35\x3c\x1d\x2f\x36\xe1\xcc\x12\x33\xf3\x60\xe3\x95\x77\x2a\xde\
-\x85\x10\x25\x2f\xa2\x0e\x06\x85\xae\x3c\x75\xae\x7f\xe1\xd4\xf9\
-\xf3\x8b\xc3\x3c\x94\x5e\x4c\x10\x34\x11\x89\x40\x1c\xff\xc9\xac\
-\x02\x2a\x11\x0a\x83\x5c\x44\x46\x18\xb9\x21\x85\x88\x56\x08\xa1\
-\xd4\x24\xa6\x21\x28\x83\x41\xcd\xf4\x43\x0f\x5d\xa6\x02\xdb\x03\
-\x70\xec\xb8\xd1\x3f\xac\x49\x38\x13\x42\x1c\x95\xce\x37\x87\x21\
-\x6a\xdf\x79\x97\x88\x40\x14\x29\x9d\x59\x8e\xd0\xc4\x24\x03\x4b\
-\x4d\x5c\x6a\x66\xa9\x03\x2f\x5e\x7c\x54\x73\xa7\xce\x2f\x2f\xbe\
-\x70\x7e\xe9\x94\x29\x20\xb8\x2c\x4d\x7c\x2b\x4d\x52\xe7\x48\x9c\
-\x38\x51\xcc\x54\x4d\xcb\x32\x86\x51\x59\x05\x35\xcc\x09\x38\xe7\
-\x0c\x33\xf3\x0e\xc5\x44\x19\x27\xb9\xc5\x08\x86\x0b\x22\x56\x61\
-\x54\x6a\x52\x20\x9a\x8b\xb9\x55\xc4\xfa\x86\x2c\x5b\xd4\xbe\xf7\
-\x0c\x2d\xcf\x4b\x6f\x31\xd2\xc9\x94\xdd\xef\x55\xbe\xf5\xa9\xcb\
-\x58\xdc\x0e\x80\x3a\xcb\x31\x7f\x5c\x17\xab\xc9\xd0\x6d\x37\x47\
-\x65\x5a\xb8\x24\x4d\x24\xaa\x0f\xe2\x62\x8e\xc5\x01\xf8\x26\xa6\
-\x2d\x13\x1a\x22\xbe\x21\xa6\xa9\xe1\x12\x85\x04\x33\xef\xc0\x9b\
-\xe0\x9d\x89\xc3\xd7\xb1\x47\x88\xc1\xf7\x43\xdc\x98\x03\x12\x50\
-\x40\xcc\xd5\x36\x61\x1c\xf5\x98\x02\x8a\xa0\x02\xaa\x26\x11\x2c\
-\x1a\x16\x04\x0b\x60\x95\x99\x94\x40\x21\x2a\x45\x14\x19\x39\x63\
-\x15\x61\xe0\xa3\x0e\xa2\x25\xfd\xc4\x31\x5a\x26\xa9\x98\x47\xb9\
-\xf7\xf8\x26\xd7\x78\x67\x7e\xc0\xf1\x63\x9e\x64\x90\x4e\x75\x67\
-\x1b\x65\x33\x6f\xa9\xd1\x4c\xd4\xb7\x0c\x9a\x4a\xcc\xbc\x4b\x1a\
-\xe6\x68\xa0\xd6\x30\x23\xf1\x9e\xc4\x22\x09\x22\xde\x88\x49\x9d\
-\x34\x18\xef\x82\x66\xe2\xc4\xea\xe7\xab\xbe\xd6\x59\x14\x54\xd4\
-\x0c\x27\x11\x5b\x03\xc1\x22\xa6\x51\x44\x42\x8c\x04\x11\xa9\x10\
-\xab\x24\xba\x2a\x26\x5a\x88\xf9\xc2\x89\xe4\x41\xca\xdc\x85\x74\
-\x94\xc8\x20\xef\x87\xac\xe0\x74\xaf\xe2\x2d\xfb\x02\x8f\x7c\x78\
-\x93\x1f\xb0\x83\x18\x75\x0c\xc2\x0f\xa6\x1d\xe9\x44\x82\xdb\x9b\
-\x74\x3b\xc3\x34\x86\x46\x1a\xab\x61\xc3\x1a\x49\xda\x50\x9f\x2a\
-\x24\x36\x0e\xd6\x2d\x8d\xde\x2a\x12\x3c\x2e\xc1\x79\x73\x89\x43\
-\x71\x38\x9c\x99\xd6\xbb\xa0\xd8\xd5\x01\x70\xa2\xa8\x1a\xe2\x4c\
-\x14\xc5\xa1\x68\x50\x31\x17\x83\xb9\x28\x89\x46\xcc\x47\x11\x82\
-\x50\x05\x17\x7c\x55\x22\x41\x7c\xa8\x5c\x45\xe9\x93\xac\x4a\xd3\
-\xa2\x5a\x98\x27\x30\x22\x70\xc7\x1d\x91\x47\xee\xd7\xad\x3e\x29\
-\xd9\x61\x90\x6e\xc2\x03\x0f\x0a\x27\x4e\x08\xc7\x8f\x79\xe6\x70\
-\x34\x3a\xbe\xb7\x3c\xf0\xb1\x85\xd3\x24\xf3\x6a\xfd\xc4\xd2\x09\
-\x67\x15\xce\x5c\xe5\x4d\x12\x4f\xc0\xa1\x5e\x1a\x2e\xf8\x3a\x51\
-\x1b\xc5\xcc\x0b\x89\x17\x6c\xac\x02\xea\x2f\xcd\xc1\xc5\x7a\x82\
-\xe2\x8d\x10\x4d\x24\x1a\xce\x9b\x44\x14\x17\xad\x0c\x28\x8d\x24\
-\x4a\x40\x09\xb9\x4a\x96\x44\xa7\x65\x94\xd8\x88\x3e\x36\xa3\xef\
-\xe4\x71\x21\x76\x22\xe5\x20\x32\x8f\x32\x87\x72\x2f\xca\x43\x0f\
-\xda\xd5\xbe\xa7\xb9\xde\xaf\x0d\x2e\x01\x71\xfe\x98\x30\xd8\x2f\
-\x2c\xe7\x8e\x03\x0b\xc2\x24\x8e\xa2\x23\xac\x9e\x77\xbd\x6e\x5b\
-\xe2\x08\x47\xa7\x29\x56\xe5\x62\x31\x13\x0b\x85\x58\x03\x47\x6c\
-\xac\xbf\xd3\x62\xb9\xe9\xfd\xe2\x1b\x97\x26\xea\x4b\x93\x12\x95\
-\x24\xb3\xba\xae\x30\x29\x50\x97\xe6\xb6\x38\xec\x29\xe9\xd0\x98\
-\x44\xe9\xa3\xb4\x7a\xc6\x0f\x17\x8c\x39\x94\xdd\x77\x18\xc7\x8e\
-\xdb\x98\x71\xd8\x26\x29\xf7\x2a\xd2\x34\x36\xee\xfb\xa0\x70\xff\
-\x89\xfa\x7e\x0d\x14\x80\xd1\x19\xa1\xec\x09\x07\x16\xea\xe7\xa2\
-\x5b\x5f\xab\x95\xfa\xba\x6f\x9b\xa1\xd7\x0e\xb0\xd3\x6e\x3d\xf1\
-\x6c\xa5\xbe\x9e\xee\x19\x8d\x85\xfa\xbe\xb5\xdf\xe8\x9c\x31\x76\
-\x9f\xa8\x9f\x8f\x1d\x1b\x33\x0c\x3b\xfb\x7a\xaa\xa6\xff\x07\x60\
-\x89\xfa\x44\xe0\x81\xc8\xac\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x4c\x5e\
-\x00\
-\x01\x08\x3e\x78\x9c\xed\xbd\x07\x7c\x14\x47\xd2\xff\xbd\x38\x9c\
-\x7d\xd1\x17\x1e\xe7\x33\xa0\x2c\x44\x70\xbe\xf3\x39\x60\x83\x6d\
-\x0c\xc6\x60\x83\x71\xc0\xe4\x9c\x73\x06\x05\x94\x13\x42\x89\x9c\
-\x83\x10\x20\x10\x28\xe7\x9c\x13\xca\x04\x21\x32\x22\x8b\x1c\xec\
-\xf3\xf9\x5c\x6f\x55\x77\xcf\x6c\xcf\xec\x2a\x10\x7c\x3c\xcf\xfb\
-\xbf\xe5\xf3\xa5\x67\x66\x67\x67\xba\xeb\x57\x5d\x5d\x3d\x3b\xb3\
-\x32\x18\xda\xe0\xbf\xc5\x8b\x0d\xf8\x7f\x7b\x83\xfd\x93\x6d\x0c\
-\xcf\x18\x0c\x06\x7b\x04\x37\xd1\x46\xb6\x9d\xbd\xf0\xbd\xff\x1f\
-\xbc\xfe\x8c\xbc\x60\xe0\x4d\xec\x8c\xbc\xf9\x90\x79\x5d\xd4\xc5\
-\x42\xd4\xeb\x77\xbf\x5c\xd3\xff\x9f\x79\x3d\x8a\xbc\x88\xfc\x1d\
-\xf9\x14\x19\x8a\x4c\x6f\xd3\xa6\x8d\xdb\xeb\xaf\xbf\xbe\xbc\x57\
-\xaf\x5e\xeb\xc7\x8c\x19\xb3\x73\xfa\xf4\xe9\x7b\x9d\x9d\x9d\x13\
-\x1e\x26\x0b\x16\x2c\x88\xa3\xba\x0c\x1c\x38\x70\x2b\xd5\xcb\xca\
-\xca\x2a\x08\xeb\xea\x86\xcc\x42\x46\x88\xfa\x93\x9f\x90\x6f\x3c\
-\xf2\x70\xcc\xf9\x7f\xe2\xf5\x3c\xf2\x01\x32\xea\xd7\xbf\xfe\xb5\
-\x7b\xcf\x9e\x3d\x37\xb8\xba\xba\x26\x6e\xd8\xb0\xa1\x38\x31\x31\
-\xb1\xbe\xac\xac\xac\xb1\xfe\xc8\x91\x9f\x8e\x1f\x3f\x0e\xc7\x8f\
-\x9f\x00\x5e\xca\x18\xb7\x9d\x30\x79\xcf\x74\xdf\x63\xca\xf2\x89\
-\xe3\x9a\xcf\x29\xf0\xed\x27\x58\x79\x42\x7f\x4c\xe5\x33\xc7\x04\
-\xba\xf3\x1f\x3d\x7a\xe4\xa7\xf2\x7d\xe5\x57\x53\x52\x52\x8f\x51\
-\xfd\x1d\x1d\x1d\x13\x7a\xf4\xe8\xb1\xee\x89\x27\x9e\x70\xa7\xf6\
-\x21\xdd\x91\x97\x1e\xa6\xb1\xff\x97\xbc\x68\xa8\xfa\x04\x99\x45\
-\xf6\x09\x08\x08\xc8\x4c\x4d\x4d\x3d\x71\xb8\xee\xf0\xbf\x8e\x1e\
-\x3d\x8a\x76\x3c\x06\xbc\x34\x72\x4c\x6c\x3f\x76\x4c\xd9\x76\x4c\
-\xda\x8e\x1c\xd3\xee\xa7\x6c\x3b\xa6\xdb\xa6\xee\x6f\xe6\x1c\xfc\
-\x33\x4d\x9d\xdb\xfc\x7b\xda\x63\x9a\xa7\xee\x70\xdd\xbf\xa8\x7d\
-\x41\xc1\xc1\xd9\x7d\xfb\xf6\xdd\x84\xed\x9e\x8b\xf4\x32\xf0\x58\
-\xf7\xff\xca\x8b\x92\x90\x2e\xc8\xf8\xf7\xde\x7b\x6f\xcd\xaa\x95\
-\x2b\x0b\x4b\x4b\x4a\xaf\xd6\xd7\xd7\xc3\x91\xfa\x23\x2a\xf5\x82\
-\x23\x47\x88\x7a\x09\xb1\x4d\x7d\x8f\x96\xeb\xd5\xfd\xea\x8f\x98\
-\x2e\x2b\xc7\xaa\x3f\x22\x95\x47\xf8\xf9\x78\x59\x2f\x1d\xaf\x5e\
-\x7c\x56\x39\x3f\x2e\xd7\xd7\x9b\x1c\x43\xd9\x47\xdd\x5f\xaa\x3b\
-\xa7\x5e\x53\xcf\x7a\xb5\x34\xd6\x6f\xdf\xbe\x7d\xd7\xd7\xac\x59\
-\x53\x44\xb1\x0e\xed\x31\xd3\xc0\xe3\xdf\x93\x0f\x53\x9c\x5f\xf0\
-\x45\x63\xdf\x1b\x8f\x3d\xf6\xd8\xec\xa9\x53\xa7\xee\xcd\xc8\xc8\
-\x68\xa8\xab\xab\x83\xff\xc2\x29\x2a\x2a\xbe\xec\xe7\xe7\x97\xf9\
-\xc2\x0b\x2f\x78\x19\x78\xce\xf0\xd4\x43\xd6\xeb\x41\xbd\xa8\xbf\
-\xbf\xf9\xe4\x93\x4f\xce\x9f\x37\x77\x5e\x7c\x61\x61\xe1\x95\x83\
-\x07\x0f\x82\x39\x0e\x1d\x32\xbf\xfd\xe0\xc1\x43\xac\x3c\x70\xe0\
-\x00\xd4\xd4\xd4\x40\x65\x65\x25\x60\x3e\x00\xc5\xc5\x25\x68\xb7\
-\x22\x46\x61\x21\x96\x85\x85\x50\x58\x54\xc8\x96\x0b\x69\x59\x07\
-\xdf\x4f\x2c\x2b\xdb\x8b\xf4\xfb\x14\x1a\x8f\x53\x64\xdc\xaf\x48\
-\x73\xac\x22\xf5\xbc\xc5\xc5\xc5\x50\x52\x52\xc2\xea\x53\x5e\x5e\
-\x0e\x35\xd5\xd5\xac\x9e\x87\x9a\x68\xa3\xdc\x1e\x73\x54\x55\x55\
-\xfe\x73\xe5\xca\x95\x45\x0e\x0e\x0e\x81\x68\xb7\xfe\xc8\x1f\x1e\
-\xb2\x7e\xf7\xf3\x7a\xf6\x91\x47\x1e\x19\x3f\x7f\xde\xfc\x04\xb4\
-\xdb\xf5\x03\xfb\x6b\xe1\xc0\xfe\xfd\x50\x7b\xa0\x16\xf6\xef\x3f\
-\x00\xfb\x6b\x71\x19\xd7\xf7\xe3\xf6\xfd\xb5\xb8\x8e\xcb\x07\xd8\
-\x3a\xdf\xa7\xa2\xa2\x82\xd9\x37\x27\x37\x17\xd2\xd3\xd3\x21\x39\
-\x39\x19\x12\x93\x92\x20\x21\x31\x11\x12\xe2\xe3\x21\x1e\x89\x8b\
-\x8b\x6b\x35\xb1\xb1\xd2\x7a\xac\x6e\x9d\xde\x57\x97\x63\x8d\x25\
-\xed\xa7\xac\xc7\x0a\xf4\xfb\xc7\xc7\x41\x7c\x42\x3c\x24\x24\x24\
-\x42\x52\x62\x12\xa4\x60\x3d\xa9\xbe\xb9\x39\x79\xac\xfe\xd4\x0e\
-\x6a\x6f\x6d\x2d\xb5\xaf\x56\x6a\x27\xb7\x01\x6b\x6f\x2d\x5f\x67\
-\xf6\x20\xbb\xd4\xd4\xfc\xb4\x79\xf3\xe6\x4a\x7b\x7b\xfb\x25\x68\
-\xc7\x6e\x06\x3e\x27\xfa\xbf\xf2\x7a\x1c\xe9\xd9\xb5\x6b\xd7\x55\
-\x89\x09\x89\x0d\xd5\xd5\x35\x40\x50\xdf\xe0\xd0\x7a\x35\x54\xd7\
-\xf0\xb2\xa6\x86\xbf\x5f\x55\x55\xc5\xfa\x52\x76\x76\x36\xda\x30\
-\x05\xed\x99\xc0\x6c\xbf\x67\xcf\x1e\xd8\xb9\x73\x27\x84\x85\x85\
-\xc1\x56\x64\xd3\xa6\x4d\xb0\x6e\xfd\x3a\x58\xbd\x7a\x35\x60\x5f\
-\x81\x15\x2b\x56\xc0\xf2\xe5\xcb\xff\xe3\xd0\x79\x57\xad\x5a\xc5\
-\xea\xb1\x7e\xfd\x7a\x56\xaf\x2d\x5b\xb7\xb2\x7a\xee\xd8\xb1\x83\
-\xd5\x3b\x36\x26\x16\xfd\x34\x01\x7d\x37\x09\xb2\xb2\xb3\x98\x3f\
-\x54\x55\x57\x61\xdb\x79\xbb\x6b\x44\xfb\x95\x65\xc5\x2e\x7c\x5b\
-\x35\xc5\x94\x1f\x7d\x7d\x7d\xb3\x7f\xfb\xdb\xdf\xd2\x7c\xb2\xed\
-\xc3\x16\xb6\x15\xaf\xe7\xff\xf2\x97\x3f\xcd\x0d\x0a\x0a\x2a\x2c\
-\x2f\xdf\xf7\xef\xca\xca\x2a\xa8\xac\xaa\xa4\xb8\x06\xb4\x5c\x85\
-\xb1\x9b\xad\x53\x29\x96\xb9\xe6\x59\xac\x5f\x93\xbd\xc8\x6e\xdb\
-\xc2\xb6\xc1\xa6\x8d\x1b\x60\xed\xda\xb5\xe0\xe6\xbe\x10\x1c\x5d\
-\x66\xc2\x42\xa7\x69\x30\x72\xfc\xe7\x30\x60\xd8\x47\xd0\x67\x70\
-\x77\xf8\x6c\x48\x77\xe8\x33\xf4\x43\xc1\x47\x26\xf4\x15\xf4\x91\
-\xca\xa6\xf6\xe9\xab\xdb\xd6\xe2\x67\xb0\x0e\x9f\xe1\x79\x59\x1d\
-\x86\x7c\xc8\xea\xf3\x25\x6e\x1b\x3a\xe6\x33\x58\xb0\x68\x32\xab\
-\xaf\xab\xfb\x02\x56\xff\x8d\x1b\x37\xc2\xb6\x6d\xdb\x60\x77\xe4\
-\x6e\x6c\x5f\x0c\xf3\x6b\xcc\x7f\xa0\xa0\xa0\x80\xb5\x5f\xb5\x0b\
-\x96\x15\x8a\x6d\xaa\x84\x7d\x2a\x69\xbd\x8a\xe2\xc9\xa5\xde\xbd\
-\x7b\x6f\x44\xfb\x7e\x68\xf8\xdf\x7b\x1d\xe1\x8d\x6e\xdd\xba\xad\
-\xc2\xba\x36\xd2\x58\x68\x8e\x7d\xe5\xfb\xf8\xf2\xbe\x72\x28\x28\
-\x2c\x60\x31\x3d\x3a\x3a\x1a\x6d\x13\x09\x5b\xb7\x86\xb1\x7e\xb4\
-\x64\x89\x37\xb8\xb8\xcd\x81\x29\xb3\x86\x33\x3b\x7f\x38\xb0\x2b\
-\xbc\xda\xf7\x55\xb0\xf9\xc4\x01\xda\x7f\x68\x0b\x2f\x75\xb3\x6e\
-\x99\xee\xbf\x10\x2d\x9c\xb7\x5d\x77\x1b\x56\xcf\x57\xfb\xbe\x86\
-\xf5\x7e\x8f\xd5\x7f\xcc\x94\xaf\xd1\x17\xe6\x81\x8f\xaf\x3b\x6b\
-\xdf\x96\xad\x5b\x60\xf7\xee\xdd\x10\x15\x15\x85\xb1\x21\x0e\xb2\
-\xb2\xb2\xd5\xfc\x81\xdb\xa8\x09\xdb\xed\xdb\xf7\x6f\x5f\x1f\x9f\
-\xdc\x27\x9e\x78\x62\x2c\xda\xfa\xb7\x0f\x5b\x6c\xe9\x45\x39\x5e\
-\xef\x19\x33\x66\xc4\x15\x15\x17\xff\xab\xb4\xac\x94\xb5\x87\xca\
-\xd2\xd2\x52\x50\xd6\xcb\x44\x99\x9b\x9b\xc3\xfa\xc0\xde\xbd\x7b\
-\x59\x5c\xdf\x80\xfd\x7c\x69\x70\x10\x8c\x9c\xb7\x04\x3e\x1a\x30\
-\x10\x3e\x19\xf8\x01\x74\xe9\xf3\x2a\xb4\xfb\x08\xb5\xfe\xd0\x46\
-\x43\x5b\xdc\x66\xd1\xd7\x01\xac\xbe\xec\x0c\xd6\x5f\xbd\x0c\x36\
-\x0a\x5f\x3f\x04\xf0\xbc\x54\x07\xeb\x01\x48\xff\xce\x60\x89\xf5\
-\x6a\x6b\xa6\xce\xed\xd0\x67\x3b\xf6\xee\x02\x9f\x0c\xe9\x06\x43\
-\xc6\xf5\x05\x17\xf7\xb9\xe0\xed\xb3\x18\x36\xac\xdf\xc0\xe2\x02\
-\xc5\xbb\x18\x8c\x0b\x14\x13\x68\x7c\x60\x76\x2a\x2d\x13\xb6\x13\
-\x76\x2c\x13\xeb\xb8\x1d\xf7\x3f\x69\x69\x69\xe9\x82\x36\x7f\xee\
-\x61\x0b\x8f\xaf\x47\x1f\x7f\xfc\xf1\x41\xc1\xc1\xc1\x25\x14\xc7\
-\x4b\x4a\x78\x3e\x4c\xb9\x39\x2d\xf3\xfc\x18\x4b\x24\x3f\x3f\x1f\
-\xf3\xb6\x04\xd6\xde\xed\xe1\xe1\xb0\x6e\xdd\x7a\x70\xf5\x5d\x02\
-\xdd\x46\x79\xc0\x6f\x7b\xf8\xc3\x23\xdd\x82\xe1\xf7\x9f\x2c\x83\
-\x17\xdf\xb1\x87\xb6\x1f\xdb\x41\xdb\x1e\x76\x60\x89\x76\xb5\xf9\
-\xee\x35\x70\x18\xfb\x16\x74\x9a\xf4\x0e\x74\x9e\x8c\x4c\x79\x17\
-\x79\xcf\xc8\x54\x2d\x5d\xcc\xf2\x6e\x13\xdb\xf5\xef\xbd\x2b\xf1\
-\x9e\x6e\x99\xaf\x6b\xce\xc7\xea\xf0\xae\x4a\xa7\xc9\xef\xb2\x7a\
-\x3a\x8c\xfd\x07\xd8\x62\xbd\xad\x06\x74\x81\x76\x3d\xa9\x3d\xe8\
-\x17\x08\xb5\xab\x13\xc6\xb2\x5e\xc3\x3e\x84\xa1\x38\x96\x2d\x72\
-\x9e\x81\x76\x58\x07\x5b\xb6\xf0\x98\x40\xb1\x30\x03\x73\x47\xc5\
-\x6e\xcc\xa6\x64\xcb\x62\xb2\x61\x09\xb7\x2d\x82\x31\xf6\x5a\xd7\
-\xae\x1f\x84\xa0\xfd\xff\xfa\x10\xb5\x7f\xec\x77\xbf\xfb\xdd\xe8\
-\x0d\x1b\x36\x1d\x2c\x2c\x10\xf3\xae\x02\xfd\xbc\xab\x00\x75\x2f\
-\x80\x24\xcc\xdb\x49\x77\xca\x8b\xa8\xbd\x3e\xfe\x1e\xf0\xd1\x38\
-\x0f\xf8\x9f\xbe\x81\xf0\x54\xef\x50\xf8\x7d\xaf\x50\xf8\x6d\x4f\
-\xa4\xcf\x46\xb0\xfa\xe2\x6b\xb4\xdf\xdb\xd0\x79\x5a\x57\xe8\x3c\
-\xfd\x03\xe4\x7d\x95\x2e\x32\x33\x14\x3e\x10\xe8\xb7\x99\x5b\xd7\
-\x97\xe6\xf6\xff\xa0\x89\xe3\xb6\xf0\x99\xe9\x1f\xb0\x7a\x75\x36\
-\x43\xc7\x09\xef\xa0\x1f\xbf\x0e\xed\xfb\x74\x42\xbf\xb6\x67\x58\
-\xf6\xea\x08\xef\xe1\x18\xf1\xf5\xe8\x5e\xe0\xb8\x78\x16\xcb\x23\
-\x37\x6f\xd9\x0c\xbb\x98\x1f\x44\x41\x36\x8e\x0b\x05\x9a\xb9\x67\
-\x01\xa3\x48\x6c\xcb\xca\xca\xba\xd3\xa3\x47\x8f\x95\xa8\x43\xfb\
-\x87\xa0\xfd\xa3\x4f\x3d\xf5\xd4\xe8\xb0\xb0\x6d\xc7\xf2\xf2\xf3\
-\x20\x3f\x2f\x1f\xf2\x18\x79\xc0\xd6\xb1\xaf\x53\x99\x99\x99\x89\
-\xba\x8b\x38\xbf\x61\x03\xac\xc0\xbc\x79\xce\xd8\x2f\x61\xc8\x37\
-\x5d\xc1\xaa\xdf\x1c\x78\x61\xc0\x32\x78\xee\xcb\x65\xf0\xfc\xf0\
-\x28\x78\x61\x66\x1d\x3c\xb3\xe8\x16\x38\x4c\xdf\xc5\x6c\xf9\xf2\
-\xac\x6e\x48\x77\x56\xbe\x32\xbb\x39\xba\x0b\xf4\xdb\xcc\xed\xd3\
-\x5a\xcc\x1d\xb7\xb9\x73\x98\xab\x43\x37\x4d\x1b\x14\x3a\x4e\x78\
-\x17\x6c\x06\xbe\x0e\xed\x3e\xed\x08\xed\x7a\x39\x80\x05\x96\x6f\
-\x7d\xf3\x36\x0c\x9e\xf8\x05\x78\xe1\xb8\xb0\x66\xcd\x1a\x08\xc3\
-\x71\x61\xd7\xae\x5d\xd8\x6f\x12\x99\x4d\xf3\x05\xdc\xd6\xdc\xde\
-\x54\xa2\x7d\x7f\xf8\xec\xb3\xcf\xd6\xa3\x1e\xd6\xff\x49\xf1\xff\
-\xf0\x87\x3f\x7c\x87\x31\xeb\x68\x4e\x4e\x2e\xe4\xe4\xe4\x80\xb1\
-\x34\x92\x88\xf9\x7c\x44\x44\x04\xc6\xb6\xad\x6c\x9e\xe4\xb6\x68\
-\x2a\x4c\xf8\xfc\x6f\x30\xe9\xb3\x37\x60\xec\x97\xff\x80\x0e\xfd\
-\x87\x40\xc7\xa9\xf1\xf0\xaa\x4f\x03\xbc\x1c\xf8\x3d\xd8\xfb\xdd\
-\x01\x0b\xaf\x3b\x60\xef\x7c\x12\x5e\x9e\xf2\x21\xbc\x32\xef\xa3\
-\x7b\xe6\xd5\x79\x1f\x37\xcd\xfc\x16\x68\xe2\x73\xaf\x30\x94\x73\
-\x7c\x7c\xf7\xf5\x9a\xcb\x79\x59\xd0\x79\x5a\x37\xb0\x1b\xfe\x16\
-\xb4\xef\xdb\x99\xf9\x82\xc5\x67\x5d\xa0\xfb\xd0\xee\x30\x71\xd6\
-\x30\x96\x03\x53\x9c\xdc\xb1\x63\x3b\xe6\x49\x7b\x58\x3f\xd2\xdb\
-\x57\x01\xf3\x86\x1f\xfb\xf7\x1f\xb0\xc9\xf0\x9f\xfb\x1e\xa1\x17\
-\xce\xbb\x6b\x31\xfe\x80\x39\xa8\xae\x94\xdb\x86\x87\x6f\x67\xf9\
-\x6e\xc0\x12\x2f\x98\x33\xea\x73\x98\xf4\xe9\x6b\x30\xa5\xef\xdf\
-\x61\x5a\xbf\x77\x61\xd1\xe0\x0f\x61\xa0\xd7\x24\xe8\x1a\x7a\x13\
-\xde\x5e\x72\x1c\xfe\xe1\x19\x0b\x6f\xb9\xed\x81\x37\x16\xa7\x41\
-\x67\xcf\x8b\xf0\xda\xec\x71\xf0\xea\xc2\x4f\x90\x9e\xa2\x94\xe9\
-\xa9\xa3\x17\x2b\x5f\x5b\xf4\x9f\xa4\x97\x99\x7a\xf4\x6c\xa2\xbe\
-\xe6\x79\x85\x58\xf0\x09\xbc\x3c\xbf\x07\xd8\x8d\x7c\x1b\xda\xf5\
-\xc1\x5c\xe1\xb3\xce\xe0\xf0\xe5\x1b\xf0\xf9\x98\x5e\x98\x27\xce\
-\x67\xfd\x66\xeb\xd6\xad\xac\x1f\x25\xa7\x24\x9b\xb5\x37\x91\x96\
-\x96\xf6\xcf\x8f\x3e\xfa\x88\xf2\x81\x5f\xfa\xba\xf1\x2b\x9e\xee\
-\x9e\x85\x19\xe9\x19\xe8\x77\xe9\x2c\x67\xe5\xcb\xbc\x4c\x4b\x4b\
-\x65\x79\x0c\x5d\x03\xa1\x6b\x33\xde\x7e\x1e\x30\x0c\xe7\x6f\x93\
-\x3f\x7d\x15\xa6\xf4\xf9\x1b\xcc\xf9\xba\x2b\xac\x9d\xfd\x15\xa4\
-\x05\x4e\x01\xf7\xc0\x31\xf0\xb1\x8f\x2f\x0c\x8c\x72\x84\x6f\xb3\
-\xdd\xe0\xf3\x8c\x45\xd0\x23\x6a\x3a\x74\x5b\x33\x16\xde\x5f\x30\
-\x08\x7a\xfa\x0f\x83\x5e\x01\xc3\x55\x3e\x55\x19\xa1\x65\xe9\x43\
-\x46\x53\x1f\x5e\xc7\x5e\x77\x05\x6f\xe7\x47\x1e\x03\xe1\x6f\xe3\
-\x3e\x81\x2e\xdf\xbe\x07\xaf\x60\x5e\xd0\x7b\x5c\x1f\x98\x34\x7b\
-\x04\x2c\x5b\xb6\x9c\x5d\x5b\x0a\xc7\x9c\x59\xb9\x76\x90\x9e\x21\
-\x6c\xce\xec\xce\x75\x88\x8b\x8b\xbb\xd5\xa5\x4b\x97\xf9\xa8\xd1\
-\x63\xbf\x90\xf6\xcf\x8e\x1e\x3d\x7a\x77\x4a\x6a\x2a\xa4\xa6\x20\
-\xa9\x9c\x14\x5c\x4e\x49\x4d\x61\xd7\xec\x28\xbf\xdb\xbc\x79\x33\
-\x2c\x5f\xbe\x0c\xbc\xfc\xdc\xe0\xcb\xc9\xfd\xe0\x1f\x03\xdf\x81\
-\x7e\x7d\x5e\x83\xd9\x83\xde\x85\x9d\x2e\xdf\xc0\x6e\xbf\x11\xe0\
-\x1f\x38\x02\x46\xae\x9e\x09\x7d\x52\xe6\xc2\xa0\x7d\x41\xd0\xbf\
-\xc0\x07\x3e\x49\x77\x82\x77\xe2\x67\xc2\xab\x91\x13\xe0\x8d\x88\
-\xb1\xd0\xd3\x77\x28\xf4\x09\x19\x63\x9e\xd0\xff\xa5\x98\xad\xef\
-\x68\xf8\xec\x2e\xe8\xee\xfc\x35\xbc\x36\xb4\x1b\xbc\x3a\xf8\x03\
-\xe8\x3e\xe6\x53\x98\xb2\x60\x1c\x04\xe3\xfc\x98\x62\x29\xf5\x2b\
-\xba\xe6\x9c\xaa\xd3\x40\x01\x7d\xe4\xec\x9f\xff\xfc\xe7\x01\xbf\
-\x80\xf6\x8f\xbd\xff\xde\x7b\x1e\xf1\xf1\xf1\x3f\x26\x25\x27\x41\
-\x72\x52\x32\x50\x49\x79\x3d\x95\x74\xed\x8e\xfc\x73\xe3\xa6\x8d\
-\xb0\x2c\x34\x14\xe6\xbb\x4c\x83\x2f\x26\xf7\x87\x37\x86\x7d\x04\
-\xaf\x0d\xf9\x08\x6c\x5f\xf7\x82\x77\x07\xb9\xc1\x67\x73\x67\x40\
-\xdf\x85\xce\xf0\xd9\xd8\x1d\xf0\x49\xaf\x72\xf8\x2e\xc2\x11\x06\
-\x56\x2c\xe5\xfa\x67\x38\xc3\x7b\xf1\xb3\xe1\xf5\xc8\x89\xf0\x5a\
-\xe2\x64\xe8\xe6\xfa\x2d\xf4\x5b\x35\xd1\x3c\xab\x9b\x62\x92\x09\
-\xfd\xef\x13\xd3\x63\x36\x71\xee\xa6\xea\x2a\xf1\x05\x63\x42\x8b\
-\x7c\x16\x34\x1a\xde\x1a\xdf\x0b\x5e\x1f\xfa\x21\x74\xc5\xf9\xc1\
-\xb8\x79\xc3\xc1\xd7\xcf\x0b\xd6\xae\x5d\x83\x73\x84\x2d\x10\x85\
-\xf3\x83\x64\x66\xff\x64\x06\x5d\x47\x63\x5a\x20\xbe\xbe\xbe\xe5\
-\xa8\x97\xc3\x83\x14\xff\x8f\x7f\xfc\x63\x9f\x6d\xdb\xb6\x5d\xa0\
-\xf8\x63\x4a\x3c\xd3\x9e\xf2\xfb\x90\x90\x10\x98\xb1\x60\x3c\x7c\
-\x3e\xe5\x4b\xf8\xfb\x88\x4f\xe0\xef\xa3\x7a\x42\x4f\x8f\xa1\xf0\
-\xca\xc7\xd1\xe0\xe0\x70\x04\xde\x7c\xf3\x18\x74\xed\x7a\x1c\x7a\
-\xf5\x3a\x05\xbd\x7b\x9f\x86\x6f\x5c\x7d\xa1\x5f\x99\x37\x7c\x91\
-\xef\x09\x3d\xd2\x1d\x79\xff\xdf\x3d\x1e\x3a\xee\x1a\x03\xef\x06\
-\x0f\x85\x01\x6b\xa7\xc2\x57\xeb\xa6\xc1\x57\xeb\x9b\xe6\xeb\xf5\
-\xd3\x1f\x1a\xcd\xd5\x8b\xd5\xbb\x19\x06\x30\xa6\x36\x49\xbf\x15\
-\x93\xe0\xdd\xc9\x7d\xe1\xef\x23\x3f\x81\xf7\xc7\xf4\x86\x51\x73\
-\x86\x80\xb7\xaf\x07\x9f\x27\x6e\xda\x0c\x51\x7b\xa3\xcc\x68\xc1\
-\x19\x3c\x78\xf0\x26\x94\xed\x37\x0f\x48\xfe\x17\x9d\x9d\x9d\x0b\
-\x8d\xdf\x8b\x89\xef\xcf\xc4\x32\x69\x4f\xb1\x29\x28\x28\x08\xe6\
-\x2f\x9e\x01\xfd\xa6\x7d\x0d\xff\xc0\xb8\xf5\xce\xf8\xcf\xe0\xf3\
-\xc0\x09\xf0\xcd\xa6\xd9\xf0\xfe\xa4\x50\xb0\xb6\xae\x81\x4e\x9d\
-\x0e\xa0\x0f\xd4\xa1\x0f\xd4\x43\xf7\xee\xc7\xa0\xe7\xb0\x2d\xd0\
-\x17\x75\xef\x9d\xe3\x06\xdd\x52\x17\xc0\xdf\x63\xa6\x43\x97\x88\
-\x71\x60\xbb\x65\x28\xbc\xb9\x71\x24\x7c\xb5\x76\x06\x7c\xbb\x79\
-\x0e\x0c\x34\xcb\x5c\xce\x16\xc1\xe6\xb9\xe6\xb7\x99\x7b\xdf\xdc\
-\x3e\x9b\x9b\xd8\x4f\xff\x99\x26\xcf\x29\xd5\x0d\x97\xbf\x55\xd8\
-\x2c\xd8\xa4\x63\xb3\x76\xf9\x9b\xcd\xb3\x99\xad\x18\x9b\x39\x5f\
-\xad\x9f\x09\xdd\xe7\x72\x7b\x7e\x30\xbe\x2f\x8c\x9e\x3b\x14\x7c\
-\x7c\xbd\x98\x0f\x6c\xda\xb8\x91\xe5\xd9\xf2\xf7\x91\x8a\x26\x38\
-\x77\xbc\x6d\x65\x65\x35\xe4\x41\x88\xdf\xa3\xc7\xc7\x9e\xd1\xd1\
-\x51\xff\xa6\x6b\x94\xd1\x31\xd1\x48\x0c\xbb\x5e\x19\x1d\x1d\xc3\
-\xc6\x7b\xfa\x8e\x23\x38\x38\x18\xbc\x96\x78\xc2\x57\x33\xbf\x83\
-\x77\xc7\xf5\x85\x77\x71\x2e\x3b\x60\xe5\x74\x18\x14\xb6\x80\xf1\
-\xf9\x52\x37\x68\xd7\xae\x14\x2c\x2c\x2a\x31\x0e\xd4\xc2\x2b\xaf\
-\xec\x87\xd7\x5f\x3f\x08\x7f\x7b\x3b\x1d\x3e\xdb\x39\x0b\x7a\x16\
-\xba\x42\xb7\xdc\x05\xf0\x61\xea\x5c\xf8\x20\x71\x16\xbc\x1e\x3b\
-\x11\xfe\x96\x3a\x05\xfa\x87\x4c\x86\x21\xdb\x16\x0a\x16\xdd\x35\
-\x43\x9b\x22\xdc\x0c\xcd\xec\x7f\x2f\xe7\x36\xd6\x9b\x33\x58\x26\
-\xac\x29\x16\xa8\x36\x53\xf8\x6e\xcb\x7c\xf8\x78\xe1\x60\x78\x07\
-\xed\xfa\xe1\xc4\xfe\x30\xd5\x79\x12\x2c\x5d\xba\x14\x56\xad\x5e\
-\xc5\xc6\xdb\x68\xf4\x01\xd2\x82\xae\x1d\x2a\xba\xc4\x20\x3e\x3e\
-\x3e\x55\x28\x5f\xbb\xfb\x94\xff\x75\x9c\x87\x9e\xa3\x6b\xf5\x7a\
-\xe8\xfa\x04\x5d\xab\x08\xc5\xf1\xde\xcd\xcb\x05\xbe\x9d\x3d\x08\
-\xfb\x79\x3f\xe8\x3a\xe9\x0b\xf8\x6a\xe5\x0c\x18\xb6\xd3\x59\x65\
-\x38\x62\xf3\x72\x0a\x3c\xfd\x74\x09\xbc\xf4\x52\x19\x58\x5a\x96\
-\x63\x3c\xa8\x00\x7b\xfb\x5a\xf8\x64\xd1\x14\xe8\x97\xea\x0c\x43\
-\x22\x9c\x60\x44\x84\x0b\x63\x78\x84\x33\x0c\x88\x5e\x04\x83\x31\
-\x3f\x18\x11\xb1\xb8\x59\x46\xde\x0d\xbb\x5a\xc9\x5d\x1c\xb3\xa5\
-\xfa\x29\x6d\x92\x19\x4e\xec\x34\x87\xb3\x06\xc5\x7e\x43\xb7\x3b\
-\x41\x0f\xf4\x81\xae\x13\xfb\xc1\xa7\xd3\xbf\x81\x89\x0b\xc7\x32\
-\x1f\x58\x8d\xf3\xc3\x2d\x5b\x36\xa3\x1e\x51\x26\xfa\x20\x3f\xf7\
-\xe9\xd3\xc7\xfb\x3e\xb4\x7f\x6c\xec\xd8\xb1\xdb\x22\x23\x23\x41\
-\x0f\xcd\xf1\xa8\xdf\xd3\x1c\xcf\x2f\xc0\x07\x46\xcc\x1f\x06\x1f\
-\x4e\xfd\x0a\xde\x9f\xfa\x25\x7c\x19\x3c\x15\x46\x46\xba\x99\xd0\
-\x63\xd6\x6a\xb0\xe8\x98\x0a\xcf\x3d\x57\x08\x2f\xbe\x58\x0c\xed\
-\x2d\x0a\xe0\xed\xaf\xf6\xc2\xa0\x0d\x3e\x30\x7a\x8f\x3b\x8c\x12\
-\x8c\x16\x8c\xda\xe3\x81\xa5\x07\x2b\x15\x46\x0b\xc6\x48\xe8\xd7\
-\xc7\x98\xdb\x6f\xaf\x27\x8c\x46\xc6\x34\x83\xfe\x7d\x73\xc7\x6d\
-\xcd\x39\x9b\xc6\x5d\xc3\xa8\x48\x53\x46\x6a\xd6\xdd\x18\x8a\xfd\
-\x86\x85\x3b\xc1\xc7\xf3\xb1\x8f\x61\x6e\xf5\xe5\x9c\xc1\xb0\xc0\
-\x7d\x16\x04\x63\xbe\xb5\x1a\xe3\x00\x8d\xc1\xe6\x74\xc2\x71\xe2\
-\xec\xe3\x8f\x3f\xde\xf9\x5e\xc4\xff\x9f\xe7\xfe\xe7\x7d\x9c\xcb\
-\xdd\xa0\x6b\x0f\xbb\x76\x45\xb0\x6b\x10\x11\x11\xbb\x58\xb9\x11\
-\xe7\xa3\xa4\xfd\x9a\x35\x6b\x61\xb4\xcb\x04\xf8\x64\xc6\x77\xd0\
-\x73\xc6\x20\x18\x1c\x32\x07\x66\xc4\x2e\x95\x08\x34\xcb\xcc\x38\
-\x3d\x41\x2d\x32\x4b\x21\xde\x1c\xc1\x0f\x09\x5d\x3d\xe2\xb4\x34\
-\xdf\x26\xad\x0d\x9a\xb2\x15\x87\xdb\x73\x72\xa4\x2f\x7c\x86\x73\
-\x01\xb2\x75\x8f\xa9\x5f\x43\xd0\xca\xa5\x4c\x07\xba\x4e\x44\xd7\
-\xd8\x23\x48\x27\x8c\xcb\xbb\x22\x14\xbd\x22\x60\xf8\xf0\xe1\xf4\
-\x1d\xc1\xdd\x3e\xfc\xf3\xe8\xe4\xc9\x93\xf7\xd0\xf8\xae\x27\x2c\
-\x6c\x1b\xac\x58\xc1\xef\x81\x71\x0e\x59\x0c\xcf\x7c\xf7\x06\x3c\
-\x33\xf0\x75\x78\x7e\xdc\x3b\x60\xe9\xf7\x39\xf2\x05\x58\xfa\x37\
-\x47\x3f\x86\x95\xc2\x12\xf3\x58\x2f\xe9\xdf\x32\x01\x0a\x5f\xb6\
-\x0a\x9b\x56\xd0\xda\x63\x19\xcf\xdd\x8a\x7a\x22\x66\xdb\x29\xd9\
-\x81\xdb\xa5\x19\xbb\xf9\x71\xda\x3a\xf7\x62\xf6\x7e\x66\xe0\x1b\
-\xf0\xd6\xe4\x9e\x6c\xde\x45\x5a\xac\x67\xd7\x8b\x4d\xf5\x42\xdf\
-\xb8\xf8\xab\x5f\xfd\xea\xae\xe6\x83\x7f\xfe\xf3\x9f\xff\x86\x39\
-\xfd\x4d\x8a\x2b\x46\xb6\xb1\x72\xe5\xca\x55\x10\xba\x2c\x14\xd6\
-\xae\x5f\x05\x16\xc3\xde\x82\x67\x07\xff\x1d\x9e\x1d\xf1\x0f\xb0\
-\xf0\xc3\xfa\x07\x0d\x00\xcb\x60\x73\x7c\xc5\xb0\x32\x47\x88\xc2\
-\xd7\x60\xdd\x14\xc1\x54\x7e\xc3\x09\x95\x4a\x69\xd9\x26\x44\x10\
-\x2a\x08\x31\xb3\x4d\x4f\x53\xef\x37\xf7\x19\xfd\xf9\x95\x75\x99\
-\x60\xb9\xde\xba\x76\x20\xd4\x56\xd6\x66\x6a\x7f\x90\x54\x22\x96\
-\x0a\x7a\x1b\x06\x19\x79\x71\xe6\x87\xdc\xee\xc8\xbc\xa5\x8e\x2c\
-\x07\x5b\x86\x9a\xd0\xfd\x67\xa4\xd1\x36\x49\x2f\x62\xc8\x90\x21\
-\xfe\x77\xa3\xff\x98\x31\x63\xd6\xd1\xb5\x26\x0e\xbf\xa7\x8d\xee\
-\x55\x60\x73\x7c\xcc\xf5\x83\x83\x43\x60\x80\xe3\x70\x78\x66\xd8\
-\x3f\x18\x2f\x39\x7d\x0a\x96\x68\x07\x95\x65\x0a\xdf\x32\xac\xcc\
-\xb1\x9c\x18\x08\xd6\xcd\xf2\x1d\x67\x85\x16\x9b\x66\x19\xf4\x0b\
-\x63\xfe\xbc\xfa\x3a\x32\x94\xfa\x37\xd1\x3e\x2b\x86\xb0\x85\xce\
-\x3e\x96\x2a\x92\x3d\x15\xfb\xa2\x0f\x3d\x3b\xe6\x3d\xb4\xfd\xdb\
-\xf0\x22\xf6\xc1\x15\x6b\x42\x51\x97\x10\x76\x4f\xe2\xb6\x6d\xa4\
-\x59\xb8\x28\x11\x2c\x31\x57\x3c\x65\x68\xfd\xfd\x22\x7f\x0d\x09\
-\x09\x39\x4f\xdf\xdb\xd1\x7d\x09\xf4\xfd\x03\x27\x8c\x5d\xdf\xa1\
-\x79\xbe\xef\x72\x3f\x78\x66\xc4\xdb\xf0\xcc\xc8\x77\xe0\xf9\xa9\
-\xdd\xc1\x72\xc5\x40\xb0\x5c\x29\xf3\x9d\x8a\x95\xcc\x2a\x85\x41\
-\x0c\x6b\xb3\x0c\x36\xb2\x5a\x8b\x8d\x86\x21\x4d\xb3\xe6\x17\xa0\
-\xb9\xf3\x49\xf5\xd2\xd7\x99\x21\xb7\x49\xd7\x5e\x2b\x0d\xc2\x3e\
-\xc2\x5e\x96\x1a\x24\xfb\xa2\xbd\x5f\xf2\xe8\xcb\xec\x4f\xf4\x77\
-\x1a\xc6\x74\x21\xe8\x5a\x0c\x69\x45\x28\x1a\x12\x38\x17\x18\xd5\
-\x1a\xf1\xfb\xf5\xeb\x37\x71\x33\xe6\x77\xf4\x9d\x03\x5d\xcb\x57\
-\xa0\xb9\x5e\x60\x60\x20\x9e\x23\x18\x7a\x39\x0e\x81\x67\x46\xbf\
-\xc7\x68\x87\xb1\xca\x62\xcd\x20\xc1\x60\x15\x4b\x73\xac\x1d\xa2\
-\xc1\x4a\x65\xa8\x91\x75\x5a\xac\x55\x86\xb5\x8e\xf5\x5a\x6c\xee\
-\x13\xfd\xf1\x5a\x57\x0f\x63\xbd\xf5\xed\x31\xb6\xd5\xd8\x7e\xbd\
-\x5d\xf4\x76\xb3\xd0\x30\x48\xe5\xf9\x59\x3d\x98\x06\xcf\x8e\x7a\
-\x07\x96\x2c\xf7\x67\xfa\x50\x6c\xe6\x9a\x6d\x51\xb5\x23\x2d\xe7\
-\xcf\x9f\x9f\x6d\x68\xf9\xde\xd1\x47\x16\x2e\x5c\x98\x4f\xf7\xac\
-\xea\xa1\x63\x07\x04\x04\x80\x47\xb0\x3b\x3c\x43\xb1\x67\x6c\x57\
-\x78\x61\x7e\x2f\xb0\x58\x3f\x54\x30\x8c\x61\x69\x8e\x0d\xc3\x19\
-\x56\x52\xc9\x19\xa1\xc1\x7a\xa3\x9e\x91\x2d\x62\x23\xb3\x49\x61\
-\xd4\x2f\x80\x74\x7c\xe9\xdc\x2d\xd7\xd1\xd8\x1e\xab\x8d\x23\x4c\
-\xda\xcc\x31\xda\x46\x83\xce\x8e\x16\x1a\x86\x42\xbb\x90\x6f\x51\
-\x8b\xae\x4c\x8b\x01\x8b\x47\x32\x7d\x08\xe5\xbe\x63\x19\xcc\x03\
-\xef\x60\x5e\xd7\x6c\x1e\xf8\xbb\xdf\xfd\xae\x03\xce\x27\xee\xd0\
-\xbd\x89\xeb\x71\xac\xdf\x20\xa0\x39\xc6\x92\x25\xfe\xec\xd8\x7d\
-\x5c\x86\xc2\x33\xe3\x3f\x80\x67\x26\x74\x83\xb6\x2b\x07\x41\xfb\
-\xcd\x23\x90\x91\x60\xd1\x14\x5b\x46\x31\x2c\xcd\x32\x5a\xc5\x6a\
-\xab\x39\xc6\x68\xb0\x36\x47\x98\xc2\x58\x81\x7e\xfd\x97\x40\x9c\
-\x83\xd5\x61\xb4\x8e\x31\x26\xf5\x36\x69\x97\xd4\x6e\x8e\x62\x8f\
-\x91\xea\xb2\x62\xb7\xa6\xec\xda\x9e\x31\x02\x9e\x9f\xff\x29\xd3\
-\xe3\x85\x71\xef\x43\xf0\x8a\x40\xd4\x69\x09\x1b\xa7\xb9\x7e\xeb\
-\xb9\x86\xeb\x39\x23\x47\x8e\x9c\xd7\x9c\xfe\xa3\x46\x8d\x9a\x45\
-\xf7\x9d\x30\xd0\x87\x38\xeb\xd8\xb8\xe2\xef\xef\x0f\x41\xcb\x03\
-\xe0\x39\xd2\x7e\xe2\x87\xf0\xbc\x63\x1f\x68\x8f\x6d\x21\x2c\xcc\
-\x81\xf6\x51\xb0\x34\xcb\x58\xce\xb6\xb1\x60\x65\xc2\x38\x0d\xd6\
-\x0a\xe1\x0a\xe3\xef\x0a\x9b\x7b\xe4\xee\xce\x23\xea\x26\xd5\x57\
-\xdb\x0e\xd3\x76\x52\xdb\x55\x3b\x98\xb1\x91\x6c\x43\xbd\x7d\x15\
-\xdb\xff\x35\xf0\x5b\xa6\xc7\x33\x13\xbb\xc3\x30\xb7\x89\x4c\x27\
-\x62\xcd\xda\x35\xa0\x68\xb9\x76\xed\x3a\xa6\xe3\x22\x47\xc7\x22\
-\x43\x33\xd7\x02\x30\xf6\x67\xae\xc6\x71\x7e\xcd\xea\xd5\xb0\x7a\
-\xf5\x1a\xa0\xe5\xd5\xab\x56\x83\x9f\x9f\x3f\xf8\xfa\xf9\xc1\x70\
-\xf7\x69\xf0\xcc\xe4\x8f\xe0\x99\x29\x1f\xc1\x4b\x2b\x87\x40\xfb\
-\xf0\xb1\x60\xa1\x61\x1c\x58\x6c\x37\x62\xa9\x61\xbc\x06\xab\x1d\
-\x32\x13\x4c\xb0\x56\x99\xc8\xd9\xd9\x3c\x36\x8c\x49\xff\x01\xf8\
-\xb9\x5a\xaa\x0f\xaf\xb7\xb1\x1d\xa6\x6d\x34\xb6\x5f\x6f\x1b\x4b\
-\x9d\xed\x54\x9b\x92\x7d\x75\x36\x27\x0d\x9e\x9d\xd3\x0b\x9e\x46\
-\x4d\x5e\x9d\xd3\x17\xb5\xf2\x05\x3f\x5f\x5f\x36\x47\x5f\xc3\xb4\
-\xe4\x7a\xd2\x32\xc6\x85\xdb\x4f\x3e\xf9\x64\x53\xcf\x11\xfd\x05\
-\x63\xc7\x95\x55\x38\xbf\xa7\xeb\x49\xab\xc4\x75\xa5\x90\xd0\x10\
-\xfa\x2e\x01\x7c\x91\x2e\x73\x31\xe7\x9c\xf6\x31\x3c\x3b\xaf\x37\
-\xb4\x8b\x98\x00\xed\x4d\x98\xc8\xb0\xd8\xa5\x67\x92\x8a\xa5\xc2\
-\x6e\x85\xc9\x26\x58\x99\x30\xc5\x48\xa4\x16\x6b\xb3\x4c\xfd\x85\
-\xd0\x9e\x47\x5f\x17\x86\x5a\x57\x6d\x1b\xcc\xb5\x53\xb5\x81\xb0\
-\x89\x85\x06\x53\x3b\x72\xfb\x9a\xda\xfd\x85\x25\xdf\x30\x5d\x08\
-\xef\x10\x6f\xa6\x17\x8d\x03\xab\x56\xa1\x86\xa8\xe7\x4a\x2c\x57\
-\xae\x5a\xc5\x18\x32\x64\xc8\x77\xe6\xc4\xef\xf3\xe9\xa7\x3d\x69\
-\xfe\xb8\x62\x05\x7f\xa6\x8e\xb1\x72\x05\xf8\x63\xdf\xf7\xf2\xf2\
-\x02\x2f\x3c\xee\xd3\xd3\x7b\xc0\xd3\x33\x3e\x81\x17\x96\x0e\x84\
-\xf6\x58\x6f\x23\x93\x19\x16\x91\x7a\xa6\xa8\x58\xca\xec\x99\x6a\
-\x16\x2b\x95\x69\x46\xf6\x6a\xb1\x66\x4c\xbf\x7b\xa2\x66\xb4\x9e\
-\x7b\x39\xfe\x5e\xd3\xba\x6a\xda\xc1\xe0\xed\x6b\xaa\xfd\x8a\x7d\
-\x2c\x4c\x30\xda\xb4\x7d\xe4\x64\xd5\xde\x8a\xfd\xdb\x6e\x19\xc3\
-\x74\x21\x86\xf8\xce\xe6\x7a\x79\x7b\xa9\xcf\x29\x2a\x5a\x52\x39\
-\x67\xce\x9c\x55\xe6\xf4\x9f\x31\x63\xda\xe2\x65\xcb\x96\x81\x82\
-\xf2\x9c\xa3\xa7\xa7\x17\xe2\x09\x43\x7c\xe6\xc0\xd3\xb3\x7b\xc3\
-\xd3\xb3\x7a\xc1\x4b\x38\x9e\xb5\x8f\x9a\x82\x4c\x15\x4c\x03\x0b\
-\x2c\x2d\xa2\xb1\x8c\x56\xca\xe9\x0c\x4b\xc6\x34\x51\x22\x31\x33\
-\x34\x58\xc5\x4c\x17\xcc\x10\xcc\x34\x96\xb1\x1c\x6b\x95\x59\x52\
-\xd9\xdc\xf2\x2c\xb0\x61\xcc\x36\x83\x78\x2f\x8e\x98\xcd\x91\xb7\
-\x6b\xf6\x53\xca\x99\x26\xc7\x37\x9e\x53\x5f\x37\x23\xc6\x36\x29\
-\xed\x9a\x29\xb5\x4f\xb6\xc3\x74\x4e\xf4\x0c\xa3\x9d\x84\xfd\x8c\
-\xb6\x9c\x66\xb4\xaf\xb0\x39\x67\x2a\xd3\xe2\x19\xa7\xcf\x99\x36\
-\x16\xb3\x3f\x45\xfd\xbd\xc1\xc3\xd3\x03\xe7\x6c\x41\xaa\x8e\x8a\
-\xae\x4e\x4e\xce\xfb\xcd\x8e\xfd\xf3\x17\xa6\x85\x62\xac\xa7\xdc\
-\x91\xae\x27\xd2\xf8\xc1\xbe\xd7\x47\x5f\x72\x77\x77\x87\x7f\x8c\
-\xfb\x00\x9e\x9b\xd6\x1b\x9e\x73\xff\x06\xda\x61\x5d\xdb\x61\xbd\
-\x89\xf6\x0a\xb1\x0a\x33\x55\x2c\x34\xcc\x02\x8b\x38\x23\x96\x1a\
-\x66\x9b\x60\x15\xaf\x30\xa7\x59\xac\x4d\x98\x6b\x4a\xc2\x3d\x60\
-\xee\x38\x0c\xe3\xb9\x5a\xaa\x1b\xc7\xb4\x6d\x1c\x63\xfb\x2d\xf4\
-\x90\xad\x24\xdb\x19\x6d\x2a\xd9\x59\xd8\x5f\xe1\x85\xe5\x43\xe1\
-\xe9\xb9\x9f\xc2\xd3\x73\x3e\x05\xf7\x20\x0f\xa6\x99\x2f\xe6\x01\
-\x8a\xee\xa4\x29\x69\x1b\xb0\x34\xe0\x7b\x03\xff\x1d\x35\xf9\xf5\
-\x28\xee\x7f\x36\x34\x84\xeb\xaf\x80\xfb\xb2\x71\x7f\x69\xa0\x3f\
-\xbc\x34\xf4\x2d\x78\x7e\xf8\xbb\xd0\x76\xf1\x97\x60\x9d\xe4\x0c\
-\xed\x92\xe6\x41\xbb\xf8\x59\xd0\x2e\x41\x66\x36\xa3\xbd\x86\x39\
-\x2a\x16\x89\xe6\x98\xcb\xb0\x94\xc1\x63\x9b\xc3\xca\x2c\xf3\x5b\
-\x47\x32\xc7\xba\x19\x94\x7d\x5a\x7d\xcc\x26\xea\x64\xbe\xfe\xc6\
-\xf6\x59\x68\xd0\xda\xa3\x7d\xe2\x1c\xc9\x66\x46\x3b\xb6\x53\x91\
-\xec\x8d\xf6\x6f\x2b\x78\x69\xd7\x14\x78\x7a\xde\x67\x48\x1f\x18\
-\xe0\x3c\x01\xf5\xf7\x00\x0f\x24\x44\xa3\x29\xf7\x81\x3e\x7d\xfa\
-\x74\x97\xc5\x7f\xe9\xa5\x97\x5e\x08\x0c\x0c\xfc\x89\xfa\x7b\xb0\
-\xb8\x8e\x48\xf8\x61\xce\x4f\x3e\x34\xd5\x69\x1c\x3c\x3f\xea\x3d\
-\x46\x7b\xf7\x2f\xc0\x66\xf9\x20\xcc\x81\x31\xc6\xa5\xbb\x83\x45\
-\xea\x22\x68\x9f\x3c\x17\x99\x07\x16\x66\x99\xcf\xb0\x4c\xd1\xb3\
-\x40\xc5\x4a\x4f\xea\x42\x0d\xd6\x1a\x16\x35\x89\x8d\x4c\xba\x0b\
-\xd8\x66\xba\x83\x5d\xb6\x27\xd8\xe7\xfa\x42\x87\x3c\x7f\xe8\x90\
-\x83\x64\xfb\x72\x32\x7d\xc0\x21\xdd\x1b\x1c\x32\xbc\x71\xdd\x8f\
-\x6f\xcb\xc1\x32\xcf\x0f\xec\x72\xbc\xc0\x36\xcb\x1d\x8f\xe1\xac\
-\x3d\xa6\xa0\xe9\x3a\x18\xeb\xa9\x6f\x03\x43\x6a\xa3\xa5\x09\x46\
-\xdb\x28\x36\xe3\x68\xed\xd9\x5e\x05\x6d\x9e\x64\xa4\x1d\xfa\xcd\
-\x33\x8e\xfd\xe0\xe9\x85\x9f\xc3\xc7\x3e\xa3\xc1\xcd\xcd\x8d\x41\
-\xf7\x89\x28\x7a\x32\x7d\x51\xff\x99\xd3\x67\x4e\x92\xf5\xff\xaa\
-\x5f\xbf\x8f\x03\x83\x02\x81\xb1\x34\x90\x7d\x86\xf0\xf6\xc1\x5c\
-\xd2\xdb\x1b\x46\xba\x8f\x87\x17\x70\x7e\xf9\x02\xce\xfd\xad\x96\
-\x0d\x06\x6b\x9c\xfb\x59\xaf\x1c\x0a\xd6\xab\x86\x82\xcd\x2e\x1c\
-\x1f\xd3\xdc\xc1\x32\xd7\x0b\xda\x67\xa0\x2f\xa4\x2d\x90\x58\xc8\
-\xb0\x48\xd7\xb3\x88\x61\x69\x82\x23\x58\x66\x70\xac\xcc\xe2\xa4\
-\x62\x9d\xe5\x0a\x36\x39\x9e\x60\x8b\x7a\xd9\x17\x04\x70\xed\x50\
-\x4b\x87\x14\x0f\xe8\x98\xe0\x06\x1d\xf7\x2e\x04\x87\x88\x59\xe0\
-\x10\x3e\x0d\x1c\x36\x4f\x00\x87\xf5\x63\xc0\x61\xdd\x68\x33\x8c\
-\x02\x87\xb5\xd2\xfa\x86\xb1\xe0\x10\x36\x85\x7d\xb6\x63\xb4\x23\
-\x38\x24\xb9\xb3\xe3\xda\xe7\x2d\x01\xbb\x7c\x7f\xb0\xc9\xf5\x04\
-\xeb\x4c\x17\x4d\x5d\x4c\xd1\xd6\x5b\x69\x13\x6b\x9f\xae\xcd\x16\
-\x1a\xb4\x76\xe2\xf6\x5b\xa0\xa1\x9d\xca\x7c\x4e\x2a\xa7\x2d\xf2\
-\x5c\xd0\x10\x78\x7a\xd1\x17\xf0\x57\xf4\x01\x57\x57\x57\x58\xbc\
-\x78\x31\xeb\xbf\xa4\x65\x20\x11\xb8\x94\xe5\x04\x0b\x16\x2c\x08\
-\x95\xf5\x9f\x3e\x7d\xfa\x58\x45\x73\xba\xc6\xb7\x14\xa1\xf9\x03\
-\xcb\x23\x91\x8f\xe7\x7f\x0e\x2f\xe0\xbc\xff\xc5\xd9\xbd\xc0\x66\
-\xd3\x68\xb0\x5e\x37\x12\xac\x57\x0f\x67\xd8\xac\x1e\x01\x36\x6b\
-\x90\x8d\xe3\xc1\x36\x6a\x21\xfa\x02\xda\x07\xed\x64\x95\xef\x03\
-\x16\xd9\xae\xd0\x3e\xd3\x91\x61\x91\x85\x65\x96\x13\x2e\x3b\x81\
-\x85\x09\xce\x0c\x4b\xc4\x2a\x4b\x90\xe3\x06\xd6\x79\xde\x60\x5b\
-\xe8\x0f\x76\x45\x81\x68\x7f\xec\xbb\x99\xd8\x47\xd3\xbc\xc0\x01\
-\xf5\x75\xc0\x73\x39\xec\x9c\x0d\x0e\x5b\xa7\x40\x87\x0d\xe3\x50\
-\xdf\xb1\x4d\x30\x4e\x2a\x9b\xdb\x4f\xec\xb3\xa1\x89\x7d\xe9\x1c\
-\x5b\x26\xa1\x5f\xcc\x81\x8e\x71\x8b\xc1\x21\xd5\x8b\xc5\x0d\xfb\
-\xc2\xa5\x60\x57\xb8\x04\x6c\xf2\xbc\xc0\x0a\xdb\x6b\x99\x85\xbe\
-\x91\xed\x02\x96\x88\x15\x5b\xc6\x76\x11\x59\xbc\x7d\x96\x52\x5b\
-\xa9\xed\x96\x59\x1c\xb2\x8b\x11\x47\x23\xe8\x37\xed\x94\x92\xfa\
-\x17\x42\x65\xbb\xcc\x45\xd0\x96\xc8\x58\x08\x6d\xd1\x57\xda\x21\
-\xcf\xa3\x1f\x3f\xed\xd2\x1f\x9e\x76\xea\x07\xee\x01\xee\xb0\xd8\
-\xc5\x05\xbc\x30\x77\xa7\x71\x7c\x29\x83\x6b\x4c\xd7\x79\x64\xfd\
-\x1d\x1d\x1d\x5d\x95\x6b\xc7\x4b\x02\x96\xb0\x92\x62\xbf\xa7\x97\
-\x27\xf3\x9f\x4e\x53\xb1\xef\x4f\xed\x01\x6d\x3d\x06\x80\x2d\xe6\
-\xfe\xb6\xdb\x50\xeb\xb0\x71\xa8\xf9\x68\xb0\x59\x4f\x8c\x52\x4b\
-\x5b\x2c\x19\xdb\xa6\x80\xed\xde\x05\x60\x97\xe4\x06\x76\xe9\xd8\
-\x4f\x31\xbe\xda\xe6\xfa\xa1\x9d\x96\xa0\xa6\x4b\x39\x05\x48\xae\
-\x3f\xc3\x0e\xdf\xb7\xcf\xf0\x81\x0e\x64\xd7\x24\x0f\xe8\x10\xe3\
-\x04\x1d\x76\xcf\x81\x0e\xe1\x53\xa1\xc3\xa6\x71\x12\xe3\x19\x0e\
-\x32\xd4\xbf\xcd\x6c\xeb\xb8\x05\xd9\x3a\x11\x3a\x86\x4d\x42\x26\
-\x43\xa7\x6d\x48\xb8\xc4\x76\x81\xb2\x8c\xef\xb3\x7d\xb7\x22\x5b\
-\x26\x6a\x8f\xab\x5f\x56\xd6\x37\x8f\xe7\x31\x66\xcf\x7c\x70\x48\
-\x74\xc3\x58\xe1\xcb\x62\x85\x6d\x49\x30\xd8\x16\x07\x80\x75\x81\
-\x0f\x58\xe6\xb9\x61\x7c\x44\xdf\xc8\x5d\x0c\x96\x39\x46\x2c\x34\
-\xcb\x2e\x2a\xed\x15\xd0\x6f\x64\xda\xb1\xd2\x09\x4b\x23\x6d\x09\
-\xf4\x9f\x76\xd8\xbf\x5e\x8c\x98\x06\x4f\x2f\x1e\x00\x4f\xbb\x0e\
-\xc0\x98\x3d\x05\x9c\x9d\x9d\xd9\x18\xa0\x68\x1b\xb0\x84\x6b\x8b\
-\xdb\x8f\x69\x72\xff\x85\x0b\x37\xd1\xf5\xfd\x25\xfe\x4b\xd4\xeb\
-\x87\xde\x18\xf7\x3d\x3c\x70\x0e\xb1\xd4\x03\xda\xe2\xbc\xff\xf9\
-\xe9\x3d\xa1\xad\xdf\x37\x60\xb3\x63\x22\xd8\x2a\xec\xa4\x72\x12\
-\xd8\x6c\x9b\x00\x36\x5b\xd0\x1f\x36\x8d\x35\xc1\x96\xd8\x3c\x4e\
-\x83\x9d\xca\x78\xce\x16\x23\xf6\xa8\x99\x59\x50\x47\x85\x0e\xc4\
-\xb6\x49\xe8\x1b\x93\xa1\x03\xea\xe6\xb0\x03\xe3\xf5\xce\xa9\xd0\
-\x31\x02\xd9\x35\x0d\x3a\xed\x9e\x0e\x9d\x22\x89\x19\xf7\x4d\x47\
-\x3c\x56\x47\xb4\x2b\x1d\xdf\x61\x3b\x9e\x07\x7d\xa4\x43\x98\xa8\
-\x83\x0e\xb5\x8e\x4a\x9d\x31\x47\xb2\x8f\x5e\x04\xf6\xc9\x1e\x60\
-\x8f\xb1\xcb\x2e\x2f\x00\x7d\x22\x08\x6c\xca\x42\xc0\xba\x24\x00\
-\x2c\x0b\x31\x46\xe6\x7b\x80\x45\x1e\xe6\x51\xe8\x23\x0a\xed\x65\
-\xd0\x6f\x14\xda\xa9\x2c\x56\x69\x4b\xe0\x7e\xed\x0a\xbc\xa0\x5d\
-\x8e\x37\x3c\xeb\x35\x1c\x9e\x75\x1f\x02\xdf\x2c\x9e\x04\xce\x4e\
-\xce\x2c\x06\x90\x9e\x4c\x5b\xd4\x7f\x09\x2e\xbb\x7b\xb8\xdf\x30\
-\x48\xdf\x05\xa2\xfe\xe9\xd4\xdf\x59\xbe\xe7\xe7\xcb\xfa\x3c\xe9\
-\x4f\x73\x88\x60\xcf\xd9\xf0\xd6\x84\x77\xe0\xf9\x99\x9f\x82\xc5\
-\x4a\x8c\xf7\x11\x93\x71\xcc\x57\xc0\x3e\xae\x27\x62\x0a\xf3\x09\
-\xdb\x70\xf4\x0d\xb4\x93\xed\x56\x51\x86\x4d\x00\x3b\x2c\xed\xd4\
-\x52\x80\x3a\xda\xab\x4c\x36\x82\xda\xda\xa3\xbd\x3b\xa0\xb6\x1d\
-\xd0\xfe\x1d\x22\xa6\x83\x03\x6a\xe1\x40\x9a\xec\x99\xa9\x65\xef\
-\xac\xbb\xa2\x93\x19\xee\xf6\x18\xec\xbc\x54\x1f\xe1\x1b\x1d\x76\
-\x20\xe1\x53\x04\xa2\xfe\x72\x7b\xd4\xf6\x4d\x62\xed\xb2\x8f\x9c\
-\x03\x76\xf1\xce\x60\x87\xf1\xce\x2e\x1b\x63\x20\xfa\x86\x0d\x8e\
-\x73\x36\xa5\xe8\x1b\x15\xcb\xc1\xaa\x3c\x14\xac\xf6\x05\x0b\x82\
-\xc0\x12\xa1\x6d\x96\xfb\x70\x7b\x49\x10\x8e\xb1\x18\x5b\x70\xfc\
-\xb1\xc6\xdc\xc4\x3a\xc9\x15\xac\xa3\x70\x3e\x82\xb1\xf2\xf9\x29\
-\x3d\xe0\x39\xe4\x6b\xc7\x61\xe0\xe4\xe8\xc4\x72\x00\x1f\xd4\x93\
-\x74\x25\x7d\xfd\xfd\x59\x4e\xff\x73\xbb\x76\xed\xfe\xa8\xe8\xbf\
-\xc8\x71\x51\x85\x92\xeb\xd3\xb5\x43\x05\xd2\x7f\xc9\xa2\x31\x30\
-\xa9\xd7\x93\x60\x39\xbb\x37\x58\x61\xff\xb4\x89\x9c\x06\x36\x7b\
-\xa6\x81\xed\x9e\xe9\x66\x98\x01\x76\x7b\xb5\xd8\xe3\x36\x7b\xd4\
-\xcc\x1e\x6d\x65\x8f\x7d\x92\x95\xbb\xf9\x7a\x07\x02\xdf\x23\x1c\
-\x22\x67\x62\x0c\x45\xa2\x30\x67\x8b\xc2\x71\x3d\x9a\xd3\x31\x7a\
-\x4e\xf3\xc4\xcc\x85\x4e\x0f\x01\x3a\xaf\x49\x5d\xa2\x90\xbd\x58\
-\xe7\x3d\xb3\x78\x7b\x76\x61\xdb\x76\x62\x7b\xd1\x37\x4c\x20\x1f\
-\x40\xec\x64\xc2\x89\xc9\xb8\x3c\x19\xfb\xd0\x54\xec\x4f\x33\x38\
-\xe8\xfb\x84\x4d\x38\xc5\x5a\x01\xf6\x1d\xc2\x5a\x65\x02\x58\x63\
-\x1c\x7e\x01\xe7\x7f\xcf\x4f\xeb\x09\x9f\x3b\x0d\x04\x47\xd4\xdf\
-\xd5\xd5\x8d\xf5\x65\x1f\x1f\x5f\xe6\x07\x4a\x3f\xef\xdb\xb7\xaf\
-\x83\x34\xfe\x1f\x55\xb4\xa7\x7d\xf9\xfe\x3e\x2c\xf7\x73\x9d\xfa\
-\x39\xcc\xfe\xd8\x00\xdf\x7d\xfb\x12\x6a\x3f\x03\x6c\xa2\xb0\x1e\
-\x51\x33\x18\xb6\x0a\xd1\x33\xb1\x9c\x09\x76\x44\x34\x31\x0b\xec\
-\x62\x38\xf6\xd1\x12\xb1\xb3\xc1\x3e\x66\x36\x8e\xed\x48\xac\x20\
-\x66\x8e\x8a\x43\x2c\x12\x27\x88\x9d\x8b\x25\xa7\x63\xac\x9e\x79\
-\x98\x83\x49\xc4\xcf\x83\x4e\x71\x02\xb6\x3c\x9f\x13\x2f\x88\x6b\
-\x86\xf8\x16\xf6\xd3\xbc\xcf\xcf\x21\x9f\x57\x53\x0f\xaa\xab\x82\
-\x54\x7f\x6a\x0b\x6b\x33\xd9\x00\x63\x87\x3d\xfa\xb9\x1d\xf6\x01\
-\x3b\x1c\xab\x6c\x31\x7e\xd8\xee\x94\x99\xca\xb0\x21\x76\xc8\x4c\
-\x66\x58\x63\x3c\xb4\x66\x25\xb2\x7d\x12\x32\x19\xac\xb0\xb4\xda\
-\x39\x05\xac\x30\x36\xb7\xf5\x19\x04\xef\x8f\xfb\x3b\xb8\x8e\xee\
-\xc2\xe6\x00\x84\xac\x2b\xe9\x4c\x0c\x19\x32\xe4\x7d\x45\x7f\x17\
-\x17\x97\xb3\x7c\x1f\x1f\x76\xed\xd0\x47\xec\x4b\xb8\x4c\xec\x05\
-\x73\x7a\x18\x18\xa3\x97\x61\xfe\x8f\xda\xa8\xd7\x4d\x55\xe6\x80\
-\xad\x42\x3c\x31\x17\x63\x9b\x9e\x79\x60\x4f\x24\x28\xcc\x57\xe9\
-\xa0\x61\x01\x74\x48\x5c\x80\xb9\x94\x39\x16\xaa\x74\x94\x49\x52\
-\x58\x64\x96\x4e\x2a\x8e\xd0\x39\x65\x31\x74\xc1\xf9\xea\x2b\x99\
-\xde\xf0\x6a\x96\x0f\xbc\x8a\xb1\xd7\x14\x3f\xf6\xfe\xcb\x99\x5e\
-\xd0\x25\xdd\x03\xba\xa4\xba\x42\xe7\x64\x67\xe9\x98\xe2\x7c\xe2\
-\xfc\x0e\x26\x68\xeb\x4d\xed\x61\xed\x62\x18\xdb\xca\xda\x8f\x7e\
-\x65\x8f\xbe\x63\x8f\x3e\x62\x8f\x7d\xc0\x16\xe3\x88\x2d\xc6\x3f\
-\x5b\xf4\x13\x19\x1b\xc6\x4c\x0e\xc6\x48\x1b\xf4\x25\x9b\x18\x71\
-\x8d\x1a\x35\xb0\x4b\x76\x82\xbe\x3b\xc6\xc0\xac\x51\x2f\x32\xad\
-\x16\x7f\xfd\x0c\x8b\xfd\x9e\x98\xc3\x29\x5a\x52\x7f\xe6\xb1\xdd\
-\x17\x46\x8d\x1a\xd5\x47\xd1\xdf\xd9\xc5\xf9\x22\xe9\x4e\x73\x05\
-\x4f\x01\x5b\xa6\xfe\x3f\xe1\x63\x98\xfb\x89\x01\xe6\xe2\x31\x77\
-\x8c\x7d\x04\x7a\xef\x1c\x03\x36\x09\x73\x25\xe6\x81\xad\xc0\x2e\
-\x71\x3e\xd8\x22\x76\x3a\xec\x85\x0d\xec\x93\x14\x16\x62\x8e\xaf\
-\x23\x79\x91\x8a\x83\x42\x0a\x95\x8e\x2a\x1d\x95\x32\x45\xc1\x49\
-\xa5\x93\x09\xce\xd0\x25\xd3\x03\x5e\xc7\x79\x45\x6f\xf4\xbb\x51\
-\xdb\x47\xc2\xa2\xd5\x3d\xc0\x27\xf0\xef\xb0\xdc\xc3\x1e\xb6\x2e\
-\x7c\x16\x76\xcd\xfe\x1d\xc4\x4c\x35\x40\xcc\x34\x03\xc4\x52\x29\
-\xd8\x3b\xfd\x31\x08\x9f\xff\x17\xd8\xb2\xf0\x39\x58\xe5\x6a\x0d\
-\x01\xfe\xaf\x82\x5b\xe8\x7b\x30\x7f\x4d\x2f\x18\x17\x36\x04\xbe\
-\xda\x33\x05\x3e\x46\x3f\x78\x33\xdb\x07\x5e\xce\xf1\xc5\xf3\x78\
-\x42\xa7\x74\x57\xac\x87\xb3\xb6\xbe\x58\x47\xde\x06\x0e\x6b\x5f\
-\x92\xc2\x42\x66\x07\x2d\xdc\x3e\x76\x89\x0a\x46\x1b\xda\xaa\xb6\
-\x35\xda\xdb\x16\x8f\xd7\x39\xcd\x15\x06\x6d\x19\x0c\x21\x8e\xed\
-\x21\x72\xac\x01\x96\x0e\xe0\x5a\x2d\xea\xfb\x1b\x96\xbf\x2b\x7a\
-\xd2\x5c\x8e\x4a\x6f\x31\xa7\x9f\x30\x61\xc2\x37\x8a\xfe\xe8\x27\
-\x8d\x8a\x7f\x78\x4a\x3e\x40\xb8\x4e\xf8\x10\x1c\x7b\x1b\x60\x5e\
-\x4f\x03\xec\xc6\xe3\x6f\x99\xf1\x07\x78\x0b\xfb\xb3\x4d\xf2\x02\
-\x64\x21\xd6\x41\x02\xdb\x6a\xa7\xc1\x91\x61\xaf\x90\x4a\x38\xa9\
-\x74\x50\x71\x66\x38\xa4\xe9\x71\x51\xe9\x68\xc2\x62\xe8\x98\xce\
-\xe9\xa4\x80\x7a\xbf\x8a\x73\xaf\x3e\xd8\xa7\x66\x6e\xfa\x12\x42\
-\x7c\x3b\x43\xe4\xec\x27\x21\x76\xba\x81\x33\xc3\x60\x5c\x6e\x86\
-\xb8\x56\xec\x13\x3b\x8d\xfb\xcd\x8e\x79\x7f\x82\x95\xee\xb6\xe8\
-\x57\x6f\xc1\x02\xf4\x8f\xf1\xdb\x06\xc3\x57\x7b\xa7\xa1\x7f\x38\
-\xc1\xeb\x39\xfe\xd0\x39\xcf\x1f\x3a\x65\x7b\x43\xc7\x4c\x77\xd1\
-\x16\x67\xd1\x5e\x63\xfb\x8d\x36\x11\x36\x12\xf6\xe2\xf6\x13\xb6\
-\xa4\xed\xd8\xc6\x0e\x59\x9e\xf0\x46\xba\x1b\x7c\xb3\x63\x34\x2c\
-\x0e\xf8\x07\x84\x4f\xfd\x0d\xec\x99\x60\xe0\x8c\x37\x40\xd0\x37\
-\x06\x58\xf8\xa9\x01\x5c\x3e\xff\x15\xf6\x61\x53\x3d\x7d\x7c\x78\
-\x2c\x98\x36\x6d\xda\x50\x29\xfe\x37\x72\xed\xf9\xf7\x06\xe4\x37\
-\x0a\xae\xe3\xbb\x83\x73\x1f\x03\x38\x7e\x66\x80\x48\x3c\xfe\x5e\
-\x3c\xcf\x9a\x85\x2f\xc0\xcb\xa9\x74\x6d\xd4\xd1\x48\x9a\x23\xd8\
-\xa6\x39\x69\xb0\xc3\xb6\xaa\xa4\x73\xec\xd3\x5d\x74\x60\x9b\x14\
-\x32\x64\x5c\xc1\xc1\x1c\x99\x6e\x1a\x3a\x65\x63\x1f\xc7\xdc\xf9\
-\xbb\xa8\x69\xe0\xb1\xe2\x03\xd8\x39\xff\x8f\x10\x8f\x3a\xc7\x09\
-\xe2\x25\xd8\xfa\x4c\x03\x24\xcc\x32\x40\xe2\x6c\x03\x24\x49\x24\
-\x13\x73\x8c\xeb\xf4\x7e\x22\xed\x37\x93\x7f\x46\x3d\xe6\x74\x33\
-\xcc\xd0\xf9\xcc\x34\x23\xdb\xe7\xff\x19\x56\x78\xd8\x81\x77\xf0\
-\xdb\x30\x6f\x5d\x6f\x18\x17\x3e\x0c\xbe\x8b\x9c\x04\x7d\x71\xac\
-\xec\x8e\x36\x7c\x37\xc3\x1d\xba\x60\x2e\xdf\xb9\x20\x10\x3a\x31\
-\x96\x32\x5e\xc5\xb8\xf2\x36\xea\xfc\x29\xc6\xf6\xa1\x3b\x46\xc2\
-\x9c\xd5\xbd\xc0\xdb\xff\x0d\x58\xb7\xf0\x45\xd8\x3b\xb1\x0d\x44\
-\x4f\x32\x40\x14\x31\x91\x6b\x42\x65\xdc\x64\x03\xac\x1a\x6c\x60\
-\x7a\xb9\xf4\x7d\x94\x6b\xe8\xa9\x68\xe9\x4e\xf3\x3e\x71\x4d\xcf\
-\x1b\x66\xcc\x98\x31\x42\xd5\xdf\xd9\x99\xe9\x4f\xfb\x71\xfd\xf9\
-\xbe\xb4\xee\x86\xfa\x2f\xee\x6b\x60\xc4\x4e\x16\xe7\x44\x82\x30\
-\x86\x76\x42\xfb\xdb\x64\xa0\x1f\x64\xd0\xb5\x76\x99\xc5\x0c\x3b\
-\x99\xac\xc5\x60\x9f\xe5\x2a\xe1\xa6\xd2\x41\x21\x9b\x70\x67\xa5\
-\x03\x96\x5a\x3c\x8c\xe4\x78\xc1\xcb\x45\x41\xd0\x1f\xc7\x4f\xd7\
-\xd5\x1f\x41\xe4\x82\x3f\x40\x3c\x6a\xa5\x87\x34\x4c\x9e\x6b\x80\
-\x94\x79\x06\x48\x9b\x6f\x80\xf4\x05\x06\xc8\xd0\x33\x5f\x20\x6f\
-\x5b\x28\xbd\x27\x6d\x4f\xc7\xf5\x34\x3c\x56\x2a\x1d\x73\xae\xd1\
-\x5f\xc8\x4f\xc8\xa7\xc8\x4f\xe2\x64\x5f\x91\x11\xbe\x12\x6f\x26\
-\x8e\xc8\x44\x4f\x7b\x94\x8d\x41\xea\x78\x34\x45\x4b\x34\x31\xd9\
-\x48\x1c\xee\x93\x80\x9f\x4b\xc1\x63\x25\x23\x6b\x86\x1a\x84\x5e\
-\x6d\x54\x2d\x95\xbe\x4c\xeb\x34\x0e\xd0\xd8\x2e\xeb\xef\xec\xec\
-\xd4\x48\xb1\x81\xde\x77\xa7\xef\x0d\xdc\x39\xb4\xee\x36\x01\xf5\
-\xff\xdc\xc0\x48\xa2\x36\x50\x3d\x26\xf3\xba\x04\xf8\x76\x81\x4e\
-\xec\xbb\x12\x57\xb0\xc9\x76\x05\xdb\x1c\x37\x04\x4b\xd4\x4f\x05\
-\xb7\xd9\xe5\xb8\x83\x3d\xc3\x03\xec\x72\x3d\x58\x69\x8e\x0e\xb9\
-\x9e\x0c\x87\x5c\x2f\x4e\x1e\xad\x2b\xcb\xde\xd0\xb9\x28\x18\x7a\
-\x60\x1c\x5d\xb0\xf9\x0b\xd8\xee\xf2\x9c\x6a\xf7\x84\xd9\x46\x48\
-\xef\xd4\x79\x5c\xaf\xcc\x85\x9c\xac\x85\xc6\xe5\x4c\x69\xbb\xb9\
-\x75\xcd\xbe\xc4\x22\x5e\x66\xc8\x98\xf1\xa3\x4c\xc9\x97\xe8\xfc\
-\xa9\xe8\x1b\x29\x66\xfc\x83\xc5\xa2\xe9\xda\x98\x64\x12\x57\xa6\
-\x71\x54\xbf\x10\xfe\x40\xdb\x12\xf0\xfd\x44\xdc\x3f\x19\x49\xc5\
-\x63\xa6\x10\x33\x8d\xac\x1d\xc6\xb5\x72\xfd\x82\xeb\x2f\x43\xd7\
-\x02\x3d\x3d\x3c\x59\x4e\xa8\xd5\xdf\xb9\xd1\x83\xf4\x47\x5f\x71\
-\xa3\x39\x83\xf8\xee\x88\x31\x11\xf5\xff\x82\x1f\x53\x39\x27\xf3\
-\x61\x51\xa7\x50\x6f\x07\x78\x35\xd7\x1b\x6c\x73\xdd\xc1\x36\x0f\
-\xf5\xd5\x61\x8f\x1a\xaa\xe4\x7b\x31\x3a\xe4\x7b\x23\x5e\x12\xde\
-\xe0\x20\x53\xe0\x23\x40\xcd\x8b\x83\xa0\x2b\x8e\xa1\xd3\x77\x0c\
-\x86\x8d\x5e\x56\x90\x88\x36\xd5\x43\xfd\x9b\xfa\x36\x69\x97\xb5\
-\x48\x87\xa3\x71\x39\xdb\x91\x93\x25\x95\xea\x3e\xba\xf5\x6c\xdd\
-\x67\xcd\x1d\x8f\x50\xfc\x23\xab\x29\xff\x59\x60\x84\xc5\x90\x05\
-\x3c\x16\x51\x0c\x51\x20\x3f\xa1\x58\xc2\xc6\xa0\x59\xa2\x14\xa4\
-\xcc\xe6\xbe\x94\xa6\x30\x57\x94\xb3\xb5\xa4\x0a\xd6\x8d\x30\x30\
-\xbd\x5c\xfb\xb5\x11\x7d\x58\xd2\x12\xb5\xa5\x9c\xc0\x43\xa7\xbf\
-\x93\x93\x53\x23\x8f\x0f\x6e\xea\x9c\xd1\xcd\x95\x2f\xbb\x4d\xe8\
-\x06\x6e\xfd\x0c\xe0\xde\x9f\xfb\x5a\xba\xa8\x47\xc2\x4c\x91\x2b\
-\xa1\x4f\xac\x77\x7b\x09\xba\x62\xfc\xb6\x2d\x44\x3f\x28\xf0\x92\
-\xf0\x06\x3b\x85\x42\x05\x1f\xb0\x37\xc1\x17\x3a\x28\x14\xf9\x81\
-\x43\xc9\x52\x78\xb3\x24\x04\x46\x47\x4d\x84\x15\x81\xaf\x40\xc2\
-\xdc\x47\x20\x11\xdb\x9d\x84\x3a\x53\x49\x24\x53\x3c\x5f\x28\xb4\
-\x72\xe2\xe4\x88\xe5\x1c\x27\x63\xa9\xe2\x6c\xdc\xcf\xdc\x7b\x39\
-\xd2\xe7\xe4\xf7\xd5\xe3\x39\x8a\xe3\x2b\x38\x49\x3e\x24\xfb\x94\
-\xe2\x6b\x02\xb6\xbe\xd0\x14\xe6\x2b\x0b\xb4\xfe\x91\x29\x8f\x45\
-\xf3\xf9\x7a\x26\xc5\xb2\x79\x7c\x3d\x9d\xca\xb9\x46\xd2\xa9\x9c\
-\xc3\x35\x51\x58\x3f\xd2\xc0\xf4\x72\xeb\x8f\xfa\xbb\xb9\x0a\x3d\
-\xdd\xd8\x5c\x70\x31\x2e\x53\x3f\x27\xad\xa7\x4e\x9d\x6a\xa2\x3f\
-\xf9\x88\xcb\x62\x17\x70\xc5\x7d\xd9\xe7\xb0\x74\x9b\xd8\x0d\xdc\
-\xbf\x34\x30\xc8\x0f\xd9\x39\x45\x9d\x12\x95\x98\x86\x44\xce\xfb\
-\x1d\x0c\x41\xbd\xec\xca\x82\xc0\xa6\xd8\x17\x6c\x19\x7e\x1a\xec\
-\x4a\xfc\x35\xd8\xab\x2c\x01\x87\xb2\x60\x78\x6d\xdf\x4a\x18\x92\
-\x30\x0b\xfc\x56\x77\x85\xd8\x05\x4f\x32\xbd\x49\xe7\xa4\xf9\x5c\
-\xfb\x14\xb2\x01\xd9\x53\xd2\x93\x69\xe7\x22\xca\x16\xc8\xd5\xef\
-\xe7\xa2\x83\xf6\xd1\x7f\x4e\xf7\xbe\x7a\x2c\x65\x99\xfc\xc0\x59\
-\xe0\x64\x2c\x73\x64\x3f\x11\x28\xb1\x23\x5b\x1f\x57\xa4\xb8\x65\
-\x2e\x6e\x64\xcd\x37\xc6\x8f\x0c\xd9\x27\xcc\xf8\xc3\xc6\x51\x06\
-\xf0\x60\x7a\xb5\x41\xfd\x5c\x99\xe6\xca\x77\xc1\x84\x92\x0b\xe8\
-\xfb\xbf\xbb\xd0\x5f\xd9\x8f\xbe\x37\xa0\xd2\x6d\x52\x37\xf0\xc4\
-\x39\x25\x41\xc7\xcf\x14\x7e\x49\x75\x22\xff\xa5\xf8\x95\x28\x72\
-\x2d\x22\x28\xf8\x0d\xf8\x98\xc6\xf3\xf2\x10\xb0\x2d\xf5\x57\xb1\
-\x2b\x5d\x82\xbe\x61\xc4\x7e\x5f\x10\x74\xac\x5a\x05\xef\x94\x06\
-\xc3\x88\xb8\xa9\x10\xb8\xf2\x6d\x88\x5b\xf4\x24\xd3\x58\x65\x01\
-\x27\x63\x11\xb7\x2b\x69\x90\xab\xb0\x98\x97\x79\x8b\x39\xb9\x8b\
-\x8d\xcb\xe6\xc8\x75\xc5\xb2\x19\xd4\xf7\xdd\xa4\xe3\x29\xdb\xcd\
-\x1d\x53\xda\x9e\xeb\xd2\x0c\xce\x46\xe4\x38\x93\x23\x7c\x44\x5e\
-\x56\x63\xcb\x22\x1d\xfa\xf8\xb1\xc0\x68\xff\x2c\x29\x4e\x50\xb9\
-\x69\x0c\xd7\xca\xf3\xab\x36\x4c\x7b\x17\x45\x4f\x13\xfd\x8d\xfd\
-\xdf\x91\xe9\xcf\xf3\x03\x9c\x0b\xf2\xcf\xb8\xf0\xfd\xdd\x51\x7f\
-\xaf\xaf\x0c\x0c\xe6\x7b\xe2\xfc\xd9\x52\x9c\xa3\x9c\x28\x79\xae\
-\x31\x36\x53\x5f\x0d\x0d\x79\x1d\xc6\x44\x4f\x80\xee\x05\xfe\xf0\
-\x5a\xe5\x2a\x78\xb3\x7c\x05\x7c\x54\xe0\x07\xfd\x71\xbe\x30\x26\
-\x6e\x0a\x78\x6e\xf8\x18\xb6\x7b\xb7\xe5\x1a\x2f\xe4\xa4\x2a\x25\
-\x1e\x33\x5d\xf4\x25\x8d\xbe\x7a\xdd\xdc\x38\xf9\x12\x79\x52\x99\
-\xe7\x2e\xad\xe3\x72\xbe\xbb\x71\x5b\x9e\xbb\xb4\xcd\xcd\x74\x59\
-\x39\xb6\xe6\x78\x66\x96\xf3\xf5\x7e\x24\x7c\x4d\xf1\x9b\x5c\x19\
-\xe1\x13\xb2\x1f\x9b\xc4\x2e\x39\x86\x48\xb1\x83\x8d\x3f\x8b\x0c\
-\xda\xbc\x65\xa1\xa9\x7f\x6c\x1e\xcb\xb5\xf2\xfa\xba\x0d\x8f\xe3\
-\x08\xd7\xd4\x85\x69\x4a\xb9\x9f\x07\xe6\x82\x53\xe5\xfe\xef\x68\
-\x8c\xff\xf4\x9d\xb1\xb3\x8b\x33\xff\x0c\xe2\x3e\xf1\x03\x3c\x16\
-\x1e\xef\x1b\x1e\x83\xe8\x7c\x54\x8f\x1c\x47\x09\x51\x3f\x1a\x8f\
-\xe5\xfe\x9b\xbc\x80\xc7\xef\x64\xd1\x8f\x65\x8d\x55\xdd\x17\x09\
-\xbd\x95\xb8\xee\xc2\xed\x48\x76\x95\x75\x2d\x50\x70\x97\x4a\xb1\
-\x9c\x2f\xd6\x49\xbf\x02\x0f\xbe\x5c\xa8\x2c\x9b\x43\xbc\x57\x28\
-\xad\x2b\xcb\xf9\x66\xf6\x93\xd7\xf3\xdd\xb5\xa5\x5c\x1f\xda\x26\
-\xd7\x39\x5f\xf8\x68\xbe\xab\x16\xd6\x3e\xf2\x67\x29\x7e\xe5\x29\
-\xeb\x22\x66\x28\x65\xae\x93\x14\x43\x68\xd9\x51\x8a\x1d\xb2\x16\
-\xc2\x0f\xb6\x8e\xe3\x5a\x79\x7f\xd3\x86\xc5\x70\x45\x47\xd2\xd4\
-\xd9\xd9\x85\xcf\x03\xb1\xaf\xcf\x98\xaa\xcb\xff\xe8\x5a\x9f\xd0\
-\xdf\x45\xfa\x9c\xc7\xe4\x0f\xc0\xe7\x5b\x03\xf8\x7e\xcb\x7d\x4e\
-\x53\x17\x27\x29\xc6\x29\x75\x47\x32\xb1\x3e\x69\x8b\xb8\xd6\xa9\
-\xa2\x3f\x13\x69\x62\x3b\x95\xd4\xbf\x33\xc9\xcf\x45\xbf\xd6\xe8\
-\x6b\x4e\x3b\x4f\xa3\x66\x0c\x4f\x33\x78\xe9\x30\xb7\x4d\xc6\x5b\
-\xa2\xb9\xfd\xbc\x74\xe7\x90\xcf\x29\xd5\xc5\xac\x9f\x35\x81\xea\
-\x2b\xae\xa6\xa5\x39\x9f\x90\x51\xec\xad\xd1\x41\x10\x36\xc1\xc0\
-\xf4\xf2\xf9\xb6\x8d\xaa\xa1\xe2\x07\xa4\x2d\xbb\x26\x6c\x36\xff\
-\x77\x67\x79\x02\xeb\xff\x02\x17\xda\x1f\xf5\xf7\x1d\xc8\xf5\x27\
-\xbf\x53\xfd\x53\xd1\x5c\xd4\x91\xfc\x39\x5f\xf8\xb5\xb2\x4c\xef\
-\x51\x7f\xce\x72\xe1\x3a\xe7\x28\x71\x5c\xd2\xb9\x50\x41\xd2\x55\
-\xd5\x5a\x2c\x53\x59\x24\xec\x5e\x24\x34\x28\xf2\xe6\xdb\x58\x29\
-\x34\x2c\xf2\x92\xde\xd3\x51\x2c\x51\xe4\x23\xb6\xf9\x88\x6d\x3e\
-\x7c\x5b\xb1\x8f\x76\x5f\x93\xe3\x48\x7e\x53\x24\xf9\x46\x91\xce\
-\xd7\x94\x3a\x16\x78\x1a\x29\x94\xe3\x8d\x87\x88\x4f\x72\x0c\x93\
-\x7c\xa2\x40\xf2\x87\x3c\xc9\xa6\x8a\x4f\xe4\xcb\x7e\xe1\x2c\x81\
-\xeb\xdb\x26\x1a\xc0\x8f\xf4\x1a\xd8\x46\xd5\x9c\xe3\xc2\xee\x07\
-\x71\x37\x33\xfe\x3b\x39\x3a\x36\xd2\x98\xa0\xea\xef\xe4\xa4\x7e\
-\xce\x63\xf2\xfb\xe0\xf7\x9d\x81\x91\xe3\xac\xf3\xc5\xc5\x52\x5c\
-\xd3\xd5\x3b\x5f\x8a\x8b\x85\x72\x5f\x90\xfa\xb3\xdc\x77\x8a\xf4\
-\x7d\x4b\xb2\xb3\x8c\x5e\xbf\x22\xbd\x9e\x84\xaf\x54\xfa\x36\xb1\
-\x5d\x7e\x5f\xbf\x8f\x1e\x1f\x23\xca\xb9\x54\x74\xbe\xa3\x47\x8d\
-\x2d\x9e\x52\x3b\xf4\x71\xc3\x53\x6b\x9f\x42\x33\xe3\x4a\x81\x3c\
-\x1e\xea\xc6\x91\x7c\x17\x23\xdb\x26\x1b\x84\x5e\x6d\x44\xcc\x77\
-\xa6\x67\x3e\xc0\x89\x4a\x67\x27\x71\x6d\x57\xaf\x3f\xf6\x7f\x77\
-\x31\xfe\xd3\xbe\x92\xfe\x9e\x53\xde\x07\xff\x41\x78\xbc\x41\xbc\
-\xbf\x9b\xe8\xed\x66\x26\xde\xc9\x7e\xae\x8b\xd1\xfa\x7e\x53\xa4\
-\xef\xaf\xb2\x9d\x7d\x5a\xd0\xc5\xcf\x94\x12\xc2\x5f\x94\x48\xa9\
-\xbf\x58\x37\x83\xfa\x9e\x9f\x84\xbc\x0f\x7d\x5e\x3e\x36\x6e\x2b\
-\xf6\x17\xeb\xba\xba\x94\xe8\xb7\x49\x6d\x30\xf1\x19\x73\x31\x45\
-\x3f\xae\xc8\x63\x8a\xa7\xc1\xfc\x78\xe2\x66\xea\x13\xdb\xa6\x18\
-\x98\x5e\x4b\x06\xb5\x51\xfb\xbd\x93\xa4\xa9\x71\xfc\x37\xea\xaf\
-\x7c\xff\x43\xd7\x08\x5d\x58\xee\xa7\xe4\xff\x2e\xe0\x35\xed\x03\
-\x58\x32\xd8\xc0\x50\xc7\x69\x7d\xcc\x36\xd7\x8f\x75\xfa\x6a\x62\
-\xaa\x8f\xb6\x4f\x31\xfb\xe9\x6c\x59\x22\xb6\x29\x1a\x68\xb4\xd1\
-\xeb\xb4\x04\xf7\x51\xf0\x97\x96\x91\x32\xf9\xbd\x00\xb1\x2d\x40\
-\x2c\x07\xf0\xe5\xb2\x00\xe3\xbe\x32\xa5\xe6\x8e\x2b\x4a\x3a\xa7\
-\xc6\x4f\x14\x7f\xf2\xd3\xa1\xf7\x13\x1f\x69\x9b\x34\xfe\x68\xe2\
-\x87\x64\x3b\x8d\x2d\x65\x1b\x7b\x6a\xc7\x13\xc5\x3f\xb6\x4f\xe5\
-\x5a\x05\x0c\x69\xa3\xce\xf9\x5c\x94\x39\x00\xe2\xed\xc5\xbf\xe7\
-\x95\xc7\x7f\x8c\xfb\x8d\x3e\xbe\x3e\xec\xbb\xa2\xc5\xec\xda\xcf\
-\x62\xf5\x3a\xa0\xf7\xf4\x6e\x10\x30\xd4\x00\x4b\x87\x72\x3f\x2b\
-\xf2\xe0\xe7\x67\xa5\x87\x31\x26\x17\x7b\x19\x34\x63\x2c\x51\xe2\
-\x2d\xda\xeb\x23\xe9\x29\x51\xea\x27\xe1\x6f\x1e\xbd\x26\x2a\x01\
-\x4d\xb3\x6f\xa9\x19\x9a\xda\xde\xda\xfd\xe8\xd8\x4b\x9b\x39\x6f\
-\x53\xfe\xa3\x6f\x93\x9f\x29\xaa\x8d\x7c\x84\xcf\x28\xcb\xde\xa6\
-\x36\x65\x76\x16\x28\x3e\x21\xb3\x73\xba\x81\xe9\x15\x30\xac\x8d\
-\xaa\xa1\x7a\xfd\x07\x75\x55\xee\xed\x9b\x35\x6b\x96\xaa\xbf\xbb\
-\x9b\x5b\x23\xdd\x13\xc6\xee\xf7\x72\x73\x13\xdf\x17\xf0\xd2\x67\
-\x46\x77\x58\x3a\xcc\x00\x81\xc3\x78\x1c\x2a\xd6\xe9\xad\xd4\xb3\
-\xc4\x47\xeb\xdf\x8a\xbe\x25\x72\x3b\x65\x3b\x90\x8d\xfc\x05\x52\
-\x9f\x54\x96\xf7\xc9\xc8\x3a\x04\x72\x1d\xa8\x54\xd6\x89\x72\x99\
-\x20\xdc\x16\xa4\x2d\x69\xfb\xbe\x20\xf3\xef\x33\x94\xed\x66\x8e\
-\xa5\xa0\xec\x53\x1e\x68\x7a\xfe\x7d\xf2\x36\xe1\x2b\x4a\xdd\xcd\
-\xf9\x88\x1c\x6f\x34\x7e\x21\xc5\x11\xb6\x6e\xa6\xdf\x28\xfe\xa1\
-\xc6\x0f\xc9\x37\x76\xce\xe4\x5a\x2d\x1d\x2e\xbe\xff\x71\x13\xdf\
-\xfd\x88\xef\x01\x7c\xc5\x3d\x80\xb2\xfe\x38\xf7\x6b\xa4\xe7\x3d\
-\xc8\x2f\xf8\xf7\x43\xfc\x5e\x01\x0f\x2c\xfd\x67\x7f\x08\x41\x23\
-\x0c\x10\x34\x92\xe7\x32\x25\xb2\xc6\x7e\xda\x7e\xac\xc4\x65\xb6\
-\x2e\xb7\x6d\x89\x31\xd6\x96\xca\xb6\xd1\xe9\xdb\x94\xae\xea\x32\
-\xd9\x3e\x58\x68\x17\x2c\x69\x13\x6c\x5c\xaf\x10\xeb\x15\x82\xf2\
-\x10\xb1\x1e\xc2\x97\x2b\x42\x05\x21\xd2\x7b\xe2\x7d\xb6\x2d\x54\
-\xfb\x79\x75\x3f\xe5\xfd\x20\x1d\x54\x9f\xe0\x26\x7c\x4a\xf8\x8c\
-\x52\x96\x89\x36\x96\x05\x1a\xc7\x9f\xd2\xa5\xc6\x71\xa9\x44\x46\
-\x1e\x4b\xfc\xa5\x7c\x47\x59\x96\x90\x73\x8c\x9d\xb3\x50\x7f\xd4\
-\x2a\x70\xc4\x23\xe2\xfe\x0f\x3e\xdf\x53\xbe\xf7\xa3\x67\x00\x96\
-\x2c\x09\x80\xb9\x73\xe7\xaa\xfa\x7b\x7b\x7b\x37\xd2\x73\x21\x4a\
-\x0c\x50\xa0\xfb\x44\x96\xcc\xf9\x08\x42\x46\x19\x18\x74\x0e\xb5\
-\x4f\xeb\xe3\x9a\x3c\xe6\x0a\x5d\xcb\x02\xa4\x36\x2b\x1a\x4b\x9a\
-\xaa\xda\xea\xec\xa6\xd1\x4f\xaf\x8f\xa4\x85\x42\x65\xa8\xa4\xab\
-\x8e\xca\x65\x58\x36\x43\x53\xef\x57\x2a\xef\x85\x36\x73\x7c\xa9\
-\x4e\xfa\xfa\x29\x3e\xb9\x4f\x50\x16\xc4\xdb\x4e\x94\x28\x04\x48\
-\xa0\x6d\x8a\x03\x84\xbe\x82\x22\x05\x3f\x2d\x85\x04\xea\x5e\xe8\
-\x23\x95\x62\x39\x82\xae\xc1\x53\x7f\x1d\xf5\x08\xbf\xef\x4f\x8c\
-\xf7\x4c\x4f\x64\x69\x20\x7f\x06\x68\xfe\xfc\xf9\xaa\xfe\xd8\xef\
-\x1b\xe9\xf7\xbd\x28\x06\xb0\x7b\x7f\xbd\x8d\xf7\x80\x07\xcc\xfb\
-\x18\x42\x46\x1b\x18\xe4\x6b\xa5\x52\xcc\xde\xa7\x20\xf5\x65\x79\
-\xfc\xad\x58\xaa\x8b\xa5\x52\x4c\xad\x90\xa8\x6c\x42\x6b\x66\xfb\
-\x10\xad\xcd\x15\x2d\xaa\x24\x8d\x08\xfd\x3a\x63\xb9\x01\xaa\x45\
-\x59\xb5\xdc\x58\xea\x97\xe5\x75\xfd\x76\x46\x53\xc7\x5f\xc6\xeb\
-\xa3\x47\x8d\x2f\x92\x0f\x90\xfe\xa5\x81\xbc\xbf\xab\x5a\x13\x68\
-\xbf\x22\x05\x7f\x5e\x16\xfa\x0b\x8d\xfd\x8c\xcb\x05\x42\xf3\x02\
-\x19\x1f\x81\xb7\x11\xea\xff\x4b\xa9\xff\x0b\xfd\x99\x96\xde\xfc\
-\x9e\x5e\xd2\x93\x9e\x03\x0d\xa4\xbf\xd5\x20\xe9\x8f\xfd\xbe\x91\
-\x7e\x3f\x92\xfc\x42\xb9\x3f\x98\x7e\x43\xc6\xcf\xdf\x1f\x96\x2e\
-\xe8\x01\xa1\x63\x0d\x10\x3a\x86\xc7\x21\xd2\xbb\x5c\xc4\xef\x72\
-\x85\x40\xbe\xad\x42\xd1\x36\x50\xd2\x37\x58\xb7\x1c\xcc\xf5\x26\
-\x5d\x89\x2a\x33\xf6\x23\xaa\x42\x8d\x76\xd7\x20\xeb\xb2\x02\xf5\
-\x25\x8d\x57\x8a\x72\x85\x19\x56\x0a\xe4\xf5\x15\xda\x6d\x35\x2b\
-\xcd\xec\xab\xff\x8c\xbc\x2e\xce\x45\xe7\xd7\xfb\x8a\xe2\x77\xe4\
-\x03\x34\x96\x94\x61\x1b\x4b\x83\x79\x7f\x2f\x46\x1b\x15\x12\x01\
-\x9c\x7c\xb4\x65\x01\xda\x34\x5f\xc1\xcf\x48\x1e\xe1\x2b\xe1\xc3\
-\xc9\x25\xbc\xb5\xe4\x78\x71\x68\x39\x1c\xf5\x0f\x40\xfd\x97\x0a\
-\xfd\x15\x3d\x15\xe8\x19\xff\xe0\x90\x60\x58\xb4\x68\x91\xaa\x3f\
-\xf6\xfb\x46\xfa\x8d\x08\xe5\x77\xbe\xd8\xf3\x42\x6c\x9c\x58\x02\
-\x41\x0b\x3f\x81\x65\xe3\x0c\xb0\x6c\x3c\x8f\xed\xe5\xba\x3e\xad\
-\xd1\x38\x58\x4b\xa5\x88\xcd\x8a\xd6\x72\x7f\x69\x49\xd7\x2a\x49\
-\xcf\x1a\x01\x69\xa0\x94\xd5\xab\x04\x42\x9b\x1a\x5c\xae\x5d\xc5\
-\x4b\xc6\x6a\xd3\xb2\x56\x59\x97\x59\xa5\x43\xda\x56\xab\x7f\x6f\
-\x15\xf7\x15\xa5\xd4\xd7\x81\xea\x5d\xb9\x82\xeb\x5f\x8e\x6d\xda\
-\x47\xda\xa3\x5d\x8a\x02\xb9\xee\x05\x48\x11\x6e\x2b\xc6\x7d\x8a\
-\x56\x8a\x92\x58\x6e\xa4\x50\x61\x99\x20\xd4\x48\x01\x11\x22\x95\
-\xc1\x52\x29\x96\x23\x9c\x0c\x10\x3c\x09\xe3\xf5\xa4\x47\xf9\xef\
-\x36\x49\xcf\x7c\x90\xae\xca\x6f\x81\x38\x3b\x3b\xab\xfa\x63\xbf\
-\x6f\xa4\xdf\x86\x61\xbf\xf9\x40\xcf\x09\xd2\xb3\xa2\x01\x4b\xb1\
-\x5c\x0a\xc1\x8e\x3d\x61\xf9\x04\x03\x83\xc6\x6a\x59\xdf\xaa\x10\
-\x49\xdb\x10\x33\xfd\x37\xd4\x8c\xbe\xb8\x5c\xb3\x5c\xf4\xa1\xe5\
-\xba\xfe\xa5\x68\x29\xeb\xb9\xd2\x54\x9f\xda\xd5\xc6\x92\xd8\xaf\
-\x2c\xaf\x69\x9e\xfd\xfa\x6d\x6b\x75\xcb\x6b\xcd\x6c\x33\xb7\xac\
-\x20\xf9\x91\xe2\x0b\xa4\x7f\x05\xb2\x0f\xdb\x59\x4a\x5a\x23\xfb\
-\xf0\xb3\x15\x5b\x90\xad\xe8\x17\x58\xee\xdb\xcc\x29\x55\xd8\xc8\
-\x29\x11\x94\x6e\xc0\x52\x47\xf1\x7a\x89\x75\x3a\xd6\xf2\xb2\x04\
-\x89\xc4\x38\xb0\x0c\x63\xc0\x8a\xd9\xbf\x62\xbf\xfd\x49\xba\xaa\
-\xfd\x19\xb5\xa5\xdf\x72\xa4\xdf\x78\x92\xf5\xc7\x7e\xdf\x48\x7f\
-\x53\x86\xfc\x82\xf2\x00\x1a\x1f\x82\x02\xf9\x6f\x06\x84\x3a\xf5\
-\x82\x15\xe8\x4f\x04\xc5\x76\xb3\x1a\x87\x6a\x35\x36\x1b\x8b\x65\
-\x6d\x65\xcc\x68\xab\xd1\x52\xaf\xab\xd0\x61\xff\xda\x26\x58\xd7\
-\x4a\xd6\x9b\xa1\xb5\x9f\x5d\xa7\x3d\x27\xd5\xa7\x06\xa9\xc6\xba\
-\x56\x62\x3b\xca\xb1\xbd\xa5\x94\x3b\xa2\x6e\xd5\xdb\xb1\x0c\x43\
-\xbd\x51\xfb\x32\xd4\xbe\x64\x13\xd7\xb8\x08\x29\xa6\x12\xf7\x29\
-\x5c\x2f\xb1\xce\x48\x01\xb1\x56\x2a\xd7\x70\xf2\x15\x56\x6b\xcb\
-\x42\x64\x17\xce\xd1\x43\x71\x0e\xb8\x8c\xe9\xbf\x89\xfd\x76\x33\
-\xe9\xaa\x3c\xfb\xbd\x9a\xfd\xb6\xdf\x6a\xba\x1e\xa0\xea\x8f\xfd\
-\xbe\x91\x7e\x33\x94\x7c\x85\xff\x46\x44\x30\xfb\x3d\x69\x5a\x5e\
-\xbe\xf8\x53\x58\x49\xf7\x15\x4f\xe6\x39\x8d\x1c\xb3\xab\xf5\xfd\
-\x58\xa2\x49\x8d\x57\x49\x1a\x37\xd5\x6f\x5b\xab\xab\xd0\xed\x80\
-\x39\x36\x48\x6c\xd4\xad\x9b\xa3\xa9\x7d\xf0\x58\x07\xcd\x1c\x5f\
-\xe3\x37\x22\x6e\x30\xfd\xb1\xbd\xfb\xa8\x9d\xdb\x70\x7d\x07\xda\
-\x0c\xcb\x32\xd4\x3e\x7f\x4b\x7b\x48\x09\xfb\x0c\x62\xc3\xa6\x42\
-\x54\x98\x33\x63\x2f\x95\x5b\xb1\xdc\xea\x02\xbb\xc2\xfc\x61\xd7\
-\x56\x05\x3f\xd8\xb5\xc5\x0f\x22\x88\xad\x54\xfa\x42\xc4\x66\xce\
-\xce\xcd\x3e\x9c\x4d\x84\x37\xec\x50\xf1\x82\x1d\x1b\xbd\x20\xc8\
-\x77\x16\x2c\x9a\x33\x12\x5c\xe6\x0c\x60\xfd\x9f\x7e\x03\xdc\xf8\
-\xdb\xcd\x41\xec\xb7\x61\x89\xc5\x8b\xdd\x55\xfd\x71\x4c\x68\xa4\
-\xdf\x09\xa5\xdf\xfb\xe3\xbf\x25\xbf\x0c\x42\xd9\xef\x06\x85\xc2\
-\x0a\xd7\xde\xb0\x7a\x8a\x81\x41\xe3\xb7\x66\x4c\x6e\xaa\x2f\x2b\
-\xba\x4a\x5a\xd7\xc8\x31\xdb\x5c\x1c\x5e\x2b\xe9\xde\x9a\xbe\x6a\
-\x46\xab\x83\x0a\x1b\x05\x9b\xb4\x1c\xda\x64\xba\x4d\x7e\xef\x90\
-\xb9\x7d\x36\x36\x0f\x9d\x97\xea\x52\x8b\xf5\xac\xc6\xba\x57\x52\
-\x6c\x8a\xc0\x75\xa4\x32\x1c\xfb\x64\x58\x5b\x88\x09\x77\x62\x7f\
-\x93\x87\xfe\x4e\x27\xfd\x2d\xef\xb2\xb2\x32\x13\x2a\x2b\x2b\x9b\
-\xa5\xa2\xa2\xc2\x84\xf2\xf2\x72\x13\xe8\x6f\x82\xb1\x5c\x2e\x70\
-\x09\xfb\xdd\x6f\xfa\xdd\x7e\xfa\x0d\x50\xea\xcb\x34\xbe\x93\xce\
-\xf4\xdb\xb0\xee\xee\x5e\xaa\xfe\xa8\x7b\x23\xfd\x4d\x17\xf2\x13\
-\xf6\x9b\x71\xcb\x57\xa8\xbf\x1b\xb7\xca\xfd\x33\x58\x3d\xcd\xc0\
-\xa8\x5a\x61\xd0\x8c\xcd\xb5\xb2\xce\x6b\xa4\x71\x58\xa7\x33\xc5\
-\x46\x59\xfb\x1a\x65\xfb\x5a\x2d\x64\x43\xa2\x46\x94\xb5\x42\xeb\
-\x5a\x89\xfd\x1b\xb4\xc8\xfd\x57\xd1\x84\xe9\xb8\x59\xb0\x45\x80\
-\xcb\x75\x5b\xcc\x6c\xdf\xc2\xb7\xcb\xa8\xef\xeb\x3e\x53\xb7\x59\
-\xfa\xbc\xec\x2b\x1b\x79\xdd\xaa\xb0\x0d\x07\x76\x62\xbd\x76\xf3\
-\xbe\x9f\x17\xfe\x2e\xc4\x46\xef\x82\x7d\xfb\xf6\xc1\xd1\xa3\x47\
-\x9b\xe5\xc8\x91\x23\xcd\x52\x5f\x5f\xdf\x2c\x87\x0f\x1f\x66\xd0\
-\xdf\x01\xa5\xdf\x7b\x5e\xbf\x8e\xff\xed\xe0\xf0\xed\xfc\xef\x30\
-\xb3\x7e\xbd\x7c\x19\xfb\x9b\x61\xf4\x7b\xe0\x98\x1b\xaa\xfa\xa3\
-\xee\x8d\xe4\x2b\xb4\x1f\xe5\x07\xec\x6f\xca\x50\xb9\x6a\x25\xac\
-\xf1\xec\x0b\x6b\xa7\x1b\x60\xed\x0c\x3e\x7e\xef\x5f\x2d\x81\x1a\
-\x1e\x10\xc8\xb9\x55\x8d\x34\x1e\x56\x63\x59\x85\xfe\x51\xb5\x5a\
-\x62\x8d\x19\xd6\x0a\xd6\xf0\x7e\x54\xbd\xce\x08\xf9\x43\xf5\x7a\
-\x0e\x2d\xd7\xac\x97\x40\xdb\xd7\x6c\xe0\xd4\x6e\x14\x71\x5c\xd1\
-\x65\xb3\xa4\xef\x56\xce\xe1\x16\xa8\x6b\x8e\x26\x7c\x85\xe9\x4f\
-\xfe\x88\xe3\x7c\xdd\x5e\x5c\xde\x85\xfd\x7e\xe7\x9b\x90\x92\x92\
-\xc4\xb4\x39\x76\xec\x58\x93\xb4\xe4\x17\xad\xf1\x0d\xd9\x3f\x48\
-\x7f\xd2\x77\x03\xea\x4f\x7d\x7f\x07\xea\xbf\x71\xc3\x46\xf1\x5b\
-\x90\x2b\xd5\xbf\x07\x80\xf3\x02\xf5\xef\x03\x62\x7c\x38\x4f\xfb\
-\x92\xdf\x28\xf9\x01\xfb\x1d\x60\x64\x9d\x77\x3f\x58\x87\xf9\x04\
-\x41\x7d\xf8\xc0\x5a\xa1\xf9\x5a\xc1\x3a\x5e\x52\x9c\xae\x15\xfd\
-\x98\x34\xa7\x38\x58\xb1\x5a\x40\x39\x91\xcc\x6a\x2d\x15\xb8\x6f\
-\xf9\x1a\x5e\x32\xd6\x1a\xa9\x24\xd6\x35\xc1\x7a\x4e\x15\xf9\xc6\
-\x06\x4e\x0d\xea\x5e\x8b\xec\x27\x5d\x50\xb3\x43\xa4\x5b\x98\xd0\
-\x17\xc7\xe2\xfa\xe6\x08\x33\xdd\x76\x38\x4c\xb0\x4d\x10\xa6\x85\
-\xfc\xe2\xe0\x16\x7e\xce\xfa\x18\x3c\x1f\xea\x5f\xb9\xeb\x69\x48\
-\x4b\xde\xcb\xf4\x3d\x7e\xfc\x78\xb3\x34\xe7\x1b\xf7\xe2\x23\x69\
-\x69\x69\x6c\xdc\xdf\xb8\x7e\x05\x6c\x47\xed\xe9\x6f\x40\x91\xde\
-\xd4\xa7\x49\x57\xd2\x99\xc0\xfe\xff\xad\xa2\x3f\x8e\x09\xa7\x69\
-\x5f\xda\x8f\x72\x03\xf5\x37\xc0\x91\x8d\x4b\x06\xc1\xfa\xd9\x06\
-\x06\xf5\xed\x83\xeb\x4d\xa1\x7c\x88\xc5\x6d\xd1\x7f\x2b\x57\x73\
-\x9d\xf7\x61\xbc\x28\x5f\xcb\xf3\xe0\xca\xcd\x3a\xd0\x66\x95\x5b\
-\xa5\x12\xa9\x92\x09\x33\x52\x4d\x6c\x33\x4f\x4d\x38\xa7\x16\xf3\
-\xec\xea\x2d\xdc\x1f\xc8\x0f\x34\x3e\xa0\xe8\x87\xfb\xd5\x13\xdb\
-\xa5\xd2\x1c\xe1\xba\xf7\xe5\xcf\xe8\xfd\x63\x1b\x3f\x7e\x1d\xc6\
-\xfd\x23\xb1\x5c\xff\xdc\xe8\x69\x4c\x93\x53\xa7\x4e\x32\x4e\x9e\
-\xd4\x72\xe2\xc4\x09\x38\x71\x92\xa0\xf5\x13\x70\xf2\x04\x96\xb4\
-\x4d\xc7\x71\xc6\x71\x75\x59\x2d\xf5\x7e\x44\x7e\xc6\x38\xce\xf4\
-\xa7\xb8\xbf\x65\xc3\x32\xf6\x37\xc1\xe8\x6f\xf5\xd1\x3a\x69\xbf\
-\x16\xf5\x24\x9d\x09\x9c\x0f\x7e\x21\xe9\x7f\x80\xf6\xa5\x5c\x91\
-\xc6\x80\x0d\xeb\xd7\xab\xbf\xfd\x1f\x16\x3a\x11\x36\xcc\x31\x30\
-\xa8\x5f\x1f\xda\x20\xd8\x28\x72\x2d\x31\x2e\xd7\x88\xfc\x87\xfa\
-\x7b\xe5\x26\xae\x09\x8d\x83\x14\x0b\x6b\x08\xcc\x87\xaa\x09\xb1\
-\xae\x94\x35\xbb\x45\xa9\x2c\x2b\x44\xe2\x67\xe9\xf3\x91\x12\x7b\
-\x04\xf2\xf2\x5e\xce\x7e\xe4\x60\x14\xd6\x2b\x1a\x4b\xdc\xbe\x1f\
-\xc7\xdf\x1a\xd4\x7f\x3f\xf5\x4f\xd4\xa8\x6e\x1b\xd7\xef\x08\xea\
-\x78\x04\xdf\x3b\xda\x0c\xca\xfb\xca\xbe\x1a\xb6\x4b\x84\x1b\xf5\
-\xaf\xc7\x73\x1e\x89\xc3\xbe\x10\xf5\x24\x94\x97\xe5\xc2\xa9\xd3\
-\xa7\x50\xfb\xd3\x8c\xd3\x6c\xf9\x14\x9c\x24\x5f\x60\xfe\xc0\xd7\
-\x4f\xa9\xeb\xe8\x27\xaa\x7f\x9c\x12\x3e\x22\x7c\x42\xf8\x87\xea\
-\x17\xc2\x7f\x4e\x2a\x7e\x40\x3e\x71\x9c\x7c\x84\x7c\xe1\x04\xfb\
-\x1b\xd0\xa4\x63\xf8\x96\xe5\xec\xef\xc1\xed\xd9\xb3\x47\xcd\x01\
-\x49\xcf\x9d\x3b\x76\x30\xbf\xc0\xf8\xdf\x4d\xd1\x1f\xfb\x7d\x2e\
-\xfd\x3d\x4f\xf2\x8b\x4d\xe2\x6f\xbf\x28\xec\xde\xe8\x0e\x1b\xe9\
-\xb9\x82\xb9\xbc\x3f\xd7\x6d\xe2\xb0\xfc\x47\xe4\x5b\x94\xa3\xd1\
-\x38\x5d\x45\x63\x2f\x6a\x7c\x20\x92\xeb\x5d\x85\x7d\xa2\x92\xe6\
-\x40\x3a\xca\x45\x59\xb9\xd3\x94\x0a\x2a\x23\x74\xec\xe2\x54\x89\
-\xb2\x5a\x61\xb7\x20\x92\x53\x23\xfc\xe1\x00\xfa\x40\x1d\xf6\xc5\
-\xc3\x31\x3c\x1f\x3b\x40\xfd\x93\xfa\xae\xa2\xed\x4e\xce\xb1\x08\
-\x81\xbc\x6c\x66\xfd\xa8\xcc\x4e\x23\x74\x2c\x8a\x0b\x74\xec\x13\
-\x49\xb8\x1e\x8f\xf5\x8b\x79\x93\xe9\xd7\xd0\xd0\xd0\x22\xa7\x4f\
-\x9f\x6e\x35\xdc\x5f\x5a\x26\x36\x36\x96\xfd\xcd\xaf\x5d\xe1\x6b\
-\xd8\xdf\x80\xa4\xf9\x40\x18\xfd\xed\xae\x8d\x1b\xd8\xb8\x40\x3a\
-\x13\x4b\x97\x2e\xed\xa8\xe8\x8f\x63\xc4\x4e\xf2\x93\x5d\x11\xbb\
-\xd4\xfc\x40\x21\x32\x2c\x08\x36\xcd\x33\xc0\xe6\x79\xfc\xba\xe3\
-\x61\xec\x53\x87\xb7\xf0\x5c\x98\xfc\x80\xf2\x2d\xca\xc3\x6a\xb7\
-\xf1\xd8\xb7\x3f\x92\x6b\x53\xb1\xf3\x09\xc8\xdd\xf1\x0e\x24\xef\
-\x18\x05\x09\x3b\xe6\x43\xdc\x0e\x37\xce\x4e\xc2\x1d\x62\x22\x96\
-\x40\x74\x44\xb0\x20\x84\x11\xa3\xb0\x2b\x94\xb3\x3b\x14\x62\x19\
-\xcb\x8c\x44\x2e\x67\xc4\x49\xc4\xef\x59\x01\x89\x7b\x02\x21\x2d\
-\x72\x2e\xe4\xef\xf9\x08\xaa\xf6\xfe\x91\xf9\xc0\x21\xf4\x81\x7a\
-\xd4\xa4\x3e\x9a\xc7\x80\xc3\xa4\xbf\xa2\xed\x2e\xc1\x6e\xc1\x2e\
-\xdd\xb6\x5d\xa6\x1c\x97\xd7\x25\x7f\x20\xbf\x3a\x99\x8c\xdb\x12\
-\xb1\xfd\x69\xfd\xe1\xec\xd9\x33\xc8\x59\x0d\x67\x70\xdb\x99\x33\
-\xb8\x7c\x46\xda\x76\xe6\x8c\x96\x06\x53\x1a\x1a\xf8\x7b\x5a\xbf\
-\x11\x88\xe5\x06\xf4\x8f\x06\xe1\x23\x34\xde\x6f\xc7\x3e\xbe\x7b\
-\xfb\x3a\xa6\x7d\x4c\x6c\x0c\x8b\x07\xec\x5a\xc0\xb6\x30\x16\x0f\
-\x44\x4c\xf8\x93\xa2\x7f\x74\xf4\x5e\x3f\xda\x97\xb6\xd3\x58\xa1\
-\xfe\xed\x37\xdc\x7f\xc7\xb6\xf5\xb0\x75\xd1\x6f\x60\x0b\x3d\xb7\
-\xb8\x04\xdb\xba\x95\xeb\xcf\x72\x65\x8a\xaf\x14\x03\xb0\xfd\x75\
-\x18\x7b\xf7\xef\x21\xed\x1f\x85\xcc\x9d\xfd\x20\x32\x62\x3d\xfb\
-\xbb\xf4\x05\x05\xf9\x50\x5a\x5a\x6a\x32\x4f\xad\xaa\xaa\x82\x9a\
-\x9a\x1a\x95\xda\xda\xda\x66\xd9\xbf\x7f\x7f\x93\x1c\x38\x70\x00\
-\x8f\x51\xcb\xe6\xd1\x59\x59\x59\x38\xe7\x8a\x80\xec\xa8\x51\x50\
-\x1b\xf3\x7b\xa8\xc3\x98\x7c\x24\x81\xf7\xcd\x43\xa4\x7f\x04\xd7\
-\xf7\x38\x11\xd9\x34\x27\xc4\x3e\x27\x22\x75\xa5\xf2\xd9\x5d\xbc\
-\x24\x3f\xa0\x63\x9e\x4a\xc5\x75\x8a\x01\xf9\x43\xe1\xdc\xb9\x73\
-\xad\x46\xef\x27\xcd\x61\xe2\x2f\x3a\x68\x5c\xa0\xd8\x4e\x44\xee\
-\xd8\x08\x31\x31\xd1\x10\x1f\x1f\x07\x5b\xb7\xf0\xbf\xe1\x46\x7f\
-\x0f\x52\xe8\x7c\xc7\x20\xbd\xd0\x67\x66\xc5\xc6\xc4\x40\x54\x74\
-\x14\x8e\x01\xf4\x37\x03\xb7\xb3\x79\x23\xc5\x11\x96\x43\x7a\x59\
-\xa1\x0f\x18\x20\xde\x07\xfd\x3d\x8c\xe7\xc9\xa4\x3f\xcd\xad\x0e\
-\x6c\xe3\x79\x2f\x8d\xbd\x55\xbb\x7f\x0f\x09\x11\x4e\x4c\x83\x43\
-\x87\x0e\x61\xee\x7a\x54\x42\xe4\x28\x2c\x67\x51\x72\xdb\xe3\x02\
-\x5c\x56\x72\x19\xca\x77\x8e\x4b\x63\xdb\x09\x25\xcf\x39\xc1\xb7\
-\x9f\x38\x2e\x10\x39\xd4\x89\x93\xea\x78\xa9\x8c\x99\xc7\x30\xf7\
-\x2a\x2a\x2e\x82\xa4\xd8\xcd\x50\x15\xd7\x1e\xea\xb1\x5f\x1e\xc3\
-\xfe\x79\x14\xeb\x59\x4f\xfa\x93\xbe\xe8\xab\x27\x30\x5e\x9d\x94\
-\x38\xb1\x57\xda\xb6\xc7\x94\x13\x52\x49\xfe\x70\x42\xf8\x09\xc5\
-\x83\x86\x34\x7c\x2f\x05\x7d\x20\xaf\x1f\x5c\xb8\x70\xa1\x49\xce\
-\x9f\x3f\x7f\x57\xdc\x8d\x2f\x55\x57\x57\x8b\xf8\x1e\x01\xd1\xbb\
-\x37\x41\x1c\x8e\x05\x09\x09\x09\xb0\x35\x6c\x2b\xf6\xf7\x70\x96\
-\x0b\xd2\xdf\x08\xc7\x52\xf3\xfb\x8f\x18\xe7\xbf\x54\xfe\x8e\x3c\
-\xc5\x0f\xf2\x93\x9d\xe2\xef\x87\x46\x50\x0e\x19\xf8\x0e\x84\x39\
-\x19\x60\xbb\x33\xfa\xf7\x36\x0e\xcd\x7d\x0e\x6c\xe1\x36\xad\x8b\
-\xa1\x71\xf7\x31\x48\x8c\xf4\x62\xd7\xa5\x5a\x9a\xf3\xe8\xf3\xdc\
-\xa6\xd0\xe7\xcd\xad\x41\x1e\x0b\x69\x3e\x9c\x9e\x12\x09\xfb\xe3\
-\x5f\x84\xa3\xd8\x37\x4f\xa2\x46\x47\x50\xbb\xe3\xa4\x1f\xfa\xeb\
-\x49\x22\x5a\x20\xd6\x4f\x49\xe5\x29\x69\xfd\xe4\xde\x26\x10\xc7\
-\x3b\x8d\xda\x9f\xc6\xe3\x1f\x4f\xb7\x86\x4b\x17\x2f\xc0\xa5\x4b\
-\x97\xe0\xe2\xc5\x8b\xf7\x44\x73\xfe\xd3\x9c\x4f\x15\x15\x15\x31\
-\x8d\x77\x47\x84\x43\x5c\xcc\x6e\xa6\x3d\xe9\x4d\xfd\x99\xfa\x31\
-\xfd\x8d\x78\xd2\x18\xcb\x38\x59\x7f\x8c\x07\xb6\x89\x89\x89\x40\
-\xb0\x3c\x40\xe4\x08\x2a\xab\xc7\xc2\x36\xd4\x9e\x20\xdd\x29\xf7\
-\xa5\xbc\xf7\x08\xfa\xff\x51\x8c\xab\x75\x68\xbf\xac\xc8\xe1\x2c\
-\xa6\x3f\x28\x5d\x5b\x9b\xef\xc8\x98\xcb\x9b\x28\xb6\xe4\x26\x87\
-\xc2\x91\x64\xae\xff\x09\x8a\x05\xd4\xcf\xb1\xce\xa7\x90\xd3\x44\
-\x8c\x20\xda\x4c\x19\x6d\xba\x4e\x9f\x63\xbe\x11\x6d\xf4\x8f\xd3\
-\x38\xc6\x34\x64\x60\x99\x6e\x80\xf3\x47\x13\x99\xfe\xad\xe5\x41\
-\xf9\x08\xc5\x5d\xca\xf9\xf6\x44\x6c\x64\xda\x27\xe1\xf8\x4b\x9a\
-\xb3\xbf\x0d\x8d\xfd\x3a\x3e\x2e\x9e\x69\x9c\x90\x10\xe7\x2b\xeb\
-\x0f\x00\x8f\xe0\xf6\xef\x69\xbc\xa6\x71\x60\xb7\xee\xef\x88\x47\
-\x87\xfb\x43\xb8\x0b\xf6\x7f\xa4\x14\xe7\x80\x47\xb7\xf3\xb9\xf4\
-\x71\x31\xae\xd6\x46\x3f\x03\x45\x85\xb9\x77\xad\xdf\xdd\xe4\xbf\
-\xad\xc9\xa7\x9b\xe2\xe0\xc1\x83\x50\x9b\x84\x79\x39\x6a\xd3\x90\
-\x85\xf5\x26\xed\x48\x4f\xcc\x0f\x1b\x30\x3f\x68\x88\xe5\xcb\xad\
-\x26\x46\x0b\x8b\x1f\x58\x9e\xcb\x36\xc0\x99\x4c\xa4\xb0\x2b\x5c\
-\x6e\xbc\x04\x97\x2f\x5f\x36\xa1\xb1\xb1\xf1\x9e\x69\xc9\x87\xa8\
-\xaf\xd3\xf7\x0c\x31\x7b\xc3\x21\x39\x29\x19\x52\xd3\x52\x61\x2f\
-\xf6\xe7\xdd\xbb\x77\xb1\x7e\x9d\x9c\x9c\x84\xa4\x50\x0e\x30\xc2\
-\xa0\x7b\xe1\x7b\x25\xa9\xa9\x69\xcc\x3f\xe8\x18\x2a\x98\x2f\x44\
-\x45\xed\x85\x9d\xee\x7f\x80\x1d\x8b\x0d\x90\x12\x88\xfd\x87\xe6\
-\x3d\x98\xf7\x9e\xa2\x31\x15\x7d\xa0\x24\x7e\x10\xeb\xd7\xf7\xa3\
-\xf1\xbd\xe8\xda\x52\x3e\x24\x53\x9d\xeb\x08\x27\xb1\x7f\x9e\x41\
-\x8d\x4e\xa2\xcf\x9e\x12\xda\x9f\xc1\xe5\x33\x71\x82\x78\xe3\x7a\
-\x43\xbc\xf0\x0d\x33\x9c\x91\xfc\xa6\x41\xf8\x03\xc5\x82\x33\x18\
-\x5f\xce\xe5\x60\x89\x3e\x76\x61\xbf\x3b\x5c\xbd\x7a\xb5\x45\xae\
-\x5c\xb9\x72\xdf\x90\x5f\xd1\x58\x47\x7d\x3d\x1a\xf5\x4a\x88\xd9\
-\xce\xae\x03\x65\x66\x64\x60\xff\xdd\x8d\x3a\xee\x61\xbe\x41\xd7\
-\x86\xd3\x10\xd4\xd8\x4e\xaf\x7f\x7a\x7a\x7a\x50\x7a\x7a\x06\xf3\
-\x19\x76\x9c\xe8\x18\x51\x22\xf8\xd9\x3d\xcb\x3e\x84\x1d\x6e\x06\
-\x88\x70\xe7\xf3\x9e\xe3\xd4\x66\x1c\xf3\x68\x5c\xad\x2e\xda\xac\
-\xd5\xb2\x59\x5d\xa5\xb9\xcc\x99\x7b\xd3\x92\x68\x7d\xde\xcc\x73\
-\xec\xc3\x55\xd1\x70\x32\x93\xeb\x4f\xb9\xda\x29\xd2\x19\x7d\xf7\
-\x4c\xa2\x8e\x04\x1d\xe6\xb6\xc5\x6b\x69\x10\x9c\x46\x9f\x38\x8f\
-\xfa\x9f\xcb\x35\xc0\x59\x3c\xcf\xc5\xba\x25\x70\xfd\xda\x35\xb8\
-\x7e\xfd\x7a\x93\x5c\xc3\xf7\xef\x17\xf2\x23\x9a\x63\x91\xc6\xd1\
-\x51\xbb\x51\xe3\x64\xc8\xcc\xcc\x80\xe4\x94\x64\xd6\x87\xa3\x50\
-\xc3\xc4\xa4\x24\x40\x8d\x49\xdf\xab\x06\x33\x7f\x03\x10\x63\xff\
-\x80\xcc\xac\x4c\x20\xe2\xe3\xe3\x21\x36\x16\xf3\x41\x24\x36\x2e\
-\x96\xe5\x0c\xb1\x61\xf3\x30\x06\x18\x60\x87\x3b\xbf\xbe\x77\x32\
-\x56\xcc\x79\x30\x06\xd4\xd5\xe6\x3e\x60\xcd\xce\xde\x55\xde\x2b\
-\xd3\x54\x1e\x7d\xbc\x2e\x1f\x4e\x63\xbf\x3c\x8b\xda\x9c\xa1\x71\
-\x40\x68\x7b\x36\x49\x47\xa2\x20\x49\x57\x36\x47\x82\xd1\x0f\xce\
-\xe0\xfe\x17\xf3\xd1\x0f\x72\x79\x2c\x38\x5f\x31\x08\xae\x5d\x3a\
-\x0a\x37\x6e\xdc\x78\x60\xe8\x7d\x88\xf4\x4f\x49\x49\x61\x3a\x25\
-\xc6\x45\xb0\xef\x99\xb3\xb3\xb3\xd9\xb5\xc0\x18\xec\xc7\x74\x4d\
-\x28\x3d\x2d\x1d\xf3\x03\xd4\x37\x3d\x33\x4a\xaf\x3d\xbd\x30\x36\
-\xfc\x05\x3f\xf3\x73\x4e\x4e\x0e\xa4\xe2\xb1\xc8\x07\x08\xca\x23\
-\xe2\x91\x84\xf8\x18\xd8\xe5\xf5\x6b\x88\xf0\x34\x40\x7a\x08\xef\
-\x3f\x94\xef\x9c\xc0\x18\x70\xe2\x48\xe5\x3d\x69\x76\xb7\x73\xa1\
-\xbb\xcd\x8b\x65\x4e\x1f\x2d\x80\x06\xea\x9b\xa8\xcd\xd9\x4c\xae\
-\xd3\x59\xf4\xdd\x73\x2d\x91\x64\x8a\x59\x7f\x11\x50\x7c\x38\x9b\
-\xc2\x7d\xe0\x42\x3e\x8f\x05\x0d\x39\x7f\x81\xf3\x35\xd3\xe0\x5a\
-\xe3\x51\xb8\x79\xf3\x66\xab\x69\xad\x3f\xd0\x77\x0d\x8a\x5e\x69\
-\xc9\x7b\x20\x3b\x2b\x1b\xf2\xf2\x72\x99\x3f\xd0\x36\x1a\xd3\xc9\
-\x1f\x48\x5b\xf4\x8d\x69\xe6\xf4\xa7\x57\x6e\x6e\x6e\x59\x5e\x5e\
-\x1e\xee\x9b\xc5\x3e\x43\xfe\x23\x13\xb3\xb6\x37\xfa\x80\x01\x22\
-\xbd\x51\xf3\x78\x9e\xeb\x9c\xc2\x58\xda\x70\x24\xf7\x81\xe8\x75\
-\xaf\xf3\x25\xa2\xa5\x1c\xfb\xcc\x91\x44\x38\x93\x87\x9a\x14\xa0\
-\x26\x99\x42\x7b\xd4\xe9\xbc\x42\xaa\xb4\xdc\x14\xc9\xc6\x92\x3e\
-\xab\xf1\x91\x64\x9d\x7f\x24\xf3\x18\xa0\xf8\x00\xc5\x9e\x4b\x47\
-\x36\xc1\xad\x5b\xb7\x5a\x4d\x6b\xfd\xa4\xb8\xb8\x98\xe9\x95\x18\
-\xb7\x87\xe9\xcc\x35\xcc\xc6\x6d\x09\x6c\x3b\xe5\x02\xb4\x8d\x40\
-\x8d\x2d\x9b\xd2\x3f\x3f\x3f\xdf\xb1\xb0\xa0\x10\x0a\x0a\x0a\x58\
-\xae\x40\x31\x25\x35\x25\x95\x91\x42\xeb\x51\xcb\x61\x37\x6a\xbf\
-\xdb\xc7\x00\xfb\xc2\x44\xbe\x4b\x39\xd5\x81\x15\x0f\x44\x23\x73\
-\xdc\x4f\xbe\x2c\x73\xfe\x90\x2f\x9c\x47\xed\x2f\x16\x63\xbd\x29\
-\x4f\x43\xbd\x2f\xa4\x99\x21\x55\x2a\x53\x85\x5f\x08\x94\xf5\x0b\
-\xc2\x1f\xce\xe9\x50\xfc\x84\x7c\x81\xf4\xa7\x18\x73\x26\x95\xfb\
-\xc0\x59\x8c\x3d\x97\xea\x1c\xe1\xce\x9d\x3b\x8c\xdb\xb7\x6f\x3f\
-\x10\xa8\x6d\x34\x6f\xa3\xfe\x99\x91\x1a\xc5\x34\x26\xfd\x32\x30\
-\x97\x4b\xc1\xed\xf4\x1e\x6a\xce\xb6\x21\xb5\x4d\x69\x4f\x2f\x7c\
-\xbf\x33\x5d\x43\x20\x7f\x22\xff\x21\xbf\x21\x28\x6f\xe0\xa4\x42\
-\x4c\xa8\x1d\x44\xfa\x1a\x20\x6e\x29\xb6\x2b\x57\xf8\x40\xd1\x07\
-\xbf\x98\x96\xe6\xe6\x50\xf7\xc2\xf9\xf2\x8f\x98\xf6\x8d\x25\x5c\
-\x7f\xd2\xf8\x22\xfa\xee\x85\x74\x23\xe7\x89\x34\x23\xe7\x04\xa4\
-\xf9\x39\xa1\xbd\xbc\x4e\x50\xac\xd7\x20\xb6\x91\x0f\x9c\x41\x1a\
-\x70\x4c\xb8\x88\x7e\x77\x1e\x63\xcf\xf9\xf2\x9e\xf0\xfd\xf7\xdf\
-\x3f\x50\xe8\x9a\x1f\xf5\xd3\x94\xa4\x04\x28\xc8\x49\x66\xf7\x97\
-\x91\x7e\x2c\xd7\x17\xda\x29\x9a\xa2\xbe\x2e\xcd\xe9\x4f\xaf\x92\
-\xa2\x92\x5a\xca\x25\xe9\x33\x19\x19\xe9\x2c\x97\xc8\xc8\xc4\xbc\
-\x81\x81\x3e\xb5\x7b\x11\xec\xf1\x33\x30\xaa\x76\x1b\x7d\xe0\xe2\
-\xf1\xe8\x7b\xd2\xe5\x7e\xe6\x3d\xad\x99\x5f\x11\x97\xcf\xe4\x33\
-\xed\x2f\xa1\xf6\x97\xf2\xb9\xd6\x97\x32\x84\xfe\x19\x42\xf7\x74\
-\xa3\xde\x4a\x7c\x50\x34\x3d\x63\x8e\x64\x2d\x0d\x4a\x7f\x97\x68\
-\x10\x9c\xcb\xe2\xe3\xce\xd9\xbc\x47\xe0\xf6\xd5\xc3\xf0\xcf\x7f\
-\xfe\xb3\x59\x7e\xf8\xe1\x87\x56\x41\x6d\x63\x39\x3d\x6a\x9d\x95\
-\x16\xc5\x34\x2b\x2d\x29\x61\x31\x20\x9d\xb4\xc3\x18\x40\xcb\xa4\
-\x67\x49\x49\xc9\xcf\x48\x93\xb1\x5f\x79\xe1\xbe\xf3\xe8\x7e\x35\
-\x22\x17\xf3\x05\xba\xa6\x44\xb1\x40\x25\x2b\x1d\x62\x82\x5f\x84\
-\xbd\xfe\x06\x88\x0f\xc6\x76\xe5\x71\xce\x17\xb6\x83\xcb\x17\xea\
-\xee\x49\x1f\x3d\x0f\x62\x4e\xa4\x72\x05\xc7\x9d\xca\xbf\xb3\x7e\
-\x7f\xb9\x0c\xeb\x4a\xbe\x9a\x69\xe4\x3c\xea\x7f\x4e\x68\x7f\x36\
-\x8d\xc7\xeb\x06\x22\x45\x5c\xd3\x15\xda\x9e\xd6\x41\xd7\x3e\x4e\
-\xa3\xb6\xa7\x64\x12\x39\x27\x91\xd3\x89\xc6\x6d\xa7\x29\x76\x50\
-\xde\x81\x5c\xaa\x19\x08\x3f\xfe\xf8\xe3\x03\x81\xae\xb7\x52\x1f\
-\x4f\x4d\x4d\x82\xc2\xfc\x74\x28\x2b\x2b\x65\xba\x65\x61\xfe\xc7\
-\x74\x43\x48\x7b\xda\x56\x56\x56\x96\xdd\x92\xf6\xf4\x2a\x2f\x2f\
-\x7f\x1a\xf7\xff\x27\x5d\xc7\x47\x7f\x61\x39\x23\x41\x63\x88\x42\
-\xfa\x1e\x17\x88\x0a\x30\x30\x2a\x31\x06\x5c\x2a\x14\xf9\x6e\xa9\
-\x03\x5c\xbd\x78\xa8\xd9\xf9\x6e\x73\x3c\xc8\x39\x12\x9b\x27\x5d\
-\xbb\x08\x8d\xb5\x5f\x41\x23\xea\x7e\x65\x1f\xea\x5f\x84\x75\xa5\
-\x3c\x8c\xb4\xa7\x3e\x99\x29\x72\xc1\x74\x7e\x4d\x80\xf4\xa6\x6b\
-\x1a\xf4\x5d\xee\x89\x64\xfe\x7d\xde\x09\x89\xe3\x89\x82\x04\x69\
-\x39\xc9\xb8\xed\x44\x82\xf4\x7e\x82\x71\x1b\x41\xe3\xff\xf9\x42\
-\xee\x03\x37\xce\x6c\x83\x7f\xfd\xeb\x5f\xf7\x05\xe5\xcb\x14\x9b\
-\x53\x93\x76\x42\xda\x9e\x85\xa8\x71\x39\x94\x57\x94\xb3\x38\xaf\
-\x68\x46\x63\xbe\x72\xaf\x30\x6a\xfa\x4d\xcb\xea\xf3\x57\x65\x65\
-\x65\x78\x55\x55\x25\xf3\x2f\x3a\x06\xcb\x1d\xf3\xf3\x01\xf3\x43\
-\xf6\x7d\x2e\x91\xb0\xca\x0e\x62\x96\xf2\x18\x70\x16\x6d\xd9\x88\
-\x6d\xbb\x84\x6d\xbb\x50\xfc\x02\x5c\x3e\x19\x06\x37\xee\x52\xcf\
-\xbb\x99\x17\xb5\x86\xeb\x17\xcb\xa1\xb1\xfa\x2d\xb8\x8c\xba\x5f\
-\x29\x37\xc0\x55\x2c\x2f\x51\x0e\x96\xcd\xcb\x0b\x58\xe7\xf3\xa4\
-\x7d\x06\xef\xef\x74\xcd\xee\x0c\x5d\xbb\x2b\xe4\x34\x14\x48\xe4\
-\x6b\x39\x85\xf1\xee\x74\x1e\x2f\x4f\xe5\x8a\xe5\x5c\x23\xa7\x15\
-\x70\x7b\x03\xbd\x47\xf3\xa4\x0c\x63\x0c\x38\x5f\xf8\x07\xb8\x7d\
-\x29\x1b\x7e\xfa\xe9\xa7\x7b\x82\xfa\x7e\x41\x61\x01\xa4\xa5\x44\
-\x40\xec\xba\x97\xa1\xac\x38\x93\xdf\x27\x8e\x3a\x93\x46\x5c\xaf\
-\x3c\xa6\x7b\x75\x75\x15\xbd\xd7\x80\xfd\xff\xf1\xd6\xea\x8f\xba\
-\xbf\xa6\x7c\x2f\xbf\xaf\xbc\x1c\x73\x8a\x02\x96\x57\x10\x34\xc6\
-\x14\x15\x15\x42\x6e\xca\x06\x88\x0d\x6c\x03\xb1\xa8\x7f\xee\x7a\
-\x3e\xae\x5e\xa6\x31\xb6\x88\x8f\x75\xe7\xcb\xde\x43\x3f\xd8\xf1\
-\xc0\x75\x6d\x69\xce\x74\xed\x42\x36\x34\xee\xef\x07\x97\xca\x84\
-\xee\x15\x08\x96\x97\x51\x87\xc6\x5c\x0e\xe9\x7f\x31\x9b\x5f\x07\
-\xa0\xdc\xe5\x1c\xea\x7d\x16\xeb\xdd\x80\xe5\xe9\x7c\xae\xe1\x49\
-\xdc\xff\x44\xae\x44\x0e\xe7\xb8\x9e\x6c\x2d\xc7\xd0\x8f\x8e\x65\
-\x73\x94\xcf\x9c\xca\xe1\xbe\x40\xe7\xb8\x50\xca\xe3\xc0\xf9\xa2\
-\xa7\xe0\xd6\xd9\xcd\xf7\xa4\x7f\x5d\x5d\x1d\xa4\x27\x85\xa3\xf6\
-\x2f\x42\x7e\x8a\x2f\xcb\x01\x49\x6b\xd2\x87\xfa\x2b\xe9\x55\x52\
-\x52\xca\xee\x9b\x10\x3a\x4e\x6f\xad\xf6\xca\x6b\xff\xfe\xfd\xc9\
-\x74\x6f\x05\x1d\x83\xc6\x81\xe2\xe2\x12\x2c\x8b\x59\x7c\xe1\xcb\
-\x25\x90\xbe\x7d\x20\xc4\xa1\xfe\xc4\x81\xdd\xbc\x6f\x5d\x2e\x31\
-\xfa\xc0\x99\x02\x9b\x66\xb5\x7a\x50\x73\x20\x99\xcb\x75\x23\x99\
-\xf6\x97\x49\xfb\x4a\xa4\x8c\x6b\xaf\xa0\xe8\x7f\x5e\xe4\x64\xa4\
-\x07\xd3\x1e\x97\x4f\xe4\xfd\x1a\x0e\x64\xbf\x0b\x55\x19\x7d\xa0\
-\x22\xa3\x1f\x27\xbd\x1f\x94\x13\x69\x0a\x5f\xc0\xbe\xb4\xfe\x50\
-\x92\x3a\x08\x8a\x25\x8a\x52\xb0\xd4\xf0\x1d\x94\xa4\x7c\x03\xd5\
-\x69\xdd\xe0\x68\xd6\xef\xe1\x64\x0e\x8f\x09\xe7\xb1\x3e\x97\xd0\
-\x27\x2f\xe0\x39\x2f\x22\xd7\x0e\x8f\x87\x1f\xbf\x3f\x0f\xff\xfe\
-\xf7\xbf\x5b\xc5\x95\xcb\x8d\x90\xba\x77\x16\xc4\xad\xfd\x3d\xa4\
-\x6e\xff\x98\xe9\x43\x7d\x9f\xe9\x22\xf2\x7c\x82\x74\x17\xfa\x9d\
-\xc7\xbe\xff\x9b\xbb\xd5\xff\xc0\x81\x03\x6f\xe1\xe7\x7f\xa6\x7b\
-\x6b\x28\x86\x50\x1e\xa1\x50\x46\x94\x95\x41\x69\x71\x2e\x24\xae\
-\xfa\x2b\xc4\x87\x1a\x20\x71\x19\xcf\x79\x2e\xe2\x58\xda\x58\xc0\
-\x7d\xe0\x5c\xe1\x13\x70\xfb\xd6\x35\x75\xce\xfb\x20\x68\x76\x3e\
-\x74\xe7\x26\x34\x56\xd8\xf0\x7e\x4f\x7d\x1e\xfb\xd9\x95\x7c\x41\
-\x01\x2f\x1b\xd1\x07\x2e\x8a\xeb\x32\x17\x71\x4c\x38\x87\xfe\x7a\
-\xba\xf0\xd7\x50\x91\x39\x16\xe3\x69\x14\xcb\x6f\xc8\x7e\xe4\xdf\
-\xe6\x50\xec\x2b\x72\xaa\x26\x11\x39\x37\x1b\x87\x93\x12\xf6\xa2\
-\x3f\x4c\xc0\x58\xf0\x7b\x36\x7e\x90\xcf\x35\x56\xf0\xf9\x48\x23\
-\x2e\x5f\x2e\xfd\x13\xdc\x3c\xee\x08\xff\xbc\x51\x0b\x3f\xa3\xc6\
-\x3f\xff\xfc\xb3\x09\xff\xfa\xfe\x1c\x5c\x3b\x19\x02\x69\xe1\x0e\
-\x10\xbf\x16\xed\xbd\xe1\x19\xa8\x2e\xcf\x61\x7d\x5f\xaf\x4d\x45\
-\x45\x25\xbb\x27\x8a\x53\x3b\xf9\x6e\xb5\x57\x5e\x07\x0f\x1e\x8c\
-\xa2\x58\x73\xe8\x50\x9d\x92\x43\x70\xca\x05\xb8\x5c\x9c\x15\x06\
-\xf1\xcb\x1f\x83\x04\xd4\x3f\x73\x2d\x9f\x2f\x51\x1f\xa3\x38\x40\
-\x73\xae\x1b\x17\xf2\x1e\xd8\x5c\xb7\xa5\xf9\xd0\x8d\x86\x55\x70\
-\x05\xed\x7a\xad\x0a\xf5\x2f\x15\x9a\x23\x57\x0b\x8d\xcb\x8d\xf9\
-\x5c\x7f\xb2\xff\x05\xec\x8b\x0d\xc5\x7f\x80\x82\x8c\x95\xac\x2d\
-\xf4\x1d\xe6\xdd\x7c\xff\xd8\xda\xef\x36\xe9\xb8\xe4\x13\x99\xc9\
-\x1b\x70\x5c\x79\x1a\xce\x52\xbe\x5c\xc6\xaf\x45\x5c\x11\xb9\x29\
-\xa3\x8c\x62\x96\x3d\x5c\xaf\x1b\x00\x37\x8f\x8e\x43\x9f\x98\x02\
-\x37\x0e\x0f\x84\x6b\x35\x1f\x60\xee\xf0\x08\x64\x85\xa3\xee\xeb\
-\x89\x36\x50\x96\xb3\x9e\xe5\x67\x8a\x26\xe5\x98\xff\xb1\x12\xc7\
-\xeb\x83\x87\x0e\xc2\xa1\xba\x43\x74\x0f\x56\x1d\xce\xdb\x1f\xbb\
-\x57\xfd\xeb\xeb\xeb\xad\xeb\xea\xea\x7f\x38\x7c\xb8\x9e\xdd\xcf\
-\x55\x8e\x3e\x50\xa9\x7b\x06\xad\x12\x7d\x2d\x3f\x7e\x01\x24\x2c\
-\x37\x40\xc2\x0a\x03\x64\xad\xe7\xf3\x29\x8a\xbb\xe4\xdb\x57\xeb\
-\x86\xb7\x38\xdf\x7d\x10\xdc\x3a\xbf\x13\xae\x56\x3d\xc9\xb4\xbf\
-\x5e\x6d\xd4\xfd\x9a\x04\x6d\xbb\x9c\xcf\xed\x4e\xfa\x53\x2c\x2e\
-\xcf\x71\x66\xcf\x4d\xdd\xcf\x7d\x77\x32\xcd\xf9\x0b\x7d\x47\x5b\
-\x90\x1e\xc2\xf5\x2f\xe5\xf9\xf2\xa5\x5c\x6e\xab\x6b\xe5\x46\xae\
-\x2a\xec\x13\x79\x2b\xf6\xa3\xdc\x1d\x06\x48\xda\x84\x6c\x34\xa0\
-\xbd\x67\x71\xfb\x57\x56\x68\x4b\xe4\x20\xf6\x79\xd2\xab\xfe\x30\
-\x7b\x26\xec\xe3\x7b\xd5\x5e\x79\x1d\x39\x72\xc4\x93\x9e\x2b\x39\
-\x7a\xf4\x08\x1c\x38\x78\x90\xf9\x1c\x41\x63\x42\x75\x55\xb5\x5a\
-\x66\xef\xfa\x1a\x92\x50\xff\x44\xa4\x60\x0b\xda\xb7\x98\xfb\x73\
-\x63\xd9\xe3\x70\xe7\x6a\xd5\x03\x99\xef\xea\xe7\x40\xff\xbc\x7d\
-\x1e\xee\x5c\x4a\x80\x1b\xf5\x5f\x70\xdd\x6b\x38\xd7\x4a\x85\xe6\
-\x38\x06\x5d\x57\xa0\xfa\x60\x79\x99\xfc\x02\xf7\x6d\xc4\xdc\xe0\
-\x54\xc9\xcb\x70\x60\x7f\xed\x3d\x7f\xd7\x78\x2f\xf7\x6e\x52\x3f\
-\xaa\xcf\x7b\x9b\xe9\x4f\x73\x13\xca\x99\x1a\x31\x37\xb8\x82\xe3\
-\xd2\x35\xac\xe3\x75\xdc\x76\xbd\xd2\x08\xf9\x41\xf1\x1e\x03\x24\
-\x63\xbf\x4a\x5a\x6d\x40\x3b\x7f\xc7\x6d\x5e\x5d\xcd\x11\x5a\x54\
-\x55\x56\xb1\xf1\x9e\x69\xc5\xf4\x3a\xba\xfd\x7e\xb5\xa7\xd7\xf1\
-\xe3\xc7\x9f\xc4\x63\x1e\x54\x9e\x45\xe2\xf7\xda\x9a\xbf\x67\x37\
-\x73\x47\x77\x48\x5a\x69\x60\x14\xef\x14\x31\x0d\xeb\x7f\xa5\xe6\
-\x55\xf8\xf1\x87\xeb\xf7\x3d\xe7\x55\xb8\x79\x3a\x00\xae\x54\xfd\
-\x85\xe9\x78\xad\x9a\x6b\x7e\xa3\x96\x73\xbd\xcc\xa8\x37\xa3\xc4\
-\x08\xd3\xbf\x98\x7f\x86\xf4\x3f\x5c\x36\xa7\xc5\xef\xa9\xee\xf6\
-\x3b\xca\xd6\xdc\xb3\x79\xb8\x74\x36\xd3\x9f\x6c\x43\xf9\x08\x69\
-\x7f\x55\x21\xd7\x48\x23\xe6\xa8\x45\xdb\x50\xfb\x55\xdc\xa6\x59\
-\x3b\x7a\xa1\x9d\x4d\xed\xce\xb4\x40\xed\xe9\x7b\x40\xd2\x08\xf5\
-\x3a\x87\x7e\xf6\x3f\x0f\x42\x7f\xe1\x03\x6f\x21\xff\x52\x9e\x35\
-\x22\x1f\xd8\xbf\x9f\x73\x80\xee\xbf\x16\xf7\x60\x1f\xa8\xad\x84\
-\xac\xed\x7f\x63\xf5\x4d\x46\x5f\x2d\x8c\x40\xff\x2e\xe5\x3e\x7c\
-\xfd\xf0\xb7\xf0\xaf\x7f\xde\xbe\xe7\x39\xaf\xc2\xad\x06\x7f\xa6\
-\x3b\xc5\xf8\x1b\x42\xf7\x9b\xfb\xb1\xac\x12\x3a\x2b\x9a\x97\xea\
-\xc0\x6d\xd7\x4a\x78\x5d\xae\xe1\xe7\x2e\xe3\xfe\xa7\xea\xf6\xb6\
-\x7c\x9f\x9d\x74\xaf\xdd\xc5\x0b\xca\x7a\xcb\xf7\x69\x9e\x3f\x2f\
-\x2d\x2b\x08\xff\x38\x75\x70\x13\x9b\xa3\xd0\xdc\x94\x7c\x92\xf2\
-\xd2\xab\x18\x97\xae\x63\x79\x4d\x40\xf3\xd3\xfc\xad\x68\xc7\x35\
-\x9c\xac\xed\xef\xc1\xfe\xda\x0a\x35\xaf\xe3\xf6\x37\xde\xff\x4e\
-\xba\x53\x9e\x71\xec\xf8\xf1\x9f\xb1\xec\xfd\xa0\xb4\x57\x5e\x27\
-\x4f\x9e\x5c\xc4\x9e\x67\x3b\x79\x92\xdd\xc3\x4b\xf7\xd4\xe9\xa1\
-\xd8\x76\x70\x7f\x25\x64\xef\x78\x9b\xd5\x39\x85\x7e\x9b\x22\x82\
-\xe7\xbb\xd7\x28\x9e\x1d\xea\xc9\xe6\x3a\xf7\xa6\xfd\x8f\x70\xbb\
-\xc1\x8b\xf5\x5d\xb5\xaf\xa3\xfd\x6e\x94\x1b\xfb\xf7\x8d\x52\x89\
-\x32\xed\x32\x8b\x0b\x54\x0f\xfc\xcc\x75\xf4\x97\xab\x78\x9c\xb3\
-\xc7\x92\xee\xe9\x5e\xbb\xfb\xbd\x9f\xf3\xec\xe1\x2d\x6c\x7e\x4a\
-\x36\xb9\x8a\xfa\x5f\x25\xcd\x49\x7f\x1c\xb3\xae\x17\xf0\x6b\x90\
-\xd9\x38\xce\xa7\x62\x3e\x9d\x8a\x36\xcc\x89\xe8\x05\x87\x0e\x54\
-\x29\x39\x1d\xe6\x77\xc8\xc1\x43\xaa\xcd\x49\x7b\xf6\x7c\xd9\xc9\
-\x53\x70\xfa\xe4\x49\xbf\x07\xad\x3d\xbd\x5c\x5c\x5c\x1e\xc1\x5c\
-\x36\x59\xc9\x69\xe9\x59\xc3\xc3\x87\xeb\xe0\x70\xdd\x61\x5e\x1e\
-\x96\xca\x43\xfb\x21\x7f\x4f\x3f\x5e\xff\x75\x38\x2f\x08\xe7\xd7\
-\x50\xae\xb3\x58\xdd\x16\x7e\xb8\x9c\x00\xff\x46\x4d\x5b\x3b\xe7\
-\xfd\xf1\xf6\x71\xb8\x79\xa4\x37\x8f\xf3\xa8\xdd\xcd\x5a\xa1\x69\
-\x89\x4e\x6f\x73\xec\x13\x28\x3e\x40\xcb\x07\xd0\xde\x78\x8c\xc6\
-\xe3\x2b\xee\xf9\xfb\xc4\xfb\xba\x87\xb3\x7e\x21\x9b\xa7\xb0\x3c\
-\xb5\x50\xd2\x1e\x39\x18\x63\x80\x74\x1c\xeb\xd3\xd6\x72\x8a\xe2\
-\xc6\xa2\x4d\x0f\xa9\xcf\xf7\x13\x75\x38\x1f\xab\xab\xe3\xcb\xf4\
-\x4c\x84\xf4\x8c\x58\xda\xfd\xe4\xfb\x2d\xbd\x30\x06\xfc\x09\xf3\
-\xd8\xc3\x4a\x3e\x4b\x71\xa0\xa9\xdf\x23\xa0\x3c\xa4\x24\x69\x3a\
-\xa4\xad\x7b\x04\xc1\x36\x61\x2c\xab\x49\xe2\xd7\x64\x58\xec\xae\
-\x7b\x1f\xfd\x20\x16\x7e\xfa\xf1\x9a\xd9\xf9\xee\xcf\xff\xc6\xfc\
-\xee\x7a\x31\xdc\x3a\x35\x1a\xae\xd7\xfe\x9e\xeb\x8e\xdc\xaa\x95\
-\xfa\x76\x53\x9a\x23\x37\x85\xee\x37\xcb\xf9\xb2\xb2\x4e\x3e\x70\
-\xeb\x20\xf7\x81\xab\x87\x7b\x3f\xf0\x7b\x31\xe5\x7b\x32\x9b\x64\
-\x7f\x77\x96\xaf\xde\xa8\x36\xce\x51\xce\x63\xbc\x2f\xd9\xc1\xb5\
-\x67\xfa\x6f\xf8\x3d\x54\xe6\x85\x36\xfb\xfb\x0f\x14\xef\x95\x39\
-\x07\xea\x5f\x81\xf1\xe0\xf7\xbf\x94\xf6\xca\x0b\xcf\x65\x8b\xf9\
-\xec\x25\x25\xaf\xa5\x3a\x68\x9f\x45\xd7\x3e\xaf\x5e\x53\xbc\x09\
-\x32\x36\x3f\x0d\xe9\x1b\xb0\x5d\x38\x2f\xc8\x8b\x34\xc0\xb1\x1c\
-\x63\xae\x7e\xbd\xe6\x37\xd8\xb7\x7b\xc2\xed\x93\xc3\x31\xbe\x4f\
-\x85\xdb\xa7\xc6\xc1\xad\x63\xfd\x51\x1f\x2b\x1e\xe7\x49\xf7\x03\
-\x5c\xb3\x9b\x35\x5a\xed\x6f\xca\xfd\x5b\xc7\x4d\x45\x7b\x1d\xec\
-\x3d\x3c\xce\x4d\x3c\xde\x75\x8a\x03\xe7\x12\x1e\xec\xf7\x8d\xe2\
-\x7e\xcc\x26\x39\x93\xc0\xc7\x30\x6a\x4b\x05\x9f\x93\xee\xc7\x3e\
-\x9f\x89\xf1\x3e\x03\x21\x3b\xe5\x6c\xef\x0c\x87\x6a\xb2\xa4\x67\
-\xff\x4d\x7f\x07\x80\xee\xb1\x97\xe6\x17\x47\x71\xfd\x85\x5f\x5a\
-\x7b\xe5\x85\x39\xec\xdf\x90\x9b\x4a\x3e\x7b\x4a\x3c\x67\xa1\x7d\
-\xce\xe7\x84\xfa\x6c\xf2\x91\x83\xc5\x50\xb0\xb7\x17\xa4\x53\xfb\
-\x90\xcc\x30\x03\x94\xc6\xf0\xeb\x6f\xb7\x44\xbf\x56\x39\x20\xf4\
-\x56\x38\xc8\xfb\xfc\xcd\x0a\xa3\xe6\x4a\x7f\x6e\x4a\x63\x85\x5b\
-\x15\xa6\x30\x1f\xc0\xf2\x76\x1d\x2e\x1f\x42\x1f\x38\xf8\x3c\x5c\
-\xbf\x54\x04\x37\x6e\xdc\x84\x9b\xfa\xef\xa5\x6e\x0a\xee\xfa\xfe\
-\x4c\x84\x96\xaf\x8b\x7b\x35\x6f\x5c\x67\xdf\x87\x5d\x6f\xac\x85\
-\x6b\xfb\xdb\xf3\xdc\x05\xf5\xaf\x4f\xc6\xfe\x80\xb6\xc8\xd8\xc4\
-\xb5\xcf\xd8\xf8\x38\x94\xa5\xce\x80\xe3\x47\x0f\x35\xfb\xfc\x14\
-\xc5\x7a\xe3\x7c\xe2\xfc\x45\xea\x93\xff\x29\xed\x95\x17\xe6\x31\
-\x5d\x31\xb7\xbd\xc1\x73\xdc\x8b\xd0\x40\xcf\x1f\x9e\x54\x9e\x59\
-\x37\xf3\x2c\x0f\x96\x07\xf7\x85\x41\x76\x78\x5b\xc8\xc4\xf6\x12\
-\x59\xd8\xf6\x0a\xba\x7f\x1e\xe3\xdf\xed\x83\x5a\x98\xe6\x55\xc6\
-\x3e\x2e\x6b\x7e\x8b\x28\x6f\x02\x33\x9a\x9b\xf8\x00\x95\x68\xff\
-\xdb\x87\x15\x1f\xf8\x33\x5c\x6f\x08\x84\x5b\x37\xae\xdc\xf3\x3d\
-\x78\xcd\x72\xe3\x2a\x5c\x3f\xb3\x15\xb5\x7f\x11\x2e\x61\x1d\x0f\
-\x63\xac\xcf\xc3\xf9\x71\xe6\x66\x01\xda\xa2\x70\x6f\x37\xa8\xaf\
-\xcd\x14\xbf\x05\x70\x4a\xfb\x7b\x11\x27\xf9\xf3\xfe\x4a\x9f\x57\
-\xe6\x1e\xe7\xcf\x9d\x47\x17\x38\xd7\xe9\x3f\xad\xbd\xf2\xc2\xb1\
-\xec\x1d\xac\xc7\x55\x25\xe7\x3d\x47\x73\x9b\x53\xa6\xcf\xaa\x6b\
-\x9e\x63\xc7\xb6\x54\x64\xcc\x84\xac\xad\x7f\x42\x0c\x2a\x45\x68\
-\x8f\xba\x44\xfe\x3d\xe2\x4d\x33\xfd\xfc\x96\xe0\x76\x39\x87\x69\
-\x29\x6b\x2e\xfb\x00\xe6\x18\xb7\x65\xcd\x2b\x9b\x28\xf7\x4b\x3e\
-\x80\xb1\xe6\xca\x81\x76\x70\xf3\xea\x91\x07\xfa\x7d\xd4\xad\x9b\
-\xd7\xa0\xb1\xda\x02\x4e\x60\xbb\xca\x13\x0c\x90\xbb\x1b\x73\xfb\
-\xed\xa2\xdd\x5b\xda\x40\x5e\x44\x17\x38\x58\xb6\xd9\xe4\x9a\xb1\
-\xc6\x7e\xc2\x86\xa4\xb9\x34\xc7\x38\xfa\x30\xfa\xbd\xfe\x45\xfe\
-\x87\x75\x39\x2d\xcf\x7d\x28\x27\x61\xcf\xa5\x37\x48\xcf\x7f\x9c\
-\x96\x9f\xf5\x68\x80\x93\xc7\x6a\xa0\x2a\x7b\x01\x8e\x75\x2f\x32\
-\x5b\x64\x13\x61\x9c\x62\x9c\x33\xd6\xa7\xf0\xef\x91\xc8\x0f\x14\
-\x5d\x6f\xcb\x54\xe8\xa8\xd4\x2d\x37\x45\x95\x40\xf1\x01\x1c\x8b\
-\x6f\x1d\x32\xfa\xc0\xf5\x8b\x39\xf7\xf5\x1d\x85\x72\x6f\x27\xe5\
-\x01\xa4\x5d\xcd\xbe\x58\xc8\xde\x85\x5a\x47\x18\x78\x19\x4e\xda\
-\x3f\x0a\x85\x51\xdd\xe0\x50\xf9\x4e\xf6\x0c\xcc\x99\x33\x0d\x9a\
-\x6b\xc7\xa7\x4f\xcb\xd7\x8d\x4f\xb3\x3e\xaf\x9b\x63\x16\xe0\x38\
-\xf3\xc0\xae\xef\xdc\xef\x0b\x35\x7f\x1e\xe7\x36\xf9\x8d\x94\xdb\
-\x36\x12\x8d\xec\x3a\x87\x72\xdd\x93\xe5\x28\x67\xf8\x6f\x20\xa8\
-\x39\x8b\xf8\x1d\x84\x86\x53\xf5\x70\xa0\x38\x04\x8a\x63\x3e\x84\
-\x9c\xb0\x47\x98\xfe\x39\xc4\x36\x04\x6d\x95\x4f\xbf\xeb\x43\xbf\
-\xab\x83\x73\x87\xa3\xe2\x5e\xda\xab\x25\x66\x72\xbc\x0a\x33\xa5\
-\x9e\x4a\x41\x85\xb1\xbc\x21\xae\x21\xdc\x10\xfa\xdf\x38\xed\xd4\
-\xaa\xef\x21\xd5\xfe\x8d\x63\x04\xe5\xf4\x94\x07\x53\x9e\x4e\xd7\
-\x63\xe8\x1e\x09\xfa\x1e\x3e\x3f\x2f\x07\xb2\xa3\xdf\x66\xba\x67\
-\x63\xbf\xcf\xdd\xd9\x1e\xaa\xb2\xa6\xc2\xb1\x83\x59\x70\x8e\x9e\
-\x4b\x22\x9b\x9c\xd1\x5f\x27\x3e\xab\xf9\xfd\x08\xea\x4f\xcc\xa6\
-\x7c\xce\xf9\x33\x96\x41\x00\xf0\xab\x87\xad\xb9\xfe\x85\x75\x7a\
-\x1c\xf3\xdb\x50\x79\x0e\xd4\x88\xf5\x96\xaf\x87\xe2\x78\x85\x63\
-\xc4\x39\x36\x4e\xc8\xd7\x4a\x95\xe5\x86\x93\x07\xe1\x40\x91\x37\
-\x14\x46\xbe\x0a\xb9\xdb\x1e\x83\x5c\xd4\x9f\xb1\xdd\x48\x9e\x02\
-\x8e\x17\x79\x3b\x38\xf9\x3b\xcd\x10\xc1\x29\x68\x05\x6c\xbf\x28\
-\x24\x1a\x8f\x17\xfd\x2c\x14\x15\xa4\xb3\xef\x78\xf9\xbd\x2e\x45\
-\xec\xb7\x04\xd4\x65\x81\x72\x3f\x0c\xbb\x27\x46\x5a\x2e\xe4\xf7\
-\x59\x43\x7e\x66\x18\xe4\xc6\xbc\x03\x79\x51\x0e\x50\x9d\x8f\x9a\
-\xd7\x65\x09\x1b\x88\xf6\x9e\xa3\x36\x9f\x13\x36\x90\xaf\x1b\xf3\
-\x92\x62\xbd\x7c\x7f\x2c\x2e\x37\x62\xd9\xe7\x61\xeb\xdc\xd2\x0b\
-\xeb\xd8\x17\xb9\x60\x9c\x53\x5f\x45\x3f\xb8\x74\xd7\xcf\x83\x9c\
-\x3d\x5d\x07\x75\xfb\xd6\x41\x4d\xce\x64\x28\x8a\x7a\x13\x35\xfa\
-\x2b\x6a\xfd\x24\xd7\x5b\xaf\xb9\x4e\x4b\x55\xfb\x5d\x5a\x0a\x95\
-\x72\xb7\xd8\xb6\xdb\xf8\x5e\x3e\xce\x4b\x0b\x62\xb8\x0f\x14\x24\
-\xf6\x67\xf7\xba\xb4\x74\x0f\x80\x86\xa2\x7c\x28\xca\x8b\x87\x82\
-\xa4\x05\x50\x91\xeb\x08\x75\x15\x9b\xa0\xe1\x44\xb5\x98\xf3\x37\
-\x0a\x1f\x6f\x5d\xdb\x69\x7f\xdd\x75\x89\x74\xec\xfb\x7f\x7d\xd8\
-\xda\xb6\xf6\x85\x63\xdf\x9f\x70\xde\xb3\x1c\xcb\x9f\xae\x2b\x73\
-\x62\x84\xc6\x05\xe3\x75\x75\xf1\xbc\xcf\x25\xe9\xf9\x10\xf5\x1a\
-\xe9\x25\xf5\xbd\x4b\x17\x69\xbc\xe3\xdb\xcf\x9c\xac\x85\xe3\x07\
-\x53\xa0\xbe\x32\x0c\xea\xca\xfc\xa1\xae\xd4\x15\x59\x00\x87\x4a\
-\xe7\x61\x39\x57\x4b\xd9\x5c\xd3\x6d\x62\xfb\x61\xa5\x2c\x93\xf7\
-\x9b\x03\x87\x2b\xe7\x42\x7d\xd5\x7c\x2c\xe7\x41\xfd\xc1\xdc\x26\
-\xae\xbb\xd4\x41\xfd\xe1\x83\x50\x5f\x57\x8b\x54\xc3\x91\xba\x0a\
-\x38\x71\xb4\x0a\xce\x36\x1c\x86\x46\xf6\x8c\x03\xf6\xd9\xcb\x22\
-\x06\x5e\xbd\xa2\x69\x33\x6b\xdf\x25\xb9\x6d\xb2\x1d\x2e\xb1\xcf\
-\x5c\x63\xcf\x84\x22\xd7\x99\xdd\x2e\x5d\xbd\x7e\xdd\xe4\x59\xed\
-\xff\x2b\x2f\xac\xff\x1b\xe8\x07\xc5\xd7\x75\xcf\x2c\x5e\xbd\xc2\
-\xed\xa2\x3e\x17\x22\x3f\x23\xa2\x3c\x27\x72\x59\x3c\xff\x21\x5f\
-\x3f\xbd\x6c\xdc\x6e\xf6\x59\x91\xc6\xcb\x9a\x7d\xaf\xc8\xcf\x19\
-\x50\x79\x85\x96\xcd\x5c\x9b\xc3\xed\x94\xbb\xd0\x67\xae\x5e\xbb\
-\xaa\xb9\x86\x43\x1a\x36\x7b\xad\xef\xaa\xb8\xcf\xfd\x8a\xdc\x5f\
-\xc5\x31\xa5\xba\x18\x73\xb7\x46\xd1\xce\x46\x16\x17\xe9\xfc\x57\
-\x75\xcf\x08\xa3\xf6\x3f\x60\x1d\x96\xe0\xf1\x9f\x7a\xd8\x1a\xde\
-\xef\x8b\x7e\x5b\x02\xdb\xf2\x2d\xe6\xab\x95\x9a\xeb\x2a\xc2\x27\
-\x94\xeb\xae\x4d\x5f\x2f\x35\xff\x5e\xeb\xae\xc3\xde\xdb\x35\xdd\
-\x6b\x2d\x3c\xb3\x6d\x8e\x96\xdb\xa1\xad\x3b\x9d\x43\xb9\xef\x59\
-\xba\x76\x44\xaf\x00\xdc\xe7\xa5\x87\xad\xdb\x2f\xf1\xc2\x5c\xf9\
-\x53\x6c\x6f\x8e\xfe\x5e\x5e\x76\xbf\xb6\x64\xc3\xd6\x6a\x7b\xaf\
-\xcf\x97\xb4\xea\x77\x19\xee\x66\xdf\x56\x3e\xab\xa4\x3c\xe3\xa0\
-\xbf\xbe\x74\xe3\xe6\xcd\x73\xb8\xbc\x10\xf7\xf9\xe3\xc3\xd6\xe8\
-\x3f\xf1\x42\xdf\x7f\x13\xdb\x1b\x78\x93\xb7\xdb\xf4\x7a\x9b\xb8\
-\x16\xcb\xfa\xd6\x35\xf1\x1b\x09\x4d\xd9\x9f\xe5\x16\xca\x32\x95\
-\xd7\x18\xca\xfe\xd7\xae\x5d\x95\xde\x17\xef\xb1\xe3\x71\x94\xcf\
-\xb1\x65\xf1\x3e\xdf\x47\xd9\xae\xbc\x77\xd5\x88\x72\xec\x26\x9f\
-\x5d\x32\x3e\xcf\xd2\xd4\x3d\xeb\x37\x6f\xdd\xbc\x8d\xe5\x76\x9c\
-\x43\xf6\xfb\xdf\x38\x9f\xfb\x4f\xbc\x68\x6c\x40\xfb\x7c\x84\x36\
-\xd8\x88\x73\xea\x0b\xcd\x5e\x4b\x53\xed\xf6\x80\xae\xc9\x3e\x88\
-\xe7\x10\xd8\xb2\xee\x9e\xf6\x5b\x66\xea\x7e\x47\x5d\xbe\x76\xe7\
-\xd6\xad\x3d\xf8\xf9\x81\xd8\xf6\xdf\x3e\x6c\xfb\xff\x6f\x7b\xa1\
-\xfd\x5e\x45\x1b\xcd\x40\x5f\x88\xc0\xf2\xc4\x83\xbc\x6f\xfc\x61\
-\x80\x6d\x38\x8a\xe5\x6e\x64\x36\x2e\xbf\x85\x9a\x3f\xfa\xb0\x6d\
-\xfc\x7f\xe9\x85\xf6\xfa\x0d\xf6\x95\x8e\x3f\xfc\xf0\xc3\x97\x64\
-\xc3\x5b\x77\x6e\xad\xc2\x32\xe6\xfb\xef\xbf\xcf\xc1\xb2\x14\x6d\
-\x7a\xf8\xce\xf7\x77\xce\x7c\x7f\xe7\xce\x99\x3b\x77\xbe\x47\x94\
-\x65\x23\x6c\x9d\xf6\xf9\x5e\xde\xfe\xfd\x19\xf5\x73\xdf\x7f\xaf\
-\xdd\xce\xde\xfb\x5e\xfb\x79\x1d\xe4\x9b\xdf\xf3\xf3\xe7\x89\xfa\
-\x6c\xbf\x73\xe7\xd6\x72\x5c\x9e\x85\xdb\xbe\xc0\xb8\xdf\x01\xeb\
-\xfe\xc4\xc3\xb6\xdf\x7f\x5f\xff\x7d\xfd\xf7\xf5\xdf\x57\x53\x2f\
-\xa0\xd7\x35\x5a\x7a\x02\x94\xd7\x0f\xfc\xad\xa7\x94\xf5\x2c\xbe\
-\xde\x46\xac\xfe\xac\x7c\xf6\x7d\x30\x7e\x5a\x3a\x42\x96\xb2\x2e\
-\x3e\x60\x3c\x99\x8b\xe6\xe3\x06\x43\x3b\xe9\x6c\xea\x19\xaf\x19\
-\xd7\x1f\xa5\xf5\x13\xc6\x75\x76\xc0\xc5\xba\xda\xcb\xad\x71\xd1\
-\x1c\x9e\xd5\xf0\x27\x79\xbd\x9d\x6e\xfd\x29\xcd\xe9\x59\x0b\xae\
-\xc9\xeb\x8f\x6a\x4e\xcf\xd6\xb3\xe4\xf5\x36\xba\x75\x83\xb6\x7a\
-\xa6\xeb\x2e\x9a\xea\xe2\xfa\xcf\xda\xf5\xf7\x75\xeb\xed\x7e\xba\
-\xbb\xf5\xa7\x7e\x68\x7e\xfd\x89\x6b\x77\xb7\xfe\xa8\x7e\xfd\xc4\
-\xfd\xad\xb7\xc9\xfa\x65\xd7\x0d\xff\x5d\xff\xef\xfa\x7f\x70\xfd\
-\xbe\xfd\xf7\xc4\xdd\xad\x9b\xf4\xaf\x16\xfa\xab\x49\xff\xd6\xc7\
-\x83\x16\xe2\xc5\x53\xfa\xf8\xa2\x8f\x3f\xfa\x78\xa5\x8f\x67\xd0\
-\xfc\xba\x4b\x0b\xf1\xd2\x34\xde\x9e\x90\xd7\xcd\xc4\x67\x4d\x83\
-\x9f\xd0\xc5\xf7\xa7\x4c\xc7\x03\xfd\x78\xa1\x1f\x4f\x4c\xc6\x1b\
-\xa9\x42\x6d\x74\xe3\xd3\x13\xe6\xc6\x33\xe9\x84\xef\x9b\x1b\x0f\
-\x8d\x27\x68\x63\x7e\x3c\x55\x0f\xd0\x0e\xb4\x03\xaa\x32\x3e\x5f\
-\xd3\xec\xae\xee\x00\xad\x79\xfd\x7f\xcd\x4b\x64\x85\
-\x00\x00\x0b\xff\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x0b\xa1\x49\x44\x41\x54\x78\x9c\xd5\
-\x5b\x69\x8c\x1c\xc5\x19\x7d\x5f\x1d\xdd\x3d\x33\x7b\x78\x77\x31\
-\xeb\xfb\x5a\xb0\x01\x71\x99\x4b\xdc\x86\x04\x8b\x4b\x31\x21\x84\
-\x08\x44\xa2\x04\x21\x41\x40\x21\x01\x89\x20\xa2\x88\x2b\x24\x40\
-\xfe\x84\x28\x51\x00\x91\xc3\x24\x31\x08\xe2\xe0\x40\xc0\xe6\x0c\
-\xe1\xb6\x01\x2f\xd8\x60\x6c\x07\x5f\x80\x81\xc5\xc7\xde\x73\xf5\
-\x51\xf5\xe5\x47\xcf\xec\x35\xbb\xeb\xf5\xee\x78\x3d\x7e\x52\x69\
-\x57\x3d\xdd\xd5\xf5\x5e\x7d\x55\xf5\xaa\xba\x8a\xb0\x77\x50\x00\
-\x24\x00\xd9\xd0\xd0\x20\x99\x99\x98\x99\xf6\x32\x8f\xb2\x82\x88\
-\x98\x88\xb8\xb5\xb5\xd5\x00\x28\xa6\x68\xc4\xcf\x8f\xf0\x1e\xa7\
-\xa1\xa1\xc1\x89\xa2\x48\x19\x63\x94\xe7\x79\xca\x5a\x2b\x46\xf8\
-\xfc\x78\x80\x85\x10\x36\x9f\xcf\x47\x52\xca\x48\x29\x15\xb5\xb6\
-\xb6\x06\x00\x02\x00\x3c\xdc\x83\x7b\x22\xe0\x34\x34\x34\xb8\x41\
-\x10\x38\xae\xeb\x3a\xc6\x18\xa5\xb5\xd6\xd6\x5a\xc9\xcc\x92\xb5\
-\x16\xce\xec\x63\x53\xaa\x71\x72\x92\x59\x8c\xab\x18\x44\x96\xa3\
-\x1d\x2d\xd9\x60\xdb\x9a\x0c\x85\xa1\x25\x22\x23\x84\x30\x61\x18\
-\x86\x52\xca\xc8\xf7\xfd\xc0\x71\x9c\xa0\xb5\xb5\x35\x0f\x20\x1c\
-\x2a\x1f\x35\xcc\x3b\x12\xb5\xb5\xb5\xae\x94\xd2\x55\x4a\xb9\x44\
-\xe4\x10\x91\x4e\x5c\xf1\xd3\x63\xd4\xa1\x27\x9e\x4b\xa9\x9a\x13\
-\xc8\x71\xe7\x90\x10\xc9\xf2\xd3\x1b\x39\xd8\xda\x2c\x07\xfe\x56\
-\xce\x74\xac\xf6\x37\x36\x3f\x1f\x2d\xb9\x67\x2d\x11\x85\x4a\x29\
-\x2d\xa5\x54\xb5\xb5\xb5\xb2\xb3\xb3\xd3\x07\x90\x1b\xec\xf9\xc1\
-\x6a\x8d\x00\x24\xaa\xab\xab\x13\x8e\xe3\xb8\x51\x14\x79\x4a\x29\
-\x27\x75\xcd\xbd\x67\xea\xc3\x8e\xbf\x81\x9c\xc4\xe1\xfb\x94\xd1\
-\x18\x61\xfd\xfc\xfa\x68\xe3\xbb\xbf\xcd\x3c\xf4\xb3\xd7\xa3\x28\
-\x0a\x94\x52\xf9\x30\x0c\xf3\x5d\x5d\x5d\x79\xc4\x22\xf4\x6b\x12\
-\x83\x09\x90\xa8\xae\xae\x4e\x6a\xad\x13\x52\x4a\x4f\x34\xcd\xaf\
-\x4f\x5c\x75\xc7\xad\xa2\x6a\xc2\x85\x43\xdc\x5f\x89\x60\xdb\xd5\
-\xb1\x3c\xb7\xf8\x8e\xbb\xec\x96\xf7\xdb\x8c\x31\xb9\x30\x0c\xf3\
-\xdd\xdd\xdd\x59\x0c\x88\x04\x39\xe0\x41\xb7\xb6\xb6\x36\xa1\x94\
-\x4a\x48\x29\x13\xe2\xd4\x45\xd3\xbc\xef\xff\xfc\x2f\x22\x51\x75\
-\x0a\x0e\x1c\xf2\x00\x40\xe4\x7a\x73\xe5\xfc\xb3\x16\x98\x4c\xd7\
-\x6b\xf4\xc5\xa6\x1c\x11\xc1\x71\x1c\xf6\x7d\x9f\x11\x8f\x14\x00\
-\xfa\x0b\x20\xea\xeb\xeb\x8b\x35\x9f\xc0\x91\x67\x36\x7a\x97\xdf\
-\xf4\x30\x69\xf7\x10\x46\x1c\x37\x07\x5a\x82\x54\x0d\x72\xde\xf1\
-\x67\x46\x5f\x6e\x79\x41\xb6\x7e\x99\x97\x52\xb2\xe7\x79\x9c\xcb\
-\xe5\xc2\xe2\x2d\x7d\x6b\x35\x51\x55\x55\x95\x52\x4a\xa5\x84\xe7\
-\xa5\x92\xbf\x7c\xea\x41\x4a\x56\x9f\x31\xa4\xc6\xcc\xb0\xf1\x9f\
-\xe1\xc7\x99\x7d\x08\x02\x40\x04\x08\x14\xfe\x19\x0a\x99\xf4\x6b\
-\x99\x5b\x17\x5d\x6b\xf3\xf9\x4c\x14\x45\x99\x74\x3a\x9d\x06\x90\
-\x2f\xe6\x01\x00\xa2\xae\xae\xae\x5a\x08\x91\x22\xa2\x94\x73\xc3\
-\x03\x97\x89\xd9\x47\xfc\x62\x60\x3e\x0c\x20\xb2\x8c\xd0\x32\xcc\
-\xfe\x62\x3d\x04\x24\x01\x5a\x10\x94\xa0\x41\xdb\xaa\xfd\xe4\xa3\
-\x5b\x83\xfb\xae\x7b\x9c\x99\x33\xd6\xda\x4c\x7b\x7b\x7b\x37\x00\
-\x2b\x0a\xbf\xab\x82\xc9\xd1\x98\x32\xab\x0a\xd3\xe7\x5e\x6f\x19\
-\xe8\x4d\x0c\xdf\x30\xd2\xa1\x45\xde\x54\x1e\x79\x00\x30\x0c\xe4\
-\x0b\x65\xf4\x0d\xc3\x32\xa3\x2f\x07\x4c\x9b\xf7\x63\x4c\x9c\x55\
-\x65\x8c\xd1\x51\x14\x29\x14\x2c\x40\x8f\x00\x9e\xe7\x69\xad\xb5\
-\x16\x97\xde\x7c\x21\x4b\x35\xb1\xd8\x8e\x0c\x33\x72\x11\x23\xb0\
-\x15\xc8\x7a\x08\x04\x36\x2e\xb3\x61\xee\xed\x13\xa4\x9a\x28\xae\
-\xb8\xe5\x02\xad\xb5\xf6\x3c\x4f\xa3\xaf\x00\xf5\xf5\xf5\xca\x18\
-\x23\xad\xb5\x92\x26\xcd\xba\xa0\xa8\x9a\xb1\x8c\xbc\x89\xdb\xfa\
-\x81\x06\x8b\x38\x22\x22\xdb\x1b\x09\x74\xf0\xb4\x0b\xad\xb5\xd2\
-\x18\x23\xeb\xeb\xeb\x7b\x04\x10\xc6\x18\xc1\xcc\x42\x34\xce\x49\
-\xb0\xeb\x1d\xc7\x60\x58\xb6\xf0\x0f\xa0\x5a\x1f\x0a\x81\x8d\xb9\
-\x30\x18\xec\x25\x8f\x13\x8d\x73\x12\xcc\x2c\x8c\x31\x02\x80\x28\
-\x4e\x68\x88\x99\x05\xce\xbc\xa8\x89\x21\x5c\xcb\x40\x78\x20\x56\
-\xfb\x10\x08\x6d\x1c\x01\x0c\xe1\xe2\xb4\x8b\x9a\x98\xb9\x67\x22\
-\xd7\x33\x17\x60\x66\x32\x75\x53\xa7\x50\xa1\xd3\x3b\xf0\xeb\xbe\
-\x17\x8c\xb8\x39\x0b\x22\xf0\xc4\x29\x93\xfb\x4c\xe3\xa9\xdf\x64\
-\x88\xb5\x93\x64\x3e\x30\xdb\xfc\x9e\x60\x81\xd8\xb4\x68\x2f\x89\
-\x3e\xfe\x47\xf4\xbd\x89\x41\xa2\xd2\xc9\x27\xe4\xe8\x1d\xb9\x05\
-\xc0\xd4\xdf\xfe\x8b\x21\xee\xad\x48\x2c\x98\x9c\xc2\xfa\x4b\xe7\
-\xe1\x92\xd9\xb5\x65\xcb\xb3\xbf\x00\xfb\x79\x79\x6b\x38\x1c\x5d\
-\xef\x61\xc9\x59\x33\x50\xe7\x2a\xfc\xe9\x8c\x69\xf8\xf5\x49\x93\
-\xa1\x47\x53\xda\x01\x1c\xfb\x0b\x50\xa1\xf1\x30\xb3\x4a\x63\xe9\
-\x39\x33\x51\xed\xc4\xd1\x4b\x44\xb8\xe6\xf0\x06\x2c\x3f\x7f\xce\
-\x98\x9a\x04\x50\xb1\x94\x7b\xd1\xe0\x4a\x2c\x5b\x38\x0b\x8d\x09\
-\x5d\xf2\xdb\x1b\x5f\x76\x23\x37\x46\x5f\x5e\xd1\x02\xa4\x94\xc0\
-\xd2\x73\x66\xa2\xa9\xc6\x2d\xf9\xed\xd1\x0d\x3b\x70\xe7\xaa\x4f\
-\xe3\x9e\x7d\x0c\xa8\x58\x01\x14\x01\x0f\x9f\x35\x1d\xc7\x1d\x54\
-\xba\xe4\xf8\xe2\xd6\x5d\xf8\xd1\x0b\x1f\x95\xe5\x3d\x15\x2b\xc0\
-\xef\x4f\x9b\x8a\x85\x53\xab\x4b\xae\x37\xb7\x74\xe2\x7b\x4f\xaf\
-\x41\x08\x1a\x73\xed\x03\x15\x2a\xc0\x1d\xc7\x35\xe2\xf2\xa6\xba\
-\x92\xeb\x5b\xda\x33\xf8\xf6\xb2\x66\x64\x58\x81\xb4\x0b\x28\x3d\
-\xfc\x42\xc8\x08\x50\x71\x02\xfc\xf0\xf0\x06\xfc\xe4\xa8\x89\x25\
-\xd7\x77\x66\x7c\x5c\xfc\xcf\x66\xec\x0e\x01\x72\x1c\x90\xe3\x82\
-\x54\x69\xc7\xb8\xb7\xa8\x28\x01\x2e\x9e\x55\x83\xbb\x4f\x9c\x54\
-\xb2\xa2\x93\x0e\x22\x5c\xf2\x44\x33\xb6\xa5\x43\x90\x76\x40\xda\
-\x05\x29\x67\xcc\xb5\x0f\x54\x90\x00\x67\x4c\x4a\xe1\xc1\xd3\xa7\
-\x41\x0c\x20\x15\x1a\x8b\xef\x3e\xf5\x3e\xd6\xec\xce\x16\xc8\x7b\
-\x71\xf8\x97\x81\x3c\x50\x21\x02\x1c\x55\xe7\xe1\x91\xb3\x67\xc0\
-\x95\x03\x8d\x29\xe3\xba\xe7\xd6\xe1\x3f\xdb\x3b\xe2\x5a\xd7\x1e\
-\xe0\x94\x8f\x3c\x50\x26\x01\x2e\x9a\x59\x03\x6f\x94\x8e\x6c\x46\
-\xc1\xe5\xd5\x38\x03\x3f\x51\x00\xb7\xbf\xf6\x31\x1e\xdb\xf8\x55\
-\x5c\xe3\x4e\x9c\xa8\x8c\xe4\x81\x32\x08\xb0\x68\x46\x0d\x16\x2f\
-\x98\x8e\x65\x0b\x67\xa1\xd6\xd9\xbb\xec\x1a\x5c\x89\x27\xce\x99\
-\x85\x49\xc9\xd2\xce\xec\x81\xe6\x4f\x70\xdf\xbb\x9f\xc6\xe4\xb5\
-\x1b\x77\x7a\xa2\xfc\x01\x3b\xa6\x1c\x8f\x98\xe0\xe2\xfe\xd3\xa7\
-\x42\x10\xe1\xd4\xc6\x14\x9e\x3d\x6f\x0e\xa6\x24\x87\xfb\xde\xda\
-\x8b\xa4\x22\x3c\xfe\xf5\x99\x38\xb4\xb6\xd4\xe5\x2d\xdb\xd8\x82\
-\x5b\x5e\xf9\xb8\xb7\xd6\x1d\x0f\x24\x4a\x23\xa4\x1c\x18\xb5\x00\
-\xb5\x5a\x60\xc9\xd9\x33\x50\xa5\x7b\x0b\x76\x44\x9d\x87\x17\x2f\
-\x68\xc2\xbc\x41\x48\xf5\x85\x24\x60\xf1\x82\x19\x38\x61\x62\xa9\
-\xcb\x7b\xfd\xb3\x36\x5c\xfd\xec\x3a\x58\xe5\xc4\x9d\x9e\xe3\x81\
-\xe4\xbe\x21\x0f\x8c\x41\x80\x4c\x64\xf1\x46\x4b\x77\xc9\xf5\xa9\
-\x29\x8d\xe7\xce\x9f\x83\x93\x0f\x1e\xfa\xab\xf9\xef\x4e\x9d\x8a\
-\x73\xa7\x95\xba\xbc\x0f\x77\x76\xe1\xb2\x27\xdf\x83\x2f\x54\x1c\
-\xf2\x8e\x07\x92\x23\x8b\xa8\xd1\x62\xd4\x02\x44\x96\x71\xfd\xcb\
-\x9b\xf0\xab\x95\x5b\xc1\x03\x2c\x69\x9d\x2b\xf1\xaf\x85\xb3\x70\
-\xe1\xf4\x52\x92\xb7\xcd\x6f\xc4\x15\x87\x94\xba\xbc\xcf\xba\x72\
-\xb8\xe4\x89\x66\x74\x59\x51\xe8\xf1\xcb\x63\x74\xf6\x84\x51\x0b\
-\x50\xfc\xe0\x70\xef\x9b\x9b\x71\xed\x73\xeb\x10\x9a\xfe\x8b\x69\
-\x09\x25\xf0\xb7\xb3\x66\xe0\xca\xb9\xbd\x64\xaf\x3e\xac\x1e\x37\
-\x1e\x5d\xea\xf2\xda\x72\x01\xbe\xb5\x74\x35\x5a\x7c\x1e\x57\xf2\
-\xc0\xf0\x3b\x44\xf6\x08\x22\x02\x1c\x07\x8f\xac\x6f\x41\x4b\x3a\
-\x8f\x25\x8b\xe6\xa3\xda\xed\xcd\x52\x0a\xc2\x6f\x4e\x9e\x82\xc9\
-\x49\x8d\xf5\xed\x79\xdc\x73\xd2\xe4\x12\x97\x97\x0b\x0d\xbe\xb3\
-\xec\x3d\xfc\xaf\x2b\x28\x84\xbd\x0b\xd2\xe5\x71\x79\x23\xc1\xa8\
-\x23\x20\x5e\x54\xd7\xf1\x10\xa5\x5d\xbc\xbc\xbd\x03\xe7\x3d\xf6\
-\x36\x5a\xd2\xf9\xfe\xf7\x11\xe1\xe6\x63\x0e\xc6\x9f\x17\x4c\x87\
-\x1c\x40\xca\x58\xc6\x95\xcf\xac\xc5\xdb\x3b\xd2\x3d\x16\x17\x65\
-\x74\x79\x23\xc1\xe8\x87\x41\xa2\x38\x54\x9d\xd8\x9d\x91\x76\xf1\
-\x41\x6b\x0e\x5f\x5b\xb2\x0a\x1b\x76\xa7\x4b\x6e\x1f\x48\x9e\x99\
-\x71\xe3\x8b\xeb\xb1\x7c\x5b\x6b\x4f\xd8\xef\x0b\xa3\xb3\x27\x8c\
-\xd9\x59\x90\xd2\xb1\x45\xd5\x71\xe8\x7e\x9e\x33\x58\xf8\xe8\x2a\
-\xbc\xbe\xbd\x6d\xd8\xe7\xee\x5d\xb9\x05\x8b\xd7\x7d\xd1\xc7\xe5\
-\x79\x20\x1a\x7f\x67\x5e\x96\x37\x92\x52\xf1\x90\xe5\x78\x20\xed\
-\xa0\xd3\x0a\x7c\x73\xe9\x6a\x2c\xdd\xd0\x32\xe8\xfd\x0f\xaf\xdd\
-\x8e\xbb\xdf\xda\xba\xcf\x5d\xde\x48\x50\xb6\xb7\x92\x94\x71\x2d\
-\x16\x22\x21\x10\x1a\x57\x2d\xff\x00\xf7\xbd\xb3\xb5\xdf\x67\xb6\
-\x15\x9b\x77\xe2\x86\x97\x36\x00\x8e\x53\x70\x79\xee\x3e\x73\x79\
-\x23\x41\x59\x65\x27\x21\x00\xb7\x20\x82\xe3\x80\xb5\x83\xdb\x5e\
-\xdb\x84\x9b\x5e\x5a\x0f\x63\x19\x6f\x7f\xd1\x81\x1f\x3c\xb3\x16\
-\x46\x39\x3d\xb3\xbb\x7d\x6d\x74\xf6\x84\xd2\xb7\x33\x8f\xa9\x17\
-\x26\x12\x60\xc7\x2b\x74\x66\x04\x06\xe1\xa1\xb5\x9f\xe3\x93\x8e\
-\x2c\x56\x7f\xd5\x89\x1c\xa9\x3e\x8b\x1a\xe3\x4c\x7e\x90\x35\xc4\
-\x7e\x25\x10\x00\x2c\x8d\x7d\xd3\x13\x11\xc5\xc3\x19\x28\x16\x93\
-\x08\x2f\x7c\xda\x0e\x48\xd9\x7f\xac\x1f\x67\x14\x37\x54\x99\x3e\
-\xd7\xfa\x09\x40\x26\x0a\x09\x14\x5b\xdb\xb1\x0e\x47\x44\x3d\x86\
-\x86\x41\x20\x50\x2c\x80\x76\xe2\xe5\xac\xf1\x06\x33\x88\x08\x14\
-\x85\xfd\x36\x50\xf7\x08\x40\x44\x4c\xe9\x8e\x4e\x02\xc7\x91\x50\
-\x8e\x97\xf6\x15\x81\x08\x24\x64\x59\x97\xb3\xf6\x06\xf1\x8e\x08\
-\x06\x65\x3a\xbb\xe2\xa2\x11\x17\xaf\x73\xcf\x85\xcd\x6b\xb6\x13\
-\x18\x82\x18\x54\x86\x35\xf7\x22\x48\xe9\x1e\xc3\xb4\x3f\xc8\x13\
-\x17\x38\x81\x81\xcd\xcd\xdb\x85\xe8\xd9\x05\xc0\x02\x85\xbd\xf6\
-\x44\x64\xb1\xea\xe9\x1d\x1c\xf8\x3b\xc1\x0c\x09\x5b\x5e\x11\xa4\
-\x1c\x77\x97\x07\xc4\xe4\x25\x2c\xc0\x0c\x0e\xf2\x3b\xb1\x6a\xc5\
-\x0e\x22\xb2\x05\x11\x62\x01\x94\x52\x86\x88\xac\x94\x32\x10\xad\
-\x5f\xac\x8a\xb7\x7f\x32\x24\x1b\x10\x57\xfa\x96\x89\xa1\x41\x6c\
-\x21\xd9\xa0\xc8\x47\xb4\xb5\xac\x94\x52\x06\x44\x64\x95\x52\x06\
-\x05\x01\xb0\x6b\xd7\xae\xc8\xf7\xfd\xd0\x18\x13\x88\xe6\x17\x57\
-\xb0\xb5\xdc\x23\x82\x35\x10\x36\x2a\xcb\x67\xa8\x71\x03\x33\x84\
-\x8d\x20\x6d\x2f\x79\xb6\x96\x45\xf3\xf3\x2b\x8c\x31\x81\xef\xfb\
-\xe1\xae\x5d\xbb\x22\xa0\xd7\x08\x45\x52\xca\x28\x8a\x22\xdf\xbe\
-\xf2\x8f\x0d\xd4\xb9\x73\x25\xd8\xa2\x98\x84\x35\x90\x26\x00\x55\
-\xba\x10\xcc\x20\x1b\x41\x9a\x00\xc2\x1a\xf4\xe5\x40\x9d\x3b\x57\
-\xda\xff\x2e\xdd\x18\x45\x91\x2f\xa5\x8c\x50\x38\x57\x54\xf4\xa0\
-\xb6\xa6\xa6\x46\x49\x29\x25\x00\x57\x64\x3a\x3e\xb7\x87\x9f\x72\
-\x2e\x11\xf5\xac\x4a\x10\x00\xc1\x16\x64\x0b\xcd\x82\x0b\x9d\x0a\
-\x03\xfb\x6d\x3f\x38\x33\x88\x2d\xc8\x5a\x08\x1b\xc5\x89\x6d\xc9\
-\x9a\x03\x5b\x9b\x93\x4f\xdf\x7f\x27\x5a\xb6\x7d\x2e\xa5\xec\x90\
-\x52\xe6\xb3\xd9\x6c\xbe\xaf\x00\xc8\x66\xb3\xd0\x5a\x0b\x29\xa5\
-\xc2\x57\x9f\x84\xd4\x38\xb3\x83\x27\x4e\x3f\x15\x83\x9c\x13\xa0\
-\x9e\x17\x1b\x88\xfd\x9c\x8a\x15\x32\x64\x87\xcd\xcc\xe2\xa3\xd7\
-\x7f\x83\x17\xfe\xfe\x0e\x80\xb6\x30\x0c\xbb\xdb\xda\xda\xf2\x28\
-\xf8\xa1\xbe\xb3\x10\xe3\xfb\xbe\x4c\x26\x93\x44\x44\x5a\xae\x7f\
-\xeb\x4b\x9e\x7d\xb4\x45\x6d\xc3\xb1\x60\xa6\x62\x5b\x3a\xc0\x12\
-\xd3\xa7\x1f\x2d\x56\x4b\xee\x7a\x12\x40\x27\x80\x76\xc7\x71\xb2\
-\x99\x4c\xa6\x67\xd5\x66\xe0\x34\xcc\x78\x9e\x47\x51\x14\x09\x00\
-\x52\xae\x79\xf9\x63\x9e\xdc\xd4\x69\xeb\x26\xcd\x07\x20\x2b\x80\
-\xd0\x88\x13\x5b\x1b\x88\x4d\xab\xff\x20\xff\x7a\xfb\x13\xc6\x98\
-\x2e\x29\x65\xbb\x31\xa6\x73\xf7\xee\xdd\xfd\xce\x0d\x0d\x14\x80\
-\x73\xb9\x9c\x75\x5d\x97\x95\x52\xc2\x5a\x4b\x6a\xfd\x9b\xdb\x38\
-\x0a\xde\xe7\x49\x4d\x73\xa1\x74\xfd\xe0\x71\x56\x61\xc8\xa7\x37\
-\x89\x57\x1f\xbf\x4b\xaf\xf8\xe3\x1b\xc6\x98\x6e\x22\xea\xf4\x7d\
-\xbf\xbd\xa3\xa3\x23\x83\x01\x87\x2a\x87\x72\x26\xba\xaa\xaa\x6a\
-\x82\xe7\x79\x13\x00\x54\x03\x48\x91\xd6\xc9\xe8\x1b\xd7\x9d\x66\
-\xe7\x1c\xbd\x08\xc9\xda\xa3\xf6\xcb\xf2\xcd\x70\x60\xb6\xc8\x76\
-\x7e\x28\x36\xaf\xf9\xb7\x5a\xfe\xe0\x9b\x1c\x86\x59\x00\x19\x00\
-\xdd\xf9\x7c\xbe\x23\x9d\x4e\x77\x60\x90\xf3\x83\xc3\x59\x33\x55\
-\x55\x55\x35\x21\x95\x4a\x55\x33\x73\x95\x31\xc6\x23\xa2\xa4\x10\
-\x42\xdb\xa6\x63\x0e\x32\x47\x2e\x38\xca\xd6\x1d\x3c\x03\x6e\xb2\
-\x9e\xa5\x72\x81\xf1\xde\x63\x48\x4c\x26\xf2\xe1\x67\xdb\x44\xfb\
-\xce\xcf\xe4\xba\x57\x3f\x14\x5b\xd6\xee\x16\x42\x84\x00\xb2\xd6\
-\xda\x3c\x11\xa5\x33\x99\x4c\x77\x81\xfc\xa0\xc7\x69\xf7\x54\x68\
-\xaa\xab\xab\xab\x29\x1e\xa5\x11\x42\x78\xd6\x5a\x47\x08\xa1\xad\
-\xb5\x5a\x4a\xa9\x46\x90\xc7\xbe\x06\x0b\x21\x22\x63\x4c\x68\xad\
-\x0d\x85\x10\x81\xb5\x36\xdf\xe7\x68\x4c\x17\xfa\xb4\xf9\x81\x18\
-\x69\xe1\xbd\x9a\x9a\x9a\xa4\xe3\x38\x6e\x18\x86\x9e\x52\xca\x29\
-\x6e\x39\x2f\xee\xba\x2e\x07\x93\x51\x80\x0b\xb3\x3a\x26\x22\x1b\
-\x45\x51\xa0\xb5\xce\x07\x41\xe0\x77\x75\x75\x65\x51\x38\x18\x35\
-\x1c\xf6\xa6\xe0\x02\xf1\x59\x62\x1d\x45\x91\x34\xc6\xa8\x54\x2a\
-\x25\xf6\xe7\x09\xf2\xe2\xc9\xf1\x4c\x26\x63\xa5\x94\x91\x94\xd2\
-\xb6\xb5\xb5\x15\x0f\x4d\x8f\x68\x12\x33\x9a\x82\x13\x7a\x8f\xd1\
-\x8b\xc6\xc6\x46\xb2\xd6\xee\x17\x01\x84\x10\xbc\x63\xc7\x0e\x46\
-\x4c\xb6\x78\x6c\x7e\xaf\xbc\xfa\xff\x01\x38\xef\x48\x2f\xad\x9f\
-\xbd\x22\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\xd2\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x01\xfe\
-\x50\x4c\x54\x45\x00\x00\x00\xff\xb3\x00\xff\xb6\x00\xff\xb9\x00\
-\xff\xbd\x00\xff\xdb\x00\xff\xb8\x00\x00\x74\xff\x00\x73\xff\xff\
-\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\
-\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\
-\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\
-\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\
-\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\
-\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\
-\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\
-\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\
-\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\
-\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb2\x00\xff\xb3\x00\xff\xb3\
-\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\
-\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\
-\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\
-\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\
-\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\
-\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\
-\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\
-\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\
-\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\
-\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\
-\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\
-\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xb3\x00\xff\xc0\x00\xff\xb8\
-\x00\xff\xb6\x00\xff\xb6\x00\xff\xb8\x00\xff\xbf\x00\x00\x74\xff\
-\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\
-\x74\xff\x00\x74\xff\x00\x73\xff\x00\x73\xff\x00\x74\xff\x00\x74\
-\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\
-\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\
-\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\
-\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\x00\x74\xff\
-\x00\x74\xff\x00\x74\xff\x00\x74\xff\xff\xb3\x00\x00\x74\xff\xff\
-\xff\xff\x4a\x39\x1b\x8d\x00\x00\x00\xa7\x74\x52\x4e\x53\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x09\x30\x5e\x69\x5f\x33\x0a\x4f\xb2\
-\xee\xfe\xef\xb3\x55\x19\x97\xf6\xdb\xa5\x95\xa6\xdd\xf7\x98\x1a\
-\x18\xb0\xe0\x74\x1e\x03\x20\x76\xe1\xb1\x04\x8f\xcf\x38\x3c\xd1\
-\x94\x05\x43\xf0\xe7\x40\x44\xea\xf2\x49\x02\x9b\x87\xa1\x2f\x5d\
-\x13\x1b\xda\xec\x31\x47\x7a\xf4\xeb\xfa\x53\x3a\xc5\x0c\x1f\xf9\
-\xfb\xb9\xfc\xa9\x7c\xe2\xca\x2b\x42\x01\x2a\x8b\xac\x32\x14\x02\
-\x10\xc8\x4c\xab\x26\xd6\x73\x06\x4e\x5c\xf3\x11\x7b\xf5\x6e\xba\
-\x60\xbb\x6f\x51\xcb\xdc\x59\x6d\xaf\xe8\x1c\x05\x17\x23\x24\x18\
-\x05\x16\x83\x97\x96\x98\x58\x39\x94\x95\x94\x3e\xf5\xa9\x04\x76\
-\x3f\xf8\xda\x6e\x66\x28\x17\x5e\x69\xfa\xc0\x09\xe2\x8b\x87\x3a\
-\xf2\x0d\x60\x79\x78\xc0\x99\x29\x12\x00\x00\x00\x01\x62\x4b\x47\
-\x44\xa9\x27\x0f\x06\x04\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\
-\x76\x1c\x00\x00\x76\x1c\x01\xa7\xc2\x78\xea\x00\x00\x00\x07\x74\
-\x49\x4d\x45\x07\xe5\x0c\x10\x07\x02\x08\x26\x16\x66\x3a\x00\x00\
-\x01\xa3\x49\x44\x41\x54\x38\xcb\x63\x60\xa0\x22\x60\xe4\xe4\xe2\
-\xe6\xe1\xe1\xe5\xe3\x67\xc4\x21\x2d\x20\x28\x24\xbc\x7c\xf9\x72\
-\x11\x51\x31\x4e\x2c\x4a\x18\xc5\x25\x24\x85\xa5\xa4\x65\x64\x64\
-\xe5\x84\xe5\x15\x14\x31\x54\x30\x2a\x29\x2f\x57\x51\x55\x53\x67\
-\x64\x54\xd7\xd0\xd4\x5a\xae\x2d\x8e\xa6\x82\x51\x47\x77\xb9\x9e\
-\x3e\x13\x58\x94\x91\xd9\xc0\x70\xb9\x91\x31\xaa\x0a\x46\x13\x53\
-\x33\x73\x46\xa8\x18\x23\xa3\x85\xa5\x95\x35\x8a\x02\x46\x1b\xdb\
-\xe5\x76\x2c\x70\x21\x46\x56\xbb\xe5\xf6\x0e\x8e\x4e\x08\x35\x8c\
-\xce\x2e\xae\x6e\x08\x79\x1d\x77\x0f\x4f\x2f\x17\x6f\x1f\x24\x05\
-\xbe\x92\x7e\xfe\x08\x05\x01\x72\x81\x41\xcb\x97\x07\x23\x79\x85\
-\xd1\x22\x24\x54\x1d\xa1\x80\x33\x2c\x7c\xf9\xf2\x88\x48\x24\x57\
-\x30\x46\x05\x09\x22\x39\x9b\x31\x3a\x26\x36\x8e\x8b\x11\x59\x41\
-\xbc\xa9\x61\x02\xb2\xb3\x19\x13\x8d\x19\x51\xf8\x49\xc9\x81\x29\
-\xd8\x63\x00\xe6\xf3\xb0\xe5\xa9\xfc\x78\x55\xa4\xa5\x7b\x67\xe8\
-\xc0\x02\x2a\x33\x2b\x2a\x1a\x3d\xa8\x19\xb3\x73\x72\x3c\x92\x20\
-\x41\x9d\x9b\x97\x9f\x9c\x84\x6e\x1c\xa3\x4e\x81\x69\x48\x21\x6f\
-\xa4\xa2\x62\x64\x51\x71\x48\x4e\x49\x22\x66\x74\xea\x94\x96\x09\
-\x0b\xbb\x96\x97\xbb\x0a\x0b\xeb\x55\x18\x63\x4b\x10\x8c\x8a\x95\
-\x55\x52\x66\xd5\xe5\x82\x25\x35\x8c\x38\xdc\xcb\x56\x5b\x57\xdf\
-\xd0\xd8\xc4\x8c\x26\xcc\xde\xdc\xd2\xda\xd6\xde\xc1\xce\xce\xde\
-\xd9\xd5\xdd\xd3\xd3\xdd\x06\x07\xad\x2d\xcd\xec\x20\x05\xbd\x7d\
-\x2b\x56\xac\xe8\x9f\xc0\xce\x3e\x71\x05\x1a\xe8\xeb\x05\x2b\x98\
-\x34\x79\xca\xd4\x69\xd3\xd9\x39\xd8\x67\xcc\x9c\x85\x0c\xa6\x4e\
-\x99\x3c\x09\xa2\x60\xf6\x9c\xb9\xec\x98\x2e\x62\x9f\x3b\x67\x36\
-\xb1\x0a\x26\xcf\x9b\xbf\x00\x0b\x98\x3f\x0f\x6a\xc5\xc2\x45\x2b\
-\x70\x80\x45\x0b\xc1\x0a\x16\x2f\x59\xba\x0c\x2b\x58\xba\x64\x31\
-\x16\xab\x49\x06\x00\x8f\xd7\xa4\x14\xd4\x8f\xd6\xe9\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\
-\x00\x32\x30\x32\x31\x2d\x31\x32\x2d\x31\x36\x54\x30\x37\x3a\x30\
-\x32\x3a\x30\x38\x2b\x30\x30\x3a\x30\x30\x94\x39\x05\x20\x00\x00\
-\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\
-\x79\x00\x32\x30\x32\x31\x2d\x31\x32\x2d\x31\x36\x54\x30\x37\x3a\
-\x30\x32\x3a\x30\x38\x2b\x30\x30\x3a\x30\x30\xe5\x64\xbd\x9c\x00\
-\x00\x00\x20\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\
-\x68\x74\x74\x70\x73\x3a\x2f\x2f\x69\x6d\x61\x67\x65\x6d\x61\x67\
-\x69\x63\x6b\x2e\x6f\x72\x67\xbc\xcf\x1d\x9d\x00\x00\x00\x18\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\
-\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\
-\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\
-\x61\x67\x65\x3a\x3a\x48\x65\x69\x67\x68\x74\x00\x35\x31\x32\x8f\
-\x8d\x53\x81\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\
-\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\
-\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\
-\x31\x36\x33\x39\x36\x33\x38\x31\x32\x38\x70\x7a\x0c\xf6\x00\x00\
-\x00\x13\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\
-\x65\x00\x31\x33\x34\x30\x37\x42\x42\x63\x42\xa6\x00\x00\x00\x00\
-\x5c\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\
-\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\
-\x2f\x35\x36\x2f\x4b\x46\x4e\x6d\x55\x67\x76\x2f\x33\x32\x38\x34\
-\x2f\x75\x70\x64\x61\x74\x65\x5f\x72\x65\x6c\x6f\x61\x64\x5f\x73\
-\x79\x6e\x63\x5f\x72\x65\x66\x72\x65\x73\x68\x5f\x72\x65\x74\x72\
-\x79\x5f\x69\x63\x6f\x6e\x5f\x32\x30\x38\x31\x38\x34\x2e\x70\x6e\
-\x67\x2f\x84\x20\x59\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x04\x04\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x03\xa6\x49\x44\x41\x54\x58\x85\xed\
-\x96\x4b\x4c\x5c\x65\x14\xc7\x7f\xdf\xbd\x17\xe6\x75\x87\x29\x8f\
-\x42\x81\x29\x25\x69\x48\xa5\x50\x9b\x18\x4d\xb4\x91\x85\x24\xc4\
-\x6a\xaa\xc6\x85\x98\x48\x24\x71\xa1\x0b\x23\x2b\x63\xba\xa9\x26\
-\xb8\x37\x31\xa9\x6e\xea\x0e\x65\x21\xae\x4c\x4c\xd0\x8c\x62\x23\
-\xf4\xb1\xd2\x28\x2f\x53\x49\x3b\x45\x98\x0e\x2d\x05\x86\xb9\x73\
-\xe7\x01\xf7\x1e\x17\xf3\x80\x48\x0b\x4c\x74\x57\xfe\xab\x2f\xdf\
-\xe3\x9c\x5f\xce\x39\xdf\xf9\x3e\x38\xd0\x81\x1e\x75\xa9\xdd\x16\
-\x23\xe3\xe3\x2d\x88\x7e\x52\x21\x26\xe8\x65\x9a\x76\x10\x94\x85\
-\x72\x66\x7a\xba\xba\xe6\xf7\x0d\x20\x22\xea\xc7\x89\x6b\x6f\x6a\
-\xf0\xbe\x08\xa7\x94\x52\xbb\x42\xee\x25\x11\x11\xa5\x98\x04\x3e\
-\xe9\x7e\xf6\x99\x2f\x95\x52\xf2\x50\x80\x48\x24\x12\x52\x5e\xf3\
-\x6b\x05\xcf\xff\x17\xa7\xbb\xe8\x07\x37\x63\xbd\xde\xd3\xd3\x93\
-\xd8\x01\x30\x35\x35\x55\x19\x5f\x59\xff\x59\x29\x75\x06\x00\xc7\
-\x41\x4d\xff\x06\x73\xb3\xa8\x94\x05\xc8\x4e\x73\xdb\x54\xd9\xdc\
-\xc2\xa1\xee\xb3\x78\x9a\xc2\xa0\x69\x00\x88\x52\x64\xb3\x39\xd6\
-\xd6\x12\x64\x73\xb9\xfc\x9c\xc8\xd5\x23\x35\x55\xcf\x75\x76\x76\
-\xe6\x00\x8c\xa2\x81\xf8\xca\xfa\x87\x25\xe7\xcb\x77\xd1\x86\x3e\
-\x47\x8b\x2f\xe2\x35\x0c\x74\x6d\xf7\x2c\xf8\x5e\x7c\x95\xda\xb7\
-\xde\x25\x9d\xcb\x11\x34\x4d\x32\x99\x2c\x00\x5e\xaf\x87\xa4\x65\
-\x51\x57\x5b\xcd\xd2\xdd\x65\x96\xef\xaf\xa0\x94\x3a\x73\x67\x75\
-\xfd\x23\xe0\x42\x29\x02\xdf\x8d\x8f\x57\xfb\xd0\xff\x06\x15\x20\
-\x6d\xa3\x7f\x3a\x48\x6d\x26\x45\x8d\xcf\x8b\xb6\x47\x09\xa8\xc7\
-\x9f\x40\xff\xe0\x63\x12\xeb\x49\x6e\xcf\x2f\x70\xfa\xd4\x49\xa2\
-\xf3\x0b\x00\xb4\xb6\x84\xf9\x7d\x72\x86\x63\x2d\x61\x42\x55\x41\
-\x6e\x45\xe7\x49\x5a\x29\x80\x54\x9a\xcd\xa3\xe7\xba\xba\x56\x35\
-\x00\x1f\x15\x2f\x81\x0a\x00\xa8\xcb\xa3\x34\x6e\x64\xa8\xf3\xfb\
-\xf6\x74\x0e\xa0\x9d\x7b\x8d\x1d\x75\x2a\x80\x6c\x4b\x99\x08\x4a\
-\x29\xea\x0f\xd7\x15\x67\x02\x1e\x57\x7f\x19\xa0\x90\x2c\x79\xaa\
-\xb8\x52\xf5\xe7\x1f\x54\x79\x2a\xf7\x74\x5c\x8a\xc0\xf1\x13\xfb\
-\xde\xeb\xf7\xfb\xb6\xc0\x95\x7a\x72\x0b\x40\x49\x09\xed\x90\x9d\
-\xdc\xb7\x41\x00\xa7\x50\x70\xfb\x91\xeb\x38\xa5\xb1\x20\x87\x4b\
-\x00\xae\xbb\x55\xe2\x1e\x33\x58\x16\xc0\x9d\xa5\x25\x00\x74\x5d\
-\xc7\x30\xf2\xcd\xca\x30\x74\x0c\xc3\x28\x8d\xf5\xc2\xf8\xde\xfd\
-\x95\x2d\x18\xd7\x95\x12\x80\x95\xb1\xdd\xe2\x42\xaa\xb5\xad\x2c\
-\x80\x1b\xd7\x26\x10\x11\x82\x66\x80\x8e\xf6\x7c\x3a\xc2\xcd\x8d\
-\x84\x9b\x1b\x01\xe8\x68\x3f\x41\xd0\x0c\x20\x22\xcc\xdd\xbc\x59\
-\x3a\x97\xca\x66\x9c\x12\xc0\x9a\x95\xbc\x25\x85\xa2\x59\x7e\xba\
-\x1b\x29\x23\xac\xc1\x5f\xaf\x33\x36\x31\x81\xb3\x2d\xbc\xff\x96\
-\xe3\x38\x5c\xbe\x72\x05\x4d\xcb\x47\x48\x44\x58\x5d\x4f\x44\xa1\
-\xd0\x07\xec\x74\x6a\xcc\x4a\xdb\x17\x82\xfe\x00\xd9\x86\x26\x62\
-\x2f\xf4\xd2\x34\x3a\x82\x72\xdd\x87\x1a\x2d\xea\xf4\xc2\x1c\xa3\
-\x57\x7f\xe1\xab\x58\x8c\xc7\xda\xda\xa8\x0e\x85\x4a\xb7\x42\x44\
-\x58\x4d\x24\xb8\x31\x37\x47\x43\x5d\x3d\x35\xa1\x1a\x00\xac\xb4\
-\x4d\x3a\x9b\xfe\x09\x0a\x7d\x40\x44\xd4\xa5\x91\x6f\xa6\x5b\x1b\
-\x9a\xda\x0d\x3d\x4f\xe9\x59\x8a\x51\x77\x7d\x8c\xc0\xed\xbf\xd0\
-\xd3\xf6\xae\xaf\x96\xab\x14\x93\xcd\xc7\x99\x6d\x3c\x46\xc2\x6f\
-\x22\x4a\x03\x11\x0c\xc3\xa0\xba\x2a\xc4\xd1\xe6\x30\x66\xc0\x04\
-\x60\xd3\x71\x88\x2e\xc5\x66\x63\x33\xd3\x9d\x83\x83\x83\x6e\xc9\
-\xee\xc5\xa1\xa1\x1e\xbf\xd7\xff\x7d\xb8\xfe\x88\x56\x84\xf8\xbf\
-\xb5\xe9\x38\x2c\xdc\x8b\xbb\x76\x3a\x77\x76\xa0\xff\x8d\x08\x14\
-\xaf\x21\x30\xd0\xdf\x1f\xb1\x73\x99\xf3\xd1\xf8\xa2\x24\xed\x14\
-\x22\xbb\xf7\xfe\x72\x24\x22\x24\xed\x14\xd1\xf8\xa2\xd8\xd9\xcc\
-\xf9\xa2\x73\x78\xc0\x73\xfc\xd9\xf0\x70\x1f\xa8\x8b\x95\x86\x51\
-\x6d\xfa\xfc\x78\x2a\x2a\xf3\x1d\xb1\xdc\x57\x59\x04\x57\x84\xec\
-\x46\x0e\x2b\x6d\x93\xdb\xdc\x5c\x05\x19\x78\xaf\xaf\x6f\x78\xfb\
-\xb6\x07\x5a\xfd\x62\x64\xa4\x26\xbb\xb1\xf1\x0e\xc2\x2b\x40\x07\
-\x60\x96\xfb\x2f\x90\x7c\x08\x2d\x60\x1a\xc5\xb7\x9e\x8a\x8a\x4b\
-\x6f\xf7\xf6\xae\xec\x75\xee\x40\x07\x3a\xd0\xa3\xa7\x7f\x00\x4d\
-\x9d\x6d\xf1\xd6\x8f\x70\x1e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x05\x30\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x01\x1a\x50\x4c\x54\
-\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x26\x92\x1b\x4a\x00\
-\x00\x00\x5c\x74\x52\x4e\x53\x00\x01\x18\x25\x17\x5a\xc1\xc0\x57\
-\x15\x5d\x1e\x20\x5e\xc2\x1c\xaa\x12\x36\x22\x1f\x0e\xa7\xe2\xe0\
-\xe1\xe3\xa6\x0c\xfa\xef\xfe\xfd\xe5\xe4\xfc\xee\xde\xf3\xda\x7f\
-\xfb\xa1\x65\x6b\xa0\xd4\x69\x78\x77\xf2\xd5\x6e\xf6\xd0\x5c\x66\
-\x95\xd7\x93\xe6\x6c\xf5\xcd\x6d\x8f\xc5\x46\xbf\xdc\x50\xa9\x67\
-\xa2\x75\x68\xdf\xec\xe8\x0b\x06\x1d\x3b\xc6\x05\x83\x11\xdd\x4a\
-\x4d\x14\x13\xc9\x21\x07\x79\x00\x00\x00\x01\x62\x4b\x47\x44\x5d\
-\x9d\xdf\x30\x01\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\
-\x00\x00\x1d\x87\x01\x8f\xe5\xf1\x65\x00\x00\x01\x1c\x49\x44\x41\
-\x54\x38\xcb\x63\x60\x00\x03\x46\x26\x66\x74\xc0\xc2\xc8\x80\x04\
-\x58\xd9\x30\x00\x3b\x07\x92\x3c\x27\x1b\x17\x37\x0f\x2a\xe0\xe6\
-\x65\xe7\x44\x28\xe0\xe1\xe3\x61\x40\x07\x28\x62\x23\x44\x01\xbf\
-\x00\x3f\x7e\x05\x82\x42\xc2\xdc\x28\x40\x44\x14\x45\x81\xa8\x98\
-\xb8\x84\xa4\xb8\xa4\xa4\xa4\x38\x90\x10\x97\x02\x12\x52\xd2\x32\
-\x22\x48\x0a\xb8\x25\x63\x62\x64\xe5\xe4\x63\x14\x14\x95\x94\x63\
-\x54\x54\xd5\x62\x62\x62\x24\xf9\xb9\xd1\x14\xa8\x6b\x68\xc6\x68\
-\x69\xeb\xe8\xea\xe9\x1b\x18\x1a\x61\x53\x60\x6c\x22\x6b\xca\x65\
-\x26\x69\x6e\x61\x69\x65\x6d\x83\x55\x81\xad\x9d\x1a\x97\xbd\x3a\
-\xab\x83\xa3\x93\xb3\x0b\x36\x05\xae\x6e\xb6\x02\xee\x1e\x1e\x9e\
-\xea\x26\x5e\xde\x3e\xd8\x14\x68\x2a\xa9\xfa\xca\xfb\xd9\x28\xc4\
-\xa8\x49\xd8\x61\x38\x52\x54\x1a\xe4\x4d\xa0\xf7\x40\xde\x94\x94\
-\x02\x61\x69\x7f\x11\x52\x02\x8a\x70\x50\xa3\x45\x56\x00\x3f\x37\
-\x77\x60\x50\x30\x4e\x05\x21\xa1\x3e\x92\x92\x12\x7e\x7c\x61\xb8\
-\x14\xf0\x87\x03\xbd\x11\xa3\x18\x81\xcb\x3e\xb0\xaf\x63\x94\x22\
-\x19\xf0\x2a\x40\x95\xc7\x54\x80\x26\xcf\x10\xc5\xce\x8b\xc8\x7a\
-\x22\x41\x36\x8a\x68\xf2\x0c\x0c\x1c\xec\x7c\x88\x6c\xeb\xc4\x16\
-\x81\x2e\x8f\x96\xfd\xa3\x91\x64\x00\xfe\x55\x34\xbc\x2e\x00\x08\
-\xd2\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\
-\x65\x61\x74\x65\x00\x32\x30\x32\x30\x2d\x30\x33\x2d\x31\x33\x54\
-\x31\x32\x3a\x33\x36\x3a\x33\x33\x2b\x30\x30\x3a\x30\x30\xd7\x6c\
-\xc0\xef\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\
-\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x30\x2d\x30\x33\x2d\x31\x33\
-\x54\x31\x32\x3a\x33\x36\x3a\x33\x33\x2b\x30\x30\x3a\x30\x30\xa6\
-\x31\x78\x53\x00\x00\x00\x46\x74\x45\x58\x74\x73\x6f\x66\x74\x77\
-\x61\x72\x65\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\x69\x63\x6b\x20\
-\x36\x2e\x37\x2e\x38\x2d\x39\x20\x32\x30\x31\x39\x2d\x30\x32\x2d\
-\x30\x31\x20\x51\x31\x36\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\
-\x77\x2e\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\
-\x67\x41\x7b\xe2\xc8\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\
-\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\
-\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\
-\x65\x69\x67\x68\x74\x00\x35\x31\x32\xc0\xd0\x50\x51\x00\x00\x00\
-\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\
-\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\
-\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\
-\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\
-\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\
-\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x35\x38\x34\x31\x30\
-\x32\x39\x39\x33\x3a\x67\xb6\x52\x00\x00\x00\x13\x74\x45\x58\x74\
-\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x37\x2e\x39\x39\
-\x4b\x42\x42\x67\xa9\x98\x70\x00\x00\x00\x50\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\
-\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x49\x48\
-\x59\x51\x52\x6b\x57\x2f\x32\x32\x33\x36\x2f\x66\x69\x6c\x65\x5f\
-\x6c\x6f\x67\x5f\x66\x6f\x72\x6d\x61\x74\x5f\x74\x79\x70\x65\x5f\
-\x69\x63\x6f\x6e\x5f\x31\x33\x34\x37\x30\x34\x2e\x70\x6e\x67\x85\
-\xd4\x19\x53\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\xe5\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x01\x47\
-\x50\x4c\x54\x45\x00\x00\x00\x37\x71\xc8\x87\xaa\xde\x88\xab\xde\
-\x30\x74\xcf\x88\xaa\xde\x76\x9e\xd9\x55\x86\xd0\x4f\x82\xcf\x77\
-\x9e\xda\x08\x42\xf7\x39\x6f\xc6\x37\x71\xc8\x37\x71\xc8\x37\x71\
-\xc8\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\
-\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\x37\
-\x71\xc8\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\x37\x71\
-\xc8\x37\x71\xc8\x37\x71\xc8\x87\xaa\xde\x87\xaa\xde\x87\xaa\xde\
-\x87\xaa\xde\x88\xab\xde\x4e\x82\xce\x87\xaa\xde\x87\xaa\xde\x87\
-\xaa\xde\x87\xaa\xde\x87\xaa\xde\x87\xaa\xde\x88\xaa\xde\x55\x87\
-\xd0\x37\x71\xc8\x37\x71\xc8\x87\xaa\xde\x87\xaa\xde\x87\xaa\xde\
-\x8e\xaf\xe0\x3e\x76\xca\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\x88\
-\xab\xde\x37\x71\xc8\x37\x71\xc8\x4e\x82\xce\x3d\x75\xca\x36\x70\
-\xc8\x37\x71\xc8\x35\x6f\xc7\x55\x86\xd0\x37\x71\xc8\x37\x71\xc8\
-\x37\x71\xc8\x88\xaa\xde\x88\xaa\xde\x37\x71\xc8\x37\x71\xc8\x8b\
-\xad\xdf\x8b\xad\xdf\x87\xaa\xde\x87\xaa\xde\x87\xaa\xde\x87\xaa\
-\xde\x87\xaa\xde\x87\xaa\xde\x37\x71\xc8\x37\x71\xc8\x37\x71\xc8\
-\x37\x71\xc8\x37\x71\xc8\x35\x6f\xc7\x36\x70\xc8\x3e\x76\xca\x37\
-\x71\xc8\x37\x71\xc8\x37\x71\xc8\x3d\x76\xca\x8d\xae\xe0\x37\x71\
-\xc8\x87\xaa\xde\x87\xaa\xde\x87\xaa\xde\x37\x71\xc8\x37\x71\xc8\
-\x36\x70\xc8\x87\xaa\xde\x88\xaa\xde\x58\x88\xd1\x88\xab\xde\x58\
-\x89\xd1\x66\x93\xd5\x36\x71\xc8\xff\xff\xff\x39\x77\x9b\xd8\x00\
-\x00\x00\x63\x74\x52\x4e\x53\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x08\x3e\x67\x69\x6a\x52\x14\x13\x51\x07\x87\xf2\xfb\
-\xb5\x1f\xb4\x88\xf0\x7f\x78\x96\x13\x7a\x97\x96\x95\xd4\x59\xfc\
-\x69\xed\xe0\xe1\xe1\xf3\xfa\x90\x7b\x1a\x1e\x1c\x97\xb3\xe3\x41\
-\x69\xb7\x7e\xd5\x9e\x40\x40\x65\xa7\x91\x97\x22\x96\x1e\xf3\x89\
-\x65\x66\x6a\x58\xfe\x7d\xfd\x12\x66\x3d\x20\x79\x8d\x64\x3d\x99\
-\x7c\x23\xb8\x9d\x1c\x8b\xfb\x57\x98\x7b\xfc\x9a\xdd\xf9\x00\x00\
-\x00\x01\x62\x4b\x47\x44\x6c\xcc\x01\x30\x3b\x00\x00\x00\x09\x70\
-\x48\x59\x73\x00\x01\x3a\xf6\x00\x01\x3a\xf6\x01\x3a\xb1\x57\x3a\
-\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe4\x09\x0a\x0c\x12\x02\xbc\
-\x4c\x99\xba\x00\x00\x01\xaa\x49\x44\x41\x54\x38\xcb\xad\x93\xd7\
-\x5b\xc2\x30\x14\xc5\x1b\xdc\xda\x21\x42\x01\x11\x15\xb0\x0e\xca\
-\xb2\x56\x05\x27\x20\x43\x19\x2a\xa2\xe2\xc0\x9d\x06\x10\xfe\xff\
-\x77\xdb\x84\xda\x20\xfa\xf9\xa0\xf7\x2d\x27\xbf\xaf\xcd\x3d\xe7\
-\x5e\x86\xf9\x87\x02\x2c\xc7\x0b\xd3\xf6\x19\x40\x49\x0e\xa7\x20\
-\xf0\x1c\x8b\x25\x20\xba\xdc\x10\x42\xcf\xac\xf7\x93\x00\xde\x39\
-\x8f\x2e\xb9\x7d\xa2\x21\x01\x6e\x1e\xe2\x5a\xb0\x80\x45\xa2\xcc\
-\x73\x18\xe0\xc9\x09\xfa\x01\x63\x0b\x04\x97\x24\x49\x5a\x5e\xd1\
-\x88\xc4\x63\x40\xa0\x80\xd5\x35\xa4\x57\xb3\xd5\x03\x84\x01\x20\
-\x84\x90\x1c\x8e\x44\x63\x7d\x80\x3d\x4e\x4e\xeb\x04\x50\x36\xd4\
-\xcd\x2d\xa2\xc4\xed\x18\x70\x6c\x43\x4d\xd3\x60\x22\x09\x98\xa1\
-\x9d\x76\x7b\x67\x48\x7f\x77\x02\x03\xbb\x0e\xd2\xa7\x77\x6f\xff\
-\x3d\x76\x70\x08\xd8\x54\x3a\xd3\xe9\x64\xd2\x29\x76\x38\x79\x94\
-\xf5\x67\x17\x72\x66\x5f\x23\xf9\x66\xb4\x30\x2a\xfa\x8e\x21\xec\
-\x76\x21\x3c\x3e\x11\x41\xbf\x97\x36\x09\x45\xd4\x31\xd3\x0f\xb3\
-\xff\xaf\xc0\xb8\xe9\x87\xd9\x7f\x3f\x20\x2b\xc5\x8c\x05\x64\x4a\
-\xa1\x72\x25\x60\xa3\x01\x84\xda\x9d\xae\x79\xdf\xed\xb4\x11\x3a\
-\x3d\xa3\x80\xe0\xf9\x20\x80\x24\x0a\xa8\x56\xca\xa1\x12\xfd\x8b\
-\xa2\x22\xd3\x00\x89\x90\x7a\xe4\xc5\xb8\x1a\x19\x04\x6a\x56\x9b\
-\xb5\xb1\xef\x00\x3c\x38\x86\x51\x6e\x97\x38\x51\x88\x36\xf3\x23\
-\xe4\x62\x12\x5c\x5e\xe9\xbe\x5e\x73\x53\x62\xad\x6e\x58\x5d\xaf\
-\xb1\x53\x37\xb7\xb1\xf7\xfd\xbb\x7b\x12\x85\x63\x0e\x7f\xf7\x4b\
-\x58\x46\x7e\x0d\x1c\x16\x70\xf6\xe2\x7e\x78\x54\x37\x14\x84\x42\
-\x36\x06\x3c\xf5\xe2\x76\xd2\x03\xa3\xc5\xa2\x91\xb0\x4c\x00\x3f\
-\xfc\x66\xa2\xb4\x56\xd3\x18\xb7\xe7\x97\x01\xa0\xd7\xbf\xb6\xb2\
-\xac\xcf\xeb\xab\x52\xa5\x00\xfe\xa7\xb1\x7f\x33\xfd\xc0\x80\xe8\
-\xc3\x8b\xd3\xc8\x59\x40\xae\x11\xb7\x16\xe7\xd7\xd5\xfb\x6b\x7d\
-\x00\x52\x4a\xa5\x6c\x52\x5e\x7b\x82\x00\x00\x00\x25\x74\x45\x58\
-\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\
-\x30\x2d\x30\x39\x2d\x31\x30\x54\x31\x32\x3a\x31\x38\x3a\x30\x32\
-\x2b\x30\x30\x3a\x30\x30\xed\xec\xea\x4c\x00\x00\x00\x25\x74\x45\
-\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\
-\x32\x30\x2d\x30\x39\x2d\x31\x30\x54\x31\x32\x3a\x31\x38\x3a\x30\
-\x32\x2b\x30\x30\x3a\x30\x30\x9c\xb1\x52\xf0\x00\x00\x00\x20\x74\
-\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x68\x74\x74\x70\
-\x73\x3a\x2f\x2f\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\
-\x6f\x72\x67\xbc\xcf\x1d\x9d\x00\x00\x00\x18\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\
-\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\
-\x3a\x48\x65\x69\x67\x68\x74\x00\x35\x31\x32\x8f\x8d\x53\x81\x00\
-\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\
-\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\
-\x03\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\
-\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x35\x39\x39\
-\x37\x34\x30\x32\x38\x32\x7c\x83\xb4\x6c\x00\x00\x00\x13\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x31\x33\
-\x34\x33\x35\x42\x42\x72\x73\xdd\x80\x00\x00\x00\x63\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\
-\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\
-\x63\x75\x44\x66\x42\x42\x55\x2f\x32\x35\x35\x36\x2f\x63\x6f\x6d\
-\x6d\x75\x6e\x69\x74\x79\x5f\x70\x65\x6f\x70\x6c\x65\x5f\x63\x6f\
-\x6e\x6e\x65\x63\x74\x69\x6f\x6e\x73\x5f\x77\x6f\x72\x6b\x5f\x67\
-\x72\x6f\x75\x70\x5f\x69\x63\x6f\x6e\x5f\x31\x35\x33\x30\x38\x32\
-\x2e\x70\x6e\x67\x01\x01\xf7\x72\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x03\x7f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x03\x21\x49\x44\x41\x54\x58\x85\xbd\
-\x97\x41\x4e\x54\x41\x10\x86\xbf\xaa\xd7\x83\x23\x90\x88\x71\xa1\
-\x61\xe3\x96\xb8\x80\xb0\x74\x61\xdc\x78\x08\x2e\xc0\x05\x48\x74\
-\xe5\xc2\x03\x18\x17\x1e\x42\x6e\xc0\xde\x0d\x89\x37\x90\x84\x03\
-\x20\x10\x18\x02\x0c\x0c\xef\xbd\x2e\x17\xfd\xba\x5f\xcf\x40\x64\
-\x1e\x66\xe8\x64\xe8\x19\x5e\xa6\xfe\xbf\xfe\xaa\xfa\xbb\x47\xe8\
-\xb0\xd6\x37\x7e\x2c\xaf\xaf\xbe\xd9\x34\xc5\x79\xa0\xf2\xe0\x81\
-\x0a\xf0\xde\x73\x7c\x78\xb2\xf7\xf3\xfb\x87\x6d\xa0\x9e\x36\xa6\
-\xeb\x44\x60\x75\x65\xf3\xa2\xec\x7f\x39\x1c\x94\xe1\x1f\x06\x46\
-\x7c\x5b\x60\xf3\x2f\x6b\x60\x07\x38\x99\x09\x01\x53\x75\x47\x83\
-\x92\xcb\xeb\x00\x2b\x22\x89\x80\x08\x14\x3d\x0a\xa0\xd7\x25\x66\
-\x27\x02\x3e\x40\x21\x80\x49\xc8\x5e\x24\xfc\x91\xf0\xa8\xf3\xea\
-\x44\xa0\x22\x80\x9a\xdc\x05\x2c\xb3\x27\xe0\xfd\x44\xd6\x13\xc0\
-\x32\x73\x02\x11\x4f\xa4\x45\xcb\xc9\x3c\x46\x09\x52\xc6\x59\x09\
-\x02\xa1\x07\xe1\x3f\xac\x04\xad\x0a\xed\xfe\x28\x3d\x50\x65\xe0\
-\x09\x38\x29\x21\xa0\xf6\xef\x00\xff\x4b\xc0\xa3\x80\x20\xda\x76\
-\x5d\x6c\xc8\xa4\x46\xc7\x25\xeb\x1b\x3f\x96\xd7\x56\x57\x36\x45\
-\xd5\xb5\xb6\x9a\x5b\x6c\xb3\xa3\x14\xfd\xfe\xfb\xc1\x41\xfd\xae\
-\xf4\x64\x59\x37\xf8\x22\xe8\xa2\xe3\x7a\x78\xf0\xcd\x2d\x2c\x0d\
-\x41\xd1\x88\xa2\x80\x0f\x1b\x1a\xf6\xab\x93\xd3\xbd\x5f\x5f\xdf\
-\x6e\xbb\x60\xaf\xf3\x5f\x8e\x06\x25\x10\x9c\x2d\xd6\x39\x7e\x6e\
-\x6b\x5c\x53\x45\xf0\x2c\xeb\x54\x92\x2b\x4f\x5f\x5f\x6e\xc9\x35\
-\xed\xb3\xa8\x54\xc8\x37\x4d\xcb\xd3\xe7\xaf\x6a\x60\xc7\x19\xb8\
-\xc3\xc6\x5e\x25\x73\xb7\xbc\xc6\x22\x8d\xec\x32\x01\xae\x2d\xb8\
-\x01\xde\x00\xb3\x18\x20\xf9\x84\x28\xa8\x0a\x2a\x41\x01\x41\x40\
-\xac\x00\x7a\xce\x67\xf5\xc8\x4d\x86\x89\x0c\xdb\x9a\x07\xb0\xba\
-\x86\xba\x34\x3c\x46\x10\x45\xd0\x48\x48\x43\x32\x81\xa0\x21\x26\
-\xe0\x2d\xc5\x51\xb1\x28\x2b\xae\x6a\x90\xd3\xc1\x92\x98\xb7\xcd\
-\x85\x80\x89\x50\x96\xc6\x4d\xed\xf1\x3e\x04\x57\x15\xa4\xc8\x81\
-\x9b\xf7\xe9\x73\x4c\x60\x7c\x5c\x45\xc0\x4b\x98\x18\x17\x67\xdb\
-\x32\xbc\x38\xd3\x91\xc7\x70\xe4\x19\x95\x06\x0d\x80\x4e\x82\xeb\
-\xed\x3d\x12\xca\x09\xe4\x6e\x69\x4d\x87\x06\x05\xd2\x4c\x8c\x4b\
-\x3f\x2a\x8d\xe1\xc8\x63\x12\x6b\x98\x01\x4c\x80\x06\x42\x8a\x4a\
-\xfe\x3c\x2b\xa1\xb6\x63\x1a\x7a\xcd\x47\x05\xfc\x44\xf6\xa1\x99\
-\x2e\x2e\x2b\xca\x1a\xb4\xc8\xb2\x89\x01\xb3\x2c\x03\xb8\x26\x35\
-\x6e\x11\xcc\x4a\x91\x97\x37\x7a\x96\x3b\x3d\x1e\xec\xd9\xc2\xab\
-\xda\x3d\x91\x02\x11\xbc\xc1\xd5\xb5\x47\x17\x95\xfe\x24\xd8\x9c\
-\xa3\x3e\xaf\x92\x12\x09\x2c\x82\xf7\x0b\x4c\xda\x29\xf0\x99\x47\
-\xc4\x04\xad\x21\x50\x5e\x5e\xec\x03\xa5\x00\x05\xf0\x8c\x29\x6e\
-\x32\x6b\x1f\x77\x3f\x71\xf3\x62\x4b\x0b\x41\x0b\x0d\xa0\x45\x50\
-\x40\x0b\xc1\x7a\xb0\xfb\xf9\xf5\x0a\x30\xb8\x2f\x16\x50\x02\x67\
-\x8e\x70\x81\x9c\xea\x0e\x57\x2c\x2c\x0d\x7d\xd5\xce\xbe\xe8\xf8\
-\x8b\xd0\xd9\x03\xe0\xcf\x34\xf1\xa0\xe3\x59\x00\x8c\xf7\x83\x8e\
-\x13\x69\xbd\x77\xfa\xd5\xe9\x2b\x4a\x36\x28\xb1\xae\x4d\xb7\xc7\
-\x86\xeb\xba\x1e\xa6\xc0\x5d\x2f\xcd\x0c\x6c\x56\x04\x94\xa6\x8b\
-\x73\x15\x52\x29\x1e\xe1\x4e\xd8\x9c\x24\x63\x33\x7d\xdb\x6a\x3b\
-\x47\xec\xb6\x84\x2c\xdb\xfc\xb8\x4d\x47\xee\x0c\x09\xa8\x46\x99\
-\x5b\x4b\x1d\xfb\x6d\x30\x6b\x05\x34\x03\xca\x6f\xe5\xed\x45\xb9\
-\x3b\x83\x4e\x04\xca\xc1\xc9\x6f\xfa\x52\x33\x07\xd6\x03\xef\xa0\
-\x76\x46\xa5\x46\x25\xc6\xe8\xea\x7c\x9f\xe0\x70\x53\xaf\xae\x94\
-\xef\xb3\xed\x12\x38\xa3\xc3\xcf\xf3\xbf\xc2\xc2\xf3\xa7\x55\x97\
-\x2f\xa3\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\xf0\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x01\x92\x49\x44\x41\x54\x58\x85\xed\
-\xd6\xbf\x4a\x24\x41\x10\xc7\xf1\x0f\xfe\x85\x4b\xe4\xe4\xc0\x40\
-\xc4\x40\x03\xd1\xcc\x07\x30\x10\x2e\x50\x50\xf0\x2d\x14\x11\x3c\
-\x38\x13\x7d\x0c\x05\xe1\x02\xe1\x82\xf3\x1d\xc4\x27\x10\xbd\xcb\
-\x0c\x45\x10\x31\xd2\x7d\x02\xf7\xd6\xa0\x7b\x61\x1c\xe7\xdf\xc2\
-\x3a\x93\xec\x0f\x9a\x61\xaa\xba\xe6\x5b\x53\xd3\xd5\xd3\x7c\xd4\
-\x46\x86\xad\x48\x8b\x98\x2b\x99\xb3\x80\x3d\x4c\x94\x3d\xec\x0b\
-\xee\x31\x9a\xe1\x5b\xca\x89\x39\xc4\xcf\x82\x67\x2e\xe3\x05\x1d\
-\xdc\xe0\x6b\xde\xc4\x2d\x3c\xc4\x89\x77\x58\x4f\xf9\xff\x60\x26\
-\x71\xff\x0d\x67\x68\xc7\xf1\x0b\x93\x05\xf0\xee\x28\x4c\xa2\x5b\
-\x81\xb1\x94\x7d\x04\x2d\xec\x66\xc4\x1c\xe1\x20\xc3\x9e\x84\xb7\
-\x71\x55\x35\x89\xcd\x0c\xdb\x6a\x0c\xbc\xc8\xf0\x2d\x62\xbe\x04\
-\xbe\x8d\x61\x9c\xa7\x92\x28\x5c\x13\xe3\x58\xc3\x29\x9e\x62\xd0\
-\x2b\x2e\x85\x05\x35\x9b\x13\x97\x86\xef\x24\x7c\xc3\xde\x57\x62\
-\x2f\x0f\x3e\x8a\x1f\xb8\xc6\x7f\xef\xbf\x61\x07\xcf\xf8\x1d\xdf\
-\xbe\x2a\x5c\xbc\x6f\x47\xff\x8b\xd0\x1d\xa5\x9a\xc6\x49\x0c\x7a\
-\xc4\x4a\x7c\x93\xb4\x7a\x85\x2f\x57\x81\x77\x35\x23\x54\xe2\x38\
-\xc7\xff\xa9\xf0\xae\xfe\xe2\x7b\x09\xbc\x23\x74\x51\xb2\x1d\xfb\
-\x02\x87\x7d\x1f\x37\xa8\xac\x3e\xef\xc4\x64\x27\x85\xd5\xdf\x17\
-\xb8\x1e\xe0\xc9\x4a\xf4\x0d\x9e\x56\x19\x3c\x39\xb2\xe0\xe9\x1d\
-\xb3\x56\x38\x61\xdb\x6e\x04\x3e\x2f\xfc\xb8\xda\xf1\x3a\x37\xd4\
-\x23\xfc\x52\xb5\xf2\xb5\x84\x8e\xf9\x97\xb2\x8f\x09\x3b\xac\x78\
-\x1d\x57\x51\xfd\x28\x7b\x52\x67\x55\xc1\x9f\x01\x27\xfc\xca\x1b\
-\x83\x57\xd6\x00\x3e\x80\x0f\xe0\xb5\xc0\x09\xc7\xac\xc6\xe0\x84\
-\xe3\x71\x63\x70\x98\xc2\x6d\x53\xf0\xb2\x24\x6a\x81\xe7\x25\x51\
-\x2b\x3c\x99\xc4\x8d\xb0\x30\x6b\x81\xbf\x01\x1d\xb9\x32\x8e\x1c\
-\xf9\x01\x57\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\xee\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x01\x56\x50\x4c\x54\
-\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xff\xff\xff\xcb\x14\x99\x11\x00\x00\x00\x70\x74\
-\x52\x4e\x53\x00\x0f\x1f\x1e\x0e\xa8\xe3\xe1\xa6\x1d\x39\xe4\xe0\
-\xfb\xfc\xe7\xe6\x72\x28\xfe\x75\x29\x07\x42\x9d\xf6\x30\xa5\xf1\
-\xa3\x2f\x4e\xdc\xec\x74\xa0\xdb\x4c\x3d\xa1\x2b\x20\xab\xe2\x3a\
-\x04\x9b\x0c\x9f\x19\xed\x0d\x31\xee\x32\xda\x03\x9e\x3b\x2a\x01\
-\x27\xa2\x4d\xdf\x8c\x3c\xc0\x48\x09\x33\x84\xde\xa4\xf2\xc5\x87\
-\x17\x10\x24\x5b\x88\xb8\xf5\xa7\x08\x41\x90\xd6\xf9\xac\xb0\xe9\
-\xf7\xfd\x49\x0a\x02\x18\x47\x7d\xef\xae\xc7\xaa\x7e\x54\x22\x80\
-\x11\xbe\x45\x61\x14\x77\xb1\x00\x00\x00\x01\x62\x4b\x47\x44\x71\
-\xaf\x07\x5c\xe2\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\xec\x38\
-\x00\x00\xec\x38\x01\x71\x2b\xca\x38\x00\x00\x01\x67\x49\x44\x41\
-\x54\x38\xcb\xbd\x92\xd7\x5b\x82\x50\x18\xc6\x11\x91\x21\x0a\x89\
-\x0b\x51\x4b\xd2\x86\x99\x99\xa2\x89\x2d\xcd\xb6\x65\xd3\xf6\xde\
-\xbb\xce\xff\x7f\x15\xe7\x20\x29\x89\x5e\xfa\x5e\x7d\xcf\x79\x7f\
-\xcf\x37\x0f\x86\xf5\x57\x36\xdc\xae\x09\x27\xba\xf9\x84\x83\xa4\
-\x34\x91\x74\x37\xc2\x4e\x01\x24\xca\x6e\x9d\x9e\x71\xb2\x3a\xc0\
-\x3a\x99\xce\x32\x5a\x7a\x17\xeb\xd6\x01\x37\xeb\xea\x2c\x63\xa4\
-\x37\xd4\x51\xa6\x09\x70\x3c\xcf\xf5\x02\x06\x3c\x82\xe0\xe1\xbb\
-\x03\x5e\x0f\x0c\x7d\x5e\x2b\x00\x87\x00\xef\x87\xa1\x1f\xa6\xa0\
-\x70\x93\x1d\x08\x8a\x21\x33\x10\x12\x83\x81\x96\x2f\x85\x23\xa8\
-\xb3\xb6\x12\x00\x44\xa2\x83\x86\x3f\x14\x03\x94\x28\xc3\x47\x7e\
-\x58\x10\x7c\xa8\x49\x39\x4e\x82\xc4\x88\xee\x8f\x92\xdc\xd8\x78\
-\xf2\xff\x98\x49\x69\x82\x4b\x4d\x42\x3f\x1d\x06\x53\x19\xab\x45\
-\x11\xd3\x20\x9e\xd6\x80\x6c\x22\x27\x69\xab\xa6\xd1\x25\x0d\x91\
-\xb4\x82\x61\xf9\x5c\x22\x8b\x80\x42\x1e\x1e\x03\xfd\x05\x43\xe8\
-\x58\x33\x85\x22\x04\xd4\x28\x2c\x61\xa1\x8c\x08\x4a\x2a\x0c\x66\
-\x29\x2e\x3a\x37\x0f\x2f\x6e\x6b\xf7\x17\x16\xb9\x94\x53\x0f\xcb\
-\x31\x50\x59\xaa\x2a\x84\x63\x79\x45\x6d\xba\xab\x6b\xeb\x45\xb0\
-\x51\xfe\x5b\xd4\x66\x0d\xd4\xb6\xe8\x1a\x90\xb7\xeb\xd8\xce\x6e\
-\x75\x6f\xff\x20\x07\x0e\x1b\x52\x2b\xdd\xd1\xf1\xc9\xe9\x19\x1a\
-\xef\x1c\xbf\xb8\xbc\xf2\x82\x6b\xaa\x74\x73\x6b\xea\xe8\xee\xfe\
-\xe1\xf1\x09\x02\xcc\x73\xea\xe5\xf5\xed\xfd\x23\x6d\xf9\x67\xe5\
-\xcf\x3a\xf6\xc5\x28\x16\x26\x94\xd2\xf8\xfe\x51\xb1\x5e\x32\x8f\
-\xd9\x3f\xfd\x02\xa9\xc0\x5f\x1c\xe8\xee\x7e\x69\x00\x00\x00\x25\
-\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\
-\x32\x30\x31\x39\x2d\x30\x35\x2d\x31\x33\x54\x31\x38\x3a\x35\x38\
-\x3a\x31\x34\x2b\x30\x31\x3a\x30\x30\x61\x23\x72\x41\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\
-\x00\x32\x30\x31\x39\x2d\x30\x35\x2d\x31\x33\x54\x31\x38\x3a\x35\
-\x38\x3a\x31\x34\x2b\x30\x31\x3a\x30\x30\x10\x7e\xca\xfd\x00\x00\
-\x00\x46\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x49\
-\x6d\x61\x67\x65\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x37\x2e\x38\
-\x2d\x39\x20\x32\x30\x31\x39\x2d\x30\x32\x2d\x30\x31\x20\x51\x31\
-\x36\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\
-\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\x41\x7b\xe2\xc8\
-\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\
-\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\
-\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\
-\x00\x35\x31\x32\xc0\xd0\x50\x51\x00\x00\x00\x17\x74\x45\x58\x74\
-\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\
-\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\
-\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\
-\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\
-\x54\x69\x6d\x65\x00\x31\x35\x35\x37\x37\x37\x30\x32\x39\x34\xcc\
-\xcb\x34\xda\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\x75\x6d\x62\
-\x3a\x3a\x53\x69\x7a\x65\x00\x31\x30\x2e\x36\x4b\x42\x42\xb7\x06\
-\x95\x65\x00\x00\x00\x73\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\
-\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x70\x65\x63\x48\x79\x64\x77\
-\x2f\x31\x39\x33\x33\x2f\x69\x63\x6f\x6e\x66\x69\x6e\x64\x65\x72\
-\x2d\x66\x72\x6f\x6e\x74\x2d\x63\x61\x6d\x65\x72\x61\x2d\x63\x61\
-\x6d\x65\x72\x61\x2d\x73\x65\x6c\x66\x69\x65\x2d\x70\x68\x6f\x6e\
-\x65\x2d\x70\x6f\x72\x74\x72\x61\x69\x74\x2d\x34\x35\x39\x33\x31\
-\x35\x32\x5f\x31\x32\x32\x32\x36\x34\x2e\x70\x6e\x67\x47\x2b\x27\
-\xeb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\x90\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\x62\x4b\x47\
-\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\x70\
-\x48\x59\x73\x00\x00\x44\xb8\x00\x00\x44\xb8\x01\xf7\x37\xd7\x7a\
-\x00\x00\x05\x12\x49\x44\x41\x54\x58\xc3\xad\x97\xdd\x6f\x54\x45\
-\x18\xc6\x7f\x33\xe7\xec\xc7\xa1\xdd\xd2\x96\x6e\xad\x2d\x50\x04\
-\x9a\x42\xe5\xab\x46\x0c\xf8\x85\x10\xac\x36\x35\xf1\xd6\xa8\x11\
-\x2f\x0c\x17\xc6\x44\x13\xf4\xaf\x50\x63\xa2\x37\xdc\x90\x48\xe0\
-\xc6\x1b\x6f\x08\x54\x34\x01\x4b\xf8\x10\xab\xf2\xb1\x48\xc1\x62\
-\x21\x94\xb4\xb6\x50\xba\xdd\xdd\xee\xf7\x99\xf1\x62\xce\xb6\x5d\
-\x96\x6e\xb7\x29\x4f\x72\x2e\x76\xce\xec\xbc\xcf\x79\xde\x99\x77\
-\x9e\x57\xb0\x00\xda\x7a\x23\x00\x16\xd0\x0e\xbc\x09\xbc\x04\x6c\
-\x00\x5a\x81\x2a\x6f\x5a\x02\xb8\x0b\xdc\x04\xce\x02\x27\x81\x1b\
-\x80\x3b\xd8\xbd\xb9\xec\xfa\xa2\x82\xc0\x2f\x00\xfb\x80\x37\x80\
-\x55\xde\x58\x39\xb8\xc0\xb0\x47\xe2\x7b\xa0\xbf\x1c\x91\x12\x02\
-\xeb\x7a\x07\x90\xe4\x01\x9a\x81\xcf\x80\x0f\x81\xf0\x42\x4a\xcd\
-\x83\x71\xe0\x30\xf0\x0d\x30\xaa\x94\xcd\xbf\x3d\x1b\xe7\x27\xd0\
-\x76\x22\x02\x12\xd0\x6c\x07\xbe\x02\x5e\x29\xa7\x52\x85\xd0\x40\
-\x1f\x70\x40\xc0\x5f\x0a\xc1\xad\xee\x4d\xa5\x04\x3c\xc9\x01\xba\
-\x80\x6f\x31\x39\x7f\x92\x18\x00\x3e\x01\x4e\x01\x14\x52\x22\x00\
-\xda\x8f\x5f\x41\x49\x09\xb0\x1d\x38\x02\xb4\x6b\x40\x6b\x90\x4b\
-\xfd\xfe\x62\x5c\xc7\xa4\xb4\xbf\x90\x0e\x09\x14\x82\xb7\x00\x5f\
-\x16\x82\xaf\xf0\x59\x6c\x0a\xf9\xe7\xd5\x5f\xcf\x79\x16\x81\x0e\
-\x2f\x46\x8b\x94\x79\x00\xa4\x91\x5e\x4b\xe0\x53\x60\x17\x80\xd2\
-\x9a\x97\xeb\x1c\x3e\x5e\x5d\x8b\xef\x11\x09\x0a\x41\x43\xb6\x45\
-\x38\x60\x53\xeb\xb3\x10\x02\x54\xe5\x4c\x76\x99\x58\x42\xb6\xf5\
-\x46\xb0\xcd\x98\xd8\xe1\x49\x33\x13\x24\x20\x05\x7e\x29\x8a\x14\
-\x50\x1a\xea\x03\x36\xaf\x37\x2d\x67\x5b\x7d\x15\x21\xdb\x22\xa3\
-\x14\x83\xf1\x34\x3f\x8f\x44\xb9\x3d\x9d\x41\x88\x99\xcc\x9a\x1c\
-\x3e\x1e\xfb\x40\xff\x08\xfc\x26\x31\xfb\xfe\x03\x16\x38\x6a\x1a\
-\x68\x08\xda\xec\x5f\xff\x14\x5d\x2d\xf5\x4c\x63\x33\x94\x81\x71\
-\xd7\x62\x6b\x7d\x88\x8f\xda\x9a\x58\x53\x15\x24\x3d\x9d\x26\x93\
-\x48\x92\x49\x24\xc9\x67\x73\xf3\x2d\xd7\x08\xbc\x07\x48\x1b\xd8\
-\x88\x29\x32\x65\x83\x4b\xa0\xa7\xb9\x8e\xf5\x35\x0e\x67\x27\x73\
-\x8c\xe7\x14\xda\xfb\xd6\x6b\x71\xc5\x9a\xa0\xc5\xce\x86\x1a\x2e\
-\x5d\xfe\x87\x58\x22\x0d\x40\x4d\xb8\x96\xfa\x95\x8d\xf3\x2d\xdb\
-\x03\x1c\x94\xcc\x56\xb8\xf9\x09\x78\xd2\x77\xd6\x57\x71\x2b\xa5\
-\x18\xcf\x29\x04\xa6\x24\x26\xf3\x8a\x1b\xb1\x0c\xbf\x4f\x66\x68\
-\xaa\x76\x78\xa6\x2e\x84\x9b\x77\x51\xae\x8b\x56\xaa\xdc\xb2\xab\
-\x81\xd7\x24\xa6\xb6\x97\x2d\xaf\x1a\x4d\x43\xc0\x47\xc8\x67\xf1\
-\x20\x6b\x16\x15\x40\x22\xaf\xb8\x97\xcc\x92\x51\x9a\x58\xde\xc5\
-\x45\x50\xeb\x04\x2a\x3d\x19\x16\xf0\xa2\xc4\x5c\x2c\x65\x21\x80\
-\x8c\xab\xc8\x6b\xf0\x4b\x33\x56\x08\x9e\x72\x0d\x21\x4b\x08\x84\
-\x00\x57\x2f\xea\x60\x6e\x93\x9e\x14\xe5\x09\x08\xc1\x44\x26\x43\
-\x2c\x35\x45\x6b\xd0\x26\xe3\x2a\x86\xa7\x33\x33\xc1\x01\x56\x39\
-\x36\x6e\x2e\xcf\xf0\xc3\xb8\x77\x12\x2a\xc2\x6a\x09\x54\x2f\x38\
-\x4d\x43\x97\x75\x91\x4e\xf7\x07\x1a\xec\x34\x61\x9f\xc4\x27\x04\
-\xb6\x00\x47\x0a\x36\x54\xfb\x79\x36\x14\xe0\xef\x87\x31\x46\xe2\
-\x49\x64\xe5\xd7\x47\xb5\xbd\x40\x5c\x04\xf0\xdc\xd0\x05\x3a\x1f\
-\xf4\xe2\x30\xc5\x8a\xda\x3b\xb4\xd6\x1d\xa0\xa1\xb1\x8e\xb4\x52\
-\xf8\x85\xc0\xa7\x5d\x22\xf7\xa3\x9c\x1f\x9b\x42\x69\x6d\xfe\x54\
-\x61\x26\x6c\x8c\x99\x78\xac\x0a\x16\xd0\x39\x74\x81\x1d\x91\x63\
-\x4c\x4c\x45\x39\x71\x67\x82\x54\x57\x13\xc7\x9a\xc7\xa8\xf6\x65\
-\x71\xd2\x19\xa6\x92\x69\x86\xc6\xa3\x4c\x06\x03\xf8\x43\xcb\x10\
-\x8b\xbb\x3c\xe3\x36\xc6\xc9\x74\x14\x8f\x0b\x5c\x34\x56\xe4\x0c\
-\x3b\x2f\x1f\x83\x78\x94\x58\x3c\x41\x7f\xf3\x5e\xfa\x9d\x77\x49\
-\xa5\x1d\xd2\xe3\xf7\x19\x1b\xbc\x87\x52\x0a\x34\x84\xd7\x3c\x4d\
-\x60\x11\xc9\xf7\x70\x57\x62\xac\x53\xa9\xfc\x5a\x93\x1b\x19\x82\
-\xe8\x03\x62\xd1\x38\x7f\x86\xb7\xf0\x53\xeb\x1e\x46\x26\x52\xe8\
-\x6c\x16\xe9\xed\x7a\x29\x04\x52\x2e\xf2\xbb\x67\x71\xc5\x06\xce\
-\x01\x6f\x53\x54\x0b\x34\x96\xb4\x70\x76\xf6\x30\x70\xfd\x36\xff\
-\x25\xf2\x9c\x6c\x79\x95\x78\x3c\x87\x9d\x9c\xa4\x66\x45\x88\xa5\
-\xfb\x14\x5c\xe0\xbc\xc4\x78\xb7\xe1\x47\xdf\x0a\xad\x49\x2e\x6f\
-\xe4\xcc\xde\xfd\x9c\xdd\xf1\x0e\x09\xcb\x41\x42\xf1\x65\xb3\x34\
-\xdc\x05\x7e\x95\x20\x06\x3c\x12\x25\x10\x5a\x93\xb7\xfd\xe4\x6d\
-\x3f\x68\x3d\xc7\x03\xcc\x3a\x81\x82\x71\xd1\x26\x6f\xde\xef\xd9\
-\x77\x65\x70\x5c\xc3\x80\x04\xad\x30\xc6\x71\xbc\x84\x00\xe6\x5a\
-\x76\x2c\x81\x63\x4b\xef\xb1\x08\x4a\x69\x1e\xcb\x9a\x19\x0f\x5a\
-\x82\x80\x35\x3b\xc7\xb1\x2d\x82\x96\x24\xf0\xf8\xfd\x31\x06\x1c\
-\x15\xa0\x6c\x8f\xea\x45\x04\x87\x81\x2f\x0a\x33\x14\x9a\xb6\x2a\
-\x1f\x5f\x6f\x68\x20\xb7\xb6\x96\x5c\xe7\x4a\x43\x4a\x08\xfc\xcb\
-\x02\xa0\x35\xd9\x8e\xf0\xcc\x95\xef\x0b\xfa\xb1\x6c\x8b\xec\xba\
-\x5a\x94\xe7\x4e\x6c\xbf\x8d\xf6\xf9\x38\x38\x1c\xe5\x6a\x2c\x3b\
-\xd7\xde\x1d\x02\xdd\x4f\xe1\xd0\x7a\x86\xb4\x19\x38\x0a\xec\xd6\
-\xc0\x5a\xc7\x47\xe7\xf2\x80\xf1\x6c\x88\xa2\xf2\x5a\x08\xba\xd0\
-\x18\x40\xda\x55\x9c\x9b\x4c\x33\x91\x73\x0b\x4a\x9c\x02\xde\x07\
-\x46\x07\xbb\x37\x1b\x47\xa4\xb0\x91\xe4\x47\x80\xcf\x81\x23\x02\
-\x3a\x86\x52\x39\x06\x93\xd9\x25\xef\x34\x81\x39\xaa\x5e\xf0\x6b\
-\x9e\xca\xa3\x72\xce\x7b\x8c\x0a\x57\x0b\x3f\xf7\x00\xdf\x51\x52\
-\x9c\x96\x8c\x6b\x18\x5b\xde\xa7\x81\x5b\x9e\x2d\x2f\x10\x61\xb0\
-\x7b\x0b\xde\xbe\x3d\x85\x69\xc5\xfa\x9e\x50\x60\x0d\x9c\xc6\xd8\
-\xbe\x3e\xe6\x04\x2f\x52\x60\x46\x89\x5f\x22\x98\xce\xec\x89\xb5\
-\x66\x87\x3c\x45\x47\x25\x70\xf3\x91\x1e\xb1\x92\xe6\xf4\x79\xcc\
-\xa6\x79\x8b\xc5\x35\xa7\xc7\x31\x4d\xce\x1f\x2c\xa6\x39\x2d\x43\
-\xa4\x1d\xd8\x8d\xb1\x70\x5b\x29\x6d\xcf\x87\x81\x2b\x98\xd2\x7e\
-\x9a\x0a\xdb\xf3\xff\x01\xdd\x09\xe4\x78\x9f\x06\xc0\xbf\x00\x00\
-\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\
-\x65\x00\x32\x30\x31\x39\x2d\x30\x33\x2d\x32\x39\x54\x31\x31\x3a\
-\x31\x38\x3a\x31\x33\x2b\x30\x30\x3a\x30\x30\x11\x81\xb8\x7b\x00\
-\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\
-\x66\x79\x00\x32\x30\x31\x39\x2d\x30\x33\x2d\x32\x39\x54\x31\x31\
-\x3a\x31\x38\x3a\x31\x33\x2b\x30\x30\x3a\x30\x30\x60\xdc\x00\xc7\
-\x00\x00\x00\x46\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x37\
-\x2e\x38\x2d\x39\x20\x32\x30\x31\x39\x2d\x30\x32\x2d\x30\x31\x20\
-\x51\x31\x36\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\
-\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\x41\x7b\
-\xe2\xc8\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\
-\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\x65\x69\x67\
-\x68\x74\x00\x35\x31\x32\xc0\xd0\x50\x51\x00\x00\x00\x17\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\
-\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\
-\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\
-\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\
-\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x4d\x54\x69\x6d\x65\x00\x31\x35\x35\x33\x38\x35\x38\x32\x39\
-\x33\xe8\xc2\x4c\x30\x00\x00\x00\x11\x74\x45\x58\x74\x54\x68\x75\
-\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x32\x32\x4b\x42\x42\x36\xc0\
-\xe2\x5e\x00\x00\x00\x45\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\
-\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x6d\x4c\x6c\x79\x4c\x70\x34\
-\x2f\x31\x38\x36\x30\x2f\x67\x72\x61\x70\x68\x6d\x61\x67\x6e\x69\
-\x66\x69\x65\x72\x5f\x31\x31\x38\x30\x38\x31\x2e\x70\x6e\x67\xcf\
-\xfb\x3c\x6b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x55\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
-\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
-\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\
-\x2b\x0e\x1b\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe8\x03\x09\x0f\
-\x09\x23\x74\x92\x8b\x13\x00\x00\x05\xd4\x49\x44\x41\x54\x58\xc3\
-\xed\x97\x6b\x6c\x14\xd7\x15\xc7\x7f\xe7\xce\xee\xda\x66\x6d\x43\
-\x43\x8c\x6d\x30\x50\xf2\x90\x0d\x32\x94\xd2\x84\x82\x83\x22\xda\
-\x14\x10\x54\x0d\x15\xd8\x4d\x2b\x52\x92\xa6\x2a\x0a\x6e\x2b\x5a\
-\x8b\x3c\x10\x89\xa2\x44\x25\x2a\x24\x12\x69\x1e\x50\x92\xc8\x6a\
-\x2a\x52\xe1\x1a\x50\x9a\xa8\x42\x0d\x1f\xd2\x80\xc1\x06\x4a\x00\
-\x91\xf8\x59\x02\x8b\x01\xbf\x8d\x17\x7b\xd7\x66\x76\xe7\xde\x7e\
-\x98\x59\x0b\x53\xb0\xd7\x85\x7c\xeb\x91\x46\xa3\xb9\x67\xee\x3d\
-\xff\xf3\x9f\xff\x3d\xe7\x8e\x30\x0a\x2b\xd9\x16\x03\xb0\x80\x55\
-\xc0\xd3\xc0\xd7\x81\x13\xda\xb1\x5f\x3a\xbc\x65\xe6\xa7\x63\x27\
-\xcf\x51\x89\x77\x9d\x58\xd4\x64\x4d\xff\xbe\x6f\xd2\xbc\x5f\x3c\
-\x0a\x52\x06\x4c\x04\x0e\x01\xcf\x01\xff\x02\xa8\x2c\xf5\xe3\x1b\
-\x0d\x00\xcf\xbe\x0b\xbc\x88\xc8\x3e\xa5\xd4\x1b\x5a\xeb\x25\x26\
-\x6e\xbf\x9d\xf3\x8d\x95\x0d\xd1\xce\x33\x96\x88\x8b\x41\x59\x29\
-\x46\xf9\x52\xfd\x20\xf7\x22\xf2\x81\x28\xf5\x85\x71\x9c\x15\xc0\
-\xeb\xc0\x8f\x80\x0b\x00\x2a\xd9\xa8\x3f\x29\x37\x5c\x3c\x1a\x02\
-\x28\x41\xe4\x44\xd3\x47\x4f\xbf\xfc\xd9\x8e\x65\x97\x7a\x2f\x9c\
-\x78\xca\x4a\x49\xef\x1b\x37\x6d\x41\x1e\x46\x37\x02\x4d\x40\x93\
-\xb2\x52\xce\x65\xe4\xcd\x99\x21\xca\xb7\xaf\x76\xd7\x13\xaf\x7e\
-\xf6\xc7\x25\x67\xed\xde\xd6\x5f\x03\x5f\x03\x1e\x4a\xac\x9b\x34\
-\x80\x86\xbf\x3d\x47\xa4\xf5\x8d\x8c\x58\xa4\x33\x5f\x44\x75\xf5\
-\x77\x9e\xc9\x50\xfe\xb4\xef\x85\x43\xd5\x36\x22\xe1\x60\x56\x7e\
-\x93\xd1\x4e\x05\x50\x81\x31\x15\xbe\xd4\x8c\xdd\x29\x99\x93\xda\
-\x11\x5a\xed\xbe\xf6\xf1\x56\x20\x7d\x61\x5f\xcb\xe9\x2b\x20\xbd\
-\x40\x7a\x62\x5d\x49\x26\x78\xc1\xfc\x62\x8c\x21\x15\x13\x7f\x26\
-\xab\x70\xf9\xfa\xdc\xfb\x56\x5f\xc4\xe8\x32\x3b\xd2\x51\x17\x08\
-\x4e\x58\x6c\x1c\xfb\xa5\xf3\x07\x5f\x8f\x84\xcf\x1f\xb1\x45\x2c\
-\x77\x92\xd1\xe4\xde\xb7\x7a\x6c\x56\xe1\xc3\x9d\x46\x3b\xbf\x89\
-\x45\xbb\xce\x06\x82\x59\x25\xc6\x98\x52\x30\x8f\x00\x35\x49\x69\
-\x20\x11\x5c\x84\x67\xc1\xfa\x59\xdf\xa5\x53\xeb\xed\xde\xb6\xa5\
-\x96\x3f\xad\x32\x10\xcc\xea\x00\x23\x20\x7f\x18\xe8\x0e\xbd\x7f\
-\x6d\x3e\x3a\x6e\x1b\x20\xb3\xbf\x3b\xb4\x3d\x10\x1c\xbf\xd7\x3f\
-\x66\x7c\x4f\x2c\xda\x95\xa5\x75\xfc\x77\x93\x1f\xc8\x3d\xda\x76\
-\x32\x3e\x32\x03\xf9\xf3\x56\x82\xd1\xa9\xa2\xac\x67\x81\x27\x80\
-\xf5\xc6\x89\xd5\x59\x81\xe0\x9f\x32\x26\xcd\xee\xca\x5b\xf0\xcb\
-\xf7\x95\x2f\xe5\x14\xc6\x7c\x0e\xc4\x2b\x4b\xfd\x43\xe6\xcf\x7d\
-\x64\x33\x91\xd6\xda\x1d\xe9\x13\x67\xdd\x3d\xa1\x70\xf9\x47\xcd\
-\x87\xb7\x97\xd9\xe1\x96\xc7\x11\xf5\x49\xed\xc1\x9d\x00\x37\x66\
-\xa0\x64\x5b\x8c\x60\xb6\x4f\x35\x57\xed\x4f\x6f\x39\xbe\xf3\xb7\
-\xda\x8e\xac\x36\xc6\x29\x13\xe5\x6b\x14\xcb\xff\x9e\x76\xae\xb6\
-\x74\xff\xfb\x9f\x6b\xc2\xe7\x8f\x5d\xac\xaf\xae\xbc\x69\x02\xe1\
-\x73\x35\x88\x52\xaa\xe7\xec\xa1\x33\x3d\x5f\x56\xed\x15\x91\xb5\
-\xc8\x50\xd9\x0d\x01\x50\xfc\x56\x2c\xc1\x4a\x51\xa4\xcd\x79\x6c\
-\xdc\xb4\xa2\xd9\x29\x99\xd9\xb3\x9d\x58\xff\xe1\x68\x47\xa3\xdd\
-\x7e\xfa\x83\x72\x11\xd5\x02\xb2\xc6\x0a\x8c\x19\x36\x38\x80\x28\
-\x57\x0f\x22\x72\x53\xae\x07\xe1\x94\x6c\x8b\x21\x02\x22\x2c\x07\
-\x76\x22\x4c\xf6\xa5\x06\x77\x65\xe6\xcd\x7a\x61\xec\xd4\x6f\x07\
-\xc6\x4d\x5b\x50\x99\x9e\x53\xd8\x13\x1f\xb8\xb2\xc6\x68\xe7\x62\
-\x7d\xf5\xee\x64\xf4\x3b\xa2\x5d\xff\x09\xee\x01\x36\x21\xb2\xe7\
-\xfc\x81\x57\xb6\x5e\x6e\xaa\x2a\x32\x46\x87\xf3\x7f\xf8\x6a\x45\
-\xda\xf8\xfc\xed\x77\x2d\xda\x68\x2b\xbf\xd5\x8d\x28\x1a\x8e\x24\
-\xbd\x83\xc1\xad\x9e\x01\x6e\xc0\xc3\xf5\xab\x3c\x08\xc8\xc0\xe5\
-\xe6\x6d\x3d\x67\x8f\x6d\x50\xfe\xb4\xd7\xac\x40\xb0\xbc\xf1\xc3\
-\x0d\x0f\x89\x65\xfd\x1e\x51\x33\x75\xdc\x4c\xd7\x31\x67\xc4\x88\
-\x05\xf3\x8b\x01\xf2\x81\x59\xc0\x32\xe0\x3d\x20\x0f\x58\x0c\x8c\
-\xf1\xfc\xff\x05\x20\x88\xa8\xf6\x4b\x47\xcb\x95\x88\x5a\x8c\x5b\
-\x36\x3f\x16\xcb\xb7\x24\xd6\xd7\xd9\x0c\x5c\x05\xc6\x26\x19\x5c\
-\xe1\xf6\x0b\x3f\xb0\x07\x38\x05\xfc\x05\x78\x14\x58\x7a\x33\x06\
-\xa2\x18\x7d\x47\xce\x37\x7f\xec\x18\xa3\xab\x80\x52\x60\x91\xd1\
-\xf1\x83\xfe\xf4\x3b\xf3\x80\x14\xe0\xca\x70\xc1\xa7\x17\x15\x63\
-\x0c\x00\x53\x81\x6f\x01\x35\x40\x05\xf0\x57\x60\x37\xd0\xe3\x8d\
-\xa7\x16\xcc\x2f\xbe\x5e\x03\xe6\x20\xc8\xfa\x60\xf6\xf4\xc7\x82\
-\x59\x77\x3d\xdf\xdb\x52\xb7\x1f\xa3\xc3\x77\x2f\x7d\xb1\x16\xad\
-\xb7\x02\x9f\x83\xa9\xbb\x99\xa4\xbd\xa2\x85\x08\x4b\x81\x4d\xc0\
-\x04\x60\x11\xf0\x1d\xef\x15\xf1\x92\x78\x1c\x98\x06\x6c\x18\x02\
-\xe0\x9d\xb5\xfe\xc6\x15\xeb\xfe\x7e\x28\x73\xca\xfd\x1b\xef\x59\
-\xb6\x79\x86\x58\xea\x13\x8c\xc9\xd1\x5a\x6f\x88\x76\x7d\xb9\x20\
-\x1c\xaa\x59\x27\xa2\xa2\x07\xde\x5e\x35\x1c\x09\x53\x80\xcd\xc0\
-\x31\x60\x0b\xd0\xef\x05\x15\x40\x7b\xcf\x05\xc0\x2b\xc0\xcb\x83\
-\x00\x2a\x4b\xfd\x34\xec\x7d\x12\x3b\xd2\x19\x8f\xb4\xd5\x9d\x9c\
-\xba\xb0\x6c\x40\xc7\xe3\xab\x10\x89\xdb\x7d\xed\xa1\x0b\x87\xde\
-\x2a\xec\xef\x0e\xc5\x45\x8d\xa8\xfe\xb9\xc0\x38\x0f\x84\x03\x3c\
-\x85\x2b\x46\x01\x06\x80\xfd\xc0\x0e\xe0\xcf\xc0\xf3\x43\x18\xb0\
-\xfb\x3a\x40\xc4\x0a\x87\x6a\x4e\xce\x7d\x52\xad\x39\xb2\x5d\xa7\
-\x65\x4c\xb4\x9c\xea\x2d\x65\xb9\xc6\x89\x3d\x28\xca\x4a\xa6\x79\
-\x65\x27\x96\x03\x36\x02\xf3\x80\xc3\x1e\x80\x54\xe0\x19\x20\x04\
-\x44\x81\x3b\x86\x6a\x40\x64\xf0\xfe\x6e\x51\x89\xa9\xaf\xde\x1d\
-\xf5\x14\xad\x07\x7d\xc9\x5b\x0a\x70\x2f\x50\x0e\x6c\xf5\xc6\xc6\
-\x00\xff\xc0\x3d\x1d\x39\x30\x8a\xf3\xc0\x28\xcc\xf6\xb2\x2d\xc4\
-\x15\x61\xf8\x1a\x5f\x0c\x77\x17\xdc\x0f\xe4\x00\xf1\xaf\x02\xc0\
-\x11\xe0\x32\xf0\x26\x70\x0e\xf8\x18\x40\x69\x9d\x00\xf0\x2e\xf0\
-\x00\xb0\x16\xd8\xf7\xbf\x9c\x09\x47\x30\x39\x0d\x66\x25\x30\x09\
-\xf8\x02\xe8\x48\xf4\x0d\xef\x73\x7e\x08\xd4\x03\xb9\x40\xed\x6d\
-\x05\xe0\x05\x32\x78\xe7\xc2\x61\xfc\x0d\xde\xf5\x95\x68\x60\x54\
-\xf6\x7f\x00\x02\x83\xe2\xc8\x01\x7e\x0a\xfc\xdc\xf3\x1d\xf0\xfc\
-\x06\xc8\x00\x7e\x00\x9c\xc4\xad\x62\x7b\x80\xe8\xed\x38\x94\x58\
-\x5e\x70\x3f\x6e\x6d\x5e\x01\x7c\x8a\xbb\x7d\x12\xec\x08\x6e\x1b\
-\x3e\x01\xf4\x79\x00\xa3\xc0\xd1\x3b\xa7\xcc\xa0\xb3\xb9\xf6\x96\
-\x00\x24\x76\x41\x36\xb0\x10\x78\x01\xd8\x05\x83\x8a\x1d\xb4\x6b\
-\x3a\xdd\x26\xe0\x61\xe0\x1d\x0c\x57\x6f\x95\x81\x44\x96\x96\x47\
-\x75\xdb\x8d\x82\x27\xc6\xbc\x6a\xdc\x8a\x5b\xd3\x6f\x8b\x7e\xa4\
-\x60\x7e\xf1\x72\x60\x26\xf0\x2b\x2f\xfb\xfa\x61\x16\x77\x70\x7f\
-\x4e\xe7\xe0\x56\xba\x2a\xe0\xf8\xad\x68\xc1\x87\xdb\x36\xf3\xbd\
-\xe7\x75\xa3\x98\xfb\x1a\x6e\xbf\x3f\x7e\x2b\x0c\xfc\x07\x91\xc4\
-\x33\x1e\xa4\x3f\x34\x7d\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
-\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x34\x2d\x30\
-\x33\x2d\x30\x39\x54\x31\x35\x3a\x30\x39\x3a\x33\x35\x2b\x30\x30\
-\x3a\x30\x30\x8e\x92\x2c\x6e\x00\x00\x00\x25\x74\x45\x58\x74\x64\
-\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x34\x2d\
-\x30\x33\x2d\x30\x39\x54\x31\x35\x3a\x30\x39\x3a\x33\x35\x2b\x30\
-\x30\x3a\x30\x30\xff\xcf\x94\xd2\x00\x00\x00\x20\x74\x45\x58\x74\
-\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x68\x74\x74\x70\x73\x3a\x2f\
-\x2f\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\
-\xbc\xcf\x1d\x9d\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\
-\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\
-\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x48\x65\
-\x69\x67\x68\x74\x00\x35\x31\x32\x8f\x8d\x53\x81\x00\x00\x00\x17\
-\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\
-\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\
-\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\
-\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\
-\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x37\x30\x39\x39\x39\x36\
-\x39\x37\x35\xbf\x62\x1b\x51\x00\x00\x00\x13\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x32\x34\x38\x30\x32\
-\x42\x42\x8c\x94\xa3\xcf\x00\x00\x00\x66\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\
-\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x43\x6b\x45\
-\x78\x7a\x50\x52\x2f\x34\x31\x38\x33\x2f\x72\x6f\x62\x6f\x74\x69\
-\x63\x73\x5f\x72\x6f\x62\x6f\x74\x69\x63\x5f\x61\x72\x6d\x5f\x72\
-\x6f\x62\x6f\x74\x73\x5f\x69\x6e\x64\x75\x73\x74\x72\x79\x5f\x72\
-\x6f\x62\x6f\x74\x5f\x69\x63\x6f\x6e\x5f\x32\x36\x32\x32\x37\x39\
-\x2e\x70\x6e\x67\xf8\xab\x63\x09\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x01\x9d\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x01\x3f\x49\x44\x41\x54\x58\x85\xcd\
-\x96\x31\x52\x02\x51\x10\x44\xdf\xfc\xfa\xb2\x24\x12\xa8\x94\x9a\
-\x19\x10\x6d\x99\x9a\x93\x79\x82\xf5\x1a\x7b\x96\xbd\x06\x7b\x02\
-\x33\x0e\x41\x71\x09\x08\x28\xa8\xd2\x5a\x70\x7f\x1b\xec\x62\x62\
-\xcc\x0e\x1d\xfd\x6c\xfa\xf7\xf4\xf4\x8c\x01\xac\x8a\x62\xf4\xdc\
-\x34\x25\x66\x85\xa4\x29\x17\x84\x99\x6d\x90\xea\xbb\x2c\xab\xac\
-\xae\x8f\xb6\xca\xf3\xd1\xd3\x6c\xf6\x89\xd9\xfc\x92\x85\xff\x41\
-\x5a\xde\x67\xd9\x7b\x7c\x9c\xcd\x4a\x60\x8e\x34\x68\x7d\x60\xbe\
-\x6d\x9a\x32\x0a\x8a\xa1\x2b\x9f\x61\x50\x44\x52\x9a\xca\xcc\x85\
-\x80\xa4\x69\x14\x60\xc3\xcb\xdf\x11\x00\xa2\x24\x70\x52\x00\x89\
-\x88\x84\xcf\xff\x7b\x02\x09\x08\x4e\x2d\x00\x7a\x05\xfc\x4c\x48\
-\x54\xf7\x72\x21\x00\xbd\x02\x5e\xe8\xa6\x20\x25\x08\xc1\x8f\x00\
-\x74\xbd\xf0\x61\xa0\x2e\x07\x9c\x52\xa0\x33\x21\xe0\x97\x03\x70\
-\x05\x0a\x5c\xc5\x18\x7a\x05\x91\xbb\x09\xf9\x33\xa1\x67\x0b\x92\
-\x84\x79\xee\x02\x4f\x03\x02\xbe\x53\xd0\x45\x71\x4a\xc8\x69\x17\
-\x40\xaf\x80\xdb\x4d\x78\x1e\x43\x37\x48\x04\x4f\x0b\x26\x20\xfe\
-\x48\x9b\x1b\x78\xf1\x20\x70\x92\xb6\xf1\x2b\xa5\xfa\x36\x84\xb7\
-\xa1\x93\x40\xc0\x77\x4a\x8b\x30\xde\xed\xaa\x43\xdb\x2e\x4f\x03\
-\x9d\xe7\x02\x4e\x12\x87\xb6\x5d\x8e\x77\xbb\xca\x00\x56\x79\x3e\
-\xda\x4f\x26\x65\x80\x8f\x60\xf6\x70\x49\x02\x49\xda\x26\x58\x4c\
-\xf6\xfb\xea\x75\xbd\x3e\xfe\x02\x73\x56\xb3\xe7\xfe\xb1\xd1\x30\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\xa7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x04\x00\x00\x00\xd9\x73\xb2\x7f\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x02\
-\x62\x4b\x47\x44\x00\xff\x87\x8f\xcc\xbf\x00\x00\x00\x09\x70\x48\
-\x59\x73\x00\x01\x67\xf4\x00\x01\x67\xf4\x01\x63\x29\xa1\x27\x00\
-\x00\x00\x07\x74\x49\x4d\x45\x07\xe7\x02\x10\x09\x32\x2b\xa3\x51\
-\x13\xdb\x00\x00\x01\x4e\x49\x44\x41\x54\x48\xc7\xed\x95\x3f\x52\
-\xc2\x40\x14\x87\xbf\x18\xc6\x88\x74\x1a\x42\x6c\xac\xa1\x87\x2e\
-\x28\x07\xf1\x04\x9e\xc2\xca\x23\xd8\x32\x8e\x46\x3c\x81\x35\x1e\
-\x20\x43\x1f\x87\x49\x15\xc8\x30\x84\x2e\x62\x14\x07\x8b\xfc\x59\
-\x02\x85\xc9\xe0\x0c\x14\xfe\xaa\xec\xbe\x7d\xdf\x26\x2f\xbb\xef\
-\x07\xbb\x96\xb4\xf2\x5c\x42\x45\x61\x09\x48\x7c\x30\x61\x99\x59\
-\xa7\x71\x14\xc7\x42\x7c\xbe\x36\x41\x6d\x1e\x19\x32\xc2\xc5\x65\
-\xcc\x80\x46\x26\xde\x60\xc0\x18\x17\x97\x11\x43\x7a\x5c\x24\x5b\
-\x97\xe2\x05\x06\x26\x0b\xfa\x7c\xc6\xb8\x29\xb3\x0c\x60\xc6\x0b\
-\x6a\xfc\x4e\x87\x74\x30\xb8\xe2\x55\x84\x65\xee\x71\x68\xe6\xfe\
-\xf0\x26\x0e\x26\xb2\x98\xa8\x61\xd3\x2d\x54\xbb\x2e\x36\x35\x80\
-\x03\x00\x14\x2a\x84\x85\x00\x21\x15\x14\x01\xd8\x42\xfb\x02\x98\
-\xe3\xad\xfd\xb6\xdf\xe4\xe1\x31\x17\x43\x89\x7a\x54\xd3\xdc\xd2\
-\x68\x64\x4e\xf1\xbf\x76\xaa\xe8\x46\x49\xd4\x91\x09\x0a\xe4\x69\
-\x9c\xe3\x8b\x61\x15\x8b\xdb\x42\x1b\xdf\x60\x51\x85\xe4\x24\x96\
-\xd1\x39\x29\x04\xd0\xd1\x29\x0b\xc0\x16\xda\x17\x40\x48\x10\xf5\
-\x97\xdc\x52\x08\x56\x7b\x98\xcc\x03\x0e\xad\xdc\xe9\x2d\x1c\x7a\
-\xd1\x11\x48\xae\xa4\xc1\x13\xdf\xf4\x63\xaa\xc4\x98\x3b\x26\x2b\
-\x29\x1a\xd7\x9c\xc5\x6d\x5d\xa1\x43\x29\xdb\xd6\x01\xda\x98\xd8\
-\xa9\xb1\x58\x1b\xc6\x62\xa5\xc6\xf2\xc6\x33\x97\x49\x20\x6b\x6d\
-\xa7\xa9\x7d\xbd\x33\x5d\xb3\x36\x95\xe3\xd4\xf6\x7c\x16\xdb\x16\
-\xff\xef\xf4\x03\x1d\xe1\x57\xb5\x82\xc5\x10\xf9\x00\x00\x00\x25\
-\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\
-\x32\x30\x32\x33\x2d\x30\x32\x2d\x31\x36\x54\x30\x39\x3a\x35\x30\
-\x3a\x34\x33\x2b\x30\x30\x3a\x30\x30\xd6\x07\xdd\x29\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\
-\x00\x32\x30\x32\x33\x2d\x30\x32\x2d\x31\x36\x54\x30\x39\x3a\x35\
-\x30\x3a\x34\x33\x2b\x30\x30\x3a\x30\x30\xa7\x5a\x65\x95\x00\x00\
-\x00\x20\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x68\
-\x74\x74\x70\x73\x3a\x2f\x2f\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\
-\x63\x6b\x2e\x6f\x72\x67\xbc\xcf\x1d\x9d\x00\x00\x00\x18\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\
-\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\
-\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\
-\x67\x65\x3a\x3a\x48\x65\x69\x67\x68\x74\x00\x35\x31\x32\x8f\x8d\
-\x53\x81\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\
-\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\
-\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\
-\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\
-\x36\x37\x36\x35\x34\x31\x30\x34\x33\x8b\x8e\x87\xe8\x00\x00\x00\
-\x12\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\
-\x00\x35\x39\x30\x32\x42\x42\x44\x2f\x3d\x44\x00\x00\x00\x43\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\
-\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\
-\x36\x2f\x38\x4e\x32\x48\x43\x79\x45\x2f\x33\x39\x30\x30\x2f\x63\
-\x61\x70\x74\x75\x72\x65\x5f\x69\x63\x6f\x6e\x5f\x32\x34\x36\x35\
-\x30\x32\x2e\x70\x6e\x67\x0e\xd6\x06\x85\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x64\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x01\x06\x49\x44\x41\x54\x58\x85\xed\
-\xd5\x3b\x4e\x03\x31\x14\x85\xe1\x0f\x98\x0d\x64\x07\x6c\x80\x22\
-\x0b\xa0\x02\x09\x89\x15\x20\xa4\x74\x2c\x80\x8e\x86\x0d\xb0\x07\
-\xba\x29\x88\x28\x29\x10\x05\x54\x2c\x80\x8a\x1e\xe8\x53\xd1\xf1\
-\x10\x34\x0e\x0a\x23\x8f\x1c\x4f\x1e\xd3\xf8\x48\xb7\xb9\x3e\xf6\
-\xf9\x25\x5f\xd9\x2c\xa6\x61\xa8\x5e\x34\xc4\x24\xd4\xda\x21\xa6\
-\xe1\x9f\xa1\x3a\x43\x6c\x74\x0c\xbf\xc7\x03\xbe\x43\x6f\x0b\x7b\
-\xd8\xc7\x53\x17\x90\x9c\xf0\x09\xae\x51\xa1\x0e\x55\x85\xde\x4a\
-\xaf\xa3\x19\x6e\x06\xc0\x3a\x20\xae\x30\x9e\x09\x6f\x02\x4c\x21\
-\xc6\xc1\x3b\x97\xaa\xb4\xe5\x4f\xc7\xf8\x49\x78\xbe\x70\x24\x63\
-\xb6\x36\x33\x00\x52\xe1\x9d\xbc\x39\x00\x2b\x51\xec\x0a\x4e\x30\
-\x6a\xf1\x5f\xe0\x36\x71\xe6\x21\xce\x5a\xd6\x6a\x5c\xa6\x00\xb6\
-\x43\xd5\x91\xb5\xb7\x44\x38\xbc\xe2\x31\xd2\x1f\x85\x73\xff\xa9\
-\x6d\x08\x5f\x70\x3e\x47\x58\x4c\xcf\x2d\x7b\x77\x63\xe6\xde\x67\
-\xa0\x00\x14\x80\x02\x90\xf3\x19\xc5\xf4\xde\x37\xc0\x69\xdf\x00\
-\x1f\x8b\x02\xf4\x3e\x03\x05\xa0\x00\x14\x80\xb6\x77\x60\x80\x83\
-\x25\x67\x0d\x72\x00\x76\x70\xb7\x64\x00\xb8\x69\x36\x7e\x01\xfa\
-\xc0\x2c\x97\xdd\x57\x54\x9b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x07\x83\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x07\x25\x49\x44\x41\x54\x78\x9c\xed\
-\x9a\x5b\x6c\x14\xd7\x1d\xc6\xbf\x33\x33\x3b\x33\x7b\x1b\xef\xda\
-\xeb\xcb\xae\xaf\x18\x37\xbe\x14\x8c\x91\x0b\x86\x36\x09\xbd\x40\
-\x95\x54\x40\xd5\x07\x9a\xd4\x69\xd5\x56\xa2\x22\x55\x85\x5a\x35\
-\x54\xb6\xf2\xb2\xe2\x21\xad\xec\x2a\x8d\xa2\x4a\x89\xea\x12\x25\
-\x0f\x89\x52\x81\xa0\x24\x85\xaa\x0a\x69\xa5\x1a\x04\x32\x14\x07\
-\xdb\x80\x6d\x0c\x01\xdf\x2f\x6b\xef\xd5\xbb\xde\xdd\xb9\x9c\x3e\
-\xe0\x20\xc7\xb7\xda\xde\xdd\x6c\x57\xcc\xef\x6d\x74\xce\xf9\xff\
-\xbf\xf3\xcd\xb9\xed\xce\x01\x74\x74\x74\x74\x74\x74\x1e\x5b\xc8\
-\x7a\x1b\x34\xff\xee\x0d\x3b\x25\xec\x57\x41\xc8\x36\x10\xa6\x02\
-\xa0\x2e\x00\x56\x80\x18\x08\x68\x8c\x02\x7e\x10\x32\x0a\xd0\x7e\
-\x4d\xd3\x3a\x15\x6e\xf6\xea\x6b\x2f\xbd\x34\xb7\x11\x71\x6e\xf7\
-\xdb\x62\xd4\xa2\xee\x84\x46\xeb\xc1\x90\x4a\x50\x5a\x48\x00\x1b\
-\x05\x11\x00\x2a\x03\x08\x01\x64\x8c\x10\x3a\xa0\x6a\xe8\x8a\x47\
-\xb8\xcb\xaf\x1f\xff\xa9\x7f\x3d\x39\xd6\x64\xc0\x51\xf7\xeb\x92\
-\xc9\x6c\xfc\x11\x21\xcc\xf3\x85\xf9\x8e\xdd\x15\xa5\x2e\xb6\x30\
-\xdf\x01\x47\x76\x16\x24\xb3\x09\xa2\x60\x00\xc3\x30\x50\x54\x15\
-\x73\xd1\x38\x02\xa1\x30\x3c\x5e\x3f\x46\x26\x3c\xb8\x37\x34\x3e\
-\x37\x39\xed\xfb\x27\xa1\x78\xd7\x7b\x4f\x3b\xd3\xd6\x76\x44\x5e\
-\xbd\xd3\x6e\x2e\x66\x2e\xfe\x1e\x05\xfd\x61\x6e\x8e\x7d\xaf\xab\
-\x20\xcf\x94\x9f\x9b\x0d\x5b\x96\x04\x8b\xc9\x08\x41\xe0\x41\x08\
-\x01\x28\x45\x5c\x51\x10\x0e\xcf\x21\x10\x0c\xc1\x33\xe3\xc3\xe8\
-\xf8\x94\x32\xe9\x99\xb9\xa2\x6a\xda\xfb\x1a\x25\xef\xfe\xbe\xe9\
-\x70\x28\x21\x03\x7e\xe9\x7e\xdb\x26\x5a\xd4\xa6\x5c\xbb\xf4\xe2\
-\x8e\xda\x2a\xdb\xf6\x9a\x0a\x58\xcd\xc6\xb5\x78\xf6\x39\x3c\x5e\
-\x3f\xfe\xd3\x73\x07\xd7\x7a\xee\x0c\x85\xa3\xd1\x57\xfd\x03\xda\
-\x9b\x8b\x8d\x70\xbb\xdd\xdc\x9c\xb1\xe8\x45\xb3\x59\x3c\x56\x53\
-\xb9\xb9\xb4\xaa\xa2\x0c\x92\xd5\xb2\xee\x5c\xb1\x58\x1c\x03\xf7\
-\x87\xd0\x37\x70\xdf\xe7\x99\xf1\xbe\x49\x55\xad\xb5\xa5\xf9\x48\
-\x60\xa5\xfa\x2b\x1a\xd0\xd4\xfa\xe7\x46\x9b\x64\x79\x6d\xdf\xd7\
-\xea\xf3\xb6\xd7\x6c\x06\xc3\x30\xeb\x16\xb3\x44\x5c\x5c\xc6\xa5\
-\xeb\x37\xd1\x7e\xb5\xbb\x37\x1a\x8d\x1d\x6e\x6d\x3e\x72\x19\x00\
-\x9a\x5b\x4f\xec\x36\xf0\xdc\x89\xfa\xda\x9a\x9a\xad\xd5\x15\xe0\
-\x38\x2e\xe1\x5c\x94\x52\x0c\x8e\x8c\xa3\xa3\xb3\x67\x72\xda\x17\
-\xf8\x55\xeb\x6f\x0e\xff\x65\xb9\x7a\x4b\x0c\x70\xbb\xdd\x5c\xd4\
-\x52\xf4\x46\xfd\x97\x9f\xf8\xd9\x81\x6f\xee\x82\x28\xf0\x09\x8b\
-\x59\x8c\x2f\x10\xc2\xc9\xbf\xff\x5b\xb9\x3f\x3c\x79\x8c\x30\x94\
-\xba\x0a\xf2\x5e\xfd\xd6\x53\x0d\x9c\xc5\x6c\x4a\x7a\x2e\x55\xd3\
-\x70\xbd\xeb\x36\x3a\xbb\x6f\xb7\xf1\xa1\xe1\x5f\x1c\x3f\x7e\x5c\
-\x59\x58\xce\x2e\x6e\xb0\xf3\x3b\x3f\xae\xab\xad\x2c\xfb\xd3\xf3\
-\xfb\xbf\x01\x8e\x5b\x52\x9c\x14\x8c\xa2\x80\xed\x35\x9b\x19\x5f\
-\x30\xf4\x8c\xdd\x6e\x7b\xf6\xdb\x5f\xdf\xcd\x08\x29\x30\x1a\x00\
-\x18\x42\x50\xe8\xcc\x43\x28\x1c\xa9\xf7\x04\xf1\xc1\xc5\x8f\x3f\
-\x18\x5f\x58\xbe\xec\x58\x33\x8a\x42\x4a\xc4\x2c\x84\x65\x59\x1c\
-\x7a\xf6\x69\x0c\xcf\xcc\x3e\x5c\xd4\x52\x0c\xc7\x2e\xff\x32\x13\
-\x9f\xd8\x09\xc0\x30\xcc\x17\xd2\xf9\xd5\x48\x7c\xb5\xf9\x02\x51\
-\x55\x15\xa7\x4f\x9f\x45\x77\x77\x0f\x4a\x4a\x8a\xd1\xd8\xf8\x1c\
-\x2c\x96\xf5\xef\x14\x0b\x79\x64\xc0\xfe\xa6\x0f\x4b\x08\xcb\xfe\
-\x71\x42\x61\xf6\x26\xac\x34\x45\x9c\x3e\x7d\x16\xa7\x4e\x9d\x01\
-\x00\xf4\xf7\x0f\xc0\xeb\xf5\xa1\xb9\xf9\xd8\x9a\xdb\x0f\x2b\xce\
-\x8b\x07\x5e\x3e\xff\x31\x55\xd5\xa3\xe7\x5a\x0e\x0e\x01\xf3\x53\
-\xe0\x90\xfb\x24\x6f\xe0\xf9\x8f\xea\xb6\x6d\x3d\x58\x53\x5d\x95\
-\xfc\xa5\x38\x49\x74\x77\xf7\x7c\xee\xb9\xab\xab\x67\x85\x9a\xcb\
-\x53\x53\x5d\x65\xaa\xdb\xb6\xf5\xa0\x81\xe7\x3f\x3a\xe4\x3e\xc9\
-\x03\xf3\x06\xc4\x64\xd3\x3e\xa7\xb3\xa0\x52\x92\xa4\x64\x69\x4d\
-\x09\x25\x25\xc5\xab\x3e\xaf\x05\x49\x92\xe0\x74\x16\x54\xc6\x64\
-\xd3\x3e\x60\xde\x00\x95\x52\x97\x28\x8a\xc9\xd0\x98\x52\x1a\x1b\
-\x9f\x43\x7d\xfd\x76\x70\x1c\x87\xf2\xf2\x4d\x38\x7a\xf4\xe7\x1b\
-\x8a\x23\x8a\x22\x54\x4a\x5d\xc0\xfc\x1a\xc0\xa6\x77\x33\x58\x33\
-\x16\x8b\x65\x5d\x73\x7e\x35\x3e\xeb\x73\x66\xf4\x3c\x85\x3c\xf6\
-\x06\x64\xc4\x39\xa0\xa3\xe3\x1a\xce\x9c\x39\xbb\x6c\x59\x4b\xcb\
-\x2b\x09\xc5\xce\x08\x03\x00\x80\x52\x60\x74\x74\x0c\xf1\x78\x3c\
-\xa9\x71\x33\x62\x0a\x34\x34\xec\x40\x6b\xeb\x2b\x28\x2a\x72\x25\
-\x3d\x76\x46\x18\x90\x4a\x74\x03\xd2\x2d\x20\xdd\xe8\x06\xa4\x5b\
-\x40\xba\xd1\x0d\x48\xb7\x80\x74\xa3\x1b\x90\x6e\x01\xe9\x46\x37\
-\x20\xdd\x02\xd2\x4d\x46\xfc\x18\x1a\x19\x19\x45\x6f\x6f\x3f\x82\
-\xc1\xa5\xdf\x3a\x2f\x5c\xf8\x17\x8a\x8a\x5c\xa8\xae\xae\xda\x50\
-\xec\x8c\x18\x01\xbd\xbd\xfd\x68\x6b\x7b\x0b\xd3\xd3\x33\x4b\xca\
-\xda\xda\xde\x42\x7b\xfb\xa5\x0d\xc7\xce\x88\x11\xd0\xd0\xf0\x15\
-\x94\x97\x6f\x5a\xb1\x5c\x92\xac\x1b\x8e\x9d\x11\x06\x48\x92\x84\
-\x54\xfd\x63\x9d\x11\x53\x20\x95\xe8\x06\xa4\x5b\x40\xba\xd1\x0d\
-\x48\xb7\x80\x74\xb3\xa1\x5d\x20\x10\x0a\x63\x62\xda\x0b\xaf\x3f\
-\x84\xe0\x6c\x04\x71\x59\x81\xa2\x28\x60\x59\x16\x46\x81\x87\xd5\
-\x62\x82\xc3\x2e\xc1\x99\x9b\x03\xb3\x29\xb1\x4f\x6e\xb2\xac\xc0\
-\xeb\x0f\xc0\x1f\x08\x62\x36\x3c\x07\x59\x96\xa1\xa8\x1a\x0c\x1c\
-\x0b\x96\x65\x61\x31\x9b\x90\x25\x59\x90\x63\xb7\x81\xe7\x0d\xeb\
-\x8e\xbf\x26\x03\x34\x4d\xc3\xdd\xc1\x31\xdc\x1c\x78\x80\xbb\xc3\
-\x53\x98\x95\x05\x70\x46\x1b\x18\xde\x02\x86\xb3\x82\xb0\x06\x10\
-\x42\x40\x35\x0d\x54\x93\xa1\xc9\x73\x50\x63\x1e\xa8\xd1\xeb\x70\
-\x98\x81\x8a\x92\x02\x6c\xab\x2e\x47\x61\xbe\x63\x4d\xa2\x42\xb3\
-\x61\xdc\xf9\x74\x10\x23\x63\x53\x98\x0e\x69\x60\x04\x1b\x58\xc1\
-\x0a\xc6\x20\x81\xb0\x3c\x08\xc3\x80\xc6\x34\x50\x55\x81\xe6\x99\
-\x83\x1a\x1b\x85\x1a\xbd\x8d\x2c\x51\x45\x89\x2b\x17\x9b\xcb\x8a\
-\xe1\xc8\xb6\x25\x6e\x80\x2c\x2b\xe8\xe8\xea\xc3\xe5\x1b\xfd\x98\
-\x63\x72\xc0\x67\x15\x83\x73\x6d\x81\xb4\x8e\x5b\x1d\x31\x4d\xc5\
-\x8d\xa9\x29\x74\x0c\x74\xc2\x21\x46\xb1\x67\xc7\x16\x6c\x79\x62\
-\x13\x18\x66\x69\x8c\xd1\xf1\x29\x7c\x72\xb3\x0f\x93\x41\x02\xde\
-\x56\x02\x83\x7d\x37\xac\x8e\xb5\xbf\x55\x4d\xd3\x30\x10\xf0\xe0\
-\x56\x7b\x3f\x6c\x7c\x04\x75\x35\x5f\xc2\xa6\xd2\xc2\x55\x6f\xa1\
-\xac\x68\x40\x4f\xff\x7d\x9c\x6f\xef\x84\x2c\x16\x41\x70\xee\x81\
-\x99\x5d\xff\xf0\x02\x00\xc2\xb0\xe0\x25\x27\x78\xc9\x89\x48\x3c\
-\x82\xbf\x5e\xb9\x83\xf6\x6b\x37\xf1\xdd\xbd\xbb\x50\xec\xcc\x03\
-\x00\xf8\x03\x41\x5c\xea\xb8\x81\xa9\x88\x00\x63\x6e\x2d\xac\xf6\
-\x8d\x1d\x7a\x08\xc3\x80\xb7\xe6\x83\xb7\xe6\x23\xae\x44\xd1\x7e\
-\xeb\x2e\x3e\xb9\x35\x80\x27\x77\xd6\xae\xd8\x66\x59\x03\xba\xfb\
-\x3e\x45\xd7\x60\x04\x66\xe7\x53\x30\x72\xc9\xbb\x30\xc5\xf2\x26\
-\x98\x9d\x75\x08\xc7\x82\x38\x71\xf6\x0a\xf6\xd4\x95\x22\xaa\x52\
-\x5c\xed\x19\x84\x58\x50\x07\x4b\xb6\x3d\x69\xb9\x18\x4e\x84\x29\
-\x7f\x0b\xe2\x72\x04\xe7\x2f\x76\x81\x53\xbc\xe0\x9c\xa5\x4b\xea\
-\x2d\x35\x80\x10\x70\x8e\xad\x10\xb3\xcb\x93\x26\x66\x31\xac\x20\
-\xc1\x52\xf6\x34\x2e\xf6\x75\x83\x52\x0a\x73\xd9\x1e\x10\x92\x9a\
-\x0d\x89\x35\x98\x60\x2e\xde\x85\xa8\xf7\x1e\x96\xbb\x17\xfa\xd0\
-\x00\x4a\xfd\xb2\xfc\xf0\xe6\x2a\x27\xda\xc0\x89\x6b\x5b\x40\x12\
-\x81\x10\x06\x66\x67\x5d\xca\xf3\x3c\xcc\x45\x60\xcc\xa9\x78\xf4\
-\x2c\xcb\x32\xc0\x50\x3f\x30\x7f\x0e\x20\x82\x7c\x61\x62\x62\xd2\
-\x9b\xec\x0f\x8f\xff\x8f\xc4\xe3\x71\x4c\x4c\x4c\x7a\x09\x27\x5f\
-\x00\x16\x8c\x89\xfd\x4d\x1f\x3e\xc9\x0b\xc2\x7b\x76\xbb\xbd\x84\
-\x65\x53\x7b\x3e\xe2\x38\x0e\x65\x65\xa5\x8f\x56\x67\x4a\x29\x1e\
-\x3c\x18\x84\xa2\x28\xff\xa3\x65\x62\xa8\xaa\x06\x9f\xcf\x37\x14\
-\x8f\xc5\x5e\x38\xd7\x72\xf0\x12\xb0\x78\x52\x1c\x3a\xc9\x3e\x53\
-\xc1\x57\x72\x44\x48\xe9\x85\x21\x42\xd5\x17\x5c\x2e\xe7\xaf\x3f\
-\xbb\xe4\x34\x34\x34\x8c\xb1\xb1\xf1\x3f\x50\xc2\xbe\x97\xca\xbc\
-\x0a\x8d\x45\xff\x71\x37\xde\x8f\x53\xdf\x57\x1f\x69\x49\x65\xc2\
-\xd5\x38\xf0\xf2\xb9\x9f\x80\xe2\x07\xf3\x2a\xde\xff\xdb\x6f\xf7\
-\xbf\x93\x2e\x2d\x3a\x3a\x3a\x3a\x3a\x3a\x8f\x29\xff\x05\x25\xb2\
-\x74\xae\xe3\x20\x3c\xca\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x01\xb4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x01\x66\x49\x44\x41\x54\x68\xde\xed\
-\x98\x41\x4e\xc3\x30\x10\x45\x5f\xd2\x6e\x90\xe0\x1c\x74\x43\x7b\
-\x00\x0e\x82\xb8\x00\x57\xe8\xae\xbd\x52\x8e\xc0\x15\xb8\x05\x74\
-\x91\x4d\x90\xa0\x52\xe2\xb2\x71\x24\xcb\xd8\x89\x03\x8e\xeb\x48\
-\xf3\x24\x4b\x56\x6c\xc5\x7f\xe2\x19\x7b\x26\x20\x08\x82\x20\x08\
-\x82\x20\x2c\x96\x62\x60\xac\xcc\x4c\xab\x0a\x99\x74\x0f\x54\x40\
-\x03\xb4\x99\xb5\x46\x6b\xdb\xf8\xc4\x6f\x80\x1a\xb8\x64\xde\x6a\
-\xfd\xa1\x7f\x51\xe9\x09\x4a\x37\x57\xdf\x7c\xa6\x02\xe6\xab\x89\
-\xef\x0c\xed\x57\xae\x18\x68\x80\xdb\x85\xc4\xee\x27\x70\x67\x07\
-\x6c\x6b\x59\x4a\x86\x41\xdc\xef\x40\xdb\x1f\x32\xeb\xa5\x1f\xa3\
-\xeb\x89\x47\x6b\x76\x47\xbe\xcb\x80\x4b\x26\xf7\x82\xf2\xe8\x2a\
-\xc6\x0c\xf0\x89\xff\x02\x56\x89\xc4\x77\xc0\x4d\x48\x2c\x4e\x71\
-\xa1\x55\x42\x03\x66\x71\x21\xd7\x78\x61\x6d\xed\x5f\xfa\xbe\x71\
-\x62\xba\x50\xbf\xad\x24\x74\xa1\xa8\xa7\x90\xd2\x3e\x79\xcd\x20\
-\x9e\xec\x42\xa5\xf5\x4c\x5d\xc1\xe7\x8b\x31\x17\xc2\x4a\x25\xcc\
-\x9b\xd8\xcc\x04\x3f\x80\x6d\x42\xf1\x5b\xe0\xdd\xd2\x60\xde\xc4\
-\xcd\x50\x32\xe7\x6b\xa7\x44\x46\x3c\xe8\xb5\x86\xb4\x54\xbe\x5a\
-\xa0\x1e\xc9\x06\xe7\x36\xa2\x17\x3f\x94\x8d\x7a\xd3\x69\x5f\x41\
-\x63\xa7\xbe\x27\x60\xa7\x63\x24\x66\xdb\x19\xe2\xcd\x35\x83\x0b\
-\x1a\xd7\xed\x5b\x02\x47\xc7\x16\x76\x33\x54\x5c\x9d\xb5\x86\x02\
-\xf6\x86\x8e\x7f\x71\x4c\x5c\xd0\xb4\xc0\x4b\x6c\xff\x3c\x58\xe2\
-\xe7\x32\xe0\x0c\x3c\xcd\x15\x64\xcf\xc0\x9b\x23\x36\x62\x18\xf0\
-\x0d\xbc\x02\x8f\xf2\xb3\x48\x10\x04\x41\x10\x04\x21\x8c\x1f\x0e\
-\x4f\x53\xc7\xf7\xc2\xf0\x1c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x07\xd0\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\x62\x4b\x47\
-\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\x70\
-\x48\x59\x73\x00\x00\x00\x27\x00\x00\x00\x27\x01\x2a\x09\x91\x4f\
-\x00\x00\x05\x14\x49\x44\x41\x54\x58\xc3\xad\x97\x4d\x6c\x54\x55\
-\x14\xc7\x7f\xe7\xbe\xf7\xa6\x53\x5b\x4c\x31\x81\x04\x48\x91\x85\
-\x06\xa8\x09\x12\x05\x34\x90\xda\x36\x02\x35\x51\x23\xee\x4c\x24\
-\x82\x71\xe1\x06\x13\x09\x92\xb8\xe7\xa3\x0d\xc5\x68\xd0\x2d\x89\
-\x04\x13\x37\xba\x30\x81\x45\x8d\xa1\x94\xcf\x18\x48\x01\x83\x82\
-\x86\x08\x01\x6d\x0b\xf2\x65\x5a\xda\xe9\xcc\x7b\xf7\xb8\xb8\x6f\
-\xde\xcc\xeb\xb4\x9d\x11\x38\x9b\x37\x6f\xce\x7d\xe7\xfc\xef\xf9\
-\x3e\x42\x15\xda\x7d\xac\x0d\xc0\x53\x65\x31\xf0\x9a\xc2\x1a\x55\
-\x96\x00\x4f\xab\xd2\xa0\x80\x2a\xa3\xc0\x75\x55\x7e\x57\x38\x01\
-\xf4\xaa\x72\x19\x88\x76\xac\xed\x9f\x51\xbe\x4c\xc7\xe8\x8a\x15\
-\x03\xab\x14\x36\xa9\xd2\x09\x34\xab\x03\x03\x4e\x31\x31\x80\xf2\
-\xf7\x08\xb8\xa1\x4a\xaf\xc2\xd7\xc0\x19\x20\xda\x39\x0d\x90\x0a\
-\x00\x7b\x4e\xb6\x62\xad\x01\x98\xaf\xf0\x31\xca\x66\x85\x39\x94\
-\x29\x4b\x29\xa5\x12\x8c\xc6\x0c\x85\x5b\x28\x07\x14\x3e\x07\x86\
-\x8c\x31\xec\x78\xb5\x6f\x7a\x00\xdd\xc7\x5f\x41\xdc\x5f\x2b\x15\
-\xf6\x02\xad\xaa\x88\x02\xd6\x42\xa4\x25\xc5\x00\x22\x4e\x80\x94\
-\x49\x51\x75\xe7\xac\x4d\x00\x29\xd0\xaf\xb0\x4d\x84\x01\x6b\x95\
-\xae\xf5\xc7\x2a\x01\xec\x39\xd1\x8e\x45\x11\x58\x0f\xec\x8b\x7d\
-\x4e\x64\xa1\x10\xb9\x27\x02\x26\xfe\x4a\x26\x01\x28\x7f\x22\x93\
-\xbe\x73\x40\x2e\x01\x5b\x80\x23\x0a\x74\xad\xef\x2f\x01\xf8\xec\
-\x74\x07\x91\x3b\xb9\x12\x38\xa8\xb0\x58\xd5\x09\xc8\x87\xee\x56\
-\x22\x69\x05\xd3\x01\x48\x2c\x23\xee\xbb\x89\x10\xc2\x28\x71\xcd\
-\x6f\xc0\x66\xe0\x8c\xa8\x61\x77\x67\x9f\xbb\x90\xb5\x16\x11\x16\
-\x00\x3d\xe0\x6e\x9e\x0f\x21\x57\x00\xab\x33\x85\xea\x0c\xa4\x60\
-\x04\xea\x03\xc8\xf8\xc9\xbf\x2d\x40\x8f\x2a\x0b\x2c\xce\x34\xd2\
-\x73\xb2\x0d\x44\x0c\xaa\xdd\xaa\x6c\x07\xc8\x47\x30\x96\x2f\xf9\
-\x68\x2a\x13\x57\xb5\x40\xf9\x79\x9c\xbc\x7c\x94\x04\x68\x0f\xf0\
-\x29\xe0\xc2\x5d\x54\x5f\x06\x36\x4b\xec\xbb\xf1\x7c\x3a\xd8\x1e\
-\x95\x44\xa0\x3e\x03\x9e\xa1\x98\x36\x9b\x14\x56\x01\x18\xe3\xe2\
-\xea\x3d\x60\x8e\xaa\x33\x7b\x31\x70\x1e\x27\x79\x06\xb2\x41\x62\
-\xa5\xb9\xc0\xbb\x11\x18\xa3\xc2\x52\xa0\x13\x20\xb4\xce\x4c\xe5\
-\x3e\x57\x14\x55\x1b\x3f\x15\xa5\x98\x8b\x5a\xe4\xa2\x28\x16\x77\
-\x66\x26\xca\x78\xe0\x9b\xe4\xf5\x75\xa3\x2c\xf5\x63\xe5\xcd\xe0\
-\x02\xcf\x6a\xc9\x97\xaa\x4a\x53\x76\x0e\x2f\x35\x6f\xa0\x21\x68\
-\x02\x34\x95\xf3\xc5\x9f\x22\xc2\x68\xfe\x0e\x03\x83\x3f\xf0\xa0\
-\x70\xa7\xcc\xf4\x1e\x50\x32\xa7\x11\x17\x90\x85\x08\x80\x85\x40\
-\xbb\x0f\xac\x21\x2e\xaf\x31\xa3\x8c\x94\xe5\xf3\x3a\x69\x5b\xb4\
-\xb1\xaa\x89\x55\x95\xbf\x6f\x5e\xe3\x8f\xf1\x1f\x69\xc8\x3e\xc9\
-\x8b\xf3\xdf\x66\xf0\xf6\x15\xae\x8d\x9e\x26\x08\xbc\xe4\x5c\xe0\
-\x25\x29\xea\x01\xab\x7d\x60\x09\xb8\xea\x55\xe9\x7b\xa1\x29\x3b\
-\xb7\x26\x1f\x8b\x08\xb3\xfd\x45\xb4\x36\x7f\xc0\xbf\x63\xb7\x58\
-\xfa\xd4\x3a\x86\xaf\xdf\x25\x2c\x44\x29\x00\x9e\x01\x4f\xe2\xf4\
-\x86\xe5\x46\x9c\x29\x92\xd2\x59\x2d\xe5\x47\xc6\xee\x71\xfe\x6a\
-\x3f\xf9\x30\x57\xc1\xeb\x58\xf6\x0e\xed\xcf\xbc\x8f\x8c\x35\x11\
-\x55\x9a\x33\x91\x6f\x4c\xf2\xbe\xd0\x00\x8d\x10\x23\xaa\x21\xf5\
-\xc6\x26\x46\x39\xf4\xeb\x3e\xbe\xff\xa5\x8b\xdb\xa3\x7f\xa5\x78\
-\x19\xbf\x0e\x29\x96\xc0\xe9\x6e\x22\x2e\x16\x62\x6a\x34\x3c\x04\
-\x19\xcf\x90\xa9\xf3\x30\xe6\x61\x4a\x64\x9a\x7c\x60\x14\x68\x34\
-\x52\x83\xfd\x81\x27\xb2\xb3\xd8\xb0\x6c\x2b\xcf\xce\x7b\x81\xc0\
-\x64\x53\xbc\x7c\x38\x41\xe0\x65\x66\x16\xa4\x89\xff\x01\x46\x7c\
-\x85\xeb\x40\x8b\x31\xee\xb3\x6a\x71\x30\xab\xbe\x89\x96\x05\xab\
-\xa7\xe4\x1d\x39\xff\x2d\xa1\x79\xc0\xfd\x07\xb7\xa7\x94\x52\x94\
-\x6f\x6d\xf2\x7e\xdd\x07\x2e\x03\x2d\x9e\xb8\x08\x0d\x53\x99\xa0\
-\xdc\xcb\x0d\xd7\x64\x4a\x55\x65\xf0\xde\x15\xfe\x2c\xfc\x44\xd6\
-\x6b\xe4\xc2\xf0\x6c\xee\x8e\x0e\x21\x99\x34\x90\x28\x9e\x2b\x62\
-\xba\xe0\x03\x27\x81\xb7\x44\xf0\x02\x6f\x32\x00\xe1\xfc\x60\x2f\
-\x36\xe7\x91\x8d\x66\xa3\x6e\x5e\x48\xdd\xc8\x35\x26\xe1\xee\xc8\
-\x30\x57\xef\x9f\xa5\x7e\x6e\x1d\xc6\x0b\x39\xf7\xcf\x77\x14\x0c\
-\xd4\x05\x7e\x0a\x40\xb1\xbd\xe3\x46\xb7\x53\xb2\xf7\x54\xdb\x73\
-\x28\x87\x14\x16\x15\x22\x18\xc9\x95\xdc\xe0\xaa\x9e\x62\x43\x4b\
-\x61\xdc\x22\x65\x95\xb0\xb2\x03\x2a\xf5\x0d\x01\x7e\x60\x4a\xfc\
-\xe2\x19\x4a\xf3\xc1\x48\xce\x15\x3c\x85\xab\x28\x6f\xfa\xa2\x5c\
-\x52\xe8\x05\x3e\xf4\x8d\xab\xd7\x13\x61\xc9\x85\x82\xe0\x07\x1e\
-\x41\xc6\xab\xde\x7e\x29\x0d\x2f\xa9\x94\x8e\xcf\xe5\xa3\x94\x85\
-\x0f\x2b\x7a\xc9\x58\x57\xac\x0f\x00\xb7\x44\x5c\xc7\xf2\xa6\x4a\
-\xce\x52\xff\x71\xd3\x4d\xba\x27\x55\xad\x21\x91\x75\x9d\x36\x36\
-\xff\x4d\xe0\x1b\x23\x62\x8b\xaa\x7e\x06\x0e\xa8\x3a\xe5\xf5\x99\
-\xf4\xa0\xf9\xa8\xa4\xea\x66\x8c\xe2\x5c\x09\xec\x37\x6e\x5c\xc7\
-\x6c\x5f\xd3\x8f\x3a\x2b\x7c\x01\xf4\x81\x6b\x18\x59\xff\xe1\x26\
-\xb1\xa9\x0c\x97\x0b\x4b\x8d\x4e\xe0\x08\xf0\x95\x82\xed\xee\xec\
-\x77\x33\xa1\x6f\x2d\xaa\x0c\x02\x9f\xe0\x06\x47\x32\xbe\x73\x87\
-\x99\xec\xcf\x5a\x29\x6e\x38\xe3\x05\x17\xf9\x31\x5d\x04\xb6\x8b\
-\x30\x44\x6c\x7b\x03\xb0\xb5\xf5\x38\xa8\x60\x61\x40\xe1\x23\xd4\
-\x81\x08\x3c\x07\xc2\xf7\x4a\xb7\xa9\x41\x2f\xe0\x26\xe1\x5c\xc1\
-\x3d\x63\xc6\x45\x81\x2d\x22\x0c\xa0\xd0\xbd\xae\x3f\x75\x1e\x80\
-\x3d\xc7\xda\xb1\x62\x11\x64\x45\xbc\x98\xb4\x15\x37\x9d\x47\x5c\
-\x4c\x8e\x2a\x6c\x03\xce\x89\x08\xbb\xd6\x1e\xad\x00\x9c\xd0\xde\
-\xe3\x1d\x84\x6e\x8a\x79\x5c\xab\xd9\x7e\x85\x2f\x81\x21\x2c\xec\
-\xea\x4c\xef\x88\xb5\x2c\xa7\x2b\x14\x36\xaa\xf2\x06\xff\x6f\x39\
-\x3d\xac\x70\x10\xe5\x2c\x10\xed\x5c\x57\xe3\x72\x3a\x99\x26\xad\
-\xe7\x1d\xf1\x7a\xfe\x3c\x95\xeb\xf9\x0d\x55\x2e\xa8\x2b\xed\x7d\
-\x6a\xb9\x8c\x54\x5f\xcf\xff\x03\xc8\xfe\x91\xcc\x11\x16\xd5\x45\
-\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\
-\x61\x74\x65\x00\x32\x30\x31\x37\x2d\x30\x32\x2d\x30\x37\x54\x31\
-\x36\x3a\x35\x34\x3a\x32\x35\x2b\x30\x31\x3a\x30\x30\x7b\x1a\xe2\
-\x27\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\
-\x64\x69\x66\x79\x00\x32\x30\x31\x37\x2d\x30\x32\x2d\x30\x37\x54\
-\x31\x36\x3a\x35\x34\x3a\x32\x35\x2b\x30\x31\x3a\x30\x30\x0a\x47\
-\x5a\x9b\x00\x00\x00\x46\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\
-\x72\x65\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\x69\x63\x6b\x20\x36\
-\x2e\x37\x2e\x38\x2d\x39\x20\x32\x30\x31\x36\x2d\x30\x36\x2d\x31\
-\x36\x20\x51\x31\x36\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
-\x2e\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\
-\xe6\xbf\x34\xb6\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\
-\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\
-\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\x65\
-\x69\x67\x68\x74\x00\x35\x31\x32\xc0\xd0\x50\x51\x00\x00\x00\x17\
-\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\
-\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\
-\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\
-\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\
-\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x34\x38\x36\x34\x38\x32\
-\x38\x36\x35\xb5\x07\xba\x87\x00\x00\x00\x13\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x32\x36\x2e\x34\x4b\
-\x42\x42\xfa\xbe\xa4\x6e\x00\x00\x00\x81\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\
-\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x63\x61\x72\x6c\x6f\x73\
-\x70\x72\x65\x76\x69\x2f\x79\x52\x57\x55\x44\x42\x36\x2f\x31\x31\
-\x34\x39\x2f\x31\x34\x38\x36\x35\x30\x34\x33\x31\x32\x2d\x63\x61\
-\x6d\x63\x6f\x72\x64\x65\x72\x2d\x63\x61\x6d\x65\x72\x61\x2d\x72\
-\x65\x63\x6f\x72\x64\x69\x6e\x67\x2d\x76\x69\x64\x65\x6f\x2d\x63\
-\x61\x6d\x65\x72\x61\x2d\x76\x69\x64\x65\x6f\x2d\x72\x65\x63\x6f\
-\x72\x64\x69\x6e\x67\x5f\x38\x31\x33\x32\x32\x2e\x70\x6e\x67\x8d\
-\x99\x2e\xd6\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0a\xeb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\x62\x4b\x47\
-\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\x70\
-\x48\x59\x73\x00\x01\x3a\xf6\x00\x01\x3a\xf6\x01\x3a\xb1\x57\x3a\
-\x00\x00\x08\x59\x49\x44\x41\x54\x58\xc3\x95\x97\x5b\x6c\x5c\xe5\
-\x11\xc7\x7f\xf3\x9d\xf5\xae\xef\x1b\xc7\x97\xd8\x26\x21\x09\x71\
-\x6c\x27\x71\x42\x12\x10\x2a\x85\x26\xa5\xe1\x56\x14\xe1\xa8\x29\
-\x05\xc4\xa5\xc0\x43\x04\xaa\x2a\x84\xd4\xaa\x2f\x3c\xb4\x2f\xed\
-\x0b\x42\x6a\xd5\x16\x95\xaa\x6a\x55\xb5\x15\xe2\x22\x4a\x9a\x00\
-\xad\x92\x52\x35\xa8\x84\x56\x8d\x81\x24\xb6\xe3\x86\xc4\x49\x6c\
-\xe2\xd8\x8e\x2f\xeb\x78\xd7\xde\x73\xbe\x99\x3e\x9c\xdd\xb5\x23\
-\x24\x30\x9f\xf4\xed\x39\xbb\x7b\xce\xcc\x7f\x66\xfe\xf3\x9f\x73\
-\x84\x25\xae\x3d\x0f\x7d\x1b\x31\x12\x26\xf2\x07\xcc\xee\x37\x55\
-\x14\xc3\xcc\x30\x2d\x1c\xe1\x25\x55\x7d\x44\x44\xa2\xb7\x5f\x7b\
-\x69\x49\x76\x13\x4b\x05\x00\x82\x09\xb5\x98\x75\x04\x0d\xeb\x71\
-\xb5\x2b\x51\xf5\xf8\xfc\x1c\x66\x46\x34\x3d\x8c\x4e\x9e\xed\x04\
-\x6a\x31\x9b\x58\xaa\xd5\x2f\x00\x00\xc0\x5a\x10\xd7\x1a\xd4\xaf\
-\x27\x68\xec\x44\x7d\x88\x65\x67\x50\x33\x9c\x4b\xe2\x27\x07\x5b\
-\xc5\xb4\x05\x91\x25\x03\x70\x4b\xf7\x6d\x60\xb6\x96\x20\xb9\x4c\
-\xca\x6b\x31\xf3\x60\x5a\xda\x92\xaa\x01\x57\xb6\xcc\xcc\xd6\x9a\
-\x2d\x3d\xa4\x52\x06\x1e\x78\x7c\x1f\x06\x29\x81\x2a\xaf\x3a\x85\
-\x88\xbe\xf2\xbb\x5f\x03\xb0\xe7\xa1\xc7\x10\xe7\x02\x8b\xf2\x37\
-\x48\xa2\x22\x29\xc9\x6a\x30\x8b\x31\x01\x66\x06\x89\x4a\x48\x94\
-\x27\x2d\xcc\x5e\x1f\x46\xfe\xcd\xdb\xbb\xef\xd3\x43\x6f\xbc\x02\
-\xc0\x8e\x7b\xf6\x00\x38\x53\xad\x03\x66\x80\xfc\x91\xb7\xf7\x17\
-\x0a\x5b\x70\x2e\x66\x98\xc8\x53\x98\xed\x53\xd3\x77\xcd\x38\x68\
-\xf0\x1e\x92\x98\xf6\xd1\xfc\x8d\x66\xfa\x1d\x90\xee\xa0\x69\x63\
-\x5d\xd9\xba\xdb\x00\x87\xaa\x92\xcf\xce\x60\xea\x31\x53\xc2\xc1\
-\x23\x44\xe3\x03\x13\xaa\xba\x1f\xf8\x99\xf7\xda\x03\xa4\xcd\xfc\
-\x97\x4c\x6d\xb7\x99\xdd\x6a\xc8\x0b\x0e\x79\x51\x51\xde\xfd\xeb\
-\x81\x38\x03\x22\x02\x22\xed\xc0\xd3\x2e\xbd\xb2\x03\x8d\xb6\xfa\
-\x99\xd1\x27\x88\xe6\x8f\xa9\x9f\xeb\x03\xb9\x33\xa8\x6d\x5d\x1d\
-\xac\xe8\xc2\xd5\xad\x01\x71\xa5\xe8\x17\x3e\x1d\xee\x9a\x9b\x48\
-\x54\xb7\x2c\x8f\x46\x7b\x1f\xf3\x33\x23\x3b\x05\xfb\xbb\x9a\x75\
-\xe0\xca\xb6\x4b\x75\x43\x25\x26\x68\x66\xe8\x19\x6f\xf6\x0f\x60\
-\x00\x40\x1e\x78\x7c\x1f\x88\x38\x31\x7d\x4e\x2a\x96\x3f\x93\xec\
-\xbc\x07\x12\x15\x44\x99\x8b\x44\x93\xe7\x88\xa6\x2e\xe0\x96\x5d\
-\x4b\xa2\x65\x2b\x24\xab\x51\x55\x30\x43\x0d\x54\x3d\x51\x6e\x06\
-\x55\xc5\x0c\xb4\x80\x47\xf3\xb3\x44\x17\x3f\xc4\x67\x86\xa1\xba\
-\x05\xa9\x5d\x89\x54\xad\x40\xc3\x2c\xf9\x53\x07\xd1\xd9\xcb\xcf\
-\x47\xca\xf7\x03\x27\x9a\x10\x11\xc0\xbe\x82\x04\x0f\x27\x5a\x36\
-\x23\xe5\xe9\x98\xd5\x75\xab\x49\xa6\x57\x11\x84\x73\x10\x94\x61\
-\x04\x98\x2a\x60\x98\xc8\x42\x6b\x96\xb6\x15\x78\x11\xf3\xc1\xad\
-\xbc\x09\x89\xf2\x58\x90\x8a\xff\x37\x05\x97\xc6\x35\x75\xe1\x07\
-\x8f\x3c\xe2\x9c\xbe\x6e\xd8\xbb\x09\x44\xaa\x51\x7d\xda\x2d\x6b\
-\x6d\x0c\xea\xdb\x62\x03\x85\x6d\x80\x24\xca\xe3\xdf\x62\x17\x98\
-\x2a\x3e\xf3\x09\xe1\xc4\x20\x9a\x9f\x45\xc3\x10\x0b\x52\x50\xd3\
-\x8a\x54\x35\x61\xb8\xc2\x95\x02\x89\x54\x81\xa5\x0a\x85\x92\xb9\
-\xfa\x76\xe4\xf2\xc7\x8d\x3a\x75\xfe\xbb\x86\x7c\x90\xc0\xec\x5b\
-\xb8\xe0\xee\xa0\x71\x03\x94\x55\x82\x8f\x28\x76\x51\x41\xdd\x0a\
-\x5b\xd0\xdc\x24\xf9\xf3\x47\x09\xc7\x4e\xcf\x69\x98\xed\x33\xd5\
-\x13\x66\x26\x06\x9b\x2d\x38\xd1\x29\xe9\xd5\x29\xd7\xb2\x0d\x4b\
-\xd6\x2c\xea\xdc\x22\x47\x0a\x08\x12\x15\xb8\xc6\x0d\xf8\xe9\xe1\
-\xdd\xa8\xef\x4e\x00\xa3\xa6\x3a\x1e\x8d\x9d\x5a\x25\x95\xf5\x50\
-\xb1\x1c\x4c\x4b\x20\xe2\x93\xd8\xf9\xfc\xc0\xdb\x44\x53\x43\x1f\
-\x99\xd9\x8f\x91\xe0\x10\x8e\xc9\x82\x14\x2f\xb7\x70\xee\x4e\x1d\
-\xeb\xff\x81\xce\x65\xb6\xb8\xd5\x3b\x20\x55\xbb\x40\xd0\x62\x52\
-\x11\x34\x3b\x8e\x1f\x1f\xc0\x4c\x47\x81\xd1\xe0\xc6\xed\x37\x0e\
-\x84\x46\x8f\x66\x27\xb6\xfa\x99\x91\x66\xa9\xa8\x43\x92\x35\x57\
-\x47\xaf\x9e\xf9\xb3\x47\x88\xc6\x4f\x7f\x24\xc8\x63\xe2\xdc\x21\
-\x81\xdc\x5b\xaf\xbe\x64\x1f\xf7\x9d\xb4\xb5\xed\x1b\xb3\x66\x7a\
-\x5c\x90\xf7\x75\x6e\xfa\x16\x34\x6a\x92\xda\x55\x0b\x99\x2c\x94\
-\x44\xa7\x87\x08\xcf\xbe\x83\x66\x86\x7b\x40\x9e\x64\x6a\xfa\x9d\
-\x60\xfd\x96\x6d\xa8\xea\x20\x22\x47\x6c\x7e\x66\xad\x9f\x1e\x6a\
-\x93\xea\x46\x91\xf2\xda\x52\xf4\x7e\x7a\x98\xfc\xf9\xa3\xf3\xf8\
-\xe8\x7b\x88\x1c\x02\x38\xf8\xca\x9f\x4a\x6a\x76\xf6\x54\x2f\x6b\
-\x3b\x36\xa2\xaa\x23\xc0\xb4\xcd\xcf\xec\x96\xea\xe6\x84\xa4\x6a\
-\xb0\xa2\x8d\xa9\x73\x84\x67\x0e\x9b\xe6\x26\xde\x42\xdc\x93\x4e\
-\xdc\x7f\xad\x3c\x45\xd0\xfb\xe1\x31\x7a\x3f\xec\x61\xc3\x96\xad\
-\x63\x86\xf4\x58\x34\x77\xaf\xab\x6a\x4a\x4b\x4d\x4b\x81\x88\x42\
-\x78\xf1\x38\x7e\x62\xf0\x38\x22\x3f\x02\xb2\x07\x5e\xfe\xe3\xa7\
-\x24\xf5\xec\x40\x1f\xab\xdb\x3b\x01\xb9\x88\xe6\xef\x26\x95\x6e\
-\x71\xd5\x2d\x18\xb1\x0d\xbd\xfc\x3f\xfc\xc4\xe9\x0b\x22\xee\x51\
-\x11\xfa\x8e\x1e\x7e\x8b\xe1\xb3\xa7\x3f\x35\x0b\x66\x0d\xcc\x44\
-\x4a\xac\xc5\x0c\x0b\x73\x60\x7a\x52\x23\x3f\x61\x9f\x25\xf4\x06\
-\x22\x36\x61\xaa\x27\x6d\xfe\xca\x22\x1e\x09\x04\x29\x40\xcc\x8c\
-\xd9\xc5\x26\x4a\xb3\xa0\xc4\xd6\x62\xe1\x8b\xe4\x29\x55\xd1\x24\
-\x32\x08\x3e\x03\x80\xa9\xc5\xce\x8c\x42\x04\xc5\x79\x51\xe0\x93\
-\x15\xf9\xb0\xb0\xdc\x62\x00\x66\x56\x69\xa6\x25\x02\x2e\xc0\xac\
-\xc0\x4c\xba\x82\xc0\xd5\xf3\x59\x4b\xc0\xb0\x7a\x13\xe9\x22\x59\
-\x5d\x10\xa0\x82\xfd\x70\x2e\x16\x23\xac\x72\xf1\x2d\xc1\xde\x47\
-\x9e\xa0\xb3\xeb\x7a\xc4\xc9\x26\xcc\x9e\x77\xe5\xe9\x1b\x12\xcd\
-\x9b\x85\x54\x4d\x89\xbd\x86\x10\x5d\x3e\xbd\xdc\x7c\x78\x42\x44\
-\x8e\xb7\x75\x6e\xe2\x74\xdf\xc9\xab\x7c\xef\xf8\x7a\x77\x31\x7d\
-\xdf\x24\x48\x3d\x11\xb4\x6c\x0b\x48\x55\x97\x4a\x69\x3e\x42\x67\
-\x86\xd3\x16\xe6\xda\xcc\xe8\x69\x5d\xb3\x6e\xac\x75\xcd\x3a\x82\
-\x2f\xef\xdc\xc9\x7c\x3e\xbf\x0b\xb3\x17\x5d\x4d\xd3\x2d\xa9\xb6\
-\x5d\xe2\x6a\x5b\x8b\xea\x13\x67\x22\x59\x85\xe6\xa6\x02\x9d\xb9\
-\xd4\x66\xca\xfb\x22\x8c\x5c\xd7\xb9\x89\x8f\xfb\x63\x10\x3b\xef\
-\xe9\x8e\x2f\x14\xd9\x66\xd8\x73\xae\xa1\xa3\xc5\x35\x6d\x88\x53\
-\x52\x34\x52\x9e\x46\x2a\x9b\x44\xb3\xe3\x6d\x3a\x3f\x73\xab\x19\
-\xfd\xa9\x4b\x7d\x83\xc1\x75\x9d\x1b\xbb\x81\x5f\x05\x75\xab\xdb\
-\x93\xeb\xbe\x86\xab\x6e\x62\x41\x78\x0b\x41\x89\xc3\x55\x35\xe0\
-\xaf\x8c\xad\xd0\xdc\xe4\x2d\xaa\x36\x6d\xca\x27\x6b\xda\x37\xcc\
-\xaf\x69\xdf\x20\x20\xf5\x88\xee\xc5\xec\x39\x57\xbb\xaa\x2b\xb8\
-\xf6\x66\x2c\x51\xbe\x48\x80\x0a\x86\x52\xb5\x48\xcd\x35\xe8\x7c\
-\xa6\xd9\xe6\x26\x6f\x0b\x2b\x1b\xfa\x13\x18\x69\x90\xfa\xa0\xb1\
-\x03\xa9\x6c\xc0\xd4\x5f\x1d\x7d\xe1\x44\xca\x97\x91\xea\xb8\x0b\
-\xce\x1d\xed\x0a\x47\x4f\xfd\xc6\xf2\xd9\x3e\xcc\x9f\x40\x11\x60\
-\x33\x41\xaa\x33\x68\x58\xb7\x20\xc5\x8b\xd8\x5c\x12\x35\x33\xa8\
-\xac\xc7\xd5\xb7\xe3\x27\x07\x1b\xcc\x34\x9d\x00\x5e\x53\x8d\x76\
-\x87\x97\x7a\xef\x73\xe9\xd5\x90\x48\x5d\x15\x7d\x71\xd2\x99\x59\
-\x0c\x62\xfd\x1d\x04\x4d\x9b\xca\xa3\xa9\x0b\xdb\x7c\x6e\x6a\x9b\
-\x0f\xc3\x78\x86\x54\x37\xc7\xc3\x48\x5c\xe1\x29\x79\xe1\xde\x62\
-\x1c\x00\x96\xcf\xa2\xa3\xbd\xa0\xfe\x0d\x90\xbf\x24\xbc\xea\x2c\
-\xf0\x0b\x3f\x35\xf4\xd5\x68\x7c\xa0\x31\x68\xde\x12\x17\x40\x5c\
-\x3c\x13\xc2\x1c\x04\xc9\xb8\x61\xcc\xe2\x72\x2c\x5b\x45\x59\x7a\
-\x15\x09\xef\xc9\x67\x33\xa8\x69\x21\xdd\x5a\x68\x67\x01\xf3\x58\
-\x94\xc7\x12\xa9\x18\x94\x29\x86\xe0\xc7\xfb\xf1\x99\xa1\x31\x90\
-\x5f\x8a\x48\x36\xe8\xd8\xbc\x15\x5c\xe2\x02\x1a\x36\x6b\x2e\x73\
-\x73\x50\x77\x2d\xe0\x88\x26\xcf\x13\x0e\x1f\x23\x7f\xfe\x28\x9a\
-\x9b\x42\xaa\x1a\xe3\xec\x14\x1c\x51\xc8\x8a\x86\xf3\xf1\xf7\x52\
-\xb1\x1d\x96\x9f\x25\x1a\xfe\x0f\xe1\xf0\xbf\xb1\xd9\xcb\x71\x87\
-\x96\x55\x60\xf3\x33\x44\x83\xff\xc4\xf2\xb3\x2f\x28\x89\xdf\x22\
-\x66\x02\xd0\xfd\xe0\xa3\x00\xed\x66\xb6\xdf\xa5\x57\x76\x98\x7a\
-\xa2\xcc\xa5\xac\x46\x73\xc7\xcc\xf4\x98\x99\xbb\xd7\xd5\x34\xaf\
-\x09\x9a\xb7\xe0\xea\xdb\x0a\xba\x60\xa8\x2a\x61\x36\x83\xaa\x07\
-\x40\xf3\x39\xa2\xc9\xb3\xf8\x4b\x27\xf1\x57\x46\xce\x98\xf7\x07\
-\xcc\x6c\x9b\x05\x65\x37\x50\xd9\x58\x69\x06\x3e\x33\xd4\x8f\xd1\
-\x0d\x0c\xf4\x1c\x39\x5c\x54\x42\x23\xf4\x36\x10\x38\xf9\x69\x34\
-\x79\x6e\x9f\xa9\x1e\x36\xe4\x6f\x88\x7b\x5f\xc4\x65\xd4\xfb\xdf\
-\x47\xd3\x43\x4f\x85\xd3\x9f\x7c\x23\x58\xd1\x55\x97\x6a\xbf\xb3\
-\xa0\x61\x0b\x82\x65\xaa\x44\x17\xfe\x45\x34\xda\x3f\x61\xea\x5f\
-\x47\xe4\xe7\x1a\x95\x7d\x40\x22\x4c\x9b\x0f\x6f\xb2\xa9\x0b\x77\
-\x19\xec\x8a\x53\x6f\x03\x85\xd8\x29\x3e\x5b\xb1\xfb\xfe\x87\x01\
-\x92\x40\xb5\x99\x4e\x01\x7a\xf0\xe5\x78\xe2\xdd\xbe\xe7\x3e\x5c\
-\xe0\x02\x9f\xcf\x3f\xeb\xaa\x1a\x7e\x98\xba\xfe\x41\x28\xab\x46\
-\x35\x22\xcc\x66\x30\x55\x34\x9f\x25\xdf\xfb\x67\x34\x3b\xfe\xac\
-\x37\xf9\x89\x13\xd1\xf7\x0e\xbd\x09\xc0\xf6\x1d\x77\x20\x82\x33\
-\xd3\x65\x66\x5c\x01\xf2\x3d\x47\x0e\x5f\x0d\xe0\xf3\xd6\xae\x7b\
-\xf7\x82\xe9\x6e\x12\x15\xaf\xa5\xb6\xdc\x9f\x74\x35\x2d\xa8\x8f\
-\x01\xa8\x19\xfe\xca\x25\xc2\xbe\xfd\x79\x0d\x73\x7b\x41\x0e\x14\
-\x9d\x7f\xde\x5a\xf2\x9b\x51\xdc\xcb\x72\xc6\xa2\xf9\x49\xcd\x4d\
-\x81\xb8\xf8\xf1\xbc\x78\x9c\xcb\x60\x51\x7e\x12\x38\xb3\x54\x9b\
-\xf0\x85\xdf\x0d\x19\x31\xd5\xe1\x68\xac\x7f\x85\x86\x59\xd4\x7b\
-\x7c\x3e\x17\x67\x60\xea\x02\x66\x7e\xd8\x60\x04\x6c\xc9\x06\x97\
-\x0c\xc0\x0c\x04\x99\x36\xac\x3f\xbc\xd4\xbb\xdd\x46\x4e\xc6\x82\
-\xb3\xe8\x15\x1d\xa4\xdf\xd0\x69\x59\x7a\x65\xf9\x3f\x7c\x22\x34\
-\x11\xca\x6c\x7f\xdb\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x38\x2d\x31\x30\
-\x2d\x31\x31\x54\x31\x37\x3a\x34\x34\x3a\x32\x32\x2b\x30\x32\x3a\
-\x30\x30\xa9\x6e\xf2\x52\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
-\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x38\x2d\x31\
-\x30\x2d\x31\x31\x54\x31\x37\x3a\x34\x34\x3a\x32\x32\x2b\x30\x32\
-\x3a\x30\x30\xd8\x33\x4a\xee\x00\x00\x00\x46\x74\x45\x58\x74\x73\
-\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\
-\x69\x63\x6b\x20\x36\x2e\x37\x2e\x38\x2d\x39\x20\x32\x30\x31\x36\
-\x2d\x30\x36\x2d\x31\x36\x20\x51\x31\x36\x20\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\
-\x6b\x2e\x6f\x72\x67\xe6\xbf\x34\xb6\x00\x00\x00\x18\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\
-\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\
-\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\
-\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\x00\x35\x31\x32\xc0\xd0\x50\
-\x51\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\
-\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\
-\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x35\
-\x33\x39\x32\x37\x32\x36\x36\x32\xc9\xad\x0e\x1e\x00\x00\x00\x13\
-\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\
-\x34\x37\x2e\x34\x4b\x42\x42\x52\x32\x42\xf1\x00\x00\x00\x57\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\
-\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\
-\x36\x2f\x49\x55\x78\x46\x79\x50\x73\x2f\x31\x36\x30\x33\x2f\x73\
-\x65\x74\x74\x69\x6e\x67\x73\x2d\x73\x65\x74\x75\x70\x2d\x73\x65\
-\x74\x2d\x67\x65\x61\x72\x2d\x6d\x65\x63\x68\x61\x6e\x69\x63\x5f\
-\x31\x30\x38\x36\x30\x34\x2e\x70\x6e\x67\xae\x02\xc5\xbe\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0b\x69\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x2c\x00\x00\x00\xa8\x08\x03\x00\x00\x00\x6d\xf5\x23\x3d\
-\x00\x00\x00\x60\x50\x4c\x54\x45\x82\x82\x82\xff\xff\xff\x83\x83\
-\x83\xfe\xfe\xfe\xfb\xfb\xfb\x7c\x7c\x7c\x7f\x7f\x7f\xbb\xbb\xbb\
-\xaf\xaf\xaf\x9e\x9e\x9e\x78\x78\x78\xd9\xd9\xd9\xc6\xc6\xc6\x99\
-\x99\x99\xf7\xf7\xf7\xd4\xd4\xd4\xf0\xf0\xf0\xe4\xe4\xe4\x8f\x8f\
-\x8f\xea\xea\xea\xa1\xa1\xa1\x89\x89\x89\xdf\xdf\xdf\x93\x93\x93\
-\xb7\xb7\xb7\xa0\xa0\xa0\xcd\xcd\xcd\xba\xba\xba\xa7\xa7\xa7\xc3\
-\xc3\xc3\xd6\xd6\xd6\x71\x71\x71\x9b\x04\x0b\xb3\x00\x00\x0a\xc4\
-\x49\x44\x41\x54\x78\x9c\xed\x9d\x0b\x7b\xa2\x3a\x10\x86\x49\x48\
-\x22\xa2\x28\x17\x11\x75\xb5\xfb\xff\xff\xe5\x99\x4b\x02\xa8\xa0\
-\xf4\x6c\x6d\x6b\xc8\xb7\x7d\xec\xd6\x0b\x95\xb7\x93\x61\x66\x32\
-\x89\x91\x09\x9a\xac\x48\x06\x4d\x56\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\xf4\x15\x0a\x13\x2f\xd3\x15\xa6\xa9\x3e\xa3\xc0\x6a\xb2\
-\x4c\x30\xac\x4f\x08\x67\xd6\x83\x9e\x4a\xe2\x97\x29\x33\xb6\xad\
-\x60\x5f\x0f\x25\x0d\x98\x95\x5e\x89\x4b\x0a\xb4\xc2\x60\x7c\x28\
-\x89\xc6\xa4\x3f\x44\xac\x0e\xda\xa0\xf3\xfa\xe9\x37\xf4\xab\x05\
-\x74\xcc\x56\xa8\x38\x56\x7f\xb4\x09\xac\x1e\x0b\x00\x9d\x84\x88\
-\xe1\x1f\xd2\xfa\xe9\x77\xf3\xcb\x65\x0c\xb1\x12\x31\xe8\xa0\x7f\
-\xfa\xdd\xfc\x5a\x19\xf6\xe7\x5b\xe0\x24\x04\xd1\x12\x8b\x9f\x7e\
-\x4f\xbf\x56\x70\x1d\x94\xcc\xca\xc2\x52\x22\x3e\x87\x81\x38\x22\
-\x08\x1a\xa4\xb3\x2b\x84\x25\x36\x67\xbf\xbd\xd6\x3f\xc4\x46\x52\
-\x22\x2b\xc6\x84\xb7\xc8\xea\x4b\xdf\xdb\xaf\x93\x8c\xfe\x67\x67\
-\x2b\xbe\xc6\xd0\x18\xb4\xc3\x10\x58\xa5\x5e\x47\xf0\x18\x52\xca\
-\xda\x4c\x4f\x53\x64\xef\x99\x12\xfc\x55\xcf\xb9\x6f\x76\xda\x67\
-\x54\xec\xa3\xc9\xcb\x4c\xea\xab\x86\x67\xd6\x36\xec\x34\x12\xe2\
-\xab\x2d\x20\x72\xb0\xd0\xae\x70\x5c\xfe\xe8\xe9\xbc\x54\x08\x00\
-\xce\x3a\x9d\xac\xa8\x35\x1e\x20\x87\x71\xbb\xb0\xce\x9d\x7d\xbb\
-\x91\x5e\xfb\xf7\x48\xa6\xc9\x6a\x3d\x55\x97\x7d\x49\x2e\x1c\x53\
-\x1c\x1e\x83\x8e\x16\xb0\x92\x54\xd4\xf2\xd6\xb4\xd0\xb9\xeb\x44\
-\x89\x4f\x28\x67\x5a\x60\x43\x2b\x42\xe5\x7c\xfb\x51\x63\xde\xe3\
-\x2f\x2a\x72\xd6\xc8\x2a\x7e\x02\xa8\x15\xd2\xa9\x32\x8d\x2f\xab\
-\x57\xc2\x39\x2b\xf4\x57\xcb\x14\x6d\xcd\x5f\x51\xb2\xa2\x0f\x9b\
-\x58\x7d\x06\x16\xd2\x42\xcf\xd5\x8b\xdb\xf9\x3a\xe8\xf9\x8c\x05\
-\x58\x02\xb0\x12\x9f\x84\x45\xb4\xea\xce\x5f\x71\xdc\x2e\x39\xee\
-\xf2\x56\x78\x19\x3c\x28\xa1\xa6\xb3\x02\xae\x0a\x07\x6d\x9e\x9c\
-\xe0\x07\xd5\xc5\xed\xe9\x4f\x9f\xcb\x17\x69\xe0\xaf\x6d\xdd\xb0\
-\x34\x1a\xed\x43\x91\x85\xf0\xd7\x38\x25\x67\x59\x3c\x12\xed\x77\
-\xeb\xdb\x97\xda\x60\x08\x66\x0d\xeb\xbd\xcd\x4b\xde\x07\x9c\xa6\
-\xc6\xcb\x20\x5f\xcf\xf0\xbc\x27\x19\x17\x3c\x4d\xc5\xce\xa3\x13\
-\x5c\x7a\x75\x0e\x0e\x9f\x96\x4c\xda\x79\xd6\x77\x76\xf3\x92\x67\
-\x5f\xae\x84\xc1\x63\x7b\xed\x27\x0a\xf0\xb5\x79\x2c\x78\x9c\xa1\
-\xc6\x57\xf8\x44\x7e\x4c\xeb\x36\x15\x97\x6f\x5e\x83\x1f\xfc\x63\
-\x9b\x1a\x8c\x6b\xef\xe2\x6f\xb4\x93\x6a\x97\x3d\x15\x5c\x0c\x6e\
-\x4c\x10\x63\x06\x7d\x15\x88\xbe\xb9\x93\x87\x41\x67\xf4\xad\x52\
-\x8d\xac\x14\x8f\x3f\x0e\x9e\x9e\xae\x4e\xd6\x69\x02\xb4\xae\x59\
-\xe5\x65\x0a\xc7\xea\x8e\xaa\xdf\xbc\x44\x63\xcc\xf1\x63\x7b\x23\
-\xb8\xa3\xe8\x5c\x74\x2c\x8a\xa6\x5f\x2f\x18\x2c\xd9\x70\x00\xbb\
-\x69\x2b\x7d\x7c\x71\xac\x4e\x37\xc7\x3d\xbd\xb9\x69\xe9\x64\xd4\
-\x63\xdb\x0b\x61\x51\xea\x81\x72\xc1\xf5\x69\xe3\x0f\x26\x4d\xe2\
-\x2b\x9f\x75\x7f\x61\x88\xbf\xed\xb4\x5e\x23\x9d\xc4\x3d\x38\xed\
-\x15\xdf\xdd\x25\x88\xd5\xbd\x3d\xdc\x18\x97\xc1\x1f\xe5\xe9\x0a\
-\x56\x77\x44\x7b\xdc\x58\xa8\x77\xbe\x18\x46\x3d\x58\x43\x82\x20\
-\xb3\xa8\xf5\x4d\x69\x79\x30\x75\xc1\x02\xe1\x4a\x88\xab\x71\x78\
-\x67\x57\x42\x7d\xe3\x89\xbd\x42\x0f\x61\xc5\xe2\x64\xf4\xa4\x44\
-\xc5\xc6\x65\xb3\x85\x85\xf7\x5f\x0c\x4d\xb9\x5f\x0f\x39\xb8\xb0\
-\xd1\x35\xae\xd7\x46\x04\xc6\x87\xb1\x86\x1d\xc5\x23\x47\xf4\x08\
-\xd6\xb5\xbb\xe2\x6a\xd4\xc5\x15\xa1\x38\x03\xc2\x40\x43\x9b\xfa\
-\x78\x58\x5c\xd6\xeb\xcb\x22\x69\xea\x48\xdb\xf9\x9f\xfa\xc3\xd6\
-\xaf\xf0\xe6\x2e\xde\xe2\xe1\xe9\x07\x2c\x57\x1f\xb8\x72\xc9\x10\
-\x66\x5d\x8c\x69\x8d\x8a\xe6\x2e\x22\x53\x26\xdb\x6a\xe3\x20\xe4\
-\xd5\x7a\x57\xa3\x7d\x19\xcb\x4a\x70\xdc\x2e\xae\xf9\x53\x0e\xc0\
-\x0e\xfe\x47\x4f\xf5\xdf\xe5\x60\x61\x6e\xd7\xd7\x46\xc5\x97\xd4\
-\x44\xed\xac\x28\xd6\xcf\xd3\xec\x94\x0b\x17\x54\x58\x38\xd5\xa2\
-\x4e\xb5\xd9\xb7\x25\x64\x00\x93\x57\xea\x56\x16\x9c\x07\xb0\xec\
-\x9f\x3f\x49\x65\x7f\xbf\x20\x93\x51\x0b\x0c\x4f\xc2\x47\x90\x01\
-\xa5\xe5\x87\x62\x07\x4e\x49\xa0\x72\x81\x46\xbe\xa8\xf7\xdd\x20\
-\x86\xb8\xbd\xa9\x4b\x46\xcc\xc7\x31\x26\x5d\x59\xc0\x1e\xc0\xb2\
-\xa3\xe6\x70\x1d\x04\x19\x37\xf4\x78\x24\x1a\x7d\xc8\x45\x5b\x57\
-\xb7\x95\x05\x1a\xae\x30\x1c\xdb\xaa\x0c\xd6\x19\x8e\x96\x51\x77\
-\xa8\xf4\xc3\x1f\xcb\xb2\xb0\x12\x7d\x95\x53\xd3\x2c\x1f\x9b\x95\
-\xc1\xef\x6b\xce\xa9\xc9\xa2\x94\x8b\xee\xbb\xf2\x95\xfb\x6f\x7e\
-\x4e\xef\x52\x73\x84\x25\x7c\x83\x35\x5a\x0a\x34\xa6\xdc\x5b\x4c\
-\xbd\x09\x8c\xb8\xf5\xdd\xee\x0a\xa1\x44\xbe\xd3\xb7\x99\x90\x94\
-\xe9\xca\x3d\xfe\x4d\x27\xf5\x2a\x3d\x81\x85\x02\xc3\x2a\x0b\xcb\
-\x45\x6d\x28\x43\xde\xaf\x56\xfb\x5c\x89\xae\xe9\xc3\x9a\x0e\xd6\
-\xfa\x6e\xc2\x32\xc0\xcd\xb0\x3c\xba\x1a\x3e\x80\x05\xe3\xb1\x70\
-\x4e\x0a\x6c\xe7\x74\x6e\xa8\xf0\x59\x67\xc9\x2a\xbf\xca\x24\x91\
-\x55\x7d\xdb\xf1\x3e\x2f\x58\xe0\xb9\xd6\x6d\xb0\xb0\xb9\x34\x5a\
-\xd3\x65\x0e\xee\xd6\xe9\x6e\xd3\x8f\x3f\x81\x15\x05\x63\x57\xa6\
-\x35\x1f\x58\x14\xbd\xeb\x84\x33\x19\x18\x76\xab\x86\xdc\x37\x15\
-\x58\xb1\xfc\xfc\xd1\x7a\x30\xf8\x4e\x35\xc2\xbb\x45\x4d\xb3\x82\
-\x25\x4d\x93\x73\x84\x10\xab\x45\x6a\x8c\x4d\x7b\x6c\x3e\xd8\xc1\
-\x8a\xc5\xd6\x0c\xa5\xdc\x9e\xc1\x8a\x9f\xc0\x3a\x91\x61\x81\x5f\
-\xc7\xb0\xd5\x35\xc2\x80\x5d\x51\x9d\xbe\x83\x85\x61\xed\xd0\x6f\
-\x90\x73\x81\x05\x32\xd9\xc6\x86\x9b\xd8\x99\x2d\xdd\x04\x8d\xc4\
-\x7e\x86\x8e\x15\x39\xb4\x62\x70\xf6\xc6\x2f\x58\x8f\x86\xa1\x91\
-\xe9\x96\x83\x4f\xb5\xa2\x82\x68\xed\x1e\x72\x39\x8e\x2b\x83\x92\
-\x69\xe9\x81\xfa\xb3\x5f\xc3\x70\x14\x16\xcd\xb8\x96\x39\x1b\xce\
-\xa6\xa4\xa0\xc0\xfa\x25\x23\xf7\xa2\x87\xca\xa6\x33\xab\xf4\xde\
-\x6b\xcd\x05\x16\x45\xdf\x07\x7b\xa2\x6b\x2e\xf6\x49\xca\xae\x23\
-\x62\x25\x5c\x51\xa7\xaa\xb0\x86\x05\x81\x45\x3d\x70\x8c\xb9\xc0\
-\xc2\x69\xfc\xad\x8d\xa1\x4a\x3b\x49\xc1\x29\x63\x5b\x93\xa1\xba\
-\x43\x7d\xe6\x1f\x55\x32\x34\x23\xe1\x15\xac\x71\x07\x8f\x75\xbd\
-\x9c\x59\x9e\x52\xdb\x8a\x8b\xaf\xe9\xd5\x64\x28\x6e\x4f\xa3\x8a\
-\xd3\xec\xed\xc0\x34\xea\x6c\x1c\x7c\x64\x1a\xfb\x70\xa2\x5d\x71\
-\xb9\x36\xc4\xaa\xed\x29\xca\x97\xa9\x4c\x4f\x5c\xb5\xa9\x86\x7e\
-\xc5\x6c\x60\x41\xf4\x4e\x8f\xaa\x46\x4b\x5b\xdf\x72\x76\x65\xe7\
-\x26\xa8\x4f\x46\x1f\xb8\xdc\xaa\xea\xbb\x71\x38\x1b\x9f\x25\xa3\
-\xf4\xc2\x8e\xbc\x92\xd4\x11\x8f\x95\xd3\x7a\xef\x26\xbc\x28\xaf\
-\xce\x70\x4e\x43\xef\x14\x0f\xcc\x66\xc0\x69\xcd\x06\x96\x5e\xf3\
-\xa3\x7b\x69\x3b\x86\x88\x95\x70\x25\x64\xf4\x57\xe8\xef\x75\xb6\
-\x61\x17\x9f\xf9\x0e\xeb\x51\x04\xaf\x4f\x0c\x66\x85\x3f\x58\xbb\
-\x72\x71\x3b\xda\xd5\x92\xeb\x57\x90\x3f\x32\xac\xe5\x3d\x2c\xbf\
-\x1c\xfc\x43\x58\xce\xb2\x28\xc6\xaa\x35\xc4\x0c\xbd\x39\x7a\x60\
-\x45\x6b\x01\x8c\x69\xc6\x2d\xcb\x2f\x58\xcf\x7c\x16\xc3\x32\x5c\
-\x05\x74\xad\xa3\xc4\xaa\xa1\xf5\x38\xd8\x03\x9e\xd9\x76\xa3\x7b\
-\x9f\x35\x17\x07\x2f\x3b\x58\x79\x8d\x71\x7b\x6d\x63\x51\x3b\x37\
-\xd1\xd0\x7a\x1c\x7b\x14\xbe\x7b\xbe\xb0\xf0\xe1\xb3\x0d\x1d\x76\
-\x30\xe0\xca\x95\x50\xdc\xdd\x47\x17\x48\xac\x21\xdb\x5c\x90\x99\
-\x02\xbf\xa1\x2a\xcf\x6c\x60\x45\xf5\x86\x1f\xbe\xa4\x51\xd9\x9b\
-\x77\x86\xf8\x73\xc9\x6b\x01\xf0\x49\xb8\x25\x08\x05\xa5\xfb\x19\
-\xe7\x86\xe0\x90\x74\xc1\xbe\x7c\xff\x17\xfd\x55\xd7\x95\x9b\xd3\
-\x22\x1d\xfb\x0a\xd3\x28\x2e\x10\x5e\x06\xfc\xfb\x4c\x60\x61\x75\
-\xc1\xac\x6d\x98\xb0\x2b\x84\x70\x93\xab\xd8\x5b\x4b\xfd\x35\x76\
-\x18\xa6\x6b\x3b\xe3\xbc\xbc\xcf\x0d\xe7\x02\x8b\xf6\x91\xd9\xd9\
-\x75\x03\x1b\x17\x89\xaa\xd8\xce\xe3\xf0\x53\x10\xa8\x0b\x1c\xf2\
-\xa1\x3c\x7a\x2e\xb0\x70\x56\x4b\x57\xb6\xe1\xaa\x6d\x8b\x8f\xe3\
-\x0a\xe3\x76\x69\xd7\x4e\xf3\xc2\x15\xb2\xb7\xb5\x1e\x5a\xab\xea\
-\x15\xac\xf1\xa0\x14\x47\x5a\x7a\x68\xd3\x9b\xd6\xb7\xb3\x5d\xb9\
-\xa9\x0b\x7d\x70\x31\x6a\xa3\x07\xd6\x9b\xcc\x25\x28\xa5\x7c\xb0\
-\x2e\x7a\x17\xc1\x98\x7c\xbb\x91\xbd\x76\x65\xbd\xcc\x2d\x8b\xb5\
-\x8e\xea\xa1\x19\x8b\x79\xc0\x22\xfb\xd1\x89\x52\x1d\x2c\xb0\x2b\
-\xb4\x9f\xae\x83\xf9\xef\xd9\x96\x07\x09\xe2\x9c\xe3\x2c\x3c\x7b\
-\x9e\x64\x6d\x2d\x0b\x17\xf6\xda\xc1\x06\xd6\xa5\xa3\x4b\xee\xfa\
-\x8f\x86\x37\x31\x9a\x0d\x2c\x43\x6d\xa4\x7b\xa1\xba\x96\x86\xa2\
-\x64\xdf\x4e\x01\xa9\xd6\xd9\x07\xfb\x7c\xb8\x59\x0d\xef\x96\xe1\
-\x19\xac\x47\x55\x07\xa9\x65\xd1\xaf\xb7\x8b\x3c\xa9\xb9\xad\x1b\
-\xd7\x47\x35\x27\x65\xdb\x20\xc0\x93\xd5\x23\xcb\x98\xfc\x72\xf0\
-\x0f\xae\x86\xc0\xaa\xea\xad\x79\xc2\x76\x35\xa1\x8a\x53\x72\x3e\
-\x1e\x77\x87\x8f\xb6\x6f\x12\xc4\x9d\x59\x43\xf2\x0b\xd6\x03\x07\
-\xaf\xcb\xaa\xab\xb7\x73\xac\xc5\xdd\xb7\xd4\x81\xdc\x5b\xef\x83\
-\x1d\x7f\xc3\x0b\x73\x3c\x1b\x86\xc3\xb0\xb0\x50\x65\x1a\x37\x47\
-\xdf\xb5\xc9\xdb\xfe\x7f\xd7\xe5\xce\xb7\xfb\x6c\x74\x07\xa3\x59\
-\xc0\x02\x5a\xa6\x57\x67\x50\xbd\x86\xe4\xd6\xd0\x6c\x61\x4b\x6d\
-\xeb\x31\xbb\xa2\x03\xcd\x02\x56\x2f\x1c\x85\x51\x57\xad\x95\xed\
-\xe9\xee\x46\x25\x75\xb8\xe5\x09\xae\x14\x8e\x46\x97\xd6\x7b\x05\
-\x6b\xd0\xc1\x4b\x0a\xdd\x45\xe7\xac\xaa\x3a\x6d\x4e\x1b\x9e\x78\
-\x76\x79\x22\x7e\xcb\x2f\x74\x19\x1c\xdd\x12\xc4\xfb\x61\x48\x3d\
-\x6c\xe8\xdb\x5b\x17\x0e\x71\x3b\xf6\x91\x66\x97\xbc\xcb\xa9\xd1\
-\xe0\xf6\x07\xea\x31\xe5\x32\xe0\x20\x2d\xbf\x61\xd1\xa2\x54\xb0\
-\xab\xca\xf5\x6d\x73\xdc\x9e\x92\xe9\x68\x79\xbc\x6c\x8b\x3c\xdf\
-\xa8\x3c\x2f\x4e\x87\xc6\xd8\x06\x88\xf1\x35\x89\xde\xc3\x02\x23\
-\xc2\xce\x77\x5b\x99\xb1\xf9\xa0\xf5\x49\xb8\x36\xbf\x6c\xb2\xac\
-\x2c\x25\xfc\x77\x60\x5f\x88\x1b\x79\x0f\xcb\x95\x1a\x62\xeb\x98\
-\xaa\xb2\x57\xa8\x92\xd2\xae\x84\x9a\xb6\x4f\x83\xdf\xb0\xfa\xb1\
-\xa8\xe8\xea\x57\xbd\x06\x48\x63\x17\x94\x0f\x76\x27\xdf\xca\x77\
-\x58\xa6\x29\xac\x6f\xa7\x53\x2c\x32\x2d\xdd\x52\x3a\xc6\x24\xdb\
-\xb2\xc3\xf3\x5f\xe0\x23\xac\xb8\xed\xc0\x02\xbb\x2a\xda\x1c\x87\
-\xfd\x15\x39\xf0\xf6\xb3\x02\xac\x3b\x97\xfd\x0a\xe0\x98\xa4\x85\
-\x15\x7b\x07\x4b\xd6\xb4\xcd\x1f\xb1\xe2\x45\x5f\x10\x8b\xe6\xa5\
-\xdd\x2b\xcc\xde\x4a\x4b\x60\xaa\x0c\x25\xd2\x7c\x40\x0f\x60\x59\
-\x0b\x4a\xfe\x62\xe9\x25\x4a\xd9\x5f\xb9\x1c\xa7\x32\xda\x68\x7d\
-\xbf\x5f\xcd\x27\x64\xfe\xf2\x2e\x9c\xde\xc0\x82\x53\xb9\x64\xcb\
-\xe5\xf2\xb8\x3c\x17\x3c\x5f\x4a\xb0\x44\xbe\xcb\x76\xcb\x23\x7c\
-\x2d\xff\xa7\xe0\x85\xc7\xac\xf0\x6d\x18\xc6\xdd\xe2\xef\xae\xb3\
-\xef\x76\x99\xf9\xff\x94\x6b\x3f\xf5\x07\x96\x2b\x58\xc5\x57\x93\
-\x84\xee\xde\x7f\x91\xab\xe5\x78\x03\xeb\x1b\x14\x60\xcd\x0d\x56\
-\x1c\x60\x4d\xd4\x88\x65\xbd\x86\x9f\x4f\xb0\x3a\x42\x2f\x32\xb6\
-\xf7\xde\x6c\x0c\xb7\x4f\x6e\xf9\xf4\x02\x86\x57\xc1\x7a\xeb\x0d\
-\xe1\x71\x72\x7e\xb1\xf8\xb3\xf8\x93\xac\x55\x57\x58\x57\xa2\x38\
-\x2c\x5e\xa0\x3f\x8b\x77\x66\x85\x32\x38\xbb\x9c\xd6\xfb\xb8\xb7\
-\x16\x60\xdf\xfc\x4b\x7a\x33\x9a\xf6\x68\xf3\xa4\x50\xf8\xdb\x45\
-\x5b\xce\xd8\xfa\x15\x6f\x33\x4a\xfb\x47\xda\x2d\x8a\xbe\x54\xf8\
-\x19\x17\x5f\x7b\xc4\xef\x15\x55\x11\x8c\x2e\xf3\xfe\xde\x3b\x55\
-\xdd\x16\xfa\x26\xd7\x16\xa6\xe8\x47\xcf\xf4\x0b\x44\xa5\x29\xdd\
-\x54\x3c\xbd\xc5\x9e\xbd\xa8\x75\x5b\x16\x0d\xb0\x6e\x84\xac\x54\
-\xb7\x28\x1c\xc6\x60\x3d\xa9\x04\x3a\x3b\x01\x93\x94\x59\x59\x58\
-\xa2\x68\x70\xdb\xfc\x9f\x7e\x5f\xbf\x52\x60\x41\x3b\xec\x72\x54\
-\x6e\xcf\x69\xf4\xed\xd2\xbc\xf5\xb6\xed\xaf\x93\x89\xfe\xc4\xf4\
-\x21\xa0\x1c\x36\x14\x35\x2d\x82\x7e\xf3\x2b\xfc\x8b\x84\xc3\xf0\
-\xcc\x2b\x76\xb1\xde\x5e\x94\x46\x1a\x39\xde\xb7\x30\x7b\x49\xdc\
-\xc8\x9d\xf7\xb0\x28\x78\xd5\x78\xd0\xa8\x8c\x44\xdb\x72\xfe\xea\
-\xad\x3f\x37\xe1\xc5\xa2\x09\x53\xa9\xcf\x8a\x62\x51\xf4\xed\x6f\
-\x1d\x63\xbf\x5a\xbc\x5e\xf0\xbc\xe1\xbd\xcc\x4d\x88\xb0\x1e\x8b\
-\x3e\xc6\xe2\xb0\xca\x52\xea\x5d\x08\xac\x1e\x0b\x3f\xb8\x91\xda\
-\x62\x02\xa8\xe7\x92\xdc\xbc\x20\xdf\xba\x32\xf7\xad\x32\x53\xda\
-\x3c\x82\x5c\x5f\x64\x14\x1c\xd6\x14\x71\x03\x91\x7c\xf3\x4f\xa7\
-\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\
-\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a\xfa\xac\x4c\
-\xd0\x64\xfd\x07\xd3\xff\x8c\x45\x70\xbf\xe1\x50\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\xce\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x02\x80\x49\x44\x41\x54\x68\xde\xed\
-\x99\x4f\x48\x15\x51\x14\xc6\x7f\xa6\xf4\x2c\xcb\x04\x4d\x28\x22\
-\x88\xda\x04\x05\x89\x44\x88\x42\x81\x90\x20\x42\x9b\x16\x51\x08\
-\x2d\x02\x83\x20\x5b\xb4\x88\x20\xdd\xb4\x09\x77\x2e\x0c\x94\x68\
-\x51\x12\x2e\x02\x37\x2e\x82\x68\xa1\x28\xe8\xea\x29\x41\x41\x8b\
-\x30\x5b\x44\xb5\xe8\x2f\x29\xea\x4c\x9b\xf3\x60\xb8\xcc\x34\x77\
-\x66\xee\x9d\x3f\xf1\x3e\xb8\xbc\xfb\x60\xee\x9d\xf3\x9d\xef\xdc\
-\x73\xcf\xbd\x03\x05\x47\x4d\x8c\x31\x3b\x12\xbe\xd3\xc9\x9a\xc0\
-\x56\x82\xf7\x6d\x03\xbb\x4c\x92\xa8\x8b\x31\xa6\x36\x4f\x21\x14\
-\x87\x80\xab\x28\xe8\x46\xe8\xe7\x82\xc0\x7f\x0b\xd7\xd3\xb6\x0c\
-\x2c\xf6\x4c\x14\x70\xf3\xe8\xd9\x96\x08\xc6\x3b\xd2\x52\x53\x20\
-\x0c\x07\x81\x75\x60\x06\xe8\x0b\x31\x2a\x93\x10\x0a\xc3\xb0\x78\
-\xb4\xe2\xdd\xf7\xc0\x1d\xa0\xb5\x08\x0a\xd4\x01\x1f\x15\x02\x95\
-\xdf\x75\xe0\x29\xd0\x99\x67\x02\x17\x95\xb0\x08\x6a\xcb\xc0\x40\
-\x0a\x21\x54\x0f\x9c\x89\x32\xe0\x95\xc7\xa3\xaa\x02\x8e\xcf\x7f\
-\x6f\x7f\x1b\x68\x03\x1a\x0c\x18\x7e\x04\x78\x00\x7c\x06\xbe\x03\
-\x7b\x75\x06\x1d\x0f\x30\x54\x97\x80\xeb\x21\xf2\x01\x78\x09\x8c\
-\x01\xb7\x80\x5e\xe0\x98\x66\x0a\x7f\x26\x6a\x7a\xe7\xbe\xae\x43\
-\x60\x54\x33\x7c\x92\xb4\x0d\xa0\x2c\xa4\x9a\x02\xec\x18\xf3\x19\
-\x57\x0e\x33\x7e\x0f\xf0\x2d\xc0\xa3\x51\x15\xd0\xe9\xbb\xc0\x2f\
-\x60\xc2\x87\xc8\x49\xe5\xd9\xaf\xc0\x08\xb0\xf3\x5f\x04\x06\x52\
-\xf0\xbe\x5f\x5b\x0b\x08\xab\x39\x60\x09\xb8\x2a\xa5\x78\x28\xca\
-\x21\xde\xb2\xa1\x80\x03\xdc\x0b\xb0\xa7\x31\xca\x8a\xef\xd2\x7c\
-\x99\x69\x02\x1b\xc0\x01\x13\xb9\x76\x32\xa3\xf0\x99\x32\x61\x7c\
-\x49\xe2\x30\x0b\x05\xce\x9a\xda\xed\x4a\xc0\x15\x60\xde\xd0\x3e\
-\xa0\xd3\x7f\x6d\xab\x94\x38\x05\x8c\x4b\x8a\xb3\x19\x3e\x37\x6c\
-\xd7\x44\xfb\x80\x41\xe0\x8d\x05\x05\x7e\x44\xcd\x32\x49\xaf\x60\
-\xba\x81\xe7\xc0\xa6\x21\x02\x0f\xb3\xaa\x54\x0f\x01\xd3\x09\x43\
-\xc7\x91\x9d\x36\x53\xdc\x94\xb3\x41\x1c\x05\x66\x35\xe6\x1f\x92\
-\x03\xd4\x7e\x9b\x24\xda\x81\x77\x31\x08\x5c\xd2\x58\x7b\x3f\xe5\
-\xd9\x3f\xc0\x13\xa0\xc3\x16\x89\x46\x29\x7d\x75\xc3\xe7\x53\x58\
-\x41\x26\xea\xfa\x85\xdd\xa2\xcd\xdb\xc1\x6b\xc0\x6f\x0d\x05\xee\
-\x47\xa8\xc9\xd4\x39\xa6\x6c\xaf\x8b\x13\xb2\x39\x05\x11\xd8\x04\
-\x0e\x6b\xcc\xd3\x0c\xdc\xf6\x09\xcf\x73\x69\x2c\xee\xdd\xc0\x23\
-\x8f\xd1\xde\x36\x1d\x23\x7d\xf7\xc8\xb8\x95\xb4\xb3\xd4\x65\x60\
-\x55\x51\xe0\x7c\xc2\x52\x27\x75\xd4\x02\x17\x80\x17\xc0\x5b\xe2\
-\x7d\x93\xc8\x0d\x1a\xa8\x22\x7f\x28\x15\xd1\xe8\x7a\xa0\x1f\x58\
-\x90\x2b\xca\x42\xe1\x28\xf0\x45\xb9\x67\x6d\x2d\x12\x81\x1a\xc9\
-\x46\xde\x53\xde\xdd\xa2\xa9\x30\xa8\x6c\x6e\xab\xe4\xec\xeb\x67\
-\x18\x9a\xe4\xa8\x5a\xd9\xe0\x96\xe4\x8c\x51\x28\x8c\x02\x8f\x81\
-\xd3\xd5\x44\x5c\x45\x15\xf1\xf1\x17\x95\x9d\x24\xc6\xf6\x45\x23\
-\x75\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x60\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\x62\x4b\x47\
-\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\x70\
-\x48\x59\x73\x00\x00\x0f\x1e\x00\x00\x0f\x1e\x01\xfa\xec\x7d\x44\
-\x00\x00\x05\xd6\x49\x44\x41\x54\x58\xc3\xb5\x97\x5b\x6c\x5c\xe5\
-\x11\xc7\x7f\xdf\x39\x67\x77\xbd\xf6\xc6\xf1\xda\x8e\xed\x78\x63\
-\x2b\x34\x8e\x13\x90\x2d\xd7\x10\x20\x10\x70\x9d\x50\x22\x04\xbd\
-\xd0\x2a\x94\x48\x81\x2a\x88\x0a\xa8\x5a\x10\x17\x01\x02\x09\x68\
-\x53\x78\xe2\x01\xa1\x82\x2b\x9e\x2a\x2a\xf5\x02\xa8\x22\xa4\x85\
-\x2a\x4a\xab\x14\x2c\x04\x71\xa0\x09\x6b\x02\xc6\xb2\x63\x92\x60\
-\x3b\x8e\xe3\x5d\xef\x66\xef\xe7\x32\x3c\x9c\x63\x63\x87\x5d\xdb\
-\x72\xd2\x79\xf9\xa4\x73\xe6\xcc\xfc\x67\xe6\x3f\xf3\xcd\x51\x5c\
-\x3c\x79\x08\xf8\x15\xe0\x2c\x41\x57\x01\xe3\xc0\xf3\xc6\x45\x04\
-\xb0\x7e\x43\x59\x68\xdd\xae\xea\x08\x9a\x52\x80\x14\x55\x12\x81\
-\x69\x07\xde\x3d\x37\xd9\xf2\x51\x3a\x56\x73\x31\x01\xd0\xec\x0f\
-\x72\x57\x6d\x13\x3e\xa5\x4a\xea\x08\x30\x66\x82\x29\xf0\x51\x3a\
-\x76\xd9\xc5\x00\xe0\x03\x74\x40\x17\x04\x4b\x04\xb5\x80\xb2\x00\
-\xb6\x7c\x93\x9f\x0b\x05\x70\x13\x70\x2f\x10\x06\xd6\x2e\xc7\x80\
-\x01\x68\x40\x2d\x10\xa4\x54\xe1\xe6\x8b\x02\x26\x81\xcb\x0c\xa5\
-\x5e\xf9\x51\x55\x7d\x73\x7b\xb0\x92\xbf\xc5\x46\x09\x28\x0d\x6d\
-\x19\x00\xee\x53\x9a\xfe\x4b\xdd\xe7\xaf\x5c\xca\x07\x8e\x65\xea\
-\x8e\x6d\xbd\x04\xe8\x1b\xca\x42\xcd\xbf\x6d\xdc\x40\xbd\x11\xa0\
-\x7b\x45\x0d\x19\xc7\xc6\x50\x6a\x49\x51\xcc\x05\xf0\xcc\xfa\xef\
-\xff\xac\xae\x65\xdb\x0e\x44\x16\xee\x20\xa5\x14\x9f\xbe\xf9\x0a\
-\x27\x0f\x1d\x88\x00\x23\x79\xc7\x21\x65\x5b\xd4\x1a\x7e\x26\xcd\
-\x02\x39\xb1\xe7\x39\xd7\x50\x28\xe5\x32\x5f\x29\xb0\x45\x8a\x02\
-\xa8\xab\x5d\xdf\x41\xe4\x8a\x6e\x1c\xdb\x2c\x91\x73\x05\x4a\xa1\
-\x94\xc6\xf1\xde\x7d\x33\x65\xd8\x37\x9c\x4f\xdf\xf1\xc0\xa9\x63\
-\x9d\x2d\x81\x72\xfe\x73\x6e\x8a\xce\x60\x25\x5d\xa1\x1a\x0c\xa5\
-\xd0\x80\x91\x42\x86\x7d\xd3\x13\xc4\xac\x02\x5b\x57\xd4\xb0\x25\
-\x54\xed\xb5\xe8\x7c\x00\x88\x38\x88\x6d\x21\xb6\x5d\x2c\x6c\xc4\
-\x71\xc8\x4e\x4f\xe2\xd8\x16\x76\x2e\xeb\x06\x07\x43\x02\x77\x1d\
-\x4e\x4f\xdf\x71\x38\x3d\x5d\x07\x5c\x6e\x07\xa5\x4d\xbc\xc8\x87\
-\xf3\x69\xee\x3f\xf5\xa9\x1c\xcd\x24\x07\x80\xf8\x6b\xf1\xb1\x8e\
-\xa7\x57\xb7\x56\xec\xac\x6e\xfc\x36\x80\x05\x72\x8e\x95\xcb\xd0\
-\xff\xf7\x3f\x70\xfc\xdd\xbd\xb6\x6d\x16\x1c\x33\x93\xf2\xcd\xd1\
-\xf8\x04\x88\xe2\x92\xb7\x47\xa0\xcd\xfb\x8c\x37\xa7\x4f\x73\x34\
-\x93\x3c\x02\xdc\x0e\x8c\x25\x6d\xeb\x99\x57\xa7\x4e\x3d\xb6\xbd\
-\x72\x15\x4a\xf9\x96\x06\x40\x29\x8d\x91\xde\x7f\x10\x7d\xfd\xf7\
-\x67\x6c\xb3\xf0\x3b\xe0\x2b\xe0\x41\x20\x3e\x47\x6d\xb6\xb0\xca\
-\x4b\x8d\x02\x62\x96\x89\xa7\x7f\x12\x28\x00\x5f\x24\x6c\x4b\xf2\
-\xe2\x28\x4d\xa9\xd9\x59\xb1\x70\x06\x44\x98\x1c\xf8\x1f\xb6\x59\
-\x38\x00\xf4\xe0\xce\xf9\x43\x40\x51\xb2\x7c\x9e\x4d\xf1\xc4\xe8\
-\x00\xba\x52\x44\x33\x49\x80\xad\xc0\xad\x40\x2f\x70\x77\xca\xb1\
-\xd4\xf3\xa7\x87\xb1\x50\x0c\xe6\xd2\x4b\x29\x01\xf8\x43\x95\x00\
-\xdf\x01\x9a\x80\x33\xc0\xcd\xc0\x14\xb0\xf7\x3c\xed\xfd\xa3\x66\
-\x4e\xfb\x4b\x6c\xd4\xc4\x9d\x8c\x78\x67\xce\xf3\x73\x28\x66\x99\
-\xd1\xd7\xe3\x63\xf2\x8d\x75\x52\x8b\x4e\xc2\x96\x6d\x3b\x18\x3b\
-\xd2\xbb\xf9\xec\x50\xf4\x2d\x20\x06\x5c\x0b\xfc\xf1\x3c\x00\xdb\
-\x80\xed\x9e\xa3\xf7\x81\x37\x3c\xc7\x73\xe5\xe1\x62\xf6\x17\x04\
-\x20\x8e\x43\x78\xed\x46\xba\x1f\xef\x51\x27\x3e\xdc\xdf\x61\x66\
-\x52\x8c\x47\xdf\x67\xe2\x58\xdf\xdc\x86\xde\xaa\x19\xfe\x57\x23\
-\x97\x77\xad\xf1\x57\x54\xf2\xd5\xc7\x07\x77\xe5\x93\xf1\x4a\xe0\
-\xe5\xc5\x82\x03\xe6\x4c\xce\x12\x37\x98\x38\x0e\x2b\xd7\xac\xa3\
-\xe3\xb6\x5f\xb3\x69\xf7\x13\x84\xd7\x6e\x3c\x5f\xe5\xc7\x91\xce\
-\xeb\xd7\x74\x3f\xd6\xc3\xf7\x1e\x7d\x89\x0d\x37\xed\x2a\x03\x7e\
-\x8e\x7b\x3f\x2c\x2a\x06\x80\x63\x99\x58\xf9\x2c\x62\x5b\x2e\x16\
-\x4d\x47\x33\x7c\x20\x82\x6d\x16\x98\x25\xba\xd2\x70\x5c\x76\x1b\
-\x80\xdf\xb3\x51\x6e\x94\x95\xa3\xfb\x03\x68\x9a\x8e\x2f\x18\x02\
-\x28\x07\x2a\x80\x8c\x57\x6b\x13\xb0\x8b\x01\x50\x80\x84\x1a\x2f\
-\x21\x58\xd3\x00\x22\x68\x40\xa0\xa2\x92\xab\x7e\xf1\x34\x67\x06\
-\x3e\x66\x70\xff\x5f\x11\x05\x8e\xb8\xda\xe7\x46\x47\xc8\xc5\x26\
-\x46\x81\x2f\x3c\x1b\xad\x46\x59\xf9\x9a\xae\x47\x5e\x24\xdc\xd4\
-\xca\x81\x3d\xbb\x49\x8e\x8d\xc4\x71\x67\x84\xe3\x65\xb9\x0f\xf8\
-\x0d\x90\x2d\x9a\x81\x8e\x44\x9c\xb6\x9c\x49\x4e\x6c\xde\x4e\x4c\
-\x52\x68\xdf\x8c\x2f\x18\x22\x10\xaa\x22\x7e\x72\x90\xb6\x42\x81\
-\x2b\xca\xab\x00\xa1\x37\x95\x64\xa2\xa5\x3d\xd2\x7c\xe5\x0d\x91\
-\x99\x21\xaf\x94\xc6\x8a\xba\x26\x8c\x60\x05\xad\x37\xde\x8e\x55\
-\xc8\x85\x45\xa4\xdb\xca\xa7\x39\x3b\x14\x65\xa2\xbf\xaf\x01\x78\
-\xa1\x24\x80\x5b\xaa\x1a\xb8\x67\x55\x33\x27\xf2\x59\x0e\xa6\xe2\
-\x44\xae\xff\x21\xa1\xba\x08\xc1\x70\x1d\x0d\x9d\x5d\xb4\x45\x0f\
-\xb1\xa7\xe9\x52\x00\x1e\x3d\xd1\xcf\x87\xad\x9d\x6c\xda\xfd\x24\
-\xe2\xcc\xb9\xbc\x44\x10\x84\x8e\x9d\x0f\xce\x90\x87\xf4\xb9\x09\
-\x06\xfe\xf9\x27\x26\xfa\xfb\x16\xe6\x80\xbb\xa5\x08\x41\x4d\xa7\
-\x46\xf7\x31\x39\x14\x25\x9b\x98\x22\x33\x75\x9a\xc4\xa9\x41\xea\
-\x7d\x65\x08\x20\x22\xee\x89\x60\xe5\xb3\x28\xa5\xa1\x19\xc6\x3c\
-\x20\x22\xb6\x77\x8a\xfb\x7c\x91\x1b\x76\xb6\x0d\x05\xa8\xd2\x0d\
-\xee\xac\x6d\xe2\xb9\xff\xee\xe5\x9d\xe1\x7e\x0a\xe9\x24\xeb\xa6\
-\x63\xfc\xa0\xa9\x0d\x99\xe5\xa1\xc6\x78\xf4\x03\xf6\xef\xd9\x4d\
-\xa0\x62\x25\x1b\xb7\xef\xa4\xf1\xbb\x5d\x2c\x6d\x97\x59\x00\x00\
-\x1e\x63\x76\x54\x37\xb2\x36\x50\xce\x67\xa9\x04\x7e\x15\x60\x4b\
-\x73\x3b\x97\xf8\x83\x38\xb8\x04\x45\x69\x04\xc7\xbf\xe4\x96\x4c\
-\x96\x93\xf9\x0c\x1f\x1c\xeb\xe3\xba\xc7\x7b\x68\x68\xdb\x8c\x38\
-\xf6\x85\x01\x00\x97\xb2\xd7\x84\xc2\x5c\x1b\x72\xdb\xd8\x11\x70\
-\xbc\xe8\x04\xb8\x2d\xbc\x9a\x9f\x56\x35\x70\x75\x45\x98\x84\x6d\
-\x72\xf7\xf1\x23\x7c\xd9\xf7\x6f\x1a\xda\xae\xbe\xf0\x0c\xcc\x48\
-\xb1\xcd\x65\x46\x74\xa5\x28\x53\x1a\x9a\x02\x4d\x29\x74\x05\xe2\
-\x58\xcb\x72\x5e\x12\x40\x29\x51\xc0\x6b\xb1\x31\xde\x4b\x9e\xe5\
-\x27\x2b\xeb\x19\xce\xa7\x38\xea\xf3\x71\xdd\xa6\x1b\xbc\xb7\xff\
-\x67\x00\xe0\xb2\x7b\xbc\x7a\x15\x7f\xae\x8f\xe0\x0b\x56\x70\xd5\
-\x8d\x3b\x69\x68\x5f\x5e\xfd\x97\x07\xc0\xb1\x69\xea\xec\x66\xcb\
-\x7d\xcf\xa2\x94\x42\xf7\x07\xe6\xcf\x83\xd2\xc9\x2b\x0d\x40\x03\
-\x0c\xb5\x78\x0a\x95\xbb\x9e\xa2\x74\x03\x5f\x79\x08\x3c\xc7\x4a\
-\xff\xf6\xdf\x80\x88\x83\xa6\xcf\xac\x05\x38\x94\xe8\x53\x03\x18\
-\xfc\x57\xe2\x4c\x6b\x4e\x16\xff\xa9\x55\xc0\x67\xf9\x34\xf1\xe3\
-\xc7\xe8\x7f\xe3\x65\x4a\xf7\xbe\x42\xc4\x21\x9f\x4d\x30\x7a\xf8\
-\x20\xc0\x10\x90\x2c\x65\xf3\x56\xdc\x65\x61\x35\xcb\x9d\x26\x0b\
-\x63\x1e\x03\x9e\x02\xde\x2b\xa6\xf0\x35\x8a\xcb\x57\x2d\x02\x9b\
-\x66\x40\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\
-\x72\x65\x61\x74\x65\x00\x32\x30\x31\x38\x2d\x30\x35\x2d\x30\x34\
-\x54\x31\x33\x3a\x32\x34\x3a\x34\x33\x2b\x30\x32\x3a\x30\x30\x47\
-\x68\xf0\x1d\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\
-\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x38\x2d\x30\x35\x2d\x30\
-\x34\x54\x31\x33\x3a\x32\x34\x3a\x34\x33\x2b\x30\x32\x3a\x30\x30\
-\x36\x35\x48\xa1\x00\x00\x00\x46\x74\x45\x58\x74\x73\x6f\x66\x74\
-\x77\x61\x72\x65\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\x69\x63\x6b\
-\x20\x36\x2e\x37\x2e\x38\x2d\x39\x20\x32\x30\x31\x36\x2d\x30\x36\
-\x2d\x31\x36\x20\x51\x31\x36\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\
-\x77\x77\x2e\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\
-\x72\x67\xe6\xbf\x34\xb6\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\
-\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\
-\x68\x65\x69\x67\x68\x74\x00\x35\x31\x32\xc0\xd0\x50\x51\x00\x00\
-\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\
-\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\
-\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\
-\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x35\x32\x35\x34\
-\x33\x33\x30\x38\x33\xb4\xcb\x27\xe6\x00\x00\x00\x13\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x31\x39\x2e\
-\x34\x4b\x42\x42\x3a\x00\x0c\x26\x00\x00\x00\x4f\x74\x45\x58\x74\
-\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\
-\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x34\
-\x39\x6a\x4a\x4c\x38\x76\x2f\x31\x34\x35\x39\x2f\x32\x37\x39\x39\
-\x32\x30\x31\x2d\x6a\x69\x67\x73\x61\x77\x2d\x70\x72\x6f\x63\x65\
-\x73\x73\x69\x6e\x67\x5f\x39\x39\x37\x38\x31\x2e\x70\x6e\x67\xb8\
-\x3d\x87\x3c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x76\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x01\x18\x49\x44\x41\x54\x58\x85\xed\
-\xd7\x21\x4e\x43\x41\x18\x45\xe1\x73\xa7\x45\x54\x22\xd9\x45\x67\
-\xc6\x92\x4a\x2c\x7b\x28\x61\x13\xa4\x09\x04\x81\x07\x4b\x82\xaf\
-\x03\x4b\x6a\x20\xd8\x47\xda\x4d\x80\x23\x38\x48\x68\xe7\x62\x20\
-\x69\x08\xa2\x66\xf2\x42\x78\x57\x8e\xf9\x8e\xfc\x07\xfe\xfb\x04\
-\x30\x1c\x0e\xf7\x7b\xbd\x5e\x06\x1e\x9a\xa6\xb9\xad\x09\xe6\x9c\
-\xf7\x80\xdd\xd5\x6a\xd5\xcc\xe7\xf3\x1b\xc5\x18\x4f\x42\x08\xc7\
-\x00\xb6\x0d\x9c\x49\xba\xaf\x81\xdb\x1e\x01\x47\x92\x04\x50\x4a\
-\x39\x55\x4a\xe9\x45\xd2\x76\x0d\x70\x83\xa0\xd7\x20\xe9\xbd\x0d\
-\x1c\x40\xd2\x5b\xbf\x94\x32\x91\x74\x29\x29\x00\x1f\xa5\x94\x83\
-\x10\xc2\x5d\x0d\xb0\x94\x32\x0a\x21\x5c\x01\x5b\xb6\x8b\xed\x09\
-\x00\x29\xa5\x59\xce\xd9\x31\xc6\x69\x0d\x78\x7d\x31\xc6\x69\xce\
-\xd9\x29\xa5\x19\x40\xf8\x7a\x37\x80\x24\xd7\x0e\x58\x33\xbc\x1e\
-\xd0\xda\xba\x80\x2e\xa0\x0b\xe8\x02\xba\x80\x2e\xa0\x0b\xf8\x0e\
-\x10\x80\x6d\xd5\x06\xd7\x0c\x01\x28\xc6\x38\xfe\x71\x92\x8d\x43\
-\x08\x55\xae\xe2\x5f\x4e\xb2\x43\xe5\x9c\x9f\x80\x9d\x1a\xe0\x06\
-\x7b\x0e\xb6\x07\x2d\xe1\xd8\x1e\xf4\x6d\x9f\x4b\x6a\xe5\x63\x62\
-\xfb\xa2\xb5\xaf\xd9\x72\xb9\x7c\x5c\x2c\x16\xd7\x35\xad\xbf\xb1\
-\x4f\x20\x1b\x81\xbb\xa4\x79\xb8\x2f\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x07\xc3\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x03\x00\x00\x00\x9d\xb7\x81\xec\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x25\x00\x00\x80\x83\x00\x00\xf9\
-\xff\x00\x00\x80\xe9\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x6f\x92\x5f\xc5\x46\x00\x00\x02\x01\x50\x4c\x54\
-\x45\x00\x00\x00\x42\x82\xc4\x5c\xbc\x67\x5b\xba\x6a\x43\x84\xc1\
-\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\
-\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\
-\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\
-\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\
-\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\
-\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\
-\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\
-\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\
-\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\
-\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\
-\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\
-\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\
-\x42\x82\xc4\x42\x82\xc4\x5c\xbc\x67\x5c\xbc\x67\x42\x82\xc4\x42\
-\x82\xc4\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\
-\x67\x5c\xbc\x67\x5c\xbc\x67\x42\x82\xc4\x42\x82\xc4\x5c\xbc\x67\
-\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x42\x82\xc4\x42\x82\xc4\x5c\
-\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x42\x82\xc4\x42\x82\xc4\x5c\xbc\
-\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\
-\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\
-\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\
-\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\
-\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\
-\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\
-\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\
-\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\
-\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x5c\xbc\x67\x42\x82\
-\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\
-\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x42\x82\xc4\x5c\xbc\x67\x5c\
-\xbc\x67\x42\x82\xc4\x5c\xbc\x67\x42\x82\xc4\x42\x82\xc4\x42\x82\
-\xc4\x42\x82\xc4\x5c\xbc\x67\x5c\xbc\x67\x42\x82\xc4\x42\x82\xc4\
-\x42\x82\xc4\x5c\xbc\x67\x5c\xbc\x67\x42\x82\xc4\x5c\xbc\x67\xff\
-\xff\xff\x98\x40\x58\xec\x00\x00\x00\xa8\x74\x52\x4e\x53\x00\x00\
-\x00\x00\x00\x08\x69\xdf\xf7\xe2\xc4\x86\x2f\x03\x74\xf0\xfc\xdb\
-\x0e\x75\xf1\x96\x11\xfd\xfa\x81\x05\xa4\x64\x66\x70\x8c\xd1\xe8\
-\x3e\x01\x20\x99\xfb\x95\x04\x18\xbd\xd5\x19\x68\xea\x44\x42\x35\
-\xec\xf4\x4e\xeb\x67\x07\x73\xf2\xf9\x5e\x34\xee\xe3\x31\x13\xf8\
-\x80\x0b\x76\xfe\xe5\x02\x03\x82\x06\x04\x3a\x86\x9a\x8f\x4e\x0b\
-\xb4\x51\x67\xe6\xf1\x0e\x59\x49\x3b\xe4\xf8\x1a\x2c\x85\xb6\x0d\
-\x08\xa6\xd8\x18\x0c\xb2\xe3\x1c\xb1\x0f\xb3\x1f\x01\x99\x98\x9d\
-\xe0\xf4\xa4\x8e\x10\xf7\x74\xcd\x05\x9e\xea\x91\xda\x50\xfc\x90\
-\xfe\x23\xb8\xdc\xc2\x80\x1b\x26\xba\x35\x1a\x19\x11\xde\x9a\xb8\
-\xe1\x6f\xbc\x1f\xc7\x65\x29\x09\xaa\x53\xc1\x6d\xc8\xd3\x1d\x0a\
-\xfd\xb9\xdd\x5c\xcf\xdb\x7c\x21\xb7\x86\x00\x00\x00\x01\x62\x4b\
-\x47\x44\xaa\xbe\x06\x57\xbe\x00\x00\x00\x09\x70\x48\x59\x73\x00\
-\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x02\x8d\
-\x49\x44\x41\x54\x58\xc3\xed\xd7\xe9\x57\x12\x51\x18\x06\xf0\x79\
-\x6f\x59\x56\x26\x18\x19\x65\x51\x96\x2d\x54\xb6\x28\x39\x26\x5a\
-\x86\x45\xd0\x62\x44\x01\x2d\xb4\x60\x69\x69\xc6\x64\xab\x56\x96\
-\xa2\x99\xb6\x48\xa6\xd9\x66\xfb\x3a\xf3\x5f\x76\x87\x46\xc1\xb9\
-\xf7\xce\x82\xa7\x63\x1f\x7c\x3e\xce\xcc\xf3\x3b\xc3\xcc\xbd\xef\
-\x61\x38\x4e\x15\xc8\x99\x33\x57\xa4\x26\x77\xde\xfc\x05\x79\x0b\
-\x81\xd3\x0e\xe4\xe4\x5b\x44\x66\xac\x05\xf9\x8b\x40\xa7\x6f\x5b\
-\x2c\x6a\x25\xb7\x70\x09\x18\xe8\xdb\xad\x94\xd8\x53\xc2\xd2\x65\
-\x45\xa0\xdf\x5f\xbe\xc2\x41\x66\xe5\xaa\x62\xd9\x58\xbd\x06\xf4\
-\xfa\xa2\xd5\x41\xbb\x06\x4a\xd6\xae\x5b\x8f\xcf\x6e\x70\x82\x4e\
-\x9f\x01\xe0\x2b\x36\x6e\xc2\x67\x37\x97\x82\x4e\x9f\x0d\xc0\x16\
-\x7c\x0b\x5b\xf3\x40\xa7\xcf\x04\x38\xd8\x86\xdf\xb1\x65\x3b\xe8\
-\xf4\x35\x80\xb2\x72\x51\x74\xed\x00\x9d\xbe\x16\x50\x41\x07\x54\
-\xeb\xc7\x34\xa0\x5e\x7f\x66\x01\x62\xfd\x9a\x04\xc8\xf5\x6f\x0e\
-\xa0\xec\x1f\x53\x00\x6d\xff\x59\x79\x13\x40\xe5\xce\x2a\x62\xcf\
-\xba\xab\x59\x40\x0d\x09\xf0\xbb\xc8\x4d\xbf\xbb\x96\x05\xec\x29\
-\x74\xa9\x81\x02\xb2\xef\xa9\x63\x6e\x79\xd8\xbb\xaf\x4a\x05\x78\
-\xd5\xf3\xc3\xbd\xbf\x8e\x36\xb6\x90\xcf\xef\x43\x58\xa8\x3c\x60\
-\x99\x0c\xa8\xe7\x07\x5f\x5d\x7b\x90\xec\xa3\x43\x87\xeb\x8f\x04\
-\x8e\x06\x11\x07\xa5\xc7\x8e\xab\x01\xe6\x5b\x4b\xf7\xfd\xa1\xb0\
-\x24\x49\x91\xc0\x09\x04\x70\xf2\x54\x16\xc0\xe9\xa8\x24\xe7\x4c\
-\x08\x21\x38\x7b\xce\x34\x80\xd0\x79\xe9\x6f\x62\x0d\x08\x4a\x9c\
-\xe6\x81\x0b\x17\x15\xa0\xb1\x09\xa9\x4f\x1a\x02\x2e\x5d\x56\x80\
-\xe6\x96\x19\x60\x06\x98\x46\x20\x78\xc5\x34\x80\xe7\x47\x3a\xbe\
-\xd6\xab\x0a\x10\x8d\x0b\x99\xc7\x11\x0b\x90\xe7\xc7\xb5\x74\xda\
-\xae\xdf\x50\x80\x9b\xb7\xda\x32\x8e\xa7\x26\x0c\x0d\x50\xe6\x87\
-\x7e\x22\xb7\xef\xd0\x01\x65\x7e\xe8\xa7\xbd\x83\x06\x20\x54\x6f\
-\xb0\x2f\x49\x77\xa9\xc0\xbd\xfb\x86\x81\x4e\x2a\x20\x3c\x30\x0c\
-\x3c\xa4\xff\x84\xae\x88\xc1\x7e\x77\x82\xfe\x10\x83\x89\x76\x43\
-\xfd\x9e\x58\x2f\x63\x1d\xb4\x86\x1e\x35\x46\x9b\x27\x12\x1d\xf7\
-\xba\xc3\x19\x07\xfb\x1e\xf7\xc7\x11\x63\x25\x22\xa1\xa1\xa9\x65\
-\x22\x03\x4f\x9e\x2a\x40\xf8\xd9\xf3\xf4\xe1\xc1\xa4\x1f\xfd\xbb\
-\xbd\x30\x19\x98\xfe\xed\xfc\xff\x03\xfc\x54\x00\x17\x16\x6c\x53\
-\x01\x5e\x60\x60\xc8\x09\xd9\x03\x2f\x31\x30\x5c\x06\x90\x35\x30\
-\xe2\xc1\xc2\xab\x1a\xcd\x7b\xd0\x04\x46\x5f\x63\xc0\x3b\x3c\x64\
-\xe3\x1d\xd4\xf0\x6f\xde\x02\x7a\xf7\x5e\x01\xfa\x06\x09\x00\xc6\
-\x2a\x52\xff\x2e\xbd\x56\x46\xec\x36\x98\x25\x24\x14\xe0\x43\x92\
-\x04\x9c\x1f\xcb\x35\x3f\x76\xf1\x23\x9e\x3d\x3e\x61\x7a\xfa\x05\
-\x02\xe0\xa0\x68\xec\x93\x5b\x0b\xf8\xfc\x05\xd0\xd7\x80\x3c\x11\
-\xbe\xc5\xe2\x64\x5f\xfe\x1a\x1c\x1d\xf9\xfe\x83\xfd\xcd\xed\xf9\
-\x09\x1c\x4a\x76\xfc\xea\xfc\x9d\xe8\x45\x04\xf0\x07\xe1\xc3\x4f\
-\xb9\x0d\xeb\x35\x82\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x39\x2d\x30\x32\
-\x2d\x30\x34\x54\x31\x32\x3a\x33\x39\x3a\x32\x31\x2b\x30\x31\x3a\
-\x30\x30\xb0\xdd\x25\x23\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
-\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x39\x2d\x30\
-\x32\x2d\x30\x34\x54\x31\x32\x3a\x33\x39\x3a\x32\x31\x2b\x30\x31\
-\x3a\x30\x30\xc1\x80\x9d\x9f\x00\x00\x00\x46\x74\x45\x58\x74\x73\
-\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\
-\x69\x63\x6b\x20\x36\x2e\x37\x2e\x38\x2d\x39\x20\x32\x30\x31\x36\
-\x2d\x30\x36\x2d\x31\x36\x20\x51\x31\x36\x20\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\
-\x6b\x2e\x6f\x72\x67\xe6\xbf\x34\xb6\x00\x00\x00\x18\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\
-\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\
-\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\
-\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\x00\x31\x32\x38\x0c\x21\x42\
-\x50\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x31\x32\x38\
-\xd0\x8d\x11\xdd\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\
-\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x35\
-\x34\x39\x32\x38\x30\x33\x36\x31\x74\xf3\xcb\x0c\x00\x00\x00\x13\
-\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\
-\x34\x2e\x30\x39\x4b\x42\x42\x5b\x51\xe0\x9c\x00\x00\x00\x3f\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\
-\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\
-\x36\x2f\x52\x57\x30\x56\x77\x61\x46\x2f\x31\x37\x38\x36\x2f\x66\
-\x69\x6c\x65\x2d\x61\x64\x64\x5f\x31\x31\x34\x34\x37\x39\x2e\x70\
-\x6e\x67\x3e\xd9\x05\x18\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x12\x9c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x12\x3e\x49\x44\x41\x54\x78\x9c\xdd\
-\x9b\x59\x90\x5c\x57\x79\x80\xbf\x73\xee\xde\x7b\x8f\x66\xd3\xd8\
-\x92\x25\x2f\x12\x46\x5e\xb0\x1d\x20\xa6\x02\x09\x15\x92\x80\x0b\
-\x02\xa6\x8a\x82\xa4\x42\xa5\x92\x22\x2f\x09\x59\x08\x79\x80\xe2\
-\xc1\x79\xa0\x48\x80\x02\x62\x2a\x84\x38\x3c\x10\x96\x10\xe2\xb2\
-\xd9\x8c\x31\x38\x18\x03\x8e\x2d\xcb\xf2\xc8\xd6\x66\x2d\x1e\x4b\
-\xa3\xd1\xec\x9a\xe9\x9e\xee\x9e\x5e\xee\x76\x4e\x1e\x6e\xf7\x4c\
-\x4f\xcf\x78\xd3\x8c\x12\xec\x53\x75\xeb\xde\x7b\xfa\xce\xbd\xf7\
-\xff\xfe\xe5\xfc\xe7\x3f\x77\x04\x97\xa6\x89\x9e\x3d\x80\xee\xd9\
-\xff\x4a\x34\xf1\xe2\x97\xbc\x78\xfb\xcb\x3b\xef\x74\xae\x1f\xdc\
-\xf9\x86\x38\x8c\xde\x28\x84\x71\x3d\x9a\x9d\x08\x31\x20\x10\x99\
-\x58\x2b\xc2\xd0\xaf\x85\x61\x34\x1f\x04\xc1\x78\xd0\x0c\x8e\xb5\
-\x5a\xad\xc7\xef\xf9\xc6\x97\x0e\x8d\x8d\x8d\x85\x80\xda\x8a\x77\
-\xb8\xd8\x76\xd1\x00\xde\xf7\xbe\xf7\x19\x6f\x7f\xef\x07\x7f\x17\
-\x21\xfe\xd8\xb4\xcc\xb7\x3b\xb6\x9b\x77\x3c\x0f\xdb\x76\x30\x4c\
-\x0b\x21\x04\x5a\x43\x1c\xc7\x44\x51\x84\xef\xfb\xb4\x5a\x4d\xea\
-\xf5\x3a\xf5\xe5\x1a\x8d\x46\x63\xb1\x59\xaf\xff\xb0\x5e\x5f\xfe\
-\xc6\x17\xff\xe1\x13\xbf\x04\x22\xfe\x1f\xac\xe3\x65\x03\xb8\xeb\
-\xae\xbb\x2c\xab\x30\xf2\x41\xd3\xb4\x3e\xe6\xa5\xd2\xd7\xe4\x0b\
-\x05\x52\xe9\x2c\x96\x6d\x23\x84\x44\x29\x4d\xac\x62\xe2\x38\x26\
-\x8e\x15\x2a\x8e\x89\x95\x42\x29\x4d\x14\xc7\x44\x61\x88\xef\xfb\
-\xd4\xeb\x75\xaa\x95\x32\x4b\xe5\x12\xb5\x6a\xf5\x70\xb5\x52\xfa\
-\xc7\xaf\x7c\xe1\x93\xdf\x05\x02\xfe\x0f\x41\xbc\x2c\x00\xff\xfe\
-\xed\x1f\xbe\xc5\xb0\xcd\x2f\x65\xb2\xf9\xeb\xfa\xfa\x07\x48\xa7\
-\x33\x48\xc3\x20\x8e\x62\xfc\x20\xc0\xf7\x5b\xf8\xad\x16\xbe\x1f\
-\x10\x86\x21\x51\x1c\xa1\x62\x95\x48\x23\x04\x52\x18\x08\xc3\x40\
-\x08\x89\xd6\x10\xc5\x11\xcd\x46\x83\xca\x52\x89\xd2\xc2\x05\x96\
-\x96\x4a\xfb\xe7\xa6\xa6\xff\xfa\xbb\xff\xf1\xe5\xa7\x48\x2c\xe2\
-\x92\xb7\x97\x04\xe0\x8e\xbb\xef\xb6\x77\x8b\xcc\xa7\xbc\x54\xea\
-\x23\x83\x43\xdb\x65\xae\x50\x44\x0a\x49\x10\x04\xd4\xeb\x75\x96\
-\x6b\x55\xea\xf5\x65\x1a\x8d\x06\xad\x96\x8f\x90\x26\x52\x9a\x80\
-\x44\x6b\x4d\x14\x05\x04\x81\x4f\x18\xf8\x48\xd3\xc0\x34\x2d\x2c\
-\xdb\xc1\xb4\x1d\xa4\x34\x50\x4a\xd1\x68\x34\x28\x2f\x5e\x60\xe1\
-\xc2\x9c\x5f\x29\x2d\x7e\xea\x3f\xbf\xf2\xb9\xcf\x02\x2d\x2e\xb1\
-\x35\xbc\x28\x80\x7f\xf9\xfa\xbd\x83\xe9\x74\xfa\x9e\x62\xdf\xb6\
-\x37\x0f\x0d\x8f\x60\x3b\x2e\x61\x18\x50\xab\x56\x59\x5a\x2a\x53\
-\x5d\x5a\x22\x8a\x21\x93\xed\x23\x9b\x2b\x92\xc9\xe6\x91\x22\xb9\
-\xad\x06\xb4\xd2\x28\xad\x89\x95\x22\x08\x42\xaa\x95\x32\xa5\xd2\
-\x3c\x8b\x0b\xb3\x44\x71\x88\xe3\x78\xd8\xae\x87\x34\x4c\xa2\x38\
-\xa6\xb6\x54\x66\xe1\xc2\x2c\x95\xd2\xc2\xfd\x07\x7f\xf6\xd3\x3f\
-\x19\x1b\x7b\x7a\x91\x4b\x18\x28\x5f\x10\xc0\x5d\x5f\xbb\x7b\xa7\
-\x97\xcd\x3f\x38\x38\x34\xbc\x77\x60\x70\x18\x84\xa4\x5e\x5f\xa6\
-\xb4\xb8\x40\x79\x71\x11\xc3\x74\x19\x1a\xda\x49\xa1\xd8\x87\x21\
-\x05\x52\x4a\x84\x10\x08\x91\x48\xaf\x01\xa5\x75\x12\x17\x62\x45\
-\xac\x14\x61\x14\x13\xc5\x31\x61\x18\x31\x3f\x3f\xcb\xf8\x99\x93\
-\xd4\xea\x55\x5c\x2f\x8d\xed\x7a\x08\x21\x09\x5a\x2d\x4a\x0b\x73\
-\x94\x17\xe7\x9f\x3c\xfa\xe8\xc3\xb7\x1f\x3d\xfa\xc4\xf4\xa5\x82\
-\x60\x3c\xdf\x0f\xff\xf4\x95\x6f\x0d\xe5\xf3\xc5\x5f\x0c\x6f\x1f\
-\xd9\xd3\x3f\x38\x8c\x52\x9a\x72\xb9\xc4\xdc\xcc\x34\xb5\x4a\x8d\
-\x1d\x3b\xf7\xb0\x7b\xf7\xd5\xe4\x73\x39\x3c\xc7\xc2\x73\x6d\x5c\
-\xc7\xc6\xb5\x4d\x1c\xdb\xc2\xb1\x2c\x6c\xdb\xc2\xb1\x4c\xec\xf6\
-\x66\x99\x06\x96\x69\x62\x1a\x12\xc3\x30\x48\xa7\xb3\x0c\x8f\x5c\
-\x41\xc3\x97\x4c\x4f\x8d\xa3\x22\x1f\xc3\x34\xb1\x1d\x17\xc7\x4b\
-\x01\x8c\xe4\xfa\xfa\x7f\xb3\xba\x50\xfe\x7e\xa5\x72\xa1\xc1\x25\
-\x70\x87\x0d\x01\x7c\xe4\x73\x9f\xf3\x76\x0d\x5d\xfe\xc0\xe0\xf0\
-\xc8\x0d\xfd\x03\x43\x44\x71\xcc\xe2\xc2\x05\x66\x67\xa6\xb0\x2d\
-\x8f\x7d\xd7\xdd\xcc\xb6\xbe\x22\x9e\x63\xe3\x3a\x16\x96\x65\x62\
-\x98\x06\x86\x94\x48\x29\x91\x42\x20\x65\xb2\x19\x52\x62\x18\x12\
-\xcb\x90\x58\xa6\x89\x6d\x19\x98\xa6\x91\x40\x90\x12\x69\x08\x0a\
-\x85\x22\x4d\xfa\x28\x2f\xce\x13\xf9\x35\x0c\xa3\x0d\xc1\xf1\xd0\
-\x5a\x8d\x14\x87\x86\xf6\x1d\x3f\xb4\xff\x07\x24\x23\xc4\x25\x07\
-\x20\x3e\xf4\xa7\x7f\x75\x67\x5f\xff\xc0\xed\x83\x43\xdb\x89\x95\
-\x5a\x11\x7e\xb0\xff\x32\xae\xbd\xf6\x3a\x32\x9e\x8b\x63\x99\x98\
-\x86\x81\x14\x22\x31\x7b\xba\xfc\xa9\x7d\x22\x04\xab\xfd\xed\xeb\
-\xa4\x94\x98\x6d\x18\xa6\x21\x57\xce\x35\x06\x66\x6a\x90\xa5\xa5\
-\x0a\x41\xa3\xbc\x62\x09\x96\xed\xa0\x54\x7c\xcd\xe5\x57\x5c\xa3\
-\x4e\x1d\x7d\x72\x3f\x5b\x3c\x3a\xac\x03\xf0\xe5\xaf\xdd\x73\x5b\
-\x36\x97\xfb\xfc\xf0\x65\x3b\x85\x90\x92\xd2\xe2\x02\x73\x33\xd3\
-\x8c\x8c\x5c\xc1\xde\x6b\xf6\xe2\xda\x16\x86\x94\x08\xd9\x25\x9d\
-\x58\x23\xf7\xca\xf1\x46\x30\x68\xc3\x90\x52\x60\x1a\xb2\x0d\x41\
-\x60\x19\x06\x8d\x40\xe1\x65\x07\x58\xaa\x2c\x11\x36\x97\xb0\x2c\
-\x07\xdb\x71\x31\x0c\x13\xa5\xe2\x5b\xbd\x6c\xee\x17\x93\x67\x4e\
-\x4f\xb2\x85\xf1\x60\x0d\x80\x3b\xee\xb8\x2b\x55\xdc\xde\x77\xff\
-\xf6\x91\x1d\x45\xd7\x4b\x51\xad\x56\x98\x9b\x99\xa6\xaf\x38\xc0\
-\xbe\x6b\xaf\xc3\x32\x0d\xa4\x14\x6b\x34\xbb\xb2\x75\x9d\xac\xd1\
-\x7c\x0f\x8c\x5e\x10\x86\x94\x98\x86\x81\x6d\x49\x1a\xbe\x46\x03\
-\x6e\x7a\x1b\xa5\xc5\x39\x54\xd4\xc0\xb6\x5d\x6c\xc7\x45\x2b\x65\
-\x58\x86\x75\xe3\xb1\xd1\xc7\xbe\x0d\xf8\x6c\x51\x3c\x90\xdd\x27\
-\x03\xbb\xb6\xfd\x45\x36\x9b\xdf\xe5\xa6\xd3\x34\x9b\x0d\x16\x2f\
-\xcc\x23\x91\xdc\x70\xfd\x8d\x58\xa6\x81\x68\x0f\x6f\x42\xac\xdf\
-\xd6\x08\xff\x3c\x30\xd6\x80\xe8\x02\x67\x18\x12\xcf\xb5\x19\xec\
-\x4b\x93\xcf\xa4\xc8\x67\x53\xec\xb8\xea\x16\x9a\xcd\x90\x66\xa3\
-\x8e\x10\x82\x6c\xbe\x48\x36\x5f\x7c\xdd\xdb\x6f\xff\xe0\x07\x00\
-\x7b\x2b\x84\x5f\x03\xe0\xa3\x1f\xfd\x6c\xda\xb6\xed\xbf\xcd\x17\
-\xfa\x88\x63\x45\xb9\x5c\xa6\x5c\x2e\x71\xf3\x4d\xbf\x86\x65\x9a\
-\x2b\x2f\x1b\x2b\x88\x63\x50\x6d\x23\xec\x08\x28\xdb\xdb\x8a\xd6\
-\x7b\x60\xac\x03\xd1\xd3\x27\xa5\xa4\x90\x75\xc9\x67\x3c\x72\x69\
-\x8f\x42\x2e\xcb\xb6\x91\xd7\xd2\xa8\xd7\x08\x83\x00\xdb\x71\xc9\
-\xe6\x0b\x6c\x1b\xda\xfe\x37\x40\xb6\x57\x79\x9b\x06\x70\xf9\x9e\
-\xcb\xde\xef\xa5\x33\xc3\xa6\xed\x24\x59\x59\x69\x91\xcb\x47\x76\
-\x50\xc8\x17\x56\x5e\x38\x8a\xa1\x15\x26\x5b\x23\x80\x7a\x0b\x1a\
-\x3e\x04\x11\x28\xbd\x2a\x54\x77\x78\xe8\x86\xb1\x91\x7b\x74\x5b\
-\x83\x63\x49\xb2\x69\x8f\x5c\xc6\x23\x9b\x76\x19\x1a\xde\x09\x46\
-\x86\x56\xb3\x0e\x40\x2a\x93\x23\x95\xc9\x5d\xf3\xb6\x77\xbe\xff\
-\x77\xd8\x22\x2b\xe8\x00\x90\xc2\x34\xff\x28\x9d\xc9\x11\xc7\x8a\
-\x6a\xa5\xc2\x72\xad\xc6\x6b\x5f\xb3\x6f\x55\x5b\x24\x42\xca\x6e\
-\x21\x45\xd2\x17\x44\x09\x88\x7a\x0b\xfc\x30\xe9\x13\x1b\x08\xbb\
-\xc6\x35\x36\x80\x60\x4a\xb0\x4c\x49\x26\xe5\x92\x49\xb9\xa4\x53\
-\x0e\x03\x23\x7b\x69\x35\x1b\x44\x61\x88\x65\x3b\xa4\x32\x59\x8a\
-\xfd\xc3\x7f\x00\x78\xdd\xb7\xd8\x14\x80\xbf\xbb\xe3\x33\x83\xa6\
-\x69\xbd\xc5\xb4\x6d\x5a\x7e\x8b\x6a\xb5\xc2\xf0\xe0\x30\x29\xcf\
-\x5b\x23\xac\x65\x80\x69\x24\xe7\x6b\x36\x99\x6c\x00\x61\xbc\x6a\
-\x19\x61\xcc\xba\xc0\xd7\x1d\x30\xd7\x0e\x93\xc9\xbd\x0c\x29\x70\
-\x6d\x2b\x01\xe0\x3a\xf4\x0f\x0c\x81\x70\x09\xfc\x16\x42\x08\xbc\
-\x54\x86\x54\x26\xf3\xd6\x7c\x3e\x5f\xe0\x05\x12\xb9\x97\x05\x20\
-\x57\x2c\xbe\xcd\x76\x5c\x03\x04\xcd\x46\x83\xe5\x5a\x95\x5d\x57\
-\xec\x5a\xab\xc5\x36\x80\x94\x0d\x69\x17\x5c\x6b\x2d\x0c\xd1\x06\
-\xd1\xd9\x2b\x9d\xb8\x4a\xc7\x2a\x34\xab\xae\x41\x07\x02\x1b\x40\
-\x90\x20\xa5\x20\xe5\xda\xa4\x3c\x1b\xcf\xb1\xc9\xf5\x5d\x46\x10\
-\xb4\xd0\x5a\x63\x3b\x2e\xb6\xeb\xa5\x6f\x7e\xd3\x6f\xdf\x0a\x58\
-\x5b\x01\x40\x18\x42\xde\x6a\xd9\x0e\x61\x14\x53\xaf\xd7\xf1\xfd\
-\x80\xcb\xb6\x8f\xac\x68\x89\x2e\x08\x42\x82\x21\xc1\xb6\x12\x18\
-\x99\x36\x0c\xcb\x68\x07\xc2\x2e\x17\x91\x6d\x21\x83\x28\x01\xd1\
-\x0c\x92\x01\xbc\x17\x42\xb7\x4b\x74\x20\x59\xa6\x41\xca\xb1\xf1\
-\x5c\x9b\xe2\xb6\x11\xc2\x20\x20\x8e\x23\x4c\xd3\x4a\x02\x62\xa1\
-\xf8\x7a\xb6\x20\x0e\x98\xc9\x73\xe5\x75\xc2\x30\x08\xc2\x90\x46\
-\xbd\x41\x3e\x97\xc3\x34\x8c\x8d\xb5\xb4\xfa\xce\x2b\x2f\x6e\x9b\
-\x89\x2a\xb4\x4e\xcc\x3e\x8a\x93\xd1\x42\xd0\x9e\x11\x0a\xda\xf3\
-\xff\xe4\x77\xd3\x00\xc7\x48\x60\x8a\xf6\x6f\x9d\x8b\x65\xfb\x41\
-\x12\x81\xeb\x58\xb8\xb6\x45\x3e\x5f\x40\x69\x89\x6a\x03\xb0\x6c\
-\x07\xc7\x4b\xef\x6d\x03\xe8\x3c\xe6\xa2\x01\x48\x0d\xbb\xb5\x16\
-\x04\x7e\x40\xb3\xd5\x64\x64\x70\x40\x77\x26\x75\x2b\xfe\xdb\xe5\
-\x0e\x0f\x1d\xaa\x33\x5f\x0a\xd1\x5a\xa1\xb5\x42\x69\x0d\x4a\xa1\
-\xb4\x42\x6b\x8d\xd6\x8a\x28\x4e\x66\x80\xba\xab\x5f\x29\x85\x56\
-\xba\xfd\x37\x0a\x53\x68\x20\xb9\xc7\x2d\xfb\x86\xb8\x65\xdf\xf6\
-\x15\x0b\xd2\x80\x65\x99\x38\xb6\x99\x4c\xaa\xdc\x0c\x71\x14\x23\
-\x5c\x81\x69\xd9\x58\xa6\xbd\x93\x84\xbb\x04\xe2\xcd\x01\xd0\x62\
-\xa0\x33\x55\xf5\x7d\x9f\xb4\x97\x5a\x31\x63\x3a\x10\xba\xcc\xf5\
-\xc9\x93\x0d\x4e\x8c\x37\x50\x2a\x46\xa9\x18\xdd\xde\xaf\x1e\x27\
-\xa5\xb0\xf5\xfd\x1b\x9f\x6b\x15\x93\x72\x0d\x6e\xd9\xb7\x9d\x8e\
-\x31\x40\x12\x10\x93\x99\xa4\x81\xe3\xa4\x50\xf1\x32\x5a\x6b\x0c\
-\xc3\xc0\xb0\xac\x6d\x6d\x00\x9b\x1a\x09\x4c\x40\x84\x71\xe8\x46\
-\x51\x44\x14\xc5\x04\x41\x80\xe3\xd8\x5d\xa6\xc8\x6a\x2c\x68\x3f\
-\x4d\xeb\xe7\x17\xe4\x62\x84\x57\x4a\xd1\x0a\x34\xcd\x20\x71\x87\
-\x55\xf7\x12\xc9\x14\xda\x48\xaa\x48\x7e\x94\x58\xba\x90\x12\xd3\
-\x34\xd3\x24\xa3\xc0\xa6\x12\x22\x13\x20\x0c\x23\x82\x30\x22\x8e\
-\x62\xc2\x28\x02\x92\xac\xb7\x5b\xf3\x1d\x10\x40\x62\xd6\x5b\x28\
-\xbc\x52\x31\x5a\x2b\xc2\x78\x35\xa1\xa2\x9d\x4b\x24\xb5\x03\x89\
-\x34\x56\xe5\x94\x42\x62\xca\xee\x37\xda\x24\x80\x38\x8a\xc3\x20\
-\x08\x2d\xa5\x14\x51\x14\xd3\x6c\x35\x57\x63\x00\x3d\x23\x01\x24\
-\xbe\xbf\x95\xc2\xab\x18\xb4\x5e\x17\x68\x13\x61\x05\x86\x14\x68\
-\x15\x77\x34\x9f\x4c\x9f\xb5\xf6\x37\x2b\xfc\x0a\x00\x3f\xf0\x4b\
-\xbe\xef\x0f\x21\x04\x4a\x69\x6a\xb5\xe5\x15\x17\xe8\x0e\x84\x1d\
-\x6b\x18\x2e\x1a\x2c\x0f\x59\x28\x6d\xa0\x95\x5a\x11\x46\xeb\x8e\
-\x40\xab\x5a\x55\xdd\xbf\x2b\x85\xd2\xf1\x4a\x5f\x27\x40\x46\x51\
-\x4c\x21\xef\x42\xd7\x33\x80\x64\x54\x90\x02\x21\x05\x2a\x0e\x70\
-\x6c\x1b\xcb\x32\x69\x09\x00\xbd\x44\x32\xaa\x6e\x6a\x56\x68\x02\
-\xaa\xd5\x6a\x8d\xfb\xad\xd6\x90\xe5\x38\x48\xc3\xe0\x42\xa9\xb4\
-\x2e\x09\x82\x55\xdf\xfc\xf3\xf7\x6e\x5f\x31\xd3\xde\xa7\xeb\x76\
-\x9f\xd6\xeb\xcf\x75\xd7\xf5\xdd\xe7\x61\x3b\x95\x56\xba\x7d\xcf\
-\x0e\x04\xbd\xfa\xdc\x30\x6c\x92\xcb\x65\xb1\x4c\x13\xd0\xa8\x38\
-\x9c\x21\x89\xfe\x9b\x02\x20\xdb\x00\x4e\x05\x81\x0f\x08\x4c\xd3\
-\x66\x7a\x66\x16\x50\xba\x93\xf8\xac\xc0\x90\xab\x89\x4e\x07\x4c\
-\x77\x26\xb8\x62\x2d\x62\x35\xa1\xe9\xed\xef\xcd\x25\x04\x49\x12\
-\x65\x9b\xeb\x5d\x2d\xc9\x11\x34\x41\xe0\x83\x0a\x71\x5d\x17\x43\
-\x4a\x74\x1c\x11\xfa\xad\xe7\x80\x70\x2b\x00\xe8\xa0\xd9\x38\x18\
-\xf8\x2d\x00\x4c\xcb\xc2\x0f\x42\x31\x3d\x3b\xbf\x3a\xc5\xed\x15\
-\xb4\x67\x5b\xe7\x2a\x3d\x02\x6f\x04\x61\x25\xc0\xb4\x5b\xdc\x99\
-\x5e\x77\xba\x3b\x01\x57\x6b\xca\xa5\x59\x3c\xcf\xc3\x71\x5d\x84\
-\x80\x28\x0a\xa9\x94\x17\x8f\x92\xd4\x08\x37\x55\x1d\x92\x80\x2a\
-\x95\x2e\x3c\xdc\x6a\x36\x50\x71\x8c\x65\xd9\xd8\x8e\xcb\x91\xe3\
-\x27\x56\x46\x82\x0e\x84\x5e\xad\xcb\xae\xdf\xd7\xc1\xe9\x11\x98\
-\x9e\x3e\xba\xee\x19\xab\xd5\xe1\x6f\xad\xbb\x25\xcb\x69\xa5\x85\
-\x69\xd2\x99\x0c\x8e\xed\xa0\xe2\x88\x38\x68\xc5\xc7\x46\x0f\x3c\
-\xc1\x16\x2c\xa3\x49\x80\x9f\xdc\xfb\xf5\x33\xad\x66\xe3\x48\x10\
-\xf8\x48\xc3\xc0\x71\x3d\x46\x8f\x1c\x47\xa9\x78\x5d\x6e\xbf\xa1\
-\x15\x48\xd6\x69\x9b\xae\xfd\xca\x71\x57\x13\x5d\x07\x41\xc4\xda\
-\x5c\xa3\x73\xbd\x86\x46\xa3\x4e\x63\xb9\x44\x3a\x93\xc5\x34\x0d\
-\x82\x56\x83\x46\xbd\xf6\xd4\x99\x33\xa7\xe7\x48\x5c\x60\x53\xad\
-\x33\xb8\x86\xcd\xe5\xda\xdd\xcd\x7a\x0d\x00\xc7\xf5\xf0\x83\x88\
-\xc7\x47\x0f\xaf\xd5\x64\x0f\x0c\x41\xfb\xb8\xfb\x9a\x0d\x20\x6c\
-\xe8\x12\x6d\x61\xa3\xf6\xd8\xdf\x01\xd2\x0d\x2a\x56\x8a\x73\xe3\
-\xa7\xc8\x64\x33\xa4\x52\x69\xd0\x8a\x66\x63\x99\xf9\x99\xc9\xfb\
-\x81\xe5\xad\x04\x10\x9f\x3c\x36\xfa\xcd\xe5\x5a\xa5\x1e\x06\x01\
-\x96\x65\xe3\xa5\x33\xfc\xf4\x97\xfb\xf1\xc3\x60\xad\xb9\xf7\x6a\
-\x9e\xf5\x82\x6d\x18\x0f\x36\x7a\x7a\xbb\x98\xd2\x5d\x1f\x80\xd5\
-\x7d\xb5\x5a\x61\xe1\xc2\x79\x72\xf9\x22\xb6\x6d\xd3\x6a\xd6\x69\
-\x2e\x57\x2b\xff\xfd\xe3\xef\xfd\x08\x68\xb0\x05\xd5\xe1\x0e\x00\
-\xfd\xd4\xfe\x87\x67\xab\x4b\xa5\xaf\xd6\x6b\x15\x10\x02\x2f\x95\
-\xc6\x8f\x14\xf7\x3d\xf8\xf3\xb5\x91\x7d\x23\x4b\x78\x1e\xbf\xef\
-\x0d\x74\xbd\x31\x21\xe8\xaa\xf0\x8b\x9e\x03\xa5\x15\xc7\x8f\x8f\
-\x92\xcd\xe5\xc9\x64\xb3\xa0\x63\x96\x2b\x65\xa6\xce\x9f\xfd\x56\
-\x69\x6e\x6e\x1e\x68\xb2\x05\x95\xe1\xee\x3c\x3a\x3c\x7e\xe8\xf1\
-\x2f\x54\x2b\xa5\x25\xbf\xd5\xc4\xb4\x6c\xd2\x99\x1c\xfb\x47\x8f\
-\x72\xe4\x99\xd3\x1b\xc7\x02\xd6\x02\xe9\x16\xae\x23\x48\xb7\x15\
-\x74\xb7\x28\x82\xb8\x6b\x9c\xef\xf9\x33\x9e\x1d\x3b\x81\xef\xd7\
-\x29\xf6\x6d\xc3\xb2\x2c\x96\xab\x15\x2a\x4b\x8b\x0b\x0f\x7e\xff\
-\xde\x6f\x02\x15\xb6\xc0\xfc\x7b\x01\xa8\xa3\x4f\xfe\xcf\xd4\xe2\
-\xfc\xd4\x27\xab\x4b\x8b\x28\x15\xe3\xa6\xd2\xa4\xb3\x79\xbe\x71\
-\xef\x03\x4c\x4c\xcf\xae\x13\x62\xa3\x64\x69\x8d\xdf\xd3\x05\xa4\
-\x4b\xb8\x58\x25\x75\x81\xde\xdf\x3b\x6d\x66\x66\x8a\xf1\xf1\x53\
-\xf4\x0f\x0c\x92\x4a\xa5\x08\x5a\x4d\x96\x4a\x17\x18\x7b\xe6\xd8\
-\x17\xa7\xa7\x27\xa6\x80\x3a\x5b\xb4\x2e\xd0\x5b\x53\x53\x27\x0e\
-\x1f\x7c\x66\xcf\x75\x37\xbf\xd1\xb2\x9d\xdd\xae\x9b\xc2\xb2\x6c\
-\xa2\x38\xe2\x89\x43\xc7\x78\xcd\x55\x57\x90\xcf\x65\xd6\xdf\x65\
-\x03\x1f\xd7\xa2\xfd\x8a\x62\xed\x9b\xc6\x6d\xbf\xef\x64\x91\x9d\
-\xad\x93\x01\xce\xcc\x4e\x73\xf8\xc8\x41\xb6\x0d\x0c\x90\xcb\x17\
-\xd0\x2a\x66\x7e\x76\x8a\xc9\x73\x63\x0f\xff\xdb\x17\x3f\xfd\x79\
-\x60\x8e\xc4\xfc\xb7\xa4\x6d\x54\x54\x8c\xfc\x56\xfc\xd8\xc0\xf0\
-\xf0\x7b\x6c\xc7\xc9\x39\xae\x87\x65\xdb\x04\x61\xc8\xfe\x83\x4f\
-\x33\x3c\xd4\xcf\xf0\x40\xdf\x9a\x3f\xe8\x16\x5e\x3f\xcf\x31\x40\
-\xa4\x93\xb4\x77\x25\x35\x5e\x73\x9d\xe6\xcc\xd9\x33\x1c\x3b\xfe\
-\x34\xdb\x06\x06\x28\x14\xfb\xd0\x5a\xf3\xcc\xf1\x63\x9c\x1d\x7b\
-\xae\xf5\xbd\xff\xfa\xda\x87\x97\x4a\x0b\x67\x81\x2a\x97\x6a\x69\
-\xac\xdd\xd4\xe2\xfc\xf9\x65\x2f\x95\x7b\x32\x93\x2f\xdc\x6e\x59\
-\xb6\xe3\xb8\xc9\xc7\x4f\xb1\xd2\x1c\x18\x3d\xc2\x72\xa3\xc1\xd5\
-\xbb\x76\x60\x1a\x3d\x7f\x2e\xba\xca\x5b\x3d\x00\x22\x95\x0c\x79\
-\x7a\x03\xcd\xfb\xbe\xcf\xe8\x53\x07\x99\x9c\x9e\x60\x60\x70\x88\
-\x7c\xa1\x88\x56\x9a\xa7\x9f\x3a\xc4\x40\x5a\xb0\xfb\x9a\x6b\x4d\
-\xbb\xb0\xe3\xf2\x89\x93\x27\xbe\xd3\x68\x54\x96\xd9\x22\xf3\x7f\
-\x3e\x00\x00\xea\xfc\xd9\x53\x73\xf9\xe2\xb6\xc3\xae\x97\x7e\xa7\
-\x69\x59\x8e\xed\x24\x6b\x74\x86\x69\x72\xf6\xdc\x24\x8f\x3d\x79\
-\x04\xcf\x75\x19\x19\xea\x47\xca\x55\x1b\xd0\x5d\xaf\xd6\xd1\x74\
-\xd8\xae\x11\x76\x6b\x5e\x03\x51\x1c\x73\xfa\xb9\x31\x0e\x1e\x3a\
-\x88\x06\x06\x06\x87\xc9\x64\x73\x68\x15\x73\xe0\xc0\x01\x4e\x9f\
-\x38\xce\xae\xdd\x57\xf3\x5b\xb7\xde\x84\x97\xce\xee\x4e\x0d\xee\
-\xba\x61\x6a\xec\xcc\x8f\xf6\xec\xb9\xc2\xbe\xe9\xa6\x9b\x86\x9f\
-\x7d\xf6\xd9\xda\x66\x61\xbc\x50\x5d\x3d\x1a\x7f\xf6\x99\xc9\x74\
-\x3a\xf5\xb8\x9b\xca\xbc\x4d\x4a\x23\xdb\x81\x60\xdb\x2e\x61\x14\
-\xf3\xf4\xf1\x53\x3c\x36\x7a\x94\x96\x1f\x90\xcf\x65\x48\x79\x2e\
-\x1d\xa7\x6f\x97\x09\xd7\x69\x5d\x69\x4d\xa9\xbc\xc4\x33\xa7\x4e\
-\xf1\xe4\x53\xa3\x54\x6a\x55\x0a\x7d\xdb\xe8\xeb\xef\xc7\xf5\x3c\
-\x02\xbf\xc5\xd9\xe7\xc6\xf8\xd9\x43\x0f\xe1\x65\xfb\x88\x31\xf0\
-\x83\x80\x5f\xbf\x71\x0f\x4e\x2a\x7d\x95\x95\xeb\x7f\xbd\x6a\x2c\
-\x7c\xbc\xaf\xaf\xef\xc3\x57\x5e\x79\xe5\x23\x27\x4f\x9e\x9c\x65\
-\x13\x2e\xf1\x62\x0b\x0b\xd1\xc4\x99\xd3\xb3\xcd\xb0\xf5\x60\x2e\
-\x57\xbc\x41\x6b\xb5\xa3\x53\x96\xb6\x1d\x17\xd7\xf5\x50\x1a\xce\
-\x9e\x9f\xe1\xd1\x83\x4f\x33\x7a\xf4\x14\xe7\xa7\xe7\x98\x5f\x2c\
-\x73\xa1\x5c\xa1\xb4\x54\x63\xa1\x54\x66\x7a\x6e\x9e\xb3\x13\x93\
-\x3c\x73\xfa\x34\xa3\x87\x8f\x30\x76\xf6\x2c\x41\x18\x91\x2f\xf6\
-\xd1\xd7\xdf\x4f\x26\x93\x45\x0a\x41\xad\x52\x66\x6e\xea\x3c\xd3\
-\x13\x67\x0e\x4c\xce\x2d\x95\xb4\x90\x43\x71\xac\x68\xb4\x02\xfc\
-\x20\xe0\x0d\x37\x5c\xcd\xf8\xa9\xc3\xbb\x67\xa6\xce\x17\x94\x52\
-\xa9\x5c\x2e\xf7\x9e\x9d\x3b\x77\x3e\x72\xfa\xf4\xe9\x99\x8b\x85\
-\xf0\x52\x56\x56\xa2\x85\x99\xc9\xa5\x67\x8f\x8d\xde\x3f\xb0\xfd\
-\xb2\x96\xd6\xdc\xa4\xb4\xb2\x6d\xdb\xc6\xf5\x3c\xd2\xe9\x0c\x99\
-\x4c\x86\x74\x36\x87\x30\x4c\xaa\xf5\x26\x33\xf3\x25\xce\x4f\xcf\
-\x31\x3e\x35\xc3\xf9\xe9\x59\xe6\x16\x4a\x54\xeb\x0d\x34\x82\x4c\
-\x36\x4f\x5f\xff\x00\x85\x62\x91\x54\x3a\x8d\x61\x48\x9a\x8d\x65\
-\x2e\xcc\x4d\x33\x3b\x39\x51\x3b\x7a\xe8\x89\x3b\xef\xfc\xf4\xdf\
-\x7f\xa6\x34\x3f\xff\x83\x91\x2b\xf6\xdc\x12\x44\xe1\x48\x1c\x2b\
-\xfc\x30\x62\x7b\x5f\x8a\x83\xfb\x1f\xe1\xb9\xe7\x9e\x43\x27\xbe\
-\x96\x2a\x14\x0a\xef\xde\x0c\x84\x97\xba\xb4\x14\x45\x51\xd4\x3c\
-\x79\x64\x74\xb4\x51\x5b\xfe\x51\x36\x97\xc9\x29\xa5\xae\x41\x2b\
-\xc3\x34\x4d\x1c\xc7\xc1\xf3\x3c\xd2\xa9\x0c\xe9\x4c\x86\x6c\x2e\
-\x4f\x36\x9f\x27\x97\x2f\x90\x2b\x14\xc9\xe7\x0b\xe4\xf2\x05\x32\
-\xd9\x2c\x5e\x2a\x85\x65\x9a\x68\x15\x53\xaf\x55\x59\x98\x9f\x65\
-\x6e\x7a\xd2\x3f\x73\xf2\xf8\xf7\xbe\xfd\xd5\x7f\xfd\xd8\x83\x0f\
-\x7c\xff\x67\xc0\x8c\xdf\xa8\xcc\x57\xca\xd5\x9f\x0c\x5d\xb6\xeb\
-\x4d\xf9\x5c\x7a\xe4\xcf\x3e\x70\x1b\xa3\x07\x1e\xe5\xb1\xc7\x1e\
-\xa3\x5e\xaf\x13\xc7\xf1\x96\x40\xd8\x30\x45\x7f\x81\x26\x01\x17\
-\xc8\xed\xbb\xf1\x96\xab\x6e\x7c\xfd\x9b\xff\xb0\x7f\x78\xfb\xbb\
-\xd2\x99\xdc\x8e\x74\x26\x4b\x2a\x95\xc6\x6d\x7f\x2e\x6b\x59\x56\
-\x52\xbe\x36\x92\x2f\xc7\xd0\x1a\xa5\x62\xa2\xc0\xc7\x6f\x35\x69\
-\x36\xea\x2c\xd7\x2a\x13\x53\x13\xe3\x0f\x3c\xf4\xe3\xef\x7e\xe7\
-\xe4\xf1\xe3\x13\x40\x99\x64\x98\xf3\xdb\x82\x38\xbf\x78\xe4\xd1\
-\x0f\xbd\xf6\xda\xd7\xfc\xf3\xa9\x93\x27\x92\xc0\x78\xfa\x34\xe7\
-\xce\x9d\xa3\x54\x2a\x61\x9a\x26\xe9\x74\x9a\x6c\x36\x4b\x36\x9b\
-\x5d\x2c\x95\x4a\xef\xbe\xef\xbe\xfb\x0e\xf0\x32\x3e\xa3\x79\xb9\
-\x00\x3a\xcd\x00\x1c\x20\x03\x64\xdf\xfa\x7b\xef\xba\x71\xe7\xee\
-\xab\x7f\x23\x57\x28\xde\xe8\xa5\x73\x57\xa6\x53\xa9\x11\x69\x5a\
-\xb6\x69\x18\x48\x29\x49\xa2\xa2\xf2\x7d\xbf\x35\xdd\xa8\x2f\x9f\
-\xa9\x2c\xce\x1f\x3d\x71\xf4\xa9\xc7\x7f\xfe\xd0\x83\x27\x49\x66\
-\x75\x55\x92\xec\xce\x67\xed\x22\x87\xbc\xe7\x9e\x7b\x0e\x9f\x3b\
-\x77\xee\xba\xbd\x7b\xf7\x22\x84\xe0\xe4\xc9\x93\x5b\x0a\xe1\x62\
-\x01\xac\xbc\x20\xc9\xe2\x84\x43\x62\x19\x5e\xfb\xd8\xbe\xea\xaa\
-\xab\xb2\xa9\x54\x2e\x85\xa1\x45\xa5\x54\x6a\x4e\x4c\x4c\x2c\xb7\
-\x5f\x2a\x68\x0b\xda\x6a\x6f\x3e\x49\x5e\xbf\x91\xe9\xca\x77\xbc\
-\xe3\x1d\xbf\x3f\x34\x34\xf4\xad\xbd\x7b\xf7\x7a\xd7\x5f\x7f\xfd\
-\x96\x43\xd8\xec\xf2\xb2\x26\xd1\x98\x4f\x92\x9e\xd6\x81\x1a\x50\
-\x29\x97\xcb\x17\xe6\xe7\x67\x67\xe6\x67\x67\xa7\x2b\x95\xca\x3c\
-\x50\x22\x31\xf1\x25\x92\xc9\x4c\xbd\x0d\xe0\x05\x0b\x9b\x63\x63\
-\x63\xe7\x8b\xc5\xe2\xa9\x28\x8a\x6e\x8b\xe3\xd8\x1a\x1c\x1c\x64\
-\x60\x60\x00\xad\x35\x71\x1c\xaf\x7c\xae\x7b\xb1\x31\x61\xd3\xeb\
-\xeb\x5d\x4d\xb7\x1f\x16\x91\x68\xb4\xa3\xe9\x80\x44\xd0\xa0\xdd\
-\x1f\xf1\xf2\xca\xd9\xf1\xf8\xf8\xf8\xf8\xa5\x82\xb0\x95\x00\x2e\
-\x55\xd3\x40\x34\x3e\x3e\x7e\xf6\x52\x40\x78\x25\x00\x80\x4b\x08\
-\xe1\x95\x02\x00\x2e\x11\x84\x57\x12\x00\xd8\x24\x84\x6c\x36\xfb\
-\xc8\xc4\xc4\xc4\x1a\x08\xaf\x34\x00\xb0\x09\x08\xa6\x69\xbe\x5b\
-\x4a\x79\xff\xe2\xe2\xe2\x62\xfb\x3e\xaf\x48\x00\x70\x91\x10\xea\
-\xf5\x7a\xca\xb2\xac\xda\xd4\xd4\xd4\xa3\xb4\x6b\x8a\xaf\x54\x00\
-\xf0\x32\x21\xb4\x5a\x2d\x2a\x95\x0a\x96\x65\xfd\x72\x7a\x7a\xfa\
-\x00\xc9\x10\xfd\x8a\x06\x00\x2f\x11\x42\xa3\xd1\x60\x66\x66\x06\
-\x21\x44\xa9\x54\x2a\x7d\xaa\x5a\xad\x4e\xf3\x2a\x01\x00\x2f\x02\
-\xa1\x54\x2a\x71\xee\xdc\x39\x82\x20\x08\xea\xf5\xfa\xc7\xcf\x9f\
-\x3f\xff\x04\x49\x36\x1a\xc3\xab\x03\x00\xf4\x40\x68\x36\x9b\xb7\
-\xd5\xeb\x75\xab\x54\x2a\xb1\xb0\xb0\x40\x14\x45\xe5\xc9\xc9\xc9\
-\x8f\x8d\x8f\x8f\x3f\x08\xcc\x93\x64\xa6\xc0\xab\x07\x00\x74\x41\
-\xf0\x7d\xff\xf8\xec\xec\xec\xeb\x2a\x95\x4a\x53\x29\xf5\xc3\xfd\
-\xfb\xf7\x7f\x62\x7c\x7c\xfc\x09\x92\x92\xfa\x9a\xff\x3d\xda\xec\
-\x6c\xf0\x57\xb1\x49\x20\x05\x14\xdb\xfb\x88\x64\x82\xd6\xa9\x33\
-\xac\x99\x83\xbc\x1a\x01\x40\x22\x97\x49\x62\xe1\x9a\x04\xc2\x45\
-\x7f\x4c\xf9\xaa\x6e\xff\x0b\x4d\xa4\x93\xb8\xb2\x0d\x4c\x66\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x8b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\x62\x4b\x47\
-\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\x70\
-\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\x0e\x1b\
-\x00\x00\x06\x12\x49\x44\x41\x54\x78\xda\xed\x9b\x5b\x6c\x14\x55\
-\x18\xc7\x7f\x67\x76\xb6\xbb\xcb\xee\x76\x5b\xba\xb4\x14\x45\xac\
-\x88\xb1\x85\x20\x2a\x16\x02\x08\x18\x51\xf4\x41\xc1\x18\x4d\xbc\
-\xf0\xa0\x18\xb1\x8d\x09\x89\x31\xd1\x17\x7d\xe0\x85\xf8\xe0\x93\
-\x91\xa8\x21\xd1\xf0\xa2\x2f\x12\x1e\x4d\x44\xe3\x85\x84\x44\xbc\
-\x04\x12\x6b\x88\x80\xc4\x28\x60\x69\xcb\xb5\xd0\xdd\xee\x9c\xcf\
-\x87\x99\x2d\xbb\x3b\xc3\x76\xf6\xce\x65\xff\xc9\x61\x53\xe6\xcc\
-\x99\xef\xfb\xcd\x99\xef\x7c\x67\xce\x1c\x68\xaa\xa9\xa6\x6e\x66\
-\xa9\x62\x07\x57\xed\x18\x02\x30\x80\xf9\xc0\x2d\x40\x14\x88\x01\
-\x21\xa7\x98\xce\xf1\x6c\x29\xa6\x40\x89\xb6\x09\xa0\x7d\x1c\xcf\
-\x96\x0c\x90\x72\xca\x79\xe0\x12\x70\x0c\xf8\x17\x90\x7d\x83\x7d\
-\xfe\x01\xac\xdc\xf1\x07\x0a\xc1\x71\x7a\x2b\xf0\x2c\xd0\xe5\x38\
-\x19\x70\x7e\x8b\xc2\x6b\x90\xb2\x50\x2c\xa7\x1c\x07\x76\x01\x1f\
-\x01\x67\xbd\x20\xb8\x9c\x58\xf3\xf1\x51\x2c\x2b\x05\xd0\x0b\x7c\
-\x08\xac\xbd\x46\x9d\xf5\x2b\x0b\xf8\x1c\x78\x03\x38\x5d\x08\xc1\
-\xd5\x6d\x1d\xe7\x93\xc0\xfb\xc0\x43\xd7\xb9\xf3\x60\xf7\xd8\x17\
-\x80\x6d\x40\xc4\x79\xac\xbd\x01\x3c\xb8\x63\xc8\xee\xf8\xf0\x32\
-\xb0\xbe\xd1\x96\x57\x51\x0a\xd8\x04\x3c\x5c\x78\x20\x0f\x80\xd8\
-\x35\x23\xc0\xa3\x4c\x1f\xd4\xae\x37\x45\x81\xa7\x01\x23\xb7\x17\
-\x78\x39\xd9\x06\xdc\xda\x68\x6b\x6b\xa4\x1e\xec\xd1\xab\x28\x80\
-\x56\xa7\xdc\x88\x52\x14\xc4\x34\x2f\x00\x61\xa0\xa5\xd1\x96\xd6\
-\x48\x2d\xd8\xb9\x4b\x51\x00\x41\x4a\x4f\x5a\xae\x17\xb9\x7c\x6b\
-\x02\xf0\xa8\xe4\x27\xad\xad\x9a\x44\xea\x0a\xc0\xe5\x9b\x97\xa3\
-\x75\x49\x7c\x44\xc0\x34\x14\xb3\xa2\x66\xe5\x8d\x95\x06\x60\xda\
-\x20\x58\xf3\x3c\x5f\x0b\xc4\x42\x06\x2f\xdd\x3f\x93\xf7\x1e\xeb\
-\xe6\x91\x3b\xe3\x18\xaa\x2e\xbd\xc1\x35\x0a\x98\x7e\x2a\x55\xdb\
-\xf9\xae\x98\xc9\x96\xfe\x0e\xd6\xde\x11\xc3\x54\x8a\xad\x2b\x92\
-\xcc\x6b\x6f\xe1\x8b\x83\x67\x38\x9f\xd2\x18\xce\xd5\x45\x20\x97\
-\x89\x52\x15\x1b\xe6\xba\xe1\x75\xed\x7f\x5a\xa0\x77\x56\x88\x81\
-\xe5\x49\x16\xcf\x0e\x23\x02\x96\x08\x33\x82\x06\xcf\x2d\x6e\x63\
-\x6e\x22\xc8\xce\x03\xa3\x1c\x3f\x3b\x89\xa1\xa0\x3d\x12\x20\xe9\
-\x3c\x22\x5a\x84\x93\x17\x32\x5c\x9a\xd4\x95\x42\x50\xb9\x50\xeb\
-\x02\xc0\x49\xb1\x59\x71\xdb\x0c\x06\x96\x25\x99\xd7\x16\xc4\x92\
-\xfc\xe3\x00\xab\x6f\x8f\xd2\x1d\x37\xd9\x79\x60\x8c\xfd\x7f\x8f\
-\xb3\xba\x27\xc6\xe6\xa5\x33\xd1\x02\x69\x4b\xb3\xed\xdb\xff\x38\
-\x74\x6a\x82\x40\x45\x04\x24\x0f\x60\xcd\x01\x88\x80\x19\x50\x3c\
-\x79\x77\x2b\x9b\xee\x6d\xa7\x3d\x12\xc8\x73\x3e\x57\x5a\x60\x41\
-\x47\x88\xb7\xd7\x74\xb2\xeb\xb7\x33\xc4\x5a\x0c\x5a\x43\x06\x02\
-\xa4\x32\x0a\xd3\x50\x39\x38\xcb\x55\xfe\xb9\x35\x05\xa0\x05\x5a\
-\x43\x06\xcf\xdf\xd3\xce\xc6\xbe\x04\x91\xa0\x42\xcb\xf4\xe7\xb4\
-\x45\x02\x6c\xe9\xef\x60\xec\xb2\x35\x55\x5f\xa6\xfe\xa9\x48\x2e\
-\x72\x35\x03\xa0\x05\x66\xc7\xed\x60\xb7\xa6\x27\x86\xe1\xfc\x9f\
-\x1f\x89\x40\x4b\x40\xd1\x1d\x37\x6b\x3e\x32\xd4\x04\x80\x16\xe8\
-\xeb\x0c\x31\xb8\x3c\xc9\xa2\xae\xb0\x2b\x9a\xfb\x55\x9e\xf3\x02\
-\x1a\xa9\xfc\x09\x00\x24\xe7\xfc\xaa\x02\xc8\xda\xb6\x72\x5e\x94\
-\x81\x65\x1d\xdc\x96\x08\x5e\xf5\x79\x2f\x55\xa6\x01\x73\xe2\x41\
-\x0e\xaa\x89\x8a\xdb\xca\x1d\x06\xaa\x06\x20\x1b\xec\x36\xf4\xda\
-\xc1\xae\x2d\x1c\xa8\x9a\xf3\x36\x00\xc5\x2b\x0f\x74\x20\xc0\xd7\
-\x7f\x5e\x40\x53\x9d\x64\xa5\x2a\x00\xb2\xc1\xee\xc5\x25\xed\x6c\
-\xe8\x4b\x10\x36\xa7\x0f\x76\xa5\x4a\x80\xe4\x8c\x00\xaf\x2f\x4f\
-\xd2\x16\x0e\xb0\x67\xe8\x1c\xa9\x8c\xa0\xca\xa2\x70\xc5\xb8\x8a\
-\x01\x68\x81\xee\xb8\xc9\x6b\xfd\x1d\xac\xee\x89\xa1\xf0\x1f\xec\
-\xca\xb9\x56\x2c\x64\xb0\x79\xe9\x4c\x3a\x63\x26\x9f\xfd\x32\x96\
-\x97\x39\xfa\xd7\x95\x13\x2a\x02\xa0\x05\x16\x75\x85\x19\x5c\xd6\
-\xc1\xc2\xae\x30\xba\xcc\x60\x57\x8a\x44\x20\x68\x28\x9e\xea\x4b\
-\xd0\x1a\x0a\xf0\xc9\x4f\xa3\x0c\x8f\x67\xca\x80\x50\x21\x00\x43\
-\xc1\xea\x9e\x28\x5b\xfa\x93\xcc\x6d\x0d\x32\x59\xab\xdb\xee\x05\
-\x01\x7b\x5e\xb0\x7e\x41\x9c\xce\xa8\xc9\x07\xfb\x47\x38\x32\x96\
-\xf2\x15\x13\x54\x81\x99\x65\xcd\xfb\x45\x60\x61\x57\x98\x75\xf3\
-\xe3\x8c\x8c\x67\x38\x3c\x92\xaa\x59\xb7\xf7\x74\x02\xb8\x98\xd2\
-\x1c\x3c\x79\x19\xc3\x80\xc7\xef\x8a\xd3\x11\x09\xf8\xca\x19\x44\
-\xa1\x2a\x1e\x06\x95\x82\xc3\xa7\x53\x6c\xff\x7e\x98\x8c\x16\x96\
-\x74\x47\xd8\xb6\x6e\x36\x2d\x95\x25\xe9\xbe\x65\x28\xc5\xb1\xb1\
-\x34\xef\xee\x3d\x45\xca\xd2\x18\x4a\x91\xb6\x7c\x05\xc4\xea\x65\
-\x82\x69\x4b\xc0\x12\x2c\x2d\xa4\x32\x52\xf2\xb3\xaf\x3c\xcd\x71\
-\xe4\x23\x96\x68\x11\x26\x32\x9a\x94\x25\xd9\x75\x4c\x3f\x72\x55\
-\xac\x7c\x18\x2c\x63\x8e\xae\x80\xef\xfe\xba\xc8\xaf\x27\x2e\xbb\
-\x82\x97\x16\x98\x9b\x08\xb2\xb1\x2f\xe1\x4c\x7e\x8a\x5f\xb7\x8c\
-\x3e\x97\x07\xa1\xae\xef\x03\xa6\x6c\x57\x70\xe8\xd4\x04\xbb\x7f\
-\x3f\xe7\x9a\xda\x5a\x02\xf7\xcd\x89\xf0\x44\x6f\xa2\x2e\xc6\x35\
-\x04\x00\xd8\xa3\x48\x40\x41\xa0\xf0\x2e\x8b\x10\x28\x2f\xbb\x29\
-\xcf\x8e\x46\x01\xb8\x56\xd4\x04\xd0\x68\x03\x1a\xad\x9b\x0d\x80\
-\x6b\x18\xbc\xd9\x00\xb8\xd4\x04\xd0\x68\x03\x1a\xad\x9b\x0d\x80\
-\xe0\x23\x13\xd4\x94\x3a\xad\x57\xce\xb2\xab\xcf\xfc\x45\x29\x55\
-\x3c\x85\x9d\xa6\x3d\x43\x81\x51\xde\x0b\x31\x5f\x00\x5c\x95\x8a\
-\xdb\xaa\x48\x65\x34\xff\x9c\x9f\xf4\x3d\x1b\x54\xc0\x85\xb4\xc6\
-\x6b\xfa\xe6\xa7\x3d\x43\xc1\xf0\x78\xa6\x9c\x97\x2f\xbe\x26\x43\
-\x25\xb5\x6b\x28\x38\x3a\x9a\xe6\xad\xaf\x4e\x50\xca\xd4\x64\x3c\
-\xad\x3d\x97\xb8\xfc\xb4\xa7\x80\xb4\x16\x26\x4b\x7f\xeb\x5a\xfd\
-\x1e\x00\x30\xa9\x85\x91\x71\xab\x34\x53\x8a\xcc\x22\x7d\xb5\x57\
-\xde\x4a\x71\x6d\x00\x00\x65\xbe\x9d\xad\x5f\x7b\x39\xbe\xe5\xc9\
-\xb8\x4a\xa5\xfa\x7e\xb8\x52\x3f\x65\xbf\x2c\x2f\x0a\xc0\xa2\xf8\
-\x67\xea\xd7\xb3\x5c\xbe\x79\x01\x98\xbc\x81\x01\x64\xfc\x00\x98\
-\x00\xd2\x8d\xb6\xb4\x46\x4a\x61\xdf\xe0\xa2\x00\xc6\x80\xd1\x46\
-\x5b\x5a\x23\x5d\xc6\x7e\x0c\x8a\x02\x18\x01\x7e\x6e\xb4\xa5\x35\
-\xd2\x37\xd8\xbd\xc0\x1b\x80\xb3\x9b\x42\x03\x9f\x02\xc3\x8d\xb6\
-\xb6\xca\x1a\x02\x76\xe7\xf8\xe9\x06\x30\x25\x91\x1f\x80\xed\xd8\
-\x1b\x8f\x6e\x04\x8d\x00\xef\x08\x1c\x29\x9c\x85\xb8\x00\xec\x1b\
-\xec\x03\xa5\x04\xd8\x01\xbc\x09\x9c\x68\xb4\xf5\x15\x48\xb0\xef\
-\xfc\xab\xa0\xf6\x28\xe0\xc7\xc1\xde\xbc\x0a\x57\xcd\xb7\x72\xb6\
-\xcc\x2d\x01\x9e\x01\x96\x15\x00\x53\xd8\x1f\x1e\x9b\xe4\xef\x24\
-\xf3\xfa\xcd\x3d\x47\x79\xfc\x7d\xb5\xe4\x2b\x3b\x64\x65\x77\x83\
-\xe5\xfe\xe6\xee\x10\xcb\xe0\x1e\xe3\x53\xc0\x5e\xe0\xcb\x33\x66\
-\xf4\x58\x7b\xe6\x22\xfb\x06\x17\xba\x2e\x30\x6d\xc2\xb9\xca\xde\
-\x47\x64\x28\xfb\x5b\xfb\x42\xe3\x73\xf7\x0c\x2a\xef\x92\x9b\xd4\
-\x8a\xd7\x62\x4e\x16\x80\xc7\xdd\xcb\xae\xe5\x4e\x2d\x7b\x8a\x47\
-\xd1\xa0\x2c\x90\xc2\x69\xbc\xc6\x30\xd2\x88\xc8\xbe\x81\x5e\x9a\
-\x6a\xaa\x29\x4f\xfd\x0f\xcc\xfc\xef\x05\x9c\x32\x15\xfe\x00\x00\
-\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\
-\x65\x00\x32\x30\x31\x38\x2d\x30\x36\x2d\x30\x33\x54\x31\x32\x3a\
-\x33\x36\x3a\x34\x39\x2b\x30\x32\x3a\x30\x30\xa5\x5a\x07\xf7\x00\
-\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\
-\x66\x79\x00\x32\x30\x31\x38\x2d\x30\x36\x2d\x30\x33\x54\x31\x32\
-\x3a\x33\x36\x3a\x34\x39\x2b\x30\x32\x3a\x30\x30\xd4\x07\xbf\x4b\
-\x00\x00\x00\x46\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x37\
-\x2e\x38\x2d\x39\x20\x32\x30\x31\x36\x2d\x30\x36\x2d\x31\x36\x20\
-\x51\x31\x36\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\
-\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\xe6\xbf\
-\x34\xb6\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\
-\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\x65\x69\x67\
-\x68\x74\x00\x35\x31\x32\xc0\xd0\x50\x51\x00\x00\x00\x17\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\
-\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\
-\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\
-\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\
-\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x4d\x54\x69\x6d\x65\x00\x31\x35\x32\x38\x30\x32\x32\x32\x30\
-\x39\xe0\xd9\xfd\x9d\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\x75\
-\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x39\x2e\x35\x35\x4b\x42\x42\
-\xb8\xb0\xb1\x94\x00\x00\x00\x3e\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\
-\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x6f\x32\x59\x62\x4b\
-\x55\x44\x2f\x31\x35\x30\x38\x2f\x73\x70\x61\x63\x65\x66\x6d\x5f\
-\x31\x30\x33\x39\x30\x37\x2e\x70\x6e\x67\xc5\xa3\xa6\x34\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\x55\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x04\xf7\x49\x44\x41\x54\x58\x85\xad\
-\x57\x4b\x6c\x94\x55\x14\xfe\xce\xbd\xff\x3f\xaf\xd2\x17\x32\x31\
-\xa5\x83\xa9\xa4\x53\x83\x45\xe3\x90\xe8\x42\xe2\xa6\x31\xb2\x68\
-\x30\x92\x10\x81\x85\x9b\xb2\x62\x83\x0b\x13\xec\xa6\x2e\x24\x24\
-\x2c\x15\x43\x70\x23\x2c\x58\x88\x84\xa4\x76\xd1\x05\x26\x76\xa5\
-\x2e\x4c\x4c\x7d\xa4\x62\x32\x5a\x9a\x40\x79\x75\x28\xb5\x43\xe7\
-\xf5\xff\xf7\x1c\x17\xff\x63\x9e\xa6\x33\x2d\x67\xe6\x26\x33\x37\
-\xf7\x9e\xef\xbb\xdf\x39\xf7\xfc\xe7\x27\xb4\x69\x57\x77\x0e\xf7\
-\xf4\x74\xf7\x8e\x6b\xd0\x18\x01\x19\x10\x86\x08\xe8\x03\x00\x01\
-\xd6\x20\x58\x12\x60\xde\x40\xe6\xd6\xf3\xff\xce\x7e\xb0\xfa\xf7\
-\x7a\x3b\x7e\x69\xb3\x05\x37\x06\x5f\x4b\xc7\x6c\x3d\xa9\x49\x1f\
-\x57\xa0\x04\x11\x41\x41\x01\x04\x90\xbf\x5d\x20\xf0\xbe\x0c\x16\
-\x01\x43\x0a\x46\xcc\xb5\x92\x63\xce\x1f\x5d\xfe\x35\xbb\x25\x02\
-\xd7\x53\xa9\x78\x42\x3d\x7f\x56\x2b\x7d\x5a\x13\xd9\x4a\x69\x28\
-\x22\x0f\x94\xa8\x69\xa3\x00\x80\x08\x04\xe2\x91\x60\x03\x23\xe2\
-\x18\xe6\x0b\x05\x7e\x30\xf5\xfe\xdd\xbb\xc5\xb6\x09\xcc\xa4\x32\
-\xc3\x96\xb6\xa6\x2d\xa2\xfd\x5a\x59\x50\x4a\x81\x40\x20\xaa\x2e\
-\xa7\x86\x9d\x22\xb5\xbf\x7d\x22\xcc\x30\xec\xc2\x11\x5e\x28\xb9\
-\xee\x91\x56\x6a\x34\x11\xf8\x76\xf7\xab\x99\xa8\x1d\xb9\xa9\x95\
-\x4e\x6a\xa5\xa1\x48\x85\xc0\xcd\xe7\x6e\x6d\xe2\xe9\x01\x11\x01\
-\x0b\xc3\xb0\x81\x61\xb3\x52\x76\x2a\x87\xde\xbb\xf7\xfb\xfc\xff\
-\x12\x98\x49\xbd\x3c\x6c\xe9\xc4\x4f\xb6\x52\x49\x4b\x59\x20\x52\
-\xbe\xe4\x6d\xe1\xb6\x62\x02\x81\x40\x84\xe1\xb2\x0b\x87\x79\xa5\
-\xe8\x6e\x1c\x3c\xba\x7c\x2b\x54\x42\x05\x3f\xae\x23\x15\xd7\x2a\
-\x36\x6d\x11\x25\x35\x59\x35\xa7\x15\x4f\xdf\xad\x0c\x5f\x09\x02\
-\x41\x93\x05\x8b\x28\x19\xd3\xf1\xe9\xeb\x48\xc5\x9b\x08\x44\xf6\
-\x24\xcf\x5a\xa4\xf6\x6b\xd2\x55\xc9\x03\x1f\xdb\x18\xe4\xe7\x06\
-\x11\x41\x93\x86\x45\x6a\x34\xb6\x27\x79\xb6\x2e\x04\x37\x76\xed\
-\x4b\xc7\xe3\xb1\x85\x88\xb6\xbd\x6c\xf7\x33\xfd\x99\x9a\x77\x3d\
-\xc1\x6c\x50\x31\x8e\x53\x2c\x96\x46\x8f\xe6\x6e\x65\x2d\x00\xb0\
-\xa3\x91\x49\x4d\xca\x26\x90\xc7\x98\x10\xa6\x75\x22\xfd\x22\xe2\
-\xa9\x81\x4d\xfd\x57\x72\xab\xc8\xff\xf1\x57\xdd\x5c\xd7\xc8\x5e\
-\x6c\x64\x6f\x87\xbe\x48\x82\x70\x28\xdb\x8e\x46\x26\x01\x9c\xa4\
-\xab\x3b\x87\x7b\xfa\x13\x5d\xf7\x23\xca\x4e\x68\xa5\x41\x14\x46\
-\x05\xbd\x07\xf6\x23\xf3\xcd\x97\x20\xad\xb0\x99\x89\x08\xfe\x3c\
-\xfd\x09\x1e\xcd\x7e\x0f\x00\xd8\x7d\xec\x5d\x8c\x9c\x3b\x83\x5b\
-\x1f\x7d\x8a\x87\x33\xdf\xd5\xac\xf3\x6e\x45\x85\x9d\xc2\x93\xc2\
-\xc6\x80\x8a\x45\x23\xe3\x5e\x85\xab\x4a\x15\x8c\xf8\xd0\x9e\xb6\
-\xc0\x01\x2f\xc6\x3b\xf6\x0d\x03\x22\x18\x38\x76\x18\x23\xe7\xce\
-\x80\x94\x82\xdd\xdf\xdb\x90\x98\x5e\x74\x15\x28\x11\x8b\x46\xc6\
-\x2d\x5b\xd4\x58\x28\xbd\x77\x69\x6a\xcf\xd5\x16\x78\xad\x0d\x1c\
-\x3b\x8c\x97\xce\x7d\x0c\x52\x2a\x3c\x90\x08\xd7\x93\xf5\x43\x61\
-\x8b\x1a\xb3\x40\x92\x21\x1f\x8a\x1a\x00\x45\x3a\x23\xb0\xeb\xed\
-\xb7\x90\x18\x1e\xaa\x82\x23\x28\x4a\x0d\x7e\xe1\x67\x3f\x49\xc6\
-\x22\xc6\x10\x34\x40\x22\x5b\x38\x6f\xbd\x75\x8d\xec\x6d\x9e\x94\
-\xe6\x83\x50\x10\x0a\xc6\x90\x25\x90\x3e\x88\x40\x48\xc2\x3b\x5b\
-\xdd\xbc\x5d\x4a\x21\x83\x86\x19\x09\x1e\x5c\x7d\x56\x30\x21\x02\
-\x34\x32\x78\x46\xf0\x68\xd4\x56\xa4\x3a\xa7\x44\x64\x2d\x28\x9b\
-\x4d\x95\xf4\x59\x50\x68\x55\xa1\x03\x05\x44\xd6\x94\x81\x2c\xb1\
-\xf7\x27\xe4\x1b\xf2\xee\x10\xbf\x78\x67\xb9\x29\xde\x82\x56\x7e\
-\xbd\x9e\xc1\x40\x96\x94\x11\x99\x67\x78\x65\xb2\x99\x69\x67\x76\
-\x7f\xe6\x26\xb2\xe7\xbf\x68\x26\xd1\xe0\xb7\x8a\x27\xf3\xca\x08\
-\xcf\x31\x0b\x84\x05\xad\x3e\x1d\x99\x08\x6e\x5f\xbc\xd2\x40\xa2\
-\x85\x57\x16\x30\x0b\x1c\xe1\x39\xb5\xc2\x8f\x67\x1d\x36\x05\x9f\
-\x51\xdd\xc2\xe2\x9d\x7b\x1d\xd5\x82\x8d\x7f\x96\x20\x10\x2c\x5e\
-\xbc\x1c\x92\x70\xd6\x9f\xd6\x83\xfb\x0f\x25\x87\x4d\xc1\xb0\xcc\
-\x12\x00\x7c\x9d\x4c\x7f\x95\xd0\x91\x09\xcb\xef\x7e\x6a\x3b\x9f\
-\xde\x03\xaf\x20\xf1\xc2\xe0\xa6\xe0\xe5\xdc\x2a\x56\x7f\xf8\xb9\
-\x6e\xae\xff\x8d\x0c\x9e\xfc\xf2\x1b\x60\xb8\xaa\x85\x08\x5c\x61\
-\x14\x4c\xe5\xf2\x89\x95\xec\x49\x02\x80\xcb\xdd\x7b\xd3\x3d\x31\
-\x7b\x21\xaa\x6d\xdb\x6b\xc1\xda\x3e\x74\x47\x26\x02\xb0\x30\xca\
-\xc6\x71\xd6\x4b\xce\xe8\x44\x7e\x31\xab\x00\x60\x22\xbf\x98\x2d\
-\x8b\xb9\xe0\x8a\x01\x83\xfd\x50\x6c\xbb\x17\xa9\x1f\x22\x60\x30\
-\x5c\x31\x28\x8b\xb9\x30\x91\x5f\xcc\x02\x35\x1d\xd1\x83\x5c\x69\
-\xaa\x64\xdc\x05\xc3\x5e\x6f\x2f\x5b\x6d\xc3\x5a\x8c\xf0\xda\x31\
-\xa3\x64\xdc\x85\x07\xb9\xd2\x54\x80\x5b\x27\xf6\xa5\xee\xc1\xf4\
-\x73\xd1\xae\x1f\x23\xda\x4a\xea\x9a\x77\x80\xed\xea\x2e\x10\x18\
-\x11\x94\x8d\x93\xdb\x28\x17\xde\x9c\xc8\x2f\x37\x37\xa5\x00\x70\
-\x2a\xbf\x9c\x5d\x77\xca\x87\x4a\xc6\x5d\x71\x85\x51\x7b\x33\x3a\
-\x15\xbd\x36\xe3\x5d\x61\x94\x8c\x93\xcb\x3b\x95\x77\x6a\xc1\x9b\
-\x14\xa8\x55\xa2\x27\x1a\x9f\x8e\x29\x6b\x54\x87\x37\x23\x10\x63\
-\x33\x45\xfc\x82\x06\x2f\xee\x46\x18\x25\x76\x17\xd6\xcb\xc5\x23\
-\xa7\x1a\xc0\x01\x40\xb7\x72\x31\x5b\xc9\xaf\x1e\x2c\x24\xae\xd8\
-\x51\xc4\x00\x79\x9d\x00\x0d\x50\x5b\x8f\x86\x20\x81\x59\x18\x15\
-\x76\x9d\xa2\x71\x3f\x7b\xf4\xb8\x7c\xe2\x74\x65\xf9\x61\xab\xf5\
-\x9b\x06\xf8\x52\xf7\x60\xba\xdb\x8a\x4d\x5a\x4a\x1d\xb7\x94\x4a\
-\xa8\x86\x3a\x51\x07\x0e\x2f\xd9\x5c\xe6\x82\xcb\x7c\x2d\xef\x96\
-\xce\xb7\x3a\x75\x47\x04\x02\xfb\x1c\x3b\x7b\x76\xf4\x77\x8f\xdb\
-\xa4\xc7\x34\x54\x86\x08\x43\x20\xef\xf5\x1c\x82\x35\x11\x2c\x19\
-\xf0\xbc\x23\x66\xee\xe9\x93\xfc\xec\x87\x58\x6d\xeb\xf5\xfc\x3f\
-\x1a\x8e\x6b\xb0\x0d\x5e\xbd\x9e\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x03\xf9\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x03\x9b\x49\x44\x41\x54\x58\x85\xed\
-\x96\x3b\x6c\x1c\x55\x14\x86\xbf\x3b\x33\xde\xd9\xdd\xd9\xcd\xda\
-\xc6\x4f\xd6\x98\x44\x8a\x62\x3b\xb6\x95\x86\x14\x44\x71\x01\xca\
-\x02\x05\x8f\x02\x29\x51\xb0\x70\x07\x48\x08\x57\x14\x41\xc8\x1d\
-\xa2\xa4\x0a\xa2\x08\x5d\x90\x0b\x8c\x5c\x20\xa5\x20\x6c\x48\x02\
-\xb6\x43\x11\x8a\xa0\x98\x04\x64\x93\xac\x1d\x47\xac\x6d\xf0\x6b\
-\x67\x67\x1f\xde\x99\x43\xe1\xec\x60\x48\xbc\xde\x15\x65\xfc\x57\
-\x67\xe6\x5e\x9d\xff\xbb\x8f\x73\xef\x85\x3d\xed\xe9\x71\x97\xaa\
-\xd4\x98\x9c\x98\xe8\x44\xf4\xc3\x0a\x89\x80\x5e\x63\x6a\x17\x41\
-\xd9\x28\xf7\x56\x62\x60\x60\xbe\x6a\x00\x11\x51\x97\x26\x7f\x7c\
-\x53\x83\xf7\x45\xe8\x57\x4a\x55\x84\xdc\x4d\x22\x22\x4a\x71\x13\
-\xf8\xe4\xf9\xe3\xcf\x7e\xa1\x94\x92\x1d\x01\x92\xc9\x64\x4c\x05\
-\x23\x5f\x2a\x78\xf1\xff\x98\x56\xd0\x45\x2f\x6f\x9f\x4a\x24\x12\
-\xeb\x0f\x01\x4c\x4f\x4f\x07\xd2\x2b\x1b\x57\x94\x52\xc7\x00\xcc\
-\x40\x80\xfa\xfa\x18\xa6\x19\x60\x0b\x59\xf0\x10\x16\x9c\x65\x2e\
-\x2e\xfe\xc4\xbc\xb3\x54\xd1\x49\xa1\xb0\x94\x49\x77\x20\xce\x91\
-\xc0\x01\x74\xa5\x6d\x65\x11\xb9\xd6\xd6\xb8\xef\xb9\xbe\xbe\xbe\
-\xe2\xbf\x00\x2e\xfd\x70\xed\x23\xa5\xd4\x08\x40\xd3\x13\x8d\xb4\
-\xb6\x34\x91\xcb\xe7\x89\x46\x22\xe4\xf3\x05\x00\x82\x41\x93\x8c\
-\x6d\x63\x06\x4d\x3e\x4b\x5d\x60\x7c\x79\xaa\x22\x84\x78\x82\x14\
-\x4b\x3c\xa9\x35\xf2\x4e\xec\x05\x9a\xf5\x18\x00\x1e\xf2\x71\x62\
-\xe0\xd8\x88\x0f\x70\x61\x62\xa2\x21\x84\x7e\x0f\x94\x15\x8d\x58\
-\x1c\xd8\xdf\xc9\xfa\x46\x86\xb9\xf9\x05\x8e\xf4\x1f\x26\x35\xbf\
-\x00\xc0\xfe\xce\x0e\x7e\xbe\x79\x8b\xa7\x3b\x3b\x88\xed\x8b\xf2\
-\xc1\x1f\xa3\x5c\x77\x66\x77\x85\x70\x33\x79\x62\x76\x1d\x1f\xd6\
-\xbf\x4e\x58\x33\x01\xb2\x39\x4a\x4f\xbd\x3c\x30\xb0\xaa\x01\x84\
-\xa8\x7b\x05\x94\x05\xd0\xd2\xdc\xc4\x43\xfb\x4e\x00\xd9\xb6\x77\
-\x44\x50\x4a\x71\xba\xe1\x78\x45\x73\x00\xa5\x29\x8c\x58\x88\x8d\
-\x7a\x8f\x6f\x73\x37\xca\xbf\x2d\xd3\xd3\x5f\x05\x28\x2f\xcc\xd1\
-\x72\x4b\x38\x1c\xda\x35\x69\x59\xdd\x66\xbc\xea\xbe\xba\x15\xe0\
-\x86\x7e\xcf\xff\xd6\x94\x7a\xe6\x1f\x00\x25\x4d\xe5\x06\xd7\x73\
-\xab\x4e\xaa\x79\x55\x77\x05\x60\x2d\x54\xf4\x63\x41\x9a\x7d\x00\
-\xcf\xc3\x9f\xdf\xe5\xbf\x56\xb6\x88\x75\x1d\xc3\xd8\x3a\x7c\x0c\
-\x43\xc7\x30\x0c\x3f\xd6\x1f\xc4\xe9\xc5\xca\x95\xf0\x5f\x59\x81\
-\xb0\x1f\x7b\x9e\x27\x3e\x80\x9d\x77\xfc\xb1\xcc\xde\xb9\x8b\x88\
-\x10\x8d\x58\xf4\xf6\x74\x01\xd0\x11\x6f\xa7\x23\xde\x0e\x40\x6f\
-\x4f\x17\xd1\x88\x85\x88\x70\xf5\xb7\xeb\x35\x01\x1c\xf2\x5a\xfd\
-\x38\x5b\xc8\xbb\x3e\xc0\x9a\x9d\xb9\x2b\x0f\x36\x99\xa6\x34\xae\
-\x4c\x4d\xe1\xba\x3b\x2f\x85\xeb\xba\x5c\x9e\x9c\x64\x8a\xca\x15\
-\xb0\x5d\x9a\x28\x4e\x94\xba\x01\x10\x11\x56\x37\xd6\x53\x00\x06\
-\x80\x93\xcb\x5e\xb6\x73\xce\x48\x34\x6c\x11\xb5\x22\xa4\xff\x5c\
-\x62\x74\x7c\x9c\xae\x83\x07\x69\x88\xc5\xfc\xaa\x10\x11\x56\xd7\
-\xd7\xf9\x75\x66\x86\x19\x63\x99\xd9\x7e\xbb\x6a\xf3\xd3\x9b\x47\
-\x89\x4b\x03\x00\x76\xce\x21\x57\xc8\x7d\xe7\x03\xbc\x3b\x38\x78\
-\xf5\xdc\xd8\x57\xb7\x43\x66\xb0\xc7\xd0\x75\xda\x9a\x5a\xb0\x42\
-\x61\xee\xa4\xe6\x58\xdd\x58\xa3\x54\x72\x51\x80\x87\x60\x87\x4b\
-\xcc\xb5\x67\xf9\x3d\x6e\x23\x5a\x05\x57\x81\x30\x01\x0e\xb9\xad\
-\x9c\x28\x75\xfb\xe6\x25\xd7\x65\x71\x6d\xe5\xf6\xd2\xcc\xcc\xf7\
-\xb0\xed\x24\x3c\x7b\xfe\x7c\x22\x1c\x0c\x7f\xd3\xd1\xd2\xa6\x19\
-\x7a\xad\x37\x5f\x75\x2a\xb9\x2e\x0b\xcb\x69\xcf\xc9\x15\x5f\x1a\
-\x1e\x7a\x23\x09\xe5\x32\x04\x86\x87\x86\x92\x4e\x31\x7f\x26\x95\
-\xbe\x2f\x19\x27\x8b\x88\xec\x9c\xa9\x46\x89\x08\x19\x27\x4b\x2a\
-\x7d\x5f\x9c\x42\xfe\x4c\xd9\x1c\x1e\x71\x1d\x7f\x3a\x3a\x3a\x08\
-\xea\x6c\xc0\x30\x1a\x22\xa1\x30\x66\x5d\x00\x4d\x29\xa8\xf5\x56\
-\x16\xc1\x13\xa1\xb0\x59\xc4\xce\x39\x14\x4b\xa5\x55\x90\xe1\xf7\
-\x06\x07\x47\xb7\x77\x7b\x64\xd6\xcf\xc7\xc6\x1a\x0b\x9b\x9b\x6f\
-\x23\xbc\x06\xf4\x02\x91\x5a\xdf\x05\xb2\x35\x85\x36\xf0\x0b\x8a\
-\xaf\xcd\xba\xba\x73\x6f\x9d\x3c\xb9\x52\xdb\x28\xf6\xb4\xa7\x3d\
-\x3d\x0e\xfa\x1b\xe1\xd7\x6c\xa8\x95\x6c\x8c\x8f\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\x4e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x1b\x00\x00\x00\x20\x08\x04\x00\x00\x00\x49\x60\xcb\xb0\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x02\
-\x62\x4b\x47\x44\x00\xff\x87\x8f\xcc\xbf\x00\x00\x00\x09\x70\x48\
-\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\x0e\x1b\x00\
-\x00\x00\x07\x74\x49\x4d\x45\x07\xe5\x0b\x16\x0d\x03\x35\xfd\xb9\
-\x1d\x70\x00\x00\x00\xf1\x49\x44\x41\x54\x38\xcb\xed\xd5\x4d\x4a\
-\xc3\x50\x14\xc5\xf1\xdf\x6b\xe2\xc7\x58\x90\x14\x62\x96\x21\x12\
-\x9d\xb8\x09\x37\xa1\x6e\xa7\x6e\xc2\xb9\xe0\x12\x3a\x70\x05\x0a\
-\x0e\x8c\xd8\x80\x73\xa1\xa4\xc6\x41\x13\x03\xda\x62\x1a\xa7\xbd\
-\x6f\xf4\x1f\x1c\xee\x3d\xf7\xc0\x7d\x0c\xaa\x00\x76\x1c\x8a\x7b\
-\x2a\x2a\xef\xe6\x01\x27\x2e\x9d\xda\xed\x29\x9b\x9b\xba\xe1\xdc\
-\xa3\x7a\xc3\xf7\xc4\xdd\xc6\xa2\x5a\x1d\x7c\xd8\x47\xa5\x54\x21\
-\x96\x88\x7b\x70\xa3\x2f\xe4\x32\x99\x5c\xd1\x87\xdb\xfd\x2d\xbc\
-\x7a\x41\xb0\xe8\xc3\xa3\x61\xb9\xb5\xdd\x22\xa9\x1a\x89\x52\x40\
-\x29\x59\xc9\xa9\x68\x19\x77\xdd\x84\x58\xaa\x8c\xcc\x5c\x99\x61\
-\x6c\x62\xcc\x0f\xfe\x6c\x57\x12\x7f\x77\x4d\x2d\x17\x54\x36\x1e\
-\x12\xd9\x0a\x6e\xea\x9f\xde\xda\x21\xd7\x79\x5a\xf2\xaf\x21\x4b\
-\x17\x8a\xb5\x9e\x3a\x3e\x72\x2b\xed\x64\x5d\x2e\xab\x3d\x75\xbc\
-\xcd\x6d\x9b\x5b\x93\xcb\x5f\x3c\xf8\x04\xdd\x0f\x39\x78\x91\x37\
-\x67\x0e\x36\xb4\xf6\x1c\x90\xbb\x76\x6c\xaf\xa7\x64\xee\xc1\x64\
-\xe0\xd7\x31\x6c\xff\xbe\x00\xc5\x8a\xfb\x75\xa9\xab\x80\x36\x00\
-\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\
-\x74\x65\x00\x32\x30\x32\x31\x2d\x31\x31\x2d\x32\x32\x54\x31\x33\
-\x3a\x30\x33\x3a\x35\x33\x2b\x30\x30\x3a\x30\x30\x48\x57\x2e\xca\
-\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\
-\x69\x66\x79\x00\x32\x30\x32\x31\x2d\x31\x31\x2d\x32\x32\x54\x31\
-\x33\x3a\x30\x33\x3a\x35\x33\x2b\x30\x30\x3a\x30\x30\x39\x0a\x96\
-\x76\x00\x00\x00\x20\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\
-\x65\x00\x68\x74\x74\x70\x73\x3a\x2f\x2f\x69\x6d\x61\x67\x65\x6d\
-\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\xbc\xcf\x1d\x9d\x00\x00\x00\
-\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\
-\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x49\x6d\x61\x67\x65\x3a\x3a\x48\x65\x69\x67\x68\x74\x00\x35\x31\
-\x32\x8f\x8d\x53\x81\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\
-\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\
-\x00\x34\x34\x38\x80\x1c\x74\xb0\x00\x00\x00\x19\x74\x45\x58\x74\
-\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\
-\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\
-\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\
-\x65\x00\x31\x36\x33\x37\x35\x38\x36\x32\x33\x33\xbd\x51\x15\xb7\
-\x00\x00\x00\x12\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\
-\x69\x7a\x65\x00\x34\x32\x34\x37\x42\x42\x71\x0a\x8a\x4c\x00\x00\
-\x00\x47\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\
-\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\
-\x73\x2f\x35\x36\x2f\x74\x79\x6e\x58\x4b\x66\x71\x2f\x33\x32\x34\
-\x37\x2f\x63\x68\x65\x73\x73\x5f\x62\x6f\x61\x72\x64\x5f\x69\x63\
-\x6f\x6e\x5f\x31\x39\x39\x34\x30\x31\x2e\x70\x6e\x67\x0c\x40\xae\
-\xed\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\xb1\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x02\xc1\x50\x4c\x54\
-\x45\x00\x00\x00\x55\x8d\xbf\x52\x8b\xbe\x7f\xaa\xd0\xb2\xcd\xe5\
-\x00\x57\xa9\x00\x58\xa9\x35\x7a\xbb\x4c\x88\xc3\x4c\x8a\xc3\x4c\
-\x89\xc3\x50\x8b\xc4\x3d\x7f\xbe\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\
-\xbf\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\
-\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\x55\
-\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\
-\xbf\x55\x8d\xbf\x54\x8c\xbf\x62\x96\xc4\x53\x8c\xbe\x55\x8d\xbf\
-\x55\x8d\xbf\x7a\xa7\xce\x9b\xbd\xdc\x54\x8c\xbf\x62\x96\xc4\xab\
-\xc8\xe2\xab\xc8\xe3\x56\x90\xc7\x6d\x9f\xce\x4e\x8a\xc4\x4b\x88\
-\xc3\x4c\x89\xc3\x4c\x89\xc3\x55\x8d\xbf\x55\x8d\xbf\x55\x8d\xbf\
-\x4e\x89\xbd\x0a\x5d\xac\x00\x57\xa9\x4c\x89\xc3\x4c\x89\xc3\x4d\
-\x8a\xc3\x00\x57\xa9\x00\x57\xa9\x00\x57\xa9\x2d\x75\xb8\x00\x57\
-\xa9\x4c\x89\xc3\x4c\x89\xc3\x00\x57\xa9\x00\x57\xa9\x00\x57\xa9\
-\x4c\x89\xc3\x4d\x89\xc3\x31\x77\xba\x00\x56\xa9\x00\x57\xa9\x4c\
-\x89\xc3\x4c\x89\xc3\x4c\x89\xc3\x4c\x89\xc3\x00\x57\xa9\x00\x57\
-\xa9\x00\x57\xa9\x4d\x8a\xc3\x4c\x89\xc3\x4c\x89\xc3\x4c\x89\xc3\
-\x00\x57\xa8\x00\x57\xa9\x00\x57\xa9\x00\x56\xa9\x4c\x89\xc3\x4c\
-\x89\xc3\x4c\x89\xc3\x00\x57\xa9\x00\x57\xa9\x2d\x74\xb8\x4e\x8b\
-\xc4\x4c\x89\xc3\x00\x57\xa9\x00\x55\xa8\x16\x65\xb1\x47\x86\xc1\
-\x4d\x8a\xc3\x0b\x5e\xad\x2f\x76\xb9\x55\x8f\xc6\x20\x6c\xb4\x3a\
-\x7d\xbd\x55\x8d\xbf\x54\x8c\xbe\x5a\x90\xc1\x84\xad\xd2\x5e\x93\
-\xc3\x54\x8d\xbf\x56\x8e\xbf\x6e\x9e\xc9\x98\xbb\xda\xb0\xcc\xe4\
-\xb3\xce\xe6\xb2\xcd\xe5\x9f\xc0\xdd\x78\xa5\xcd\x59\x90\xc1\x54\
-\x8c\xbf\x8e\xb4\xd6\xad\xca\xe3\xb3\xce\xe5\x69\x9b\xc8\x3a\x7c\
-\xba\x66\x9b\xcc\xa7\xc6\xe1\xb5\xcf\xe6\xb0\xcb\xe4\x92\xb8\xda\
-\x64\x98\xc9\x56\x8d\xbf\x23\x6c\xb2\x02\x57\xa9\x2e\x76\xb9\x7d\
-\xaa\xd3\xaf\xcb\xe4\xb4\xcf\xe6\x9c\xbf\xde\x71\xa1\xcf\x50\x8c\
-\xc4\x4d\x89\xc2\x23\x6d\xb2\x00\x56\xa9\x00\x55\xa8\x09\x5d\xac\
-\x43\x83\xbf\x8b\xb3\xd8\x55\x8f\xc6\x4b\x88\xc3\x4c\x89\xc3\x4e\
-\x8a\xc2\x00\x57\xa9\x00\x56\xa8\x27\x70\xb6\x4d\x89\xc3\x4b\x89\
-\xc3\x01\x57\xa9\x1f\x6b\xb4\x2a\x72\xb5\x1f\x6c\xb4\x52\x8d\xc3\
-\x56\x8e\xc0\x83\xac\xd2\x8f\xb6\xd9\x4b\x89\xc2\x0c\x5e\xad\x4e\
-\x8a\xc4\x6c\x9e\xce\x96\xba\xdb\x8d\xb3\xd6\x64\x97\xc5\x58\x8f\
-\xc0\x76\xa4\xcd\x83\xae\xd5\x35\x7a\xbb\x03\x58\xaa\x1f\x6a\xb3\
-\x61\x97\xca\x8d\xb4\xd8\xae\xca\xe3\xb4\xce\xe6\xa5\xc4\xe0\x7f\
-\xaa\xd0\x66\x99\xc6\x97\xbb\xda\xaa\xc8\xe2\x6f\xa1\xce\x3e\x80\
-\xbe\x80\xac\xd4\xa9\xc7\xe2\xb1\xcd\xe5\x52\x8b\xbe\x39\x7c\xba\
-\x77\xa6\xd1\x45\x84\xc0\x56\x90\xc6\xa0\xc1\xdf\xb3\xcd\xe5\x9a\
-\xbd\xdd\x15\x63\xae\x06\x5a\xab\x3d\x80\xbe\xb1\xcc\xe5\x96\xba\
-\xdc\x68\x9c\xcc\x4f\x8b\xc4\x2c\x73\xb8\x01\x56\xa9\x23\x6e\xb5\
-\x6e\xa0\xce\xaa\xc7\xe2\xa3\xc3\xe0\x7a\xa8\xd2\x54\x8e\xc6\x15\
-\x64\xae\x11\x62\xae\x53\x8e\xc5\x74\xa4\xd0\x52\x8d\xc5\x4d\x8a\
-\xc3\x2d\x74\xb8\x05\x59\xaa\x34\x79\xbb\x82\xad\xd5\x86\xb0\xd6\
-\x5b\x93\xc8\x33\x78\xba\x19\x68\xb1\x13\x63\xaf\x49\x87\xc2\xff\
-\xff\xff\xc8\xbc\xe4\xa1\x00\x00\x00\x6b\x74\x52\x4e\x53\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x7e\x98\x96\x99\
-\x58\x5c\xf9\x0e\xba\xfc\xb6\x95\xd4\xcb\x1a\x39\x62\x60\xc6\xb1\
-\x5e\x60\x5f\xbe\xfe\xfe\x96\x97\xd9\x51\x04\xd6\x1f\xdf\x22\xdf\
-\x3e\x6b\x69\x6e\xda\xfe\xfe\xfc\xfe\xfd\x08\xb7\xf0\xfb\xd7\x1f\
-\x37\xac\xf7\xf1\x9a\x3e\x7e\xe5\xfd\xc4\x4e\x04\x0b\x59\xc8\xfa\
-\xba\x48\x06\x02\x34\x9f\xf3\xdb\x74\x16\x18\x76\xbd\x65\x10\x07\
-\x4b\xb4\x92\x27\x02\x0e\x01\x0d\x07\xa1\xa4\x91\x7a\x00\x00\x00\
-\x01\x62\x4b\x47\x44\xea\xc8\xda\x16\x2e\x00\x00\x00\x09\x70\x48\
-\x59\x73\x00\x00\xec\x38\x00\x00\xec\x38\x01\x71\x2b\xca\x38\x00\
-\x00\x01\xea\x49\x44\x41\x54\x38\xcb\x63\x60\x18\x8a\x80\x91\x97\
-\x8f\x5f\x00\x0a\x04\x85\x18\xb1\x28\x10\x16\xc9\x86\x03\x01\x4c\
-\x05\x8c\xa2\x62\xd9\xe2\x12\x92\x20\xfd\x92\x52\x58\x15\x00\x0d\
-\x90\x96\x01\x8b\x33\x0a\xc0\x14\x30\xca\xca\xc9\xc3\x80\x9c\x42\
-\x76\xb6\xa2\x92\xbc\x32\x90\xa9\xa2\x0a\x57\x20\x90\x8d\x04\x72\
-\x72\xd5\xd4\xf3\xf2\x73\x90\xdd\x80\xac\xa0\xa0\xb0\xa8\xb8\xa4\
-\xb4\xac\xbc\xa2\xb2\x0a\xab\x82\x82\xfc\xea\x9a\xd2\xb2\xb2\xb2\
-\xda\x92\xe2\xba\x02\xac\x26\xd4\x37\x34\x36\x81\x14\x34\xb7\xb4\
-\x62\x55\xd0\xd6\xde\xd1\xd9\xd5\xdd\x53\xd6\xdb\xd7\x3f\x01\xab\
-\x15\x6d\x13\x27\x4d\x9e\x32\x75\x5a\xd7\xf4\x19\x33\x67\xe1\x52\
-\x30\x7b\xf6\x9c\xb9\xf3\xe6\xcf\xc4\xa3\x60\xc1\xa4\x85\x33\x67\
-\xe2\x50\x50\x90\xbd\x68\xce\xec\xd9\x93\x16\xcf\x9b\x39\x73\xc6\
-\x92\xa5\x55\x18\x0a\x72\xf2\x97\x2d\x5f\xb1\x72\xf2\x9c\xc5\x33\
-\x67\xac\x5a\xbd\x66\xed\xba\x2a\x0d\x26\x64\x05\x55\xeb\x37\x94\
-\x97\xf5\x94\x6c\xdc\xb4\x79\xcb\xcc\xad\xdb\xb6\xef\xa8\xdd\xb9\
-\x4b\x93\x99\x05\xa1\xa0\x6a\xf7\x9e\x92\x5a\x60\x10\xf4\xec\xdd\
-\xb7\xff\xc0\x41\x10\xab\xf6\x90\x96\xb6\x0e\x42\xc1\xe1\x23\x47\
-\x6b\x76\x80\x84\x6b\xa6\x1d\x3b\x7e\xa2\xe7\x24\x90\x55\x76\x4a\
-\x57\x0f\x49\xc1\xe9\x33\x67\xa7\x95\xed\x38\x77\xfe\xc2\xc5\x4b\
-\x97\xaf\x5c\xbd\xd6\x54\x7b\xfd\xc6\x4d\x7d\x03\x24\x05\xb7\xe6\
-\x4c\xbe\x7d\x67\xf9\xdd\x7b\x33\xee\x3f\x98\x3d\xe7\xe1\xa3\xc7\
-\x4f\x9e\xce\x98\x6f\x88\xa2\x00\x18\x46\x0b\x9e\x01\x43\x00\xa8\
-\x00\x18\x5a\xcf\x67\xcc\x98\x39\x13\xaa\xc0\xc8\xd8\xc4\xc4\xc4\
-\xd4\x6c\xb6\xf9\x82\xd9\x0f\xee\x5b\x58\x5a\x3d\x98\x6d\x3d\x7b\
-\xf6\x8b\x97\x33\x2d\xa0\x0a\xc0\x80\xd5\xc6\x16\xa8\x0f\xa8\x60\
-\xa6\x85\x95\x9d\xbd\xf9\xec\x49\x40\x05\x33\x67\x3a\x38\x22\x14\
-\xb0\x39\x39\xbb\x80\x15\xb8\xba\xb9\x7b\x78\x82\x15\x78\x79\xfb\
-\xf8\x22\xa5\x57\x56\x3f\xff\x00\xeb\x07\x81\x41\xc1\x21\xec\xa1\
-\x61\xe1\x11\x2f\x5e\x46\x46\x45\x73\x70\x22\xa7\x68\x56\xd6\x98\
-\xd8\xb8\xf8\x04\x2e\x10\x33\x31\x29\x39\x25\x95\x83\x0b\x3d\xd1\
-\xb3\xa6\xa5\x67\x40\x05\xb9\x33\xb3\x78\x40\x34\x00\xd3\xe0\x10\
-\x99\x02\xa2\x9d\x15\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x30\x2d\x30\x31\
-\x2d\x31\x30\x54\x31\x36\x3a\x33\x31\x3a\x31\x39\x2b\x30\x30\x3a\
-\x30\x30\x4e\x20\x5b\x30\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
-\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x30\x2d\x30\
-\x31\x2d\x31\x30\x54\x31\x36\x3a\x33\x31\x3a\x31\x39\x2b\x30\x30\
-\x3a\x30\x30\x3f\x7d\xe3\x8c\x00\x00\x00\x46\x74\x45\x58\x74\x73\
-\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\
-\x69\x63\x6b\x20\x36\x2e\x37\x2e\x38\x2d\x39\x20\x32\x30\x31\x39\
-\x2d\x30\x32\x2d\x30\x31\x20\x51\x31\x36\x20\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\
-\x6b\x2e\x6f\x72\x67\x41\x7b\xe2\xc8\x00\x00\x00\x18\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\
-\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\
-\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\
-\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\x00\x35\x31\x32\xc0\xd0\x50\
-\x51\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\
-\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\
-\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x35\
-\x37\x38\x36\x37\x33\x38\x37\x39\x4c\xea\xeb\xe0\x00\x00\x00\x13\
-\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\
-\x31\x36\x2e\x33\x4b\x42\x42\x56\x81\x86\x4a\x00\x00\x00\x4d\x74\
-\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\
-\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\
-\x36\x2f\x38\x62\x76\x73\x33\x61\x56\x2f\x32\x31\x30\x37\x2f\x66\
-\x6f\x6c\x64\x65\x72\x5f\x74\x79\x70\x65\x5f\x6d\x6f\x64\x65\x6c\
-\x5f\x69\x63\x6f\x6e\x5f\x31\x32\x39\x38\x38\x33\x2e\x70\x6e\x67\
-\x03\x52\x42\xf6\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x19\x21\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x18\xc3\x49\x44\x41\x54\x78\x9c\xd5\
-\x9b\x69\x90\x1d\x57\x95\xe7\x7f\xf7\xe6\xfa\x5e\xed\x8b\xa4\x2a\
-\x95\x55\xb6\x4a\x25\x61\xd9\x32\x96\x64\x83\x8d\x6d\x79\x07\xcc\
-\x04\xc6\x61\x6c\x35\x98\x7d\x8b\x68\x88\xe8\x89\xe8\x98\x88\x21\
-\x62\x22\x86\xa0\xa7\x9b\x98\xee\x68\xb6\x61\x7a\xf8\x30\x03\x0c\
-\x1d\x41\xd3\x0d\x78\x69\xc0\xc2\x36\x34\x60\xbc\xe0\x05\xb0\x91\
-\x6c\x6d\xb6\x4a\x4b\x6d\x2a\xd5\xbe\xbd\x35\x33\xef\xbd\xf3\x21\
-\x33\xdf\xcb\x57\xaf\x84\x6d\xda\x34\x3d\x59\x71\xe2\xbe\xca\xf7\
-\xee\xc9\xfb\xff\x9f\x73\xcf\x3d\x77\x49\xc1\x1f\xe7\x12\xfb\x41\
-\x66\x6f\xdc\x0b\x1a\x30\xff\xe6\x0d\xf9\x43\xeb\xbf\x01\xbc\x3e\
-\xe8\xb3\xe1\xd2\xf6\x7c\x7e\x67\xff\xc0\xc0\x50\xf7\xe0\xe0\xa6\
-\xd6\xcd\x9b\x3b\xa5\x94\x0e\x80\x52\x2a\x2a\x4e\x4d\x2d\x2e\x8d\
-\x8d\x4d\x4f\x9e\x3b\x77\x6a\x65\x75\xf5\x58\x00\x47\x67\x60\xea\
-\x31\xa8\xf2\x07\x24\xe6\x0f\x41\x80\xd8\x0f\xed\xbe\x65\xed\xdb\
-\xba\x75\xeb\xed\x97\xdc\x7c\xf3\xb5\x5b\x2e\xbf\x7c\x78\x70\xcf\
-\x1e\x6f\xc3\xf6\xed\xb8\x5d\x5d\x08\xb1\xfe\x63\x8d\x31\x04\x8b\
-\x8b\xcc\x9e\x38\xc1\xf8\xa1\x43\xd5\xf1\x83\x07\x47\x8e\xfd\xec\
-\x67\xbf\x1c\x1d\x1b\x7b\xb0\x10\x04\x4f\xdc\x0b\x2b\xbc\xce\x64\
-\xbc\x6e\x04\xec\x07\x4b\xc0\xce\x8b\x36\x6f\xfe\xc4\x9b\xf7\xef\
-\xbf\x6b\xf7\x3b\xdf\x39\x70\xd1\x35\xd7\x08\xcb\x18\x88\x22\x30\
-\x06\x84\x00\x29\xc1\xb2\xe2\x52\xca\xf8\xbe\x31\xa0\x35\x28\x15\
-\x0b\xc4\xbf\xb5\x6d\xb4\x10\x9c\x79\xfa\x69\x73\xe8\xc0\x81\xc9\
-\x67\xee\xbb\xef\xfe\x33\x13\x13\x5f\x37\x70\xec\x5e\x50\xaf\x47\
-\xbb\x5f\x0f\x02\xe4\x07\x6d\x7b\xef\xf6\x9d\x3b\x3f\x7d\xd3\xc7\
-\x3f\x7e\xfb\x95\xef\x7d\xaf\xef\xd9\x36\x14\x8b\x08\xa5\xc0\xb6\
-\xeb\x62\x59\x75\x91\x32\x06\x99\x25\x40\xeb\x98\x2c\xa5\xe2\x32\
-\x11\x63\x59\xd0\xda\x4a\x55\x29\x9e\xfb\xee\x77\x2b\xbf\xf8\xfa\
-\xd7\x1f\x7c\xe9\xe8\xd1\xbf\xfd\x56\x14\x3d\x4f\x1c\x3b\xfe\x38\
-\x04\xbc\x1f\xfa\x07\x06\x06\xfe\xeb\x3b\xfe\xfc\xcf\x3f\xfa\x96\
-\x0f\x7d\x28\xe7\x94\x4a\xb0\xbc\x8c\xb0\x2c\x70\x1c\xb0\x6d\xc4\
-\x7a\x04\xa4\xe0\xd3\xae\x90\x25\x20\xf5\x82\x2c\x01\x51\x04\x61\
-\x18\xdf\xef\xe8\x20\x6c\x6d\xe5\x99\x7f\xf8\x87\xf2\x43\x5f\xfe\
-\xf2\x37\x27\xc6\xc7\x3f\xf7\x6d\x98\xfa\x37\x25\xe0\x06\xb0\x87\
-\x7d\xff\xae\xeb\xdf\xfd\xee\xcf\xdf\xfe\x99\xcf\x6c\x69\x17\x02\
-\xe6\xe6\x6a\xc0\x45\x02\x1e\xc7\xa9\x13\x90\x05\x2f\x25\x47\x4e\
-\x9d\x66\x6c\x76\x01\x80\xc1\x0d\xdd\x5c\x3a\xb4\xb5\x91\x80\x84\
-\x84\x1a\xf8\xa4\x34\x61\x18\xdf\xdb\xb8\x91\x82\x10\x3c\xf8\x57\
-\x7f\x35\xfe\x8b\xfb\xee\xfb\xcf\x23\x95\xca\xfd\x8f\x41\xf4\x5a\
-\xb1\x58\xaf\xb5\xc2\x7e\xe8\xb8\x64\xf3\xe6\xff\xf1\xd1\x2f\x7e\
-\xf1\x73\xb7\x7e\xf4\xa3\x9d\xce\xd8\x18\x2c\x2f\xd7\xfa\xb7\x48\
-\x00\x8a\xd4\xc2\x42\xc4\x2c\xa7\xee\x0e\x4c\xcc\xcc\x70\x36\x14\
-\x74\x6d\xea\xa7\xa5\xab\x9b\xe5\x6a\x84\xac\x14\xe9\xf0\xfd\x3a\
-\x09\x51\x84\xc9\x92\xa1\x54\xfd\xff\x28\x82\xc5\x45\x9c\x95\x15\
-\x76\xdd\x7d\x77\xc7\x85\x6f\x7c\xe3\x9d\x4b\xbf\xf9\x4d\xff\xe6\
-\x95\x95\x27\x8e\xc6\xa3\xc6\x1f\x86\x80\xf7\xc0\x45\xbb\xaf\xbc\
-\xf2\xbe\x3f\xfd\xe6\x37\xef\xbc\xb0\xb3\x53\x9a\xd3\xa7\x11\xc6\
-\x20\x12\xe0\x22\x03\x5c\x64\x5d\x3c\x25\x01\xc0\x18\x26\x96\x0b\
-\x58\xed\x9d\x88\xe4\x77\x9e\xef\xa3\xca\x25\x36\xe4\xfc\x66\xb0\
-\x6b\x3d\x22\xf3\xbd\xa9\x56\x31\x93\x93\x6c\x1c\x18\x90\x97\xbf\
-\xef\x7d\x57\xcc\xbd\xf0\xc2\x75\x3d\x93\x93\x8f\x1e\x81\xa5\xd7\
-\x9d\x80\xf7\xc3\x25\x6f\x79\xeb\x5b\x1f\xfc\xe8\x57\xbe\xb2\xb7\
-\x65\x7c\x1c\xb3\xb8\xd8\x00\x38\x2b\x62\xad\xe5\x33\x97\x30\x86\
-\xb9\x20\x42\xbb\x5e\x8d\x00\x21\x04\xb6\x8a\xd8\xe0\xda\x31\xb8\
-\x8c\x17\x34\x10\xb2\x36\x40\xa6\x44\x2c\x2e\xe2\x17\x8b\xec\xfe\
-\xf0\x87\x07\x57\xce\x9c\x79\x47\xd7\xc8\xc8\xcf\x5f\x84\xd9\xd7\
-\x8d\x80\x7b\xe0\xe2\xab\xdf\xf6\xb6\x03\xef\xff\xdc\xe7\xb6\xcb\
-\xc3\x87\x21\x08\x6a\xe0\x1b\x04\x6a\x63\x7c\x0a\xbe\x01\x7e\x12\
-\xf1\xe7\x43\x85\xf1\xfc\x86\xba\x56\x50\xa1\xc7\x96\x8d\xc0\x53\
-\x90\x69\x30\x4c\xc9\x48\x62\x43\xf6\xbe\x2e\x95\x10\xe7\xce\x71\
-\xd9\x3d\xf7\xf4\x2e\x8f\x8f\xbf\xa3\x7d\x64\xe4\x27\x87\x61\xee\
-\x5f\x4d\xc0\x7e\x18\x7c\xd3\xb5\xd7\xfe\xf0\x9e\xcf\x7e\x76\x87\
-\x78\xe1\x05\x88\xa2\x75\xc1\x67\xa3\x7a\x0a\x7a\x6d\x99\x12\xb0\
-\x10\x69\x4c\x2e\xdf\x48\x40\xa5\x42\x8f\x30\x8d\xa3\x40\xa6\x2b\
-\xa4\x1e\x50\x03\xbf\x86\x88\xb4\x4b\xe8\xc9\x49\x76\xde\x7d\x77\
-\xd7\xdc\xc9\x93\x37\xb7\x8f\x8e\x1e\x38\x0a\xcb\xbf\x37\x01\xfb\
-\xa1\xe3\xe2\x8b\x2f\xbe\xf7\x03\x7f\xf9\x97\x57\xca\xa3\x47\x11\
-\x4a\x9d\xd7\xf2\x4d\xae\x9e\x00\xae\x95\xe9\x78\x6f\x0c\x8b\x9a\
-\x66\x02\xca\x25\xba\x8d\xaa\xe5\x02\xd9\x18\x60\xb2\xee\x9e\xf1\
-\x8a\xb5\x44\xe8\x28\x42\x07\x01\xe6\xec\x59\x2e\xbe\xf3\xce\x0d\
-\xe3\x07\x0f\x5e\xb9\x71\x76\xf6\x81\xdf\x15\x18\xcf\x4b\xc0\x0d\
-\x60\x6f\xed\xec\xfc\xf2\x07\xfe\xe2\x2f\xee\xf2\xc7\xc7\x9b\xdd\
-\x1e\xe2\xff\xa9\xbb\x7d\x7a\x69\x63\x28\x54\xab\xd8\xe9\xf7\x09\
-\x09\x29\x11\x8b\x08\x68\x69\x6d\x20\x40\x96\x0a\x74\xab\xa8\x31\
-\xd2\x47\x11\xa5\x72\x99\x85\xe5\x15\x84\x8a\xb0\xa1\x0e\x3e\x29\
-\x75\x14\xa1\x95\x42\xa7\x5d\x21\x8a\x50\xd5\x2a\xcc\xcd\x31\x74\
-\xdb\x6d\x17\xbe\xf4\xd8\x63\x5d\xb9\x72\xf9\x91\xd1\xf3\x24\x4c\
-\xe7\x25\x60\x9f\x94\x7f\x72\xc7\x27\x3f\xf9\xb9\xcd\x9e\x27\xcd\
-\xea\x6a\xdc\xc8\xb5\x96\xcf\x58\x5f\x00\xcb\xd5\x2a\x07\x4b\x15\
-\x46\xbc\x3c\xb3\x6d\x9d\x9c\x5c\x2d\xe0\x95\x8b\xb4\xb9\x6e\x83\
-\x17\x2c\x49\x0b\x5a\xdb\x1b\x09\x28\xae\xd2\x19\x06\x0d\x56\x3f\
-\xb3\xb0\xc8\x61\x37\x47\x61\x63\x3f\x63\xc2\xe6\xcc\xe2\x12\x72\
-\x75\x85\x76\x29\xcf\xef\x01\x89\xa8\x72\x19\xd7\x18\x3a\xb6\x6f\
-\xdf\x33\xf9\xeb\x5f\x1f\x3f\xa4\xf5\xe1\x57\x4d\xc0\x7e\x18\xd8\
-\x73\xd5\x55\xdf\xbb\xe6\xc6\x1b\x3b\x83\xb3\x67\xcf\x0b\x3c\x6b\
-\xf9\x63\xe5\x0a\xd3\x43\xdb\x19\xd8\x73\x05\x3d\x7d\xfd\x74\x76\
-\x75\xd3\xd3\xdf\xcf\x62\xa9\xcc\xc6\x28\xa8\x77\x01\xad\x59\xb6\
-\x5d\x64\x7b\x07\x32\x21\x55\x0a\x81\x58\x5d\xa1\xa3\x5a\x69\x08\
-\x80\xe3\x2d\xed\xf4\xed\xd8\x49\x5b\x5b\x1b\x5d\xdd\x3d\x74\x6d\
-\x19\x64\xb1\xa3\x8b\xd3\xe3\x63\xf4\x46\x21\x22\xb1\x78\xd6\x0b\
-\x74\x14\xa1\x12\x09\x96\x97\xd9\xb0\x6d\x9b\x5c\x98\x9b\xbb\xba\
-\x63\x7c\xfc\x7b\x47\x61\xf5\x15\x09\xd8\x0f\x56\x67\x4b\xcb\xdf\
-\xbc\xeb\xe3\x1f\xbf\x59\x4f\x4e\xd6\x80\xd6\x2c\x95\xfd\x1f\x88\
-\x8c\xe1\xa0\xe3\xd1\x7d\xc3\xcd\xf4\x6c\xdc\x98\x90\x95\xc6\x44\
-\x81\x0c\x02\xba\x56\x97\x31\x69\xba\x6b\x0c\xcb\xae\x8f\xec\xe8\
-\x68\x18\x3d\xcd\xca\x12\x9d\xe5\x52\xc3\x70\x57\xea\xe8\xc6\xea\
-\x68\x6f\xd0\x97\x6f\xc9\xd3\xbe\x75\x98\xe3\x8b\x4b\xe4\xe7\xe7\
-\x70\x8d\x41\x2b\x85\xca\x80\xd7\x4a\x11\x45\x11\x51\x14\x51\x99\
-\x9d\x65\xe0\x8a\x2b\xda\x5f\x7a\xf6\xd9\xfc\xd6\x20\x78\xe4\xe8\
-\x9a\xd9\x64\x13\x01\xbb\x61\xef\x55\xb7\xdc\xf2\x95\x81\xee\x6e\
-\x47\x95\xcb\x75\xeb\xa7\x16\xcf\x7c\xae\x28\xc5\xb1\xbe\x01\x86\
-\x6e\xba\x05\xcf\x75\x9b\xbd\x44\x08\xda\x26\xc7\xf1\xcb\x25\x44\
-\x02\x1e\xad\x59\xcd\xe5\xb1\x92\x69\x71\x2a\x66\x69\x89\xb6\xc2\
-\x6a\x43\xe2\x23\xa3\x90\x68\xd3\x66\x84\x6c\xd4\x29\xa5\xa4\xfb\
-\x82\x2d\x4c\x58\x0e\x66\xec\x0c\x7e\xda\xf7\xa3\x08\x95\x01\x1f\
-\x29\x45\x14\x86\x58\x80\xf1\xfd\x4b\xc7\x4f\x9c\x78\xf8\xc5\x35\
-\xf3\x86\x06\x02\xf6\x83\xd5\xd9\xd1\xf1\x85\x1b\x6f\xbf\x7d\x4f\
-\x38\x37\x17\x83\x4f\xc0\xca\x74\x88\x4b\xee\x85\xc6\x70\x66\x78\
-\x07\xdb\xf7\x5d\x8f\x5c\x6f\x64\x10\x02\xfb\xec\x04\x1d\x13\x63\
-\x8d\x33\x3e\x63\x28\xb4\xb4\x60\x75\xf7\x34\x12\xb0\x38\x4f\xdb\
-\xea\x4a\xc3\x04\xc8\x2d\x97\x51\x5a\xa1\xbb\x7b\xd6\x1d\x7d\x3a\
-\x7a\x7b\x99\x6b\x6d\x43\x9d\x3c\x81\xab\x14\x2a\xf1\x84\x28\x53\
-\x86\x51\x44\x75\x75\x95\x0d\xdb\xb6\x39\x27\x5e\x7c\xb1\xfd\xa2\
-\x4a\xe5\xfb\x59\x2f\x68\x20\xe0\x8d\x70\xc9\x1b\xaf\xba\xea\x4b\
-\xbd\x6d\x6d\xb6\x0e\x82\x9a\xf5\x65\x06\x38\x42\xa0\x8d\x61\x7c\
-\xdb\x0e\x86\x6f\xbc\xf9\xfc\xe0\xcf\x9c\xa6\xf5\xf8\x91\xd8\xf2\
-\x89\x18\x63\x30\x5a\x53\x6c\x6d\xc7\xee\xe9\x6d\xf8\xbd\x9e\x9f\
-\xa7\x75\x69\xb1\x16\xd8\xd2\x61\xcf\x9d\x9f\xc3\x54\xca\xe8\x8d\
-\x9b\xd6\x25\xa1\xbd\xa7\x87\xd9\x5c\x1e\x4e\xbc\x8c\x95\x58\x5f\
-\xa5\x1e\x10\x45\x84\x49\xa9\xa3\x88\xc8\x71\x86\x27\xcf\x9c\x79\
-\xe0\x70\x26\x4b\xcc\xae\xcb\x09\xdf\xf3\x3e\x71\xe1\xf6\xed\x7e\
-\x69\x79\xb9\xc6\x5e\xa4\x54\x2c\x19\xa5\x13\xbd\x1b\xd8\xfe\xd6\
-\xb7\x62\x59\x12\x29\x45\xa3\x00\xce\xa1\xe7\xf1\x0f\x3d\x1f\x27\
-\x26\x61\x88\x0e\x43\x54\x18\xc6\x63\x74\x10\x80\xd1\x4d\xf5\x30\
-\x3a\xfe\x3e\x0c\x31\x41\x80\x4e\x25\x0c\xf1\x4e\x8e\xe0\x3f\xf9\
-\x18\x32\x0c\x9a\x9f\x27\x05\x83\xbb\x76\x31\xbf\x7b\x2f\xd5\x30\
-\xac\xb7\x55\x29\xc2\xa4\xed\xa1\x52\x94\x96\x96\x18\x1a\x1e\xf6\
-\xf3\xbe\xff\x09\x32\xb9\x59\x8d\x80\xfd\xd0\xde\x37\x38\x78\x17\
-\x51\x44\x98\x54\x0a\x13\x65\x61\x46\xe6\xa5\xc5\xe0\xed\x77\x60\
-\x5b\x36\x52\xc8\x46\xd1\x1a\xf1\x8b\x9f\x21\x8f\x1d\xad\x81\x56\
-\x59\x30\x41\x80\x0a\x02\x30\xa6\xa9\xae\x30\xa6\xf6\xbd\x0a\x82\
-\x98\xb0\x84\x34\x1d\x86\x88\xc9\x09\xec\x87\x0e\x20\x0a\xc5\xe6\
-\xe7\x0a\xc9\xb6\x1b\x6e\xe4\xdc\xa6\x3e\xa2\x30\xac\xb5\x35\x4a\
-\xb0\xa4\x24\x98\x30\xa4\x6f\x70\xf0\xae\xfd\xd0\xde\x44\x80\x05\
-\xd7\x6d\xdc\xb2\xe5\x82\xe2\xca\x4a\x03\xe0\x20\xa3\xac\x12\x45\
-\xe4\xde\xf6\x76\xda\x3b\x3b\xd7\xb1\xbc\x26\xfa\xc9\x23\x70\xe6\
-\x74\x0d\xb8\xca\x80\xce\x96\xe2\x77\x78\x40\x0a\x58\x67\x88\x48\
-\xc5\x2c\xcc\x63\x1e\xfc\x67\x44\xb1\xd0\x54\xdf\xb6\x6d\x06\xee\
-\xb8\x93\x25\x44\x6c\xbc\x4c\xbb\x53\x0c\xc5\xa5\x25\xfa\xb7\x6c\
-\xb9\xc0\x82\xeb\xd6\x12\x20\x3c\xd7\xbd\xbd\xb5\xa3\x43\x04\x41\
-\xd0\xc0\x5a\x56\x59\x69\xcb\x20\x5b\xf7\xec\x6d\x06\x2f\x04\xa5\
-\x9f\xfe\x94\xe8\xd4\x49\xa2\x75\x1a\x9e\x25\x44\x05\x01\x68\xd3\
-\x4c\x80\x36\x0d\xbf\xc9\x4a\x94\xe8\x8b\xc2\x10\xb5\xb0\x40\xe5\
-\xfb\xf7\x23\xa2\xa8\x49\x47\xf7\x86\x0d\xd8\xd7\xed\xab\x59\x3e\
-\x54\x8a\x20\x83\x23\x08\x02\xda\x3a\x3a\x84\xe7\xfb\xb7\xa7\xdd\
-\x40\x02\xdc\x06\x6e\x6b\x57\xd7\x3e\x95\xe9\x37\x41\x06\x78\xa8\
-\x14\x65\xa5\x18\xb8\xed\x36\x2c\xd9\xec\x7e\xa5\x17\x0e\x51\x3d\
-\xf4\xdb\xd8\xfd\x92\x86\x46\x99\xc6\x47\x19\x10\x2a\x0c\xe3\x18\
-\xb0\x46\x07\x46\x37\x00\x8e\x52\x3d\x49\x9d\xec\xbd\x70\x6a\x8a\
-\xd5\x47\x1e\x4a\x92\xa8\x8c\x1e\x29\x19\xba\xe9\x26\x96\x3d\xaf\
-\xee\xbd\x6b\x48\x88\xc2\x90\x8e\x8e\x8e\x7d\xb7\x81\x5b\x23\x20\
-\x0f\x7d\x2d\xed\xed\xdb\xaa\xe5\x72\x3d\xf8\xa5\x2c\x26\x8a\xd4\
-\x45\x5b\x19\x18\xde\x5e\x5b\xcc\x4d\x45\x15\x57\x59\x7c\xf8\x47\
-\x04\x41\x40\x18\x04\x84\x61\x58\x2f\x33\x44\xa4\x5e\x10\x05\x01\
-\xc6\xe8\x26\x3d\x18\x5d\x03\xb9\xd6\xfa\x35\xf0\x19\xbd\xa5\xe7\
-\x9f\xa3\x74\xe2\xe5\x26\x3d\xb9\x7c\x8e\x8e\x7d\xd7\xd7\xc1\x67\
-\xb1\x28\x45\xa5\x5c\x26\xdf\xd9\xb9\x2d\x0f\x7d\x35\x02\x3c\xb8\
-\xd4\xcd\xe7\xbd\x20\x8d\xa2\x19\xd7\x4f\x3d\x61\x60\xdf\xbe\x75\
-\xad\x3f\xf3\x2f\x3f\x21\x28\x14\x08\xc3\x90\x20\x69\x5c\x8d\x84\
-\xa4\xe1\x61\xd6\x0b\x82\x00\x11\x46\xcd\x1e\x10\x46\xcd\xa0\xd3\
-\xfa\x89\x8e\x06\xfd\x61\xc8\xcc\x83\x3f\x44\x18\x9a\x74\x5d\x74\
-\xdd\x3e\x4a\xc6\x34\x79\x40\xa4\x14\x41\x18\xe2\xe5\x72\x9e\x07\
-\x97\x02\xf1\x04\xcb\xc0\x2e\x3b\x71\x1b\x2c\xab\x36\xde\x9b\x64\
-\x0d\x2f\xf2\x3c\x2e\xdc\xb3\xb7\x96\x0c\xa5\x57\x79\x69\x91\xb9\
-\xa7\x9f\xc6\x36\x06\x4b\x4a\x6c\xad\xe3\x9c\xdc\xb2\xb0\xa4\xc4\
-\x12\x02\x23\x63\xd7\xd4\x42\xc4\x19\x1d\x02\x33\x33\xdd\xa4\x4b\
-\xcf\x4c\x13\x85\x61\x9c\x2b\x24\xf9\x82\x31\x06\xad\x35\x5a\x6b\
-\x54\x2a\x4a\xd5\xcb\x89\x09\x16\x0e\x1d\x64\xc3\xde\x2b\x1a\x74\
-\x75\xf6\xf6\xe2\x6c\xdb\x46\xe1\xc5\x17\x1b\x46\xb4\x94\x04\xdb\
-\x71\x10\x52\xee\x42\xeb\x87\x24\x80\x6d\x59\x43\x42\x88\x38\x87\
-\xce\x0c\x7f\x51\xe2\x42\x9d\x3b\x77\x92\x6f\xc9\xc7\x00\x32\x32\
-\xf5\xe4\x93\x04\xe5\x72\xcd\x32\xb5\x7e\x9b\x58\x2f\x8c\xd2\x7b\
-\x01\x51\x98\x76\x85\x00\x75\xfc\x18\x95\xd3\xa7\x6a\x7a\x2a\xa7\
-\x4f\xa1\x8e\x1f\x4b\xe2\x44\xe2\x05\x61\x48\x98\xd4\x6b\xd0\x9d\
-\x3c\x2b\x08\x43\x82\x28\x62\xea\xd1\x9f\x37\xb5\x4b\x4a\x41\xdf\
-\x15\x57\x10\x24\xed\x4f\xbd\x39\x8d\x71\x5a\x08\x2c\xcb\x1a\x4a\
-\x3d\x40\x58\xb6\xdd\x6f\xb4\x46\x9b\xc6\x5d\x27\x93\xc8\xc6\x4b\
-\x2e\x6d\xb2\x18\x06\xa6\x7e\xf5\x6c\x1c\xd4\xb4\x06\x4b\x62\xb4\
-\xc6\xb6\x24\x46\x4a\x8c\x90\x58\x2a\xf1\x80\x24\x95\xd6\x69\x06\
-\x17\x86\x2c\x7c\xf3\x1b\x58\xbd\xbd\x00\xa8\xb9\x39\x50\x1a\x8d\
-\xa9\x7b\x80\x31\x68\x6d\xd0\xa6\xee\x01\x91\xd6\x28\x95\x96\x8a\
-\x50\x6b\x8a\xc7\x8e\x51\x59\x5e\x26\xdf\xd9\xd9\xd0\xbc\xbe\x4b\
-\x77\x71\x30\x4d\xe2\x52\xc3\x26\x3a\xb4\xd6\x48\xcb\xea\x27\x0c\
-\x85\xbd\x1f\xa4\x90\xb2\x4d\x2b\xd5\xb4\xb0\x61\x00\x8c\x61\xe3\
-\x8e\x1d\x4d\xdf\x15\x16\xe6\x59\x1d\x1b\xc3\x11\xf1\x18\x8e\x96\
-\x20\x35\x42\xa5\x4b\xe3\x31\x78\x4b\x48\x8c\x14\x18\x11\xbb\xbf\
-\x48\x67\x8b\x08\xd4\xc4\x64\xc3\xd3\x62\xe0\xd4\x09\x30\x1a\xad\
-\x0d\x6a\x0d\x09\x91\xd6\x44\x4a\xc7\xc0\xb4\x66\xf6\xc8\x61\x2e\
-\xba\x6e\x5f\x43\xfb\x36\x6d\xdd\x4a\x60\xdb\xe8\x6a\xb5\xe6\xfa\
-\x91\x52\x68\xad\x31\x5a\x23\xa5\x6c\xdb\x0f\x32\x8e\x01\x5a\xdb\
-\x5a\xa9\xb8\xaf\x66\xad\x6f\x0c\xda\x75\xe9\x19\x18\x40\xc8\x46\
-\x02\x16\x4f\x9f\x22\x0a\x93\x55\x22\x6d\xc5\xa5\xa5\x11\x22\x0e\
-\xc7\x46\x8a\x1a\xf8\x86\x79\x7f\x8d\x88\x35\x0e\x65\xb2\x24\x18\
-\x74\xd6\x03\x8c\xa9\xc7\x80\x0c\x09\xa1\xd2\x84\x5a\xb1\x38\x32\
-\xc2\xd6\xeb\xaf\x6f\xd0\xe7\x08\x9b\xdc\xc6\x8d\x2c\x9d\x38\x91\
-\x10\x16\x83\xd7\x4a\xa5\xf1\xc5\x81\x24\x08\x02\x68\x15\xef\x35\
-\xa6\xed\x92\xc6\xa0\x92\xdd\x9c\xb6\xce\x8e\xa6\x2e\xb0\x3c\x39\
-\x49\x14\x86\x48\xcb\xc2\x92\x1a\x25\x25\x52\x27\x63\x91\x88\x3d\
-\x00\x21\x30\x08\x82\xa5\x45\xc2\xf9\x05\xd4\xd2\x22\x6a\x65\x05\
-\x53\x2c\xa2\x2b\x15\x50\xf1\xa6\xa9\xb0\x6c\x84\xe7\x21\x5b\x5a\
-\xb0\x5a\xdb\xb0\xba\x3a\xb1\xbb\xbb\xb1\xbb\x7b\x30\x52\xa0\x32\
-\x04\x44\xd9\x80\x98\xfc\xbf\x34\x31\xde\xdc\x45\x05\xe4\x7b\x7b\
-\x99\x7d\xe9\x25\xd4\x1a\xf0\x5a\xd7\x57\xc7\x6c\x00\x21\x44\x84\
-\x31\xf1\x2c\x2c\x61\x3f\x25\xc3\xf3\xbc\x38\x57\x6f\x54\x4f\x75\
-\x79\x39\x9e\x83\x6b\x4d\x94\xd9\x18\x21\x59\xae\x2a\x4e\x4f\x53\
-\x9d\x9c\x24\x9a\x99\x4e\x86\xbd\x78\xcc\x15\xd4\xcb\xda\x15\x85\
-\x98\x28\x84\x62\x01\x33\x33\x8d\x06\xb4\x01\x2d\x25\x4e\x6f\x2f\
-\xce\xe6\x01\xbc\xfe\x3e\xf0\x7c\x94\x69\x24\x40\x29\x4d\x65\x69\
-\x79\xdd\x3d\x3e\xdb\xf7\xe3\x99\x60\xe2\xf6\x29\x78\x13\x4f\xcb\
-\x43\x00\xfb\x5e\xd0\x1f\x54\x6a\x35\x75\xbd\xb4\x81\x3a\xf1\x02\
-\x59\x1b\xbe\xd6\x10\x50\x58\x45\x45\x11\x52\x4a\x2c\x29\x89\x8c\
-\xa1\x34\x33\x13\x83\x9e\x9f\x8b\x87\x46\xe2\xf9\xb6\x95\xa9\x2c\
-\x88\xbb\x97\xc8\x7c\x4e\x2f\x93\x11\x2d\x40\x19\x4d\x38\x3b\x83\
-\x9a\x99\x21\x3a\x08\xb2\xb3\x13\x6f\xf3\x66\xdc\xfe\x7e\xb4\x65\
-\x25\x24\x18\x2a\xab\xab\xcd\x7b\x10\x80\x65\x59\x75\xab\x27\x06\
-\x36\x5a\x63\x00\xa5\xd4\xea\xbd\xa0\x6d\xc0\xa8\x28\x9a\x32\xa9\
-\x5b\x24\x1e\x20\xd3\x68\x1c\x45\xeb\xb2\x2b\x6c\x07\x1d\x45\x54\
-\x8a\x25\x96\xa7\xa6\x08\xa6\xcf\x61\x45\x11\x8e\x88\xdd\x4a\x67\
-\xac\x5d\x73\x38\xb1\xe6\x5c\xcc\xf9\xc0\x9b\xfa\x79\x19\x9d\x90\
-\xa1\x81\x70\x79\x89\xc2\xd2\x12\xea\xf8\x31\xec\xde\x8d\x78\xfd\
-\x7d\xc8\x8e\x0e\x5c\xab\xd9\x43\x01\x74\x14\x41\xc6\xea\x69\x6e\
-\x01\x60\xb4\x9e\x02\x8c\x0d\xa0\x8d\x39\x15\x45\x11\x56\x9a\x4f\
-\x66\xfa\x48\x50\x2c\xa0\xb5\x69\x1a\x05\x84\x65\x31\xf5\xfc\xf3\
-\xe8\xd5\x55\x5c\xc0\x11\x71\xb7\x4f\x41\xa4\x80\xd3\xcf\x35\x80\
-\x19\x35\x6b\x8f\x7a\x18\x53\xff\x4d\xed\xf7\xa6\x91\x1c\x23\xe2\
-\x65\xf7\xe2\xcc\x34\x4b\x33\xd3\xe8\x5c\x8e\x8b\x2e\xbc\x30\xdd\
-\x77\x6d\xb8\x82\x62\x31\xee\xd6\x99\xc5\x18\x63\x0c\x06\x88\x94\
-\x3a\x05\x89\x41\x04\x1c\xae\x16\x0a\x29\x33\x71\x05\xad\x10\x5a\
-\xa1\x8b\x45\xc2\x6a\x05\xb3\xe6\xcf\xeb\xe8\x20\x58\x5d\x8d\xa3\
-\x79\xba\x07\x9a\x05\x2e\x1a\x3f\x8b\x6c\xe7\x3f\x9f\xc8\xa4\x9e\
-\xa8\xd7\x6b\xf8\xbf\xc1\x02\xf1\x77\x51\xb9\x8c\x95\xcb\x35\xb5\
-\xcf\x18\x4d\x75\x71\x01\xa1\x55\xc3\x8a\x14\x40\x50\x2e\x23\xe0\
-\x70\x8d\x80\x2a\x1c\x29\xae\xac\x54\x83\x52\x29\x7e\x96\x31\x08\
-\xad\xe3\xe5\xac\x62\x91\x99\x33\xa3\xb5\x65\xbd\x54\xfa\x76\xef\
-\xc6\x91\x02\x9b\xb8\x9f\x8b\xa4\x51\xe2\x3c\x82\xf8\xdd\xd8\x6b\
-\x7c\x65\x7f\xbf\xce\xe7\xac\x23\x0a\xe2\xf8\xd2\xbf\x67\x6f\x53\
-\xfb\xb4\x81\x99\xe3\xc7\x93\xe5\x78\x5d\xdb\xa5\x52\x61\xc8\xea\
-\xe2\x62\xb5\x0a\x47\x20\x19\x05\x4a\x70\xae\x4d\xa9\x93\xa5\xc5\
-\xc5\x4b\x4a\xb3\xb3\xb8\xbe\x87\x65\x0c\x04\x01\x54\xab\x4c\x3e\
-\xf7\x1c\x7d\x3b\x76\x34\xb8\xd7\xa6\xa1\x6d\xe4\x06\x06\x10\x13\
-\x13\x58\xa2\x1e\xec\x24\xd4\x22\x7e\x93\x88\x7a\x5c\x58\xef\x92\
-\xc4\x56\x56\xa6\xfe\x59\x88\x7a\x1c\xc9\x38\x4a\x9c\xc2\x1a\x08\
-\xa5\x64\xcb\x75\xd7\x35\x65\xb1\x0b\x13\x13\xcc\x3c\xf7\x1c\xc6\
-\xb6\x11\xae\x8b\x96\x92\x30\x08\x31\x52\x12\x45\xd1\xc9\x79\x98\
-\xae\x79\xc0\x23\x10\xa8\x20\x78\xc2\xf5\x7d\x54\xb5\x4a\xb0\xb2\
-\x42\xb8\xba\x8a\xa9\x56\xb1\x80\xb1\x5f\x3e\x59\x0f\x22\x89\x08\
-\x21\x18\x7a\xd7\x1d\x38\x22\x9e\x58\xbb\xa2\x2e\x0e\xb1\x58\x29\
-\x19\xa2\x4e\x8e\x45\xbd\xcc\x4a\x96\x28\x4b\x64\xea\x65\x7e\x6f\
-\x8b\x38\xd6\xb8\xc9\x33\x1d\x01\xed\xbb\x76\xd1\x3f\xbc\xbd\xa9\
-\x7d\xa3\x4f\x3d\x85\xa5\x35\x04\x01\x61\xa1\x10\x63\x2a\x97\x71\
-\x7c\x0f\x15\x04\x4f\x3c\x96\xec\x17\xa6\xc6\x30\xca\x98\x1f\x21\
-\xa5\x71\x6c\x0b\x3b\x61\x38\x95\xd3\x3f\x7e\x04\xa5\x54\x43\x9e\
-\x6e\x8c\xe1\xe2\x0f\x7e\x08\xdb\x96\x38\x69\xc3\xa8\x37\x2c\xdb\
-\x50\x57\x24\x8d\x97\x60\x5b\x22\x16\x5b\xd6\xc4\xb2\x65\x7c\x4f\
-\x12\x4b\xfa\x7b\xd6\xe8\xa1\xae\x2f\x7d\xc6\x1b\x3e\xfc\x91\x18\
-\xc0\x9a\xb6\x8d\x3c\xfc\xa3\x06\x0c\x16\xe0\xd8\x16\x48\x2b\xc6\
-\x9a\x84\x94\x9a\x37\x96\xe0\x89\x6a\xa5\x32\x91\x6f\x6d\x6d\xb2\
-\x4e\x65\x74\x94\xf1\x5f\xfd\x2a\x1e\x9e\x32\xb2\xe5\xb2\xcb\x69\
-\xbf\xf5\x6d\x35\xf0\xb5\x06\x67\x88\x70\x25\xb8\x96\xc4\x73\x6c\
-\x3c\xd7\xc5\x77\x5d\x7c\xdf\xc3\xf7\x92\xd2\xf7\xc8\x79\x2e\xbe\
-\xe7\xe1\x79\x1e\x9e\xe3\xe0\xd9\x16\x9e\x25\xe3\xba\x09\x11\x35\
-\xd0\x99\xe7\x58\x7d\x7d\xec\xba\xe7\x03\x4d\xed\xaa\x96\xca\x9c\
-\x3e\x70\xa0\x09\x47\xbe\xb5\x95\xa0\x52\x99\x2c\xc1\x13\xd9\x6e\
-\x07\xc0\x0f\x60\xb9\x54\x28\x3c\xe0\xb7\xb7\xd7\x2a\xd4\x18\x14\
-\x70\xf4\xef\xbf\xd9\xe4\x66\x18\xc3\x9e\xcf\xfc\x37\xa4\xeb\x36\
-\x7a\x81\x04\xd7\x12\x31\xe8\x0c\x50\xdf\xf7\xf0\x7c\x3f\x91\x5c\
-\x4d\x5c\x3f\x87\xe7\xfb\xf8\xbe\x8f\x97\x4b\xbe\xf7\x5c\x3c\xd7\
-\xc5\xb5\x2d\x5c\x4b\x34\x74\xb5\xf4\xf3\xf0\xa7\xff\x0b\x2d\x6d\
-\x6d\x4d\xed\x7a\xe9\x9f\x1f\xc0\xac\x2c\x37\x58\xdf\x02\xfc\xf6\
-\x76\x4a\x85\xc2\xfd\x3f\xc8\x9c\x19\x68\xd8\x18\xb9\x18\x26\x72\
-\x7e\xee\x63\x2d\x52\xda\x22\x08\xb0\xa9\xb3\x5e\x3c\xf1\x12\x3b\
-\x3e\xf4\x11\x9c\x96\x96\x86\x71\xb9\x6d\xe3\x26\x66\x8a\x05\x78\
-\xf6\xe9\x38\x09\xb2\x04\x8e\x6d\xe3\xba\x0e\x8e\xe3\xe0\x38\x6e\
-\x2c\x6e\x2c\x76\x83\x38\xb1\x38\x0e\x96\xe3\x60\x59\x36\xb6\x65\
-\x63\x59\x16\x52\x5a\x48\x4b\xc6\x92\xee\x50\x61\x6a\x81\x50\xbd\
-\xe5\x1a\xae\xf9\xeb\xcf\x23\xa5\xb5\x26\x89\xd2\xfc\xe2\xcf\x3e\
-\x45\x79\x2a\xde\x01\x4b\xef\xfb\x6d\x6d\x94\x85\xac\x2c\x15\x0a\
-\x9f\x3a\x02\x33\xeb\x12\x70\x09\xcc\xab\x30\xbc\xa4\x7f\x60\x60\
-\x57\xb4\xb0\x50\x73\x35\x07\xb0\xa3\x08\xad\x15\x9b\x6f\xbe\xb5\
-\xe1\x81\x00\x1b\xdf\x7c\x35\x67\x9e\x7c\x9c\xdc\xf4\x14\xae\xe3\
-\xc4\xe0\x5d\x17\xd7\x75\x71\x3c\x17\xdb\xf3\x70\x7c\x0f\xdb\x73\
-\x71\x3c\x0f\xdb\xf3\x12\x02\xbc\x84\x00\x17\xcb\xb1\xb1\x1c\x1b\
-\x69\xc7\x12\x93\x90\xec\x19\xc8\x64\x03\x06\x01\xc6\x50\xed\xe9\
-\xe5\xf2\x6f\x7d\x8f\xf6\xde\x0d\x8d\x49\x12\x30\xfa\xf0\x43\x1c\
-\xff\xbb\xff\x19\x37\x2c\x33\x64\xb6\x0c\x0e\x32\x71\x6e\xfa\xfe\
-\x50\xa9\xff\x9d\xdd\x1a\x6b\xca\x20\xdf\x0f\x7b\xb7\x6c\xd9\xf2\
-\x64\x67\xa9\x90\x53\x8b\x8b\x0d\x7d\xce\xf3\x3d\xde\xfa\xf8\x33\
-\xb4\x0f\x6f\x5f\x5b\x8d\xb9\xb3\x93\x1c\xbf\xe7\x4e\xba\x26\xc7\
-\xb1\x9d\xc4\xaa\xae\x8d\x65\x3b\x75\x60\x96\x8d\xb4\x64\xfd\x38\
-\x9d\xa8\xb3\x58\x73\xe1\x48\xa1\x55\xb2\xd1\x19\x46\xb5\x95\xe4\
-\x28\x08\x89\xa2\x90\x55\xc7\xa3\xf7\xff\x7c\x8b\xe1\xeb\x6f\x68\
-\x6a\xbc\x0a\x02\x1e\xb9\xfe\x6a\x96\x5e\x7e\x99\xd0\x40\x00\x84\
-\x80\xdd\xd5\xc5\x72\xbe\xb5\x3c\x3e\x3e\x7e\xdd\xb7\xe1\xf9\x6c\
-\x9d\xa6\xdd\xe1\x8b\x61\x26\xa8\x94\xb7\x0c\x0e\x0d\x5d\xa1\xe7\
-\xe6\x70\x8c\xa9\xf5\x6f\x5b\x2b\x8a\xc7\x8f\x31\x70\xf7\x9f\x24\
-\x53\xdd\xfa\x5f\xae\xad\x0d\xf7\xc6\x5b\x98\x7d\xe6\x29\xda\xab\
-\x65\x1c\xdf\xc7\xf1\x7c\xdc\x9c\x8f\xed\xfb\xd8\x39\x1f\x2b\x29\
-\x6d\x3f\x16\xcb\xf3\x62\x71\x5d\x2c\x37\xee\x06\xd2\x89\x89\xb2\
-\x6c\x1b\x69\x59\x08\x19\x7b\x82\x90\x82\x62\x6b\x3b\xed\x5f\xfa\
-\x2a\xdb\x6f\xbc\x09\x9a\x73\x3f\x8e\x7f\xe1\x6f\x98\x7e\xf0\x07\
-\x35\xb3\x1a\xe2\x53\x2c\xf9\x6d\xc3\x8c\x8c\x8e\xfe\x7d\x45\xa9\
-\x6f\xbc\xe2\xf6\xf8\x51\x30\xdb\x95\xfe\x2d\x88\xf7\x6c\xe9\xef\
-\x6b\x57\x8b\x99\xae\x20\x20\x1a\x1b\x45\xe6\xf2\x74\xbc\xe9\xea\
-\xa6\xec\xab\xa5\xa3\x13\xff\xd6\xb7\x33\x79\xf2\x04\x5d\x2b\x4b\
-\xb8\x39\x1f\x2b\x97\xc3\x4e\x25\x9f\xc3\xf2\x7d\xac\x9c\x8f\xe5\
-\xa5\xe2\x61\xb9\x1e\xd2\x75\x90\x8e\x1b\x93\x60\xdb\x08\xcb\x42\
-\x5a\x49\x1c\x90\x82\xd9\xbe\x0b\xe8\xf8\xfc\xdf\x31\x74\xf5\xb5\
-\xf5\x39\x42\x46\x16\x9e\x7d\x86\xe3\xff\xe9\xcf\x48\x27\x75\x26\
-\xf1\xef\xf6\x6d\xdb\x38\xb5\xb0\x38\x39\xb7\xbc\xf2\x81\x7b\xd7\
-\x39\x30\xb5\xee\x09\x91\xa3\xb0\xba\xad\x5c\x3e\xdb\xd5\xd7\x77\
-\x67\xbb\x56\x52\x54\xca\x0d\xe3\x72\xe9\xa9\x27\x69\xd9\xbd\x17\
-\xef\xc2\xa1\xa6\x86\xf8\xf9\x16\xba\x6f\x79\x3b\x67\x2c\x07\x6b\
-\x72\x9c\x76\xcf\xc5\xce\x27\x04\xf8\x39\xac\x5c\x0e\xcb\x4f\x88\
-\x48\xbd\xc0\x75\x91\xae\x8b\x74\x1c\x84\x1d\x7b\x81\xb0\xe3\x40\
-\x58\xb5\x6d\x46\xdf\x72\x23\x17\x7e\xf6\xaf\xd9\xb4\x75\x68\x5d\
-\xf0\x95\xc9\x49\x8e\xbe\xf7\x4e\xd4\xea\x4a\x0c\x3e\x99\x37\x78\
-\xdd\xdd\xac\x74\x74\xaa\x93\x67\x46\x3f\xf9\x1d\x63\x9e\x5e\x0f\
-\xeb\x79\xcf\x08\x75\x19\x73\x5c\xad\x2c\xf7\x6d\xdb\xb5\xeb\x4a\
-\xb9\x30\x87\x1d\x45\xb5\x21\xd1\x31\x9a\xe2\xa3\x3f\x21\x7f\xcd\
-\x3e\x9c\x4d\x7d\x4d\xae\x68\x59\x16\x1b\x2e\xdb\x4d\xe1\x8a\xab\
-\x99\x2c\x14\x70\x8a\x05\xda\x73\x09\xf8\x7c\x1e\x2b\x97\x43\x26\
-\x04\x48\xcf\x8b\x57\x83\x52\x12\x92\x03\xd6\x15\x69\x73\xf2\x82\
-\x21\x82\x8f\x7c\x8a\x37\xdc\xf5\x5e\xfc\x7c\x7e\x1d\xa7\x37\x04\
-\xf3\x73\x8c\x7c\xf0\x6e\xaa\x67\x4e\x35\x04\x43\x2b\xe7\x63\xef\
-\xbc\x94\xdf\x1c\x39\xf2\xb5\x33\x61\xf4\x85\xd1\xf3\x1c\x92\x6a\
-\x0a\x82\xd9\x6b\x3f\x74\xf4\x75\x75\xfd\xf0\xa6\xcb\x2e\xb9\x3e\
-\xf8\xcd\xb3\x58\x51\x14\x27\x38\x96\x88\x13\x96\x8d\x9b\xe8\xfb\
-\xea\xff\xc5\xdf\xbd\xf7\xbc\x3a\x8c\x31\xcc\x4c\x4d\xb1\x78\xe8\
-\x37\x38\xa7\x47\xe8\x2a\xae\xb0\xd1\x73\xc8\x3b\x76\xbc\x74\x46\
-\x9c\xbd\x04\x51\xc4\x7c\x35\x60\xc6\x76\x09\x06\x87\xf0\x76\xed\
-\x61\x70\xfb\x0e\xa4\x3c\xdf\xcc\x01\xa2\xb9\x59\xce\xfe\xe9\x07\
-\x29\x1e\x3a\x18\x2f\x93\xeb\x38\xe8\x45\xb6\x83\x7f\xe5\x9b\x78\
-\xf4\xf0\xb1\x27\xce\x2d\x2c\xde\xbe\x9e\xeb\xbf\x2a\x02\x00\xde\
-\x03\x5b\xb6\xf6\xf7\x3f\x7c\xc3\x8e\xa1\x4b\xab\xbf\x7a\x06\xdb\
-\x28\x5c\x3b\x4e\x70\x5c\xcf\xc7\xed\xea\xa4\xfd\x33\xff\x1d\xf7\
-\xc6\x5b\x5f\x49\x15\x18\xc3\xca\xca\x0a\x0b\xb3\xb3\x54\x97\x97\
-\x20\x0c\xe2\x81\xc0\xb2\xb1\xdb\xda\xe8\xe8\xe9\xa5\xa7\x27\x3e\
-\x0d\xf2\x4a\x57\x74\xf2\x04\xcb\x9f\xfe\x8f\x94\x4f\x8e\x10\x54\
-\x2b\x04\xd5\x80\xaa\xd2\x44\xd2\xc2\x7f\xf3\xd5\x3c\xfe\xf2\xa9\
-\x23\x27\xa7\xa6\xfe\xc3\xbd\x30\xf6\xbb\xf4\xbc\x22\x01\x10\x1f\
-\x95\x1d\x1e\xbc\xe0\xc0\xcd\xdb\x87\xb6\x55\x7f\xfd\x0c\xae\x14\
-\xb8\x9e\x17\x67\x71\xf9\x1c\x4e\x4b\x0b\xee\xbb\xdf\x83\xf5\xbe\
-\x8f\x21\x1c\xf7\xd5\xa8\xfc\xbd\x2f\x63\x0c\xea\xd1\x1f\x53\xfd\
-\xea\x97\x08\x16\xe7\x09\x4a\x65\x82\x4a\x85\x6a\xb5\x4a\x68\xc0\
-\x7b\xf3\x5b\x78\x74\xe4\xd4\xc9\x91\xd1\x89\x77\xfe\x13\x1c\x7f\
-\x25\x7d\xaf\xea\xac\xf0\x61\x98\xeb\x5f\x5e\xf9\x97\x55\xa5\x6f\
-\xdd\x79\xd5\x55\xbd\xd6\xe2\x02\xb6\x10\x38\xbe\x87\xe3\xf9\x71\
-\x92\x33\x39\x86\x3c\xfc\x5b\xcc\xe6\x0b\xd0\xdd\xbd\x4d\x09\xca\
-\xeb\x21\xcc\x4d\x23\xbe\xf1\xbf\xe0\xc0\x03\x10\x04\xf5\x85\x4e\
-\xa5\x11\x7e\x0e\xef\xea\x6b\xf9\xf9\xb1\x13\x2f\xbd\x3c\x36\x71\
-\xc7\x77\x5e\x05\xf8\x57\x4d\x00\xc0\x11\x98\xeb\x5b\x5e\x39\x30\
-\xbd\xbc\x72\xc5\x8e\x7d\xd7\x5f\xd8\x9a\x9c\xe2\x4a\x87\x3a\x27\
-\x9f\xc7\x31\x0a\xff\xd8\x0b\xd8\xf3\xb3\xa8\xce\x6e\x54\x4b\x7b\
-\x53\xc4\xfe\x7d\x44\x2c\x2d\xe2\x3d\xfe\x63\xbc\xfb\xbf\x8d\x9c\
-\x9a\x88\x81\x2b\x85\x51\xf1\xca\x95\xbd\x61\x13\xc1\xe5\x7b\x39\
-\xf0\xd4\xaf\x9e\x38\x79\x76\xea\xae\xef\xc2\xc8\xab\xc5\xf5\x9a\
-\xde\x17\x38\x02\x4b\x9b\x8b\xc5\x07\x4e\x8e\x4d\x74\xf5\x5e\x76\
-\xd9\x9e\x0b\x86\x87\xa4\x28\x16\xe2\xd4\x36\x9f\xc3\xce\xe5\xb1\
-\x5a\x5a\x70\xab\x65\x5a\xc6\x46\xf0\x67\xa7\x10\x52\x10\xf9\x3e\
-\xda\xb2\x9b\xa6\xac\xbf\x4b\x44\x58\xc5\x3b\x37\x4e\xfb\x6f\x9f\
-\xa6\xed\x97\x3f\xc3\x9e\x1c\x4d\x5e\x9b\x89\x41\x1b\xa5\x40\x0a\
-\xdc\x4b\x2f\xe7\x84\x93\x53\xdf\xff\xe9\xcf\xbe\x76\x76\x61\xe9\
-\x63\xdf\x4b\x16\x3a\xfe\x20\x04\x00\x1c\x85\x6a\x4b\x10\x3c\x72\
-\xee\xd4\x99\x63\x4b\x9a\xab\x86\xf6\xed\xeb\x68\xcd\xf9\xf1\x59\
-\xde\x74\x98\xcb\xe7\xb1\xf2\x2d\x38\x52\xd2\x52\x5a\xa5\x7d\x61\
-\x86\xd6\xf2\x0a\xae\x8e\xb0\x8c\x46\x90\x2c\x51\x19\x13\x1f\x97\
-\xd1\x0a\x3b\x0a\xc8\x55\x4a\xb4\xae\xcc\xd3\x39\x35\x4a\xd7\xa9\
-\x63\xb4\x9c\x1d\xc5\x59\x59\xac\x9f\x1d\xd4\xc9\xe9\x31\xad\xb0\
-\x36\xf5\x51\x1a\xbe\x98\x1f\x3d\xf3\xdc\xf8\xe3\x4f\x3f\xfb\xc9\
-\x13\xe5\xca\x17\x1f\x82\xf2\x6b\xc5\xf3\x9a\x09\x00\x18\x05\x7d\
-\x50\xeb\x23\xbd\xe7\xa6\xbf\xf3\xe2\x91\xe3\x39\xa7\x6f\xf3\xae\
-\xc1\x37\xbd\xd9\x71\x5c\x27\x3e\x56\x97\xcb\x21\xf3\x2d\xc8\x7c\
-\xbe\x26\xb6\xe7\x92\x93\x82\x56\xa1\xe9\x10\x9a\x2e\xa1\xe8\x26\
-\xa2\xcb\x84\x74\xa9\x0a\x9d\x61\x99\xd6\x6a\x81\x5c\xb5\x84\x13\
-\x54\x1b\x17\x33\x75\xfd\xc5\x09\xd9\xd9\x8d\xda\xba\x9d\xa7\x47\
-\x46\xcb\xf7\x3e\xf0\xc3\xaf\x9d\x1e\x1d\xfb\xd0\xb7\xb4\x7e\xe6\
-\x7c\xe3\xfc\x2b\x5d\xaf\x6a\x14\x78\x85\x4b\xbe\x0f\xf6\x6c\x19\
-\xe8\xff\xf4\x75\xb7\xdc\xfc\xae\xab\xf6\x5d\xeb\xb7\x3a\x16\x04\
-\x15\xa4\x9f\x43\xb4\xb6\x21\x5b\x5b\x11\x2d\xad\x90\xcf\x23\xfc\
-\x3c\xc2\xf3\xe2\xb7\xca\x64\xc2\xbf\x8a\xe2\xa0\x56\xad\x60\xca\
-\x65\x4c\xb9\x88\x29\x14\x30\x85\x02\xba\xb0\x8a\xa9\x94\x31\xae\
-\x4f\x21\xd2\x3c\xfb\xe4\x53\x95\x5f\xfe\xfc\xd1\x1f\x8e\x4f\x4e\
-\xfd\xed\x3f\xc2\x6f\xf9\x63\xbe\x36\x97\xbd\xd2\x17\x27\x37\x75\
-\x75\x7d\xe2\x4d\xfb\xae\xbd\xfb\xf2\xeb\xf7\x0d\x0c\xbf\x71\x17\
-\x6e\x3e\x1f\xcf\xfe\x5c\x17\x91\xcb\x21\x72\x79\xf0\x7c\x70\xbd\
-\xf8\x2d\x32\x63\x62\x02\xaa\x55\x4c\xb5\x02\xe5\x12\xa6\x54\xc2\
-\x84\xf1\x61\xaa\xa0\x5c\xe2\xe4\x8b\x47\x38\xf8\xf8\xe3\x93\xbf\
-\x7e\xe2\xe9\xfb\xa6\x17\x17\xff\xdd\xbd\x38\xd9\xa4\xf3\x0e\xe8\
-\x68\xb3\xac\x7d\x9b\x37\x6d\x7c\xe7\x1b\x76\xef\xbe\x76\xf0\xb2\
-\xcb\x86\x07\x77\x5d\xe2\x6d\x1a\x1e\xa6\xa5\x7f\x33\x56\x5b\x1b\
-\xb8\x5e\xfc\x9a\x1d\xc4\x2f\x41\x54\x2b\xa8\xc2\x2a\x85\xb3\x67\
-\x99\x39\x79\x92\xb1\x23\x47\xaa\x63\x2f\x1e\x1e\x79\xe9\xe0\xa1\
-\x5f\x9e\x9d\x9e\x39\xb0\xaa\xd4\x13\xc9\x4a\xce\x3a\x5b\x20\xff\
-\x8a\xc6\xbe\x9e\xca\xd6\xd3\x7f\x03\x78\x3d\xb0\x29\x6f\x59\x3b\
-\x3d\xd7\xdd\xd9\xdb\xdd\x3d\xb4\x61\xd3\x86\xcd\x6d\x3d\x3d\x5d\
-\xc2\xb1\xe3\x97\xa7\xc3\x28\x2c\xce\xcf\x2f\xce\x4e\xcf\x9e\x9d\
-\x5b\x58\x38\x55\x0d\x82\x63\x25\xa5\x8e\xcd\xc3\xf4\x63\xff\x1f\
-\xbe\x3c\xfd\xaa\x9e\xfb\xef\xe5\xf5\xf9\xff\x07\xad\x70\x91\x19\
-\x1c\x73\x57\x3d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x03\x50\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x02\xf2\x49\x44\x41\x54\x58\x85\xbd\
-\x97\x4d\x48\x14\x71\x18\xc6\x9f\xff\xcc\x6e\xa5\x66\x16\x84\x88\
-\x44\x41\x1d\xba\x44\x20\x46\x88\xae\x05\xe5\x67\xd1\xaa\x69\x1d\
-\xba\x09\xdd\x3a\x58\x08\x05\x05\x51\x14\x11\xd5\xc5\x2e\x1e\x02\
-\xeb\x12\x64\x12\x44\x12\x44\x25\x52\x89\xee\x9a\x22\x44\xa6\xac\
-\xae\xa0\x74\x08\xc1\x40\x62\x77\x67\xdc\x99\xf7\xe9\xa0\xad\xad\
-\xba\xba\x9f\xbe\xc3\x73\x99\xf9\x7f\xfc\xe6\x79\xdf\xf9\x0f\xaf\
-\xc2\x52\x9c\x9b\x29\xc9\xd2\xac\xdd\xf7\xa8\x70\x0a\x44\x00\x4a\
-\x75\x53\x37\xdb\xba\xf6\xbe\xff\x8d\x0c\x86\x8a\x00\xf8\x4f\x77\
-\x28\xa5\x9a\x57\x3c\x9f\x23\x79\x0b\xfb\xb3\xdb\xbb\x54\x97\x9d\
-\x31\x80\xba\x91\xe3\x3b\xb7\xe4\x6d\x9f\x05\x94\x33\xc6\xb8\xef\
-\x8a\xbc\xf2\xf2\xc0\xdb\x8f\xe9\x06\xd0\x00\xc0\x91\x97\x73\x10\
-\x80\x13\x20\x62\xe8\x90\x80\xef\x9b\xfc\xb5\xaf\xeb\xa7\x6b\x0e\
-\xa4\x1d\xc0\x86\x6c\x23\x89\xf5\x04\x40\x01\xaa\x4e\xb7\xb4\xd1\
-\x26\x7f\xed\x7d\xf7\x58\x69\x6e\xda\x00\x80\x75\xde\x7d\x85\x00\
-\x6c\x25\xd4\x35\x87\x33\xcf\xd7\x30\x59\xdb\x0c\x2e\xd7\x51\x8a\
-\x00\x89\x5d\x50\x28\x50\x0a\x1d\x67\xa7\x6a\x06\x1b\x27\xaa\x4a\
-\x53\x03\xb0\x00\x90\x49\x0a\x47\x04\x5a\x5f\x83\xbf\xfa\x79\x83\
-\xaf\x66\x4f\x92\x0e\x58\x09\x3b\x10\xed\x06\x15\x88\x0b\xd0\x38\
-\x5e\x3f\x59\x75\xb3\x64\xa6\x24\x2b\x41\x80\xf8\x6b\x60\x03\xe5\
-\x00\xea\x76\x81\xb9\x63\xac\x7e\xaa\xfa\x7c\xdc\x00\x16\x90\x42\
-\x0a\xd6\x10\xb0\x0f\x36\x3b\xdd\xbe\xca\xcf\x6e\xdf\xc9\xa2\x38\
-\x1d\x48\xff\xa5\x14\xca\xa1\xb4\xaf\x6e\x5f\xe5\x93\xca\xc9\xca\
-\xfc\xcd\x48\xc1\x2a\x01\xd0\xa1\x70\x71\x9b\xc0\x77\x66\xa2\xa2\
-\xb5\x78\xa8\x38\xea\xb4\x5d\x2e\xc2\x0d\x0e\xa2\x54\x05\x30\x0f\
-\xc4\xa3\xc2\xdc\x5d\x5e\xf7\x58\x45\xe1\x2a\x07\x32\xe7\xc1\x0a\
-\x29\x16\x89\x26\xaf\x36\xa5\x06\x62\x7f\xb6\x28\xa9\x19\x3f\x71\
-\x18\x00\x1c\x8b\x09\x00\x74\xae\x55\x22\x19\x0a\x21\x10\x0c\x23\
-\x02\xf0\xcf\x83\xcd\x08\x12\x60\x88\x9e\x77\xc5\x7d\xdf\xa2\x00\
-\xb8\x09\x00\xb4\x00\x09\x71\xc4\x36\xc2\x8d\xff\xee\x2d\x02\x58\
-\x16\xa8\x39\x62\x4e\x4c\x39\x84\x10\x83\xf3\x34\x71\x67\xce\x19\
-\x78\x3c\xec\x1a\x0e\x47\x03\x20\x43\x0e\x10\x10\x53\x6c\x86\xf8\
-\x14\x62\xdf\xf8\x50\x36\x30\xbb\x72\x48\xa4\x08\x1d\x69\x06\x60\
-\x18\x90\xa0\x7c\x11\xcb\x6e\xe9\x29\x1b\x18\x89\x35\x6e\xd9\x81\
-\x34\xed\x4f\x9b\x60\x88\xd3\x62\xca\xb5\x1e\x57\x7f\xe7\x46\xe3\
-\xd3\x97\x02\x02\x62\x48\x40\x0c\x3e\x08\x42\x1e\x7a\x5c\x9e\x50\
-\x3c\xd3\xfe\x73\x20\x79\x00\x9a\xa4\x18\x7c\x61\x2b\xeb\xea\xa7\
-\xd2\xc1\x9f\x89\xcc\x5d\x02\xb0\x10\x75\x24\xc4\xbb\xb1\x45\x48\
-\x50\x86\x68\xa3\xa5\xb7\x6c\xa0\x3f\xe1\x05\x90\x6c\x0a\x84\x90\
-\x10\x7f\x71\x41\xae\xf7\x96\x7a\x9f\x41\x25\x9f\xbf\xe5\xa3\x38\
-\x9e\x35\x08\x88\x41\x13\x86\xb4\x99\xd4\xef\xf6\xbb\xbc\x7f\x92\
-\xdd\x38\x0a\x00\x41\x1a\xc8\x8a\x0d\x40\x00\x58\x00\x19\xe2\x1b\
-\x88\xd6\xda\xeb\xf2\xfa\x53\xdd\x38\x0a\xc0\x01\x6b\xdc\xb6\x9d\
-\x61\xa5\xaf\x6e\xcd\x68\x11\x12\xe2\x28\xc2\xea\xf2\xa7\x72\x4f\
-\xda\x5b\xb3\x48\x53\x71\xcc\x7b\xb4\x43\xcf\xd6\x9a\x23\x3f\x68\
-\x01\xc4\xe0\x1c\x0c\xde\xca\x77\x0d\xb6\x77\x29\x64\xa4\x39\x8d\
-\x14\xe1\x82\xad\x5d\xda\x32\xcf\x79\xa5\xe3\x14\xc0\x00\x2c\x76\
-\x9b\x7a\xa0\xcd\x53\xfe\x23\xa3\xed\xf9\x5f\x5a\x4d\xcc\xc3\x25\
-\xfb\x31\x29\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xba\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x04\x03\x00\x00\x00\x81\x54\x67\xc7\
-\x00\x00\x00\x2a\x50\x4c\x54\x45\x47\x70\x4c\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x07\xae\x96\x6b\x00\x00\x00\x0d\x74\x52\x4e\x53\x00\xaf\
-\x02\xa4\xf9\x4d\x81\xe1\x2e\x80\x3a\x2f\x39\x93\x0c\x3c\xaa\x00\
-\x00\x00\x32\x49\x44\x41\x54\x28\xcf\x63\x60\x18\x6c\x60\x9b\x02\
-\x9a\xc0\x11\x23\x34\x01\x56\x67\x74\x25\x21\x14\x28\x61\x13\x84\
-\x81\x5a\x23\xec\x02\xb8\x4d\x0d\xa1\x58\xc1\x12\x74\x67\x75\x2a\
-\x0c\xaa\xd8\x00\x00\x21\x70\x0a\x70\x91\x83\xfb\x70\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x97\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x04\x00\x00\x00\xd9\x73\xb2\x7f\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x02\
-\x62\x4b\x47\x44\x00\xff\x87\x8f\xcc\xbf\x00\x00\x00\x09\x70\x48\
-\x59\x73\x00\x00\xec\x38\x00\x00\xec\x38\x01\x71\x2b\xca\x38\x00\
-\x00\x00\x07\x74\x49\x4d\x45\x07\xe6\x02\x15\x0f\x25\x0e\x15\xd9\
-\x1c\x2f\x00\x00\x02\x3a\x49\x44\x41\x54\x48\xc7\xa5\xd4\xcd\x6f\
-\x8c\x51\x14\xc7\xf1\xcf\xb4\x83\x18\x55\xa1\x95\xa0\x2f\x24\x4a\
-\x23\x4a\x88\x9d\x15\xa5\x16\x4d\x24\x44\x48\x13\x8b\x26\x22\xc4\
-\xca\x46\xfc\x03\x15\x11\xb1\x10\x49\xbd\x2c\x58\x60\x45\x82\x85\
-\x95\x8a\x90\x6a\x75\xd1\x04\x11\x61\x21\x92\xbe\x58\xd4\xa2\x6d\
-\xa8\xd6\xcb\xcc\x5c\x8b\x99\xbe\x4c\xf5\x99\x31\x9c\xd5\x73\x6f\
-\xce\xef\x7b\xcf\xfd\x9d\xf3\x5c\xfe\x33\x4a\x11\xb7\x52\xb9\x09\
-\xe9\xa2\x94\x71\x61\xf2\x73\x95\x1e\x3d\xaa\x8a\x92\x6f\x70\xd5\
-\x8e\x0c\x87\xb8\xaa\x6c\x2d\x73\xc5\x02\x95\x4a\x0c\x1b\x9f\x3e\
-\x51\xbd\x76\x3b\x25\x74\xfb\x09\xb5\x06\x0c\xa8\x9d\x43\x1c\xb3\
-\xd3\x3d\x1f\xf5\x79\xe6\x9c\x26\x8b\xb2\xf2\x27\x82\x17\x36\x4f\
-\xa6\x45\x03\x76\x18\x90\x36\x64\xd0\x77\xc1\x37\x0f\xed\xb3\x35\
-\x2b\xdf\x34\x9d\x16\x05\x28\x71\x43\x70\x5d\xbd\x35\x9a\x9c\xf7\
-\x4e\xda\x98\x7e\xc1\x73\x0d\x33\x13\xa3\x00\x0b\x3d\xf5\x4b\xe3\
-\xd4\xba\xca\x15\x41\x10\xb4\x5b\x32\x7d\x4a\x74\xa4\x8c\x29\xb5\
-\x78\x6a\x9d\x50\x87\x41\x5f\x1d\x77\x6b\xd2\x81\x7c\x80\x9f\x5e\
-\x89\xd9\x3e\xe5\xfc\x35\xbb\xf5\xd8\xef\x88\xf7\xf6\x3a\x69\x5e\
-\x61\x13\x9b\xfd\xd0\x6b\xf9\x0c\xe7\x33\xd6\x6d\x74\xc1\xb6\xc2\
-\x1e\xb0\x54\xa7\xb4\x56\x75\x7f\x38\x9f\x53\x79\x34\x80\x13\x82\
-\x5e\xcf\x66\x37\x2e\x37\xf2\x01\x56\x79\x29\xe4\x93\xe7\x33\x11\
-\xca\xa5\x30\xe2\xb4\x37\xff\x02\xa8\x77\xd9\x36\x29\x65\xea\xf3\
-\xa5\x45\x5d\x21\xe3\x7c\xa7\x73\x92\xba\x55\x16\x0b\x98\x6c\x5c\
-\x83\x65\xba\xa4\x1d\xfd\x1b\x40\xb5\xc3\xd9\x21\xcd\xed\xfb\x31\
-\x41\x87\xb2\x42\x80\x12\x17\x25\xdd\xb6\xd6\xfa\x59\x7d\xaf\xf6\
-\xd6\x37\xbb\x0a\x57\xd0\xe2\x83\xe0\x95\x1e\x41\x57\x4e\xe3\xce\
-\x0b\xce\xfc\x8d\x07\x5b\x74\x0a\x82\x31\x07\x73\x72\x0e\x09\xee\
-\x8a\x17\x6e\xe3\xb8\x14\x92\x12\xda\x9c\x52\x33\xb5\x3f\x2a\xa5\
-\x62\x2e\x40\x6e\x05\x19\xeb\xba\xb4\x7a\x60\x42\xda\x5b\x6d\x1a\
-\xad\xb6\xc1\x4d\xc1\xb5\xfc\x57\xa8\xb1\x6e\x86\x75\x8b\xb4\xe8\
-\x30\x2e\x98\x30\xe8\xb3\x60\x20\xf3\x0a\x47\x01\xfa\xec\xf1\x78\
-\xd6\xcc\x97\x69\x76\x49\xa7\x3e\x1f\xdd\x8f\xee\x01\xb5\xfa\x8d\
-\x7a\x2d\xe8\xca\x7d\xeb\x40\x42\x95\x95\xe6\x47\x89\x33\xb6\x04\
-\x4b\x6c\xf6\xc1\x59\x23\x73\x8c\x74\x5a\xdc\x8a\x3f\x76\x63\x92\
-\x86\x24\x63\xa8\xf4\xc8\x56\x8c\x19\x2e\xf8\x77\xce\x04\x0c\x3a\
-\xe0\x53\x29\xc6\x8d\xaa\xf3\xcb\xf7\x22\xe4\xc4\x7c\x71\xc7\xd7\
-\x58\x76\x51\x21\x51\x84\x38\x13\x49\x9f\x25\x8b\x56\xcd\x8e\xdf\
-\x88\xa0\xd5\xa4\x77\xa7\x34\x81\x00\x00\x00\x25\x74\x45\x58\x74\
-\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x32\x32\
-\x2d\x30\x32\x2d\x32\x31\x54\x31\x35\x3a\x33\x37\x3a\x31\x33\x2b\
-\x30\x30\x3a\x30\x30\x2a\x70\x9d\xcb\x00\x00\x00\x25\x74\x45\x58\
-\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x32\
-\x32\x2d\x30\x32\x2d\x32\x31\x54\x31\x35\x3a\x33\x37\x3a\x31\x33\
-\x2b\x30\x30\x3a\x30\x30\x5b\x2d\x25\x77\x00\x00\x00\x20\x74\x45\
-\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x68\x74\x74\x70\x73\
-\x3a\x2f\x2f\x69\x6d\x61\x67\x65\x6d\x61\x67\x69\x63\x6b\x2e\x6f\
-\x72\x67\xbc\xcf\x1d\x9d\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x3a\x3a\x50\
-\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\x00\x00\x00\x18\x74\x45\
-\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\
-\x48\x65\x69\x67\x68\x74\x00\x35\x31\x32\x8f\x8d\x53\x81\x00\x00\
-\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\x6d\x61\
-\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\x35\x31\x32\x1c\x7c\x03\
-\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\x6d\x61\x67\x65\x2f\x70\
-\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\x00\x31\x36\x34\x35\x34\
-\x35\x37\x38\x33\x33\xa6\xec\xf8\x20\x00\x00\x00\x13\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\x7a\x65\x00\x31\x31\x31\
-\x39\x36\x42\x42\x9a\xa0\xad\xc6\x00\x00\x00\x46\x74\x45\x58\x74\
-\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\x66\x69\x6c\x65\x3a\
-\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\x2f\x35\x36\x2f\x77\
-\x66\x30\x32\x30\x39\x64\x2f\x33\x34\x30\x36\x2f\x63\x75\x72\x76\
-\x65\x5f\x6d\x61\x74\x68\x5f\x69\x63\x6f\x6e\x5f\x32\x31\x36\x33\
-\x34\x39\x2e\x70\x6e\x67\x2a\xa3\x4a\xa6\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\x8d\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x01\x7a\
-\x50\x4c\x54\x45\xff\xff\xff\x00\x00\x00\x01\x01\x01\xff\xff\xff\
-\x9f\x9f\x9f\x05\x05\x05\x02\x02\x02\x01\x01\x01\x01\x01\x01\x03\
-\x03\x03\x36\x36\x36\x06\x06\x06\x00\x00\x00\x00\x00\x00\x03\x03\
-\x03\x02\x02\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x05\x05\x05\x01\x01\x01\x07\x07\x07\x0f\
-\x0f\x0f\x0e\x0e\x0e\x00\x00\x00\x01\x01\x01\x07\x07\x07\xff\xff\
-\xff\x00\x00\x00\x0c\x0c\x0c\x01\x01\x01\x01\x01\x01\x03\x03\x03\
-\x17\x17\x17\x09\x09\x09\x01\x01\x01\x02\x02\x02\xd6\xd6\xd6\x06\
-\x06\x06\x01\x01\x01\x00\x00\x00\x00\x00\x00\x13\x13\x13\x14\x14\
-\x14\x0f\x0f\x0f\x01\x01\x01\x0c\x0c\x0c\x00\x00\x00\x0a\x0a\x0a\
-\x05\x05\x05\x03\x03\x03\x03\x03\x03\x03\x03\x03\x01\x01\x01\x02\
-\x02\x02\x04\x04\x04\x17\x17\x17\x02\x02\x02\x00\x00\x00\x00\x00\
-\x00\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x03\x03\x03\
-\x00\x00\x00\x00\x00\x00\x04\x04\x04\x01\x01\x01\x2a\x2a\x2a\x02\
-\x02\x02\x04\x04\x04\x0b\x0b\x0b\x02\x02\x02\x00\x00\x00\x0c\x0c\
-\x0c\x08\x08\x08\x02\x02\x02\x01\x01\x01\x03\x03\x03\x7c\x7c\x7c\
-\x00\x00\x00\x05\x0d\x18\x19\x49\x89\x1c\x51\x97\x1c\x50\x96\x1c\
-\x52\x99\x10\x30\x59\x0e\x2a\x4d\x2f\x87\xf9\x30\x8b\xff\x30\x8a\
-\xff\x30\x8c\xff\x18\x46\x82\x17\x41\x7b\x2f\x88\xff\x2e\x86\xfb\
-\x0f\x2d\x54\x01\x03\x06\x21\x5e\xb1\x2f\x89\xff\x2b\x7d\xea\x08\
-\x18\x2d\x06\x11\x21\x29\x77\xdf\x26\x6d\xcb\x03\x09\x11\x0e\x29\
-\x4d\x2e\x85\xf9\x1e\x58\xa4\x00\x01\x02\x18\x45\x81\x0e\x2a\x4e\
-\x2e\x86\xf9\x13\x38\x69\x2a\x79\xe3\x29\x78\xe1\x2a\x7a\xe4\x1b\
-\x4e\x92\x03\x0a\x12\x06\x10\x1f\x06\x10\x1e\xff\xff\xff\xf7\x37\
-\x69\x54\x00\x00\x00\x54\x74\x52\x4e\x53\x00\x00\x00\x02\x02\x40\
-\x8e\x98\x97\x5a\x04\x3f\xe4\xed\x54\x8b\xfb\xe5\xe1\xe2\xf7\xde\
-\x3b\x96\x3b\x1e\x20\xfc\xc9\x26\x01\x1e\x0f\xa4\xc5\x62\x0e\x1d\
-\xbe\x80\x02\x30\xbf\xf3\xd4\x18\x12\x1f\xa3\x20\x96\x25\x44\x6b\
-\x6a\x69\xc2\x7d\x58\x14\x64\xec\xfe\x9a\x94\xe8\xd1\x6e\xf9\xf5\
-\x42\xbb\x0a\x6f\x43\x20\x8f\xda\x1e\x34\x92\x99\x5d\x04\xe2\xfd\
-\xbb\xf1\x00\x00\x00\x01\x62\x4b\x47\x44\x00\x88\x05\x1d\x48\x00\
-\x00\x00\x09\x70\x48\x59\x73\x00\x00\x9d\x7b\x00\x00\x9d\x7b\x01\
-\x3c\x9f\x77\xc4\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe4\x0a\x10\
-\x08\x08\x1e\x67\x6d\x5a\xd9\x00\x00\x01\x4b\x49\x44\x41\x54\x38\
-\xcb\x8d\xd3\xf7\x53\xc2\x30\x18\xc7\xe1\xc4\x3a\x70\x20\x50\xac\
-\xd5\xaa\x71\xef\x89\x1b\x17\x2e\xdc\xdb\xd7\x2d\x75\x5b\xf7\x9e\
-\xe0\x1f\x6f\x49\x02\x7a\x4d\xab\x7c\x7e\xec\x3d\x77\xfd\x5e\x9b\
-\x20\xe9\x9f\x50\x0a\x00\xfd\xca\x0e\xa4\x67\x64\x66\xb9\x78\xd9\
-\x39\x22\xc0\xb9\x79\x90\xcc\x9d\x8f\x44\xe0\x01\xaf\x4f\xa6\xf9\
-\x0b\x40\x29\xc4\x56\x80\x54\xf0\x15\x15\x6b\x34\x4f\x09\x94\x96\
-\xe1\xe4\x20\x92\x00\x72\x39\x7b\x88\x2b\x2a\x01\xaa\x54\xbe\x47\
-\xad\xae\x21\x09\xa0\xf1\x37\xe3\xda\xba\x9f\x3d\xe0\xad\x6f\xb0\
-\x02\x09\x37\x36\xf9\x65\x5e\x33\xb4\xb4\x12\x2b\x90\x48\x9b\xc6\
-\x6b\xef\x60\xcf\x29\x08\x60\x84\x85\x3a\xcd\x6d\x69\x84\x81\xae\
-\xee\x9e\x5e\x6b\x7d\xfd\xe0\x0e\x0e\x0c\x92\x38\x50\x86\x86\xc1\
-\xbe\x91\x20\xa6\x20\x04\x4e\x8d\x52\x30\x36\x0e\x1b\x9b\x5b\xdb\
-\xd6\x76\x76\x01\x26\x28\xf0\x4e\xc2\xde\x7e\x44\xb7\x76\x70\x08\
-\xe1\x29\x0a\xcc\x8e\xf4\x63\xa1\x93\x53\x50\x02\x1c\x9c\x9d\x8b\
-\xc0\xb8\xb8\x84\xe9\x19\xc2\xc0\xd5\xb5\x21\x00\xfd\xe6\x16\x54\
-\xf6\x1d\x00\xee\xee\xc5\x37\xe8\x0f\x8f\x30\x8b\x39\xb0\x9b\xa0\
-\x3f\x41\x78\x8e\x03\xbb\x09\x74\xe3\x3c\x62\xc0\x6e\x02\xdf\xc8\
-\xc0\xf3\x8b\x21\x14\x61\x1b\x19\x78\x7d\x7b\x17\xfa\xf8\xa4\x1b\
-\x19\x88\xc6\xbe\x84\x62\x51\xba\xd1\x3c\xd5\x0b\x8e\x7f\x6a\x71\
-\x29\x7e\x60\xf0\xf2\x8a\xcb\xbe\xd5\xb5\x75\x7a\xb3\x08\x72\x8a\
-\xa4\x7a\x79\xff\xee\x1b\x20\xa9\xbd\x73\x5e\x06\xc0\xb2\x00\x00\
-\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\
-\x65\x00\x32\x30\x32\x30\x2d\x31\x30\x2d\x31\x36\x54\x30\x38\x3a\
-\x30\x38\x3a\x32\x39\x2b\x30\x30\x3a\x30\x30\x23\xa5\x2e\x24\x00\
-\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\
-\x66\x79\x00\x32\x30\x32\x30\x2d\x31\x30\x2d\x31\x36\x54\x30\x38\
-\x3a\x30\x38\x3a\x32\x39\x2b\x30\x30\x3a\x30\x30\x52\xf8\x96\x98\
-\x00\x00\x00\x20\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x68\x74\x74\x70\x73\x3a\x2f\x2f\x69\x6d\x61\x67\x65\x6d\x61\
-\x67\x69\x63\x6b\x2e\x6f\x72\x67\xbc\xcf\x1d\x9d\x00\x00\x00\x18\
-\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\x75\x6d\
-\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\xbb\x2f\
-\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x49\
-\x6d\x61\x67\x65\x3a\x3a\x48\x65\x69\x67\x68\x74\x00\x35\x31\x32\
-\x8f\x8d\x53\x81\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\
-\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\x68\x00\
-\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x54\
-\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\x00\x69\
-\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\x00\x17\
-\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\x6d\x65\
-\x00\x31\x36\x30\x32\x38\x33\x35\x37\x30\x39\x75\x2e\xc8\xe4\x00\
-\x00\x00\x12\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x53\x69\
-\x7a\x65\x00\x37\x36\x38\x36\x42\x42\x49\x0a\x8b\xad\x00\x00\x00\
-\x47\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\x49\x00\
-\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\x61\x64\x73\
-\x2f\x35\x36\x2f\x6d\x38\x51\x33\x37\x52\x57\x2f\x32\x35\x39\x36\
-\x2f\x66\x6f\x6c\x64\x65\x72\x5f\x6f\x70\x65\x6e\x5f\x69\x63\x6f\
-\x6e\x5f\x31\x35\x35\x33\x37\x36\x2e\x70\x6e\x67\x0c\x39\xbb\xbd\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x12\xf9\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x12\x9b\x49\x44\x41\x54\x78\x9c\xdd\
-\x9b\x69\x90\x1c\x57\x7d\xc0\x7f\x7d\x77\xcf\x3d\xab\xbd\xb4\xb6\
-\x65\xc9\x87\x84\x90\x6c\xc7\x76\x6c\x30\xc5\x11\x02\x49\xc0\x05\
-\xe1\xa8\x72\x41\x52\x50\x21\x29\x52\x45\x51\x24\x81\x90\x0f\x50\
-\xa4\xca\xf9\x40\x48\x80\x02\x62\x2a\x40\x1c\x3e\x10\xce\x10\xc7\
-\xe6\x32\xc6\xe0\x60\x0c\x18\x5b\x96\xe5\x95\xad\x63\xad\xd5\x7a\
-\xbd\x5a\xed\x7d\xce\xec\xcc\xec\x1c\x7d\xbc\xf7\xf2\xa1\x67\x76\
-\x67\x56\x92\x6d\x69\x57\x09\xf6\xab\xea\x9a\x37\x3d\x7d\xfd\x7f\
-\xef\x7f\xbe\xd7\xa3\x71\x71\x9a\xb6\xe1\x13\x40\x6d\xf8\xfc\xad\
-\x68\xda\xf3\x1f\xf2\xfc\xed\xaf\xee\xb8\xc3\xb9\xa6\x77\xc7\xcd\
-\x22\x8c\x5e\xa1\x69\xc6\x35\x28\x76\xa0\x69\x3d\x1a\x5a\x4a\x28\
-\x49\x18\xfa\x95\x30\x8c\x16\x82\x20\x18\x0f\xea\xc1\xf1\x46\xa3\
-\xf1\xd8\xdd\xdf\xfc\xd2\xe1\xd1\xd1\xd1\x10\x90\x5b\xf1\x0c\x17\
-\xda\x2e\x18\xc0\x6d\xb7\xdd\x66\xbc\xe9\x9d\xef\xfd\x43\x34\xed\
-\xcf\x4c\xcb\x7c\x93\x63\xbb\x59\xc7\xf3\xb0\x6d\x07\xc3\xb4\xd0\
-\x34\x0d\xa5\x40\x08\x41\x14\x45\xf8\xbe\x4f\xa3\x51\xa7\x5a\xad\
-\x52\x5d\xad\x50\xab\xd5\x96\xeb\xd5\xea\x8f\xab\xd5\xd5\x6f\x7e\
-\xf1\x9f\x3e\xf1\x6b\x20\xe2\xff\x41\x3b\xce\x1b\xc0\x9d\x77\xde\
-\x69\x59\xb9\x81\xf7\x9a\xa6\xf5\x31\x2f\x91\xbc\x3a\x9b\xcb\x91\
-\x48\xa6\xb1\x6c\x1b\x4d\xd3\x91\x52\x21\xa4\x40\x08\x81\x10\x12\
-\x29\x04\x42\x4a\xa4\x54\x44\x42\x10\x85\x21\xbe\xef\x53\xad\x56\
-\x29\x97\x8a\xac\x14\x0b\x54\xca\xe5\x23\xe5\x52\xe1\x9f\xbf\xfa\
-\x85\x4f\x7e\x1f\x08\xf8\x3f\x04\x71\x5e\x00\xfe\xe3\xbb\x3f\x7e\
-\xad\x61\x9b\x5f\x4a\xa5\xb3\xfb\xbb\xba\x7b\x48\x26\x53\xe8\x86\
-\x81\x88\x04\x7e\x10\xe0\xfb\x0d\xfc\x46\x03\xdf\x0f\x08\xc3\x90\
-\x48\x44\x48\x21\x63\x69\x34\x0d\x5d\x33\xd0\x0c\x03\x4d\xd3\x51\
-\x0a\x22\x11\x51\xaf\xd5\x28\xad\x14\x28\x2c\x2d\xb2\xb2\x52\x38\
-\x30\x3f\x3d\xf3\x37\xdf\xff\xf6\x57\x9e\x24\xd6\x88\x8b\xde\x5e\
-\x10\x80\xdb\xef\xba\xcb\xde\xa5\xa5\x3e\xe5\x25\x12\x1f\xe9\xed\
-\xdb\xae\x67\x72\x79\x74\x4d\x27\x08\x02\xaa\xd5\x2a\xab\x95\x32\
-\xd5\xea\x2a\xb5\x5a\x8d\x46\xc3\x47\xd3\x4d\x74\xdd\x04\x74\x94\
-\x52\x44\x51\x40\x10\xf8\x84\x81\x8f\x6e\x1a\x98\xa6\x85\x65\x3b\
-\x98\xb6\x83\xae\x1b\x48\x29\xa9\xd5\x6a\x14\x97\x17\x59\x5a\x9c\
-\xf7\x4b\x85\xe5\x4f\xfd\xe7\x57\x3f\xf7\x59\xa0\xc1\x45\xd6\x86\
-\xe7\x05\xf0\xe5\x6f\xdc\xd3\x9b\x4c\x26\xef\xce\x77\x6d\x7b\x4d\
-\x5f\xff\x00\xb6\xe3\x12\x86\x01\x95\x72\x99\x95\x95\x22\xe5\x95\
-\x15\x22\x01\xa9\x74\x17\xe9\x4c\x9e\x54\x3a\x8b\xae\xc5\x97\x55\
-\x80\x92\x0a\xa9\x14\x42\x4a\x82\x20\xa4\x5c\x2a\x52\x28\x2c\xb0\
-\xbc\x34\x47\x24\x42\x1c\xc7\xc3\x76\x3d\x74\xc3\x24\x8a\x04\x95\
-\x52\x91\xa5\xc5\x39\x4a\x85\xa5\xfb\x0e\xfd\xe2\xe7\x7f\x3e\x3a\
-\xfa\xd4\x32\x17\xd1\x51\x3e\x27\x80\x3b\xbf\x7e\xd7\x0e\x2f\x9d\
-\x7d\xa0\xb7\xaf\x7f\x4f\x4f\x6f\x3f\x68\x3a\xd5\xea\x2a\x85\xe5\
-\x25\x8a\xcb\xcb\x18\xa6\x4b\x5f\xdf\x0e\x72\xf9\x2e\x0c\x5d\x43\
-\xd7\x75\x34\x4d\x43\xd3\x62\xe9\x15\x20\x95\x8a\xfd\x82\x90\x08\
-\x29\x09\x23\x41\x24\x04\x61\x18\xb1\xb0\x30\xc7\xf8\xd8\x30\x95\
-\x6a\x19\xd7\x4b\x62\xbb\x1e\x9a\xa6\x13\x34\x1a\x14\x96\xe6\x29\
-\x2e\x2f\x3c\x71\xec\x91\x87\xde\x71\xec\xd8\xe3\x33\x17\x0b\x82\
-\x71\xae\x1f\xfe\xe5\xab\xdf\xe9\xcb\x66\xf3\xbf\xea\xdf\x3e\xb0\
-\xbb\xbb\xb7\x1f\x29\x15\xc5\x62\x81\xf9\xd9\x19\x2a\xa5\x0a\x97\
-\xed\xd8\xcd\xae\x5d\x57\x91\xcd\x64\xf0\x1c\x0b\xcf\xb5\x71\x1d\
-\x1b\xd7\x36\x71\x6c\x0b\xc7\xb2\xb0\x6d\x0b\xc7\x32\xb1\x9b\x9b\
-\x65\x1a\x58\xa6\x89\x69\xe8\x18\x86\x41\x32\x99\xa6\x7f\xe0\x72\
-\x6a\xbe\xce\xcc\xf4\x38\x32\xf2\x31\x4c\x13\xdb\x71\x71\xbc\x04\
-\xc0\x40\xa6\xab\xfb\x75\xe5\xa5\xe2\x0f\x4b\xa5\xc5\x1a\x17\xc1\
-\x1c\xce\x0a\xe0\x23\x9f\xfb\x9c\xb7\xb3\xef\xd2\xfb\x7b\xfb\x07\
-\xae\xed\xee\xe9\x23\x12\x82\xe5\xa5\x45\xe6\x66\xa7\xb1\x2d\x8f\
-\x7d\xfb\x6f\x60\x5b\x57\x1e\xcf\xb1\x71\x1d\x0b\xcb\x32\x31\x4c\
-\x03\x43\xd7\xd1\x75\x1d\x5d\xd3\xd0\xf5\x78\x33\x74\x1d\xc3\xd0\
-\xb1\x0c\x1d\xcb\x34\xb1\x2d\x03\xd3\x34\x62\x08\xba\x8e\x6e\x68\
-\xe4\x73\x79\x6a\x74\x51\x5c\x5e\x20\xf2\x2b\x18\x46\x13\x82\xe3\
-\xa1\x94\x1c\xc8\xf7\xf5\xed\x1b\x3a\x7c\xe0\x47\xc4\x11\xe2\xa2\
-\x03\xd0\xde\xff\x17\x7f\x7d\x47\x57\x77\xcf\x3b\x7a\xfb\xb6\x23\
-\xa4\x5c\x13\xbe\xb7\xfb\x12\xf6\xee\xdd\x4f\xca\x73\x71\x2c\x13\
-\xd3\x30\xd0\x35\x2d\x56\x7b\xda\xec\xa9\xf9\x45\xd3\x58\xdf\xdf\
-\x3c\x4e\xd7\x75\xcc\x26\x0c\xd3\xd0\xd7\xbe\x2b\x0c\xcc\x44\x2f\
-\x2b\x2b\x25\x82\x5a\x71\x4d\x13\x2c\xdb\x41\x4a\x71\xf5\xa5\x97\
-\x5f\x2d\x4f\x1e\x7b\xe2\x00\x5b\x1c\x1d\xce\x00\xf0\x95\xaf\xdf\
-\x7d\x6b\x3a\x93\xf9\x7c\xff\x25\x3b\x34\x4d\xd7\x29\x2c\x2f\x31\
-\x3f\x3b\xc3\xc0\xc0\xe5\xec\xb9\x7a\x0f\xae\x6d\x61\xe8\x3a\x9a\
-\xde\x26\x9d\xd6\x21\xf7\x5a\xff\x6c\x30\x68\xc2\xd0\x75\x0d\xd3\
-\xd0\x9b\x10\x34\x2c\xc3\xa0\x16\x48\xbc\x74\x0f\x2b\xa5\x15\xc2\
-\xfa\x0a\x96\xe5\x60\x3b\x2e\x86\x61\x22\xa5\xb8\xc5\x4b\x67\x7e\
-\x35\x35\x36\x32\xc5\x16\xfa\x83\x0e\x00\xb7\xdf\x7e\x67\x22\xbf\
-\xbd\xeb\xbe\xed\x03\x97\xe5\x5d\x2f\x41\xb9\x5c\x62\x7e\x76\x86\
-\xae\x7c\x0f\xfb\xf6\xee\xc7\x32\x0d\x74\x5d\xeb\x18\xd9\xb5\xad\
-\xed\x4b\xc7\xc8\x6f\x80\xb1\x11\x84\xa1\xeb\x98\x86\x81\x6d\xe9\
-\xd4\x7c\x85\x02\xdc\xe4\x36\x0a\xcb\xf3\xc8\xa8\x86\x6d\xbb\xd8\
-\x8e\x8b\x92\xd2\xb0\x0c\xeb\xba\xe3\x83\x8f\x7e\x17\xf0\xd9\x22\
-\x7f\xd0\x01\xe0\xb6\xf7\xbd\xef\xc3\xf9\xae\x6d\xb7\xe5\xbb\x7b\
-\xf0\xfd\x06\x8b\xf3\x73\x28\xa1\xb8\xf9\xa6\x57\x62\x99\x26\x5a\
-\x33\xbc\x69\xda\x99\x5b\xbb\xf0\xbf\x39\x56\xe5\xd8\x58\x9d\x91\
-\xc9\x06\x23\x13\x35\x4e\x4e\xd4\x88\x22\x49\x6f\xde\x5e\x07\xb1\
-\xce\x00\xad\xa9\x0d\x0a\x9d\x48\xc4\xfb\x2d\xaf\x8b\xa5\xb9\x53\
-\x18\xba\x86\xed\xb8\x98\xa6\x45\x18\x04\xfd\x3d\x7d\x03\x13\xa3\
-\xc3\x47\x8f\xb2\x45\xa6\x60\xb6\x3a\x1f\xfd\xe8\x67\x93\xb6\x6d\
-\xff\x6d\x36\xd7\x85\x10\x92\x62\xb1\x48\xb1\x58\xe0\x75\xaf\x7e\
-\x7d\x2c\x7c\xf3\xc1\x23\xb1\x3e\xe2\xba\xce\x5a\xc8\x6b\x8f\xa7\
-\x0f\x3f\xb5\xca\xc4\x7c\x03\x29\x05\x52\x0a\x94\x14\xbc\xe1\x77\
-\x73\xec\xbf\x22\xb5\x76\x8c\x6a\x41\x68\x8e\xa3\xae\xeb\xe4\xd2\
-\x2e\x75\x5f\x22\xa5\x44\x08\xc9\xea\xc0\xcb\x29\xcd\x0f\x61\x3b\
-\xb1\x16\xa4\xb3\x39\xb6\xf5\x6d\xff\x30\xf0\xdf\xc4\x0e\x71\xd3\
-\xa6\xa0\xb7\x3a\x97\xee\xbe\xe4\x5d\x5e\x32\xd5\x6f\xda\x4e\x9c\
-\x95\x15\x96\xb9\x74\xe0\x32\x72\xd9\x5c\x87\xf0\x8d\x30\xde\x6a\
-\x01\x54\x1b\x50\xf3\x21\x88\x40\x2a\xd6\x34\x40\x29\xd9\x21\xbc\
-\x94\x02\x94\x3c\xab\x79\xd0\xf6\xdd\xb1\x74\xd2\x49\x8f\x4c\xca\
-\x23\x9d\x74\xe9\xeb\xdf\x01\x46\x8a\x46\xbd\x0a\x40\x22\x95\x21\
-\x91\xca\x5c\xfd\xc6\xb7\xbc\xeb\x0f\x00\x7b\xb3\xc2\xb7\x03\xd0\
-\x35\xd3\x7c\x4f\x32\x95\x41\x08\x49\xb9\x54\x62\xb5\x52\xe1\xe5\
-\x2f\xdb\xb7\x26\xbc\x46\x2c\xa4\xde\x14\xa2\xf5\x29\x55\x0c\xa0\
-\xe6\xc7\x40\xfc\x10\xc4\x06\xe1\xa5\x14\x28\xa5\x3a\x4d\xe5\x2c\
-\x10\x4c\x1d\x2c\x53\x27\x95\x70\x49\x25\x5c\x92\x09\x87\x9e\x81\
-\x3d\x34\xea\x35\xa2\x30\xc4\xb2\x1d\x12\xa9\x34\xf9\xee\xfe\x3f\
-\x01\x3c\x3a\x15\xef\xc2\x01\xfc\xdd\xed\x9f\xe9\x35\x4d\xeb\xb5\
-\xa6\x6d\xd3\xf0\x1b\x94\xcb\x25\xfa\x7b\xfb\x49\x78\x5e\x87\xb0\
-\x96\x01\xa6\x11\x7f\xef\xd8\xf4\x78\x03\x08\x05\x08\x21\x3b\x85\
-\x6f\x69\x00\xeb\xe6\x73\x66\x98\x8c\xaf\x65\xe8\x1a\xae\x6d\xc5\
-\x00\x5c\x87\xee\x9e\x3e\xd0\x5c\x02\xbf\x81\xa6\x69\x78\x89\x14\
-\x89\x54\xea\xf5\xd9\x6c\x36\xc7\x73\x24\x72\xe7\x05\x20\x93\xcf\
-\xbf\xd1\x76\x5c\x03\x34\xea\xb5\x1a\xab\x95\x32\x3b\x2f\xdf\xb9\
-\xee\xe4\x58\x07\x90\xb0\x21\xe9\x82\x6b\x75\xc2\x68\xf7\x09\x4a\
-\x89\x0d\x26\x20\x51\x28\x5a\x91\x93\x16\x04\xce\x02\x41\x07\x5d\
-\xd7\x48\xb8\x36\x09\xcf\xc6\x73\x6c\x32\x5d\x97\x10\x04\x0d\x94\
-\x52\xb1\x3f\x70\xbd\xe4\x0d\xaf\x7a\xc3\x2d\x80\xb5\x15\x00\x34\
-\x43\xd3\x6f\xb1\x6c\x87\x30\x12\x54\xab\x55\x7c\x3f\xe0\x92\xed\
-\x03\x6b\xa3\x44\x1b\x04\x4d\x07\x43\x07\xdb\x8a\x61\xa4\x9a\x30\
-\x2c\x23\xbe\x98\xae\x81\x92\xb2\x43\x78\x29\x04\x7e\x20\xa9\x07\
-\xb1\xd7\xda\x08\xa1\xdd\x24\x5a\x90\x2c\xd3\x20\xe1\xd8\x78\xae\
-\x4d\x7e\xdb\x00\x61\x10\x20\x44\x84\x69\x5a\xb1\x43\xcc\xe5\x6f\
-\x62\x0b\xfc\x80\x19\xdf\x57\xdf\xaf\x19\x06\x41\x18\x52\xab\xd6\
-\xc8\x66\x32\x98\x86\x71\xf6\x51\x5a\x7f\xe6\xb5\x07\xb7\xcd\x78\
-\x28\x94\x8a\x4d\x00\x25\x3b\x84\x57\x52\xa0\x90\x44\x22\xfe\xdd\
-\x34\xc0\x31\x62\x98\xb1\xc6\x34\x2f\xd8\xf4\x31\x68\xa0\xa3\xe1\
-\x3a\x16\xae\x6d\x91\xcd\xe6\x90\x4a\x47\x36\x01\x58\xb6\x83\xe3\
-\x25\xf7\x34\x01\x34\xcf\xbc\x70\x00\xba\x82\x5d\x4a\x69\x04\x7e\
-\x40\xbd\x51\x67\xa0\xb7\x47\xb5\x8a\xba\xb5\xc4\xa5\xcd\x1c\x1e\
-\x3c\x5c\x65\xa1\x10\xa2\x94\x8c\x3d\xbe\x52\x20\x25\x52\x49\x94\
-\x52\x14\xcb\x8d\x0e\xe1\xa5\x14\x0c\x8f\x15\xf9\xf6\x7d\x23\x28\
-\xa9\x9a\xe7\x48\x4c\x4d\x01\xf1\x35\x6e\xdc\xd7\xc7\x8d\xfb\xb6\
-\xaf\x99\x93\x02\x2c\xcb\xc4\xb1\xcd\xb8\xa8\x72\x53\x88\x48\xa0\
-\xb9\x1a\xa6\x65\x63\x99\xf6\x0e\x62\xee\x3a\x20\x36\x07\x40\x69\
-\x3d\xad\x52\xd5\xf7\x7d\x92\x5e\x62\xcd\xf9\xd1\x82\xd0\xa6\xae\
-\x4f\x0c\xd7\x38\x31\x5e\x3b\x23\xd4\x6d\x54\xfb\xf6\xfd\xe3\x53\
-\x25\xc6\x26\x0a\xe7\x3c\x27\xe1\x1a\xdc\xb8\x6f\x3b\x2d\x65\x80\
-\xd8\x21\xc6\x95\xa4\x81\xe3\x24\x90\x62\x15\xa5\x14\x86\x61\x60\
-\x58\xd6\xb6\x26\x80\x4d\x45\x02\x13\xd0\x42\x11\xba\x51\x14\x11\
-\x45\x82\x20\x08\x70\x1c\xbb\x4d\x15\x59\xf7\x05\xcd\xbb\x9d\xe9\
-\xe4\x9e\x5b\xf8\xf6\xfe\xb9\xce\x69\x04\x8a\x7a\x10\x9b\xc3\xba\
-\x79\x69\xcd\x12\x3a\x9e\x45\xf2\xa3\x58\xd3\x35\x5d\xc7\x34\xcd\
-\x24\x71\x14\xd0\xcf\x14\xeb\xfc\x00\x10\x86\x11\x41\x18\x21\x22\
-\x41\x18\x45\x40\x9c\xf5\xb6\x8f\x7c\x0b\x04\x6c\x74\x72\x9b\x17\
-\x3e\xce\x13\x24\xa1\x58\x4f\xa8\x50\xf1\xbd\xd7\xcb\xe6\x75\x39\
-\x75\x4d\xc7\xd4\xdb\x9f\x68\x93\x00\x44\x24\xc2\x20\x08\x2d\x29\
-\x25\x51\x24\xa8\x37\xea\xeb\x3e\x80\x0d\x91\x80\x38\xd3\xdb\x52\
-\xe1\xa5\x00\xa5\xce\x70\xb4\xb1\xb0\x1a\x86\xae\xa1\xa4\x68\x8d\
-\x7c\x5c\x37\x28\xe5\x6f\x56\xf8\x35\x00\x7e\xe0\x17\x7c\xdf\xef\
-\x43\xd3\x90\x52\x51\xa9\xac\xae\x99\x40\xbb\x23\x6c\x69\x43\x7f\
-\xde\x60\xb5\xcf\x42\x2a\x03\x25\xd7\x3d\x7e\x2b\x05\x9e\x9c\x5d\
-\xa5\x11\x75\x0a\x9f\x49\x9a\x6c\xcb\x24\x90\xaa\x79\xac\x14\xb1\
-\x26\xa9\x18\x7a\x2e\xeb\x42\xdb\x3d\x80\x38\x2a\xe8\x1a\x9a\xae\
-\x21\x45\x80\x63\xdb\x58\x96\x49\x23\x2e\x22\x56\x88\xa3\xea\xa6\
-\xaa\x42\x13\x90\x8d\x46\x63\xdc\x6f\x34\xfa\x2c\xc7\x41\x37\x0c\
-\x16\x0b\x85\x33\x92\x20\x58\xb7\xcd\x0f\xbe\x73\xfb\x9a\x9a\x6e\
-\xbc\xbb\x52\xf0\x81\x7f\x7c\x9c\xd1\x89\xce\x62\xe8\xf7\x6f\xde\
-\xc1\x07\xdf\x7d\xcd\xfa\xfa\x98\x6a\x6e\x40\xd8\x4c\xa5\xa5\x6a\
-\x5e\xb3\x05\x41\xad\xdf\x37\x0c\xeb\x64\x32\x69\x2c\xd3\x04\x14\
-\x52\x84\xb3\xc4\xde\x7f\x53\x00\xf4\x26\x80\x93\x41\xe0\x03\x1a\
-\xa6\x69\x33\x33\x3b\x07\x48\xd5\x4a\x7c\xd6\x60\xe8\xeb\x59\x5f\
-\x0b\x4c\x7b\x26\xd8\xda\x77\xae\x62\xa8\x63\x2e\x80\x75\x93\xb2\
-\x8c\x38\x97\xd8\x68\x6a\xf1\xb5\x14\x41\xe0\x83\x0c\x71\x5d\x17\
-\x43\xd7\x51\x22\x22\xf4\x1b\xcf\x02\xe1\x56\x00\x50\x41\xbd\x76\
-\x28\xf0\x1b\x00\x98\x96\x85\x1f\x84\xda\xcc\xdc\x42\x9c\xd9\x9d\
-\x4d\xd0\x0d\xdb\x46\x53\x51\x67\xb3\xf9\x16\x80\x76\xad\x6a\xa3\
-\x21\x64\x27\x94\x35\x87\xab\x14\xc5\xc2\x1c\x9e\xe7\xe1\xb8\x2e\
-\x9a\x06\x51\x14\x52\x2a\x2e\x1f\x63\x0b\x4a\x62\x1d\x90\x85\xc2\
-\xe2\x43\x8d\x7a\x0d\x29\x04\x96\x65\x63\x3b\x2e\x47\x87\x4e\xac\
-\x45\x82\x16\x84\x8d\xa3\xae\xb7\xfd\xde\x0e\xe7\x6c\x4e\x12\xd4\
-\x3a\xa4\x0d\x19\xa6\x90\xeb\xe1\xaf\xd3\xdc\xe2\xe5\xb4\xc2\xd2\
-\x0c\xc9\x54\x0a\xc7\x76\x90\x22\x42\x04\x0d\x71\x7c\xf0\xe0\xe3\
-\x6c\xc1\x32\x9a\x0e\xf0\xb3\x7b\xbe\x31\xd6\xa8\xd7\x8e\x06\x81\
-\x8f\x6e\x18\x38\xae\xc7\xe0\xd1\x21\xa4\x14\x1d\xe5\xef\x39\xb5\
-\x40\xef\x04\xd4\x0a\x93\x1d\xc5\x90\xea\x1c\x28\xad\xad\x13\x44\
-\x74\xe6\x1a\x2d\x53\x51\x50\xab\x55\xa9\xad\x16\x48\xa6\xd2\x98\
-\xa6\x41\xd0\xa8\x51\xab\x56\x9e\x1c\x1b\x1b\x99\x27\x36\x81\x4d\
-\xb5\x56\x70\x0d\xeb\xab\x95\xbb\xea\xd5\x0a\x00\x8e\xeb\xe1\x07\
-\x11\x8f\x0d\x1e\xe9\x18\x35\x6d\x03\x0c\x8d\x66\xbf\xfd\x18\x38\
-\x67\x9c\x6f\x87\xd4\x12\x36\x6a\xc6\xfe\x16\x90\x76\x1f\x21\xa4\
-\xe4\xf4\xf8\x49\x52\xe9\x14\x89\x44\x12\x94\xa4\x5e\x5b\x65\x61\
-\x76\xea\x3e\x60\x75\x2b\x01\x88\xe1\xe3\x83\xdf\x5a\xad\x94\xaa\
-\x61\x10\x60\x59\x36\x5e\x32\xc5\xcf\x7f\x7d\x00\x3f\x0c\x3a\xd5\
-\x7d\xe3\xc8\xc3\x19\x82\xa9\xf6\x62\xa8\x65\x02\xf2\x2c\x9a\xda\
-\x9c\x4c\x69\x9f\x1f\x80\xf5\xcf\x72\xb9\xc4\xd2\xe2\x24\x99\x6c\
-\x1e\xdb\xb6\x69\xd4\xab\xd4\x57\xcb\xa5\xff\xf9\xe9\x0f\x7e\x02\
-\xd4\xd8\xc2\x29\x31\xf5\xe4\x81\x87\xe6\xca\x2b\x85\xaf\x55\x2b\
-\x25\xd0\x34\xbc\x44\x12\x3f\x92\xdc\xfb\xc0\x2f\x3b\x46\xfe\xac\
-\x9a\xb0\xc1\xb9\xed\xdd\x95\xe5\xfa\xbd\xdd\xdc\xb0\xb7\x9b\x1b\
-\xf6\xf6\x70\xc3\xde\x1e\x2e\xed\x4f\x75\x1c\xb7\xa6\xfa\xcd\xa6\
-\x6d\xe8\x48\x25\x19\x1a\x1a\x24\x9d\xc9\x92\x4a\xa7\x41\x09\x56\
-\x4b\x45\xa6\x27\x4f\x7d\xa7\x30\x3f\xbf\x00\xd4\xd9\x82\x99\x61\
-\xb3\xad\x1f\x0e\x1d\x7e\xec\x0b\xe9\x6c\xfe\x3d\x5e\x32\x95\x73\
-\x5c\x8f\x64\x2a\xc3\x81\xc1\x63\xec\xbd\x6a\x27\xd7\xef\xdf\x1d\
-\x3f\x5f\x9b\x8e\xaa\xf6\xca\x65\x6d\x27\xfc\xfd\x07\x6e\x5a\x8f\
-\xf3\x6d\xf1\xbe\x5d\x09\xa2\x08\x44\x5b\x9c\x6f\x5d\xaa\xd5\x7f\
-\x66\xf4\x04\xbe\x5f\xa5\xb7\x7f\x00\xcb\xb2\x28\x2c\x16\x28\xad\
-\x2c\x2f\x3d\xf0\xc3\x7b\xbe\x05\x94\xd8\x02\xf5\x87\xce\x42\x42\
-\x1e\x7b\xe2\x37\xd3\xcb\x0b\xd3\x9f\x2c\xaf\x2c\x23\xa5\xc0\x4d\
-\x24\x49\xa6\xb3\x7c\xf3\x9e\xfb\x99\x98\x99\xeb\xcc\xd2\x38\x73\
-\xe4\x5b\xd2\xac\xc5\x71\x3a\x43\x5a\xeb\x10\x21\xe3\x79\x81\x8d\
-\xbf\xb7\xda\xec\xec\x34\xe3\xe3\x27\xe9\xee\xe9\x25\x91\x48\x10\
-\x34\xea\xac\x14\x16\x19\x7d\xfa\xf8\x17\x67\x66\x26\xa6\x81\x2a\
-\x17\x63\x5d\x00\x90\x27\x8e\x1c\x7a\x7a\xf7\xfe\x1b\x5e\x61\xd9\
-\xce\x2e\xd7\x4d\x60\x59\x36\x91\x88\x78\xfc\xf0\x71\x5e\x76\xe5\
-\xe5\x64\x33\xa9\x33\xaf\xa2\x9d\x45\x11\xda\x86\xb5\xfd\x49\x45\
-\xd3\xee\x5b\x59\x64\x6b\x6b\x65\x80\xb3\x73\x33\x1c\x39\x7a\x88\
-\x6d\x3d\x3d\x64\xb2\x39\x94\x14\x2c\xcc\x4d\x33\x75\x7a\xf4\xa1\
-\x7f\xff\xe2\xa7\x3f\x0f\xcc\x13\xab\xff\x96\xb4\xb3\x4d\x2a\x46\
-\x7e\x43\x3c\xda\xd3\xdf\xff\x76\xdb\x71\x32\x8e\xeb\x61\xd9\x36\
-\x41\x18\x72\xe0\xd0\x53\xf4\xf7\x75\xd3\xdf\xd3\xd5\x71\x42\xbb\
-\xf0\xea\x1c\x7d\x80\x48\xc5\x69\xaf\x62\xdd\x2c\xd6\x8f\x53\x8c\
-\x9d\x1a\xe3\xf8\xd0\x53\x6c\xeb\xe9\x21\x97\xef\x42\x29\xc5\xd3\
-\x43\xc7\x39\x35\xfa\x6c\xe3\x07\xff\xf5\xf5\x0f\xad\x14\x96\x4e\
-\x01\x65\x2e\xd6\xd2\x58\xb3\xc9\xe5\x85\xc9\x55\x2f\x91\x79\x22\
-\x95\xcd\xbd\xc3\xb2\x6c\xc7\x71\xe3\x97\x9f\x84\x54\x1c\x1c\x3c\
-\xca\x6a\xad\xc6\x55\x3b\x2f\xc3\x34\x36\x9c\xae\x75\xfa\x85\x76\
-\x00\x91\x8c\x43\x9e\x3a\xcb\xc8\xfb\xbe\xcf\xe0\x93\x87\x98\x9a\
-\x99\xa0\xa7\xb7\x8f\x6c\x2e\x8f\x92\x8a\xa7\x9e\x3c\x4c\x4f\x4a\
-\x63\xd7\xd5\x7b\x4d\x3b\x77\xd9\xa5\x13\xc3\x27\xbe\x57\xab\x95\
-\x56\xd9\x22\xf5\x3f\x17\x00\x00\x39\x79\xea\xe4\x7c\x36\xbf\xed\
-\x88\xeb\x25\xdf\x62\x5a\x96\xd3\x5a\x9d\x31\x4c\x93\x53\xa7\xa7\
-\x78\xf4\x89\xa3\x78\xae\xcb\x40\x5f\x37\xba\xbe\xae\x03\xaa\xed\
-\xd1\x5a\x23\x1d\x8a\x66\xb6\x47\x27\x80\x48\x08\x46\x9e\x1d\xe5\
-\xd0\xe1\x43\x28\xa0\xa7\xb7\x9f\x54\x3a\x83\x92\x82\x83\x07\x0f\
-\x32\x72\x62\x88\x9d\x57\x5c\xc5\xef\xdd\x72\x3d\x5e\x32\xbd\x2b\
-\xd1\xbb\xf3\xda\xe9\xd1\xb1\x9f\xec\xde\x7d\xb9\x7d\xfd\xf5\xd7\
-\xf7\x3f\xf3\xcc\x33\x95\xcd\xc2\x78\xae\x79\xf5\x68\xfc\x99\xa7\
-\xa7\x92\xc9\xc4\x63\x6e\x22\xf5\x46\x5d\x37\xd2\x2d\x08\xb6\xed\
-\x12\x46\x82\xa7\x86\x4e\xf2\xe8\xe0\x31\x1a\x7e\x40\x36\x93\x22\
-\xe1\xb9\xb4\x8c\xbe\x39\x4d\x78\xc6\xa8\x4b\xa5\x28\x14\x57\x78\
-\xfa\xe4\x49\x9e\x78\x72\x90\x52\xa5\x4c\xae\x6b\x1b\x5d\xdd\xdd\
-\xb8\x9e\x47\xe0\x37\x38\xf5\xec\x28\xbf\x78\xf0\x41\xbc\x74\x17\
-\x02\x03\x3f\x08\x78\xe5\x75\xbb\x71\x12\xc9\x2b\xad\x4c\xf7\x4d\
-\xb2\xb6\xf4\xf1\xae\xae\xae\x0f\x5d\x71\xc5\x15\x0f\x0f\x0f\x0f\
-\xcf\xb1\x09\x93\x78\xbe\x85\x85\x68\x62\x6c\x64\xae\x1e\x36\x1e\
-\xc8\x64\xf2\xd7\x2a\x25\x2f\x6b\x4d\x4b\xdb\x8e\x8b\xeb\x7a\x48\
-\x05\xa7\x26\x67\x79\xe4\xd0\x53\x0c\x1e\x3b\xc9\xe4\xcc\x3c\x0b\
-\xcb\x45\x16\x8b\x25\x0a\x2b\x15\x96\x0a\x45\x66\xe6\x17\x38\x35\
-\x31\xc5\xd3\x23\x23\x0c\x1e\x39\xca\xe8\xa9\x53\x04\x61\x44\x36\
-\xdf\x45\x57\x77\x37\xa9\x54\x1a\x5d\xd3\xa8\x94\x8a\xcc\x4f\x4f\
-\x32\x33\x31\x76\x70\x6a\x7e\xa5\xa0\x34\xbd\x4f\x08\x49\xad\x11\
-\xe0\x07\x01\x37\x5f\x7b\x15\xe3\x27\x8f\xec\x9a\x9d\x9e\xcc\x49\
-\x29\x13\x99\x4c\xe6\xed\x3b\x76\xec\x78\x78\x64\x64\x64\xf6\x42\
-\x21\xbc\x90\x95\x95\x68\x69\x76\x6a\xe5\x99\xe3\x83\xf7\xf5\x6c\
-\xbf\xa4\xa1\x14\xd7\x4b\x25\x6d\xdb\xb6\x71\x3d\x8f\x64\x32\x45\
-\x2a\x95\x22\x99\xce\xa0\x19\x26\xe5\x6a\x9d\xd9\x85\x02\x93\x33\
-\xf3\x8c\x4f\xcf\x32\x39\x33\xc7\xfc\x52\x81\x72\xb5\x86\x42\x23\
-\x95\xce\xd2\xd5\xdd\x43\x2e\x9f\x27\x91\x4c\x62\x18\x3a\xf5\xda\
-\x2a\x8b\xf3\x33\xcc\x4d\x4d\x54\x8e\x1d\x7e\xfc\x8e\x3b\x3e\xfd\
-\x0f\x9f\x29\x2c\x2c\xfc\x68\xe0\xf2\xdd\x37\x06\x51\x38\x20\x84\
-\xc4\x0f\x23\xb6\x77\x25\x38\x74\xe0\x61\x9e\x7d\xf6\x59\x54\x6c\
-\x6b\x89\x5c\x2e\xf7\xb6\xcd\x40\x78\xa1\x4b\x4b\x51\x14\x45\xf5\
-\xe1\xa3\x83\x83\xb5\xca\xea\x4f\xd2\x99\x54\x46\x4a\x79\x35\x4a\
-\x1a\xa6\x69\xe2\x38\x0e\x9e\xe7\x91\x4c\xa4\x48\xa6\x52\xa4\x33\
-\x59\xd2\xd9\x2c\x99\x6c\x8e\x4c\x2e\x4f\x36\x9b\x23\x93\xcd\x91\
-\x4a\xa7\xf1\x12\x09\x2c\xd3\x44\x49\x41\xb5\x52\x66\x69\x61\x8e\
-\xf9\x99\x29\x7f\x6c\x78\xe8\x07\xdf\xfd\xda\xbf\x7d\xec\x81\xfb\
-\x7f\xf8\x0b\x60\xd6\xaf\x95\x16\x4a\xc5\xf2\xcf\xfa\x2e\xd9\xf9\
-\xaa\x6c\x26\x39\xf0\x97\xef\xbe\x95\xc1\x83\x8f\xf0\xe8\xa3\x8f\
-\x52\xad\x56\x11\x42\x6c\x09\x84\x8d\xe1\xfb\xf9\x9a\x0e\xb8\x40\
-\x66\xdf\x75\x37\x5e\x79\xdd\x4d\xaf\xf9\xd3\xee\xfe\xed\x6f\x4d\
-\xa6\x32\x97\x25\x53\x69\x12\x89\x24\x6e\xf3\x75\x59\xcb\xb2\xe2\
-\xe9\x6b\x23\x7e\x73\x0c\xa5\x90\x52\x10\x05\x3e\x7e\xa3\x4e\xbd\
-\x56\x65\xb5\x52\x9a\x98\x9e\x18\xbf\xff\xc1\x9f\x7e\xff\x7b\xc3\
-\x43\x43\x13\x40\x91\x38\xcc\xf9\x4d\x41\x9c\x5f\x3d\xfc\xc8\xfb\
-\x5f\xbe\xf7\x65\xff\x7a\x72\xf8\x44\xec\x18\x47\x46\x38\x7d\xfa\
-\x34\x85\x42\x01\xd3\x34\x49\x26\x93\xa4\xd3\x69\xd2\xe9\xf4\x72\
-\xa1\x50\x78\xdb\xbd\xf7\xde\x7b\x90\xf3\x78\x77\xe0\x7c\x01\xb4\
-\x9a\x01\x38\x40\x0a\x48\xbf\xfe\x8f\xde\x7a\xdd\x8e\x5d\x57\xbd\
-\x3a\x93\xcb\x5f\xe7\x25\x33\x57\x24\x13\x89\x01\xdd\xb4\x6c\xd3\
-\x30\xd0\x75\x9d\xd8\x2b\x4a\xdf\xf7\x1b\x33\xb5\xea\xea\x58\x69\
-\x79\xe1\xd8\x89\x63\x4f\x3e\xf6\xcb\x07\x1f\x18\x26\xae\xea\xca\
-\xc4\xd9\x9d\x4f\xe7\x22\x87\x7e\xf7\xdd\x77\x1f\x39\x7d\xfa\xf4\
-\xfe\x3d\x7b\xf6\xa0\x69\x1a\xc3\xc3\xc3\x5b\x0a\xe1\x42\x01\xac\
-\x3d\x20\xf1\xe2\x84\x43\xac\x19\x5e\xb3\x6f\x5f\x79\xe5\x95\xe9\
-\x44\x22\x93\xc0\x50\x5a\xa9\x50\xa8\x4f\x4c\x4c\xac\x36\x1f\x2a\
-\x68\x0a\xda\x68\x6e\x3e\x71\x5e\x7f\x36\xd5\xd5\xdf\xfc\xe6\x37\
-\xff\x71\x5f\x5f\xdf\x77\xf6\xec\xd9\xe3\x5d\x73\xcd\x35\x5b\x0e\
-\x61\xb3\xcb\xcb\x8a\x78\xc4\x7c\xe2\xf4\xb4\x0a\x54\x80\x52\xb1\
-\x58\x5c\x5c\x58\x98\x9b\x5d\x98\x9b\x9b\x29\x95\x4a\x0b\x40\x81\
-\x58\xc5\x57\x88\x8b\x99\x6a\x13\xc0\x73\x4e\x6c\x8e\x8e\x8e\x4e\
-\xe6\xf3\xf9\x93\x51\x14\xdd\x2a\x84\xb0\x7a\x7b\x7b\xe9\xe9\xe9\
-\x41\x29\x85\x10\x62\xed\x75\xdd\x0b\xf5\x09\x9b\x5e\x5f\x6f\x6b\
-\xaa\x79\xb3\x88\x78\x44\x5b\x23\x1d\x10\x0b\x1a\x34\xf7\x47\x9c\
-\xdf\x74\xb6\x18\x1f\x1f\x1f\xbf\x58\x10\xb6\x12\xc0\xc5\x6a\x0a\
-\x88\xc6\xc7\xc7\x4f\x5d\x0c\x08\x2f\x06\x00\x70\x11\x21\xbc\x58\
-\x00\xc0\x45\x82\xf0\x62\x02\x00\x9b\x84\x90\x4e\xa7\x1f\x9e\x98\
-\x98\xe8\x80\xf0\x62\x03\x00\x9b\x80\x60\x9a\xe6\xdb\x74\x5d\xbf\
-\x6f\x79\x79\x79\xb9\x79\x9d\x17\x25\x00\xb8\x40\x08\xd5\x6a\x35\
-\x61\x59\x56\x65\x7a\x7a\xfa\x11\x9a\x73\x8a\x2f\x56\x00\x70\x9e\
-\x10\x1a\x8d\x06\xa5\x52\x09\xcb\xb2\x7e\x3d\x33\x33\x73\x90\x38\
-\x44\xbf\xa8\x01\xc0\x0b\x84\x50\xab\xd5\x98\x9d\x9d\x45\xd3\xb4\
-\x42\xa1\x50\xf8\x54\xb9\x5c\x9e\xe1\x25\x02\x00\x9e\x07\x42\xa1\
-\x50\xe0\xf4\xe9\xd3\x04\x41\x10\x54\xab\xd5\x8f\x4f\x4e\x4e\x3e\
-\x4e\x9c\x8d\x0a\x78\x69\x00\x80\x0d\x10\xea\xf5\xfa\xad\xd5\x6a\
-\xd5\x2a\x14\x0a\x2c\x2d\x2d\x11\x45\x51\x71\x6a\x6a\xea\x63\xe3\
-\xe3\xe3\x0f\x00\x0b\xc4\x99\x29\xf0\xd2\x01\x00\x6d\x10\x7c\xdf\
-\x1f\x9a\x9b\x9b\xfb\x9d\x52\xa9\x54\x97\x52\xfe\xf8\xc0\x81\x03\
-\x9f\x18\x1f\x1f\x7f\x9c\x78\x4a\xbd\xe3\xbf\x47\x9b\xad\x06\x7f\
-\x1b\x9b\x0e\x24\x80\x7c\xf3\x33\x22\x2e\xd0\x5a\xf3\x0c\x1d\x35\
-\xc8\x4b\x11\x00\xc4\x72\x99\xc4\x1a\xae\x88\x21\x5c\xf0\xcb\x94\
-\x2f\xe9\xf6\xbf\xcc\x2e\x7e\xbd\xae\x28\x02\xa3\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\x76\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x03\x00\x00\x00\x44\xa4\x8a\xc6\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\x00\x00\xfa\
-\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\x00\x00\x3a\
-\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x02\x16\x50\x4c\x54\
-\x45\x00\x00\x00\x3b\x46\x52\x3c\x46\x53\x38\x47\x51\x3b\x45\x51\
-\x2b\x79\xc2\x2b\x7a\xc3\x2a\x78\xc3\x2b\x79\xc1\x3b\x46\x52\x3b\
-\x47\x53\x3b\x47\x53\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\
-\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\
-\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\
-\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\
-\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\
-\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\
-\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\
-\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\
-\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\
-\x46\x52\x3b\x46\x52\x3b\x46\x52\x3c\x46\x52\x3b\x46\x52\x3b\x46\
-\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\
-\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\
-\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\
-\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\
-\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\
-\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\
-\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\
-\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\
-\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\
-\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\
-\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\
-\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x46\x52\x3b\x45\
-\x51\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\
-\x2b\x79\xc3\x2b\x79\xc3\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\
-\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\
-\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\
-\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\
-\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\
-\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\
-\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\
-\x79\xc2\x2b\x78\xc2\x2b\x79\xc2\x2b\x79\xc2\x2b\x79\xc2\x3b\x46\
-\x52\x2b\x79\xc2\xff\xff\xff\xd0\xaf\x43\x21\x00\x00\x00\xaf\x74\
-\x52\x4e\x53\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x19\x1a\x12\
-\x9e\xd5\xd4\x9d\x3b\xf4\xfe\xf0\xf7\x3f\xee\xdd\xe6\xed\xe4\xfd\
-\xba\x34\x5c\xeb\xf8\x47\x74\x97\x49\x68\x70\x0c\xc5\xfa\xf6\xf5\
-\xe8\xe9\xc1\x6c\x3a\xf3\xfb\x10\x95\xc2\xc0\xbf\xda\x91\x03\x06\
-\x01\x6e\x17\x31\x32\x2e\x87\x1b\xef\x3e\xe5\xdc\xcb\xd9\xc8\xf9\
-\xa2\x15\xe0\xa6\x57\x81\xa1\x59\x75\x0e\xfc\xd7\x73\x93\x35\x98\
-\x96\x94\x6b\x01\x2f\x52\x53\x50\x9b\x25\xd8\xb1\x90\xaa\xa5\x8c\
-\x04\x22\xb9\x79\x99\xb2\x7b\xf2\x7e\xcf\xb3\x2d\xe7\x4c\x6a\x69\
-\x66\xa8\x3e\x40\x90\x55\x04\x1a\x7d\x7b\x19\x57\x3f\x1e\xd4\xed\
-\x6d\x4a\x4c\x89\x83\x6e\xee\xd3\x1d\x2c\xe8\xfa\xa9\x8e\x8f\x3c\
-\x9d\x9b\xaa\xe7\x2b\x05\x73\xc8\x8c\x10\xb7\x39\x11\xc7\x04\x03\
-\x0f\x0b\x81\xdf\xc3\xdf\x00\x00\x00\x01\x62\x4b\x47\x44\xb1\x34\
-\x63\x9e\x52\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\
-\x00\x0e\xc4\x01\x95\x2b\x0e\x1b\x00\x00\x01\xf6\x49\x44\x41\x54\
-\x38\xcb\x63\x60\x00\x02\x46\x4e\x2e\x6e\x0c\xc0\xc5\xc9\xc8\x00\
-\x05\x8c\x3c\xbc\x7c\xfc\x68\x80\x8f\x8f\x4f\x80\x07\xa6\x82\x51\
-\x50\x68\x3d\x1a\x10\x16\x11\x5d\x2f\x24\x08\x57\x20\x26\x2a\x2e\
-\x21\x29\x25\x21\x2d\x03\x57\x20\x2b\x27\xaf\xa0\x28\x86\x50\xa0\
-\x28\xa0\xa4\xac\xa2\xaa\x26\x0e\x57\xa0\xce\xa8\xa1\xa9\x85\xa4\
-\x40\x5b\x47\x57\x44\x47\x4f\x0a\x61\x82\xbe\xaa\x81\x94\x28\x42\
-\x81\xa1\x11\xba\x1b\xd6\x1b\xcb\xac\x37\x32\x84\x2b\x30\x31\x35\
-\x33\x87\x00\x0b\x4b\x4b\x0b\x28\xd3\xcc\xca\x04\xee\x4f\x26\x6b\
-\x1b\x28\xb0\xb5\xb3\xb3\x85\xb1\xad\x11\xe1\xc0\x6c\xef\xe0\xe8\
-\x00\x06\x4e\xce\xce\x4e\x10\x96\xa3\x83\x3d\x33\xdc\x0a\x17\x0b\
-\x57\x71\x08\x90\xd2\xd1\x91\x02\x33\x44\x5c\x5d\x2d\x5c\xe0\x0a\
-\xdc\x74\x30\xdc\xc8\xef\xbe\x5e\xc7\x0d\x29\xa0\x3c\x64\x3d\xbd\
-\x64\xbd\x7d\xe0\x0a\x7c\xfd\x04\xfd\x51\x02\x2a\x20\x30\x28\x38\
-\x24\xd4\x15\xae\x40\x99\x31\xcc\x1b\x25\xa0\x84\x8d\x65\x84\x8d\
-\xc3\x11\x56\x44\x44\x46\x69\x23\x05\x54\xb4\xeb\x7a\x2c\xc0\x35\
-\x1a\xae\x80\x53\x3d\x26\x16\x02\xe2\xcc\xcc\xe2\xa0\xcc\x18\x03\
-\x44\x82\x40\x00\xc6\xf8\x78\x6c\xa2\x09\x89\x49\xc9\x10\x90\x92\
-\x9a\x9a\x02\x65\x26\x39\x25\xc0\xad\x48\x4b\x97\x31\x86\x02\x19\
-\x08\x2b\x7c\xbd\xb0\x4c\x7a\x1a\x92\x2f\xd0\x1d\x68\x94\xe1\xb9\
-\x5e\x1b\xc9\x9b\xa2\x9a\x99\x59\xe6\x56\xd9\x88\x00\xcd\xc9\xcd\
-\xe3\xf3\x41\x56\x90\x5f\x50\x58\x54\x6c\x55\x02\x57\x50\xca\xe8\
-\x57\x86\xac\x00\xc3\x0a\xc9\xd4\x72\x63\x24\x2b\x2a\x2a\xb1\x05\
-\x54\x65\x05\x5c\x41\x6e\x55\x75\x0d\x04\xd4\xd6\xd5\xd5\x42\x99\
-\xd5\x55\xb9\x58\x82\x84\xa5\xbe\x9e\x05\x53\x94\x95\xad\xa1\xb1\
-\xa9\x99\x15\xc4\x6a\x69\x6d\x6b\x07\x33\x9a\x3b\x1a\x3b\xd9\x59\
-\x61\x0a\xba\xba\x37\xf4\xf4\xf6\xf5\xf7\xf7\x77\x4d\xd8\xb0\x61\
-\x62\x17\x90\xd1\x37\x69\xf2\x86\x29\x53\xe1\x0a\xa6\x4d\xdf\x30\
-\x63\xe6\xac\xd9\xb3\x1b\xe7\xcc\xdd\xb0\x61\xde\x9c\xc6\xd9\xb3\
-\x67\xcd\x9f\xb1\x61\xc1\x42\xb8\x82\x45\x8b\x97\x2c\x5d\x06\x36\
-\x79\xce\xf2\xe5\x2b\xc0\x8c\x95\xb3\x56\xf5\xae\x66\x85\x3b\x62\
-\xcd\xda\x45\x60\x0e\x2b\xc7\xba\x75\x1c\x10\xd6\xa2\xb5\x6b\xc0\
-\x0c\x00\xef\x67\x12\x91\x06\x64\x47\xe9\x00\x00\x00\x25\x74\x45\
-\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\
-\x31\x38\x2d\x31\x32\x2d\x31\x39\x54\x31\x38\x3a\x32\x32\x3a\x34\
-\x38\x2b\x30\x31\x3a\x30\x30\x1c\xb8\xfd\xfa\x00\x00\x00\x25\x74\
-\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\
-\x30\x31\x38\x2d\x31\x32\x2d\x31\x39\x54\x31\x38\x3a\x32\x32\x3a\
-\x34\x38\x2b\x30\x31\x3a\x30\x30\x6d\xe5\x45\x46\x00\x00\x00\x46\
-\x74\x45\x58\x74\x73\x6f\x66\x74\x77\x61\x72\x65\x00\x49\x6d\x61\
-\x67\x65\x4d\x61\x67\x69\x63\x6b\x20\x36\x2e\x37\x2e\x38\x2d\x39\
-\x20\x32\x30\x31\x36\x2d\x30\x36\x2d\x31\x36\x20\x51\x31\x36\x20\
-\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\x67\x65\
-\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\xe6\xbf\x34\xb6\x00\x00\
-\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\
-\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\x00\x35\
-\x31\x32\xc0\xd0\x50\x51\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\
-\x68\x00\x35\x31\x32\x1c\x7c\x03\xdc\x00\x00\x00\x19\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\
-\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\
-\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\
-\x6d\x65\x00\x31\x35\x34\x35\x32\x34\x30\x31\x36\x38\x0c\xfb\x20\
-\xb3\x00\x00\x00\x13\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x53\x69\x7a\x65\x00\x31\x34\x2e\x35\x4b\x42\x42\x3e\x22\x78\x9d\
-\x00\x00\x00\x6d\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\
-\x52\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2e\x2f\x75\x70\x6c\x6f\
-\x61\x64\x73\x2f\x35\x36\x2f\x51\x6e\x57\x4e\x50\x6d\x30\x2f\x31\
-\x37\x33\x38\x2f\x69\x63\x6f\x6e\x66\x69\x6e\x64\x65\x72\x2d\x74\
-\x65\x63\x68\x6e\x6f\x6c\x6f\x67\x79\x6d\x61\x63\x68\x69\x6e\x65\
-\x65\x6c\x65\x63\x74\x72\x6f\x6e\x69\x63\x64\x65\x76\x69\x63\x65\
-\x32\x39\x2d\x34\x30\x32\x36\x34\x33\x31\x5f\x31\x31\x33\x33\x33\
-\x37\x2e\x70\x6e\x67\x7c\xed\x9b\x1c\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x10\xdc\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x10\x7e\x49\x44\x41\x54\x78\x9c\xd5\
-\x9b\x6b\x70\x5d\x57\x75\xc7\x7f\x6b\xef\xf3\xb8\x47\xf7\x5e\x29\
-\x92\x1d\x2b\xb2\x1d\x07\x27\x76\x5e\x38\x69\x4c\x9a\x04\xf2\x82\
-\x4c\x0a\x03\x69\x4a\x21\xa5\x94\xd2\xe9\xb4\x9f\x79\x4c\x1f\xc3\
-\x87\x0e\x9d\xe9\x83\x69\xa1\x7c\xe8\x93\xf2\x01\xfa\x98\x61\x68\
-\x19\x4a\x03\xc5\x94\x26\x19\x30\x8f\x66\x02\x4d\x62\xe2\x3c\x9c\
-\xa7\x1d\x27\x8e\x1c\x4b\xb6\x6c\xe9\x4a\x57\xba\xba\xf7\xdc\x73\
-\xf6\x5e\xfd\x70\xee\xd5\xcb\xb2\x2c\x81\x2d\x87\x35\x5e\x23\x59\
-\xe7\xec\x7d\xd6\x5a\xfb\xbf\xd6\x5e\x6b\x3f\x84\xb5\x51\xd0\x61\
-\x33\x30\x30\x10\xa8\xaa\x78\xef\x65\x8d\x7d\x9c\x53\x32\xc6\xa8\
-\x88\xe8\xc4\xc4\x44\x0e\x78\x20\xef\xf0\xaa\x68\x35\xc2\x0b\x10\
-\x0d\x0c\x0c\xc4\x79\x9e\x07\x49\x92\x04\x61\x18\x86\xde\x7b\xa3\
-\xaa\xa2\xaa\x17\xd4\x00\x22\xa2\x22\xa2\xc6\x18\x9f\x65\x59\xd6\
-\x6c\x36\xf3\x20\x08\xf2\x89\x89\x89\x14\x68\x03\xba\x62\xfb\xb3\
-\xf4\x1f\x0d\x0c\x0c\x94\xe2\x38\x8e\xac\xb5\x71\x96\x65\xa1\x73\
-\x2e\x0c\xc3\xd0\x7a\xef\x6d\x18\x86\x66\xdb\x9b\x6f\xa8\xf4\x0d\
-\x6d\x4d\x0a\x60\xac\x27\xe5\x4c\x8d\xbe\xde\x1c\x7e\xee\xa9\x99\
-\x2c\xcb\xbc\x31\xc6\x65\x59\xe6\xac\xb5\x59\x18\x86\x99\x73\x2e\
-\x4d\xd3\xb4\x3d\x31\x31\xd1\xa2\x30\xc4\xb2\xb4\x92\xd4\x49\x6f\
-\x6f\x6f\x22\x22\x25\xef\x7d\x2c\x22\x11\x10\xde\xf7\x89\x4f\x5d\
-\x7f\xc5\x2d\xb7\xbe\xab\x32\x70\xf1\x8d\x51\x54\xba\x42\x8c\x49\
-\xce\xb9\x6e\x6b\x20\xf5\xbe\xd9\x6e\xb7\x0e\xcf\x4c\x9c\x7c\xe2\
-\xf0\x63\x3f\xfe\xce\x9e\xbf\xfd\xf3\x67\xbc\xf7\x99\xf7\x3e\x12\
-\x91\xb4\xb7\xb7\x37\xa8\xd7\xeb\x4d\xa0\xb9\x5c\xfb\xe5\x10\x20\
-\x40\xcf\xd0\xd0\x50\x62\x8c\x29\xa5\x69\x9a\x58\x6b\xe3\x0f\x7d\
-\xea\xef\x6f\xdb\x79\xd3\xed\x1f\x8d\x7a\xca\xd7\x9d\x57\x8d\x7e\
-\x46\x6a\xcf\x36\x0e\x1c\xda\xf7\xc8\xe7\xbf\xfa\x27\xbf\xf7\x23\
-\xe7\x5c\x1a\xc7\x71\xd3\x7b\xdf\x1a\x1d\x1d\x6d\x02\xb3\x2c\x71\
-\x89\xe5\x0c\xd0\x33\x34\x34\xd4\x23\x22\x09\xd0\x73\xc9\xce\x6b\
-\xfb\x3f\xfc\x97\x9f\xff\x64\x65\x60\xe3\xbd\x20\x17\xd4\xdf\x57\
-\x4f\xaa\x33\x13\xa7\xbe\xfd\x95\x3f\xfe\xe8\xa7\x8f\x1f\x7a\xbe\
-\x06\xcc\xaa\x6a\x73\x74\x74\x74\x96\xc2\x08\x73\x64\x97\xb4\x8c\
-\x7b\x7b\x7b\x7b\xe2\x38\xee\x01\x7a\xae\xbd\xeb\xde\xad\xbf\xfe\
-\xa7\x7f\xf3\x4f\xa5\x4a\xef\xad\xaa\x88\xaa\xf2\xf3\xc1\x48\x58\
-\xea\xb9\x6a\xd7\xdd\xbf\x7c\x47\xed\xf8\xf1\x47\x4e\x1e\x39\xd8\
-\x14\x11\x44\x44\xd3\x34\xf5\x80\x5b\xce\x00\xa6\xbf\xbf\xbf\x5c\
-\xad\x56\xcb\x69\x9a\x26\x3b\x6e\xba\x73\xd3\xfb\xfe\xe8\x33\xff\
-\x1c\xc4\xc9\x95\xaa\xf0\xf3\xc8\xc6\x86\x1b\x77\xdc\x74\xdb\xad\
-\xa3\x07\x9f\xff\xee\xd8\x6b\x87\xd3\x72\xb9\x8c\xb5\xd6\xb7\x5a\
-\xad\x8c\x8e\x2b\x2c\x84\x74\x32\x38\x38\x58\x55\xd5\x4a\x18\x86\
-\x95\x8f\x7f\xf5\x87\x9f\x4b\xaa\x17\xdd\xb9\x22\xd0\xba\xbd\x5c\
-\x40\x12\xce\x3e\x95\x35\xa7\x27\x1f\xfe\xdc\x87\xde\xf1\xf1\x2c\
-\xcb\x66\x44\x64\xe6\xc4\x89\x13\xd3\x74\x82\x62\x17\x01\xa6\xaf\
-\xaf\xaf\x5c\x2a\x95\x12\x11\x49\x7e\xf3\xb3\xff\xfa\x6b\x03\x5b\
-\xb7\xff\x6e\x57\xc1\x2e\x7b\xc0\x29\xe4\x1e\x32\xaf\xe4\x5e\x71\
-\x17\x98\xf3\x0e\x7b\x5d\x3c\x18\x0b\xe5\x0e\xa2\xd2\x65\xdb\xae\
-\xbf\xf9\xf8\x73\xdf\xfb\xd6\x8b\xd6\x5a\x67\x8c\xf1\x69\x9a\xb6\
-\x01\xed\x4e\x83\x61\x92\x24\x61\x96\x65\x51\xff\x96\xcb\x2a\x83\
-\x57\xee\xfa\x98\xf7\x8b\x3b\xf3\xaa\xb8\x05\x7f\x7b\xa3\x91\x43\
-\xe7\x1c\xdb\x1a\x30\x22\x8b\x90\x31\x78\xe5\xae\x8f\xf5\x5e\xb2\
-\xf5\x81\xda\xb1\xd7\xda\x49\x92\x84\x53\x53\x53\x21\x90\x76\x11\
-\x50\x8a\xe3\xb8\x27\x8a\xa2\xe4\xbd\x9f\xfc\xbb\xf7\xf5\x0e\x6e\
-\xbd\xb7\xeb\x47\x5e\x21\x77\x8a\xd3\xc5\x56\x7d\x23\xb3\x57\xf0\
-\x1d\x48\x28\x85\x1e\x88\x2d\x6f\xda\x7e\xf5\xeb\x2f\xfe\xf0\xdb\
-\x2f\xb6\xdb\xed\xbc\xd9\x6c\x66\x40\x16\x00\xf4\xf7\xf7\x07\x71\
-\x1c\x5b\xe7\x5c\x30\xb0\x6d\xc7\x3d\xde\x17\x60\x52\x20\xf7\x17\
-\xc6\xcb\x05\x90\x05\xb3\xae\x2a\xe8\x1a\x23\x8e\x43\x09\xcc\x3c\
-\x12\x06\xb6\xed\xb8\xc7\x39\xf7\x8d\x38\x8e\x6d\x7f\x7f\x7f\x50\
-\xab\xd5\x8a\xc2\xc6\x7b\x6f\x9c\x73\xf6\xa2\xcd\xdb\x92\x20\x29\
-\xef\x76\x1d\xb3\x75\x47\x7d\x3d\xc9\x0a\x84\x46\x08\x8c\x60\x64\
-\x3e\xc0\x75\x63\x4f\xee\xd7\x26\x57\xe6\x14\x5b\x58\x93\x20\x29\
-\xef\xbe\x68\xf3\xb6\x64\x72\x64\xb8\xe1\xbd\x37\x80\x31\x40\xb7\
-\xa0\x91\x5d\xef\xfe\xe0\xe5\xaa\x12\x7b\xa7\x64\x4e\xf1\x5e\xd1\
-\x75\x62\xbc\x12\x0a\xf4\x04\x86\x72\x60\xa8\x84\x86\x6a\x68\xa8\
-\x86\x96\x4a\x68\xe6\xb8\x27\x30\x84\x46\x40\x57\xd7\xaf\xf7\x1d\
-\x5d\x9c\xa2\x2a\xf1\xae\x77\x7f\xf0\xf2\x85\x3a\x07\x00\x95\x4a\
-\x45\xb2\x2c\x33\xbd\x97\x5c\xba\xd9\x79\x9d\xf7\x9b\x75\x22\x11\
-\x88\xad\x90\x04\x86\x52\x60\x88\xad\x10\x19\xc1\x1a\x29\x72\x4f\
-\x85\x5c\x0b\x45\x02\x51\x0c\x1e\x51\xa1\x95\x17\xd1\x7f\x35\xa4\
-\xa2\x08\xd0\x7b\xc9\x65\x9b\xbd\xf7\xa6\x52\xa9\x48\xbd\x5e\x5f\
-\x5c\x0c\xd9\x30\xe9\xf1\xba\xfa\x4e\xcf\x15\x95\x8c\x50\x0a\x84\
-\xc4\x0a\x3d\x81\x10\x07\x86\xb8\xe3\x06\x22\xf3\xb1\xa8\x6d\x94\
-\x40\x3c\x82\x41\xb5\x98\x06\x5b\xf9\x2a\x23\x83\x82\x11\xb0\x61\
-\xdc\xb3\xf0\xcf\x8b\x0c\xe0\x11\xe3\xdc\xfa\x6a\x6f\x4d\x31\xda\
-\xb1\x29\x46\x3f\xe9\x70\x29\x10\xc2\xae\x01\xb4\xc8\x3b\x52\xa3\
-\x18\x40\xd5\xe3\xbd\x21\x77\x4a\x1b\x5d\x75\xa0\x76\x14\x3a\x2e\
-\xfc\xdb\x22\x03\x38\xaf\xb2\xde\xa3\x1f\x77\x82\x5e\x64\x85\x92\
-\x15\x4a\xd6\xd0\x13\x16\x46\x88\x6d\x11\x08\xbd\x42\xdb\x29\x56\
-\x3c\x28\x38\xaf\x64\x4e\xe6\x82\x65\xe6\x56\x3f\x3f\x38\xbf\x78\
-\x01\x67\xf1\x7a\x80\xf7\xf8\x75\xb4\x80\x11\xb0\x52\xc0\xbf\xbf\
-\x64\xd9\x90\x04\x5c\x54\xb2\x94\xc3\x02\x0d\xaf\xbc\xf4\x02\xdf\
-\xfc\xc6\xfd\xdc\x7a\xd7\x2f\x71\xcd\xee\x9b\x01\xc5\x79\xa1\x6d\
-\x85\xd0\x40\x20\x52\x44\xf8\xb5\xb8\xad\x5f\x9c\xcd\x05\x4b\x9f\
-\xe9\x3a\x19\xc0\x7b\xc7\xee\x2d\x55\xbc\xc2\x60\x39\xa0\x27\xec\
-\x8e\x7c\x17\x09\xc2\x17\xfe\xe1\xaf\x79\xe9\x85\xe7\x79\xf4\xe1\
-\xef\xf3\xf9\x7f\xfb\x3a\x71\xd2\x4b\x6a\x94\x40\x04\x23\x05\x3a\
-\x0c\x14\x09\xcf\x2a\xe5\x5e\xa2\x3f\xe6\xb4\x17\xf4\xfc\x33\xc0\
-\xd6\x4a\xc0\xdd\xdb\xab\xdc\xb2\xa5\x8c\x16\x96\x9f\x2b\xe3\x04\
-\xc5\x08\x0c\x0e\x0e\x02\xd0\x4e\x53\xbe\xfb\xdf\xff\x85\x31\xcc\
-\xe5\x06\x73\x38\x5e\x90\xb1\xae\xea\xdb\x4b\xd6\x30\x17\x19\xc0\
-\xfb\x22\x85\x3c\x9f\xac\xaa\x6c\xad\x06\x54\xc3\x22\xe9\xb9\x7c\
-\xa0\xc4\x55\x1b\x13\x9c\xf7\x38\x5f\x18\x21\xee\xf8\xff\xfb\xee\
-\xfb\xc0\x9c\x6c\x0f\xed\xf9\x3a\x69\xab\xdd\x51\x64\x49\xbf\x4b\
-\xff\xbf\x22\xaf\x80\x00\x8f\x3f\xef\x8b\x15\x03\xb1\x25\x31\x90\
-\x67\x19\x81\x29\x06\x63\xeb\x45\x25\xae\xbe\xb8\xcc\x8e\x0d\x09\
-\x3b\x36\xf6\xb0\xb1\x1c\x91\x66\x8e\x2b\xaf\xd9\xc5\x8e\x2b\xaf\
-\x02\xa0\x3e\x35\xc9\xc3\x7b\x1f\xa2\x9d\x7b\x32\xd7\xa9\x02\x5d\
-\xc1\xce\xad\xfe\xfb\x1e\x7f\x66\x03\xe0\xbb\x28\x38\x3f\x6c\x80\
-\xfe\x58\x70\x2e\xc7\x02\x91\x9d\xff\xfc\x86\x72\x44\xb5\x14\x22\
-\x22\xa4\x99\x63\xa2\x91\x32\xdb\xce\xb9\xf7\xfd\xf3\x28\xd8\xbb\
-\xe7\x6b\x34\x33\x47\x2b\xf7\xa4\x1d\x6e\x3b\x5f\x94\xc3\xab\x94\
-\x61\x89\xfe\x4b\xf3\x00\xd0\xf3\x98\x02\xf6\x45\x06\xa3\x8e\xeb\
-\x86\x2a\xec\xde\xda\x4b\x1c\x2e\x5d\x91\x2b\x68\x64\x72\x96\x66\
-\x3b\xc7\x1a\xe1\x86\x5b\x6e\x67\x60\xe3\xc5\x4c\x9c\x3a\xc9\xd8\
-\xb1\x61\x0e\xfc\xe4\x31\x06\xaf\xbe\x91\x66\xe6\x69\x65\x9e\x34\
-\x5b\xdb\xcc\xb5\xb4\xa2\x5f\x37\x04\xa0\xf0\xd6\x4b\x2b\xfc\xd6\
-\x8d\x43\xdc\xba\xbd\x9f\xe4\x0c\xca\x7b\xaf\x8c\xd4\x1a\x34\xd2\
-\x8c\x66\xe6\x69\x7b\xe1\xae\xf7\xfc\xea\xdc\xf3\x47\x1f\xbc\x9f\
-\x99\xb6\xa7\x91\xfa\xc2\x08\xf9\xea\x47\x7f\x39\x04\x2c\x09\x82\
-\xfe\xbc\x05\xbf\x6a\xa0\xbc\x3a\x36\xcd\x93\xc3\x93\x4c\x34\xd2\
-\x33\x8e\x90\x31\xc2\xd6\x81\xca\x9c\x72\xcd\xcc\xf3\x8b\x77\xbe\
-\x93\xb8\x54\x6c\x3f\x1c\x7b\xe9\x69\x8e\xbe\x72\x88\x99\xd4\xd1\
-\x48\x1d\xce\xad\x55\x96\x95\x0c\x40\x27\xc2\x9e\x63\x16\x75\x94\
-\x03\xcf\xc4\x4c\x93\x1f\xbf\x3c\xc6\xbf\x3c\xfc\x32\xff\xfe\x7f\
-\x87\xa9\x37\x97\xdf\xb0\xd9\xb6\xa1\x4c\x12\x47\xcc\x66\x9e\x66\
-\xae\x68\x58\xe2\xc6\x3b\xdf\x39\xf7\xfc\xf9\x1f\x7c\x93\xe9\xd4\
-\xd1\x76\x6b\x97\xc5\x9d\x2d\x08\xea\x39\x66\x14\x36\x94\x2c\x9a\
-\x3b\x44\x15\x97\x3b\x5c\xee\x38\x36\x3e\xcb\xe8\xe4\xfc\x66\xcd\
-\x58\xbd\xc9\xc1\xe3\x53\x8c\xd5\x5b\x64\xce\xb3\x6b\x4b\x1f\xb5\
-\x46\xc6\x4b\xc7\x1b\x3c\xfe\x6a\x0d\xb3\xfd\x16\xba\x69\xfc\xd8\
-\x81\x47\x68\xd4\xc6\x7f\x3a\x79\xce\x16\x04\xfd\x39\x0a\x82\x02\
-\x04\x46\xe8\x4f\x0c\xa1\xf1\x04\xc0\x07\x76\x6f\xe5\x2b\x8f\xbe\
-\x82\x18\x8b\xa2\x9c\x9c\x6e\x71\xd5\x50\x1f\xd3\xcd\x8c\x3d\x4f\
-\x0c\xd3\xca\x1c\xd6\x08\x6d\xe7\x19\x9f\x75\x4c\xa6\x4a\xdb\x09\
-\x2e\xcf\x48\x7d\x0f\x95\x37\x5d\xcf\xcc\xab\x4f\xa1\xde\x71\xe2\
-\x27\x0f\xb2\xe5\x1d\x1f\x5e\xb3\x5c\x4b\x83\xe0\x69\xa9\xf0\xb9\
-\xa8\x05\x04\x25\x12\xcf\xef\xdf\x71\x29\xcd\xcc\x73\xe8\xc4\x0c\
-\x6f\xbb\xfc\x22\x36\x55\x63\x54\x05\x15\x83\xaa\xe7\x64\xbd\x45\
-\xee\x3c\xdf\xda\x3f\xcc\x4c\x2b\xc7\x18\xe1\xd8\x78\x83\xe1\x53\
-\x33\x78\x31\xd8\x30\xc6\x46\x31\x82\xc5\x9b\x90\x8b\xde\xfc\x76\
-\x66\x5e\x7d\x0a\x80\x53\x4f\xee\x65\xf0\x6d\xef\xc7\x84\xa5\x35\
-\xc9\x76\x96\x54\xd8\xaf\x19\x52\x91\x01\xb4\x58\x5f\x8f\xad\x50\
-\x89\x2c\x1b\x12\x4b\x25\x50\x1e\x7f\xb5\xc6\x75\x9b\x2b\xdc\xb7\
-\xfb\x12\x86\xfa\x4a\x45\xee\x6e\x2c\x60\x50\x0c\x63\x53\x4d\xf6\
-\x3e\x3b\xc2\x48\x6d\x96\xd4\x79\x9e\x1b\xa9\x73\x64\xbc\x89\x17\
-\x8b\x48\x50\x88\xa7\x02\x26\xc0\xd8\x98\x64\xf0\x72\x4a\x9b\xb6\
-\x03\xe0\xd2\x06\xe3\x4f\xff\x60\xed\x2e\xb0\x84\x4e\x4f\x85\x4f\
-\x0b\x1c\x1e\xef\x5d\x87\x3d\xaa\x1e\x41\xb1\xa2\x44\x56\xb9\x6f\
-\x57\x3f\xd7\x6c\x2a\x91\x04\x10\x19\x8f\xd5\x1c\xe7\x1c\x79\x9e\
-\xf1\xec\xd1\x71\xb2\x05\x6b\xe9\x22\xc2\x47\xee\xde\xc9\xd5\x9b\
-\xfb\x50\x63\x39\x35\xdd\x62\xff\x91\x71\xc6\x1b\x6d\x0e\x1c\xab\
-\x33\xdd\x56\xc4\x86\x98\x20\x46\x82\x10\x15\x41\x45\x40\x0c\x12\
-\x84\x48\x10\xd1\x7b\xed\x9d\x73\xfd\x9d\x7c\xe2\x41\xbc\x73\x6b\
-\x0b\x84\xde\x2d\x54\x79\x69\x39\xbc\xbc\x0b\x78\x37\x7f\xe0\xc2\
-\x88\xa0\x02\x2a\xc2\xc6\x6a\xc8\xae\xa1\x0a\xd7\x6d\xae\x72\x60\
-\x74\x86\x89\x46\xc6\x8f\x0f\xd7\xf0\xa2\x68\x96\xf3\xde\xb7\x6c\
-\x26\xb4\x8b\x41\x16\x59\xc3\x65\xfd\x25\x46\x6a\xb3\x9c\x6a\xc2\
-\x48\xad\xc1\x64\xcb\x61\xc2\x08\x63\x43\x28\xf6\xf0\x10\x3a\xd0\
-\x92\x00\x24\x40\x2c\x98\x40\x29\x6f\xbb\x9e\xa0\xba\x81\x7c\x7a\
-\x9c\xf6\xd4\x18\x93\x87\xf6\xd1\xbb\xf3\xe6\xd3\x87\xf6\x4c\x74\
-\xf6\x4c\x70\xf1\x0b\xaa\x1e\x97\xe7\x8b\xde\x31\x46\xb8\xe7\xda\
-\x8d\xfc\xc6\x4d\x43\x98\xce\xd2\x75\x4f\xd4\xcb\x5f\x3d\x70\x90\
-\x76\x9a\x11\x04\x96\x9d\x83\xbd\x5c\xb3\xb9\x8f\x43\xa3\x53\xf4\
-\x57\x62\x36\x56\x4b\x3c\xf3\xda\x04\x5f\x7b\xec\x08\x26\x08\x69\
-\x65\xca\xd1\xb1\x29\x32\x05\x13\x46\x88\x8d\xc0\x58\x8c\x31\x20\
-\xa6\x70\x95\xce\x72\x50\x57\x26\xb1\x01\x26\x2c\x51\xbd\xfa\x0e\
-\x6a\xfb\xbe\x09\xc0\xa9\x27\xfe\x87\xea\x8e\xd5\x1b\xe0\x2c\x41\
-\xf0\xf4\xb4\x52\x55\x71\xce\x75\x77\x17\x3a\xb5\xa7\xe3\x5b\xfb\
-\x5f\xa7\x36\xdd\xe4\x23\x77\x5f\x01\xc0\xeb\x13\xb3\x1c\x9f\x98\
-\x26\x08\x03\x10\x78\x71\xa4\xce\x9f\xdd\x3f\x56\x94\xb5\x7d\x09\
-\x9f\xf8\x95\xeb\x78\xf9\x44\x9d\xd9\x34\x67\x62\x32\x65\xa6\xed\
-\x51\x15\x8c\x0d\x91\x20\x06\x63\x41\x0c\x2a\x16\x11\xd3\x2d\x5d\
-\xbb\x42\x74\xa4\x31\x48\x10\x51\xb9\xe2\x66\xa6\x9e\xfe\x0e\xbe\
-\x3d\x4b\x73\xf4\x10\x8d\x63\x07\x49\x86\x76\xae\xd2\x02\x2b\xe5\
-\x01\x9c\x5e\x0e\x17\x65\xba\x41\x55\x8a\x92\xd5\x79\x72\xe7\x48\
-\xd3\x94\x89\xe9\x59\x46\x26\x1a\x7c\x61\xef\x8b\xa4\x59\x4e\x7f\
-\x39\xc4\x79\x70\x79\x81\x1a\xe7\x8b\x1a\xfc\xf8\x54\x93\x2f\x3f\
-\xfc\x32\xfb\x5f\x19\xe7\x95\x53\xb3\x4c\xce\x16\x65\xad\xd8\x18\
-\x09\x22\xc4\x84\x80\x05\x09\x50\x95\x15\x33\x39\xb1\x11\x26\xae\
-\xd0\xb3\xe3\x96\x39\x99\xc7\xf7\x3f\xb0\xfa\x4c\x70\x65\x04\x2c\
-\xe7\x02\x20\x62\x0b\x81\x45\x50\x29\x46\xce\x2b\x0c\x9f\xac\xf3\
-\x87\x5f\x7e\x9c\x56\xe6\xf8\xce\x33\xc7\x08\xc3\x90\xa8\x94\x60\
-\x0d\x78\xe7\x0a\x43\x78\xa5\xd5\xce\x78\xed\xe4\x30\x02\x98\xa8\
-\x84\xb1\x01\x62\x2c\x18\x5b\x40\x9f\x02\xf6\xab\x4a\x41\xa4\x83\
-\x82\x2b\x6f\x63\xe6\xc5\x87\xc1\x3b\x66\x5e\xd9\x47\x7b\x6a\x8c\
-\xb0\x77\xd3\x59\x9b\x2f\x9d\x06\x57\x15\x04\x55\x4c\x07\xfd\x9d\
-\x3d\x03\x31\x60\x02\x8e\x8d\x4f\x77\x64\xb2\x64\xce\x93\xe6\x19\
-\xa1\x94\x50\x9f\xa1\xdd\xc0\x29\x1d\x04\x21\x28\x60\x83\xb8\xf0\
-\x65\x1b\x14\x3e\x2e\xb6\x78\xe6\x61\xb5\xfb\x3d\x62\x63\x6c\x79\
-\x03\xa5\x4b\x7f\x81\xd6\x6b\xfb\x41\x95\xda\x53\x0f\xb1\xf1\xf6\
-\xdf\x3e\x7b\xe3\x95\x6b\x01\xbf\xec\x32\x92\x62\x40\x0a\x1f\xc5\
-\x04\xc5\x34\x65\x23\x14\xe9\xfc\x1e\x22\xb6\x08\x64\x73\x28\x32\
-\x01\x74\xff\x1e\xc4\x88\x8d\x41\x8a\xf9\x1c\x13\x16\x7d\x62\xf1\
-\x1d\x34\xad\x85\x91\x02\x39\x3d\x57\xce\x4f\x89\xf5\x17\xff\x97\
-\xbc\xd5\x38\x7b\xfb\x25\xf6\x58\xa6\x16\x38\xc3\x36\x93\x76\x5e\
-\x17\x03\x18\xc4\x04\x98\x20\x2a\x7c\x38\x88\x31\x41\x34\x17\xc8\
-\xba\xc6\x10\x13\x76\x0c\x16\xcd\x31\x62\x90\x4e\x1f\xaa\x2b\x7c\
-\x6f\x25\x56\x30\x41\x4c\xd8\xbf\x95\x70\xd3\x0e\x00\x34\x4b\xa9\
-\x3f\xf7\xfd\x55\x6c\xc1\xad\x10\x04\x57\x53\x0d\xaa\x76\x5d\xc2\
-\x76\x46\x36\xea\x24\x2e\xc5\xef\x05\x52\x3a\x6c\x8a\x9f\x2a\x41\
-\xf1\x3c\x88\xd1\x4e\x84\xff\x59\x2b\x4c\x4c\x80\x04\x11\xc9\xce\
-\x3b\xe6\x51\xf0\xdc\x77\x71\x79\xbe\x72\xdb\x25\x08\x58\x66\x59\
-\x9c\x55\x51\x81\xc4\x22\x63\x03\x10\x05\x31\xda\x7d\xd2\x79\x4b\
-\x3a\xff\x0a\x5f\x07\xb3\xea\xfe\xcf\x4e\x82\x09\x4a\x84\x83\x57\
-\x63\xaa\x83\xf8\xe9\x13\xb8\x46\x8d\xc6\xe1\x47\x29\xef\xb8\xed\
-\x8c\xad\xce\x5a\x0b\xac\x7a\x75\xd7\x83\x98\x70\x3e\xcf\xd6\x62\
-\xc5\xb9\x3b\x65\x16\x5c\x3c\x9b\x6b\x83\x39\xa7\x8b\x2c\xdd\x78\
-\x54\xba\x62\x5e\xe1\xe9\x03\x0f\xad\xb8\xb0\xb3\x94\x4e\xab\x05\
-\xf4\x3c\x2c\x88\x9c\x2f\x56\x04\x09\x62\xa2\x4b\xdf\x82\xc4\x15\
-\x00\xb2\x89\x61\x9a\x23\x2f\x9c\xc1\x7d\x15\x5d\xb2\x8b\xb6\xd8\
-\x05\xf2\x76\xa6\xbe\x33\xd5\xad\xea\x1c\xf5\x1b\x80\x4c\x88\x84\
-\x09\xd1\x65\xb7\x90\x1e\xfc\x1e\x00\x8d\x67\x1f\x22\x1c\xbc\x66\
-\xd1\x6b\xd2\xd1\xdb\xe7\xed\x6c\x51\xf3\xb9\x17\x44\x34\x6f\x4c\
-\xd6\x2f\xfc\x21\xc7\xb5\x71\x77\xd6\x89\xde\xf4\x56\x30\x45\x3c\
-\x4a\x8f\x3d\x43\x36\x39\xb2\xec\xfb\x79\x63\xb2\x2e\x22\xba\xd0\
-\x00\x3a\x33\x33\xa3\x22\xa2\xf5\x23\x4f\x1e\xf5\x73\x53\xc6\xf9\
-\x5b\x20\x3d\xd7\x2c\x36\x42\x4a\x7d\x04\x5b\x6e\x98\x1b\xd9\xd6\
-\x91\x7d\x0b\xe2\x95\x9f\x3b\x2d\x52\x3f\xf2\xe4\x51\x11\xd1\x99\
-\x99\x19\x05\xd4\x00\x2a\x22\x5e\x44\xfc\xf8\x81\xbd\xc7\xf3\x76\
-\xf3\xa4\xf7\x7e\x41\xa3\xf3\xb7\x54\x7e\xae\x58\xc5\x82\x8d\x08\
-\xaf\x78\x3b\x44\x65\x30\x01\x76\xe3\x8e\xce\xac\xd6\x1d\x4c\x4f\
-\xde\x6e\x9e\x1c\x3f\xb0\xf7\x78\x47\x5f\x85\xe2\x9c\xa0\x06\x41\
-\xe0\xac\xb5\x4e\x55\xb3\xd6\xc4\xeb\x8f\x25\x1b\xb7\xdf\x5b\xd8\
-\xd1\x03\xa6\x98\xf7\xdf\xe0\x24\x36\x46\x7a\x36\x52\xba\xe3\x0f\
-\x40\x1d\xa6\x7f\x2b\xf8\xe2\x48\x44\x17\xef\xe9\xf8\xb1\xc7\x8d\
-\x31\x99\x88\xb8\x20\x08\x72\x40\x2d\x40\xb3\xd9\xb4\x49\x92\x84\
-\x40\x64\x4c\xe0\xcb\xdb\x76\xbf\x47\x41\xb4\x53\x92\x6a\x27\xe2\
-\xaa\xf2\x86\x65\xc4\xa0\xce\x15\xc1\xdb\x46\xd8\xa0\xd8\x66\x9b\
-\x7b\xc7\xab\x9e\xdc\xf7\x9f\x9f\x6b\x8c\xbe\x74\xc8\x39\xd7\x38\
-\x75\xea\x54\x13\xc8\xbb\x43\x9b\x37\x9b\xcd\x5c\x55\x5b\x63\x4f\
-\xec\x79\xa1\x35\x75\x62\x9f\xef\xc0\xa6\x70\x07\x07\xae\x8d\xfa\
-\xee\xf2\xd3\xda\x72\xf7\xf5\xe2\xa2\xb4\xb6\x08\x14\xb2\x2e\xd0\
-\xa1\x35\x75\x62\xdf\xd8\x13\x7b\x5e\x50\xd5\x56\x67\xf4\x73\x98\
-\x3f\x2b\xec\xab\xd5\x6a\xe0\xbd\xb7\xd6\xda\x92\x9b\x9d\x3c\xd6\
-\xb3\xfd\xa6\x77\xa1\x12\x2c\x8a\xb8\xde\x17\xb0\x52\xdf\xd9\xd3\
-\xa7\x63\x5e\xa0\xbb\x51\xbf\x5e\xec\x75\x41\x06\xe6\x10\xef\xe6\
-\x52\x59\x91\xa2\x56\x01\xa1\x38\x4c\x95\xb7\x4e\xfc\xf0\x8b\x7f\
-\x91\x4e\x0c\x1f\x8d\xa2\xa8\xd6\x6a\xb5\x9a\xcd\x66\x73\xd1\x61\
-\x69\x9a\xcd\x26\xfd\xfd\xfd\x16\x08\x5b\xe3\xaf\xe5\x51\xdf\x96\
-\x7a\xd8\xbf\xf5\xad\x2c\x77\x4f\x60\x2e\x02\xb9\x0e\xe7\xe0\xd6\
-\x99\x7d\xbe\xe0\xfb\x0b\x06\x44\x4c\x51\x83\x74\x94\xf7\xea\x75\
-\xfa\xe0\x8f\xfe\xf1\xd4\xbe\xff\x78\x4c\x44\xc6\x81\xfa\xd8\xd8\
-\xd8\x2c\x9d\x3b\x03\x0b\x77\x28\xdd\xf4\xf4\xb4\x8d\xa2\x48\x82\
-\x20\x88\x66\x5e\x7d\x74\xb4\x34\x74\x8d\xb7\xe5\x8d\xd7\x2b\xfa\
-\x73\x74\x59\x62\xe1\x40\xa9\xce\x8e\x3e\xfb\xe5\xd1\x87\x3e\xbb\
-\x47\x44\x6a\xed\x76\x7b\x5c\x55\x1b\xb3\xb3\xb3\x73\x5b\x52\x4b\
-\xb7\x68\x5d\xa9\x54\x42\x44\x2c\x60\x67\x0e\x3d\xfc\x72\xb4\x61\
-\xfb\xb4\xad\x6e\xba\x01\xc5\x5e\x70\x85\xd6\xc0\xde\xbb\x6c\x76\
-\x78\xff\x17\x8f\x3f\xf8\x99\x6f\x78\xef\xa7\xbc\xf7\x13\xde\xfb\
-\xc9\xf1\xf1\xf1\x45\xf7\x86\x96\x1a\x40\x5b\xad\x96\x37\xc6\x50\
-\x2a\x95\x8c\xf7\x5e\x9a\x47\x1e\x3d\xe2\xdb\xad\xa7\xc3\x81\x37\
-\xed\x40\x82\x81\xf5\x3a\x3a\xfb\xb3\xb0\x6b\xcd\x1c\x9e\xdc\x7f\
-\xff\xa7\x6b\x8f\x7d\xe9\x11\xef\xfd\x94\xb5\xb6\xd6\x68\x34\x26\
-\xea\xf5\xfa\x0c\x4b\x2e\x55\x9e\x29\xe1\x0f\x37\x6d\xda\x34\x60\
-\xad\xed\xf7\xde\xf7\xaa\x6a\x35\x08\xe2\x9e\xde\x5b\x7e\xe7\xf6\
-\x64\xcb\xf5\xf7\x98\xb8\xf7\xcd\x8b\x8e\x72\xbf\x11\x48\x55\x7d\
-\x5a\x7f\xae\x79\xec\x99\x07\xea\x8f\x7d\xe9\x91\x3c\x4f\x67\x45\
-\x64\xc6\x18\x33\xe5\x9c\xab\x8d\x8d\x8d\xd5\x58\xe6\xfe\xe0\x4a\
-\x4a\x04\x83\x83\x83\x03\xde\xfb\xde\x30\x0c\xab\x59\x96\x25\x22\
-\x52\x36\xc6\x84\xd1\xa6\x6b\x36\xf4\x5c\x7e\xdb\x2e\x5b\x1d\xbc\
-\x54\xc2\xa4\x1f\x63\x63\x59\xe7\x1b\x65\x8a\x2a\xde\xa5\x9a\x35\
-\x6b\x6e\xfa\xc4\xd1\xc6\x91\x1f\x3d\x97\x1d\x7f\xe1\x94\x88\x64\
-\x22\xd2\x00\x9a\x59\x96\x4d\x1b\x63\xea\x27\x4e\x9c\x98\xe0\x0c\
-\xd7\x69\xcf\x26\xb4\xe9\xeb\xeb\xeb\xab\x54\x2a\x65\xe7\x5c\xd5\
-\x18\x53\x72\xce\x45\xc6\x98\xc8\x39\x17\x59\x6b\x03\x7d\x03\x5c\
-\x9d\x75\xce\xe5\xd6\xda\xb6\xf7\xbe\xdd\xf9\xd9\xb2\xd6\x4e\x5b\
-\x6b\x1b\xc3\xc3\xc3\x53\x9c\xbe\x14\x38\xdf\x7e\x95\xdf\x29\x6d\
-\xde\xbc\xb9\xdc\x6a\xb5\x4a\xd6\xda\xc4\x5a\x1b\xa9\xaa\xe9\xb0\
-\x84\x61\x78\x41\x8c\x90\x65\x99\x76\xee\x0e\x7b\x11\xf1\xce\xb9\
-\x76\xf7\xa2\xe4\xc8\xc8\x48\x03\x68\x9d\xad\x8f\xb5\x08\x6e\x80\
-\x78\x60\x60\x20\x74\xce\xd9\x24\x49\x02\xe7\x9c\xd5\x0b\x78\x81\
-\xba\x7b\x71\xda\x5a\xeb\x9a\xcd\x66\x6e\x8c\xf1\xb5\x5a\xad\x0d\
-\xa4\xac\x30\xea\x8b\xfa\xf8\x69\xbe\xcb\x82\x6b\xf4\x17\x5f\x7c\
-\xb1\x00\xac\xf7\x35\x7a\x63\x8c\x02\x9c\x3c\x79\x52\x61\xd1\xb5\
-\x79\x5d\xa9\xdd\x52\xfa\x7f\xb2\xaa\x5d\xcb\x64\xe1\x28\x1e\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x08\
-\x06\x63\x4d\x24\
-\x00\x7a\
-\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x66\x00\x69\x00\x74\
-\x00\x0a\
-\x08\x8b\x13\xc5\
-\x00\x63\
-\x00\x6c\x00\x65\x00\x61\x00\x72\x00\x5f\x00\x6e\x00\x6f\x00\x74\x00\x65\
-\x00\x07\
-\x09\xcb\xb0\xa7\
-\x00\x73\
-\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\
-\x00\x03\
-\x00\x00\x75\xa2\
-\x00\x6f\
-\x00\x63\x00\x72\
-\x00\x05\
-\x00\x74\x5a\xbc\
-\x00\x6d\
-\x00\x6f\x00\x64\x00\x65\x00\x6c\
-\x00\x09\
-\x02\x64\x8f\x3c\
-\x00\x64\
-\x00\x65\x00\x6c\x00\x5f\x00\x6d\x00\x6f\x00\x64\x00\x65\x00\x6c\
-\x00\x08\
-\x08\xfe\x0a\xbc\
-\x00\x6f\
-\x00\x72\x00\x69\x00\x67\x00\x69\x00\x6e\x00\x61\x00\x6c\
-\x00\x10\
-\x0f\x7b\xe2\x53\
-\x00\x63\
-\x00\x6f\x00\x6e\x00\x74\x00\x69\x00\x6e\x00\x75\x00\x6f\x00\x75\x00\x73\x00\x5f\x00\x73\x00\x68\x00\x6f\x00\x74\x00\x73\
-\x00\x04\
-\x00\x07\x56\xa5\
-\x00\x6e\
-\x00\x6f\x00\x74\x00\x65\
-\x00\x0a\
-\x07\xd6\x4c\xd4\
-\x00\x6d\
-\x00\x61\x00\x6e\x00\x61\x00\x67\x00\x65\x00\x6d\x00\x65\x00\x6e\x00\x74\
-\x00\x03\
-\x00\x00\x7a\xa0\
-\x00\x74\
-\x00\x63\x00\x70\
-\x00\x0c\
-\x06\x9e\x97\x9c\
-\x00\x63\
-\x00\x68\x00\x6f\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x6d\x00\x6f\x00\x64\x00\x65\x00\x6c\
-\x00\x04\
-\x00\x07\x72\x89\
-\x00\x70\
-\x00\x6c\x00\x61\x00\x79\
-\x00\x0b\
-\x06\xa5\x7e\xdc\
-\x00\x73\
-\x00\x68\x00\x6f\x00\x77\x00\x5f\x00\x6e\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\x6c\
-\x00\x0b\
-\x06\x41\x0d\xfe\
-\x00\x66\
-\x00\x75\x00\x6c\x00\x6c\x00\x5f\x00\x73\x00\x63\x00\x72\x00\x65\x00\x65\x00\x6e\
-\x00\x08\
-\x0f\xdf\xa2\x07\
-\x00\x6c\
-\x00\x69\x00\x67\x00\x68\x00\x74\x00\x69\x00\x6e\x00\x67\
-\x00\x07\
-\x09\x8c\xb5\x63\
-\x00\x73\
-\x00\x61\x00\x76\x00\x65\x00\x5f\x00\x61\x00\x73\
-\x00\x04\
-\x00\x06\xa9\x60\
-\x00\x63\
-\x00\x72\x00\x6f\x00\x70\
-\x00\x04\
-\x00\x07\x98\xc5\
-\x00\x73\
-\x00\x61\x00\x76\x00\x65\
-\x00\x08\
-\x00\x50\x4f\x85\
-\x00\x6d\
-\x00\x69\x00\x6e\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\
-\x00\x03\
-\x00\x00\x68\x70\
-\x00\x61\
-\x00\x70\x00\x70\
-\x00\x05\
-\x00\x68\x77\x39\
-\x00\x61\
-\x00\x70\x00\x70\x00\x6c\x00\x79\
-\x00\x05\
-\x00\x78\xc9\xc4\
-\x00\x72\
-\x00\x65\x00\x73\x00\x65\x00\x74\
-\x00\x0a\
-\x0a\x95\x39\xc6\
-\x00\x73\
-\x00\x77\x00\x69\x00\x74\x00\x63\x00\x68\x00\x5f\x00\x6f\x00\x66\x00\x66\
-\x00\x03\
-\x00\x00\x73\x57\
-\x00\x6c\
-\x00\x6f\x00\x67\
-\x00\x0a\
-\x04\xb7\xe4\xfe\
-\x00\x63\
-\x00\x6f\x00\x6e\x00\x6e\x00\x65\x00\x63\x00\x74\x00\x69\x00\x6f\x00\x6e\
-\x00\x09\
-\x0a\x64\x95\xfc\
-\x00\x61\
-\x00\x64\x00\x64\x00\x5f\x00\x6d\x00\x6f\x00\x64\x00\x65\x00\x6c\
-\x00\x04\
-\x00\x07\xac\xa4\
-\x00\x74\
-\x00\x65\x00\x73\x00\x74\
-\x00\x0b\
-\x05\x67\x0c\x01\
-\x00\x73\
-\x00\x63\x00\x61\x00\x6e\x00\x5f\x00\x63\x00\x61\x00\x6d\x00\x65\x00\x72\x00\x61\
-\x00\x04\
-\x00\x06\xa8\xa1\
-\x00\x64\
-\x00\x61\x00\x74\x00\x61\
-\x00\x05\
-\x00\x79\x59\x64\
-\x00\x72\
-\x00\x6f\x00\x62\x00\x6f\x00\x74\
-\x00\x04\
-\x00\x07\xab\x60\
-\x00\x73\
-\x00\x74\x00\x6f\x00\x70\
-\x00\x07\
-\x09\x87\xbc\x45\
-\x00\x63\
-\x00\x61\x00\x70\x00\x74\x00\x75\x00\x72\x00\x65\
-\x00\x04\
-\x00\x07\x35\x74\
-\x00\x6c\
-\x00\x6f\x00\x61\x00\x64\
-\x00\x06\
-\x07\x38\x5b\x7c\
-\x00\x6d\
-\x00\x61\x00\x6e\x00\x75\x00\x61\x00\x6c\
-\x00\x07\
-\x0a\x64\x76\x54\
-\x00\x63\
-\x00\x6f\x00\x6d\x00\x70\x00\x6f\x00\x72\x00\x74\
-\x00\x06\
-\x06\x98\x3c\x81\
-\x00\x63\
-\x00\x61\x00\x6d\x00\x65\x00\x72\x00\x61\
-\x00\x07\
-\x07\x95\x9c\x43\
-\x00\x70\
-\x00\x72\x00\x6f\x00\x63\x00\x65\x00\x73\x00\x73\
-\x00\x10\
-\x0c\xb2\xb0\x1e\
-\x00\x63\
-\x00\x61\x00\x6d\x00\x65\x00\x72\x00\x61\x00\x5f\x00\x64\x00\x6f\x00\x6e\x00\x74\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\
-\x00\x05\
-\x00\x72\xfd\xf4\
-\x00\x6c\
-\x00\x69\x00\x67\x00\x68\x00\x74\
-\x00\x05\
-\x00\x6a\xb9\xb7\
-\x00\x64\
-\x00\x65\x00\x62\x00\x75\x00\x67\
-\x00\x04\
-\x00\x06\xb8\x87\
-\x00\x64\
-\x00\x72\x00\x61\x00\x77\
-\x00\x09\
-\x0c\x45\x24\xe5\
-\x00\x6f\
-\x00\x70\x00\x65\x00\x6e\x00\x5f\x00\x66\x00\x69\x00\x6c\x00\x65\
-\x00\x08\
-\x06\x63\x76\xe4\
-\x00\x7a\
-\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x6f\x00\x75\x00\x74\
-\x00\x04\
-\x00\x06\xf6\x35\
-\x00\x68\
-\x00\x6f\x00\x6d\x00\x65\
-\x00\x09\
-\x03\xc8\xa9\x5e\
-\x00\x63\
-\x00\x61\x00\x6d\x00\x65\x00\x72\x00\x61\x00\x5f\x00\x6f\x00\x6e\
-\x00\x09\
-\x00\xa9\x53\x9e\
-\x00\x73\
-\x00\x77\x00\x69\x00\x74\x00\x63\x00\x68\x00\x5f\x00\x6f\x00\x6e\
-\x00\x0a\
-\x0a\x94\x65\x04\
-\x00\x63\
-\x00\x68\x00\x65\x00\x73\x00\x73\x00\x62\x00\x6f\x00\x61\x00\x72\x00\x64\
-\x00\x0d\
-\x0b\xf1\xf8\x42\
-\x00\x6d\
-\x00\x6f\x00\x64\x00\x65\x00\x6c\x00\x5f\x00\x6d\x00\x61\x00\x6e\x00\x61\x00\x67\x00\x65\x00\x72\
-\x00\x04\
-\x00\x07\x8c\x04\
-\x00\x71\
-\x00\x75\x00\x69\x00\x74\
-\x00\x05\
-\x00\x7a\xa8\x94\
-\x00\x73\
-\x00\x74\x00\x61\x00\x72\x00\x74\
-\x00\x0a\
-\x0a\x56\xce\xc7\
-\x00\x6c\
-\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\
-\x00\x0b\
-\x09\x5b\xad\xbe\
-\x00\x63\
-\x00\x61\x00\x6c\x00\x69\x00\x62\x00\x72\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\
-\x00\x0b\
-\x05\x3a\xf2\x42\
-\x00\x6f\
-\x00\x70\x00\x65\x00\x6e\x00\x5f\x00\x66\x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\
-\x00\x07\
-\x01\x66\x34\xfe\
-\x00\x7a\
-\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x69\x00\x6e\
-\x00\x06\
-\x07\x9c\x9c\xc2\
-\x00\x73\
-\x00\x65\x00\x72\x00\x76\x00\x65\x00\x72\
-\x00\x05\
-\x00\x7a\xb7\x98\
-\x00\x74\
-\x00\x65\x00\x61\x00\x63\x00\x68\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x39\x00\x00\x00\x01\
-\x00\x00\x01\xa8\x00\x01\x00\x00\x00\x01\x00\x00\x7d\xcf\
-\x00\x00\x01\xee\x00\x00\x00\x00\x00\x01\x00\x00\xe1\x12\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x14\xec\
-\x00\x00\x00\xdc\x00\x00\x00\x00\x00\x01\x00\x00\x3a\x25\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x00\xf7\x98\
-\x00\x00\x01\x76\x00\x00\x00\x00\x00\x01\x00\x00\x5a\xf9\
-\x00\x00\x03\x36\x00\x00\x00\x00\x00\x01\x00\x01\x40\xde\
-\x00\x00\x03\x72\x00\x00\x00\x00\x00\x01\x00\x01\x5c\xbf\
-\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x01\x0c\xd1\
-\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x27\xc1\
-\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00\x41\x58\
-\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x01\x79\xab\
-\x00\x00\x01\x84\x00\x00\x00\x00\x00\x01\x00\x00\x60\x53\
-\x00\x00\x02\x74\x00\x00\x00\x00\x00\x01\x00\x01\x07\x85\
-\x00\x00\x02\x2c\x00\x00\x00\x00\x00\x01\x00\x00\xef\xb2\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\x69\x67\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\xca\x31\
-\x00\x00\x03\x26\x00\x00\x00\x00\x00\x01\x00\x01\x38\x7a\
-\x00\x00\x03\x16\x00\x00\x00\x00\x00\x01\x00\x01\x35\xa8\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x19\x49\
-\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x00\xd6\x34\
-\x00\x00\x02\x64\x00\x00\x00\x00\x00\x01\x00\x00\xff\x2c\
-\x00\x00\x03\xf8\x00\x00\x00\x00\x00\x01\x00\x01\x92\xd0\
-\x00\x00\x04\x80\x00\x00\x00\x00\x00\x01\x00\x01\xbb\x85\
-\x00\x00\x03\x98\x00\x00\x00\x00\x00\x01\x00\x01\x6a\xa7\
-\x00\x00\x04\x5a\x00\x00\x00\x00\x00\x01\x00\x01\xa1\x0e\
-\x00\x00\x00\x60\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xc8\
-\x00\x00\x03\x80\x00\x00\x00\x00\x00\x01\x00\x01\x65\x4e\
-\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x00\xe6\x46\
-\x00\x00\x04\x3e\x00\x00\x00\x00\x00\x01\x00\x01\x9b\x7d\
-\x00\x00\x02\x3a\x00\x00\x00\x00\x00\x01\x00\x00\xf1\xa6\
-\x00\x00\x01\x30\x00\x00\x00\x00\x00\x01\x00\x00\x4f\x72\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x03\x5c\x00\x00\x00\x00\x00\x01\x00\x01\x4a\x1f\
-\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x01\x17\x78\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x3b\x5b\
-\x00\x00\x01\x14\x00\x00\x00\x00\x00\x01\x00\x00\x4d\x06\
-\x00\x00\x02\xa4\x00\x00\x00\x00\x00\x01\x00\x01\x0e\x39\
-\x00\x00\x02\xdc\x00\x00\x00\x00\x00\x01\x00\x01\x1f\x4c\
-\x00\x00\x04\x6e\x00\x00\x00\x00\x00\x01\x00\x01\xb4\x0b\
-\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x00\x31\x57\
-\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x04\x8e\
-\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x24\x12\
-\x00\x00\x04\x22\x00\x00\x00\x00\x00\x01\x00\x01\x96\xe2\
-\x00\x00\x02\x82\x00\x00\x00\x00\x00\x01\x00\x01\x09\x26\
-\x00\x00\x01\x62\x00\x00\x00\x00\x00\x01\x00\x00\x56\x06\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x6c\
-\x00\x00\x04\x08\x00\x00\x00\x00\x00\x01\x00\x01\x96\x24\
-\x00\x00\x02\xb6\x00\x00\x00\x00\x00\x01\x00\x01\x15\xc0\
-\x00\x00\x02\x14\x00\x00\x00\x00\x00\x01\x00\x00\xec\x2f\
-\x00\x00\x03\xb0\x00\x00\x00\x00\x00\x01\x00\x01\x6e\xa4\
-\x00\x00\x01\xd4\x00\x00\x00\x00\x00\x01\x00\x00\xdd\x0a\
-\x00\x00\x03\xca\x00\x00\x00\x00\x00\x01\x00\x01\x71\xf6\
-\x00\x00\x03\x44\x00\x00\x00\x00\x00\x01\x00\x01\x42\x58\
-\x00\x00\x02\xf0\x00\x00\x00\x00\x00\x01\x00\x01\x2a\x3b\
-\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x25\xe8\
-\x00\x00\x01\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x51\xe1\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x39\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\xa8\x00\x01\x00\x00\x00\x01\x00\x00\x7d\xcf\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x01\xee\x00\x00\x00\x00\x00\x01\x00\x00\xe1\x12\
-\x00\x00\x01\x90\x5e\x24\xf2\x30\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x14\xec\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x00\xdc\x00\x00\x00\x00\x00\x01\x00\x00\x3a\x25\
-\x00\x00\x01\x8a\x06\x7a\x02\xb0\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x00\xf7\x98\
-\x00\x00\x01\x90\x78\x28\xdb\xb0\
-\x00\x00\x01\x76\x00\x00\x00\x00\x00\x01\x00\x00\x5a\xf9\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x03\x36\x00\x00\x00\x00\x00\x01\x00\x01\x40\xde\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x03\x72\x00\x00\x00\x00\x00\x01\x00\x01\x5c\xbf\
-\x00\x00\x01\x8a\x02\xd2\xd4\x70\
-\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x01\x0c\xd1\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x27\xc1\
-\x00\x00\x01\x93\x76\x9c\x0d\xcd\
-\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00\x41\x58\
-\x00\x00\x01\x8a\x06\x2b\x94\x90\
-\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x01\x79\xab\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x01\x84\x00\x00\x00\x00\x00\x01\x00\x00\x60\x53\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x02\x74\x00\x00\x00\x00\x00\x01\x00\x01\x07\x85\
-\x00\x00\x01\x8f\x19\x55\xca\xe0\
-\x00\x00\x02\x2c\x00\x00\x00\x00\x00\x01\x00\x00\xef\xb2\
-\x00\x00\x01\x8f\x18\xce\x7a\x40\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\x69\x67\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\xca\x31\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x03\x26\x00\x00\x00\x00\x00\x01\x00\x01\x38\x7a\
-\x00\x00\x01\x8a\x8d\xc3\x11\x30\
-\x00\x00\x03\x16\x00\x00\x00\x00\x00\x01\x00\x01\x35\xa8\
-\x00\x00\x01\x8a\x06\x7f\x03\xf0\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x19\x49\
-\x00\x00\x01\x8a\x06\x7b\xa8\x90\
-\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x00\xd6\x34\
-\x00\x00\x01\x8a\x8d\x4c\x23\xe0\
-\x00\x00\x02\x64\x00\x00\x00\x00\x00\x01\x00\x00\xff\x2c\
-\x00\x00\x01\x90\x78\x28\x28\x00\
-\x00\x00\x03\xf8\x00\x00\x00\x00\x00\x01\x00\x01\x92\xd0\
-\x00\x00\x01\x8f\x19\x55\x8c\x60\
-\x00\x00\x04\x80\x00\x00\x00\x00\x00\x01\x00\x01\xbb\x85\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x03\x98\x00\x00\x00\x00\x00\x01\x00\x01\x6a\xa7\
-\x00\x00\x01\x91\x6a\x10\x32\x20\
-\x00\x00\x04\x5a\x00\x00\x00\x00\x00\x01\x00\x01\xa1\x0e\
-\x00\x00\x01\x8a\x1f\xdd\x8d\x80\
-\x00\x00\x00\x60\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xc8\
-\x00\x00\x01\x8a\xab\x21\x97\x60\
-\x00\x00\x03\x80\x00\x00\x00\x00\x00\x01\x00\x01\x65\x4e\
-\x00\x00\x01\x8f\xdd\x5c\x70\xb0\
-\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x00\xe6\x46\
-\x00\x00\x01\x8a\xab\x25\x60\x20\
-\x00\x00\x04\x3e\x00\x00\x00\x00\x00\x01\x00\x01\x9b\x7d\
-\x00\x00\x01\x93\x75\xc5\x34\xc8\
-\x00\x00\x02\x3a\x00\x00\x00\x00\x00\x01\x00\x00\xf1\xa6\
-\x00\x00\x01\x8f\xdd\x64\x0a\x00\
-\x00\x00\x01\x30\x00\x00\x00\x00\x00\x01\x00\x00\x4f\x72\
-\x00\x00\x01\x91\x73\xf0\x6c\xb0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x90\x53\x8a\x22\x00\
-\x00\x00\x03\x5c\x00\x00\x00\x00\x00\x01\x00\x01\x4a\x1f\
-\x00\x00\x01\x8a\x1f\xdd\x8d\x80\
-\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x01\x17\x78\
-\x00\x00\x01\x90\x78\x2a\x81\x90\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x3b\x5b\
-\x00\x00\x01\x8a\xab\x22\x0c\x90\
-\x00\x00\x01\x14\x00\x00\x00\x00\x00\x01\x00\x00\x4d\x06\
-\x00\x00\x01\x91\x73\xef\xef\xb0\
-\x00\x00\x02\xa4\x00\x00\x00\x00\x00\x01\x00\x01\x0e\x39\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x02\xdc\x00\x00\x00\x00\x00\x01\x00\x01\x1f\x4c\
-\x00\x00\x01\x90\x5e\x24\x75\x30\
-\x00\x00\x04\x6e\x00\x00\x00\x00\x00\x01\x00\x01\xb4\x0b\
-\x00\x00\x01\x90\x57\x43\x69\x10\
-\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x00\x31\x57\
-\x00\x00\x01\x8a\x96\xa5\x92\xa0\
-\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x04\x8e\
-\x00\x00\x01\x93\x76\xe2\x20\xd1\
-\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x24\x12\
-\x00\x00\x01\x8a\x1f\xdd\x8d\x80\
-\x00\x00\x04\x22\x00\x00\x00\x00\x00\x01\x00\x01\x96\xe2\
-\x00\x00\x01\x8f\xdd\x62\xc1\xe0\
-\x00\x00\x02\x82\x00\x00\x00\x00\x00\x01\x00\x01\x09\x26\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x01\x62\x00\x00\x00\x00\x00\x01\x00\x00\x56\x06\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x6c\
-\x00\x00\x01\x8a\xb5\x87\x2e\x90\
-\x00\x00\x04\x08\x00\x00\x00\x00\x00\x01\x00\x01\x96\x24\
-\x00\x00\x01\x89\xf6\xff\x2e\x50\
-\x00\x00\x02\xb6\x00\x00\x00\x00\x00\x01\x00\x01\x15\xc0\
-\x00\x00\x01\x8a\x06\x76\xde\x00\
-\x00\x00\x02\x14\x00\x00\x00\x00\x00\x01\x00\x00\xec\x2f\
-\x00\x00\x01\x8a\xab\x21\x51\x10\
-\x00\x00\x03\xb0\x00\x00\x00\x00\x00\x01\x00\x01\x6e\xa4\
-\x00\x00\x01\x8f\xdd\x5f\x18\x60\
-\x00\x00\x01\xd4\x00\x00\x00\x00\x00\x01\x00\x00\xdd\x0a\
-\x00\x00\x01\x91\x6a\x10\x78\x70\
-\x00\x00\x03\xca\x00\x00\x00\x00\x00\x01\x00\x01\x71\xf6\
-\x00\x00\x01\x8a\xab\x1e\x72\xb0\
-\x00\x00\x03\x44\x00\x00\x00\x00\x00\x01\x00\x01\x42\x58\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x02\xf0\x00\x00\x00\x00\x00\x01\x00\x01\x2a\x3b\
-\x00\x00\x01\x89\xf1\x91\x80\x80\
-\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x25\xe8\
-\x00\x00\x01\x91\x6a\x20\xf3\x30\
-\x00\x00\x01\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x51\xe1\
-\x00\x00\x01\x90\x57\x42\xad\x90\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,301 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+RECORD = namedtuple(
+    "record",
+    ["t", "model", "index", "b_pass", "n_ok", "n_ng", "n_none", "msg", "table"],
+    defaults=[0.0, "", 0, False, 0, 0, 0, "", None],
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS inspections (
+    id INTEGER PRIMARY KEY,
+    t REAL NOT NULL,
+    model TEXT NOT NULL,
+    job_index INTEGER,
+    b_pass INTEGER NOT NULL,
+    n_ok INTEGER NOT NULL,
+    n_ng INTEGER NOT NULL,
+    n_none INTEGER NOT NULL,
+    msg TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_inspections_t ON inspections (t);
+CREATE INDEX IF NOT EXISTS idx_inspections_model_t ON inspections (model, t);
+CREATE TABLE IF NOT EXISTS rois (
+    inspection_id INTEGER NOT NULL,
+    roi INTEGER NOT NULL,
+    decision INTEGER NOT NULL,
+    aligned INTEGER NOT NULL,
+    dx INTEGER,
+    dy INTEGER,
+    da REAL,
+    PRIMARY KEY (inspection_id, roi)
+) WITHOUT ROWID;
+"""
+
+
+class ResultStore:
+    """
+    Append-only history of inspections in SQLite (WAL mode).\n
+    add() only puts the record on a queue. A writer thread inserts records
+    in batches, one transaction per batch (group commit): up to batch_size
+    records or whatever arrived within flush_interval. The queue is bounded,
+    records are dropped (n_dropped) rather than blocking the auto loop.\n
+    Queries open their own connection, WAL lets them read while the writer
+    commits. The summary shown on the GUI is refreshed by the writer thread
+    every summary_interval on its connection (watch(), recent), the GUI
+    timer only reads the last one.
+    """
+
+    def __init__(
+        self,
+        path="history/results.db",
+        batch_size=256,
+        flush_interval=0.5,
+        queue_size=10000,
+        summary_interval=1.0,
+    ):
+        self.path = path
+        self.batch_size = max(int(batch_size), 1)
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=max(int(queue_size), 1))
+        self.summary_interval = summary_interval
+
+        # (model, window s) theo dõi và summary gần nhất, do writer thread tính
+        self.watched = ("", 3600)
+        self.recent: dict = None
+
+        self.n_written = 0
+        self.n_dropped = 0
+        self.n_commits = 0
+
+        self._thread = None
+        self._running = False
+
+    @property
+    def running(self):
+        return self._running
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: không fsync mỗi commit, vẫn an toàn khi app crash
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def start(self) -> bool:
+        if self._running:
+            return True
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with self.connect() as conn:
+                conn.executescript(SCHEMA)
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"Error opening result store {self.path}: {str(e)}")
+            return False
+
+        self._running = True
+        self._thread = threading.Thread(target=self._loop_write, daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout=5.0):
+        """Stop after the queued records are committed"""
+        if not self._running:
+            return
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def add(self, record: RECORD) -> bool:
+        if not self._running:
+            return False
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.n_dropped += 1
+            return False
+        return True
+
+    def _take_batch(self) -> list:
+        try:
+            batch = [self.queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        t_end = time.perf_counter() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                if self._running:
+                    timeout = t_end - time.perf_counter()
+                    if timeout <= 0:
+                        break
+                    batch.append(self.queue.get(timeout=timeout))
+                else:
+                    # Đang dừng: ghi nốt những gì còn trong queue, không chờ
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def watch(self, model: str, window: float):
+        """Summary of model over the last window seconds for recent"""
+        self.watched = (model, window)
+
+    def _loop_write(self):
+        conn = self.connect()
+        t_summary, summarized = 0.0, None
+        try:
+            # Sau khi stop vẫn ghi nốt các record còn trong queue
+            while self._running or not self.queue.empty():
+                batch = self._take_batch()
+                if batch:
+                    try:
+                        self._write(conn, batch)
+                    except sqlite3.Error as e:
+                        self.n_dropped += len(batch)
+                        print(
+                            f"[{time.strftime('%H:%M:%S')}][history][ERROR]: {str(e)}"
+                        )
+
+                # Cửa sổ trượt theo thời gian: tính lại cả khi không có record mới
+                watched = self.watched
+                if (
+                    watched != summarized
+                    or time.perf_counter() - t_summary > self.summary_interval
+                ):
+                    t_summary, summarized = time.perf_counter(), watched
+                    model, window = watched
+                    try:
+                        self.recent = dict(
+                            self._summary(conn, time.time() - window, None, model),
+                            model=model,
+                            window=window,
+                        )
+                    except sqlite3.Error as e:
+                        print(
+                            f"[{time.strftime('%H:%M:%S')}][history][ERROR]: {str(e)}"
+                        )
+        finally:
+            conn.close()
+
+    def _write(self, conn: sqlite3.Connection, batch: list):
+        with conn:
+            for record in batch:
+                cursor = conn.execute(
+                    "INSERT INTO inspections "
+                    "(t, model, job_index, b_pass, n_ok, n_ng, n_none, msg) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        record.t,
+                        record.model,
+                        record.index,
+                        int(record.b_pass),
+                        record.n_ok,
+                        record.n_ng,
+                        record.n_none,
+                        record.msg,
+                    ),
+                )
+                table = record.table
+                if table is None or not len(table):
+                    continue
+                inspection_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT INTO rois VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    zip(
+                        [inspection_id] * len(table),
+                        range(len(table)),
+                        table["decision"].tolist(),
+                        table["aligned"].tolist(),
+                        table["dx"].tolist(),
+                        table["dy"].tolist(),
+                        table["da"].tolist(),
+                    ),
+                )
+        self.n_written += len(batch)
+        self.n_commits += 1
+
+    @staticmethod
+    def _where(t_from: float = None, t_to: float = None, model: str = None, *extra):
+        clauses, params = list(extra), []
+        if t_from is not None:
+            clauses.append("t >= ?")
+            params.append(t_from)
+        if t_to is not None:
+            clauses.append("t < ?")
+            params.append(t_to)
+        if model:
+            clauses.append("model = ?")
+            params.append(model)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+    def query(self, t_from=None, t_to=None, model=None, limit=None) -> list:
+        """Inspections in [t_from, t_to) of model as dicts, oldest first"""
+        where, params = self._where(t_from, t_to, model)
+        sql = (
+            "SELECT id, t, model, job_index, b_pass, n_ok, n_ng, n_none, msg "
+            f"FROM inspections{where} ORDER BY t"
+        )
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        conn = self.connect()
+        try:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
+
+    def summary(self, t_from=None, t_to=None, model=None) -> dict:
+        """Yield (passed trays) and ROI OK rate over [t_from, t_to) of model"""
+        conn = self.connect()
+        try:
+            return self._summary(conn, t_from, t_to, model)
+        finally:
+            conn.close()
+
+    def _summary(self, conn: sqlite3.Connection, t_from, t_to, model) -> dict:
+        where, params = self._where(t_from, t_to, model)
+        sql = (
+            "SELECT COUNT(*), COALESCE(SUM(b_pass), 0), COALESCE(SUM(n_ok), 0), "
+            f"COALESCE(SUM(n_ng), 0), COALESCE(SUM(n_none), 0) FROM inspections{where}"
+        )
+        n, n_pass, n_ok, n_ng, n_none = conn.execute(sql, params).fetchone()
+        return {
+            "n": n,
+            "n_pass": n_pass,
+            "n_ok": n_ok,
+            "n_ng": n_ng,
+            "n_none": n_none,
+            "yield": n_pass / n * 100 if n else 0.0,
+            "rate": n_ok / (n_ok + n_ng) * 100 if n_ok + n_ng else 0.0,
+        }
+
+    def roi_values(self, t_from=None, t_to=None, model=None) -> np.ndarray:
+        """(N, 6) array of t, roi, decision, dx, dy, da of the aligned ROIs"""
+        where, params = self._where(t_from, t_to, model, "r.aligned = 1")
+        sql = (
+            "SELECT i.t, r.roi, r.decision, r.dx, r.dy, r.da FROM inspections i "
+            f"JOIN rois r ON r.inspection_id = i.id{where} ORDER BY i.t, r.roi"
+        )
+        conn = self.connect()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        return np.array(rows, dtype=np.float64).reshape(-1, 6)
+
+    def format_stats(self) -> str:
+        return (
+            f"history: written={self.n_written} commits={self.n_commits} "
+            f"dropped={self.n_dropped} q={self.queue.qsize()}"
+        )
@@ -0,0 +1,65 @@
+import copy
+
+
+# Khóa trong config đã dịch: cửa sổ cảm biến (x, y, w, h) của ảnh tương ứng
+SENSOR_ROI_KEY = "sensor_roi"
+
+
+def config_roi(config: dict, margin: int = 0):
+    """Bounding box (x, y, w, h) of every shape box plus margin, None without shapes"""
+    boxes = [s["box"] for s in config.get("shapes", {}).values() if s.get("box")]
+    if not boxes:
+        return None
+    x0 = min(b[0] for b in boxes) - margin
+    y0 = min(b[1] for b in boxes) - margin
+    x1 = max(b[0] + b[2] for b in boxes) + margin
+    y1 = max(b[1] + b[3] for b in boxes) + margin
+    return int(x0), int(y0), int(x1 - x0), int(y1 - y0)
+
+
+def roi_contains(outer, inner) -> bool:
+    """True when window inner (x, y, w, h) lies inside window outer"""
+    return (
+        inner[0] >= outer[0]
+        and inner[1] >= outer[1]
+        and inner[0] + inner[2] <= outer[0] + outer[2]
+        and inner[1] + inner[3] <= outer[1] + outer[3]
+    )
+
+
+def _shift(point, dx: int, dy: int):
+    if point is None:
+        return None
+    return [point[0] - dx, point[1] - dy, *point[2:]]
+
+
+def shift_config(config: dict, roi) -> dict:
+    """
+    Copy of config in the coordinates of frames read out with sensor window
+    roi (x, y, w, h): shape boxes, origin blobs (center, box, c0, c1) and
+    the selected process box move by -x, -y. Vectors, sizes and alignment results (dx, dy, da
+    relative to the origin) are unchanged.
+    """
+    dx, dy = int(roi[0]), int(roi[1])
+    shifted = copy.copy(config)
+    shifted["shapes"] = {
+        key: {**shape, "box": _shift(shape.get("box"), dx, dy)}
+        for key, shape in config.get("shapes", {}).items()
+    }
+    if "blobs" in config:
+        shifted["blobs"] = {
+            key: {
+                **blob,
+                **{
+                    name: _shift(blob.get(name), dx, dy)
+                    for name in ("center", "box", "c0", "c1")
+                    if name in blob
+                },
+            }
+            for key, blob in config["blobs"].items()
+        }
+    if "process" in config:
+        process = config["process"]
+        shifted["process"] = {**process, "box": _shift(process.get("box"), dx, dy)}
+    shifted[SENSOR_ROI_KEY] = [int(v) for v in roi]
+    return shifted
@@ -11,10 +11,18 @@ class Settings:
             "thresh_type": "Binary",
             "block_size": 125,
             "c_index": 9,
+            "method": "Adaptive",
         },
         "morphological": {"type": "Erode", "kernel_size": 5},
         "contour": {"retrieval_mode": "EXTERNAL", "approximation_mode": "SIMPLE"},
-        "detection": {"area_min": "100000", "area_max": "150000", "distance": 15},
+        "detection": {
+            "area_min": "100000",
+            "area_max": "150000",
+            "distance": 15,
+            "pyramid_level": 0,
+            "refine": True,
+        },
+        "alignment": {"method": "Hough", "search": 48, "min_score": 0.5},
     }
 
     def __init__(self):
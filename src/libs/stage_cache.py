@@ -0,0 +1,73 @@
+import json
+import time
+
+
+def stage_key(config: dict, *sections) -> tuple:
+    """Hashable key of the config sections a stage depends on"""
+    return tuple(
+        json.dumps(config.get(section), sort_keys=True, default=str)
+        for section in sections
+    )
+
+
+class StageCache:
+    """
+    Last output of each processing stage of one image.\n
+    A stage is recomputed only when its key changes. Keys of downstream
+    stages include the keys of their upstream stages, so changing e.g. the
+    blur ksize recomputes blur -> threshold -> morphological -> contours
+    while a Hough parameter only recomputes the per-ROI circles.
+    Setting another image clears every stage.\n
+    saved accumulates the compute time of the stages served from the cache,
+    wall time + saved is the cost of the same call without cache.
+    """
+
+    def __init__(self):
+        self._image = None
+        self._stages = {}
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0.0
+
+    def set_image(self, image):
+        # So sánh theo object: ảnh mới (load / capture) luôn là array mới
+        if image is not self._image:
+            self._image = image
+            self._stages.clear()
+
+    def get(self, name: str, key, fn, *args):
+        """Return the cached output of stage name, or fn(*args) when key changed"""
+        item = self._stages.get(name)
+        if item is not None and item[0] == key:
+            self.hits += 1
+            self.saved += item[2]
+            return item[1]
+
+        t = time.perf_counter()
+        value = fn(*args)
+        self._stages[name] = (key, value, time.perf_counter() - t)
+        self.misses += 1
+        return value
+
+    def clear(self):
+        self._image = None
+        self._stages.clear()
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0.0
+
+
+class NoCache:
+    """Stand-in for StageCache that always computes (auto mode, batch)"""
+
+    def set_image(self, image):
+        pass
+
+    def get(self, name: str, key, fn, *args):
+        return fn(*args)
+
+    def clear(self):
+        pass
+
+
+NO_CACHE = NoCache()
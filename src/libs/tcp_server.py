@@ -6,6 +6,7 @@ from PyQt6.QtCore import pyqtSignal, QObject
 class Server(QObject):
     logInfoSignal = pyqtSignal(str)
     onTriggerSignal = pyqtSignal(socket.socket)
+    onStatsSignal = pyqtSignal(socket.socket)
 
     HOST = "127.0.0.1"
     PORT = 8080
@@ -65,6 +66,8 @@ class Server(QObject):
 
                 if response.lower() == "check":
                     self.onTriggerSignal.emit(client_socket)
+                elif response.lower() == "stats":
+                    self.onStatsSignal.emit(client_socket)
 
         except ConnectionResetError:
             self.logInfoSignal.emit(f"Connection with {client_address} lost.")
@@ -1,17 +1,35 @@
 from PyQt6.QtWidgets import QDialogButtonBox
 from PyQt6.QtGui import QIcon, QPixmap, QImage, QAction
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QResource
 
 import cv2
 
+# Icon đóng gói dạng .rcc nhị phân, chỉ đăng ký khi cần icon đầu tiên
+ICON_RESOURCE = "resource/icons.rcc"
+_icons = {}
+_b_resources = None
+
 
 class struct(object):
     def __init__(self, **kwargs):
         self.__dict__.update(kwargs)
 
 
+def register_resources() -> bool:
+    """Register ICON_RESOURCE once (maps the file, nothing is decoded)"""
+    global _b_resources
+    if _b_resources is None:
+        _b_resources = QResource.registerResource(ICON_RESOURCE)
+        if not _b_resources:
+            print(f"Failed to register icon resource {ICON_RESOURCE}")
+    return _b_resources
+
+
 def newIcon(icon):
-    return QIcon(":/" + icon)
+    if icon not in _icons:
+        register_resources()
+        _icons[icon] = QIcon(":/" + icon)
+    return _icons[icon]
 
 
 def ndarray2pixmap(arr):
@@ -1,16 +1,50 @@
+import time
+
+# Mốc tính thời gian khởi động, trước mọi import nặng
+T_START = time.perf_counter()
+
+import argparse
 import sys
 
 sys.path.append("libs/")
 sys.path.append("gui/")
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 from mainwindow import MainWindow
+from libs.metrics import METRICS, now
+
+
+def report_startup(win: MainWindow, t_import: float, t_window: float):
+    """Log the startup phases once the first frame of the window is shown"""
+    t_shown = METRICS.record("startup.first_window", T_START)
+    win.logInfoSignal.emit(
+        f"Startup: imports {t_import - T_START:.2f}s, "
+        f"window {t_window - t_import:.2f}s, "
+        f"first window {t_shown - T_START:.2f}s"
+    )
 
 
 def main():
-    app = QApplication(sys.argv)
-    win = MainWindow()
+    t_import = now()
+    parser = argparse.ArgumentParser(description="Vision inspection")
+    parser.add_argument(
+        "--replay", default=None, help="recording folder used instead of the camera"
+    )
+    parser.add_argument(
+        "--replay-failed",
+        action="store_true",
+        help="replay only the frames whose processing failed",
+    )
+    # Các tham số còn lại để cho Qt
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    win = MainWindow(replay_path=args.replay, replay_failed=args.replay_failed)
+    t_window = now()
     win.show()
+    # Timer 0 chạy sau khi event loop đã vẽ cửa sổ lần đầu
+    QTimer.singleShot(0, lambda: report_startup(win, t_import, t_window))
     sys.exit(app.exec())
 
 
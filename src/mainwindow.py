@@ -13,24 +13,54 @@ from PyQt6.QtCore import QStringListModel, QPointF, QDir, pyqtSignal
 
 import cv2 as cv
 import numpy as np
-from ultralytics import YOLO
 import json
 import threading
 import socket
 import time
 import os
-from collections import namedtuple
+from collections import deque, namedtuple
+from typing import TYPE_CHECKING
 
 from libs.settings import Settings
 from libs.camera_thread import CameraThread
+from cameras.replay import Replay
 from libs.image_converter import ImageConverter
-from libs.image_processor import ImageProcessor, RESULT, BLOBS
+from libs.image_processor import (
+    ImageProcessor,
+    RESULT,
+    BLOBS,
+    MAX_PYRAMID_LEVEL,
+    THRESHOLD_METHODS,
+)
 from gui.MainWindowUI_ui import Ui_MainWindow
 from libs.canvas import Canvas, WindowCanvas
 from libs.shape import Shape
 from libs.utils import ndarray2pixmap
 
 from libs.tcp_server import Server
+from libs.pipeline import InspectionPipeline, JOB
+from libs.metrics import METRICS, MetricsServer, now
+from libs.stage_cache import StageCache
+from libs.config_snapshot import ConfigPublisher, CONFIG_SNAPSHOT
+from libs.image_archiver import ImageArchiver
+from libs.result_store import RECORD, ResultStore
+from libs.frame_recorder import FrameRecorder
+from libs.image_loader import ImageLoader
+from libs.sensor_roi import SENSOR_ROI_KEY, config_roi, roi_contains, shift_config
+from libs.production_stats import ProductionStats
+from libs.log_model import LOG_LEVELS, LogFileSink, LogRingModel, guess_level
+from libs.circle_predictor import CirclePredictor
+from libs.fiducial_matcher import (
+    ALIGNMENT_METHODS,
+    DEFAULT_MIN_SCORE,
+    DEFAULT_SEARCH,
+    FIDUCIALS_FILE,
+    FiducialMatcher,
+)
+
+# ultralytics (kéo theo torch) chỉ import khi load model YOLO lần đầu
+if TYPE_CHECKING:
+    from ultralytics import YOLO
 
 
 STEP_WAIT_TRIGGER = "STEP_WAIT_TRIGGER"
@@ -39,19 +69,141 @@ STEP_PROCESS = "STEP_PROCESS"
 STEP_OUTPUT = "STEP_OUTPUT"
 STEP_RELEASE = "STEP_RELEASE"
 
+# Widget tham số của get_config, thay đổi thì publish lại config
+CONFIG_WIDGETS = [
+    "line_rows",
+    "line_columns",
+    "combo_box_type_blur",
+    "spin_box_ksize",
+    "combo_box_type_adaptive_thresh",
+    "combo_box_type_thresh",
+    "spin_box_block_size",
+    "spin_box_c_index",
+    "combo_box_threshold_method",
+    "combo_box_morph",
+    "spin_box_kernel",
+    "combo_box_retrieval_modes",
+    "combo_box_contour_approximation_modes",
+    "line_edit_area_min",
+    "line_edit_area_max",
+    "distance",
+    "spin_box_pyramid_level",
+    "check_box_refine_blobs",
+    "combo_box_type_blur_hough",
+    "spin_box_ksize_hough",
+    "combo_box_type_hough",
+    "spin_box_dp",
+    "spin_box_min_dist",
+    "spin_box_param1",
+    "spin_box_param2",
+    "spin_box_min_radius",
+    "spin_box_max_radius",
+    "combo_box_alignment_method",
+    "spin_box_alignment_search",
+]
+
+SUMMARY = namedtuple(
+    "summary",
+    ["index", "b_pass", "n_ok", "n_ng", "n_none", "n_total", "rate"],
+    defaults=[0, False, 0, 0, 0, 0, 0.0],
+)
+
+
+def summarize_result(index: int, result: RESULT) -> SUMMARY:
+    """Count decisions of one cycle into an immutable summary"""
+    c_true, c_false, c_none = result.count_decisions()
+
+    n_total = c_false + c_true
+    rate = (c_true / n_total) * 100 if n_total else 0.0
+
+    return SUMMARY(
+        index=index,
+        b_pass=c_true == n_total,
+        n_ok=c_true,
+        n_ng=c_false,
+        n_none=c_none,
+        n_total=n_total,
+        rate=rate,
+    )
+
 
 class MainWindow(QMainWindow):
     showResultTechingSignal = pyqtSignal()
-    showResultAutoSignal = pyqtSignal(RESULT)
+    showResultAutoSignal = pyqtSignal(object, object, object)
     logInfoSignal = pyqtSignal(str)
+    folderListedSignal = pyqtSignal(str, object)
+    imageLoadedSignal = pyqtSignal(str, object, int)
 
     messageboxWarningSignal = pyqtSignal(str)
 
-    def __init__(self, parent=None):
+    # Pipeline auto: số worker xử lý, kích thước queue giữa các stage
+    N_PROCESS_WORKERS = 2
+    PIPELINE_QUEUE_SIZE = 4
+    OCCUPANCY_REPORT_INTERVAL = 10.0
+    # Tần số cập nhật tối đa của giao diện auto (Hz)
+    MAX_AUTO_REFRESH_HZ = 10
+    # Chiều rộng ảnh hiển thị trên canvas auto
+    AUTO_PREVIEW_WIDTH = 1280
+    # Chu kỳ cập nhật bảng thời gian xử lý (ms), port của endpoint /metrics
+    STATS_REFRESH_INTERVAL = 1000
+    METRICS_PORT = 9108
+    YOLO_MODEL_PATH = "resource/models/detect_watch_20250210.pt"
+    # Log: số dòng giữ trên giao diện, chu kỳ đẩy log lên view (ms), file xoay vòng
+    LOG_CAPACITY = 5000
+    LOG_FLUSH_INTERVAL = 200
+    LOG_FILE = "logs/vision.log"
+    # Lưu ảnh OK / NG: thư mục, dung lượng tối đa, số frame OK giữ lại
+    ARCHIVE_DIR = "archive"
+    ARCHIVE_MAX_BYTES = 20 * 1024**3
+    ARCHIVE_KEEP_OK = 500
+    # Ghi frame thô (memory-mapped) để replay: thư mục, dung lượng mỗi segment
+    RECORD_DIR = "recordings"
+    RECORD_SEGMENT_BYTES = 4 * 1024**3
+    # Lịch sử kết quả (SQLite), khoảng thời gian tính yield trên bảng thống kê (s)
+    HISTORY_DB = "history/results.db"
+    HISTORY_WINDOW = 3600
+    # Số chu kỳ của cửa sổ trượt thống kê dx / dy / da
+    STATS_WINDOW = 500
+    # Auto: camera chỉ đọc vùng bao các shape + lề (pixel), giảm băng thông GigE
+    SENSOR_ROI = True
+    SENSOR_ROI_MARGIN = 128
+    # Canvas dựng khi tab chứa nó hiện lần đầu: tên -> layout trong ui
+    DEFERRED_CANVASES = {
+        "canvasProcessingImage": "MBIN",
+        "canvasOutputImageAuto": "ScreenAuto",
+    }
+    # Duyệt thư mục ảnh: số thread giải mã, RAM cache ảnh đã giải mã, số ảnh đọc trước
+    IMAGE_LOADER_WORKERS = 2
+    IMAGE_CACHE_BYTES = 1024**3
+    IMAGE_PREFETCH = 2
+    # Gom các thay đổi liên tiếp (kéo shape, gõ phím) trước khi publish config (ms)
+    CONFIG_PUBLISH_DELAY = 100
+
+    def __init__(self, parent=None, replay_path: str = None, replay_failed=False):
         super().__init__(parent)
+        # Thư mục recording thay cho camera thật (main.py --replay)
+        self.replay_path = replay_path
+        # Chỉ phát lại các frame xử lý lỗi (main.py --replay-failed)
+        self.replay_failed = replay_failed
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
 
+        # Log: ring buffer cho QListView, đẩy theo lô bằng timer, ghi file ở thread riêng
+        self.log_model = LogRingModel(self.LOG_CAPACITY, self)
+        self.ui.list_view_log.setModel(self.log_model)
+        self.ui.combo_box_log_level.addItems(LOG_LEVELS)
+        self.ui.combo_box_log_level.setCurrentText("INFO")
+        self.log_model.set_min_level(LOG_LEVELS["INFO"])
+        self.ui.combo_box_log_level.currentTextChanged.connect(
+            lambda name: self.log_model.set_min_level(LOG_LEVELS[name])
+        )
+        self.pending_logs = deque(maxlen=self.LOG_CAPACITY)
+        self.log_sink = LogFileSink(self.LOG_FILE)
+        self.log_sink.start()
+        self.timer_flush_log = QtCore.QTimer(self)
+        self.timer_flush_log.timeout.connect(self.flush_log)
+        self.timer_flush_log.start(self.LOG_FLUSH_INTERVAL)
+
         self.is_camera_active = False
 
         self.server = Server()
@@ -62,22 +214,29 @@ class MainWindow(QMainWindow):
         self.initialize_parameters()
 
         self.canvasOriginalImage = Canvas()
-        self.canvasProcessingImage = Canvas()
         self.canvasOutputImage = Canvas()
 
         self.ui.SRC.addWidget(WindowCanvas(self.canvasOriginalImage))
-        self.ui.MBIN.addWidget(WindowCanvas(self.canvasProcessingImage))
         self.ui.DST.addWidget(WindowCanvas(self.canvasOutputImage))
 
-        self.canvasOutputImageAuto = Canvas()
-        self.ui.ScreenAuto.addWidget(WindowCanvas(self.canvasOutputImageAuto))
+        # Canvas của tab đang ẩn (DEFERRED_CANVASES) dựng khi tab hiện lần đầu
+        self.canvases = {}
+        self.ui.TabMachine.currentChanged.connect(self.build_visible_canvases)
+        self.ui.TabScreen.currentChanged.connect(self.build_visible_canvases)
+        self.build_visible_canvases()
 
         self.b_stop = False
         self.camera_thread = None
         self.current_image = None
         self.file_paths = []
-        self.current_socket = None
-        self.b_trigger = False
+        # Liệt kê và giải mã ảnh ở thread riêng, kết quả về GUI thread qua signal
+        self.image_loader = ImageLoader(
+            on_loaded=self.imageLoadedSignal.emit,
+            on_listed=self.folderListedSignal.emit,
+            n_workers=self.IMAGE_LOADER_WORKERS,
+            max_bytes=self.IMAGE_CACHE_BYTES,
+            prefetch=self.IMAGE_PREFETCH,
+        )
         self.b_stop_auto = False
         self.b_origin = False
 
@@ -87,13 +246,108 @@ class MainWindow(QMainWindow):
 
         self.origin_result: RESULT = RESULT()
         self.teaching_result: RESULT = RESULT()
+        # Cache kết quả từng stage khi teaching, model YOLO chỉ load 1 lần
+        self.teaching_cache = StageCache()
+        # Template fiducial học từ ảnh origin của model hiện tại
+        self.fiducials: FiducialMatcher = None
+        # Hough trong cửa sổ quanh circle origin (alignment Predictive)
+        self.circle_predictor = CirclePredictor()
+        self.model_yolo: "YOLO" = None
+
+        self.pipeline = InspectionPipeline(
+            grab_fn=self.step_preprocess,
+            process_fn=self.step_process,
+            output_fn=self.step_output,
+            n_workers=self.N_PROCESS_WORKERS,
+            queue_size=self.PIPELINE_QUEUE_SIZE,
+            on_drop=self.on_drop_job,
+        )
+
+        # Lưu ảnh ở thread riêng, queue đầy thì bỏ qua frame chứ không chờ
+        self.archiver = ImageArchiver(
+            self.ARCHIVE_DIR,
+            max_bytes=self.ARCHIVE_MAX_BYTES,
+            keep_ok=self.ARCHIVE_KEEP_OK,
+        )
+
+        # Frame thô của chế độ auto, bật / tắt bằng check_box_record
+        self.recorder = FrameRecorder(
+            self.RECORD_DIR, segment_bytes=self.RECORD_SEGMENT_BYTES
+        )
+
+        # Lịch sử mọi lần kiểm tra, ghi theo lô ở thread riêng
+        self.model_name = ""
+        self.result_store = ResultStore(self.HISTORY_DB)
+        if not self.result_store.start():
+            self.logInfoSignal.emit(f"Error opening history {self.HISTORY_DB}")
+
+        # Thống kê cộng dồn theo từng chu kỳ (cửa sổ trượt, theo ca, SPC)
+        self.production_stats = ProductionStats(window=self.STATS_WINDOW)
+
+        # Config đã dịch theo sensor ROI: ((version, roi), config)
+        self.roi_config = (None, None)
+        # Version config đã kiểm tra với cửa sổ cảm biến hiện tại
+        self.roi_version = None
+
+        self.pending_summary: SUMMARY = None
+        self.pending_result: RESULT = None
+        self.pending_config: dict = None
+        self.auto_config: dict = None
+        self.shown_pass = None
+        self.timer_refresh_auto = QtCore.QTimer(self)
+        self.timer_refresh_auto.timeout.connect(self.refresh_auto_ui)
+        self.timer_refresh_auto.start(int(1000 / self.MAX_AUTO_REFRESH_HZ))
+
+        # Config bất biến cho các thread worker, chỉ GUI thread publish
+        self.config_publisher = ConfigPublisher()
+        self.timer_publish_config = QtCore.QTimer(self)
+        self.timer_publish_config.setSingleShot(True)
+        self.timer_publish_config.setInterval(self.CONFIG_PUBLISH_DELAY)
+        self.timer_publish_config.timeout.connect(self.publish_config)
+        self.connect_config_changes()
+
+        self.metrics_server = MetricsServer(METRICS, port=self.METRICS_PORT)
+        if self.metrics_server.start():
+            server = self.metrics_server
+            self.logInfoSignal.emit(
+                f"Metrics: http://{server.host}:{server.port}/metrics"
+            )
+        self.timer_refresh_stats = QtCore.QTimer(self)
+        self.timer_refresh_stats.timeout.connect(self.refresh_stats)
+        self.timer_refresh_stats.start(self.STATS_REFRESH_INTERVAL)
 
         self.update_model_list()
+        self.publish_config()
+
+    @property
+    def canvasProcessingImage(self) -> Canvas:
+        return self.get_canvas("canvasProcessingImage")
+
+    @property
+    def canvasOutputImageAuto(self) -> Canvas:
+        return self.get_canvas("canvasOutputImageAuto")
+
+    def get_canvas(self, name: str) -> Canvas:
+        """Deferred canvas `name`, built in its layout on first use"""
+        canvas = self.canvases.get(name)
+        if canvas is None:
+            canvas = self.canvases[name] = Canvas()
+            layout = getattr(self.ui, self.DEFERRED_CANVASES[name])
+            layout.addWidget(WindowCanvas(canvas))
+        return canvas
+
+    def build_visible_canvases(self, *args):
+        if self.ui.TabMachine.currentWidget() is self.ui.TabAuto:
+            self.get_canvas("canvasOutputImageAuto")
+        elif self.ui.TabScreen.currentWidget() is self.ui.TabMBIN:
+            self.get_canvas("canvasProcessingImage")
 
     def setup_connections(self):
         """Set up signal-slot connections"""
         self.showResultTechingSignal.connect(self.show_result_teaching)
-        self.showResultAutoSignal.connect(self.show_result_auto)
+        self.showResultAutoSignal.connect(self.on_result_auto)
+        self.folderListedSignal.connect(self.on_folder_listed)
+        self.imageLoadedSignal.connect(self.on_image_loaded)
 
         self.ui.button_open_camera.clicked.connect(self.on_clicked_but_open_camera)
         self.ui.button_camera.clicked.connect(self.on_clicked_button_start_camera)
@@ -112,26 +366,77 @@ class MainWindow(QMainWindow):
         self.logInfoSignal.connect(self.view_log_info)
         self.server.logInfoSignal.connect(self.view_log_info)
         self.server.onTriggerSignal.connect(self.on_trigger)
+        self.server.onStatsSignal.connect(self.on_stats_request)
         self.ui.button_start.clicked.connect(self.on_start_auto)
         self.ui.button_stop.clicked.connect(self.on_stop_auto)
+        self.ui.check_box_record.toggled.connect(self.on_toggled_record)
 
         self.messageboxWarningSignal.connect(
             lambda msg: QMessageBox.warning(self, "WARNING", msg)
         )
 
+    def connect_config_changes(self):
+        """Schedule publish_config on every parameter widget and shape change"""
+        for name in CONFIG_WIDGETS:
+            widget = getattr(self.ui, name)
+            if isinstance(widget, QtWidgets.QComboBox):
+                widget.currentIndexChanged.connect(self.schedule_publish_config)
+            elif isinstance(widget, QtWidgets.QLineEdit):
+                widget.textChanged.connect(self.schedule_publish_config)
+            elif isinstance(widget, QtWidgets.QCheckBox):
+                widget.toggled.connect(self.schedule_publish_config)
+            else:
+                widget.valueChanged.connect(self.schedule_publish_config)
+
+        canvas = self.canvasOriginalImage
+        canvas.newShapeSignal.connect(self.schedule_publish_config)
+        canvas.deleteShapeSignal.connect(self.schedule_publish_config)
+        canvas.moveShapeSignal.connect(self.schedule_publish_config)
+        canvas.changeShapeSignal.connect(self.schedule_publish_config)
+        canvas.actionSignal.connect(self.schedule_publish_config)
+        # Process và shape đang chọn cũng nằm trong snapshot
+        canvas.selectedShapeSignal.connect(self.schedule_publish_config)
+        self.ui.combo_box_process_name.currentIndexChanged.connect(
+            self.schedule_publish_config
+        )
+
+    def schedule_publish_config(self, *args):
+        # Khởi động lại timer: chỉ publish sau thay đổi cuối cùng
+        self.timer_publish_config.start()
+
+    def publish_config(self):
+        """Publish the current widget config as a new snapshot (GUI thread)"""
+        self.timer_publish_config.stop()
+        config = self.get_config()
+        if config:
+            # Worker đọc process và ROI đang chọn từ snapshot, không đọc widget
+            canvas = self.canvasOriginalImage
+            index = canvas.idSelected
+            config["process"] = {
+                "name": self.ui.combo_box_process_name.currentText(),
+                "box": canvas[index].cvBox if index is not None else None,
+            }
+        if self.config_publisher.publish(config):
+            self.logInfoSignal.emit(f"Config v{self.config_publisher.version}")
+
     """
     Logic Layout Auto
     """
 
     def on_trigger(self, s: socket.socket):
-        if self.b_trigger:
-            return
-        self.b_trigger = True
-        self.current_socket = s
+        if not self.pipeline.submit(s):
+            # Pipeline đầy hoặc chưa chạy: trả lời ngay để client không bị treo
+            self.logInfoSignal.emit("Trigger rejected: pipeline is busy")
+            self.server.send_message(s, "None")
+
+    def on_drop_job(self, job: JOB):
+        """Reply "None" to a trigger discarded when auto mode stops"""
+        self.logInfoSignal.emit(f"Trigger [{job.index}] dropped: pipeline stopped")
+        self.server.send_message(job.socket, "None")
 
-    def off_trigger(self):
-        self.b_trigger = False
-        self.current_socket = None
+    def on_stats_request(self, s: socket.socket):
+        """Reply to the "stats" command with the production statistics as JSON"""
+        self.server.send_message(s, json.dumps(self.production_stats.snapshot()))
 
     def start_loop_auto(self):
         """Khởi động camera và bắt đầu vòng lặp"""
@@ -144,6 +449,7 @@ class MainWindow(QMainWindow):
             # Khởi động camera thread mới
             if self.camera_thread is None or not self.camera_thread.b_open:
                 self.open_camera()
+            self.apply_sensor_roi()
 
             self.on_stop_teaching()
 
@@ -152,6 +458,54 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.logInfoSignal.emit(f"Error starting auto mode: {str(e)}")
 
+    def apply_sensor_roi(self, snapshot: CONFIG_SNAPSHOT = None):
+        """Read out only the bounding box of the model shapes in auto mode"""
+        if not self.SENSOR_ROI or self.camera_thread is None:
+            return
+        snapshot = snapshot or self.config_publisher.snapshot
+        self.roi_version = snapshot.version
+        roi = config_roi(snapshot.config, self.SENSOR_ROI_MARGIN)
+        camera = self.camera_thread.camera
+        if roi is None:
+            # Không còn shape: đọc full frame
+            if camera.get_roi() is not None:
+                camera.set_roi(None)
+            return
+        if not camera.set_roi(roi):
+            self.logInfoSignal.emit(
+                f"Sensor ROI not applied ({camera.get_error() or 'not supported'}), "
+                "reading the full frame"
+            )
+            # Cửa sổ cũ có thể không chứa shape mới
+            if camera.get_roi() is not None:
+                camera.set_roi(None)
+            return
+        self.logInfoSignal.emit(f"Sensor ROI (x, y, w, h): {camera.get_roi()}")
+
+    def check_sensor_roi(self, snapshot: CONFIG_SNAPSHOT):
+        """
+        Shapes edited during auto mode must stay inside the sensor window,
+        otherwise the window is applied again from the new config.
+        """
+        self.roi_version = snapshot.version
+        roi = self.camera_thread.camera.get_roi()
+        if roi is None:
+            return
+        needed = config_roi(snapshot.config)
+        if needed is None or not roi_contains(roi, needed):
+            self.logInfoSignal.emit(
+                f"Shapes outside sensor ROI {roi}, applying config v{snapshot.version}"
+            )
+            self.apply_sensor_roi(snapshot)
+
+    def get_roi_config(self, snapshot: CONFIG_SNAPSHOT, roi) -> dict:
+        """Config of snapshot in the coordinates of frames read out with roi"""
+        key = (snapshot.version, tuple(roi))
+        if self.roi_config[0] != key:
+            # Chỉ dịch lại khi config hoặc ROI đổi, các trigger khác dùng chung
+            self.roi_config = (key, shift_config(snapshot.config, roi))
+        return self.roi_config[1]
+
     def stop_loop_auto(self):
         """Dừng vòng lặp xử lý và camera"""
         try:
@@ -169,91 +523,171 @@ class MainWindow(QMainWindow):
         self.ui.button_start.setEnabled(True)
 
     def loop_auto(self):
+        """
+        Run the inspection pipeline until auto mode is stopped.\n
+        STEP_PREPROCESS (grab), STEP_PROCESS and STEP_OUTPUT run as pipeline
+        stages, so back-to-back triggers overlap instead of waiting for
+        STEP_RELEASE of the previous one.
+        """
         self.b_stop_auto = False
-        step = STEP_WAIT_TRIGGER
-        before_step = ""
-        config: dict = None
-        mat: np.ndarray = None
-        result: RESULT = None
-
         self.logInfoSignal.emit("Auto processing started")
+        self.archiver.start()
+        self.pipeline.start()
 
-        while True:
-            if before_step != step:
-                self.logInfoSignal.emit(step)
-                before_step = step
-
-            if step == STEP_WAIT_TRIGGER:
-                if self.b_trigger:
-                    step = STEP_PREPROCESS
+        t_report = time.time()
+        while not self.b_stop_auto:
+            time.sleep(0.05)
 
-            elif step == STEP_PREPROCESS:
-                config = self.get_config()
-                _, mat = self.camera_thread.camera.grab()
+            if time.time() - t_report > self.OCCUPANCY_REPORT_INTERVAL:
+                t_report = time.time()
+                self.logInfoSignal.emit(self.pipeline.format_occupancy())
+                self.logInfoSignal.emit(self.circle_predictor.format_stats())
+                self.logInfoSignal.emit(self.archiver.format_stats())
+                self.logInfoSignal.emit(self.result_store.format_stats())
+                if self.recorder.running:
+                    self.logInfoSignal.emit(self.recorder.format_stats())
+
+        self.pipeline.stop()
+        self.archiver.stop()
+        self.logInfoSignal.emit("Auto processing stopped")
 
-                step = STEP_PROCESS
+    def step_preprocess(self, job: JOB) -> JOB:
+        self.logInfoSignal.emit(f"{STEP_PREPROCESS} [{job.index}]")
+        t = now()
+        # Snapshot do GUI thread publish, không đọc widget từ thread worker
+        snapshot = self.config_publisher.snapshot
+        config = snapshot.config
+        t = METRICS.record("auto.config", t)
+        camera = self.camera_thread.camera
+        if self.SENSOR_ROI and snapshot.version != self.roi_version:
+            # Trước khi grab: frame của trigger này đã theo cửa sổ mới
+            self.check_sensor_roi(snapshot)
+        # Trigger luôn đọc full resolution, kể cả khi live view đang ở preview
+        _, mat = camera.grab_full()
+        t = METRICS.record("auto.grab", t)
+        # Ảnh đọc theo sensor ROI: toạ độ config dịch theo góc ROI
+        roi = camera.get_roi()
+        if roi is not None:
+            config = self.get_roi_config(snapshot, roi)
+            METRICS.record("auto.roi_config", t)
+        return job._replace(config=config, mat=mat)
+
+    def step_process(self, job: JOB) -> JOB:
+        self.logInfoSignal.emit(f"{STEP_PROCESS} [{job.index}]")
+        if job.mat is None:
+            result = RESULT()
+        else:
+            t = now()
+            result = self.process_image(mat=job.mat, config=job.config)
+            METRICS.record("auto.process", t)
+        return job._replace(result=result)
+
+    def step_output(self, job: JOB):
+        self.logInfoSignal.emit(f"{STEP_OUTPUT} [{job.index}]")
+        result: RESULT = job.result
+        t = now()
+        if result is not None:
+            self.server.send_message(job.socket, result.msg)
+            METRICS.record("auto.send", t)
+            # Chỉ post 1 bản tóm tắt bất biến sang GUI thread, không gọi widget ở đây
+            summary = summarize_result(job.index, result)
+            self.showResultAutoSignal.emit(summary, result, job.config)
+            # Sau khi đã trả kết quả: lưu ảnh và lịch sử không làm chậm trigger
+            self.archiver.submit(job.index, result, job.config, summary.b_pass)
+            self.production_stats.update(result.table, summary.b_pass)
+            self.result_store.add(
+                RECORD(
+                    t=time.time(),
+                    model=self.model_name,
+                    index=job.index,
+                    b_pass=summary.b_pass,
+                    n_ok=summary.n_ok,
+                    n_ng=summary.n_ng,
+                    n_none=summary.n_none,
+                    msg=result.msg,
+                    table=result.table,
+                )
+            )
+        else:
+            self.server.send_message(job.socket, "None")
+        if job.mat is not None:
+            # Ghi cả frame xử lý lỗi, đánh dấu failed để replay tìm lại
+            self.recorder.record(
+                job.mat,
+                trigger=job.index,
+                model=self.model_name,
+                t_mono=job.t_trigger,
+                roi=job.config.get(SENSOR_ROI_KEY) if job.config else None,
+                failed=result is None,
+            )
 
-            elif step == STEP_PROCESS:
-                if mat is None:
-                    result = RESULT()
-                else:
-                    result = self.process_image(mat=mat, config=config)
-
-                step = STEP_OUTPUT
-                pass
-
-            elif step == STEP_OUTPUT:
-                if result is not None:
-                    self.server.send_message(self.current_socket, result.msg)
-                    self.showResultAutoSignal.emit(result)
-
-                    c_true = 0
-                    c_false = 0
-                    c_none = 0
-
-                    # print(f"Decision: {result.decision}")
-
-                    for decision in result.decision:
-                        if decision == True:
-                            c_true += 1
-                        elif decision == False:
-                            c_false += 1
-                        else:
-                            c_none += 1
-
-                    if c_true == c_true + c_false:
-                        self.ui.label_checked.setText("Pass")
-                        self.ui.label_checked.setStyleSheet("background-color: green")
-                    else:
-                        self.ui.label_checked.setText("Fail")
-                        self.ui.label_checked.setStyleSheet("background-color: red")
-
-                    n_total = c_false + c_true
-
-                    self.ui.label_ok.setText(f"Aligment-OK: {c_true}")
-                    self.ui.label_ng.setText(f"Aligment-NG: {c_false}")
-                    self.ui.label_total.setText(f"Aligments: {n_total}")
-                    self.ui.label_rate.setText(f"Rate: {(c_true / (n_total)) * 100 }%")
+        # Trigger -> trả kết quả, gồm cả thời gian chờ trong các queue
+        METRICS.record("auto.cycle", job.t_trigger)
+        self.logInfoSignal.emit(f"{STEP_RELEASE} [{job.index}]")
+
+    def on_result_auto(self, summary: SUMMARY, result: RESULT, config: dict):
+        """Keep only the latest cycle, the refresh timer applies it"""
+        self.pending_summary = summary
+        self.pending_result = result
+        self.pending_config = config
+
+    def refresh_auto_ui(self):
+        """Apply the latest cycle summary to the auto tab (GUI thread, rate limited)"""
+        summary: SUMMARY = self.pending_summary
+        result: RESULT = self.pending_result
+        self.auto_config = self.pending_config
+        self.pending_summary = None
+        self.pending_result = None
+
+        if summary is not None:
+            if summary.b_pass != self.shown_pass:
+                # setStyleSheet tính lại style, chỉ gọi khi trạng thái đổi
+                self.shown_pass = summary.b_pass
+                if summary.b_pass:
+                    self.ui.label_checked.setText("Pass")
+                    self.ui.label_checked.setStyleSheet("background-color: green")
                 else:
-                    self.server.send_message(self.current_socket, "None")
-
-                step = STEP_RELEASE
-
-            elif step == STEP_RELEASE:
-                self.off_trigger()
-                config = None
-                mat = None
-                result = None
-                step = STEP_WAIT_TRIGGER
-
-            time.sleep(0.05)
-
-            if self.b_stop_auto:
-                break
+                    self.ui.label_checked.setText("Fail")
+                    self.ui.label_checked.setStyleSheet("background-color: red")
+
+            self.ui.label_ok.setText(f"Aligment-OK: {summary.n_ok}")
+            self.ui.label_ng.setText(f"Aligment-NG: {summary.n_ng}")
+            self.ui.label_total.setText(f"Aligments: {summary.n_total}")
+            self.ui.label_rate.setText(f"Rate: {summary.rate}%")
+
+        if result is not None:
+            self.show_result_auto(result)
+
+    def refresh_stats(self):
+        """Show the rolling span percentiles and recent yield on the auto tab"""
+        if self.ui.text_stats.isVisible():
+            text = METRICS.format_table()
+            text += "\n\n" + self.production_stats.format_text()
+            # Summary do writer thread của ResultStore tính, không query trên GUI
+            s = self.result_store.recent
+            if self.result_store.running and s is not None:
+                text += (
+                    f"\n\nLast {s['window'] // 60} min {s['model']}: "
+                    f"yield {s['yield']:.1f}% ({s['n_pass']}/{s['n']} trays), "
+                    f"ROI OK rate {s['rate']:.1f}%"
+                )
+            self.ui.text_stats.setPlainText(text)
 
-        self.logInfoSignal.emit("Auto processing stopped")
+    def on_toggled_record(self, checked: bool):
+        if not checked:
+            self.recorder.stop()
+            self.logInfoSignal.emit(
+                f"Recording stopped: {self.recorder.format_stats()}"
+            )
+        elif self.recorder.start():
+            self.logInfoSignal.emit(f"Recording to {self.recorder.folder}")
+        else:
+            self.logInfoSignal.emit(f"Error starting recording in {self.RECORD_DIR}")
+            self.ui.check_box_record.setChecked(False)
 
     def on_start_auto(self):
+        # Shape sửa bằng phím / menu không phát signal, publish lần cuối trước khi chạy
+        self.publish_config()
         self.start_loop_auto()
 
     def on_stop_auto(self):
@@ -269,7 +703,23 @@ class MainWindow(QMainWindow):
         self.logInfoSignal.emit("Stopped server")
 
     def view_log_info(self, mess):
-        self.ui.list_view_log.addItem(mess)
+        level = guess_level(mess, debug_prefixes=("STEP_",))
+        self.log_sink.log(level, mess)
+        # deque có maxlen: GUI bị treo cũng không làm log tăng không giới hạn
+        self.pending_logs.append((time.time(), level, mess))
+
+    def flush_log(self):
+        """Move the pending messages to the log view in one batch"""
+        if not self.pending_logs:
+            return
+        records = [self.pending_logs.popleft() for _ in range(len(self.pending_logs))]
+
+        # Chỉ tự cuộn khi người dùng đang xem dòng cuối
+        scroll_bar = self.ui.list_view_log.verticalScrollBar()
+        b_bottom = scroll_bar.value() >= scroll_bar.maximum()
+        self.log_model.append_records(records)
+        if b_bottom:
+            self.ui.list_view_log.scrollToBottom()
 
     """
     Logic Layout Teaching
@@ -300,6 +750,7 @@ class MainWindow(QMainWindow):
 
         self.ui.combo_box_type_adaptive_thresh.addItems(self.adaptive_thresh_types)
         self.ui.combo_box_type_thresh.addItems(self.thresh_types)
+        self.ui.combo_box_threshold_method.addItems(THRESHOLD_METHODS)
 
         self.ui.spin_box_block_size.setRange(0, 10000)
         self.ui.spin_box_block_size.setSingleStep(2)
@@ -329,6 +780,9 @@ class MainWindow(QMainWindow):
         self.ui.line_edit_area_max.setText("150000")
         self.ui.distance.setRange(0, 100)
         self.ui.distance.setValue(15)
+        self.ui.spin_box_pyramid_level.setRange(0, MAX_PYRAMID_LEVEL)
+        self.ui.spin_box_pyramid_level.setValue(0)
+        self.ui.check_box_refine_blobs.setChecked(True)
 
         """
         Hough Circle
@@ -364,10 +818,15 @@ class MainWindow(QMainWindow):
         self.ui.spin_box_min_radius.setValue(1)
         self.ui.spin_box_max_radius.setValue(20)
 
+        # Alignment
+        self.ui.combo_box_alignment_method.addItems(ALIGNMENT_METHODS)
+        self.ui.spin_box_alignment_search.setRange(4, 500)
+        self.ui.spin_box_alignment_search.setValue(DEFAULT_SEARCH)
+
     def get_config(self) -> dict:
         """Get current configuration from UI parameters"""
         shapes: list[Shape] = self.canvasOriginalImage.shapes
-        # blobs: BLOBS =
+        origin_blobs: BLOBS = self.origin_result.blobs
         try:
             config = {
                 # TrapInput
@@ -384,6 +843,7 @@ class MainWindow(QMainWindow):
                     "thresh_type": self.ui.combo_box_type_thresh.currentText(),
                     "block_size": self.ui.spin_box_block_size.value(),
                     "c_index": self.ui.spin_box_c_index.value(),
+                    "method": self.ui.combo_box_threshold_method.currentText(),
                 },
                 # Morphological parameters
                 "morphological": {
@@ -400,6 +860,8 @@ class MainWindow(QMainWindow):
                     "area_min": self.ui.line_edit_area_min.text(),
                     "area_max": self.ui.line_edit_area_max.text(),
                     "distance": self.ui.distance.value(),
+                    "pyramid_level": self.ui.spin_box_pyramid_level.value(),
+                    "refine": self.ui.check_box_refine_blobs.isChecked(),
                 },
                 # Shape
                 "shapes": {
@@ -418,13 +880,29 @@ class MainWindow(QMainWindow):
                     "min_radius": self.ui.spin_box_min_radius.value(),
                     "max_radius": self.ui.spin_box_max_radius.value(),
                 },
+                # Alignment
+                "alignment": {
+                    "method": self.ui.combo_box_alignment_method.currentText(),
+                    "search": self.ui.spin_box_alignment_search.value(),
+                    "min_score": DEFAULT_MIN_SCORE,
+                },
                 # Blobs
                 "blobs": {
                     str(i): {
-                        "center": self.origin_result.blobs.centers[i],
-                        "vector": self.origin_result.blobs.vectors[i],
+                        "center": center,
+                        "vector": vector,
+                        "box": box,
+                        "c0": circles[0] if circles else None,
+                        "c1": circles[1] if circles else None,
                     }
-                    for i in range(len(self.origin_result.blobs.centers))
+                    for i, (center, vector, box, circles) in enumerate(
+                        zip(
+                            origin_blobs.centers,
+                            origin_blobs.vectors,
+                            origin_blobs.boxes,
+                            origin_blobs.circles,
+                        )
+                    )
                 },
             }
             return config
@@ -468,6 +946,12 @@ class MainWindow(QMainWindow):
                 self.ui.spin_box_block_size.setValue(config["threshold"]["block_size"])
                 self.ui.spin_box_c_index.setValue(config["threshold"]["c_index"])
 
+                method_index = self.ui.combo_box_threshold_method.findText(
+                    config["threshold"].get("method", THRESHOLD_METHODS[0])
+                )
+                if method_index >= 0:
+                    self.ui.combo_box_threshold_method.setCurrentIndex(method_index)
+
             # Morphological parameters
             if "morphological" in config:
                 morph_index = self.ui.combo_box_morph.findText(
@@ -500,6 +984,12 @@ class MainWindow(QMainWindow):
                 self.ui.line_edit_area_min.setText(str(config["detection"]["area_min"]))
                 self.ui.line_edit_area_max.setText(str(config["detection"]["area_max"]))
                 self.ui.distance.setValue(config["detection"]["distance"])
+                self.ui.spin_box_pyramid_level.setValue(
+                    config["detection"].get("pyramid_level", 0)
+                )
+                self.ui.check_box_refine_blobs.setChecked(
+                    config["detection"].get("refine", True)
+                )
 
             # Shape
             self.canvasOriginalImage.shapes.clear()
@@ -543,15 +1033,35 @@ class MainWindow(QMainWindow):
                 self.ui.spin_box_min_radius.setValue(hough_config.get("min_radius", 1))
                 self.ui.spin_box_max_radius.setValue(hough_config.get("max_radius", 20))
 
+            # Alignment
+            alignment_config = config.get("alignment", {})
+            alignment_index = self.ui.combo_box_alignment_method.findText(
+                alignment_config.get("method", ALIGNMENT_METHODS[0])
+            )
+            if alignment_index >= 0:
+                self.ui.combo_box_alignment_method.setCurrentIndex(alignment_index)
+            self.ui.spin_box_alignment_search.setValue(
+                alignment_config.get("search", DEFAULT_SEARCH)
+            )
+
             # Blobs
             if "blobs" in config:
                 blobs: dict = config["blobs"]
                 origin_blobs = BLOBS(
                     vectors=[blobs[i]["vector"] for i in blobs],
                     centers=[blobs[i]["center"] for i in blobs],
+                    # Box và circles origin cho alignment Predictive (model cũ không có)
+                    boxes=[blobs[i].get("box") for i in blobs],
+                    circles=[
+                        (blobs[i]["c0"], blobs[i]["c1"]) if blobs[i].get("c0") else None
+                        for i in blobs
+                    ],
                 )
                 self.origin_result = RESULT(blobs=origin_blobs)
 
+            # Shapes và origin không phát signal khi nạp lại
+            self.schedule_publish_config()
+
             # Process image with new configuration
         except Exception as e:
             QMessageBox.critical(
@@ -647,7 +1157,14 @@ class MainWindow(QMainWindow):
 
             config = self.settings.load_model(model_name)
             if config:
+                if model_name != self.model_name:
+                    self.production_stats.reset()
+                self.model_name = model_name
+                self.result_store.watch(model_name, self.HISTORY_WINDOW)
                 self.set_config(config)
+                self.fiducials = FiducialMatcher.load(
+                    os.path.join(self.settings.models_dir, model_name, FIDUCIALS_FILE)
+                )
                 self.statusBar().showMessage(
                     f"Model '{model_name}' loaded successfully", 5000
                 )
@@ -700,6 +1217,12 @@ class MainWindow(QMainWindow):
 
             # Save configuration
             if self.settings.save_model(model_name, config):
+                if self.fiducials is not None:
+                    self.fiducials.save(
+                        os.path.join(
+                            self.settings.models_dir, model_name, FIDUCIALS_FILE
+                        )
+                    )
                 QMessageBox.information(
                     self, "Success", f"Model '{model_name}' saved successfully"
                 )
@@ -747,6 +1270,10 @@ class MainWindow(QMainWindow):
         self.origin_result: RESULT = self.image_processor.find_result(
             self.current_image, self.get_config(), b_origin=True
         )
+        self.fiducials = FiducialMatcher.learn(
+            self.current_image, self.origin_result.table
+        )
+        self.publish_config()
 
         self.save_model_config()
 
@@ -757,26 +1284,51 @@ class MainWindow(QMainWindow):
         self.b_stop = True
 
     def thread_loop_process(self):
+        """
+        Re-process current_image while teaching.\n
+        Nothing is recomputed while image, config version and process are unchanged,
+        otherwise teaching_cache only reruns the stages downstream of the
+        changed parameters.
+        """
         self.b_stop = False
 
-        model = self.load_model_yolo("resource/models/detect_watch_20250210.pt")
+        if self.model_yolo is None:
+            self.model_yolo = self.load_model_yolo(self.YOLO_MODEL_PATH)
 
+        last_state = None
         while True:
-            config = self.get_config()
-            self.teaching_result: RESULT | BLOBS = self.process_image(
-                mat=self.current_image, model=model, config=config
-            )
-            if self.teaching_result is not None:
-                self.showResultTechingSignal.emit()
+            snapshot: CONFIG_SNAPSHOT = self.config_publisher.snapshot
+            config = snapshot.config
+            state = (self.current_image, snapshot.version)
+            if (
+                last_state is None
+                or state[0] is not last_state[0]
+                or state[1:] != last_state[1:]
+            ):
+                last_state = state
+                self.teaching_result: RESULT | BLOBS = self.process_image(
+                    mat=self.current_image,
+                    model=self.model_yolo,
+                    config=config,
+                    b_debug=True,
+                    cache=self.teaching_cache,
+                )
+                if self.teaching_result is not None:
+                    self.showResultTechingSignal.emit()
 
             if self.b_stop:
                 break
 
             time.sleep(0.5)
 
+        # Giải phóng ảnh trung gian full-resolution
+        self.teaching_cache.clear()
+
     def load_model_yolo(self, model_path):
         # Load YOLO model
         # model = YOLO("resource/models/detect_watch_20250210.pt")
+        from ultralytics import YOLO
+
         model = YOLO(model_path)
 
         mat = np.zeros((640, 640, 3), dtype=np.uint8)
@@ -785,19 +1337,34 @@ class MainWindow(QMainWindow):
 
         return model
 
-    def process_image(self, mat=None, model: YOLO = None, config: dict = None):
+    def process_image(
+        self,
+        mat=None,
+        model: "YOLO" = None,
+        config: dict = None,
+        b_debug=False,
+        cache: StageCache = None,
+    ):
         """Process image with thread safety"""
         time_start = time.time()
         if mat is None or config is None:
             return None
 
         try:
-            process_name = self.ui.combo_box_process_name.currentText()
+            process = config.get("process") or {}
+            process_name = process.get("name", "ProcessAll")
 
             if process_name == "ProcessAll":
                 # Find and draw contours
                 result: RESULT = self.image_processor.find_result(
-                    mat, config, model=None, b_origin=False
+                    mat,
+                    config,
+                    model=None,
+                    b_origin=False,
+                    b_debug=b_debug,
+                    cache=cache,
+                    fiducials=self.fiducials,
+                    predictor=self.circle_predictor,
                 )
 
                 # msgs = result.msg.split("_")
@@ -809,7 +1376,14 @@ class MainWindow(QMainWindow):
             if process_name == "ProcessAllwithYOLO":
                 # Find and draw contours
                 result: RESULT = self.image_processor.find_result(
-                    mat, config, model, b_origin=False
+                    mat,
+                    config,
+                    model,
+                    b_origin=False,
+                    b_debug=b_debug,
+                    cache=cache,
+                    fiducials=self.fiducials,
+                    predictor=self.circle_predictor,
                 )
 
                 # msgs = result.msg.split("_")
@@ -821,7 +1395,7 @@ class MainWindow(QMainWindow):
             if process_name == "FindBlobs":
                 # Find and draw contours
                 result: BLOBS = self.image_processor.find_blobs(
-                    mat, config, b_debug=True
+                    mat, config, b_debug=True, cache=cache
                 )
 
                 # print("Time Processing: ", time.time() - time_start)
@@ -830,7 +1404,7 @@ class MainWindow(QMainWindow):
             if process_name == "FindBlobswithYOLO":
                 # Find and draw contours
                 result: BLOBS = self.image_processor.find_blobs_with_yolo(
-                    mat, model, config, b_debug=True
+                    mat, model, config, b_debug=True, cache=cache
                 )
 
                 # print("Time Processing: ", time.time() - time_start)
@@ -838,11 +1412,8 @@ class MainWindow(QMainWindow):
 
             if process_name == "FindCircles":
                 # Find and draw contours
-                index = self.canvasOriginalImage.idSelected
-                if index is not None:
-                    current_shape: Shape = self.canvasOriginalImage[index]
-                    roi = current_shape.cvBox
-
+                roi = process.get("box")
+                if roi is not None:
                     result: BLOBS = self.image_processor.find_circles(
                         mat, roi, config, b_debug=True
                     )
@@ -856,9 +1427,30 @@ class MainWindow(QMainWindow):
 
     def show_result_auto(self, result: RESULT):
         try:
+            # Không chuyển đổi ảnh full-resolution khi canvas auto bị ẩn / chưa dựng
+            if (
+                "canvasOutputImageAuto" not in self.canvases
+                or not self.canvasOutputImageAuto.isVisible()
+            ):
+                return
+
             # Convert and scale the original image
             if result.dst is not None:
+                self.canvasOutputImageAuto.clear_overlay()
                 self.canvasOutputImageAuto.load_pixmap(ndarray2pixmap(result.dst))
+            elif result.src is not None:
+                # Ảnh thu nhỏ + overlay vector, không cấp phát bản sao full-frame
+                src = result.src
+                scale = min(self.AUTO_PREVIEW_WIDTH / src.shape[1], 1.0)
+                if scale < 1.0:
+                    src = cv.resize(
+                        src, None, fx=scale, fy=scale, interpolation=cv.INTER_AREA
+                    )
+                overlay = self.image_processor.output_overlay(
+                    result.blobs, self.auto_config
+                )
+                self.canvasOutputImageAuto.set_overlay(overlay, scale)
+                self.canvasOutputImageAuto.load_pixmap(ndarray2pixmap(src))
 
         except Exception as e:
             print(f"Error updating UI: {str(e)}")
@@ -891,7 +1483,16 @@ class MainWindow(QMainWindow):
     def open_camera(self):
         """Open camera and start processing"""
         try:
-            self.camera_thread = CameraThread()
+            camera = None
+            if self.replay_path:
+                camera = Replay(
+                    config={
+                        "id": self.replay_path,
+                        "loop": True,
+                        "failed_only": self.replay_failed,
+                    }
+                )
+            self.camera_thread = CameraThread(camera=camera)
             self.camera_thread.open_camera()
             self.ui.button_camera.setEnabled(True)
             self.ui.button_capture.setEnabled(True)
@@ -902,6 +1503,7 @@ class MainWindow(QMainWindow):
     def close_camera(self):
         """Open camera and start processing"""
         try:
+            self.logInfoSignal.emit(self.camera_thread.camera.format_stats())
             self.camera_thread.close_camera()
             self.ui.button_camera.setEnabled(False)
             self.ui.button_open_camera.setText("Open Camera")
@@ -950,20 +1552,42 @@ class MainWindow(QMainWindow):
                 # self.current_image = None
                 # Clear the labels
                 self.canvasOutputImage.clear_pixmap()
-                self.canvasProcessingImage.clear_pixmap()
+                # Canvas MBIN chưa mở thì chưa tạo, không có gì để xoá
+                if "canvasProcessingImage" in self.canvases:
+                    self.canvasProcessingImage.clear_pixmap()
 
         except Exception as e:
             QMessageBox.critical(
                 self, "Camera Error", f"Failed to stop camera: {str(e)}"
             )
 
-    def update_frame(self, frame, t_start):
+    def update_frame(self, frame, t_start, binning=1, roi=None):
         """Update the frame display and store current frame"""
         # dt = time.time() - t_start
         # print(dt)
         if self.is_camera_active:
-            self.current_image = frame
-            self.canvasOriginalImage.load_pixmap(ndarray2pixmap(frame))
+            pixmap = ndarray2pixmap(frame)
+            if binning > 1:
+                # Frame preview binning, phóng về kích thước thật cho khớp toạ độ shape
+                pixmap = pixmap.scaled(
+                    pixmap.width() * binning,
+                    pixmap.height() * binning,
+                    transformMode=QtCore.Qt.TransformationMode.FastTransformation,
+                )
+            if roi is not None:
+                # Frame đọc theo sensor ROI: vẽ tại góc cửa sổ trong ảnh full
+                padded = QtGui.QPixmap(
+                    roi[0] + pixmap.width(), roi[1] + pixmap.height()
+                )
+                padded.fill(QtCore.Qt.GlobalColor.black)
+                painter = QtGui.QPainter(padded)
+                painter.drawPixmap(roi[0], roi[1], pixmap)
+                painter.end()
+                pixmap = padded
+            if binning == 1 and roi is None:
+                # Chỉ frame full giữ làm ảnh hiện tại cho teaching / process
+                self.current_image = frame
+            self.canvasOriginalImage.load_pixmap(pixmap)
 
     def capture_image(self):
         """Capture current frame or loaded image"""
@@ -1042,18 +1666,17 @@ class MainWindow(QMainWindow):
         # Hộp thoại chọn thư mục
         folder_path = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder_path:
-            # Lấy danh sách file ảnh từ thư mục
-            self.file_paths.clear()  # Xóa dữ liệu cũ
+            self.file_paths = []  # Xóa dữ liệu cũ
             self.ui.list_widget_file.clear()  # Xóa mục cũ trong QListWidget
-            image_extensions = [".png", ".jpg", ".jpeg", ".bmp", ".gif"]
-            for file_name in os.listdir(folder_path):
-                if any(file_name.lower().endswith(ext) for ext in image_extensions):
-                    file_path = os.path.join(folder_path, file_name)
-                    self.file_paths.append(file_path)
+            self.image_loader.clear()
+            # Lấy danh sách file ảnh ở thread riêng, xong thì on_folder_listed
+            self.image_loader.list_folder(folder_path)
 
-                    # Thêm mục mới vào QListWidget
-                    list_item = QListWidgetItem(file_name)
-                    self.ui.list_widget_file.addItem(list_item)
+    def on_folder_listed(self, folder_path: str, paths: list):
+        self.file_paths = paths
+        self.ui.list_widget_file.clear()
+        self.ui.list_widget_file.addItems([os.path.basename(p) for p in paths])
+        self.logInfoSignal.emit(f"{len(paths)} images in {folder_path}")
 
     def display_image(self):
         # Display the current image in the viewer
@@ -1061,23 +1684,49 @@ class MainWindow(QMainWindow):
         if selected_items:
             item = selected_items[0]
             index = self.ui.list_widget_file.row(item)
-            file_path = self.file_paths[index]
-            self.current_image = cv.imread(file_path)
-            if self.current_image is None:
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    "Failed to load image. Please try another file.",
-                )
-                return
-            # Update the original image display
-            self.canvasOriginalImage.load_pixmap(
-                ndarray2pixmap(self.current_image), True
+            # Ảnh cũ không còn là ảnh hiện tại: chưa process / teaching tới khi có frame full
+            self.current_image = None
+            # Giải mã ở thread riêng, ảnh về on_image_loaded (preview rồi full)
+            self.image_loader.request(self.file_paths, index)
+
+    def on_image_loaded(self, file_path: str, mat: np.ndarray, reduce: int):
+        selected_items = self.ui.list_widget_file.selectedItems()
+        if not selected_items:
+            return
+        index = self.ui.list_widget_file.row(selected_items[0])
+        if index >= len(self.file_paths) or self.file_paths[index] != file_path:
+            # Đã chọn ảnh khác trong lúc giải mã
+            return
+
+        if mat is None:
+            QMessageBox.critical(
+                self,
+                "Error",
+                "Failed to load image. Please try another file.",
+            )
+            return
+
+        pixmap = ndarray2pixmap(mat)
+        if reduce > 1:
+            # Preview giải mã nhỏ, phóng về kích thước thật cho khớp toạ độ shape
+            pixmap = pixmap.scaled(
+                pixmap.width() * reduce,
+                pixmap.height() * reduce,
+                transformMode=QtCore.Qt.TransformationMode.FastTransformation,
             )
+        else:
+            self.current_image = mat
+        # Update the original image display
+        self.canvasOriginalImage.load_pixmap(pixmap, True)
 
     def closeEvent(self, event):
         """Clean up threads before closing"""
         self.stop_loop_process()
         if self.camera_thread:
             self.close_camera()
+        self.metrics_server.stop()
+        self.result_store.stop()
+        self.recorder.stop()
+        self.image_loader.shutdown()
+        self.log_sink.stop()
         return super().closeEvent(event)
@@ -0,0 +1,317 @@
+"""
+Parameter sweep of a model config over a labelled image set.
+
+    python param_sweep.py MODEL_A D:/tuning/MODEL_A -o best.json
+    python param_sweep.py MODEL_B D:/tuning/MODEL_B --space space.json --random 200
+
+Every config variant of the search space is evaluated on every image with
+ImageProcessor.find_result. Images are spread over a process pool, inside a
+worker the variants of one image share a StageCache (variants are sorted so
+that neighbours have the same upstream parameters). The fastest variant
+that reaches full accuracy is printed and written with -o.
+
+Labels: by default every ROI of the model must be found with its pair of
+circles. --labels JSON {"image name": [decision per ROI]} additionally
+checks the decision (1: OK, 0: NG, -1: none) against the model origin.
+
+Search space JSON: {"section.key": [values, ...]}, e.g.
+{"blur.ksize": [5, 7, 9], "hough_circle.param2": [20, 30, 40]}
+"""
+
+import sys
+
+sys.path.append("libs/")
+
+import argparse
+import copy
+import csv
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2 as cv
+import numpy as np
+
+from batch_inspect import list_images
+from libs.settings import Settings
+from libs.image_processor import ImageProcessor, RESULT
+from libs.stage_cache import StageCache, stage_key
+
+
+# Thứ tự stage: sort theo thứ tự này để các variant liền nhau dùng chung cache
+STAGE_SECTIONS = [
+    "blur",
+    "threshold",
+    "morphological",
+    "contour",
+    "detection",
+    "hough_circle",
+]
+
+# Trạng thái riêng của mỗi process worker
+_worker = {}
+
+
+def default_space(config: dict) -> dict:
+    """Search space around the current values of the model"""
+    ksize = config["blur"]["ksize"]
+    block_size = config["threshold"]["block_size"]
+    c_index = config["threshold"]["c_index"]
+    kernel_size = config["morphological"]["kernel_size"]
+    hough = config["hough_circle"]
+
+    if hough["type_hough"] == "HOUGH_GRADIENT_ALT":
+        # param2 của HOUGH_GRADIENT_ALT là độ tròn, phải < 1
+        param2 = sorted(
+            {min(round(hough["param2"] * f, 2), 0.99) for f in (0.9, 1.0, 1.1)}
+        )
+    else:
+        param2 = sorted({max(int(hough["param2"] * f), 1) for f in (0.8, 1.0, 1.2)})
+
+    return {
+        "blur.ksize": sorted({max(ksize - 2, 1), ksize, ksize + 2}),
+        "threshold.block_size": sorted(
+            {max(int(block_size * f) | 1, 3) for f in (0.75, 1.0, 1.25)}
+        ),
+        "threshold.c_index": sorted({c_index - 2, c_index, c_index + 2}),
+        "morphological.kernel_size": sorted(
+            {max(kernel_size - 2, 1), kernel_size, kernel_size + 2}
+        ),
+        "hough_circle.param1": sorted(
+            {max(int(hough["param1"] * f), 1) for f in (0.8, 1.0, 1.2)}
+        ),
+        "hough_circle.param2": param2,
+    }
+
+
+def grid_variants(space: dict) -> list:
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*space.values())]
+
+
+def random_variants(space: dict, n: int, seed: int = 0) -> list:
+    """n distinct random points of the grid"""
+    rng = random.Random(seed)
+    n_total = int(np.prod([len(v) for v in space.values()]))
+    if n >= n_total:
+        return grid_variants(space)
+
+    variants = {}
+    while len(variants) < n:
+        variant = {name: rng.choice(values) for name, values in space.items()}
+        variants[json.dumps(variant, sort_keys=True)] = variant
+    return list(variants.values())
+
+
+def apply_variant(config: dict, variant: dict) -> dict:
+    config = copy.deepcopy(config)
+    for name, value in variant.items():
+        section, key = name.split(".", 1)
+        config[section][key] = value
+    return config
+
+
+def sort_variants(config: dict, variants: list) -> list:
+    """Order variants by upstream parameters so consecutive ones share stages"""
+
+    def key(variant):
+        return stage_key(apply_variant(config, variant), *STAGE_SECTIONS)
+
+    return sorted(variants, key=key)
+
+
+def init_worker(config: dict, variants: list, labels: dict):
+    _worker["configs"] = [apply_variant(config, v) for v in variants]
+    _worker["labels"] = labels
+
+
+def evaluate_image(path: str) -> dict:
+    """
+    Run every variant on one image.\n
+    Returns n_rois and per variant the number of correct ROIs and the run
+    time without cache (wall time + compute time served from the cache).
+    """
+    row = {"path": path, "error": "", "correct": [], "time": []}
+    mat = cv.imread(path)
+    if mat is None:
+        row["error"] = "Failed to load image"
+        return row
+
+    expected = _worker["labels"].get(os.path.basename(path))
+    cache = StageCache()
+    for config in _worker["configs"]:
+        saved = cache.saved
+        t0 = time.perf_counter()
+        try:
+            result: RESULT = ImageProcessor.find_result(mat, config, cache=cache)
+        except Exception:
+            # Tham số không hợp lệ (vd. HoughCircles), tính là sai toàn bộ
+            result = None
+        dt = time.perf_counter() - t0 + cache.saved - saved
+
+        row["time"].append(dt)
+        row["correct"].append(count_correct(result, expected))
+    row["n_rois"] = len(_worker["configs"][0]["shapes"]) if _worker["configs"] else 0
+    return row
+
+
+def count_correct(result: RESULT, expected: list = None) -> int:
+    """Number of ROIs found with both circles (and the expected decision)"""
+    if result is None:
+        return 0
+    table = result.table
+    ok = table["found"] & table["paired"]
+    if expected is not None:
+        n = min(len(expected), len(table))
+        ok = ok[:n] & (table["decision"][:n] == np.asarray(expected[:n]))
+    return int(ok.sum())
+
+
+def run(
+    model_name: str,
+    inputs: list,
+    space: dict = None,
+    n_random: int = None,
+    labels: dict = None,
+    workers: int = None,
+    models_dir: str = None,
+    seed: int = 0,
+):
+    """Returns (report rows sorted by run time, best row or None, base config)"""
+    settings = Settings()
+    if models_dir:
+        settings.models_dir = models_dir
+
+    config = settings.load_model(model_name)
+    if not config:
+        print(f"Invalid or missing configuration for model: {model_name}")
+        return [], None, None
+
+    paths = list_images(inputs)
+    if not paths:
+        print("No images found")
+        return [], None, config
+
+    space = space or default_space(config)
+    if n_random:
+        variants = random_variants(space, n_random, seed)
+    else:
+        variants = grid_variants(space)
+    variants = sort_variants(config, variants)
+
+    workers = workers or os.cpu_count()
+    print(
+        f"Sweep {len(variants)} variants x {len(paths)} images of {model_name} "
+        f"with {workers} workers"
+    )
+
+    correct = np.zeros(len(variants), dtype=np.int64)
+    runtime = np.zeros(len(variants), dtype=np.float64)
+    n_rois = 0
+    n_images = 0
+
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(config, variants, labels or {}),
+    ) as executor:
+        for row in executor.map(evaluate_image, paths):
+            if row["error"]:
+                print(f"Skip {row['path']}: {row['error']}")
+                continue
+            correct += row["correct"]
+            runtime += row["time"]
+            n_rois += row["n_rois"]
+            n_images += 1
+            print(f"{n_images}/{len(paths)} images, {time.perf_counter() - t0:.1f}s")
+
+    if n_images == 0:
+        return [], None, config
+
+    report = []
+    for variant, n_correct, total_time in zip(variants, correct, runtime):
+        report.append(
+            {
+                **variant,
+                "accuracy": n_correct / max(n_rois, 1),
+                "time_ms": total_time / n_images * 1000,
+            }
+        )
+    report.sort(key=lambda r: r["time_ms"])
+
+    best = next((r for r in report if r["accuracy"] >= 1.0), None)
+    return report, best, config
+
+
+def print_report(report: list, best: dict, top: int = 20):
+    print(f"\n{'accuracy':>9} {'time_ms':>9}  variant")
+    for r in report[:top]:
+        variant = {k: v for k, v in r.items() if k not in ("accuracy", "time_ms")}
+        print(f"{r['accuracy'] * 100:8.1f}% {r['time_ms']:9.1f}  {json.dumps(variant)}")
+
+    if best is None:
+        print("\nNo variant found every blob and circle")
+    else:
+        print(f"\nFastest fully correct variant: {best['time_ms']:.1f} ms/image")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parameter sweep of a model")
+    parser.add_argument("model", help="model name in models/ (Settings)")
+    parser.add_argument("inputs", nargs="+", help="image files, folders or globs")
+    parser.add_argument("--space", default=None, help="search space JSON")
+    parser.add_argument("--random", type=int, default=None, help="random samples")
+    parser.add_argument("--labels", default=None, help="expected decisions JSON")
+    parser.add_argument("--report", default=None, help="write all variants as CSV")
+    parser.add_argument("-o", "--output", default=None, help="write best config")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--models-dir", default=None)
+    args = parser.parse_args()
+
+    space = labels = None
+    if args.space:
+        with open(args.space, "r") as f:
+            space = json.load(f)
+    if args.labels:
+        with open(args.labels, "r") as f:
+            labels = json.load(f)
+
+    report, best, config = run(
+        args.model,
+        args.inputs,
+        space=space,
+        n_random=args.random,
+        labels=labels,
+        workers=args.workers,
+        models_dir=args.models_dir,
+        seed=args.seed,
+    )
+    if not report:
+        sys.exit(1)
+
+    print_report(report, best)
+
+    if args.report:
+        with open(args.report, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(report[0]))
+            writer.writeheader()
+            writer.writerows(report)
+        print(f"Report: {args.report}")
+
+    if best is None:
+        sys.exit(2)
+
+    if args.output:
+        variant = {k: v for k, v in best.items() if k not in ("accuracy", "time_ms")}
+        with open(args.output, "w") as f:
+            json.dump(apply_variant(config, variant), f, indent=4)
+        print(f"Best config: {args.output}")
+
+
+if __name__ == "__main__":
+    main()